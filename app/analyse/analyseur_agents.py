@@ -0,0 +1,155 @@
+"""
+Module pour la répartition des requêtes d'un log Apache par navigateur, système
+d'exploitation et robot.
+"""
+
+from collections import Counter
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.classificateur_agents import ClassificateurAgents
+from analyse.verifications import verifie_nombre_par_top
+
+
+class AnalyseurAgents:
+    """
+    Représente la répartition, en flux, des requêtes d'entrées de log Apache selon la
+    classification de leur agent utilisateur par un :class:`ClassificateurAgents`.
+
+    Les requêtes des robots sont réparties par robot ; les autres par navigateur et
+    par système d'exploitation (``Autre`` lorsqu'ils ne sont pas reconnus). Les
+    compteurs ne dépendent que du nombre de règles, et non du nombre d'agents distincts.
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        classificateur (ClassificateurAgents): Le classificateur des agents.
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        requetes_sans_agent (int): Le nombre d'entrées filtrées sans agent utilisateur.
+        robots (Counter): Le nombre de requêtes de chaque robot.
+        navigateurs (Counter): Le nombre de requêtes (hors robots) de chaque navigateur.
+        systemes (Counter): Le nombre de requêtes (hors robots) de chaque système
+            d'exploitation.
+        _predicat (Callable): Le prédicat compilé du filtre.
+
+    Class-level variables:
+        :cvar NON_RECONNU (str): Le nom des navigateurs et systèmes non reconnus.
+    """
+
+    NON_RECONNU: str = "Autre"
+
+    def __init__(self, filtre: FiltreLogApache, classificateur: ClassificateurAgents):
+        """
+        Initialise une répartition vide.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            classificateur (ClassificateurAgents): Le classificateur des agents.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+        if not isinstance(classificateur, ClassificateurAgents):
+            raise TypeError("Le classificateur doit être de type ClassificateurAgents.")
+
+        self.filtre = filtre
+        self.classificateur = classificateur
+        self.total_entrees = 0
+        self.requetes_sans_agent = 0
+        self.robots = Counter()
+        self.navigateurs = Counter()
+        self.systemes = Counter()
+        self._predicat = filtre.get_predicat()
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée reçue à la répartition si elle passe le filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+        """
+        self.total_entrees += 1
+        if not self._predicat(entree):
+            return
+        if entree.client.agent_utilisateur is None:
+            self.requetes_sans_agent += 1
+            return
+        robot, navigateur, systeme = self.classificateur.classifie(
+            entree.client.agent_utilisateur
+        )
+        if robot is not None:
+            self.robots[robot] += 1
+            return
+        self.navigateurs[navigateur or self.NON_RECONNU] += 1
+        self.systemes[systeme or self.NON_RECONNU] += 1
+
+    def ajoute_entrees(self, entrees) -> None:
+        """
+        Ajoute plusieurs entrées reçues.
+
+        Args:
+            entrees (Iterable): Les entrées reçues.
+
+        Returns:
+            None
+        """
+        for entree in entrees:
+            self.ajoute_entree(entree)
+
+    @staticmethod
+    def _get_repartition(compteur: Counter, nom_elements: str, nombre_par_top: int) -> list:
+        """
+        Retourne les éléments les plus fréquents d'un compteur, avec leur taux.
+
+        Args:
+            compteur (Counter): Le compteur.
+            nom_elements (str): Le nom des éléments.
+            nombre_par_top (int): Le nombre maximal d'éléments retournés.
+
+        Returns:
+            list: Les éléments, leur total et leur taux parmi les requêtes du compteur,
+            par total décroissant.
+        """
+        total = sum(compteur.values())
+        return [
+            {nom_elements: element, "total": nombre, "taux": nombre / total * 100}
+            for element, nombre in compteur.most_common(nombre_par_top)
+        ]
+
+    def get_analyse(self, nombre_par_top: int = 10) -> dict:
+        """
+        Retourne la répartition des requêtes par robot, navigateur et système.
+
+        Args:
+            nombre_par_top (int): Le nombre maximal d'éléments de chaque classement.
+                Par défaut, sa valeur est égale à ``10``.
+
+        Returns:
+            dict: Le nombre de requêtes des robots et sans agent, les classements des
+            robots, des navigateurs et des systèmes, et l'utilisation du cache.
+
+        Raises:
+            TypeError: Le paramètre ``nombre_par_top`` n'est pas un entier.
+            ValueError: Le paramètre ``nombre_par_top`` est inférieur à ``0``.
+        """
+        # Vérification du paramètre
+        verifie_nombre_par_top(nombre_par_top)
+
+        requetes_robots = sum(self.robots.values())
+        requetes_avec_agent = requetes_robots + sum(self.navigateurs.values())
+        return {
+            "regles": self.classificateur.chemin_regles,
+            "requetes_sans_agent": self.requetes_sans_agent,
+            "requetes_robots": requetes_robots,
+            "taux_robots": (requetes_robots / requetes_avec_agent * 100
+                            if requetes_avec_agent > 0 else None),
+            "top_robots": self._get_repartition(self.robots, "robot", nombre_par_top),
+            "top_navigateurs": self._get_repartition(self.navigateurs, "navigateur",
+                                                     nombre_par_top),
+            "top_systemes": self._get_repartition(self.systemes, "systeme", nombre_par_top),
+            "cache": self.classificateur.get_statistiques_cache()
+        }
@@ -0,0 +1,271 @@
+"""
+Module pour l'agrégation, en flux et à mémoire bornée, des requêtes d'un log Apache
+par niveau de l'arborescence de leur chemin.
+"""
+
+from heapq import heappop, heappush, nlargest
+from itertools import count
+from typing import Optional
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.verifications import verifie_nombre_par_top
+
+
+class AnalyseurArborescence:
+    """
+    Représente l'agrégation des requêtes d'un flux d'entrées de log Apache par préfixe
+    de leur chemin : une requête vers ``/api/v2/commandes`` est comptée pour ``/api``,
+    ``/api/v2`` et ``/api/v2/commandes``, avec ses octets et ses erreurs (réponses
+    ``4xx`` et ``5xx``).
+
+    Les agrégats sont rangés dans un arbre préfixe mis à jour à chaque entrée, en
+    parcourant les segments du chemin jusqu'à :attr:`profondeur_max`. Le nombre de
+    noeuds est borné par :attr:`capacite_noeuds` : lorsque la limite est atteinte, la
+    feuille la moins demandée est évincée pour faire place au nouveau noeud (ses
+    requêtes restent comptées par ses préfixes). Les feuilles sont rangées dans un tas
+    mis à jour paresseusement : une feuille dont le nombre de requêtes a changé depuis
+    son ajout au tas y est replacée lorsqu'elle en atteint le sommet. Les chemins
+    fréquents restent ainsi détaillés même lorsqu'ils apparaissent après de nombreux
+    chemins rares. Les agrégats d'un noeud comptent les requêtes reçues depuis sa
+    création : ils sont exacts pour les préfixes jamais évincés, et les évictions sont
+    comptées par :attr:`noeuds_evinces` et :attr:`requetes_evincees`.
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        profondeur_max (int): Le nombre maximal de segments des chemins agrégés.
+        capacite_noeuds (int): Le nombre maximal de noeuds de l'arbre (hors racine).
+        normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+            routes avant leur agrégation.
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        requetes_sans_url (int): Le nombre d'entrées filtrées sans url.
+        requetes_non_detaillees (int): Le nombre de requêtes dont au moins un préfixe
+            n'a pas pu être ajouté à l'arbre, faute de capacité et de feuille à évincer
+            (capacité inférieure à la profondeur du chemin).
+        nombre_noeuds (int): Le nombre de noeuds de l'arbre (hors racine).
+        noeuds_evinces (int): Le nombre de feuilles évincées faute de capacité.
+        requetes_evincees (int): Le nombre de requêtes comptées par les feuilles
+            évincées, qui ne sont plus détaillées que par leurs préfixes.
+        _racine (list): La racine de l'arbre. Chaque noeud est de la forme
+            ``[requetes, octets, erreurs, enfants, parent, segment, dans_tas]``, où
+            ``enfants`` associe chaque segment suivant à son noeud et ``dans_tas``
+            indique si le noeud a une entrée dans :attr:`_feuilles`.
+        _feuilles (list): Le tas des feuilles candidates à l'éviction, sous la forme
+            ``(requetes, ordre, noeud)``. Une entrée est périmée lorsque le noeud a
+            depuis reçu des requêtes ou des enfants.
+        _ordre (Iterator): Le compteur qui départage les entrées de même nombre de
+            requêtes (la plus ancienne est évincée en premier).
+        _predicat (Callable): Le prédicat compilé du filtre.
+    """
+
+    def __init__(self,
+                 filtre: FiltreLogApache,
+                 profondeur_max: int = 3,
+                 capacite_noeuds: int = 10000,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None):
+        """
+        Initialise une arborescence vide.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            profondeur_max (int): Le nombre maximal de segments des chemins agrégés.
+                Par défaut, ``3``.
+            capacite_noeuds (int): Le nombre maximal de noeuds de l'arbre. Par défaut,
+                ``10000``.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes avant leur agrégation. Si ``None``, seule la chaîne de requête
+                des urls est supprimée.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La profondeur ou la capacité est inférieure à ``1``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+        if not all(isinstance(entier, int) and not isinstance(entier, bool)
+                   for entier in (profondeur_max, capacite_noeuds)):
+            raise TypeError("La profondeur et la capacité doivent être des entiers.")
+        if normaliseur_urls is not None and not isinstance(normaliseur_urls, NormaliseurUrls):
+            raise TypeError("La normalisation des urls doit être de type NormaliseurUrls.")
+        # Vérification de la valeur des paramètres
+        if min(profondeur_max, capacite_noeuds) < 1:
+            raise ValueError("La profondeur et la capacité doivent être supérieures à 0.")
+
+        self.filtre = filtre
+        self.profondeur_max = profondeur_max
+        self.capacite_noeuds = capacite_noeuds
+        self.normaliseur_urls = normaliseur_urls
+        self.total_entrees = 0
+        self.requetes_sans_url = 0
+        self.requetes_non_detaillees = 0
+        self.nombre_noeuds = 0
+        self.noeuds_evinces = 0
+        self.requetes_evincees = 0
+        self._racine = [0, 0, 0, {}, None, "", False]
+        self._feuilles = []
+        self._ordre = count()
+        self._predicat = filtre.get_predicat()
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée reçue à chaque préfixe de son chemin si elle passe le filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+        """
+        self.total_entrees += 1
+        if not self._predicat(entree):
+            return
+        url = entree.requete.url
+        if url is None:
+            self.requetes_sans_url += 1
+            return
+        if self.normaliseur_urls is not None:
+            url = self.normaliseur_urls.normalise(url)
+        octets = entree.reponse.taille_octets or 0
+        erreur = entree.reponse.code_statut_http >= 400
+        segments = [segment for segment in url.split("?", 1)[0].split("/") if segment]
+        noeud = self._racine
+        for segment in segments[:self.profondeur_max]:
+            noeud[0] += 1
+            noeud[1] += octets
+            noeud[2] += erreur
+            enfant = noeud[3].get(segment)
+            if enfant is None:
+                if self.nombre_noeuds >= self.capacite_noeuds \
+                        and not self._evince_feuille(noeud):
+                    self.requetes_non_detaillees += 1
+                    return
+                enfant = [0, 0, 0, {}, noeud, segment, True]
+                noeud[3][segment] = enfant
+                self.nombre_noeuds += 1
+                heappush(self._feuilles, (0, next(self._ordre), enfant))
+            noeud = enfant
+        noeud[0] += 1
+        noeud[1] += octets
+        noeud[2] += erreur
+
+    def _evince_feuille(self, parent: list) -> bool:
+        """
+        Évince la feuille la moins demandée de l'arbre, hormis le noeud qui va recevoir
+        un nouvel enfant.
+
+        Args:
+            parent (list): Le noeud qui va recevoir un nouvel enfant.
+
+        Returns:
+            bool: ``True`` si une feuille a été évincée, ``False`` si l'arbre n'en
+            contient aucune autre que ``parent``.
+        """
+        mise_de_cote = None
+        evincee = False
+        while self._feuilles:
+            requetes, ordre, noeud = heappop(self._feuilles)
+            if noeud[3]:
+                # Le noeud n'est plus une feuille : il sera replacé s'il le redevient
+                noeud[6] = False
+            elif noeud is parent:
+                mise_de_cote = (requetes, ordre, noeud)
+            elif noeud[0] != requetes:
+                heappush(self._feuilles, (noeud[0], ordre, noeud))
+            else:
+                parent_evincee = noeud[4]
+                del parent_evincee[3][noeud[5]]
+                self.nombre_noeuds -= 1
+                self.noeuds_evinces += 1
+                self.requetes_evincees += requetes
+                if not parent_evincee[3] and parent_evincee is not self._racine \
+                        and not parent_evincee[6]:
+                    parent_evincee[6] = True
+                    heappush(self._feuilles,
+                             (parent_evincee[0], next(self._ordre), parent_evincee))
+                evincee = True
+                break
+        if mise_de_cote is not None:
+            heappush(self._feuilles, mise_de_cote)
+        return evincee
+
+    def ajoute_entrees(self, entrees) -> None:
+        """
+        Ajoute plusieurs entrées reçues.
+
+        Args:
+            entrees (Iterable): Les entrées reçues.
+
+        Returns:
+            None
+        """
+        for entree in entrees:
+            self.ajoute_entree(entree)
+
+    def _get_niveaux(self) -> list:
+        """
+        Parcourt l'arbre en largeur et retourne ses noeuds par profondeur.
+
+        Returns:
+            list: Pour chaque profondeur (de ``1`` à la plus grande profondeur de
+            l'arbre), la liste des chemins et de leurs noeuds.
+        """
+        niveaux = []
+        niveau = [("", self._racine)]
+        while True:
+            niveau = [(f"{chemin}/{segment}", enfant)
+                      for chemin, noeud in niveau
+                      for segment, enfant in noeud[3].items()]
+            if not niveau:
+                return niveaux
+            niveaux.append(niveau)
+
+    def get_analyse(self, nombre_par_top: int = 10) -> dict:
+        """
+        Retourne les chemins les plus demandés de chaque niveau de l'arborescence.
+
+        Args:
+            nombre_par_top (int): Le nombre maximal de chemins par niveau. Par défaut,
+                sa valeur est égale à ``10``.
+
+        Returns:
+            dict: Le nombre de requêtes agrégées, la taille de l'arbre et, pour chaque
+            niveau, les chemins les plus demandés avec leur nombre de requêtes, leur
+            taux parmi toutes les requêtes, leurs octets et leur taux d'erreurs.
+
+        Raises:
+            TypeError: Le paramètre ``nombre_par_top`` n'est pas un entier.
+            ValueError: Le paramètre ``nombre_par_top`` est inférieur à ``0``.
+        """
+        # Vérification du paramètre
+        verifie_nombre_par_top(nombre_par_top)
+
+        total_requetes = self._racine[0]
+        return {
+            "profondeur_max": self.profondeur_max,
+            "capacite_noeuds": self.capacite_noeuds,
+            "noeuds": self.nombre_noeuds,
+            "requetes": total_requetes,
+            "requetes_sans_url": self.requetes_sans_url,
+            "requetes_non_detaillees": self.requetes_non_detaillees,
+            "noeuds_evinces": self.noeuds_evinces,
+            "requetes_evincees": self.requetes_evincees,
+            "niveaux": [
+                {
+                    "profondeur": profondeur,
+                    "chemins": [
+                        {
+                            "chemin": chemin,
+                            "requetes": requetes,
+                            "taux": requetes / total_requetes * 100,
+                            "octets": octets,
+                            "taux_erreurs": erreurs / requetes * 100
+                        }
+                        for chemin, (requetes, octets, erreurs, *_) in nlargest(
+                            nombre_par_top, niveau, key=lambda element: element[1][0]
+                        )
+                    ]
+                }
+                for profondeur, niveau in enumerate(self._get_niveaux(), start=1)
+            ]
+        }
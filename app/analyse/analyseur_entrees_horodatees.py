@@ -0,0 +1,80 @@
+"""
+Module pour la base commune des analyses en flux qui ne retiennent que les entrées
+filtrées et horodatées.
+"""
+
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+
+
+class AnalyseurEntreesHorodatees:
+    """
+    Représente la base des analyses en flux (sessions, débit par adresse IP, SLO)
+    dont chaque entrée reçue est comptée, puis retenue seulement si elle passe le
+    filtre et possède un horodatage.
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        entrees_ignorees (int): Le nombre d'entrées filtrées ignorées car sans horodatage.
+        _predicat (Callable): Le prédicat compilé du filtre.
+    """
+
+    def __init__(self, filtre: FiltreLogApache):
+        """
+        Initialise les compteurs d'entrées et compile le filtre.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées, déjà vérifié
+                par la classe fille.
+        """
+        self.filtre = filtre
+        self.total_entrees = 0
+        self.entrees_ignorees = 0
+        self._predicat = filtre.get_predicat()
+
+    def _admet_entree(self, entree: EntreeLogApache) -> bool:
+        """
+        Compte une entrée reçue et indique si elle doit être analysée.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            bool: ``True`` si l'entrée passe le filtre et possède un horodatage.
+        """
+        self.total_entrees += 1
+        if not self._predicat(entree):
+            return False
+        if entree.requete.horodatage is None:
+            self.entrees_ignorees += 1
+            return False
+        return True
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée reçue à l'analyse, à définir par la classe fille.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+
+        Raises:
+            NotImplementedError: La classe fille ne définit pas cette méthode.
+        """
+        raise NotImplementedError
+
+    def ajoute_entrees(self, entrees) -> None:
+        """
+        Ajoute plusieurs entrées reçues, dans l'ordre de leur horodatage.
+
+        Args:
+            entrees (Iterable): Les entrées reçues.
+
+        Returns:
+            None
+        """
+        for entree in entrees:
+            self.ajoute_entree(entree)
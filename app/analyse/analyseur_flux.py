@@ -0,0 +1,272 @@
+"""
+Module pour l'analyse en flux, à mémoire bornée, d'entrées de log Apache reçues
+au fil de l'eau.
+"""
+
+from typing import Optional
+import numpy as np
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.series_temporelles import SeriesTemporelles
+from analyse.compteur_borne import CompteurBorne
+from analyse.statistiques_reponses import StatistiquesReponses
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.verifications import verifie_nombre_par_top
+
+
+class AnalyseurFlux:
+    """
+    Représente une analyse incrémentale d'un flux d'entrées de log Apache (par exemple
+    reçues d'Apache par un tube), sans conserver les entrées ni le fichier brut.
+
+    Chaque agrégat a une mémoire bornée quelle que soit la durée du flux :
+        - Les urls sont comptées par un :class:`CompteurBorne` (Space-Saving).
+        - Les tailles et temps de réponse sont résumés par des :class:`SketchQuantiles`,
+          globaux et par code de statut http.
+        - Les séries temporelles sont glissantes : seules les secondes de la fenêtre
+          la plus récente sont conservées.
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        fenetre_secondes (int): La durée (en secondes) couverte par les séries
+            temporelles, jusqu'à la seconde la plus récente reçue.
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        total_entrees_filtre (int): Le nombre d'entrées qui ont passé le filtre.
+        lignes_invalides (int): Le nombre de lignes reçues dont le format est invalide.
+        lignes_perdues (int): Le nombre de lignes perdues avant l'analyse (par exemple
+            lorsque le tampon de réception est plein).
+        urls (CompteurBorne): Les urls les plus demandées.
+        reponses (StatistiquesReponses): Le nombre de réponses par code de statut http
+            et les sketchs des quantiles des réponses.
+        secondes (dict): Pour chaque seconde (depuis l'epoch) récente, le nombre de
+            requêtes, d'octets et d'erreurs.
+        series_temporelles (SeriesTemporelles): Le calcul des séries temporelles.
+        normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+            routes avant leur comptage.
+        _predicat (Callable): Le prédicat compilé du filtre.
+        _seconde_max (Optional[int]): La seconde la plus récente reçue.
+    """
+
+    def __init__(self,
+                 filtre: FiltreLogApache,
+                 granularite: str = "heure",
+                 capacite_urls: int = 1000,
+                 fenetre_secondes: int = 86400,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None):
+        """
+        Initialise une analyse en flux vide.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            granularite (str): L'intervalle de regroupement des séries temporelles.
+                Par défaut, sa valeur est égale à ``heure``.
+            capacite_urls (int): Le nombre maximal d'urls suivies. Par défaut, ``1000``.
+            fenetre_secondes (int): La durée couverte par les séries temporelles.
+                Par défaut, un jour.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes avant leur comptage. Si ``None``, les urls brutes sont comptées.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La granularité est inconnue, ou la capacité ou la fenêtre est
+                inférieure à ``1``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+        if not isinstance(fenetre_secondes, int) or isinstance(fenetre_secondes, bool):
+            raise TypeError("La fenêtre des séries temporelles doit être un entier.")
+        if normaliseur_urls is not None and not isinstance(normaliseur_urls, NormaliseurUrls):
+            raise TypeError("La normalisation des urls doit être de type NormaliseurUrls.")
+        # Vérification de la valeur des paramètres
+        if fenetre_secondes < 1:
+            raise ValueError("La fenêtre des séries temporelles doit être supérieure à 0.")
+
+        self.filtre = filtre
+        self.fenetre_secondes = fenetre_secondes
+        self.total_entrees = 0
+        self.total_entrees_filtre = 0
+        self.lignes_invalides = 0
+        self.lignes_perdues = 0
+        self.urls = CompteurBorne(capacite_urls)
+        self.reponses = StatistiquesReponses()
+        self.secondes = {}
+        self.series_temporelles = SeriesTemporelles(granularite)
+        self.normaliseur_urls = normaliseur_urls
+        self._predicat = filtre.get_predicat()
+        self._seconde_max = None
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée reçue à l'analyse si elle passe le filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+        """
+        self.total_entrees += 1
+        if not self._predicat(entree):
+            return
+        reponse = entree.reponse
+        code = reponse.code_statut_http
+        self.total_entrees_filtre += 1
+        self.urls.ajoute(entree.requete.url if self.normaliseur_urls is None
+                         else self.normaliseur_urls.normalise(entree.requete.url))
+        self.reponses.ajoute(reponse)
+        # Agrégats par seconde de la fenêtre glissante
+        if entree.requete.horodatage is None:
+            return
+        seconde = int(entree.requete.horodatage.timestamp())
+        if self._seconde_max is None or seconde > self._seconde_max:
+            self._seconde_max = seconde
+        elif seconde <= self._seconde_max - self.fenetre_secondes:
+            return
+        agregats = self.secondes.get(seconde)
+        if agregats is None:
+            agregats = self.secondes[seconde] = [0, 0, 0]
+            # Purge amortie : au plus deux fenêtres de secondes sont conservées
+            if len(self.secondes) > 2 * self.fenetre_secondes:
+                self._purge_secondes()
+        agregats[0] += 1
+        agregats[1] += reponse.taille_octets or 0
+        agregats[2] += code >= 400
+
+    def ajoute_entrees(self, entrees: list) -> None:
+        """
+        Ajoute plusieurs entrées reçues à l'analyse.
+
+        Args:
+            entrees (list): Les entrées reçues.
+
+        Returns:
+            None
+        """
+        for entree in entrees:
+            self.ajoute_entree(entree)
+
+    def _purge_secondes(self) -> None:
+        """
+        Supprime les agrégats des secondes sorties de la fenêtre.
+
+        Returns:
+            None
+        """
+        limite = self._seconde_max - self.fenetre_secondes
+        self.secondes = {seconde: agregats for seconde, agregats in self.secondes.items()
+                         if seconde > limite}
+
+    def _get_taux(self, total: int) -> float:
+        """
+        Retourne le taux d'un total parmi les entrées qui ont passé le filtre.
+
+        Args:
+            total (int): Le total.
+
+        Returns:
+            float: Le taux, en pourcentage.
+        """
+        return total / self.total_entrees_filtre * 100
+
+    def get_top_urls(self, nombre_par_top: int = 3) -> list:
+        """
+        Retourne les urls les plus demandées. Les totaux sont estimés par excès d'au
+        plus ``erreur_max`` (voir :class:`CompteurBorne`).
+
+        Args:
+            nombre_par_top (int): Le nombre maximal d'urls retournées.
+
+        Returns:
+            list: Les urls, leur total, leur taux et l'erreur maximale de leur total.
+        """
+        return [
+            {"url": url, "total": total, "taux": self._get_taux(total), "erreur_max": erreur}
+            for url, total, erreur in self.urls.get_top(nombre_par_top)
+        ]
+
+    def get_total_par_code_statut_http(self) -> list:
+        """
+        Retourne la répartition des réponses par code de statut http.
+
+        Returns:
+            list: Les codes, leur total et leur taux, triés par total décroissant.
+        """
+        return self.reponses.get_repartition_codes(self.total_entrees_filtre)
+
+    def get_total_par_code_statut_http_camembert(self) -> list:
+        """
+        Retourne la répartition des réponses par code de statut http sous un format
+        utilisable par un camembert, voir
+        :meth:`AnalyseurLogApache.get_total_par_code_statut_http_camembert`.
+
+        Returns:
+            list: Une liste de listes ``[code, total]``.
+        """
+        return [[statistique["code"], statistique["total"]]
+                for statistique in self.get_total_par_code_statut_http()]
+
+    def get_series_temporelles(self) -> dict:
+        """
+        Retourne les séries temporelles des secondes de la fenêtre.
+
+        Returns:
+            dict: Les séries temporelles, voir :meth:`SeriesTemporelles.calcule`.
+        """
+        if self._seconde_max is not None:
+            self._purge_secondes()
+        secondes = sorted(self.secondes)
+        agregats = np.array([self.secondes[seconde] for seconde in secondes],
+                            dtype=np.int64).reshape(-1, 3)
+        return self.series_temporelles.calcule_par_seconde(
+            np.array(secondes, dtype=np.int64), agregats[:, 0], agregats[:, 1], agregats[:, 2]
+        )
+
+    def get_analyse_complete(self, nombre_par_top: int = 3) -> dict:
+        """
+        Retourne l'analyse des entrées reçues jusqu'à présent.
+
+        L'analyse suit la structure de :meth:`AnalyseurLogApache.get_analyse_complete`
+        (sans regroupements), à l'exception de la clé ``chemin`` qui est remplacée par
+        la clé ``flux`` :
+            - lignes_invalides: voir :attr:`lignes_invalides`
+            - lignes_perdues: voir :attr:`lignes_perdues`
+            - fenetre_secondes: voir :attr:`fenetre_secondes`
+            - urls_suivies: le nombre d'urls suivies par :attr:`urls`
+
+        Args:
+            nombre_par_top (int): Le nombre maximal d'éléments à inclure dans
+                les statistiques des classements (tops). Par défaut, sa valeur est égale à ``3``.
+
+        Returns:
+            dict: L'analyse sous forme d'un dictionnaire.
+
+        Raises:
+            TypeError: Le paramètre ``nombre_par_top`` n'est pas un entier.
+            ValueError: Le paramètre ``nombre_par_top`` est inférieur à ``0``.
+        """
+        # Vérification du paramètre
+        verifie_nombre_par_top(nombre_par_top)
+
+        return {
+            "flux": {
+                "lignes_invalides": self.lignes_invalides,
+                "lignes_perdues": self.lignes_perdues,
+                "fenetre_secondes": self.fenetre_secondes,
+                "urls_suivies": len(self.urls)
+            },
+            "total_entrees": self.total_entrees,
+            "filtre": self.filtre.get_dict_filtre(),
+            "statistiques": {
+                "total_entrees_filtre": self.total_entrees_filtre,
+                "requetes": {
+                    "top_urls": self.get_top_urls(nombre_par_top),
+                },
+                "reponses": {
+                    "repartition_code_statut_http": self.get_total_par_code_statut_http(),
+                    "taille_octets": self.reponses.get_statistiques_quantiles("taille_octets"),
+                    "temps_reponse": self.reponses.get_statistiques_quantiles("temps_reponse")
+                },
+                "series_temporelles": self.get_series_temporelles()
+            }
+        }
@@ -4,8 +4,15 @@ Module pour l'analyse statistique d'un fichier log Apache.
 
 from os.path import abspath
 from collections import Counter
+from typing import Optional
+import numpy as np
 from parse.fichier_log_apache import FichierLogApache
 from analyse.filtre_log_apache import FiltreLogApache
+from analyse.sketch_quantiles import SketchQuantiles
+from analyse.series_temporelles import SeriesTemporelles
+from analyse.moteur_groupement import MoteurGroupement, SpecificationGroupement
+from analyse.etat_partiel_analyse import EtatPartielAnalyse
+from analyse.normaliseur_urls import NormaliseurUrls
 
 
 class AnalyseurLogApache:
@@ -17,12 +24,24 @@ class AnalyseurLogApache:
         fichier (FichierLogApache): Le fichier de log Apache à analyser.
         nombre_par_top (int): Le nombre maximal d'éléments à inclure dans
             les statistiques des classements (tops).
+        series_temporelles (SeriesTemporelles): Le calcul des séries temporelles
+            du trafic.
+        groupements (list): Les spécifications (:class:`SpecificationGroupement`)
+            des regroupements à calculer.
+        normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+            routes avant leur comptage, ou ``None`` pour compter les urls brutes.
+        _entrees_filtre (Optional[list]): Les entrées qui passent le filtre, calculées
+            une seule fois lors du premier besoin ou fournies à l'initialisation.
     """
 
     def __init__(self,
                  fichier_log_apache: FichierLogApache,
                  filtre: FiltreLogApache,
-                 nombre_par_top: int = 3):
+                 nombre_par_top: int = 3,
+                 granularite: str = "heure",
+                 entrees_filtre: Optional[list] = None,
+                 groupements: Optional[list] = None,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None):
         """
         Initialise un nouveau analysateur de fichier log Apache.
 
@@ -32,10 +51,22 @@ class AnalyseurLogApache:
                 passe pas le filtre, elle ne sera pas pris en compte dans l'analyse.
             nombre_par_top (int): Le nombre maximal d'éléments à inclure dans
                 les statistiques des classements (tops). Par défaut, sa valeur est égale à ``3``.
+            granularite (str): L'intervalle de regroupement des séries temporelles
+                (voir :attr:`SeriesTemporelles.GRANULARITES`). Par défaut, sa valeur
+                est égale à ``heure``.
+            entrees_filtre (Optional[list]): Les entrées du fichier qui passent le filtre,
+                si elles ont déjà été calculées (par exemple lors d'une analyse avec
+                plusieurs filtres en une passe). Si ``None``, elles sont calculées
+                lors du premier besoin.
+            groupements (Optional[list]): Les spécifications (:class:`SpecificationGroupement`)
+                des regroupements à calculer. Si ``None``, aucun regroupement n'est calculé.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes avant leur comptage. Si ``None``, les urls brutes sont comptées.
 
         Raises:
             TypeError: Les paramètres ne sont pas du type attendu.
-            ValueError: Si l'argument ``nombre_par_top`` est inférieur à ``0``.
+            ValueError: Si l'argument ``nombre_par_top`` est inférieur à ``0`` ou si
+                la granularité est inconnue.
         """
         # Vérification du type des paramètres
         if not isinstance(fichier_log_apache, FichierLogApache):
@@ -45,6 +76,16 @@ class AnalyseurLogApache:
         if not isinstance(nombre_par_top, int) or isinstance(nombre_par_top, bool):
             raise TypeError("Le nombre par top doit être un entier.")
         # Vérification de la valeur du paramètre
+        if entrees_filtre is not None and not isinstance(entrees_filtre, list):
+            raise TypeError("Les entrées qui passent le filtre doivent être une liste.")
+        if groupements is not None and (
+            not isinstance(groupements, list)
+            or not all(isinstance(groupement, SpecificationGroupement)
+                       for groupement in groupements)):
+            raise TypeError("Les regroupements doivent être une liste de "
+                            "SpecificationGroupement.")
+        if normaliseur_urls is not None and not isinstance(normaliseur_urls, NormaliseurUrls):
+            raise TypeError("La normalisation des urls doit être de type NormaliseurUrls.")
         if nombre_par_top < 0:
             raise ValueError("Le nombre par top doit être supérieur ou égale à 0.")
 
@@ -52,19 +93,25 @@ class AnalyseurLogApache:
         self.fichier = fichier_log_apache
         self.filtre = filtre
         self.nombre_par_top = nombre_par_top
+        self.series_temporelles = SeriesTemporelles(granularite)
+        self.groupements = groupements if groupements is not None else []
+        self.normaliseur_urls = normaliseur_urls
+        self._entrees_filtre = entrees_filtre
 
     def _get_entrees_passent_filtre(self) -> list:
         """
-        Retourne les entrées qui passent le filtre.
+        Retourne les entrées qui passent le filtre. Le filtre n'est appliqué qu'une
+        seule fois, les appels suivants réutilisent le résultat.
 
         Returns:
             list: La liste des entrées qui passent le filtre.
         """
-        entrees_valides = []
-        for entree in self.fichier.entrees:
-            if self.filtre.entree_passe_filtre(entree):
-                entrees_valides.append(entree)
-        return entrees_valides
+        if self._entrees_filtre is None:
+            entree_passe_filtre = self.filtre.get_predicat()
+            self._entrees_filtre = [
+                entree for entree in self.fichier.entrees if entree_passe_filtre(entree)
+            ]
+        return self._entrees_filtre
 
     def _get_repartition_elements(self,
                           liste_elements: list,
@@ -109,6 +156,49 @@ class AnalyseurLogApache:
             for element, total in top_elements
         ]
 
+    def _get_statistiques_quantiles(self, nom_champ: str) -> dict:
+        """
+        Retourne les statistiques de quantiles d'un champ numérique de la réponse,
+        globalement et par code de statut http, en un seul parcours des entrées
+        qui passent le filtre. Les entrées où le champ est absent sont ignorées.
+
+        Args:
+            nom_champ (str): Le nom de l'attribut de :class:`ReponseInformations`
+                à analyser.
+
+        Returns:
+            dict: Un dictionnaire contenant :
+                - global: Les statistiques de toutes les valeurs
+                  (voir :meth:`SketchQuantiles.get_statistiques`).
+                - par_code_statut_http: Une liste de statistiques par code de statut http,
+                  triée par code croissant, où chaque élément contient également
+                  la clé ``code``.
+        """
+        # Vérification du type du paramètre
+        if not isinstance(nom_champ, str):
+            raise TypeError("Le nom du champ doit être une chaîne de caractères.")
+
+        # Alimentation des sketchs
+        sketch_global = SketchQuantiles()
+        sketchs_par_code = {}
+        for entree in self._get_entrees_passent_filtre():
+            valeur = getattr(entree.reponse, nom_champ)
+            if valeur is None:
+                continue
+            sketch_global.ajoute(valeur)
+            code = entree.reponse.code_statut_http
+            if code not in sketchs_par_code:
+                sketchs_par_code[code] = SketchQuantiles()
+            sketchs_par_code[code].ajoute(valeur)
+
+        return {
+            "global": sketch_global.get_statistiques(),
+            "par_code_statut_http": [
+                {"code": code, **sketchs_par_code[code].get_statistiques()}
+                for code in sorted(sketchs_par_code)
+            ]
+        }
+
     def get_analyse_complete(self) -> dict:
         """
         Retourne l'analyse complète du fichier de log Apache.
@@ -123,6 +213,10 @@ class AnalyseurLogApache:
                     - top_urls: voir :meth:`get_top_urls`
                 - reponses:
                     - repartition_code_statut_http: voir :meth:`get_total_par_code_statut_http`
+                    - taille_octets: voir :meth:`get_statistiques_taille_octets`
+                    - temps_reponse: voir :meth:`get_statistiques_temps_reponse`
+                - series_temporelles: voir :meth:`get_series_temporelles`
+                - groupements: voir :meth:`get_groupements`
 
         Returns:
             dict: L'analyse sous forme d'un dictionnaire.
@@ -137,11 +231,32 @@ class AnalyseurLogApache:
                     "top_urls": self.get_top_urls(),
                 },
                 "reponses": {
-                    "repartition_code_statut_http": self.get_total_par_code_statut_http()
-                }
+                    "repartition_code_statut_http": self.get_total_par_code_statut_http(),
+                    "taille_octets": self.get_statistiques_taille_octets(),
+                    "temps_reponse": self.get_statistiques_temps_reponse()
+                },
+                "series_temporelles": self.get_series_temporelles(),
+                "groupements": self.get_groupements()
             }
         }
 
+    def get_etat_partiel(self) -> EtatPartielAnalyse:
+        """
+        Retourne l'état partiel de l'analyse (compteurs bruts, totaux et sketchs),
+        qui peut être sérialisé puis fusionné avec les états partiels d'autres
+        fichiers analysés avec le même filtre.
+
+        Returns:
+            EtatPartielAnalyse: L'état partiel des entrées qui passent le filtre.
+        """
+        etat_partiel = EtatPartielAnalyse(self.filtre,
+                                          self.series_temporelles.granularite,
+                                          self.groupements,
+                                          self.normaliseur_urls)
+        etat_partiel.ajoute_fichier(self.fichier.chemin, self.get_total_entrees())
+        etat_partiel.ajoute_entrees(self._get_entrees_passent_filtre())
+        return etat_partiel
+
     def get_total_entrees(self) -> int:
         """
         Retourne le nombre total d'entrées dans le fichier.
@@ -164,6 +279,7 @@ class AnalyseurLogApache:
         """
         Retourne le top :attr:`nombre_par_top` des urls les plus demandées.
         Les entrées prisent en compte sont uniquement celles qui ont passées le filtre.
+        Avec :attr:`normaliseur_urls`, les urls sont regroupées par route.
 
         Returns:
             list: Une liste de dictionnaires où chaque clé contient :
@@ -173,8 +289,11 @@ class AnalyseurLogApache:
 
                 La liste est triée dans l'ordre décroissant du nombre total d'apparitions.
         """
+        urls = [entree.requete.url for entree in self._get_entrees_passent_filtre()]
+        if self.normaliseur_urls is not None:
+            urls = [self.normaliseur_urls.normalise(url) for url in urls]
         return self._get_repartition_elements(
-            [entree.requete.url for entree in self._get_entrees_passent_filtre()],
+            urls,
             "url",
             True
         )
@@ -211,3 +330,67 @@ class AnalyseurLogApache:
             [stat["code"], stat["total"]]
             for stat in self.get_total_par_code_statut_http()
         ]
+
+    def get_statistiques_taille_octets(self) -> dict:
+        """
+        Retourne les quantiles (p50, p90, p99, p999) de la taille des réponses en octets,
+        globalement et par code de statut http. Les valeurs sont estimées avec un
+        :class:`SketchQuantiles` sans conserver toutes les tailles en mémoire.
+        Les entrées prisent en compte sont uniquement celles qui ont passées le filtre.
+
+        Returns:
+            dict: Les statistiques, voir :meth:`_get_statistiques_quantiles`.
+        """
+        return self._get_statistiques_quantiles("taille_octets")
+
+    def get_statistiques_temps_reponse(self) -> dict:
+        """
+        Retourne les quantiles (p50, p90, p99, p999) du temps de réponse en microsecondes,
+        globalement et par code de statut http. Si le format du log ne contient pas
+        le temps de réponse (``%D``), le total est égal à ``0``.
+        Les entrées prisent en compte sont uniquement celles qui ont passées le filtre.
+
+        Returns:
+            dict: Les statistiques, voir :meth:`_get_statistiques_quantiles`.
+        """
+        return self._get_statistiques_quantiles("temps_reponse")
+
+    def get_series_temporelles(self) -> dict:
+        """
+        Retourne le nombre de requêtes, d'octets et d'erreurs par intervalle de temps
+        ainsi que les pics de requêtes par seconde.
+        Les entrées prisent en compte sont uniquement celles qui ont passées le filtre.
+
+        Returns:
+            dict: Les séries temporelles, voir :meth:`SeriesTemporelles.calcule`.
+        """
+        entrees = self._get_entrees_passent_filtre()
+        nombre_entrees = len(entrees)
+        # Extraction des colonnes en une passe, le calcul est ensuite vectorisé
+        secondes = self.series_temporelles.convertit_horodatages(
+            [entree.requete.horodatage for entree in entrees]
+        )
+        octets = np.fromiter(
+            (entree.reponse.taille_octets or 0 for entree in entrees),
+            dtype=np.int64, count=nombre_entrees
+        )
+        codes = np.fromiter(
+            (entree.reponse.code_statut_http for entree in entrees),
+            dtype=np.int64, count=nombre_entrees
+        )
+        return self.series_temporelles.calcule(secondes, octets, codes)
+
+    def get_groupements(self) -> list:
+        """
+        Retourne le résultat des regroupements demandés (:attr:`groupements`), tous
+        calculés en un seul parcours des entrées qui passent le filtre.
+
+        Returns:
+            list: Les regroupements, voir :meth:`MoteurGroupement.get_groupements`.
+                La liste est vide si aucun regroupement n'est demandé.
+        """
+        if not self.groupements:
+            return []
+        moteur = MoteurGroupement(self.groupements)
+        moteur.ajoute_entrees(self._get_entrees_passent_filtre())
+        return moteur.get_groupements()
@@ -0,0 +1,399 @@
+"""
+Module pour l'analyse statistique vectorisée d'un fichier log Apache avec pandas.
+"""
+
+from itertools import compress
+from typing import Optional
+import numpy as np
+import pandas as pd
+from parse.fichier_log_apache import FichierLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.moteur_groupement import MoteurGroupement
+from analyse.sketch_quantiles import SketchQuantiles
+from analyse.series_temporelles import SeriesTemporelles
+from analyse.normaliseur_urls import NormaliseurUrls
+
+
+class AnalyseurLogApachePandas(AnalyseurLogApache):
+    """
+    Représente un analyseur qui produit la même analyse que :class:`AnalyseurLogApache`,
+    mais à partir d'un tableau (DataFrame) typé construit une seule fois depuis les
+    entrées du fichier.
+
+    Les colonnes textuelles sont catégorielles, le filtre est appliqué sous forme
+    d'un masque vectorisé et toutes les statistiques sont calculées par des
+    opérations vectorisées (factorisation, ``bincount``, tris stables). L'ordre des
+    éléments à égalité est celui de première apparition, comme avec :class:`Counter`,
+    afin que l'analyse JSON soit identique à celle du moteur Python.
+
+    Attributes:
+        donnees (pd.DataFrame): Le tableau de toutes les entrées du fichier.
+        _masque (Optional[np.ndarray]): Le masque des entrées qui passent le filtre,
+            calculé lors du premier besoin.
+    """
+
+    def __init__(self,
+                 fichier_log_apache: FichierLogApache,
+                 filtre: FiltreLogApache,
+                 nombre_par_top: int = 3,
+                 granularite: str = "heure",
+                 groupements: Optional[list] = None,
+                 donnees: Optional[pd.DataFrame] = None,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None):
+        """
+        Initialise un nouvel analyseur vectorisé de fichier log Apache.
+
+        Args:
+            fichier_log_apache (FichierLogApache): Le fichier à analyser.
+            filtre (FiltreLogApache): Le filtre à appliquer dans l'analyse.
+            nombre_par_top (int): Le nombre maximal d'éléments à inclure dans
+                les statistiques des classements (tops). Par défaut, sa valeur est égale à ``3``.
+            granularite (str): L'intervalle de regroupement des séries temporelles.
+                Par défaut, sa valeur est égale à ``heure``.
+            groupements (Optional[list]): Les spécifications (:class:`SpecificationGroupement`)
+                des regroupements à calculer. Si ``None``, aucun regroupement n'est calculé.
+            donnees (Optional[pd.DataFrame]): Le tableau des entrées du fichier s'il
+                a déjà été construit avec :meth:`construit_donnees` (par exemple pour
+                plusieurs filtres). Si ``None``, il est construit à l'initialisation.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes avant leur comptage. Si ``None``, les urls brutes sont comptées.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Si l'argument ``nombre_par_top`` est inférieur à ``0`` ou si
+                la granularité est inconnue.
+        """
+        super().__init__(fichier_log_apache,
+                         filtre,
+                         nombre_par_top,
+                         granularite,
+                         groupements=groupements,
+                         normaliseur_urls=normaliseur_urls)
+        # Vérification du paramètre
+        if donnees is not None and not isinstance(donnees, pd.DataFrame):
+            raise TypeError("Les données des entrées doivent être de type DataFrame.")
+
+        self.donnees = donnees if donnees is not None else self.construit_donnees(
+            fichier_log_apache
+        )
+        self._masque = None
+
+    @staticmethod
+    def construit_donnees(fichier_log_apache: FichierLogApache) -> pd.DataFrame:
+        """
+        Construit le tableau typé des entrées d'un fichier en un seul parcours.
+
+        Colonnes du tableau :
+            - ip, agent, methode, url, protocole, referent, vhost, jour (catégorielles)
+            - secondes (int64): l'horodatage en secondes depuis l'epoch
+            - heure (int64): l'heure de la journée
+            - code (int64): le code de statut http
+            - taille, temps (Int64): la taille de la réponse et le temps de réponse,
+              éventuellement absents
+
+        Args:
+            fichier_log_apache (FichierLogApache): Le fichier dont les entrées sont
+                converties.
+
+        Returns:
+            pd.DataFrame: Le tableau des entrées, une ligne par entrée dans l'ordre
+                du fichier.
+
+        Raises:
+            TypeError: Le paramètre n'est pas un :class:`FichierLogApache`.
+        """
+        # Vérification du paramètre
+        if not isinstance(fichier_log_apache, FichierLogApache):
+            raise TypeError("La représentation du fichier doit être de type FichierLogApache.")
+
+        colonnes = {nom: [] for nom in ("ip", "agent", "methode", "url", "protocole",
+                                         "referent", "vhost", "jour", "secondes", "heure",
+                                         "code", "taille", "temps")}
+        ajouts = [colonnes[nom].append for nom in colonnes]
+        for entree in fichier_log_apache.entrees:
+            client, requete, reponse = entree.client, entree.requete, entree.reponse
+            horodatage = requete.horodatage
+            valeurs = (client.adresse_ip, client.agent_utilisateur, requete.methode_http,
+                       requete.url, requete.protocole_http, requete.ancienne_url,
+                       requete.hote_virtuel, horodatage.date().isoformat(),
+                       horodatage, horodatage.hour,
+                       reponse.code_statut_http, reponse.taille_octets,
+                       reponse.temps_reponse)
+            for ajout, valeur in zip(ajouts, valeurs):
+                ajout(valeur)
+
+        return pd.DataFrame({
+            **{
+                nom: pd.Categorical(colonnes[nom])
+                for nom in ("ip", "agent", "methode", "url", "protocole",
+                            "referent", "vhost", "jour")
+            },
+            "secondes": SeriesTemporelles.convertit_horodatages(colonnes["secondes"]),
+            **{
+                nom: np.array(colonnes[nom], dtype=np.int64)
+                for nom in ("heure", "code")
+            },
+            **{
+                nom: pd.array(colonnes[nom], dtype="Int64")
+                for nom in ("taille", "temps")
+            }
+        })
+
+    def _get_masque(self) -> np.ndarray:
+        """
+        Retourne le masque des entrées qui passent le filtre. Le filtre n'est appliqué
+        qu'une seule fois, les appels suivants réutilisent le résultat.
+
+        Returns:
+            np.ndarray: Un tableau de booléens, un par entrée du fichier.
+        """
+        if self._masque is None:
+            self._masque = self.filtre.get_masque(self.donnees)
+        return self._masque
+
+    def _get_donnees_filtre(self) -> pd.DataFrame:
+        """
+        Retourne les lignes du tableau qui passent le filtre.
+
+        Returns:
+            pd.DataFrame: Les lignes qui passent le filtre, dans l'ordre du fichier.
+        """
+        return self.donnees[self._get_masque()]
+
+    @staticmethod
+    def _en_valeur_python(valeur):
+        """
+        Convertit une valeur issue du tableau en une valeur Python sérialisable en JSON
+        (``None`` pour une valeur absente, ``int`` pour un entier NumPy).
+
+        Args:
+            valeur (any): La valeur à convertir.
+
+        Returns:
+            any: La valeur convertie.
+        """
+        if valeur is None or valeur is pd.NA or (isinstance(valeur, float) and np.isnan(valeur)):
+            return None
+        if isinstance(valeur, np.generic):
+            return valeur.item()
+        return valeur
+
+    def _get_repartition_colonne(self,
+                                 colonne: pd.Series,
+                                 nom_elements: str,
+                                 mode_top_classement: bool = False) -> list:
+        """
+        Retourne la répartition des valeurs d'une colonne au même format que
+        :meth:`AnalyseurLogApache._get_repartition_elements`, de manière vectorisée.
+
+        Args:
+            colonne (pd.Series): La colonne à répartir.
+            nom_elements (str): Le nom des éléments.
+            mode_top_classement (bool): Indique si seul le top :attr:`nombre_par_top`
+                doit être retourné.
+
+        Returns:
+            list: Une liste de dictionnaires contenant, pour chaque élément, sa valeur,
+                son total et son taux, triée dans l'ordre décroissant du total.
+        """
+        total_elements = len(colonne)
+        # Codes dans l'ordre de première apparition (comme les clés d'un Counter)
+        codes, valeurs = pd.factorize(colonne, use_na_sentinel=False)
+        totaux = np.bincount(codes, minlength=len(valeurs))
+        ordre = np.argsort(-totaux, kind="stable")
+        if mode_top_classement:
+            ordre = ordre[:self.nombre_par_top]
+        return [
+            {
+                nom_elements: self._en_valeur_python(valeurs[indice]),
+                "total": int(totaux[indice]),
+                "taux": int(totaux[indice]) / total_elements * 100
+            }
+            for indice in ordre
+        ]
+
+    def get_total_entrees_filtre(self) -> int:
+        """
+        Retourne le nombre d'entrées qui ont passées le filtre dans le fichier.
+
+        Returns:
+            int: Le nombre total d'entrées.
+        """
+        return int(self._get_masque().sum())
+
+    def get_top_urls(self) -> list:
+        """
+        Retourne le top :attr:`nombre_par_top` des urls les plus demandées,
+        voir :meth:`AnalyseurLogApache.get_top_urls`.
+
+        Returns:
+            list: Les urls les plus demandées.
+        """
+        urls = self._get_donnees_filtre()["url"]
+        if self.normaliseur_urls is not None:
+            # Une normalisation par catégorie, et non par entrée
+            urls = urls.map(self.normaliseur_urls.normalise, na_action="ignore")
+        return self._get_repartition_colonne(urls, "url", True)
+
+    def get_total_par_code_statut_http(self) -> list:
+        """
+        Retourne la répartition des réponses par code de statut http retourné,
+        voir :meth:`AnalyseurLogApache.get_total_par_code_statut_http`.
+
+        Returns:
+            list: La répartition des codes de statut http.
+        """
+        return self._get_repartition_colonne(self._get_donnees_filtre()["code"], "code")
+
+    def _get_statistiques_quantiles(self, nom_champ: str) -> dict:
+        """
+        Retourne les statistiques de quantiles d'un champ numérique de la réponse,
+        voir :meth:`AnalyseurLogApache._get_statistiques_quantiles`. Les valeurs sont
+        ajoutées aux sketchs par blocs, dans l'ordre du fichier.
+
+        Args:
+            nom_champ (str): ``taille_octets`` ou ``temps_reponse``.
+
+        Returns:
+            dict: Les statistiques globales et par code de statut http.
+        """
+        # Vérification du paramètre
+        colonnes = {"taille_octets": "taille", "temps_reponse": "temps"}
+        if nom_champ not in colonnes:
+            raise ValueError("Le champ doit être 'taille_octets' ou 'temps_reponse'.")
+
+        donnees = self._get_donnees_filtre()
+        valeurs = donnees[colonnes[nom_champ]]
+        presentes = valeurs.notna().to_numpy(dtype=bool)
+        valeurs = valeurs.to_numpy(dtype=np.int64, na_value=0)[presentes]
+        codes = donnees["code"].to_numpy()[presentes]
+
+        sketch_global = SketchQuantiles()
+        sketch_global.ajoute_valeurs(valeurs.tolist())
+        # Tri stable par code pour conserver l'ordre du fichier dans chaque code
+        ordre = np.argsort(codes, kind="stable")
+        codes_tries = codes[ordre]
+        codes_uniques, debuts = np.unique(codes_tries, return_index=True)
+        statistiques_par_code = []
+        for code, valeurs_code in zip(codes_uniques, np.split(valeurs[ordre], debuts[1:])):
+            sketch = SketchQuantiles()
+            sketch.ajoute_valeurs(valeurs_code.tolist())
+            statistiques_par_code.append({"code": int(code), **sketch.get_statistiques()})
+
+        return {
+            "global": sketch_global.get_statistiques(),
+            "par_code_statut_http": statistiques_par_code
+        }
+
+    def get_series_temporelles(self) -> dict:
+        """
+        Retourne le nombre de requêtes, d'octets et d'erreurs par intervalle de temps,
+        voir :meth:`AnalyseurLogApache.get_series_temporelles`.
+
+        Returns:
+            dict: Les séries temporelles.
+        """
+        donnees = self._get_donnees_filtre()
+        return self.series_temporelles.calcule(
+            donnees["secondes"].to_numpy(),
+            donnees["taille"].to_numpy(dtype=np.int64, na_value=0),
+            donnees["code"].to_numpy()
+        )
+
+    def _get_colonne_dimension(self, donnees: pd.DataFrame, dimension: str) -> pd.Series:
+        """
+        Retourne la colonne correspondant à une dimension de regroupement.
+
+        Args:
+            donnees (pd.DataFrame): Les lignes à regrouper.
+            dimension (str): Le nom de la dimension
+                (voir :attr:`SpecificationGroupement.DIMENSIONS`).
+
+        Returns:
+            pd.Series: La colonne de la dimension.
+        """
+        if dimension == "classe_code":
+            return (donnees["code"] // 100).astype(str) + "xx"
+        return donnees[dimension]
+
+    def get_groupements(self) -> list:
+        """
+        Retourne le résultat des regroupements demandés, voir
+        :meth:`AnalyseurLogApache.get_groupements`. Chaque regroupement est calculé par
+        factorisation des clés et ``bincount``. Au-delà de la taille maximale de
+        :class:`MoteurGroupement`, le regroupement est calculé par le même moteur
+        borné (Space-Saving) que le moteur Python, sur les entrées dans l'ordre du
+        fichier, pour que les deux moteurs retournent les mêmes groupes et le même
+        groupe « autres ».
+
+        Returns:
+            list: Les regroupements.
+        """
+        if not self.groupements:
+            return []
+        donnees = self._get_donnees_filtre()
+        total_entrees = len(donnees)
+        taille = donnees["taille"]
+        presentes = taille.notna().to_numpy(dtype=np.float64)
+        tailles = taille.to_numpy(dtype=np.float64, na_value=0)
+
+        def statistiques_groupe(total: int, somme_octets: int, nombre_tailles: int) -> dict:
+            return {
+                "total": total,
+                "taux": total / total_entrees * 100 if total_entrees else 0.0,
+                "somme_octets": somme_octets,
+                "moyenne_octets": somme_octets / nombre_tailles if nombre_tailles else None
+            }
+
+        resultats = []
+        bornes = {}
+        for position, specification in enumerate(self.groupements):
+            colonnes = [self._get_colonne_dimension(donnees, dimension)
+                        for dimension in specification.dimensions]
+            # Identifiant de groupe dans l'ordre de première apparition : les codes
+            # de chaque colonne sont combinés un à un à la clé, refactorisée après
+            # chaque dimension pour rester inférieure au nombre de lignes
+            codes_colonnes = [pd.factorize(colonne, use_na_sentinel=False)
+                              for colonne in colonnes]
+            identifiants = np.zeros(total_entrees, dtype=np.int64)
+            for codes, valeurs in codes_colonnes:
+                identifiants, _ = pd.factorize(identifiants * len(valeurs) + codes)
+            _, premieres_lignes = np.unique(identifiants, return_index=True)
+            nombre_groupes = len(premieres_lignes)
+            if nombre_groupes > MoteurGroupement.TAILLE_MAXIMALE:
+                # Calculé plus bas par le moteur borné
+                bornes[position] = specification
+                resultats.append(None)
+                continue
+            # Agrégats par groupe
+            totaux = np.bincount(identifiants, minlength=nombre_groupes)
+            sommes = np.bincount(identifiants, weights=tailles, minlength=nombre_groupes)
+            nombres = np.bincount(identifiants, weights=presentes, minlength=nombre_groupes)
+            ordre = np.argsort(-totaux, kind="stable")
+            resultats.append({
+                "dimensions": list(specification.dimensions),
+                "total_groupes": nombre_groupes,
+                "groupes": [
+                    {
+                        **{
+                            dimension: self._en_valeur_python(
+                                valeurs[codes[premieres_lignes[indice]]]
+                            )
+                            for dimension, (codes, valeurs) in zip(specification.dimensions,
+                                                                   codes_colonnes)
+                        },
+                        **statistiques_groupe(int(totaux[indice]),
+                                              int(sommes[indice]),
+                                              int(nombres[indice]))
+                    }
+                    for indice in ordre
+                ],
+                "autres": None
+            })
+        if bornes:
+            moteur = MoteurGroupement(list(bornes.values()), MoteurGroupement.TAILLE_MAXIMALE)
+            moteur.ajoute_entrees(list(compress(self.fichier.entrees, self._get_masque())))
+            for position, groupement in zip(bornes, moteur.get_groupements()):
+                resultats[position] = groupement
+        return resultats
@@ -0,0 +1,189 @@
+"""
+Module pour l'analyse statistique d'un fichier log Apache avec plusieurs filtres
+en une seule passe.
+"""
+
+from os.path import abspath
+from typing import Optional
+from parse.fichier_log_apache import FichierLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.analyseur_log_apache_pandas import AnalyseurLogApachePandas
+from analyse.index_inverse import IndexInverseEntrees
+from analyse.normaliseur_urls import NormaliseurUrls
+
+
+class AnalyseurMultiFiltres:
+    """
+    Représente un analyseur qui produit une analyse par filtre à partir d'un seul
+    fichier de log Apache déjà parsé.
+
+    Tous les filtres sont évalués sur chaque entrée au cours d'un unique parcours
+    du fichier. Chaque analyse réutilise ensuite les entrées qui ont passé son
+    filtre, sans reparcourir le fichier. Avec le moteur ``pandas``, le tableau des
+    entrées est construit une seule fois et partagé par tous les analyseurs. Avec
+    des index inversés (:class:`IndexInverseEntrees`), chaque filtre ne vérifie que
+    les entrées candidates trouvées par les index.
+
+    Attributes:
+        fichier (FichierLogApache): Le fichier de log Apache à analyser.
+        filtres (list): La liste des filtres (:class:`FiltreLogApache`) à appliquer.
+        nombre_par_top (int): Le nombre maximal d'éléments à inclure dans
+            les statistiques des classements (tops).
+        granularite (str): L'intervalle de regroupement des séries temporelles.
+        groupements (Optional[list]): Les spécifications des regroupements à calculer
+            pour chaque filtre.
+        moteur (str): Le moteur d'analyse utilisé (``python`` ou ``pandas``).
+        index (Optional[IndexInverseEntrees]): Les index inversés des entrées du fichier.
+        normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+            routes, partagée par les analyseurs de tous les filtres.
+        _analyseurs (Optional[list]): Les analyseurs de chaque filtre, créés lors
+            du premier besoin.
+    """
+
+    def __init__(self,
+                 fichier_log_apache: FichierLogApache,
+                 filtres: list,
+                 nombre_par_top: int = 3,
+                 granularite: str = "heure",
+                 groupements: Optional[list] = None,
+                 moteur: str = "python",
+                 index: Optional[IndexInverseEntrees] = None,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None):
+        """
+        Initialise un nouvel analyseur multi-filtres.
+
+        Args:
+            fichier_log_apache (FichierLogApache): Le fichier à analyser.
+            filtres (list): La liste des filtres à appliquer. Une analyse est produite
+                pour chaque filtre, dans le même ordre.
+            nombre_par_top (int): Le nombre maximal d'éléments à inclure dans
+                les statistiques des classements (tops). Par défaut, sa valeur est égale à ``3``.
+            granularite (str): L'intervalle de regroupement des séries temporelles.
+                Par défaut, sa valeur est égale à ``heure``.
+            groupements (Optional[list]): Les spécifications (:class:`SpecificationGroupement`)
+                des regroupements à calculer pour chaque filtre. Par défaut, aucun.
+            moteur (str): Le moteur d'analyse, ``python`` (:class:`AnalyseurLogApache`)
+                ou ``pandas`` (:class:`AnalyseurLogApachePandas`). Par défaut, sa valeur
+                est égale à ``python``.
+            index (Optional[IndexInverseEntrees]): Les index inversés des entrées du
+                fichier, utilisés à la place de la répartition en une seule passe. Ils
+                peuvent être réutilisés par plusieurs analyseurs du même fichier. Par
+                défaut, aucun.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes avant leur comptage, partagée par tous les filtres (chaque url
+                distincte n'est normalisée qu'une fois). Par défaut, aucune.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La liste des filtres est vide, le moteur est inconnu ou les
+                index ne sont pas utilisables (autre fichier ou moteur ``pandas``).
+        """
+        # Vérification du type des paramètres
+        if not isinstance(fichier_log_apache, FichierLogApache):
+            raise TypeError("La représentation du fichier doit être de type FichierLogApache.")
+        if not isinstance(filtres, list):
+            raise TypeError("Les filtres doivent être dans une liste.")
+        if not all(isinstance(filtre, FiltreLogApache) for filtre in filtres):
+            raise TypeError("Les filtres à appliquer aux entrées doivent être de "
+                            "type FiltreLogApache.")
+        if not isinstance(moteur, str):
+            raise TypeError("Le moteur d'analyse doit être une chaîne de caractères.")
+        if index is not None and not isinstance(index, IndexInverseEntrees):
+            raise TypeError("Les index inversés doivent être de type IndexInverseEntrees.")
+        # Vérification de la valeur des paramètres
+        if not filtres:
+            raise ValueError("Au moins un filtre doit être fourni.")
+        if moteur not in ("python", "pandas"):
+            raise ValueError("Le moteur d'analyse doit être 'python' ou 'pandas'.")
+        if index is not None and (index.fichier is not fichier_log_apache or moteur != "python"):
+            raise ValueError("Les index inversés doivent être ceux du fichier analysé et "
+                             "ne sont utilisables qu'avec le moteur 'python'.")
+
+        # Ajout des données
+        self.fichier = fichier_log_apache
+        self.filtres = filtres
+        self.nombre_par_top = nombre_par_top
+        self.granularite = granularite
+        self.groupements = groupements
+        self.moteur = moteur
+        self.index = index
+        self.normaliseur_urls = normaliseur_urls
+        self._analyseurs = None
+
+    def _repartit_entrees(self) -> list:
+        """
+        Parcourt une seule fois les entrées du fichier et répartit chaque entrée
+        dans la liste de chaque filtre qu'elle passe. Avec des index inversés, les
+        entrées de chaque filtre sont directement obtenues depuis les index.
+
+        Returns:
+            list: Une liste de listes d'entrées, une par filtre, dans l'ordre
+                de :attr:`filtres`.
+        """
+        if self.index is not None:
+            return [self.index.get_entrees_filtre(filtre) for filtre in self.filtres]
+        verifications = [
+            (filtre.get_predicat(), [])
+            for filtre in self.filtres
+        ]
+        for entree in self.fichier.entrees:
+            for entree_passe_filtre, entrees_filtre in verifications:
+                if entree_passe_filtre(entree):
+                    entrees_filtre.append(entree)
+        return [entrees_filtre for _, entrees_filtre in verifications]
+
+    def get_analyseurs(self) -> list:
+        """
+        Retourne un analyseur par filtre, alimenté par les entrées réparties
+        en une seule passe (ou par le tableau des entrées construit une seule fois
+        avec le moteur ``pandas``). La répartition n'est effectuée qu'une seule fois.
+
+        Returns:
+            list: La liste des :class:`AnalyseurLogApache`, dans l'ordre de :attr:`filtres`.
+        """
+        if self._analyseurs is None and self.moteur == "pandas":
+            donnees = AnalyseurLogApachePandas.construit_donnees(self.fichier)
+            self._analyseurs = [
+                AnalyseurLogApachePandas(self.fichier,
+                                         filtre,
+                                         self.nombre_par_top,
+                                         self.granularite,
+                                         groupements=self.groupements,
+                                         donnees=donnees,
+                                         normaliseur_urls=self.normaliseur_urls)
+                for filtre in self.filtres
+            ]
+        elif self._analyseurs is None:
+            self._analyseurs = [
+                AnalyseurLogApache(self.fichier,
+                                   filtre,
+                                   self.nombre_par_top,
+                                   self.granularite,
+                                   entrees_filtre=entrees_filtre,
+                                   groupements=self.groupements,
+                                   normaliseur_urls=self.normaliseur_urls)
+                for filtre, entrees_filtre in zip(self.filtres, self._repartit_entrees())
+            ]
+        return self._analyseurs
+
+    def get_analyses_completes(self) -> dict:
+        """
+        Retourne l'analyse complète du fichier pour chaque filtre.
+
+        L'analyse suit la structure suivante :
+            - chemin: chemin absolu du fichier
+            - total_entrees: nombre total d'entrées dans le fichier
+            - analyses: une liste d'analyses au format de
+              :meth:`AnalyseurLogApache.get_analyse_complete`, une par filtre
+
+        Returns:
+            dict: Les analyses sous forme d'un dictionnaire.
+        """
+        return {
+            "chemin": abspath(self.fichier.chemin),
+            "total_entrees": len(self.fichier.entrees),
+            "analyses": [
+                analyseur.get_analyse_complete() for analyseur in self.get_analyseurs()
+            ]
+        }
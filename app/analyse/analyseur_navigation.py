@@ -0,0 +1,236 @@
+"""
+Module pour l'analyse, en flux et à mémoire bornée, des flux de navigation entre
+les sites référents et les urls demandées d'un log Apache.
+"""
+
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlsplit
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.compteur_borne import CompteurBorne
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.verifications import verifie_nombre_par_top
+
+
+class AnalyseurNavigation:
+    """
+    Représente l'analyse des flux de navigation d'un flux d'entrées de log Apache : les
+    liens (domaine du référent, url demandée) les plus suivis et les domaines externes
+    qui amènent le plus de visiteurs.
+
+    Le domaine d'un référent est extrait une seule fois par référent distinct, grâce à
+    un cache LRU. Un référent est interne lorsque son domaine est celui de l'hôte
+    virtuel de la requête ou l'un des :attr:`domaines_internes`. L'ensemble des liens
+    pouvant croître avec le produit du nombre de domaines et du nombre d'urls, les liens
+    et les domaines externes sont comptés en mémoire bornée par des
+    :class:`CompteurBorne` (Space-Saving).
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        domaines_internes (frozenset): Les domaines considérés comme internes, en
+            minuscules et sans préfixe ``www.``.
+        normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+            routes avant leur comptage.
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        requetes_analysees (int): Le nombre d'entrées filtrées avec une url.
+        requetes_sans_referent (int): Le nombre de requêtes sans référent (accès direct).
+        requetes_referent_invalide (int): Le nombre de requêtes dont le référent n'a pas
+            de domaine.
+        requetes_referent_interne (int): Le nombre de requêtes avec un référent interne.
+        requetes_referent_externe (int): Le nombre de requêtes avec un référent externe.
+        liens (CompteurBorne): Le nombre de requêtes de chaque lien ``(domaine, url)``.
+        domaines_externes (CompteurBorne): Le nombre de requêtes de chaque domaine
+            externe.
+        _domaine_cache (Callable): L'extraction du domaine d'un référent, enveloppée dans
+            un cache LRU.
+        _predicat (Callable): Le prédicat compilé du filtre.
+    """
+
+    def __init__(self,
+                 filtre: FiltreLogApache,
+                 domaines_internes: Optional[list] = None,
+                 capacite_liens: int = 10000,
+                 taille_cache: int = 100000,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None):
+        """
+        Initialise une analyse des flux de navigation vide.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            domaines_internes (Optional[list]): Les domaines considérés comme internes,
+                en plus de l'hôte virtuel de chaque requête. Par défaut, aucun.
+            capacite_liens (int): Le nombre maximal de liens et de domaines externes
+                suivis. Par défaut, ``10000``.
+            taille_cache (int): Le nombre maximal de référents distincts gardés dans le
+                cache. Par défaut, ``100000``.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes. Si ``None``, les urls brutes sont comptées.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La capacité ou la taille du cache est inférieure à ``1``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+        if domaines_internes is not None and (
+                not isinstance(domaines_internes, list)
+                or not all(isinstance(domaine, str) for domaine in domaines_internes)):
+            raise TypeError("Les domaines internes doivent être une liste de chaînes de "
+                            "caractères.")
+        if not all(isinstance(entier, int) and not isinstance(entier, bool)
+                   for entier in (capacite_liens, taille_cache)):
+            raise TypeError("La capacité et la taille du cache doivent être des entiers.")
+        if normaliseur_urls is not None and not isinstance(normaliseur_urls, NormaliseurUrls):
+            raise TypeError("La normalisation des urls doit être de type NormaliseurUrls.")
+        # Vérification de la valeur des paramètres
+        if min(capacite_liens, taille_cache) < 1:
+            raise ValueError("La capacité et la taille du cache doivent être supérieures à 0.")
+
+        self.filtre = filtre
+        self.domaines_internes = frozenset(self._extrait_domaine(f"//{domaine}") or domaine
+                                           for domaine in domaines_internes or [])
+        self.normaliseur_urls = normaliseur_urls
+        self.total_entrees = 0
+        self.requetes_analysees = 0
+        self.requetes_sans_referent = 0
+        self.requetes_referent_invalide = 0
+        self.requetes_referent_interne = 0
+        self.requetes_referent_externe = 0
+        self.liens = CompteurBorne(capacite_liens)
+        self.domaines_externes = CompteurBorne(capacite_liens)
+        self._domaine_cache = lru_cache(maxsize=taille_cache)(self._extrait_domaine)
+        self._predicat = filtre.get_predicat()
+
+    @staticmethod
+    def _extrait_domaine(referent: str) -> Optional[str]:
+        """
+        Extrait le domaine d'un référent, sans cache.
+
+        Args:
+            referent (str): Le référent (url absolue).
+
+        Returns:
+            Optional[str]: Le domaine en minuscules, sans port ni préfixe ``www.``, ou
+            ``None`` si le référent n'a pas de domaine.
+        """
+        try:
+            domaine = urlsplit(referent.strip()).hostname
+        except ValueError:
+            return None
+        if not domaine:
+            return None
+        return domaine[4:] if domaine.startswith("www.") else domaine
+
+    def get_domaine(self, referent: str) -> Optional[str]:
+        """
+        Retourne le domaine d'un référent, en réutilisant celui d'un référent identique
+        déjà rencontré.
+
+        Args:
+            referent (str): Le référent (url absolue).
+
+        Returns:
+            Optional[str]: Le domaine, ou ``None`` si le référent n'a pas de domaine.
+
+        Raises:
+            TypeError: Le paramètre ``referent`` n'est pas une chaîne de caractères.
+        """
+        # Vérification du paramètre
+        if not isinstance(referent, str):
+            raise TypeError("Le référent doit être une chaîne de caractères.")
+
+        return self._domaine_cache(referent)
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée reçue aux flux de navigation si elle passe le filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+        """
+        self.total_entrees += 1
+        requete = entree.requete
+        if not self._predicat(entree) or requete.url is None:
+            return
+        self.requetes_analysees += 1
+        if requete.ancienne_url is None:
+            self.requetes_sans_referent += 1
+            return
+        domaine = self._domaine_cache(requete.ancienne_url)
+        if domaine is None:
+            self.requetes_referent_invalide += 1
+            return
+        url = (requete.url if self.normaliseur_urls is None
+               else self.normaliseur_urls.normalise(requete.url))
+        self.liens.ajoute((domaine, url))
+        # Le domaine de l'hôte virtuel (``site.fr:80``) est extrait comme un référent
+        hote = (self._domaine_cache(f"//{requete.hote_virtuel}")
+                if requete.hote_virtuel is not None else None)
+        if domaine == hote or domaine in self.domaines_internes:
+            self.requetes_referent_interne += 1
+            return
+        self.requetes_referent_externe += 1
+        self.domaines_externes.ajoute(domaine)
+
+    def ajoute_entrees(self, entrees) -> None:
+        """
+        Ajoute plusieurs entrées reçues.
+
+        Args:
+            entrees (Iterable): Les entrées reçues.
+
+        Returns:
+            None
+        """
+        for entree in entrees:
+            self.ajoute_entree(entree)
+
+    def get_analyse(self, nombre_par_top: int = 10) -> dict:
+        """
+        Retourne les liens les plus suivis et les domaines externes les plus fréquents.
+
+        Args:
+            nombre_par_top (int): Le nombre maximal d'éléments de chaque classement.
+                Par défaut, sa valeur est égale à ``10``.
+
+        Returns:
+            dict: Le nombre de requêtes par type de référent, les liens les plus suivis,
+            les domaines externes les plus fréquents (total, taux parmi les référents
+            externes et erreur maximale du total) et l'utilisation du cache.
+
+        Raises:
+            TypeError: Le paramètre ``nombre_par_top`` n'est pas un entier.
+            ValueError: Le paramètre ``nombre_par_top`` est inférieur à ``0``.
+        """
+        # Vérification du paramètre
+        verifie_nombre_par_top(nombre_par_top)
+
+        informations_cache = self._domaine_cache.cache_info()
+        return {
+            "requetes_analysees": self.requetes_analysees,
+            "requetes_sans_referent": self.requetes_sans_referent,
+            "requetes_referent_invalide": self.requetes_referent_invalide,
+            "requetes_referent_interne": self.requetes_referent_interne,
+            "requetes_referent_externe": self.requetes_referent_externe,
+            "top_liens": [
+                {"domaine_referent": domaine, "url": url, "total": total,
+                 "erreur_max": erreur}
+                for (domaine, url), total, erreur in self.liens.get_top(nombre_par_top)
+            ],
+            "top_domaines_externes": [
+                {"domaine": domaine, "total": total,
+                 "taux": total / self.requetes_referent_externe * 100,
+                 "erreur_max": erreur}
+                for domaine, total, erreur in self.domaines_externes.get_top(nombre_par_top)
+            ],
+            "cache": {
+                "succes": informations_cache.hits,
+                "extractions": informations_cache.misses,
+                "taille": informations_cache.currsize
+            }
+        }
@@ -0,0 +1,234 @@
+"""
+Module pour la découpe en sessions, en un seul parcours et à mémoire bornée, du
+trafic des clients d'un log Apache.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_entrees_horodatees import AnalyseurEntreesHorodatees
+from analyse.sketch_quantiles import SketchQuantiles
+from analyse.compteur_borne import CompteurBorne
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.verifications import verifie_nombre_par_top
+
+
+class AnalyseurSessions(AnalyseurEntreesHorodatees):
+    """
+    Représente l'analyse des sessions des clients d'un flux d'entrées de log Apache
+    ordonnées par horodatage (par exemple par :class:`FusionChronologique`).
+
+    Une session regroupe les requêtes d'un même client, identifié par son adresse IP
+    et son agent utilisateur, tant que deux requêtes successives sont séparées d'au
+    plus :attr:`delai_inactivite` secondes.
+
+    Les sessions en cours sont rangées dans un dictionnaire ordonné par leur dernière
+    activité : les sessions inactives sont toujours en tête et sont clôturées dès
+    qu'une entrée plus récente que leur délai d'inactivité est reçue. La mémoire
+    dépend donc du nombre de sessions simultanées, et non du trafic total. Les
+    sessions clôturées ne sont conservées que sous forme d'agrégats bornés (sketchs
+    et compteurs Space-Saving).
+
+    Une entrée légèrement antérieure à la plus récente reçue est rattachée à l'instant
+    de l'entrée la plus récente. Une entrée sans horodatage est ignorée.
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        delai_inactivite (int): La durée maximale (en secondes) entre deux requêtes
+            d'une même session.
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        entrees_ignorees (int): Le nombre d'entrées filtrées ignorées car sans horodatage.
+        total_sessions (int): Le nombre de sessions clôturées.
+        sessions_simultanees_max (int): Le nombre maximal de sessions en cours au
+            même instant.
+        requetes_par_session (SketchQuantiles): Le nombre de requêtes des sessions
+            clôturées.
+        durees_sessions (SketchQuantiles): La durée (en secondes) des sessions clôturées.
+        urls_entree (CompteurBorne): Les premières urls des sessions clôturées.
+        urls_sortie (CompteurBorne): Les dernières urls des sessions clôturées.
+        normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+            routes avant leur enregistrement dans les sessions.
+        _sessions (OrderedDict): Les sessions en cours, de la moins récemment active
+            à la plus récemment active, sous la forme ``[debut, derniere_activite,
+            nombre_requetes, url_entree, url_sortie]``.
+        _instant (float): L'horodatage (en secondes depuis l'epoch) le plus récent reçu.
+        _predicat (Callable): Le prédicat compilé du filtre.
+    """
+
+    def __init__(self,
+                 filtre: FiltreLogApache,
+                 delai_inactivite: int = 1800,
+                 capacite_urls: int = 1000,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None):
+        """
+        Initialise une analyse des sessions vide.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            delai_inactivite (int): La durée maximale (en secondes) entre deux requêtes
+                d'une même session. Par défaut, 30 minutes.
+            capacite_urls (int): Le nombre maximal d'urls d'entrée et de sortie suivies.
+                Par défaut, ``1000``.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes. Si ``None``, les urls brutes sont enregistrées.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Le délai d'inactivité ou la capacité est inférieur à ``1``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+        if not isinstance(delai_inactivite, int) or isinstance(delai_inactivite, bool):
+            raise TypeError("Le délai d'inactivité doit être un entier.")
+        if normaliseur_urls is not None and not isinstance(normaliseur_urls, NormaliseurUrls):
+            raise TypeError("La normalisation des urls doit être de type NormaliseurUrls.")
+        # Vérification de la valeur des paramètres
+        if delai_inactivite < 1:
+            raise ValueError("Le délai d'inactivité doit être supérieur à 0.")
+
+        super().__init__(filtre)
+        self.delai_inactivite = delai_inactivite
+        self.total_sessions = 0
+        self.sessions_simultanees_max = 0
+        self.requetes_par_session = SketchQuantiles()
+        self.durees_sessions = SketchQuantiles()
+        self.urls_entree = CompteurBorne(capacite_urls)
+        self.urls_sortie = CompteurBorne(capacite_urls)
+        self.normaliseur_urls = normaliseur_urls
+        self._sessions = OrderedDict()
+        self._instant = float("-inf")
+
+    def _cloture_session(self, session: list) -> None:
+        """
+        Ajoute une session terminée aux agrégats.
+
+        Args:
+            session (list): La session, au format de :attr:`_sessions`.
+
+        Returns:
+            None
+        """
+        debut, derniere_activite, nombre_requetes, url_entree, url_sortie = session
+        self.total_sessions += 1
+        self.requetes_par_session.ajoute(nombre_requetes)
+        self.durees_sessions.ajoute(derniere_activite - debut)
+        self.urls_entree.ajoute(url_entree)
+        self.urls_sortie.ajoute(url_sortie)
+
+    def _cloture_sessions_inactives(self) -> None:
+        """
+        Clôture les sessions inactives depuis plus que le délai d'inactivité.
+
+        Returns:
+            None
+        """
+        limite = self._instant - self.delai_inactivite
+        while self._sessions:
+            cle, session = next(iter(self._sessions.items()))
+            if session[1] >= limite:
+                return
+            del self._sessions[cle]
+            self._cloture_session(session)
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée reçue à la session de son client si elle passe le filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+        """
+        if not self._admet_entree(entree):
+            return
+        self._instant = max(self._instant, entree.requete.horodatage.timestamp())
+        self._cloture_sessions_inactives()
+        cle = (entree.client.adresse_ip, entree.client.agent_utilisateur)
+        url = entree.requete.url
+        if self.normaliseur_urls is not None:
+            url = self.normaliseur_urls.normalise(url)
+        session = self._sessions.get(cle)
+        if session is None:
+            self._sessions[cle] = [self._instant, self._instant, 1, url, url]
+            self.sessions_simultanees_max = max(self.sessions_simultanees_max,
+                                                len(self._sessions))
+            return
+        session[1] = self._instant
+        session[2] += 1
+        session[4] = url
+        self._sessions.move_to_end(cle)
+
+    def termine(self) -> None:
+        """
+        Clôture toutes les sessions en cours, à la fin du flux.
+
+        Returns:
+            None
+        """
+        while self._sessions:
+            self._cloture_session(self._sessions.popitem(last=False)[1])
+
+    def get_total_sessions_en_cours(self) -> int:
+        """
+        Retourne le nombre de sessions en cours (non clôturées).
+
+        Returns:
+            int: Le nombre de sessions en cours.
+        """
+        return len(self._sessions)
+
+    def _get_top_urls(self, compteur: CompteurBorne, nombre_par_top: int) -> list:
+        """
+        Retourne les urls les plus fréquentes d'un compteur, avec leur taux parmi les
+        sessions clôturées.
+
+        Args:
+            compteur (CompteurBorne): Le compteur des urls d'entrée ou de sortie.
+            nombre_par_top (int): Le nombre maximal d'urls retournées.
+
+        Returns:
+            list: Les urls, leur total, leur taux et l'erreur maximale de leur total.
+        """
+        return [
+            {"url": url, "total": total, "taux": total / self.total_sessions * 100,
+             "erreur_max": erreur}
+            for url, total, erreur in compteur.get_top(nombre_par_top)
+        ]
+
+    def get_analyse_complete(self, nombre_par_top: int = 3) -> dict:
+        """
+        Retourne l'analyse des sessions clôturées jusqu'à présent (voir :meth:`termine`
+        pour clôturer les sessions en cours à la fin du flux).
+
+        Args:
+            nombre_par_top (int): Le nombre maximal d'éléments à inclure dans
+                les statistiques des classements (tops). Par défaut, sa valeur est égale à ``3``.
+
+        Returns:
+            dict: L'analyse sous forme d'un dictionnaire.
+
+        Raises:
+            TypeError: Le paramètre ``nombre_par_top`` n'est pas un entier.
+            ValueError: Le paramètre ``nombre_par_top`` est inférieur à ``0``.
+        """
+        # Vérification du paramètre
+        verifie_nombre_par_top(nombre_par_top)
+
+        return {
+            "total_entrees": self.total_entrees,
+            "filtre": self.filtre.get_dict_filtre(),
+            "delai_inactivite": self.delai_inactivite,
+            "entrees_ignorees": self.entrees_ignorees,
+            "sessions": {
+                "total_sessions": self.total_sessions,
+                "sessions_en_cours": self.get_total_sessions_en_cours(),
+                "sessions_simultanees_max": self.sessions_simultanees_max,
+                "requetes_par_session": self.requetes_par_session.get_statistiques(),
+                "duree_secondes": self.durees_sessions.get_statistiques(),
+                "top_urls_entree": self._get_top_urls(self.urls_entree, nombre_par_top),
+                "top_urls_sortie": self._get_top_urls(self.urls_sortie, nombre_par_top)
+            }
+        }
@@ -0,0 +1,316 @@
+"""
+Module pour le calcul, en flux et à mémoire constante, du taux d'erreurs par
+fenêtre de temps et de la consommation du budget d'erreurs d'un objectif de
+disponibilité (SLO).
+"""
+
+import heapq
+from collections import deque
+from datetime import datetime, timezone
+from typing import Optional
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_entrees_horodatees import AnalyseurEntreesHorodatees
+
+
+class AnalyseurSLO(AnalyseurEntreesHorodatees):
+    """
+    Représente le suivi du taux d'erreurs (réponses ``5xx``) d'un flux d'entrées de
+    log Apache ordonnées par horodatage, par rapport à un objectif de disponibilité.
+
+    Le temps est découpé en fenêtres consécutives de :attr:`taille_fenetre` secondes.
+    Seuls les compteurs de la fenêtre en cours sont mis à jour à chaque entrée ;
+    une fenêtre terminée est ajoutée aux :attr:`pires_fenetres` (un tas borné) et
+    à l'historique des dernières fenêtres, un tampon circulaire qui couvre la plus
+    longue des :attr:`FENETRES_CONSOMMATION`.
+
+    Le taux de consommation du budget d'erreurs d'une période est son taux d'erreurs
+    divisé par le taux d'erreurs autorisé (``1 - objectif``) : à ``1``, le budget est
+    consommé exactement à la fin de la période de l'objectif. Il est calculé à la fin
+    de chaque fenêtre, sur la dernière heure et les six dernières heures.
+
+    Une entrée antérieure à la fenêtre en cours est comptée dans la fenêtre en cours.
+    Une entrée sans horodatage est ignorée.
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        objectif (float): La proportion de réponses sans erreur visée.
+        taille_fenetre (int): La durée (en secondes) d'une fenêtre.
+        nombre_pires (int): Le nombre de pires fenêtres conservées.
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        entrees_ignorees (int): Le nombre d'entrées filtrées ignorées car sans horodatage.
+        total_requetes (int): Le nombre de requêtes des fenêtres terminées.
+        total_erreurs (int): Le nombre d'erreurs des fenêtres terminées.
+        fenetres (int): Le nombre de fenêtres terminées avec au moins une requête.
+        fenetres_hors_objectif (int): Le nombre de fenêtres terminées dont le taux
+            d'erreurs dépasse le taux autorisé.
+        pires_fenetres (list): Le tas des pires fenêtres terminées, sous la forme
+            ``(taux_erreurs, erreurs, fenetre, requetes)``.
+        taux_max (dict): Pour chaque période de :attr:`FENETRES_CONSOMMATION`, le
+            taux de consommation maximal et la fenêtre à la fin de laquelle il a été
+            atteint, sous la forme ``[taux, fenetre]``.
+        _fenetre (Optional[int]): Le numéro (depuis l'epoch) de la fenêtre en cours.
+        _requetes (int): Le nombre de requêtes de la fenêtre en cours.
+        _erreurs (int): Le nombre d'erreurs de la fenêtre en cours.
+        _historique (deque): Les ``(requetes, erreurs)`` des dernières fenêtres terminées.
+        _sommes (dict): Pour chaque période, les ``[requetes, erreurs]`` des fenêtres
+            terminées de l'historique qu'elle couvre, sauf la plus ancienne.
+        _predicat (Callable): Le prédicat compilé du filtre.
+
+    Class-level variables:
+        :cvar FENETRES_CONSOMMATION (dict): La durée (en secondes) des périodes du taux
+            de consommation, par nom.
+    """
+
+    FENETRES_CONSOMMATION: dict = {"1h": 3600, "6h": 21600}
+
+    def __init__(self,
+                 filtre: FiltreLogApache,
+                 objectif: float = 0.999,
+                 taille_fenetre: int = 300,
+                 nombre_pires: int = 10):
+        """
+        Initialise un suivi vide.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            objectif (float): La proportion de réponses sans erreur visée, comprise
+                entre ``0`` et ``1`` (exclus). Par défaut, ``0.999``.
+            taille_fenetre (int): La durée d'une fenêtre, qui doit diviser une heure.
+                Par défaut, 5 minutes.
+            nombre_pires (int): Le nombre de pires fenêtres conservées. Par défaut, ``10``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Un paramètre n'est pas dans son intervalle de valeurs.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+        if not isinstance(objectif, (int, float)) or isinstance(objectif, bool):
+            raise TypeError("L'objectif de disponibilité doit être un nombre.")
+        if not all(isinstance(entier, int) and not isinstance(entier, bool)
+                   for entier in (taille_fenetre, nombre_pires)):
+            raise TypeError("La taille des fenêtres et le nombre de pires fenêtres "
+                            "doivent être des entiers.")
+        # Vérification de la valeur des paramètres
+        if not 0 < objectif < 1:
+            raise ValueError("L'objectif de disponibilité doit être compris entre 0 et 1 "
+                             "(exclus).")
+        if taille_fenetre < 1 or 3600 % taille_fenetre != 0:
+            raise ValueError("La taille des fenêtres doit diviser une heure.")
+        if nombre_pires < 0:
+            raise ValueError("Le nombre de pires fenêtres doit être supérieur ou égal à 0.")
+
+        super().__init__(filtre)
+        self.objectif = objectif
+        self.taille_fenetre = taille_fenetre
+        self.nombre_pires = nombre_pires
+        self.total_requetes = 0
+        self.total_erreurs = 0
+        self.fenetres = 0
+        self.fenetres_hors_objectif = 0
+        self.pires_fenetres = []
+        self.taux_max = {nom: [None, None] for nom in self.FENETRES_CONSOMMATION}
+        self._fenetre = None
+        self._requetes = 0
+        self._erreurs = 0
+        self._historique = deque(maxlen=max(self.FENETRES_CONSOMMATION.values())
+                                 // taille_fenetre)
+        self._sommes = {nom: [0, 0] for nom in self.FENETRES_CONSOMMATION}
+
+    def _get_date(self, fenetre: int) -> str:
+        """
+        Retourne la date (ISO 8601, UTC) du début d'une fenêtre.
+
+        Args:
+            fenetre (int): Le numéro de la fenêtre depuis l'epoch.
+
+        Returns:
+            str: La date du début de la fenêtre.
+        """
+        return datetime.fromtimestamp(fenetre * self.taille_fenetre, timezone.utc).isoformat()
+
+    def _get_taux_consommation(self, requetes: int, erreurs: int) -> Optional[float]:
+        """
+        Retourne le taux de consommation du budget d'erreurs d'une période.
+
+        Args:
+            requetes (int): Le nombre de requêtes de la période.
+            erreurs (int): Le nombre d'erreurs de la période.
+
+        Returns:
+            Optional[float]: Le taux de consommation, ou ``None`` sans requête.
+        """
+        if requetes == 0:
+            return None
+        return erreurs / requetes / (1 - self.objectif)
+
+    def _get_sommes_periode(self, nom: str, requetes: int, erreurs: int) -> tuple:
+        """
+        Retourne les totaux d'une période qui se termine par une fenêtre donnée.
+
+        Args:
+            nom (str): Le nom de la période dans :attr:`FENETRES_CONSOMMATION`.
+            requetes (int): Le nombre de requêtes de la dernière fenêtre de la période.
+            erreurs (int): Le nombre d'erreurs de la dernière fenêtre de la période.
+
+        Returns:
+            tuple: Le nombre de requêtes et d'erreurs de la période.
+        """
+        sommes = self._sommes[nom]
+        return sommes[0] + requetes, sommes[1] + erreurs
+
+    def _termine_fenetre(self) -> None:
+        """
+        Ajoute la fenêtre en cours aux statistiques et à l'historique, puis passe à la
+        fenêtre suivante.
+
+        Returns:
+            None
+        """
+        requetes, erreurs = self._requetes, self._erreurs
+        if requetes > 0:
+            self.total_requetes += requetes
+            self.total_erreurs += erreurs
+            self.fenetres += 1
+            taux_erreurs = erreurs / requetes
+            if taux_erreurs > 1 - self.objectif:
+                self.fenetres_hors_objectif += 1
+            if self.nombre_pires > 0:
+                element = (taux_erreurs, erreurs, self._fenetre, requetes)
+                if len(self.pires_fenetres) < self.nombre_pires:
+                    heapq.heappush(self.pires_fenetres, element)
+                else:
+                    heapq.heappushpop(self.pires_fenetres, element)
+            for nom, taux_max in self.taux_max.items():
+                taux = self._get_taux_consommation(*self._get_sommes_periode(nom, requetes,
+                                                                            erreurs))
+                if taux_max[0] is None or taux > taux_max[0]:
+                    taux_max[:] = [taux, self._fenetre]
+        # Glissement des périodes : la fenêtre terminée entre dans les sommes et la
+        # plus ancienne fenêtre de chaque période en sort
+        self._historique.append((requetes, erreurs))
+        for nom, duree in self.FENETRES_CONSOMMATION.items():
+            nombre = duree // self.taille_fenetre
+            sommes = self._sommes[nom]
+            sommes[0] += requetes
+            sommes[1] += erreurs
+            if len(self._historique) >= nombre:
+                sortante = self._historique[-nombre]
+                sommes[0] -= sortante[0]
+                sommes[1] -= sortante[1]
+        self._fenetre += 1
+        self._requetes = 0
+        self._erreurs = 0
+
+    def _avance(self, fenetre: int) -> None:
+        """
+        Termine les fenêtres jusqu'à une fenêtre plus récente, y compris les fenêtres
+        sans requête.
+
+        Args:
+            fenetre (int): La nouvelle fenêtre en cours.
+
+        Returns:
+            None
+        """
+        self._termine_fenetre()
+        # Au-delà de l'historique, les fenêtres vides effacent toutes les sommes
+        if fenetre - self._fenetre >= self._historique.maxlen:
+            self._historique.clear()
+            self._sommes = {nom: [0, 0] for nom in self.FENETRES_CONSOMMATION}
+            self._fenetre = fenetre
+        while self._fenetre < fenetre:
+            self._termine_fenetre()
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée reçue à la fenêtre en cours si elle passe le filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+        """
+        if not self._admet_entree(entree):
+            return
+        fenetre = int(entree.requete.horodatage.timestamp()) // self.taille_fenetre
+        if self._fenetre is None:
+            self._fenetre = fenetre
+        elif fenetre > self._fenetre:
+            self._avance(fenetre)
+        self._requetes += 1
+        if entree.reponse.code_statut_http >= 500:
+            self._erreurs += 1
+
+    def _get_fenetre(self, element: tuple) -> dict:
+        """
+        Retourne la représentation d'une fenêtre.
+
+        Args:
+            element (tuple): La fenêtre, au format de :attr:`pires_fenetres`.
+
+        Returns:
+            dict: Le début et la fin de la fenêtre, son nombre de requêtes et d'erreurs
+            et son taux d'erreurs.
+        """
+        taux_erreurs, erreurs, fenetre, requetes = element
+        return {
+            "debut": self._get_date(fenetre),
+            "fin": self._get_date(fenetre + 1),
+            "requetes": requetes,
+            "erreurs": erreurs,
+            "taux_erreurs": taux_erreurs
+        }
+
+    def get_analyse(self) -> dict:
+        """
+        Retourne l'analyse du taux d'erreurs, fenêtre en cours comprise.
+
+        Returns:
+            dict: L'objectif, la disponibilité et la part du budget d'erreurs consommée
+            sur tout le flux, les pires fenêtres et, pour chaque période, le taux de
+            consommation du budget à la fin de la fenêtre en cours et son maximum.
+        """
+        requetes, erreurs = self._requetes, self._erreurs
+        total_requetes = self.total_requetes + requetes
+        total_erreurs = self.total_erreurs + erreurs
+        pires_fenetres = list(self.pires_fenetres)
+        fenetres, fenetres_hors_objectif = self.fenetres, self.fenetres_hors_objectif
+        if requetes > 0:
+            fenetres += 1
+            if erreurs / requetes > 1 - self.objectif:
+                fenetres_hors_objectif += 1
+            pires_fenetres.append((erreurs / requetes, erreurs, self._fenetre, requetes))
+        taux_consommation = {}
+        for nom, (taux_max, fenetre_max) in self.taux_max.items():
+            taux = self._get_taux_consommation(*self._get_sommes_periode(nom, requetes,
+                                                                        erreurs))
+            if taux is not None and (taux_max is None or taux > taux_max):
+                taux_max, fenetre_max = taux, self._fenetre
+            taux_consommation[nom] = {
+                "actuel": taux,
+                "maximum": taux_max,
+                "fin_maximum": (self._get_date(fenetre_max + 1)
+                                if fenetre_max is not None else None)
+            }
+        return {
+            "objectif": self.objectif,
+            "taille_fenetre": self.taille_fenetre,
+            "fin_fenetre": (self._get_date(self._fenetre + 1)
+                            if self._fenetre is not None else None),
+            "total_requetes": total_requetes,
+            "total_erreurs": total_erreurs,
+            "disponibilite": (1 - total_erreurs / total_requetes if total_requetes > 0
+                              else None),
+            "budget_erreurs_consomme": self._get_taux_consommation(total_requetes,
+                                                                   total_erreurs),
+            "fenetres": fenetres,
+            "fenetres_hors_objectif": fenetres_hors_objectif,
+            "pires_fenetres": [self._get_fenetre(element) for element
+                               in heapq.nlargest(self.nombre_pires, pires_fenetres)],
+            "taux_consommation": taux_consommation,
+            "entrees_ignorees": self.entrees_ignorees
+        }
@@ -0,0 +1,105 @@
+"""
+Module pour la recherche simultanée de plusieurs motifs dans un texte à l'aide
+d'un automate d'Aho-Corasick.
+"""
+
+from collections import deque
+
+
+class AutomateMotifs:
+    """
+    Représente un automate d'Aho-Corasick construit à partir d'une liste de motifs,
+    qui trouve en un seul parcours d'un texte tous les motifs qu'il contient, quel
+    que soit leur nombre. La recherche ne tient pas compte de la casse.
+
+    L'automate est un arbre préfixe (trie) des motifs, complété par des liens
+    d'échec : lorsqu'aucune transition ne correspond au caractère lu, la recherche
+    se poursuit depuis le plus long suffixe du préfixe reconnu qui est aussi un
+    préfixe d'un motif. Chaque état connaît les motifs qui se terminent à cet état
+    ou à un état de sa chaîne de liens d'échec.
+
+    Attributes:
+        motifs (list): Les motifs recherchés, en minuscules.
+        _transitions (list): Pour chaque état, ses transitions par caractère.
+        _echecs (list): Pour chaque état, l'état de son lien d'échec.
+        _sorties (list): Pour chaque état, les numéros des motifs reconnus en
+            l'atteignant.
+    """
+
+    def __init__(self, motifs: list):
+        """
+        Construit l'automate des motifs.
+
+        Args:
+            motifs (list): Les motifs (chaînes non vides) à rechercher. Le numéro d'un
+                motif est sa position dans la liste.
+
+        Raises:
+            TypeError: Le paramètre ``motifs`` n'est pas une liste de chaînes.
+            ValueError: Un motif est vide.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(motifs, list) or not all(isinstance(motif, str) for motif in motifs):
+            raise TypeError("Les motifs doivent être une liste de chaînes de caractères.")
+        # Vérification de la valeur des paramètres
+        if not all(motifs):
+            raise ValueError("Les motifs ne peuvent pas être vides.")
+
+        self.motifs = [motif.lower() for motif in motifs]
+        self._transitions = [{}]
+        self._echecs = [0]
+        self._sorties = [()]
+        # Arbre préfixe des motifs
+        for numero, motif in enumerate(self.motifs):
+            etat = 0
+            for caractere in motif:
+                suivant = self._transitions[etat].get(caractere)
+                if suivant is None:
+                    suivant = len(self._transitions)
+                    self._transitions[etat][caractere] = suivant
+                    self._transitions.append({})
+                    self._echecs.append(0)
+                    self._sorties.append(())
+                etat = suivant
+            self._sorties[etat] += (numero,)
+        # Liens d'échec, calculés en largeur : le lien d'un état est toujours moins
+        # profond que lui, donc déjà complet
+        file_etats = deque(self._transitions[0].values())
+        while file_etats:
+            etat = file_etats.popleft()
+            for caractere, suivant in self._transitions[etat].items():
+                echec = self._echecs[etat]
+                while echec and caractere not in self._transitions[echec]:
+                    echec = self._echecs[echec]
+                echec = self._transitions[echec].get(caractere, 0)
+                self._echecs[suivant] = echec
+                self._sorties[suivant] += self._sorties[echec]
+                file_etats.append(suivant)
+
+    def recherche(self, texte: str) -> set:
+        """
+        Retourne les motifs présents dans un texte.
+
+        Args:
+            texte (str): Le texte à parcourir.
+
+        Returns:
+            set: Les numéros des motifs présents dans le texte.
+
+        Raises:
+            TypeError: Le paramètre ``texte`` n'est pas une chaîne de caractères.
+        """
+        # Vérification du paramètre
+        if not isinstance(texte, str):
+            raise TypeError("Le texte doit être une chaîne de caractères.")
+
+        transitions, echecs, sorties = self._transitions, self._echecs, self._sorties
+        trouves = set()
+        etat = 0
+        for caractere in texte.lower():
+            while etat and caractere not in transitions[etat]:
+                etat = echecs[etat]
+            etat = transitions[etat].get(caractere, 0)
+            if sorties[etat]:
+                trouves.update(sorties[etat])
+        return trouves
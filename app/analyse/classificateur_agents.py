@@ -0,0 +1,183 @@
+"""
+Module pour la classification des agents utilisateurs (navigateur, système
+d'exploitation, robot) à partir d'un fichier de règles.
+"""
+
+from functools import lru_cache
+from json import load, JSONDecodeError
+from pathlib import Path
+from typing import Optional
+from analyse.automate_motifs import AutomateMotifs
+
+
+class ClassificateurAgents:
+    """
+    Représente un classificateur d'agents utilisateurs (User-Agent) selon des règles
+    chargées depuis un fichier JSON.
+
+    Le fichier associe à chaque catégorie (:attr:`CATEGORIES`) une liste ordonnée de
+    règles ``{"nom": ..., "motifs": [...]}`` : un agent reçoit, dans chaque catégorie,
+    le nom de la première règle dont un motif apparaît dans l'agent (sans tenir
+    compte de la casse). L'ordre des règles départage les agents qui correspondent à
+    plusieurs règles (un agent Edge contient aussi ``Chrome/`` et ``Safari/``).
+
+    Tous les motifs de toutes les règles sont recherchés en un seul parcours de
+    l'agent par un :class:`AutomateMotifs`. Les agents se répètent énormément d'une
+    requête à l'autre : les classifications sont gardées dans un cache LRU indexé par
+    l'agent complet, de sorte que chaque agent distinct n'est classifié qu'une fois
+    tant qu'il reste dans le cache.
+
+    Attributes:
+        chemin_regles (str): Le chemin du fichier de règles.
+        regles (dict): Les noms des règles de chaque catégorie, dans leur ordre.
+        _automate (AutomateMotifs): L'automate de tous les motifs.
+        _regles_motifs (list): Pour chaque motif de l'automate, sa catégorie et le
+            rang de sa règle.
+        _classifie_cache (Callable): La classification sans cache, enveloppée dans un
+            cache LRU.
+
+    Class-level variables:
+        :cvar CATEGORIES (tuple): Les catégories du fichier de règles.
+        :cvar CHEMIN_REGLES_DEFAUT (Path): Le fichier de règles fourni avec l'application.
+    """
+
+    CATEGORIES: tuple = ("robots", "navigateurs", "systemes")
+    CHEMIN_REGLES_DEFAUT: Path = (Path(__file__).parent.parent.parent.resolve()
+                                  / "assets" / "regles_agents.json")
+
+    def __init__(self, chemin_regles: Optional[str] = None, taille_cache: int = 10000):
+        """
+        Charge les règles et construit l'automate de leurs motifs.
+
+        Args:
+            chemin_regles (Optional[str]): Le chemin du fichier de règles. Par défaut,
+                celui fourni avec l'application.
+            taille_cache (int): Le nombre maximal d'agents distincts gardés dans le
+                cache. Par défaut, ``10000``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La taille du cache est inférieure à ``1``.
+            ReglesAgentsException: Le fichier de règles est illisible ou invalide.
+        """
+        # Vérification du type des paramètres
+        if chemin_regles is not None and not isinstance(chemin_regles, str):
+            raise TypeError("Le chemin du fichier de règles doit être une chaîne de "
+                            "caractères ou None.")
+        if not isinstance(taille_cache, int) or isinstance(taille_cache, bool):
+            raise TypeError("La taille du cache doit être un entier.")
+        # Vérification de la valeur des paramètres
+        if taille_cache < 1:
+            raise ValueError("La taille du cache doit être supérieure à 0.")
+
+        self.chemin_regles = (chemin_regles if chemin_regles is not None
+                              else str(self.CHEMIN_REGLES_DEFAUT))
+        self.regles = {}
+        motifs = []
+        self._regles_motifs = []
+        for categorie, regles in self._charge_regles(self.chemin_regles).items():
+            self.regles[categorie] = [regle["nom"] for regle in regles]
+            for rang, regle in enumerate(regles):
+                motifs.extend(regle["motifs"])
+                self._regles_motifs.extend((categorie, rang) for _ in regle["motifs"])
+        self._automate = AutomateMotifs(motifs)
+        self._classifie_cache = lru_cache(maxsize=taille_cache)(self._classifie)
+
+    def _charge_regles(self, chemin_regles: str) -> dict:
+        """
+        Charge et vérifie le fichier de règles.
+
+        Args:
+            chemin_regles (str): Le chemin du fichier de règles.
+
+        Returns:
+            dict: Les règles de chaque catégorie de :attr:`CATEGORIES`.
+
+        Raises:
+            ReglesAgentsException: Le fichier est illisible ou ne contient pas, pour
+                chaque catégorie, une liste de règles avec un nom et des motifs non vides.
+        """
+        try:
+            with open(chemin_regles, "r", encoding="utf-8") as fichier:
+                contenu = load(fichier)
+        except (OSError, JSONDecodeError) as ex:
+            raise ReglesAgentsException(
+                f"Impossible de lire le fichier de règles {chemin_regles} : {ex}"
+            ) from ex
+        if not isinstance(contenu, dict):
+            raise ReglesAgentsException(f"Le fichier de règles {chemin_regles} doit "
+                                        "contenir un dictionnaire.")
+        regles = {categorie: contenu.get(categorie, []) for categorie in self.CATEGORIES}
+        for categorie, regles_categorie in regles.items():
+            if not isinstance(regles_categorie, list) or not all(
+                    isinstance(regle, dict) and isinstance(regle.get("nom"), str)
+                    and isinstance(regle.get("motifs"), list) and regle["motifs"]
+                    and all(isinstance(motif, str) and motif for motif in regle["motifs"])
+                    for regle in regles_categorie):
+                raise ReglesAgentsException(
+                    f"Les règles '{categorie}' du fichier {chemin_regles} doivent être une "
+                    "liste de dictionnaires avec un nom et une liste de motifs non vides."
+                )
+        return regles
+
+    def _classifie(self, agent: str) -> tuple:
+        """
+        Classifie un agent utilisateur, sans cache.
+
+        Args:
+            agent (str): L'agent utilisateur.
+
+        Returns:
+            tuple: Le nom de la règle de chaque catégorie (``None`` si aucune ne
+            correspond), dans l'ordre de :attr:`CATEGORIES`.
+        """
+        rangs = {}
+        for numero in self._automate.recherche(agent):
+            categorie, rang = self._regles_motifs[numero]
+            if rang < rangs.get(categorie, rang + 1):
+                rangs[categorie] = rang
+        return tuple(self.regles[categorie][rangs[categorie]] if categorie in rangs else None
+                     for categorie in self.CATEGORIES)
+
+    def classifie(self, agent: str) -> tuple:
+        """
+        Classifie un agent utilisateur, en réutilisant la classification d'un agent
+        identique déjà rencontré.
+
+        Args:
+            agent (str): L'agent utilisateur.
+
+        Returns:
+            tuple: Le robot, le navigateur et le système d'exploitation de l'agent
+            (``None`` pour ceux qui ne sont pas reconnus).
+
+        Raises:
+            TypeError: Le paramètre ``agent`` n'est pas une chaîne de caractères.
+        """
+        # Vérification du paramètre
+        if not isinstance(agent, str):
+            raise TypeError("L'agent utilisateur doit être une chaîne de caractères.")
+
+        return self._classifie_cache(agent)
+
+    def get_statistiques_cache(self) -> dict:
+        """
+        Retourne l'utilisation du cache des classifications.
+
+        Returns:
+            dict: Le nombre de classifications trouvées dans le cache, le nombre de
+            classifications calculées et le nombre d'agents dans le cache.
+        """
+        informations = self._classifie_cache.cache_info()
+        return {
+            "succes": informations.hits,
+            "classifications": informations.misses,
+            "taille": informations.currsize
+        }
+
+
+class ReglesAgentsException(Exception):
+    """
+    Représente une erreur lors du chargement d'un fichier de règles de
+    classification des agents utilisateurs.
+    """
@@ -0,0 +1,227 @@
+"""
+Module pour le comptage des éléments les plus fréquents d'un flux en mémoire bornée.
+"""
+
+from heapq import heappop, heappush
+from typing import Optional
+
+
+class CompteurBorne:
+    """
+    Représente un compteur d'éléments à mémoire bornée selon l'algorithme
+    Space-Saving (Metwally, Agrawal, El Abbadi) : au plus :attr:`capacite` éléments
+    sont suivis.
+
+    Lorsque un nouvel élément arrive et que le compteur est plein, l'élément suivi
+    le moins fréquent est remplacé ; le nouvel élément hérite de son total, conservé
+    comme erreur maximale. Le total d'un élément suivi est donc une estimation par
+    excès d'au plus son erreur, et tout élément dont la fréquence réelle dépasse
+    ``total / capacite`` est garanti d'être suivi.
+
+    L'élément le moins fréquent est trouvé à l'aide d'un tas dont les totaux sont
+    mis à jour paresseusement : un incrément ne touche que le dictionnaire, et une
+    entrée obsolète du tas n'est corrigée que lorsqu'elle arrive à son sommet.
+
+    Attributes:
+        capacite (int): Le nombre maximal d'éléments suivis.
+        total (int): La somme des poids de tous les éléments ajoutés.
+        _compteurs (dict): Pour chaque élément suivi, son total estimé et son erreur
+            maximale, dans l'ordre de première apparition.
+        _tas (list): Les entrées ``(total, ordre, élément)`` du tas, une par élément
+            suivi, dont le total peut être inférieur au total actuel.
+        _ordre (int): Le numéro de la prochaine entrée du tas, qui départage les
+            égalités sans comparer les éléments.
+    """
+
+    def __init__(self, capacite: int = 1000):
+        """
+        Initialise un compteur vide.
+
+        Args:
+            capacite (int): Le nombre maximal d'éléments suivis. Par défaut, sa valeur
+                est égale à ``1000``.
+
+        Raises:
+            TypeError: Le paramètre ``capacite`` n'est pas un entier.
+            ValueError: Le paramètre ``capacite`` est inférieur à ``1``.
+        """
+        # Vérification du paramètre
+        if not isinstance(capacite, int) or isinstance(capacite, bool):
+            raise TypeError("La capacité du compteur doit être un entier.")
+        if capacite < 1:
+            raise ValueError("La capacité du compteur doit être supérieure à 0.")
+
+        self.capacite = capacite
+        self.total = 0
+        self._compteurs = {}
+        self._tas = []
+        self._ordre = 0
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre d'éléments suivis.
+
+        Returns:
+            int: Le nombre d'éléments suivis.
+        """
+        return len(self._compteurs)
+
+    def _pousse(self, total: int, element) -> None:
+        """
+        Ajoute une entrée au tas.
+
+        Args:
+            total (int): Le total de l'élément.
+            element (any): L'élément.
+
+        Returns:
+            None
+        """
+        heappush(self._tas, (total, self._ordre, element))
+        self._ordre += 1
+
+    def ajoute(self, element, poids: int = 1, erreur: int = 0) -> Optional[tuple]:
+        """
+        Ajoute un élément au compteur.
+
+        Args:
+            element (any): L'élément (hachable).
+            poids (int): Le nombre d'apparitions à ajouter. Par défaut, ``1``.
+            erreur (int): L'erreur maximale déjà contenue dans ``poids``, par exemple
+                lors de la fusion d'un autre compteur. Par défaut, ``0``.
+
+        Returns:
+            Optional[tuple]: L'élément remplacé et son total estimé, ou ``None`` si
+                aucun élément n'a été remplacé.
+        """
+        self.total += poids
+        compteur = self._compteurs.get(element)
+        if compteur is not None:
+            compteur[0] += poids
+            compteur[1] += erreur
+            return None
+        if len(self._compteurs) < self.capacite:
+            self._compteurs[element] = [poids, erreur]
+            self._pousse(poids, element)
+            return None
+        # Recherche de l'élément le moins fréquent (entrées obsolètes corrigées)
+        while True:
+            total, _, minimum = heappop(self._tas)
+            total_actuel = self._compteurs[minimum][0]
+            if total_actuel == total:
+                break
+            self._pousse(total_actuel, minimum)
+        del self._compteurs[minimum]
+        self._compteurs[element] = [total + poids, total + erreur]
+        self._pousse(total + poids, element)
+        return minimum, total
+
+    def get_total(self, element) -> int:
+        """
+        Retourne le total estimé d'un élément.
+
+        Args:
+            element (any): L'élément.
+
+        Returns:
+            int: Le total estimé (par excès) de l'élément, ou ``0`` s'il n'est pas suivi.
+        """
+        compteur = self._compteurs.get(element)
+        return compteur[0] if compteur is not None else 0
+
+    def get_top(self, nombre: Optional[int] = None) -> list:
+        """
+        Retourne les éléments suivis les plus fréquents. Les éléments à égalité
+        restent dans l'ordre de première apparition.
+
+        Args:
+            nombre (Optional[int]): Le nombre maximal d'éléments retournés. Si ``None``,
+                tous les éléments suivis sont retournés.
+
+        Returns:
+            list: Les tuples ``(élément, total estimé, erreur maximale)``, triés par
+                total décroissant.
+        """
+        elements = sorted(self._compteurs.items(), key=lambda element: element[1][0],
+                          reverse=True)
+        return [(element, total, erreur) for element, (total, erreur) in elements[:nombre]]
+
+    def fusionne(self, autre: "CompteurBorne") -> None:
+        """
+        Fusionne un autre compteur dans ce compteur : chaque élément suivi par
+        ``autre`` est ajouté avec son total estimé et son erreur maximale, les
+        garanties de l'algorithme restant valables pour le flux combiné. Le compteur
+        ``autre`` n'est pas modifié.
+
+        Args:
+            autre (CompteurBorne): Le compteur à fusionner.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: Le paramètre ``autre`` n'est pas un :class:`CompteurBorne`.
+        """
+        # Vérification du type du paramètre
+        if not isinstance(autre, CompteurBorne):
+            raise TypeError("Le compteur à fusionner doit être de type CompteurBorne.")
+
+        total = self.total + autre.total
+        for element, total_element, erreur in autre.get_top():
+            self.ajoute(element, total_element, erreur)
+        self.total = total
+
+    def get_dict(self) -> dict:
+        """
+        Retourne l'état du compteur sous forme d'un dictionnaire sérialisable en JSON.
+
+        Returns:
+            dict: Un dictionnaire contenant capacite, total et elements, la liste des
+                éléments suivis sous la forme ``[élément, total estimé, erreur
+                maximale]`` dans l'ordre de première apparition.
+        """
+        return {
+            "capacite": self.capacite,
+            "total": self.total,
+            "elements": [[element, total, erreur]
+                         for element, (total, erreur) in self._compteurs.items()]
+        }
+
+    @classmethod
+    def depuis_dict(cls, etat: dict) -> "CompteurBorne":
+        """
+        Reconstruit un compteur à partir du dictionnaire retourné par :meth:`get_dict`.
+        Les éléments de type liste (par exemple des tuples sérialisés en JSON) sont
+        convertis en tuples.
+
+        Args:
+            etat (dict): L'état du compteur.
+
+        Returns:
+            CompteurBorne: Le compteur reconstruit.
+
+        Raises:
+            TypeError: Le paramètre ``etat`` n'est pas un dictionnaire.
+            ValueError: L'état est incomplet ou incohérent.
+        """
+        # Vérification du paramètre
+        if not isinstance(etat, dict):
+            raise TypeError("L'état d'un compteur doit être un dictionnaire.")
+        cles = ("capacite", "total", "elements")
+        if any(cle not in etat for cle in cles):
+            raise ValueError(f"L'état d'un compteur doit contenir les clés : {', '.join(cles)}.")
+        elements = etat["elements"]
+        if (not isinstance(elements, list)
+                or not all(isinstance(element, list) and len(element) == 3
+                           for element in elements)):
+            raise ValueError("Les éléments d'un compteur doivent être une liste de "
+                             "triplets [élément, total, erreur].")
+
+        compteur = cls(etat["capacite"])
+        if len(elements) > compteur.capacite:
+            raise ValueError("Un compteur ne peut pas suivre plus d'éléments que sa capacité.")
+        for element, total, erreur in elements:
+            compteur.ajoute(tuple(element) if isinstance(element, list) else element,
+                            total, erreur)
+        compteur.total = etat["total"]
+        return compteur
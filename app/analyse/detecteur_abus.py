@@ -0,0 +1,377 @@
+"""
+Module pour le suivi, en flux et à mémoire bornée, du débit de requêtes de chaque
+adresse IP sur une fenêtre glissante et la détection des clients abusifs.
+"""
+
+import heapq
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Union
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_entrees_horodatees import AnalyseurEntreesHorodatees
+from analyse.verifications import verifie_nombre_par_top
+
+
+class DetecteurAbus(AnalyseurEntreesHorodatees):
+    """
+    Représente le suivi du débit de requêtes par adresse IP d'un flux d'entrées de log
+    Apache, et la détection des adresses dont le débit dépasse leur référence.
+
+    La fenêtre glissante de chaque adresse est un tampon circulaire de compteurs,
+    un par intervalle de :attr:`taille_intervalle` secondes. Lorsqu'un intervalle
+    est terminé, son total met à jour la référence de l'adresse, une moyenne mobile
+    exponentielle (EWMA) du nombre de requêtes par intervalle. La référence n'est pas
+    mise à jour pendant une alerte, pour ne pas apprendre le débit anormal.
+
+    Une adresse est signalée lorsque son nombre de requêtes sur la fenêtre atteint
+    :attr:`minimum_requetes` et dépasse :attr:`seuil` fois sa référence ramenée à la
+    fenêtre. Une alerte couvre la période pendant laquelle la condition reste vraie.
+
+    Les adresses sont rangées dans un dictionnaire ordonné par leur dernière
+    activité : celles inactives depuis plus de :attr:`delai_eviction` secondes, et
+    les moins récemment actives au-delà de :attr:`capacite_clients` adresses, sont
+    oubliées (avec leur référence).
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        fenetre_secondes (int): La durée (en secondes) de la fenêtre glissante.
+        taille_intervalle (int): La durée (en secondes) d'un compteur de la fenêtre.
+        nombre_intervalles (int): Le nombre de compteurs de la fenêtre.
+        alpha (float): Le poids d'un intervalle terminé dans la référence (EWMA).
+        seuil (float): Le facteur de dépassement de la référence qui déclenche une alerte.
+        minimum_requetes (int): Le nombre minimal de requêtes sur la fenêtre pour
+            déclencher une alerte.
+        delai_eviction (int): La durée (en secondes) d'inactivité après laquelle une
+            adresse est oubliée.
+        capacite_clients (int): Le nombre maximal d'adresses suivies.
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        entrees_ignorees (int): Le nombre d'entrées filtrées ignorées, sans horodatage
+            ou antérieures à la fenêtre de leur adresse.
+        clients_evinces (int): Le nombre d'adresses oubliées.
+        alertes (list): Les alertes terminées, dans l'ordre de leur fin.
+        alertes_ignorees (int): Le nombre d'alertes terminées non conservées.
+        _clients (OrderedDict): Pour chaque adresse suivie, de la moins récemment
+            active à la plus récemment active, ``[intervalle_courant, compteurs,
+            total_fenetre, reference, alerte]``.
+        _intervalle_max (Optional[int]): L'intervalle le plus récent reçu.
+        _predicat (Callable): Le prédicat compilé du filtre.
+
+    Class-level variables:
+        :cvar ALERTES_MAX (int): Le nombre maximal d'alertes terminées conservées.
+    """
+
+    ALERTES_MAX: int = 1000
+
+    def __init__(self,
+                 filtre: FiltreLogApache,
+                 fenetre_secondes: int = 300,
+                 taille_intervalle: int = 10,
+                 alpha: float = 0.1,
+                 seuil: float = 3.0,
+                 minimum_requetes: int = 100,
+                 delai_eviction: int = 3600,
+                 capacite_clients: int = 100000):
+        """
+        Initialise un suivi vide.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            fenetre_secondes (int): La durée de la fenêtre glissante. Par défaut,
+                5 minutes.
+            taille_intervalle (int): La durée d'un compteur de la fenêtre, qui doit
+                diviser la fenêtre. Par défaut, 10 secondes.
+            alpha (float): Le poids d'un intervalle terminé dans la référence, compris
+                entre ``0`` (exclu) et ``1``. Par défaut, ``0.1``.
+            seuil (float): Le facteur de dépassement de la référence. Par défaut, ``3``.
+            minimum_requetes (int): Le nombre minimal de requêtes sur la fenêtre pour
+                déclencher une alerte. Par défaut, ``100``.
+            delai_eviction (int): La durée d'inactivité après laquelle une adresse est
+                oubliée. Par défaut, une heure.
+            capacite_clients (int): Le nombre maximal d'adresses suivies. Par défaut,
+                ``100000``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Un paramètre n'est pas dans son intervalle de valeurs.
+        """
+        entiers = (fenetre_secondes, taille_intervalle, minimum_requetes, delai_eviction,
+                   capacite_clients)
+        # Vérification du type des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+        if not all(isinstance(entier, int) and not isinstance(entier, bool)
+                   for entier in entiers):
+            raise TypeError("Les durées, le minimum de requêtes et la capacité doivent "
+                            "être des entiers.")
+        if not all(isinstance(nombre, (int, float)) and not isinstance(nombre, bool)
+                   for nombre in (alpha, seuil)):
+            raise TypeError("Le poids de la référence et le seuil doivent être des nombres.")
+        # Vérification de la valeur des paramètres
+        if min(entiers) < 1:
+            raise ValueError("Les durées, le minimum de requêtes et la capacité doivent "
+                             "être supérieurs à 0.")
+        if fenetre_secondes % taille_intervalle != 0:
+            raise ValueError("La durée d'un intervalle doit diviser celle de la fenêtre.")
+        if not 0 < alpha <= 1 or seuil <= 1:
+            raise ValueError("Le poids de la référence doit être compris entre 0 (exclu) "
+                             "et 1, et le seuil doit être supérieur à 1.")
+
+        super().__init__(filtre)
+        self.fenetre_secondes = fenetre_secondes
+        self.taille_intervalle = taille_intervalle
+        self.nombre_intervalles = fenetre_secondes // taille_intervalle
+        self.alpha = alpha
+        self.seuil = seuil
+        self.minimum_requetes = minimum_requetes
+        self.delai_eviction = delai_eviction
+        self.capacite_clients = capacite_clients
+        self.clients_evinces = 0
+        self.alertes = []
+        self.alertes_ignorees = 0
+        self._clients = OrderedDict()
+        self._intervalle_max = None
+
+    def _get_date(self, intervalle: Union[int, float]) -> str:
+        """
+        Retourne la date (ISO 8601, UTC) du début d'un intervalle.
+
+        Args:
+            intervalle (Union[int, float]): Le numéro de l'intervalle depuis l'epoch.
+
+        Returns:
+            str: La date du début de l'intervalle.
+        """
+        return datetime.fromtimestamp(intervalle * self.taille_intervalle,
+                                      timezone.utc).isoformat()
+
+    def _est_anormal(self, client: list) -> bool:
+        """
+        Indique si le débit d'une adresse sur la fenêtre dépasse sa référence.
+
+        Args:
+            client (list): L'état de l'adresse, au format de :attr:`_clients`.
+
+        Returns:
+            bool: ``True`` si l'adresse doit être signalée.
+        """
+        total_fenetre, reference = client[2], client[3]
+        return (total_fenetre >= self.minimum_requetes
+                and total_fenetre > self.seuil * reference * self.nombre_intervalles)
+
+    def _termine_alerte(self, adresse_ip: str, client: list) -> None:
+        """
+        Termine l'alerte en cours d'une adresse.
+
+        Args:
+            adresse_ip (str): L'adresse IP.
+            client (list): L'état de l'adresse, au format de :attr:`_clients`.
+
+        Returns:
+            None
+        """
+        alerte = client[4]
+        client[4] = None
+        if len(self.alertes) >= self.ALERTES_MAX:
+            self.alertes_ignorees += 1
+            return
+        self.alertes.append(self._get_alerte(adresse_ip, alerte))
+
+    def _get_alerte(self, adresse_ip: str, alerte: list) -> dict:
+        """
+        Retourne la représentation d'une alerte.
+
+        Args:
+            adresse_ip (str): L'adresse IP.
+            alerte (list): L'alerte, sous la forme ``[premier_intervalle,
+                dernier_intervalle, requetes_fenetre_max, reference_fenetre]``.
+
+        Returns:
+            dict: L'adresse, le début et la fin de la période signalée (de l'intervalle
+            de la détection à la fin du dernier intervalle anormal), le nombre maximal
+            de requêtes sur la fenêtre et la référence ramenée à la fenêtre au début
+            de l'alerte.
+        """
+        premier_intervalle, dernier_intervalle, requetes_max, reference = alerte
+        return {
+            "adresse_ip": adresse_ip,
+            "debut": self._get_date(premier_intervalle),
+            "fin": self._get_date(dernier_intervalle + 1),
+            "requetes_fenetre_max": requetes_max,
+            "reference_fenetre": round(reference, 2)
+        }
+
+    def _avance(self, client: list, intervalle: int) -> None:
+        """
+        Fait glisser la fenêtre d'une adresse jusqu'à un intervalle plus récent : les
+        intervalles terminés mettent à jour la référence et sortent de la fenêtre.
+
+        Args:
+            client (list): L'état de l'adresse, au format de :attr:`_clients`.
+            intervalle (int): Le nouvel intervalle courant.
+
+        Returns:
+            None
+        """
+        courant, compteurs = client[0], client[1]
+        ecart = intervalle - courant
+        # Intervalle courant terminé, puis intervalles terminés sans requête (la
+        # référence n'apprend pas le débit anormal d'une alerte en cours)
+        if client[4] is None:
+            client[3] += self.alpha * (compteurs[courant % self.nombre_intervalles] - client[3])
+            client[3] *= (1 - self.alpha) ** (ecart - 1)
+        if ecart >= self.nombre_intervalles:
+            compteurs[:] = [0] * self.nombre_intervalles
+            client[2] = 0
+        else:
+            for numero in range(courant + 1, intervalle + 1):
+                client[2] -= compteurs[numero % self.nombre_intervalles]
+                compteurs[numero % self.nombre_intervalles] = 0
+        client[0] = intervalle
+
+    def _evince_clients(self, instant_intervalle: int) -> None:
+        """
+        Oublie les adresses inactives depuis plus que le délai d'éviction, puis les
+        moins récemment actives au-delà de la capacité.
+
+        Args:
+            instant_intervalle (int): L'intervalle le plus récent reçu.
+
+        Returns:
+            None
+        """
+        limite = instant_intervalle - self.delai_eviction // self.taille_intervalle
+        while self._clients:
+            adresse_ip, client = next(iter(self._clients.items()))
+            if client[0] >= limite and len(self._clients) <= self.capacite_clients:
+                return
+            del self._clients[adresse_ip]
+            self.clients_evinces += 1
+            if client[4] is not None:
+                self._termine_alerte(adresse_ip, client)
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée reçue au débit de son adresse IP si elle passe le filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+        """
+        if not self._admet_entree(entree):
+            return
+        intervalle = int(entree.requete.horodatage.timestamp()) // self.taille_intervalle
+        if self._intervalle_max is None or intervalle > self._intervalle_max:
+            self._intervalle_max = intervalle
+            self._evince_clients(intervalle)
+        adresse_ip = entree.client.adresse_ip
+        client = self._clients.get(adresse_ip)
+        if client is None:
+            client = self._clients[adresse_ip] = [intervalle, [0] * self.nombre_intervalles,
+                                                  0, 0.0, None]
+            self._evince_clients(self._intervalle_max)
+        elif intervalle > client[0]:
+            self._avance(client, intervalle)
+            if client[4] is not None and not self._est_anormal(client):
+                self._termine_alerte(adresse_ip, client)
+        elif intervalle <= client[0] - self.nombre_intervalles:
+            # Entrée plus ancienne que la fenêtre de l'adresse
+            self.entrees_ignorees += 1
+            return
+        self._clients.move_to_end(adresse_ip)
+        client[1][intervalle % self.nombre_intervalles] += 1
+        client[2] += 1
+        if self._est_anormal(client):
+            if client[4] is None:
+                client[4] = [client[0], client[0], client[2],
+                             client[3] * self.nombre_intervalles]
+            client[4][1] = client[0]
+            client[4][2] = max(client[4][2], client[2])
+
+    def get_total_clients(self) -> int:
+        """
+        Retourne le nombre d'adresses IP suivies.
+
+        Returns:
+            int: Le nombre d'adresses suivies.
+        """
+        return len(self._clients)
+
+    def get_top_clients(self, nombre: int = 10) -> list:
+        """
+        Retourne les adresses IP qui ont envoyé le plus de requêtes pendant la fenêtre
+        qui se termine à l'intervalle le plus récent reçu.
+
+        Args:
+            nombre (int): Le nombre maximal d'adresses retournées.
+
+        Returns:
+            list: Les adresses, leur nombre de requêtes sur la fenêtre et leur référence
+            ramenée à la fenêtre, par nombre de requêtes décroissant.
+        """
+        if self._intervalle_max is None:
+            return []
+        debut = self._intervalle_max - self.nombre_intervalles + 1
+        totaux = []
+        for adresse_ip, client in self._clients.items():
+            courant, compteurs, total_fenetre, reference, _ = client
+            if courant < debut:
+                continue
+            # Intervalles de la fenêtre de l'adresse déjà sortis de la fenêtre globale
+            perimes = sum(compteurs[numero % self.nombre_intervalles]
+                          for numero in range(courant - self.nombre_intervalles + 1, debut))
+            totaux.append((total_fenetre - perimes, adresse_ip, reference))
+        return [
+            {"adresse_ip": adresse_ip, "requetes": total,
+             "reference_fenetre": round(reference * self.nombre_intervalles, 2)}
+            for total, adresse_ip, reference in heapq.nlargest(nombre, totaux)
+        ]
+
+    def get_alertes(self) -> list:
+        """
+        Retourne les alertes terminées puis les alertes en cours.
+
+        Returns:
+            list: Les alertes (voir :meth:`_get_alerte`), avec la clé ``en_cours``.
+        """
+        alertes = [{**alerte, "en_cours": False} for alerte in self.alertes]
+        alertes.extend({**self._get_alerte(adresse_ip, client[4]), "en_cours": True}
+                       for adresse_ip, client in self._clients.items()
+                       if client[4] is not None)
+        return alertes
+
+    def get_analyse(self, nombre_par_top: int = 10) -> dict:
+        """
+        Retourne l'analyse du débit des adresses IP.
+
+        Args:
+            nombre_par_top (int): Le nombre maximal d'adresses du classement.
+                Par défaut, sa valeur est égale à ``10``.
+
+        Returns:
+            dict: La configuration de la détection, le classement des adresses sur la
+            dernière fenêtre et les alertes.
+
+        Raises:
+            TypeError: Le paramètre ``nombre_par_top`` n'est pas un entier.
+            ValueError: Le paramètre ``nombre_par_top`` est inférieur à ``0``.
+        """
+        # Vérification du paramètre
+        verifie_nombre_par_top(nombre_par_top)
+
+        return {
+            "fenetre_secondes": self.fenetre_secondes,
+            "taille_intervalle": self.taille_intervalle,
+            "seuil": self.seuil,
+            "minimum_requetes": self.minimum_requetes,
+            "fin_fenetre": (self._get_date(self._intervalle_max + 1)
+                            if self._intervalle_max is not None else None),
+            "clients_suivis": self.get_total_clients(),
+            "clients_evinces": self.clients_evinces,
+            "entrees_ignorees": self.entrees_ignorees,
+            "top_clients_fenetre": self.get_top_clients(nombre_par_top),
+            "alertes": self.get_alertes(),
+            "alertes_ignorees": self.alertes_ignorees
+        }
@@ -0,0 +1,296 @@
+"""
+Module pour la détection des requêtes d'attaque ou de scanners de vulnérabilités
+par recherche de signatures dans les urls, et le classement des clients suspects.
+"""
+
+from collections import Counter
+from functools import lru_cache
+from json import load, JSONDecodeError
+from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote_plus
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.automate_motifs import AutomateMotifs
+from analyse.compteur_borne import CompteurBorne
+from analyse.verifications import verifie_nombre_par_top
+
+
+class DetecteurAttaques:
+    """
+    Représente la détection, en flux, des requêtes dont l'url contient une signature
+    d'attaque (traversée de répertoires, fichiers sensibles, injections, etc.).
+
+    Les signatures sont chargées depuis un fichier JSON, sous la forme d'une liste
+    ``{"nom": ..., "score": ..., "motifs": [...]}``. Tous les motifs de toutes les
+    signatures sont recherchés en un seul parcours de l'url par un
+    :class:`AutomateMotifs`, quel que soit leur nombre ; l'url est aussi parcourue
+    décodée (``%2e%2e%2f`` devient ``../``) lorsqu'elle contient des caractères
+    encodés. Le verdict d'une url (les signatures trouvées et la somme de leurs
+    scores) est gardé dans un cache LRU, de sorte qu'une url répétée n'est analysée
+    qu'une fois tant qu'elle reste dans le cache.
+
+    Le score de chaque adresse IP est la somme des scores de ses requêtes suspectes,
+    compté en mémoire bornée par un :class:`CompteurBorne`. Les signatures trouvées
+    ne sont conservées que pour les adresses suivies par ce compteur.
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        chemin_signatures (str): Le chemin du fichier de signatures.
+        signatures (list): Le nom et le score de chaque signature.
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        requetes_analysees (int): Le nombre d'entrées filtrées avec une url.
+        requetes_suspectes (int): Le nombre de requêtes avec au moins une signature.
+        totaux_signatures (Counter): Le nombre de requêtes de chaque signature.
+        clients (CompteurBorne): Le score de chaque adresse IP suivie.
+        _signatures_clients (dict): Pour chaque adresse IP, les numéros des signatures
+            trouvées dans ses requêtes (nettoyé des adresses qui ne sont plus suivies).
+        _automate (AutomateMotifs): L'automate de tous les motifs.
+        _signatures_motifs (list): Pour chaque motif de l'automate, le numéro de sa
+            signature.
+        _verdict_cache (Callable): Le calcul du verdict d'une url, enveloppé dans un
+            cache LRU.
+        _predicat (Callable): Le prédicat compilé du filtre.
+
+    Class-level variables:
+        :cvar CHEMIN_SIGNATURES_DEFAUT (Path): Le fichier de signatures fourni avec
+            l'application.
+    """
+
+    CHEMIN_SIGNATURES_DEFAUT: Path = (Path(__file__).parent.parent.parent.resolve()
+                                      / "assets" / "signatures_attaques.json")
+
+    def __init__(self,
+                 filtre: FiltreLogApache,
+                 chemin_signatures: Optional[str] = None,
+                 taille_cache: int = 100000,
+                 capacite_clients: int = 10000):
+        """
+        Charge les signatures et construit l'automate de leurs motifs.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            chemin_signatures (Optional[str]): Le chemin du fichier de signatures.
+                Par défaut, celui fourni avec l'application.
+            taille_cache (int): Le nombre maximal d'urls distinctes gardées dans le
+                cache. Par défaut, ``100000``.
+            capacite_clients (int): Le nombre maximal d'adresses IP suivies. Par défaut,
+                ``10000``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La taille du cache ou la capacité est inférieure à ``1``.
+            SignaturesAttaquesException: Le fichier de signatures est illisible ou
+                invalide.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+        if chemin_signatures is not None and not isinstance(chemin_signatures, str):
+            raise TypeError("Le chemin du fichier de signatures doit être une chaîne de "
+                            "caractères ou None.")
+        if not all(isinstance(entier, int) and not isinstance(entier, bool)
+                   for entier in (taille_cache, capacite_clients)):
+            raise TypeError("La taille du cache et la capacité doivent être des entiers.")
+        # Vérification de la valeur des paramètres
+        if min(taille_cache, capacite_clients) < 1:
+            raise ValueError("La taille du cache et la capacité doivent être supérieures à 0.")
+
+        self.filtre = filtre
+        self.chemin_signatures = (chemin_signatures if chemin_signatures is not None
+                                  else str(self.CHEMIN_SIGNATURES_DEFAUT))
+        self.signatures = []
+        motifs = []
+        self._signatures_motifs = []
+        for numero, signature in enumerate(self._charge_signatures(self.chemin_signatures)):
+            self.signatures.append((signature["nom"], signature["score"]))
+            motifs.extend(signature["motifs"])
+            self._signatures_motifs.extend(numero for _ in signature["motifs"])
+        self.total_entrees = 0
+        self.requetes_analysees = 0
+        self.requetes_suspectes = 0
+        self.totaux_signatures = Counter()
+        self.clients = CompteurBorne(capacite_clients)
+        self._signatures_clients = {}
+        self._automate = AutomateMotifs(motifs)
+        self._verdict_cache = lru_cache(maxsize=taille_cache)(self._calcule_verdict)
+        self._predicat = filtre.get_predicat()
+
+    @staticmethod
+    def _charge_signatures(chemin_signatures: str) -> list:
+        """
+        Charge et vérifie le fichier de signatures.
+
+        Args:
+            chemin_signatures (str): Le chemin du fichier de signatures.
+
+        Returns:
+            list: Les signatures.
+
+        Raises:
+            SignaturesAttaquesException: Le fichier est illisible ou ne contient pas une
+                liste de signatures avec un nom, un score entier positif et des motifs
+                non vides.
+        """
+        try:
+            with open(chemin_signatures, "r", encoding="utf-8") as fichier:
+                contenu = load(fichier)
+        except (OSError, JSONDecodeError) as ex:
+            raise SignaturesAttaquesException(
+                f"Impossible de lire le fichier de signatures {chemin_signatures} : {ex}"
+            ) from ex
+        signatures = contenu.get("signatures") if isinstance(contenu, dict) else None
+        if not isinstance(signatures, list) or not all(
+                isinstance(signature, dict) and isinstance(signature.get("nom"), str)
+                and isinstance(signature.get("score"), int)
+                and not isinstance(signature["score"], bool) and signature["score"] > 0
+                and isinstance(signature.get("motifs"), list) and signature["motifs"]
+                and all(isinstance(motif, str) and motif for motif in signature["motifs"])
+                for signature in signatures):
+            raise SignaturesAttaquesException(
+                f"Le fichier de signatures {chemin_signatures} doit contenir une liste "
+                "'signatures' de dictionnaires avec un nom, un score entier positif et "
+                "une liste de motifs non vides."
+            )
+        return signatures
+
+    def _calcule_verdict(self, url: str) -> tuple:
+        """
+        Recherche les signatures présentes dans une url, sans cache.
+
+        Args:
+            url (str): L'url.
+
+        Returns:
+            tuple: La somme des scores des signatures trouvées et leurs numéros, dans
+            l'ordre du fichier.
+        """
+        trouves = self._automate.recherche(url)
+        url_decodee = unquote_plus(url)
+        if url_decodee != url:
+            trouves |= self._automate.recherche(url_decodee)
+        numeros = tuple(sorted({self._signatures_motifs[numero] for numero in trouves}))
+        return sum(self.signatures[numero][1] for numero in numeros), numeros
+
+    def get_verdict(self, url: str) -> tuple:
+        """
+        Retourne le verdict d'une url, en réutilisant celui d'une url identique déjà
+        rencontrée.
+
+        Args:
+            url (str): L'url.
+
+        Returns:
+            tuple: Le score de l'url (``0`` si elle ne contient aucune signature) et les
+            noms des signatures trouvées.
+
+        Raises:
+            TypeError: Le paramètre ``url`` n'est pas une chaîne de caractères.
+        """
+        # Vérification du paramètre
+        if not isinstance(url, str):
+            raise TypeError("L'url doit être une chaîne de caractères.")
+
+        score, numeros = self._verdict_cache(url)
+        return score, tuple(self.signatures[numero][0] for numero in numeros)
+
+    def _nettoie_signatures_clients(self) -> None:
+        """
+        Oublie les signatures des adresses qui ne sont plus suivies par le compteur.
+
+        Returns:
+            None
+        """
+        self._signatures_clients = {
+            adresse_ip: numeros for adresse_ip, numeros in self._signatures_clients.items()
+            if self.clients.get_total(adresse_ip) > 0
+        }
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée reçue à la détection si elle passe le filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+        """
+        self.total_entrees += 1
+        if not self._predicat(entree) or entree.requete.url is None:
+            return
+        self.requetes_analysees += 1
+        score, numeros = self._verdict_cache(entree.requete.url)
+        if score == 0:
+            return
+        self.requetes_suspectes += 1
+        self.totaux_signatures.update(numeros)
+        adresse_ip = entree.client.adresse_ip
+        self.clients.ajoute(adresse_ip, score)
+        self._signatures_clients.setdefault(adresse_ip, set()).update(numeros)
+        # Nettoyage amorti des adresses évincées du compteur
+        if len(self._signatures_clients) > 2 * self.clients.capacite:
+            self._nettoie_signatures_clients()
+
+    def ajoute_entrees(self, entrees) -> None:
+        """
+        Ajoute plusieurs entrées reçues.
+
+        Args:
+            entrees (Iterable): Les entrées reçues.
+
+        Returns:
+            None
+        """
+        for entree in entrees:
+            self.ajoute_entree(entree)
+
+    def get_analyse(self, nombre_par_top: int = 10) -> dict:
+        """
+        Retourne l'analyse des requêtes suspectes.
+
+        Args:
+            nombre_par_top (int): Le nombre maximal d'éléments de chaque classement.
+                Par défaut, sa valeur est égale à ``10``.
+
+        Returns:
+            dict: Le nombre de requêtes suspectes, les signatures les plus trouvées, les
+            clients suspects (score, erreur maximale du score et signatures trouvées)
+            et l'utilisation du cache.
+
+        Raises:
+            TypeError: Le paramètre ``nombre_par_top`` n'est pas un entier.
+            ValueError: Le paramètre ``nombre_par_top`` est inférieur à ``0``.
+        """
+        # Vérification du paramètre
+        verifie_nombre_par_top(nombre_par_top)
+
+        informations_cache = self._verdict_cache.cache_info()
+        return {
+            "signatures": self.chemin_signatures,
+            "requetes_analysees": self.requetes_analysees,
+            "requetes_suspectes": self.requetes_suspectes,
+            "taux_suspectes": (self.requetes_suspectes / self.requetes_analysees * 100
+                               if self.requetes_analysees > 0 else None),
+            "top_signatures": [
+                {"signature": self.signatures[numero][0], "total": total}
+                for numero, total in self.totaux_signatures.most_common(nombre_par_top)
+            ],
+            "clients_suspects": [
+                {"adresse_ip": adresse_ip, "score": score, "erreur_max": erreur,
+                 "signatures": [self.signatures[numero][0] for numero
+                                in sorted(self._signatures_clients.get(adresse_ip, ()))]}
+                for adresse_ip, score, erreur in self.clients.get_top(nombre_par_top)
+            ],
+            "cache": {
+                "succes": informations_cache.hits,
+                "verdicts": informations_cache.misses,
+                "taille": informations_cache.currsize
+            }
+        }
+
+
+class SignaturesAttaquesException(Exception):
+    """
+    Représente une erreur lors du chargement d'un fichier de signatures d'attaques.
+    """
@@ -0,0 +1,238 @@
+"""
+Module pour la détection, d'une exécution à l'autre, des adresses IP et des urls
+jamais rencontrées auparavant.
+"""
+
+from hashlib import blake2b
+from json import dumps
+from os.path import isfile, join, splitext
+from typing import Optional
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.filtre_bloom import FiltreBloom
+from analyse.normaliseur_urls import NormaliseurUrls
+
+
+class DetecteurNouveautes:
+    """
+    Représente la détection des adresses IP et des urls d'un flux d'entrées de log
+    Apache qui n'ont été rencontrées lors d'aucune exécution précédente.
+
+    Les clés déjà rencontrées sont gardées dans un :class:`FiltreBloom` par type de
+    clé, enregistré dans :attr:`dossier_memoire` : la mémoire reste fixe quel que soit
+    le nombre de clés de l'historique. Chaque clé reçue est cherchée puis ajoutée au
+    filtre en une seule opération ; une clé n'est donc signalée qu'une fois, et les
+    clés de l'exécution ne sont visibles des exécutions suivantes qu'après
+    :meth:`enregistre`. Une clé déjà rencontrée n'est jamais signalée ; une clé
+    nouvelle peut ne pas l'être, avec une probabilité égale au taux de faux positifs.
+
+    Les clés mémorisées dépendent du filtre et, pour les urls, de leur normalisation :
+    le nom de chaque fichier est donc suffixé par une empreinte de cette configuration
+    (sauf sans filtre ni normalisation), pour que des exécutions avec des
+    configurations différentes dans le même dossier ne mélangent pas leurs mémoires.
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées.
+        dossier_memoire (str): Le dossier des filtres de Bloom enregistrés.
+        normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+            routes avant leur recherche.
+        nombre_exemples (int): Le nombre maximal de nouvelles clés de chaque type
+            listées dans l'analyse.
+        premiere_execution (bool): Indique si aucun filtre n'était enregistré (toutes
+            les clés sont alors nouvelles).
+        total_entrees (int): Le nombre d'entrées reçues (avant filtre).
+        fichiers (dict): Le nom du fichier du filtre de Bloom de chaque type de clé
+            pour le filtre et la normalisation des urls de la détection.
+        memoires (dict): Le filtre de Bloom de chaque type de clé.
+        nouveautes (dict): Le nombre de nouvelles clés de chaque type.
+        exemples (dict): Les premières nouvelles clés de chaque type, dans l'ordre de
+            leur apparition.
+        _predicat (Callable): Le prédicat compilé du filtre.
+
+    Class-level variables:
+        :cvar FICHIERS (dict): Le nom du fichier du filtre de Bloom de chaque type de clé,
+            sans filtre ni normalisation des urls.
+    """
+
+    FICHIERS: dict = {
+        "ip": "memoire-nouveautes-ip.bloom",
+        "urls": "memoire-nouveautes-urls.bloom"
+    }
+
+    def __init__(self,
+                 filtre: FiltreLogApache,
+                 dossier_memoire: str,
+                 capacite: int = 1000000,
+                 taux_faux_positifs: float = 0.01,
+                 nombre_exemples: int = 20,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None):
+        """
+        Initialise la détection à partir des filtres enregistrés dans le dossier, ou de
+        filtres vides s'ils n'existent pas encore.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            dossier_memoire (str): Le dossier des filtres de Bloom enregistrés.
+            capacite (int): Le nombre de clés prévu de chaque nouveau filtre. Par
+                défaut, ``1000000``.
+            taux_faux_positifs (float): Le taux de faux positifs visé de chaque nouveau
+                filtre. Par défaut, ``0.01``.
+            nombre_exemples (int): Le nombre maximal de nouvelles clés de chaque type
+                listées dans l'analyse. Par défaut, ``20``.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes. Si ``None``, les urls brutes sont recherchées.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La capacité, le taux ou le nombre d'exemples est invalide.
+            FiltreBloomException: Un filtre enregistré est illisible ou invalide.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+        if not isinstance(dossier_memoire, str):
+            raise TypeError("Le dossier de la mémoire doit être une chaîne de caractères.")
+        if not isinstance(nombre_exemples, int) or isinstance(nombre_exemples, bool):
+            raise TypeError("Le nombre d'exemples doit être un entier.")
+        if normaliseur_urls is not None and not isinstance(normaliseur_urls, NormaliseurUrls):
+            raise TypeError("La normalisation des urls doit être de type NormaliseurUrls.")
+        # Vérification de la valeur des paramètres
+        if nombre_exemples < 0:
+            raise ValueError("Le nombre d'exemples doit être supérieur ou égal à 0.")
+
+        self.filtre = filtre
+        self.dossier_memoire = dossier_memoire
+        self.normaliseur_urls = normaliseur_urls
+        self.nombre_exemples = nombre_exemples
+        self.premiere_execution = True
+        self.total_entrees = 0
+        definition_filtre = filtre.get_dict_filtre()
+        self.fichiers = {
+            "ip": self._nomme_fichier("ip", {"filtre": definition_filtre}),
+            "urls": self._nomme_fichier("urls", {
+                "filtre": definition_filtre,
+                "normalisation_urls": (None if normaliseur_urls is None
+                                       else normaliseur_urls.get_dict())
+            })
+        }
+        self.memoires = {}
+        for type_cle, nom_fichier in self.fichiers.items():
+            chemin_fichier = join(dossier_memoire, nom_fichier)
+            if isfile(chemin_fichier):
+                # Un filtre ne peut pas être redimensionné : ses paramètres sont gardés
+                self.memoires[type_cle] = FiltreBloom.charge(chemin_fichier)
+                self.premiere_execution = False
+            else:
+                self.memoires[type_cle] = FiltreBloom(capacite, taux_faux_positifs)
+        self.nouveautes = dict.fromkeys(self.FICHIERS, 0)
+        self.exemples = {type_cle: [] for type_cle in self.FICHIERS}
+        self._predicat = filtre.get_predicat()
+
+    @classmethod
+    def _nomme_fichier(cls, type_cle: str, configuration: dict) -> str:
+        """
+        Retourne le nom du fichier du filtre de Bloom d'un type de clé pour une
+        configuration.
+
+        Args:
+            type_cle (str): Le type de la clé (``ip`` ou ``urls``).
+            configuration (dict): Le filtre et, pour les urls, la normalisation des urls.
+
+        Returns:
+            str: Le nom de :attr:`FICHIERS` sans filtre ni normalisation, sinon suffixé
+            par une empreinte de la configuration.
+        """
+        if all(valeur is None for valeur in configuration["filtre"].values()) \
+                and configuration.get("normalisation_urls") is None:
+            return cls.FICHIERS[type_cle]
+        empreinte = blake2b(dumps(configuration, sort_keys=True).encode("utf-8"),
+                            digest_size=6).hexdigest()
+        nom, extension = splitext(cls.FICHIERS[type_cle])
+        return f"{nom}-{empreinte}{extension}"
+
+    def _ajoute_cle(self, type_cle: str, cle: str) -> None:
+        """
+        Ajoute une clé à la mémoire de son type et la compte si elle est nouvelle.
+
+        Args:
+            type_cle (str): Le type de la clé (``ip`` ou ``urls``).
+            cle (str): La clé.
+
+        Returns:
+            None
+        """
+        if self.memoires[type_cle].ajoute(cle):
+            return
+        self.nouveautes[type_cle] += 1
+        exemples = self.exemples[type_cle]
+        if len(exemples) < self.nombre_exemples:
+            exemples.append(cle)
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Cherche puis ajoute l'adresse IP et l'url d'une entrée reçue si elle passe le
+        filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée reçue.
+
+        Returns:
+            None
+        """
+        self.total_entrees += 1
+        if not self._predicat(entree):
+            return
+        self._ajoute_cle("ip", entree.client.adresse_ip)
+        url = entree.requete.url
+        if url is not None:
+            if self.normaliseur_urls is not None:
+                url = self.normaliseur_urls.normalise(url)
+            self._ajoute_cle("urls", url)
+
+    def ajoute_entrees(self, entrees) -> None:
+        """
+        Ajoute plusieurs entrées reçues.
+
+        Args:
+            entrees (Iterable): Les entrées reçues.
+
+        Returns:
+            None
+        """
+        for entree in entrees:
+            self.ajoute_entree(entree)
+
+    def enregistre(self) -> None:
+        """
+        Enregistre les filtres de Bloom, avec les clés de l'exécution, dans
+        :attr:`dossier_memoire`.
+
+        Returns:
+            None
+
+        Raises:
+            FiltreBloomException: Un filtre ne peut pas être écrit.
+        """
+        for type_cle, nom_fichier in self.fichiers.items():
+            self.memoires[type_cle].enregistre(join(self.dossier_memoire, nom_fichier))
+
+    def get_analyse(self) -> dict:
+        """
+        Retourne le nombre de nouvelles adresses IP et de nouvelles urls.
+
+        Returns:
+            dict: Pour chaque type de clé, le nombre de nouvelles clés, les premières
+            d'entre elles, le fichier et l'occupation de son filtre de Bloom.
+        """
+        return {
+            "premiere_execution": self.premiere_execution,
+            **{
+                type_cle: {
+                    "nouvelles": self.nouveautes[type_cle],
+                    "exemples": list(self.exemples[type_cle]),
+                    "fichier": self.fichiers[type_cle],
+                    "memoire": self.memoires[type_cle].get_dict()
+                }
+                for type_cle in self.FICHIERS
+            }
+        }
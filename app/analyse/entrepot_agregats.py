@@ -0,0 +1,405 @@
+"""
+Module pour l'entrepôt SQLite des agrégats des analyses successives et le calcul de
+leurs tendances.
+"""
+
+import sqlite3
+from datetime import date, datetime, timezone
+from hashlib import sha256
+from json import dumps
+from typing import Optional
+from analyse.series_temporelles import SeriesTemporelles
+from analyse.filtre_log_apache import FiltreLogApache
+
+
+class EntrepotAgregats:
+    """
+    Représente un entrepôt SQLite des agrégats de chaque analyse : les séries
+    temporelles, la répartition des codes de statut http et les urls les plus
+    demandées. Les tendances (jour après jour, semaine après semaine) sont ensuite
+    calculées par des requêtes sur ces agrégats, sans relire ni les fichiers log ni
+    les analyses exportées.
+
+    Chaque analyse appartient à une série, identifiée par ses fichiers sources et son
+    filtre : les analyses filtrées (``-c 404``) ne sont jamais additionnées aux
+    analyses sans filtre. Au sein d'une série, la dernière analyse ajoutée fait foi
+    sur sa plage de temps : ses intervalles remplacent ceux des analyses précédentes
+    qui la chevauchent (par exemple lors d'une nouvelle analyse d'un fichier log qui
+    a grossi), dont les codes et les urls sont écartés.
+
+    Les intervalles des séries temporelles sont datés individuellement. Les codes et
+    les urls, qui portent sur toute une analyse, ne sont comptés dans une période que
+    si toute l'analyse s'y trouve ; les analyses à cheval sur plusieurs périodes sont
+    seulement comptées dans ``executions_partielles``. Un index couvrant sur la série
+    et le début des intervalles permet de sommer une période sans lire la table, et une analyse
+    déjà ajoutée (même empreinte) est ignorée.
+
+    Attributes:
+        chemin_base (str): Le chemin du fichier SQLite.
+        _connexion (sqlite3.Connection): La connexion à la base.
+
+    Class-level variables:
+        :cvar VERSION (int): La version du schéma, enregistrée dans ``user_version``.
+        :cvar PERIODES (dict): Les périodes de comparaison disponibles et leur durée
+            en secondes.
+        :cvar SCHEMA (str): Les instructions de création des tables et des index.
+    """
+
+    VERSION: int = 2
+
+    PERIODES: dict = {
+        "jour": 86400,
+        "semaine": 7 * 86400
+    }
+
+    SCHEMA: str = """
+        CREATE TABLE series (
+            id INTEGER PRIMARY KEY,
+            filtre TEXT NOT NULL,
+            chemins TEXT NOT NULL,
+            UNIQUE (filtre, chemins)
+        );
+        CREATE TABLE executions (
+            id INTEGER PRIMARY KEY,
+            serie INTEGER NOT NULL REFERENCES series (id),
+            empreinte TEXT NOT NULL UNIQUE,
+            ajout TEXT NOT NULL,
+            debut INTEGER,
+            fin INTEGER,
+            active INTEGER NOT NULL,
+            total_entrees INTEGER NOT NULL,
+            total_entrees_filtre INTEGER NOT NULL
+        );
+        CREATE INDEX executions_serie ON executions (serie, debut);
+        CREATE TABLE intervalles (
+            serie INTEGER NOT NULL REFERENCES series (id),
+            debut INTEGER NOT NULL,
+            execution INTEGER NOT NULL REFERENCES executions (id),
+            duree INTEGER NOT NULL,
+            requetes INTEGER NOT NULL,
+            octets INTEGER NOT NULL,
+            erreurs INTEGER NOT NULL,
+            PRIMARY KEY (serie, debut)
+        );
+        CREATE INDEX intervalles_serie ON intervalles (serie, debut, requetes, octets, erreurs);
+        CREATE TABLE codes (
+            execution INTEGER NOT NULL REFERENCES executions (id),
+            code INTEGER NOT NULL,
+            total INTEGER NOT NULL
+        );
+        CREATE INDEX codes_execution ON codes (execution);
+        CREATE TABLE urls (
+            execution INTEGER NOT NULL REFERENCES executions (id),
+            url TEXT,
+            total INTEGER NOT NULL
+        );
+        CREATE INDEX urls_execution ON urls (execution);
+    """
+
+    def __init__(self, chemin_base: str):
+        """
+        Ouvre l'entrepôt, et crée son schéma si la base est vide.
+
+        Args:
+            chemin_base (str): Le chemin du fichier SQLite (créé s'il n'existe pas).
+
+        Raises:
+            TypeError: Le paramètre ``chemin_base`` n'est pas une chaîne de caractères.
+            EntrepotAgregatsException: La base ne peut pas être ouverte ou la version de
+                son schéma n'est pas supportée.
+        """
+        # Vérification du paramètre
+        if not isinstance(chemin_base, str):
+            raise TypeError("Le chemin de l'entrepôt doit être une chaîne de caractères.")
+
+        self.chemin_base = chemin_base
+        try:
+            self._connexion = sqlite3.connect(chemin_base)
+            version = self._connexion.execute("PRAGMA user_version").fetchone()[0]
+            if version == 0:
+                self._connexion.executescript(self.SCHEMA)
+                self._connexion.execute(f"PRAGMA user_version = {self.VERSION}")
+                version = self.VERSION
+        except sqlite3.Error as ex:
+            raise EntrepotAgregatsException(
+                f"Impossible d'ouvrir l'entrepôt {chemin_base} : {ex}"
+            ) from ex
+        if version != self.VERSION:
+            self._connexion.close()
+            raise EntrepotAgregatsException(
+                f"La version de l'entrepôt ({version}) n'est pas supportée, la version "
+                f"attendue est {self.VERSION}."
+            )
+
+    def ferme(self) -> None:
+        """
+        Ferme la connexion à la base.
+
+        Returns:
+            None
+        """
+        self._connexion.close()
+
+    @staticmethod
+    def _get_cle_filtre(definition: Optional[dict]) -> str:
+        """
+        Retourne la forme canonique d'un filtre, qui identifie avec les fichiers
+        sources la série d'une analyse.
+
+        Args:
+            definition (Optional[dict]): Le filtre au format de
+                :meth:`FiltreLogApache.get_dict_filtre`. Si ``None``, aucun filtre.
+
+        Returns:
+            str: Le filtre sérialisé en JSON, avec toutes ses clés.
+        """
+        definition = definition or {}
+        return dumps({cle: definition.get(cle)
+                      for cle in ("adresse_ip", "code_statut_http", "expression")},
+                     sort_keys=True)
+
+    def ajoute_analyse(self, analyse: dict) -> bool:
+        """
+        Ajoute les agrégats d'une analyse au format de
+        :meth:`AnalyseurLogApache.get_analyse_complete` (ou de
+        :meth:`EtatPartielAnalyse.get_analyse_complete`), en une seule transaction.
+        L'analyse remplace, sur sa plage de temps, les analyses précédentes de la même
+        série (mêmes fichiers sources et même filtre).
+
+        Args:
+            analyse (dict): L'analyse.
+
+        Returns:
+            bool: ``True`` si l'analyse a été ajoutée, ``False`` si elle l'avait déjà été.
+
+        Raises:
+            TypeError: Le paramètre ``analyse`` n'est pas un dictionnaire.
+            EntrepotAgregatsException: L'analyse est invalide ou ne peut pas être écrite.
+        """
+        # Vérification du paramètre
+        if not isinstance(analyse, dict):
+            raise TypeError("L'analyse doit être un dictionnaire.")
+
+        try:
+            statistiques = analyse["statistiques"]
+            series = statistiques["series_temporelles"]
+            duree = SeriesTemporelles.GRANULARITES[series["granularite"]]
+            intervalles = [
+                (int(datetime.fromisoformat(serie["debut"]).timestamp()), duree,
+                 serie["requetes"], serie["octets"], serie["erreurs"])
+                for serie in series["series"]
+            ]
+            codes = [(statistique["code"], statistique["total"])
+                     for statistique in statistiques["reponses"]["repartition_code_statut_http"]]
+            urls = [(statistique["url"], statistique["total"])
+                    for statistique in statistiques["requetes"]["top_urls"]]
+            serie = (
+                self._get_cle_filtre(analyse.get("filtre")),
+                dumps(sorted(analyse["chemins"]) if "chemins" in analyse
+                      else [analyse["chemin"]])
+            )
+            debut = min((intervalle[0] for intervalle in intervalles), default=None)
+            fin = max((intervalle[0] + duree for intervalle in intervalles), default=None)
+            execution = (
+                sha256(dumps(analyse, sort_keys=True).encode("utf-8")).hexdigest(),
+                datetime.now(timezone.utc).isoformat(),
+                debut,
+                fin,
+                analyse["total_entrees"],
+                statistiques["total_entrees_filtre"]
+            )
+        except (KeyError, TypeError, ValueError) as ex:
+            raise EntrepotAgregatsException(f"L'analyse est invalide : {ex}") from ex
+
+        try:
+            with self._connexion:
+                if self._connexion.execute("SELECT 1 FROM executions WHERE empreinte = ?",
+                                           execution[:1]).fetchone() is not None:
+                    return False
+                self._connexion.execute(
+                    "INSERT OR IGNORE INTO series (filtre, chemins) VALUES (?, ?)", serie
+                )
+                id_serie = self._connexion.execute(
+                    "SELECT id FROM series WHERE filtre = ? AND chemins = ?", serie
+                ).fetchone()[0]
+                if debut is not None:
+                    # La dernière analyse fait foi sur sa plage de temps
+                    self._connexion.execute(
+                        "DELETE FROM intervalles WHERE serie = ? AND debut < ? "
+                        "AND debut + duree > ?", (id_serie, fin, debut)
+                    )
+                    self._connexion.execute(
+                        "UPDATE executions SET active = 0 WHERE serie = ? AND active = 1 "
+                        "AND debut < ? AND fin > ?", (id_serie, fin, debut)
+                    )
+                identifiant = self._connexion.execute(
+                    "INSERT INTO executions (serie, empreinte, ajout, debut, fin, active, "
+                    "total_entrees, total_entrees_filtre) VALUES (?, ?, ?, ?, ?, 1, ?, ?)",
+                    (id_serie, *execution)
+                ).lastrowid
+                self._connexion.executemany(
+                    "INSERT INTO intervalles VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(id_serie, intervalle[0], identifiant, *intervalle[1:])
+                     for intervalle in intervalles]
+                )
+                self._connexion.executemany("INSERT INTO codes VALUES (?, ?, ?)",
+                                            [(identifiant, *code) for code in codes])
+                self._connexion.executemany("INSERT INTO urls VALUES (?, ?, ?)",
+                                            [(identifiant, *url) for url in urls])
+        except sqlite3.Error as ex:
+            raise EntrepotAgregatsException(
+                f"Impossible d'écrire dans l'entrepôt {self.chemin_base} : {ex}"
+            ) from ex
+        return True
+
+    def get_periode(self,
+                    debut: int,
+                    fin: int,
+                    nombre_par_top: int = 10,
+                    filtre: Optional[FiltreLogApache] = None) -> dict:
+        """
+        Retourne les agrégats d'une période pour les analyses d'un filtre.
+
+        Args:
+            debut (int): Le début de la période (inclus), en secondes depuis l'epoch.
+            fin (int): La fin de la période (exclue), en secondes depuis l'epoch.
+            nombre_par_top (int): Le nombre maximal d'urls du classement. Par défaut,
+                sa valeur est égale à ``10``.
+            filtre (Optional[FiltreLogApache]): Le filtre des analyses agrégées. Si
+                ``None``, les analyses sans filtre.
+
+        Returns:
+            dict: Les bornes de la période, ses nombres de requêtes, d'octets et
+            d'erreurs, son taux d'erreurs, la répartition des codes de statut http et
+            les urls les plus demandées des analyses entièrement comprises dans la
+            période, et le nombre d'analyses à cheval sur ses bornes.
+        """
+        cle_filtre = self._get_cle_filtre(filtre.get_dict_filtre() if filtre is not None
+                                          else None)
+        requetes, octets, erreurs = self._connexion.execute(
+            "SELECT COALESCE(SUM(requetes), 0), COALESCE(SUM(octets), 0), "
+            "COALESCE(SUM(erreurs), 0) FROM intervalles WHERE debut >= ? AND debut < ? "
+            "AND serie IN (SELECT id FROM series WHERE filtre = ?)",
+            (debut, fin, cle_filtre)
+        ).fetchone()
+        # Analyses actives de la période, entièrement comprises ou à cheval
+        executions = (
+            "SELECT executions.id FROM executions "
+            "JOIN series ON series.id = executions.serie "
+            "WHERE series.filtre = ? AND executions.active = 1 "
+        )
+        codes = self._connexion.execute(
+            "SELECT code, SUM(total) AS somme FROM codes WHERE execution IN ("
+            f"{executions} AND executions.debut >= ? AND executions.fin <= ?) "
+            "GROUP BY code ORDER BY somme DESC, code",
+            (cle_filtre, debut, fin)
+        ).fetchall()
+        urls = self._connexion.execute(
+            "SELECT url, SUM(total) AS somme FROM urls WHERE execution IN ("
+            f"{executions} AND executions.debut >= ? AND executions.fin <= ?) "
+            "GROUP BY url ORDER BY somme DESC, url LIMIT ?",
+            (cle_filtre, debut, fin, nombre_par_top)
+        ).fetchall()
+        executions_partielles = self._connexion.execute(
+            f"SELECT COUNT(*) FROM ({executions} AND executions.debut < ? "
+            "AND executions.fin > ? AND (executions.debut < ? OR executions.fin > ?))",
+            (cle_filtre, fin, debut, debut, fin)
+        ).fetchone()[0]
+        return {
+            "debut": datetime.fromtimestamp(debut, timezone.utc).isoformat(),
+            "fin": datetime.fromtimestamp(fin, timezone.utc).isoformat(),
+            "requetes": requetes,
+            "octets": octets,
+            "erreurs": erreurs,
+            "taux_erreurs": erreurs / requetes * 100 if requetes else 0,
+            "repartition_code_statut_http": [{"code": code, "total": total}
+                                             for code, total in codes],
+            "top_urls": [{"url": url, "total": total} for url, total in urls],
+            "executions_partielles": executions_partielles
+        }
+
+    def get_tendance(self,
+                     periode: str = "semaine",
+                     date_reference: Optional[date] = None,
+                     nombre_par_top: int = 10,
+                     filtre: Optional[FiltreLogApache] = None) -> dict:
+        """
+        Compare la période qui se termine à la fin de la date de référence avec la
+        période précédente de même durée.
+
+        Args:
+            periode (str): La durée des périodes comparées, une des clés de
+                :attr:`PERIODES`. Par défaut, ``semaine``.
+            date_reference (Optional[date]): Le dernier jour (UTC) de la période
+                courante. Si ``None``, le jour du dernier intervalle du filtre.
+            nombre_par_top (int): Le nombre maximal d'urls de chaque classement. Par
+                défaut, sa valeur est égale à ``10``.
+            filtre (Optional[FiltreLogApache]): Le filtre des analyses comparées. Si
+                ``None``, les analyses sans filtre.
+
+        Returns:
+            dict: Les agrégats de la période courante et de la période précédente (voir
+            :meth:`get_periode`), et l'évolution de leurs requêtes, octets et erreurs en
+            pourcentage (``None`` si la période précédente est vide), et de leur taux
+            d'erreurs en points.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La période est inconnue ou le nombre par top est négatif.
+            EntrepotAgregatsException: L'entrepôt ne contient aucune analyse du filtre
+                et aucune date de référence n'est indiquée.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(periode, str):
+            raise TypeError("La période doit être une chaîne de caractères.")
+        if date_reference is not None and not isinstance(date_reference, date):
+            raise TypeError("La date de référence doit être de type date.")
+        if not isinstance(nombre_par_top, int) or isinstance(nombre_par_top, bool):
+            raise TypeError("Le nombre par top doit être un entier.")
+        if filtre is not None and not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre des analyses doit être de type FiltreLogApache.")
+        # Vérification de la valeur des paramètres
+        if periode not in self.PERIODES:
+            raise ValueError("La période doit être une des valeurs suivantes : "
+                             f"{', '.join(self.PERIODES)}.")
+        if nombre_par_top < 0:
+            raise ValueError("Le nombre par top doit être supérieur ou égale à 0.")
+
+        if date_reference is None:
+            dernier_debut = self._connexion.execute(
+                "SELECT MAX(debut) FROM intervalles WHERE serie IN "
+                "(SELECT id FROM series WHERE filtre = ?)",
+                (self._get_cle_filtre(filtre.get_dict_filtre() if filtre is not None
+                                      else None),)
+            ).fetchone()[0]
+            if dernier_debut is None:
+                raise EntrepotAgregatsException("L'entrepôt ne contient aucune analyse "
+                                                "avec ce filtre.")
+            fin = (dernier_debut // 86400 + 1) * 86400
+        else:
+            fin = int(datetime(date_reference.year, date_reference.month, date_reference.day,
+                               tzinfo=timezone.utc).timestamp()) + 86400
+        duree = self.PERIODES[periode]
+        courante = self.get_periode(fin - duree, fin, nombre_par_top, filtre)
+        precedente = self.get_periode(fin - 2 * duree, fin - duree, nombre_par_top, filtre)
+        return {
+            "periode": periode,
+            "filtre": filtre.get_dict_filtre() if filtre is not None else None,
+            "courante": courante,
+            "precedente": precedente,
+            "evolution": {
+                **{
+                    cle: (courante[cle] - precedente[cle]) / precedente[cle] * 100
+                    if precedente[cle] else None
+                    for cle in ("requetes", "octets", "erreurs")
+                },
+                "taux_erreurs": courante["taux_erreurs"] - precedente["taux_erreurs"]
+            }
+        }
+
+
+class EntrepotAgregatsException(Exception):
+    """
+    Représente une erreur lors de l'ouverture, de l'écriture ou de la lecture d'un
+    entrepôt d'agrégats.
+    """
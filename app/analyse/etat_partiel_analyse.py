@@ -0,0 +1,505 @@
+"""
+Module pour l'état partiel (fusionnable et sérialisable) d'une analyse de log Apache.
+"""
+
+from json import load, JSONDecodeError
+from os.path import abspath
+from typing import Optional
+import numpy as np
+from parse.entree_log_apache import EntreeLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.compteur_borne import CompteurBorne
+from analyse.statistiques_reponses import StatistiquesReponses
+from analyse.series_temporelles import SeriesTemporelles
+from analyse.moteur_groupement import MoteurGroupement
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.verifications import verifie_nombre_par_top
+
+
+class EtatPartielAnalyse:
+    """
+    Représente l'état partiel d'une analyse : des compteurs bruts, des totaux et des
+    sketchs, sans taux calculés ni classements tronqués.
+
+    Plusieurs états produits sur des fichiers différents (par exemple sur plusieurs
+    machines) avec le même filtre, la même granularité, la même normalisation des
+    urls et les mêmes regroupements peuvent être fusionnés, puis transformés en une
+    analyse au format de :meth:`AnalyseurLogApache.get_analyse_complete`. Les codes et les séries
+    temporelles fusionnés sont exacts. Pour borner la taille de l'état, les urls sont
+    comptées par un :class:`CompteurBorne` (Space-Saving), les regroupements sont
+    bornés (voir :class:`MoteurGroupement`) et le trafic est agrégé par intervalle de
+    la granularité ; les quantiles restent des estimations (voir
+    :class:`SketchQuantiles`). Le pic de requêtes par seconde d'un intervalle reste
+    exact après fusion tant que les états ne partagent que la seconde de leur
+    première ou de leur dernière entrée, comme les plages successives d'un même
+    fichier : seules ces secondes sont conservées avec leur nombre de requêtes.
+    Sinon, il peut être sous-estimé. La précision de ces valeurs est indiquée par
+    :meth:`get_precisions`.
+
+    Attributes:
+        filtre (FiltreLogApache): Le filtre appliqué aux entrées de l'état.
+        granularite (str): L'intervalle de regroupement des séries temporelles.
+        chemins (list): Les chemins absolus des fichiers analysés.
+        total_entrees (int): Le nombre total d'entrées des fichiers analysés.
+        total_entrees_filtre (int): Le nombre d'entrées qui ont passées le filtre.
+        urls (CompteurBorne): Le nombre de requêtes des urls les plus demandées.
+        reponses (StatistiquesReponses): Le nombre de réponses par code de statut http
+            et les sketchs des quantiles des réponses.
+        intervalles (dict): Pour le début (en secondes depuis l'epoch) de chaque
+            intervalle de la granularité, le nombre de requêtes, d'octets et d'erreurs,
+            et le pic de requêtes par seconde.
+        secondes_bordure (dict): Le nombre de requêtes des secondes de la première et de
+            la dernière entrée de chaque état fusionné.
+        plages (list): La première et la dernière seconde des entrées de chaque état
+            fusionné, sous la forme ``[debut, fin]``.
+        _duree_intervalle (int): La durée en secondes d'un intervalle de la granularité.
+        _requetes_par_seconde (dict): Le nombre de requêtes de chaque seconde des
+            entrées ajoutées, pour le calcul des pics (non sérialisé).
+        _secondes_extremes (list): Les secondes de la première et de la dernière entrée
+            ajoutée (non sérialisées).
+        moteur_groupement (MoteurGroupement): Les agrégats bruts des regroupements.
+        normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+            routes avant leur comptage. Seule sa définition est sérialisée, les urls
+            de l'état étant déjà normalisées.
+
+    Class-level variables:
+        :cvar VERSION (int): La version du format sérialisé.
+        :cvar CAPACITE_URLS (int): Le nombre maximal d'urls suivies.
+    """
+
+    VERSION: int = 3
+
+    CAPACITE_URLS: int = 1000
+
+    def __init__(self,
+                 filtre: FiltreLogApache,
+                 granularite: str = "heure",
+                 groupements: Optional[list] = None,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None):
+        """
+        Initialise un état partiel vide.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre appliqué aux entrées de l'état.
+            granularite (str): L'intervalle de regroupement des séries temporelles.
+                Par défaut, sa valeur est égale à ``heure``.
+            groupements (Optional[list]): Les spécifications (:class:`SpecificationGroupement`)
+                des regroupements à calculer. Si ``None``, aucun regroupement n'est calculé.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes avant leur comptage. Si ``None``, les urls brutes sont comptées.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La granularité est inconnue.
+        """
+        # Vérification des paramètres
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre de l'état partiel doit être de type FiltreLogApache.")
+        if normaliseur_urls is not None and not isinstance(normaliseur_urls, NormaliseurUrls):
+            raise TypeError("La normalisation des urls doit être de type NormaliseurUrls.")
+        SeriesTemporelles(granularite)
+
+        self.filtre = filtre
+        self.granularite = granularite
+        self.chemins = []
+        self.total_entrees = 0
+        self.total_entrees_filtre = 0
+        self.urls = CompteurBorne(self.CAPACITE_URLS)
+        self.reponses = StatistiquesReponses()
+        self.intervalles = {}
+        self._duree_intervalle = SeriesTemporelles.GRANULARITES[granularite]
+        self.secondes_bordure = {}
+        self.plages = []
+        self._requetes_par_seconde = {}
+        self._secondes_extremes = []
+        self.moteur_groupement = MoteurGroupement(groupements if groupements is not None else [])
+        self.normaliseur_urls = normaliseur_urls
+
+    def ajoute_fichier(self, chemin: str, total_entrees: int) -> None:
+        """
+        Enregistre un fichier analysé et son nombre total d'entrées (avant filtre).
+
+        Args:
+            chemin (str): Le chemin du fichier.
+            total_entrees (int): Le nombre total d'entrées du fichier.
+
+        Returns:
+            None
+        """
+        self.chemins.append(abspath(chemin))
+        self.total_entrees += total_entrees
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute à l'état une entrée qui a passé le filtre.
+
+        Args:
+            entree (EntreeLogApache): L'entrée à ajouter.
+
+        Returns:
+            None
+        """
+        reponse = entree.reponse
+        code = reponse.code_statut_http
+        self.total_entrees_filtre += 1
+        url = entree.requete.url
+        if self.normaliseur_urls is not None:
+            url = self.normaliseur_urls.normalise(url)
+        self.urls.ajoute(url)
+        self.reponses.ajoute(reponse)
+        # Agrégats par intervalle
+        seconde = int(entree.requete.horodatage.timestamp())
+        requetes_seconde = self._requetes_par_seconde.get(seconde, 0) + 1
+        self._requetes_par_seconde[seconde] = requetes_seconde
+        if not self._secondes_extremes:
+            self._secondes_extremes.append(seconde)
+        self._secondes_extremes[1:] = [seconde]
+        debut = seconde - seconde % self._duree_intervalle
+        agregats = self.intervalles.get(debut)
+        if agregats is None:
+            agregats = self.intervalles[debut] = [0, 0, 0, 0]
+        agregats[0] += 1
+        agregats[1] += reponse.taille_octets or 0
+        agregats[2] += code >= 400
+        agregats[3] = max(agregats[3], requetes_seconde + self.secondes_bordure.get(seconde, 0))
+        # Regroupements
+        self.moteur_groupement.ajoute_entree(entree)
+
+    def ajoute_entrees(self, entrees: list) -> None:
+        """
+        Ajoute à l'état plusieurs entrées qui ont passé le filtre.
+
+        Args:
+            entrees (list): Les entrées à ajouter.
+
+        Returns:
+            None
+        """
+        for entree in entrees:
+            self.ajoute_entree(entree)
+
+    def fusionne(self, autre: "EtatPartielAnalyse") -> None:
+        """
+        Fusionne un autre état partiel dans cet état. L'état ``autre`` n'est pas modifié.
+
+        Args:
+            autre (EtatPartielAnalyse): L'état à fusionner.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: Le paramètre ``autre`` n'est pas un :class:`EtatPartielAnalyse`.
+            ValueError: Les deux états n'ont pas le même filtre, la même granularité,
+                la même normalisation des urls ou les mêmes regroupements.
+        """
+        # Vérification du paramètre
+        if not isinstance(autre, EtatPartielAnalyse):
+            raise TypeError("L'état à fusionner doit être de type EtatPartielAnalyse.")
+        if self.filtre.get_dict_filtre() != autre.filtre.get_dict_filtre():
+            raise ValueError("Les états partiels à fusionner doivent avoir le même filtre.")
+        if self.granularite != autre.granularite:
+            raise ValueError("Les états partiels à fusionner doivent avoir la même "
+                             "granularité.")
+        if self.get_definition_normalisation() != autre.get_definition_normalisation():
+            raise ValueError("Les états partiels à fusionner doivent avoir la même "
+                             "normalisation des urls.")
+
+        self.moteur_groupement.fusionne(autre.moteur_groupement)
+        self.chemins.extend(autre.chemins)
+        self.total_entrees += autre.total_entrees
+        self.total_entrees_filtre += autre.total_entrees_filtre
+        self.urls.fusionne(autre.urls)
+        self.reponses.fusionne(autre.reponses)
+        for debut, agregats_autre in autre.intervalles.items():
+            agregats = self.intervalles.setdefault(debut, [0, 0, 0, 0])
+            for indice, valeur in enumerate(agregats_autre[:3]):
+                agregats[indice] += valeur
+            agregats[3] = max(agregats[3], agregats_autre[3])
+        self.plages.extend(autre.get_plages())
+        # Requêtes d'une même seconde réparties entre les deux états
+        for seconde, requetes in autre.get_secondes_bordure().items():
+            total = requetes + self._requetes_par_seconde.get(seconde, 0) \
+                + self.secondes_bordure.get(seconde, 0)
+            self.secondes_bordure[seconde] = self.secondes_bordure.get(seconde, 0) + requetes
+            agregats = self.intervalles[seconde - seconde % self._duree_intervalle]
+            agregats[3] = max(agregats[3], total)
+
+    def get_definition_normalisation(self) -> Optional[dict]:
+        """
+        Retourne la définition de la normalisation des urls de l'état.
+
+        Returns:
+            Optional[dict]: La définition (voir :meth:`NormaliseurUrls.get_dict`), ou
+            ``None`` si les urls brutes sont comptées.
+        """
+        return self.normaliseur_urls.get_dict() if self.normaliseur_urls is not None else None
+
+    def get_secondes_bordure(self) -> dict:
+        """
+        Retourne le nombre de requêtes des secondes de l'état qui peuvent être
+        partagées avec un autre état : les secondes de la première et de la dernière
+        entrée ajoutée, et celles des états fusionnés.
+
+        Returns:
+            dict: Le nombre de requêtes de chaque seconde (depuis l'epoch).
+        """
+        secondes = dict(self.secondes_bordure)
+        for seconde in set(self._secondes_extremes):
+            secondes[seconde] = secondes.get(seconde, 0) + self._requetes_par_seconde[seconde]
+        return secondes
+
+    def get_plages(self) -> list:
+        """
+        Retourne la première et la dernière seconde des entrées de chaque état
+        fusionné, y compris celles des entrées ajoutées à cet état.
+
+        Returns:
+            list: Les plages ``[debut, fin]`` en secondes depuis l'epoch.
+        """
+        plages = [list(plage) for plage in self.plages]
+        if self._requetes_par_seconde:
+            plages.append([min(self._requetes_par_seconde), max(self._requetes_par_seconde)])
+        return plages
+
+    def get_precisions(self) -> dict:
+        """
+        Retourne la précision des valeurs de l'analyse qui peuvent être approchées
+        après une fusion.
+
+        Le pic de requêtes par seconde est une borne inférieure dès que les plages de
+        deux états fusionnés se chevauchent au-delà d'une seconde commune. Le total
+        d'une url est une estimation par excès dès que le :class:`CompteurBorne` des
+        urls a dû écarter une url.
+
+        Returns:
+            dict: Un dictionnaire contenant :
+                - pic_requetes_par_seconde: ``exact`` ou ``borne_inferieure``.
+                - top_urls: ``exact`` ou ``estimation``.
+        """
+        chevauchement = False
+        fin_maximale = None
+        for debut, fin in sorted(self.get_plages()):
+            if fin_maximale is not None and debut < fin_maximale:
+                chevauchement = True
+                break
+            fin_maximale = fin if fin_maximale is None else max(fin_maximale, fin)
+        estimation = any(erreur for _, _, erreur in self.urls.get_top())
+        return {
+            "pic_requetes_par_seconde": "borne_inferieure" if chevauchement else "exact",
+            "top_urls": "estimation" if estimation else "exact"
+        }
+
+    def _get_series_temporelles(self) -> dict:
+        """
+        Retourne les séries temporelles calculées à partir des agrégats par intervalle.
+
+        Returns:
+            dict: Les séries temporelles, voir :meth:`SeriesTemporelles.calcule`.
+        """
+        debuts = sorted(self.intervalles)
+        agregats = np.array([self.intervalles[debut] for debut in debuts],
+                            dtype=np.int64).reshape(-1, 4)
+        return SeriesTemporelles(self.granularite).calcule_par_intervalle(
+            np.array(debuts, dtype=np.int64), agregats
+        )
+
+    def get_analyse_complete(self, nombre_par_top: int = 3) -> dict:
+        """
+        Retourne l'analyse complète correspondant à l'état.
+
+        L'analyse suit la structure de :meth:`AnalyseurLogApache.get_analyse_complete`,
+        à l'exception de la clé ``chemin`` qui est remplacée par ``chemins``, la liste
+        des chemins absolus des fichiers analysés, et de la clé ``precisions``
+        (voir :meth:`get_precisions`).
+
+        Args:
+            nombre_par_top (int): Le nombre maximal d'éléments à inclure dans
+                les statistiques des classements (tops). Par défaut, sa valeur est égale à ``3``.
+
+        Returns:
+            dict: L'analyse sous forme d'un dictionnaire.
+
+        Raises:
+            TypeError: Le paramètre ``nombre_par_top`` n'est pas un entier.
+            ValueError: Le paramètre ``nombre_par_top`` est inférieur à ``0``.
+        """
+        # Vérification du paramètre
+        verifie_nombre_par_top(nombre_par_top)
+
+        return {
+            "chemins": list(self.chemins),
+            "total_entrees": self.total_entrees,
+            "filtre": self.filtre.get_dict_filtre(),
+            "precisions": self.get_precisions(),
+            "statistiques": {
+                "total_entrees_filtre": self.total_entrees_filtre,
+                "requetes": {
+                    "top_urls": [
+                        {"url": url, "total": total,
+                         "taux": total / self.total_entrees_filtre * 100}
+                        for url, total, _ in self.urls.get_top(nombre_par_top)
+                    ],
+                },
+                "reponses": {
+                    "repartition_code_statut_http": self.reponses.get_repartition_codes(
+                        self.total_entrees_filtre
+                    ),
+                    "taille_octets": self.reponses.get_statistiques_quantiles("taille_octets"),
+                    "temps_reponse": self.reponses.get_statistiques_quantiles("temps_reponse")
+                },
+                "series_temporelles": self._get_series_temporelles(),
+                "groupements": self.moteur_groupement.get_groupements()
+                               if self.moteur_groupement.specifications else []
+            }
+        }
+
+    def get_total_par_code_statut_http_camembert(self) -> list:
+        """
+        Retourne la répartition des réponses par code de statut http sous un format
+        utilisable par un camembert, voir
+        :meth:`AnalyseurLogApache.get_total_par_code_statut_http_camembert`.
+
+        Returns:
+            list: Une liste de listes ``[code, total]``.
+        """
+        return [
+            [statistique["code"], statistique["total"]]
+            for statistique in self.reponses.get_repartition_codes(self.total_entrees_filtre)
+        ]
+
+    def get_dict(self) -> dict:
+        """
+        Retourne l'état sous forme d'un dictionnaire sérialisable en JSON.
+
+        Returns:
+            dict: L'état partiel, avec les compteurs sous forme de listes
+                ``[valeur, total]`` pour conserver l'ordre de première apparition.
+        """
+        debuts = sorted(self.intervalles)
+        return {
+            "version": self.VERSION,
+            "filtre": self.filtre.get_dict_filtre(),
+            "granularite": self.granularite,
+            "normalisation_urls": self.get_definition_normalisation(),
+            "chemins": list(self.chemins),
+            "total_entrees": self.total_entrees,
+            "total_entrees_filtre": self.total_entrees_filtre,
+            "urls": self.urls.get_dict(),
+            **self.reponses.get_dict(),
+            "intervalles": {
+                "debuts": debuts,
+                "agregats": [self.intervalles[debut] for debut in debuts]
+            },
+            "secondes_bordure": sorted(self.get_secondes_bordure().items()),
+            "plages": self.get_plages(),
+            "groupements": self.moteur_groupement.get_dict()
+        }
+
+    @classmethod
+    def depuis_dict(cls, etat: dict) -> "EtatPartielAnalyse":
+        """
+        Reconstruit un état partiel à partir du dictionnaire retourné par :meth:`get_dict`.
+
+        Args:
+            etat (dict): L'état partiel sérialisé.
+
+        Returns:
+            EtatPartielAnalyse: L'état reconstruit.
+
+        Raises:
+            EtatPartielException: L'état est invalide ou sa version n'est pas supportée.
+        """
+        if not isinstance(etat, dict):
+            raise EtatPartielException("Un état partiel doit être un dictionnaire.")
+        if etat.get("version") != cls.VERSION:
+            raise EtatPartielException(
+                f"La version de l'état partiel ({etat.get('version')}) n'est pas "
+                f"supportée, la version attendue est {cls.VERSION}."
+            )
+        try:
+            moteur_groupement = MoteurGroupement.depuis_dict(etat["groupements"])
+            normalisation_urls = etat["normalisation_urls"]
+            etat_partiel = cls(FiltreLogApache.depuis_dict(etat["filtre"]),
+                               etat["granularite"],
+                               moteur_groupement.specifications,
+                               NormaliseurUrls.depuis_dict(normalisation_urls)
+                               if normalisation_urls is not None else None)
+            etat_partiel.moteur_groupement = moteur_groupement
+            etat_partiel.chemins = list(etat["chemins"])
+            etat_partiel.total_entrees = etat["total_entrees"]
+            etat_partiel.total_entrees_filtre = etat["total_entrees_filtre"]
+            etat_partiel.urls = CompteurBorne.depuis_dict(etat["urls"])
+            etat_partiel.reponses = StatistiquesReponses.depuis_dict(etat)
+            if any(len(agregats) != 4 for agregats in etat["intervalles"]["agregats"]):
+                raise ValueError("Les agrégats d'un intervalle doivent contenir 4 valeurs.")
+            etat_partiel.intervalles = {
+                debut: list(agregats)
+                for debut, agregats in zip(etat["intervalles"]["debuts"],
+                                           etat["intervalles"]["agregats"])
+            }
+            etat_partiel.secondes_bordure = dict(etat["secondes_bordure"])
+            if any(len(plage) != 2 for plage in etat["plages"]):
+                raise ValueError("Une plage doit contenir une seconde de début et de fin.")
+            etat_partiel.plages = [list(plage) for plage in etat["plages"]]
+        except (KeyError, TypeError, ValueError) as ex:
+            raise EtatPartielException(f"L'état partiel est invalide : {ex}") from ex
+        return etat_partiel
+
+    @classmethod
+    def charge(cls, chemin_fichier: str) -> "EtatPartielAnalyse":
+        """
+        Lit un état partiel depuis un fichier JSON contenant le dictionnaire retourné
+        par :meth:`get_dict`.
+
+        Args:
+            chemin_fichier (str): Le chemin du fichier à lire.
+
+        Returns:
+            EtatPartielAnalyse: L'état partiel lu.
+
+        Raises:
+            EtatPartielException: Le fichier est introuvable ou son contenu est invalide.
+        """
+        try:
+            with open(chemin_fichier, "r", encoding="utf-8") as fichier:
+                etat = load(fichier)
+        except (OSError, JSONDecodeError) as ex:
+            raise EtatPartielException(
+                f"Impossible de lire l'état partiel {chemin_fichier} : {ex}"
+            ) from ex
+        return cls.depuis_dict(etat)
+
+    @classmethod
+    def fusionne_fichiers(cls, chemins_fichiers: list) -> "EtatPartielAnalyse":
+        """
+        Lit puis fusionne plusieurs états partiels, dans l'ordre des fichiers.
+
+        Args:
+            chemins_fichiers (list): Les chemins des fichiers à fusionner.
+
+        Returns:
+            EtatPartielAnalyse: L'état fusionné.
+
+        Raises:
+            EtatPartielException: Un fichier est invalide ou les états ne sont pas
+                compatibles entre eux.
+        """
+        if not chemins_fichiers:
+            raise EtatPartielException("Au moins un état partiel doit être fourni.")
+        etat_fusionne = cls.charge(chemins_fichiers[0])
+        for chemin_fichier in chemins_fichiers[1:]:
+            try:
+                etat_fusionne.fusionne(cls.charge(chemin_fichier))
+            except ValueError as ex:
+                raise EtatPartielException(
+                    f"L'état partiel {chemin_fichier} ne peut pas être fusionné : {ex}"
+                ) from ex
+        return etat_fusionne
+
+
+class EtatPartielException(Exception):
+    """
+    Représente une erreur lors de la lecture, de l'écriture ou de la fusion
+    d'états partiels d'analyse.
+    """
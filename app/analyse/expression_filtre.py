@@ -0,0 +1,808 @@
+"""
+Module pour le langage d'expressions de filtre des entrées d'un fichier log Apache.
+"""
+
+import operator
+import re
+from datetime import datetime, timezone
+from ipaddress import ip_network
+from typing import Callable, Optional, Union
+import numpy as np
+from pandas import DataFrame, Series
+from analyse.index_ip import IndexIP
+
+
+class ExpressionFiltreInvalideException(ValueError):
+    """
+    Représente une erreur lorsque une expression de filtre est syntaxiquement
+    invalide ou utilise un champ, un opérateur ou une valeur incompatible.
+    """
+
+
+class _Comparaison:
+    """
+    Représente une comparaison entre un champ d'une entrée et une ou plusieurs valeurs,
+    par exemple ``code = 5xx``, ``ip in (10.0.0.0/8, ::1)`` ou ``ip in @liste.txt``.
+
+    Une valeur absente dans une entrée (par exemple une taille ``-``) ne satisfait
+    aucune comparaison.
+
+    Attributes:
+        champ (str): Le nom du champ comparé.
+        operateur (str): L'opérateur de comparaison.
+        valeurs (list): Les valeurs converties dans le type du champ.
+        fichiers_autorises (bool): Indique si une liste d'adresses IP peut être lue
+            depuis un fichier (valeur ``@chemin``).
+        litterale (bool): Indique si les valeurs sont comparées telles quelles, sans
+            réseau CIDR ni liste d'adresses IP ``@chemin``.
+        _repartition (Optional[tuple]): Les valeurs exactes, l'index des réseaux IP
+            et les classes de codes, calculés lors du premier besoin.
+    """
+
+    OPERATEURS_ORDRE: dict = {
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge
+    }
+
+    def __init__(self,
+                 champ: str,
+                 operateur: str,
+                 valeurs: list,
+                 fichiers_autorises: bool = True,
+                 litterale: bool = False):
+        """
+        Initialise une comparaison et convertit ses valeurs dans le type du champ.
+
+        Args:
+            champ (str): Le nom du champ (voir :attr:`ExpressionFiltre.CHAMPS`).
+            operateur (str): L'opérateur de comparaison.
+            valeurs (list): Les valeurs comparées.
+            fichiers_autorises (bool): Indique si une liste d'adresses IP peut être lue
+                depuis un fichier (valeur ``@chemin``). Par défaut, ``True``.
+            litterale (bool): Indique si les valeurs sont comparées telles quelles, sans
+                réseau CIDR ni liste d'adresses IP ``@chemin``. Par défaut, ``False``.
+
+        Raises:
+            ExpressionFiltreInvalideException: Le champ, l'opérateur ou une valeur
+                est invalide.
+        """
+        if champ not in ExpressionFiltre.CHAMPS:
+            raise ExpressionFiltreInvalideException(
+                f"Le champ '{champ}' est inconnu. Les champs disponibles sont : "
+                f"{', '.join(ExpressionFiltre.CHAMPS)}."
+            )
+        type_champ = ExpressionFiltre.CHAMPS[champ][0]
+        if operateur not in ExpressionFiltre.OPERATEURS[type_champ]:
+            raise ExpressionFiltreInvalideException(
+                f"L'opérateur '{operateur}' n'est pas utilisable avec le champ '{champ}'."
+            )
+        if operateur in ("~", "^=") + tuple(self.OPERATEURS_ORDRE) and len(valeurs) != 1:
+            raise ExpressionFiltreInvalideException(
+                f"L'opérateur '{operateur}' n'accepte qu'une seule valeur."
+            )
+
+        self.champ = champ
+        self.operateur = operateur
+        self.fichiers_autorises = fichiers_autorises
+        self.litterale = litterale
+        self.valeurs = [self._convertit_valeur(valeur) for valeur in valeurs]
+        self._repartition = None
+
+    def _convertit_valeur(self, valeur: Union[str, int]):
+        """
+        Convertit une valeur de l'expression dans le type du champ comparé.
+
+        Args:
+            valeur (Union[str, int]): La valeur à convertir.
+
+        Returns:
+            any: Un texte, un réseau IP, une liste de réseaux IP lue depuis un fichier
+                (valeur ``@chemin``), un motif compilé, un entier, une classe de codes
+                (tuple ``("classe", centaine)``) ou un horodatage en secondes.
+
+        Raises:
+            ExpressionFiltreInvalideException: La valeur est invalide pour le champ.
+        """
+        type_champ = ExpressionFiltre.CHAMPS[self.champ][0]
+        texte = str(valeur)
+        try:
+            if self.operateur == "~":
+                return re.compile(texte)
+            if type_champ == "texte":
+                if self.champ == "ip" and not self.litterale \
+                        and self.operateur in ("=", "!=", "in") \
+                        and (texte.startswith("@") or "/" in texte):
+                    if texte.startswith("@") and not self.fichiers_autorises:
+                        # Le contenu du fichier ne doit pas apparaître dans l'erreur
+                        raise ExpressionFiltreInvalideException(
+                            f"Les listes d'adresses IP lues depuis un fichier ne sont "
+                            f"pas autorisées pour le champ '{self.champ}'."
+                        )
+                    return IndexIP.lit_fichier(texte[1:]) if texte.startswith("@") \
+                        else ip_network(texte, strict=False)
+                return texte
+            if type_champ == "entier":
+                if (self.champ == "code" and self.operateur in ("=", "!=", "in")
+                        and re.fullmatch(r"[1-5]xx", texte, re.IGNORECASE)):
+                    return ("classe", int(texte[0]))
+                return int(texte)
+            # Date au format ISO 8601, en UTC si aucun fuseau n'est indiqué
+            date = datetime.fromisoformat(texte[:-1] + "+00:00" if texte.endswith("Z")
+                                          else texte)
+            if date.tzinfo is None:
+                date = date.replace(tzinfo=timezone.utc)
+            return date.timestamp()
+        except (re.error, ValueError, OSError) as ex:
+            raise ExpressionFiltreInvalideException(
+                f"La valeur '{texte}' est invalide pour le champ '{self.champ}' : {ex}"
+            ) from ex
+
+    def _repartit_valeurs(self) -> tuple:
+        """
+        Sépare les valeurs d'une égalité (ou d'un ensemble) en valeurs exactes,
+        en réseaux IP et en classes de codes. Tous les réseaux sont regroupés dans
+        un seul :class:`IndexIP`, construit une seule fois.
+
+        Returns:
+            tuple: L'ensemble des valeurs exactes, l'index des réseaux (``None`` sans
+                réseau) et l'ensemble des centaines des classes de codes.
+        """
+        if self._repartition is None:
+            exactes, reseaux, centaines = set(), [], set()
+            for valeur in self.valeurs:
+                if isinstance(valeur, tuple):
+                    centaines.add(valeur[1])
+                elif isinstance(valeur, list):
+                    reseaux.extend(valeur)
+                elif hasattr(valeur, "network_address"):
+                    reseaux.append(valeur)
+                else:
+                    exactes.add(valeur)
+            self._repartition = (exactes, IndexIP(reseaux) if reseaux else None, centaines)
+        return self._repartition
+
+    def _get_test_valeur(self) -> Callable:
+        """
+        Retourne la fonction qui teste une valeur (non absente) du champ.
+
+        Returns:
+            Callable: Une fonction qui prend la valeur du champ et retourne un booléen.
+        """
+        if self.operateur == "~":
+            motif = self.valeurs[0]
+            return lambda valeur: motif.search(valeur) is not None
+        if self.operateur == "^=":
+            prefixe = self.valeurs[0]
+            return lambda valeur: valeur.startswith(prefixe)
+        if self.operateur in self.OPERATEURS_ORDRE:
+            comparaison, reference = self.OPERATEURS_ORDRE[self.operateur], self.valeurs[0]
+            return lambda valeur: comparaison(valeur, reference)
+
+        exactes, index_reseaux, centaines = self._repartit_valeurs()
+
+        def appartient(valeur) -> bool:
+            if valeur in exactes:
+                return True
+            if centaines and valeur // 100 in centaines:
+                return True
+            return index_reseaux is not None and index_reseaux.contient(valeur)
+
+        if self.operateur == "!=":
+            return lambda valeur: not appartient(valeur)
+        if index_reseaux is None and not centaines and len(exactes) == 1:
+            reference = next(iter(exactes))
+            return lambda valeur: valeur == reference
+        return appartient
+
+    def get_predicat(self) -> Callable:
+        """
+        Compile la comparaison en une fonction spécialisée qui teste une entrée.
+
+        Returns:
+            Callable: Une fonction qui prend une :class:`EntreeLogApache` et retourne
+                ``True`` si l'entrée satisfait la comparaison.
+        """
+        extracteur = ExpressionFiltre.CHAMPS[self.champ][1]
+        exactes, index_reseaux, centaines = self._repartit_valeurs()
+        # Égalité simple : une valeur absente (None) n'est jamais égale
+        if self.operateur == "=" and len(exactes) == 1 and index_reseaux is None \
+                and not centaines:
+            reference = next(iter(exactes))
+            return lambda entree: extracteur(entree) == reference
+        # Classe de codes seule (ex: 5xx)
+        if self.operateur == "=" and not exactes and len(centaines) == 1:
+            centaine = next(iter(centaines))
+            minimum, maximum = centaine * 100, centaine * 100 + 100
+            return lambda entree: minimum <= extracteur(entree) < maximum
+
+        teste = self._get_test_valeur()
+
+        def predicat(entree) -> bool:
+            valeur = extracteur(entree)
+            return valeur is not None and teste(valeur)
+        return predicat
+
+    def get_contraintes_egalite(self) -> dict:
+        """
+        Retourne les valeurs exactes qu'impose la comparaison à son champ, utilisables
+        par un index inversé (voir :class:`IndexInverseEntrees`).
+
+        Returns:
+            dict: ``{champ: ensemble des valeurs acceptées}`` pour une égalité ou un
+                ensemble de valeurs exactes, un dictionnaire vide sinon.
+        """
+        exactes, index_reseaux, centaines = self._repartit_valeurs()
+        if self.operateur in ("=", "in") and index_reseaux is None and not centaines:
+            return {self.champ: set(exactes)}
+        return {}
+
+    def get_masque(self, donnees: DataFrame) -> np.ndarray:
+        """
+        Calcule la comparaison de manière vectorisée sur un tableau d'entrées
+        (voir :meth:`AnalyseurLogApachePandas.construit_donnees`). Pour un champ
+        textuel, le test n'est évalué qu'une fois par valeur distincte.
+
+        Args:
+            donnees (DataFrame): Le tableau des entrées.
+
+        Returns:
+            np.ndarray: Un tableau de booléens, un par ligne.
+        """
+        type_champ, _, nom_colonne = ExpressionFiltre.CHAMPS[self.champ]
+        colonne = donnees[nom_colonne]
+        if type_champ == "texte":
+            return self._get_masque_categories(colonne)
+
+        presentes = colonne.notna().to_numpy(dtype=bool)
+        valeurs = colonne.to_numpy(dtype=np.float64, na_value=0)
+        if self.operateur in self.OPERATEURS_ORDRE:
+            return presentes & self.OPERATEURS_ORDRE[self.operateur](valeurs, self.valeurs[0])
+        exactes, _, centaines = self._repartit_valeurs()
+        masque = np.isin(valeurs, list(exactes))
+        if centaines:
+            masque |= np.isin(valeurs // 100, list(centaines))
+        if self.operateur == "!=":
+            masque = ~masque
+        return presentes & masque
+
+    def _get_masque_categories(self, colonne: Series) -> np.ndarray:
+        """
+        Calcule le masque d'un champ textuel en testant chaque catégorie une seule fois.
+
+        Args:
+            colonne (Series): La colonne du champ.
+
+        Returns:
+            np.ndarray: Un tableau de booléens, un par ligne.
+        """
+        if colonne.dtype != "category":
+            colonne = colonne.astype("category")
+        categories = colonne.cat.categories
+        teste = self._get_test_valeur()
+        # La dernière case correspond au code -1 d'une valeur absente
+        resultats = np.fromiter((bool(teste(categorie)) for categorie in categories),
+                                dtype=bool, count=len(categories))
+        return np.append(resultats, False)[colonne.cat.codes.to_numpy()]
+
+
+class _Conjonction:
+    """
+    Représente une conjonction (``et``) de sous-expressions.
+
+    Attributes:
+        enfants (list): Les sous-expressions.
+    """
+
+    def __init__(self, enfants: list):
+        self.enfants = enfants
+
+    def get_predicat(self) -> Callable:
+        """
+        Compile la conjonction en une fonction qui teste une entrée.
+
+        Returns:
+            Callable: La fonction compilée.
+        """
+        predicats = [enfant.get_predicat() for enfant in self.enfants]
+        if not predicats:
+            return lambda entree: True
+        if len(predicats) == 1:
+            return predicats[0]
+        if len(predicats) == 2:
+            premier, second = predicats
+            return lambda entree: premier(entree) and second(entree)
+        return lambda entree: all(predicat(entree) for predicat in predicats)
+
+    def get_contraintes_egalite(self) -> dict:
+        """
+        Retourne les valeurs exactes imposées par les sous-expressions. Lorsque
+        plusieurs sous-expressions contraignent le même champ, seules les valeurs
+        communes sont conservées.
+
+        Returns:
+            dict: ``{champ: ensemble des valeurs acceptées}``.
+        """
+        contraintes = {}
+        for enfant in self.enfants:
+            for champ, valeurs in enfant.get_contraintes_egalite().items():
+                contraintes[champ] = contraintes[champ] & valeurs if champ in contraintes \
+                    else valeurs
+        return contraintes
+
+    def get_masque(self, donnees: DataFrame) -> np.ndarray:
+        """
+        Calcule la conjonction de manière vectorisée.
+
+        Args:
+            donnees (DataFrame): Le tableau des entrées.
+
+        Returns:
+            np.ndarray: Un tableau de booléens, un par ligne.
+        """
+        masque = np.ones(len(donnees), dtype=bool)
+        for enfant in self.enfants:
+            masque &= enfant.get_masque(donnees)
+        return masque
+
+
+class _Disjonction:
+    """
+    Représente une disjonction (``ou``) de sous-expressions.
+
+    Attributes:
+        enfants (list): Les sous-expressions.
+    """
+
+    def __init__(self, enfants: list):
+        self.enfants = enfants
+
+    def get_predicat(self) -> Callable:
+        """
+        Compile la disjonction en une fonction qui teste une entrée.
+
+        Returns:
+            Callable: La fonction compilée.
+        """
+        predicats = [enfant.get_predicat() for enfant in self.enfants]
+        if len(predicats) == 2:
+            premier, second = predicats
+            return lambda entree: premier(entree) or second(entree)
+        return lambda entree: any(predicat(entree) for predicat in predicats)
+
+    def get_contraintes_egalite(self) -> dict:
+        """
+        Retourne les valeurs exactes imposées à chaque champ. Une disjonction n'en
+        impose aucune.
+
+        Returns:
+            dict: Un dictionnaire vide.
+        """
+        return {}
+
+    def get_masque(self, donnees: DataFrame) -> np.ndarray:
+        """
+        Calcule la disjonction de manière vectorisée.
+
+        Args:
+            donnees (DataFrame): Le tableau des entrées.
+
+        Returns:
+            np.ndarray: Un tableau de booléens, un par ligne.
+        """
+        masque = np.zeros(len(donnees), dtype=bool)
+        for enfant in self.enfants:
+            masque |= enfant.get_masque(donnees)
+        return masque
+
+
+class _Negation:
+    """
+    Représente la négation (``non``) d'une sous-expression.
+
+    Attributes:
+        enfant (any): La sous-expression.
+    """
+
+    def __init__(self, enfant):
+        self.enfant = enfant
+
+    def get_predicat(self) -> Callable:
+        """
+        Compile la négation en une fonction qui teste une entrée.
+
+        Returns:
+            Callable: La fonction compilée.
+        """
+        predicat = self.enfant.get_predicat()
+        return lambda entree: not predicat(entree)
+
+    def get_contraintes_egalite(self) -> dict:
+        """
+        Retourne les valeurs exactes imposées à chaque champ. Une négation n'en
+        impose aucune.
+
+        Returns:
+            dict: Un dictionnaire vide.
+        """
+        return {}
+
+    def get_masque(self, donnees: DataFrame) -> np.ndarray:
+        """
+        Calcule la négation de manière vectorisée.
+
+        Args:
+            donnees (DataFrame): Le tableau des entrées.
+
+        Returns:
+            np.ndarray: Un tableau de booléens, un par ligne.
+        """
+        return ~self.enfant.get_masque(donnees)
+
+
+class ExpressionFiltre:
+    """
+    Représente une expression de filtre compilée une seule fois, soit en une fonction
+    spécialisée appliquée à chaque entrée, soit en un masque vectorisé sur un tableau
+    d'entrées.
+
+    Syntaxe :
+        - Comparaison : ``champ opérateur valeur``, par exemple ``methode = POST``,
+          ``code = 5xx``, ``ip = 10.0.0.0/8``, ``url ^= /api``, ``agent ~ "bot|crawl"``,
+          ``taille > 10000`` ou ``date >= 2025-03-05T16:00:00+01:00``.
+        - Ensemble de valeurs : ``champ in (valeur, valeur, ...)``, par exemple
+          ``methode in (GET, HEAD)`` ou ``code in (4xx, 500)``.
+        - Liste d'adresses IP et de réseaux CIDR lue depuis un fichier (un élément
+          par ligne, voir :class:`IndexIP`) : ``ip in @chemin``, par exemple
+          ``ip in @robots.txt et non ip in @internes.txt``.
+        - Combinaisons : ``et``/``and``, ``ou``/``or``, ``non``/``not`` et parenthèses.
+        - Les valeurs contenant des espaces ou des caractères spéciaux s'écrivent entre
+          guillemets doubles (``\\"`` pour un guillemet).
+
+    Opérateurs : ``=``, ``!=``, ``in`` pour tous les champs textuels et entiers,
+    ``^=`` (préfixe) et ``~`` (expression régulière) pour les champs textuels,
+    ``<``, ``<=``, ``>``, ``>=`` pour les champs entiers et la date.
+
+    Attributes:
+        texte (str): La forme textuelle de l'expression.
+        fichiers_autorises (bool): Indique si les listes d'adresses IP ``@chemin``
+            sont lues depuis le disque.
+        _racine (any): La racine de l'arbre syntaxique.
+        _predicat (Optional[Callable]): La fonction compilée, créée lors du premier besoin.
+
+    Class-level variables:
+        :cvar CHAMPS (dict): Les champs disponibles avec leur type, la fonction qui
+            extrait leur valeur depuis une :class:`EntreeLogApache` et le nom de leur
+            colonne dans un tableau d'entrées.
+        :cvar OPERATEURS (dict): Les opérateurs autorisés pour chaque type de champ.
+    """
+
+    CHAMPS: dict = {
+        "ip": ("texte", lambda entree: entree.client.adresse_ip, "ip"),
+        "agent": ("texte", lambda entree: entree.client.agent_utilisateur, "agent"),
+        "methode": ("texte", lambda entree: entree.requete.methode_http, "methode"),
+        "url": ("texte", lambda entree: entree.requete.url, "url"),
+        "protocole": ("texte", lambda entree: entree.requete.protocole_http, "protocole"),
+        "referent": ("texte", lambda entree: entree.requete.ancienne_url, "referent"),
+        "vhost": ("texte", lambda entree: entree.requete.hote_virtuel, "vhost"),
+        "code": ("entier", lambda entree: entree.reponse.code_statut_http, "code"),
+        "taille": ("entier", lambda entree: entree.reponse.taille_octets, "taille"),
+        "temps": ("entier", lambda entree: entree.reponse.temps_reponse, "temps"),
+        "date": ("date", lambda entree: entree.requete.horodatage.timestamp(), "secondes")
+    }
+
+    OPERATEURS: dict = {
+        "texte": ("=", "!=", "in", "^=", "~"),
+        "entier": ("=", "!=", "in", "<", "<=", ">", ">="),
+        "date": ("=", "!=", "<", "<=", ">", ">=")
+    }
+
+    _MOTIF_JETON = re.compile(
+        r'\s*(?:(?P<ponctuation>[(),])'
+        r'|(?P<operateur>!=|<=|>=|\^=|==|=|<|>|~)'
+        r'|"(?P<chaine>(?:[^"\\]|\\.)*)"'
+        r'|(?P<mot>[^\s(),"=!<>~^]+))'
+    )
+
+    _MOTS_CLES: dict = {
+        "et": "et", "and": "et",
+        "ou": "ou", "or": "ou",
+        "non": "non", "not": "non",
+        "in": "in", "dans": "in"
+    }
+
+    def __init__(self, texte: str, fichiers_autorises: bool = True):
+        """
+        Analyse une expression de filtre.
+
+        Args:
+            texte (str): L'expression à analyser.
+            fichiers_autorises (bool): Indique si les listes d'adresses IP ``@chemin``
+                sont lues depuis le disque. Si ``False`` (par exemple pour une
+                expression reçue par le réseau), elles rendent l'expression invalide.
+                Par défaut, ``True``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ExpressionFiltreInvalideException: L'expression est invalide.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(texte, str):
+            raise TypeError("Une expression de filtre doit être une chaîne de caractères.")
+        if not isinstance(fichiers_autorises, bool):
+            raise TypeError("L'autorisation des fichiers doit être un booléen.")
+
+        self.texte = texte
+        self.fichiers_autorises = fichiers_autorises
+        self._jetons = self._decoupe(texte)
+        self._position = 0
+        self._racine = self._analyse_disjonction()
+        if self._position < len(self._jetons):
+            raise ExpressionFiltreInvalideException(
+                f"Jeton inattendu '{self._jetons[self._position][1]}' dans l'expression "
+                f"'{texte}'."
+            )
+        del self._jetons
+        self._predicat = None
+
+    @classmethod
+    def _depuis_racine(cls, racine, texte: str) -> "ExpressionFiltre":
+        """
+        Crée une expression à partir d'un arbre syntaxique déjà construit.
+
+        Args:
+            racine (any): La racine de l'arbre syntaxique.
+            texte (str): La forme textuelle de l'expression.
+
+        Returns:
+            ExpressionFiltre: L'expression.
+        """
+        expression = cls.__new__(cls)
+        expression.texte = texte
+        expression.fichiers_autorises = True
+        expression._racine = racine
+        expression._predicat = None
+        return expression
+
+    @classmethod
+    def egalite(cls, champ: str, valeur: Union[str, int]) -> "ExpressionFiltre":
+        """
+        Crée l'expression ``champ = valeur`` sans passer par l'analyse syntaxique.
+        La valeur est comparée telle quelle : une adresse IP n'est jamais lue comme
+        un réseau CIDR ou une liste ``@chemin``, réservés aux expressions.
+
+        Args:
+            champ (str): Le nom du champ.
+            valeur (Union[str, int]): La valeur attendue.
+
+        Returns:
+            ExpressionFiltre: L'expression.
+
+        Raises:
+            ExpressionFiltreInvalideException: Le champ ou la valeur est invalide.
+        """
+        return cls._depuis_racine(_Comparaison(champ, "=", [valeur], litterale=True),
+                                  f'{champ} = "{valeur}"')
+
+    @classmethod
+    def conjonction(cls, expressions: list) -> "ExpressionFiltre":
+        """
+        Crée la conjonction de plusieurs expressions. Sans expression, toutes les
+        entrées satisfont la conjonction.
+
+        Args:
+            expressions (list): Les expressions (:class:`ExpressionFiltre`) à combiner.
+
+        Returns:
+            ExpressionFiltre: L'expression.
+        """
+        return cls._depuis_racine(
+            _Conjonction([expression.get_racine() for expression in expressions]),
+            " et ".join(f"({expression.texte})" for expression in expressions)
+        )
+
+    def _decoupe(self, texte: str) -> list:
+        """
+        Découpe l'expression en jetons.
+
+        Args:
+            texte (str): L'expression.
+
+        Returns:
+            list: Les jetons sous la forme ``(type, valeur)``, où le type est
+                ``ponctuation``, ``operateur``, ``mot_cle``, ``mot`` ou ``chaine``.
+
+        Raises:
+            ExpressionFiltreInvalideException: Un caractère est inattendu.
+        """
+        jetons = []
+        position = 0
+        texte = texte.rstrip()
+        while position < len(texte):
+            correspondance = self._MOTIF_JETON.match(texte, position)
+            if correspondance is None:
+                raise ExpressionFiltreInvalideException(
+                    f"Caractère inattendu '{texte[position:].strip()[:1]}' à la position "
+                    f"{position} de l'expression '{texte}'."
+                )
+            position = correspondance.end()
+            type_jeton = correspondance.lastgroup
+            valeur = correspondance.group(type_jeton)
+            if type_jeton == "chaine":
+                valeur = re.sub(r"\\(.)", r"\1", valeur)
+            elif type_jeton == "operateur" and valeur == "==":
+                valeur = "="
+            elif type_jeton == "mot" and valeur.lower() in self._MOTS_CLES:
+                type_jeton, valeur = "mot_cle", self._MOTS_CLES[valeur.lower()]
+            jetons.append((type_jeton, valeur))
+        return jetons
+
+    def _jeton_courant(self) -> Optional[tuple]:
+        """
+        Retourne le jeton en cours d'analyse.
+
+        Returns:
+            Optional[tuple]: Le jeton, ou ``None`` à la fin de l'expression.
+        """
+        if self._position < len(self._jetons):
+            return self._jetons[self._position]
+        return None
+
+    def _consomme(self, type_jeton: str, valeur: Optional[str] = None) -> str:
+        """
+        Consomme le jeton courant s'il correspond au type (et à la valeur) attendu.
+
+        Args:
+            type_jeton (str): Le type attendu, ou ``valeur`` pour un mot ou une chaîne.
+            valeur (Optional[str]): La valeur attendue. Si ``None``, toute valeur
+                est acceptée.
+
+        Returns:
+            str: La valeur du jeton consommé.
+
+        Raises:
+            ExpressionFiltreInvalideException: Le jeton courant ne correspond pas.
+        """
+        jeton = self._jeton_courant()
+        types_acceptes = ("mot", "chaine") if type_jeton == "valeur" else (type_jeton,)
+        if jeton is None or jeton[0] not in types_acceptes \
+                or (valeur is not None and jeton[1] != valeur):
+            attendu = valeur if valeur is not None else type_jeton
+            trouve = "la fin de l'expression" if jeton is None else f"'{jeton[1]}'"
+            raise ExpressionFiltreInvalideException(
+                f"'{attendu}' attendu mais {trouve} trouvé dans l'expression '{self.texte}'."
+            )
+        self._position += 1
+        return jeton[1]
+
+    def _analyse_disjonction(self):
+        """
+        Analyse ``conjonction (ou conjonction)*``.
+
+        Returns:
+            any: Le noeud de l'arbre syntaxique.
+        """
+        enfants = [self._analyse_conjonction()]
+        while self._jeton_courant() == ("mot_cle", "ou"):
+            self._position += 1
+            enfants.append(self._analyse_conjonction())
+        return enfants[0] if len(enfants) == 1 else _Disjonction(enfants)
+
+    def _analyse_conjonction(self):
+        """
+        Analyse ``negation (et negation)*``.
+
+        Returns:
+            any: Le noeud de l'arbre syntaxique.
+        """
+        enfants = [self._analyse_negation()]
+        while self._jeton_courant() == ("mot_cle", "et"):
+            self._position += 1
+            enfants.append(self._analyse_negation())
+        return enfants[0] if len(enfants) == 1 else _Conjonction(enfants)
+
+    def _analyse_negation(self):
+        """
+        Analyse ``non negation | ( disjonction ) | comparaison``.
+
+        Returns:
+            any: Le noeud de l'arbre syntaxique.
+        """
+        if self._jeton_courant() == ("mot_cle", "non"):
+            self._position += 1
+            return _Negation(self._analyse_negation())
+        if self._jeton_courant() == ("ponctuation", "("):
+            self._position += 1
+            noeud = self._analyse_disjonction()
+            self._consomme("ponctuation", ")")
+            return noeud
+        return self._analyse_comparaison()
+
+    def _analyse_comparaison(self) -> _Comparaison:
+        """
+        Analyse ``champ opérateur valeur``, ``champ in ( valeur, ... )`` ou
+        ``champ in valeur``.
+
+        Returns:
+            _Comparaison: La comparaison.
+        """
+        champ = self._consomme("mot").lower()
+        if self._jeton_courant() == ("mot_cle", "in"):
+            self._position += 1
+            if self._jeton_courant() != ("ponctuation", "("):
+                return _Comparaison(champ, "in", [self._consomme("valeur")],
+                                    self.fichiers_autorises)
+            self._consomme("ponctuation", "(")
+            valeurs = [self._consomme("valeur")]
+            while self._jeton_courant() == ("ponctuation", ","):
+                self._position += 1
+                valeurs.append(self._consomme("valeur"))
+            self._consomme("ponctuation", ")")
+            return _Comparaison(champ, "in", valeurs, self.fichiers_autorises)
+        operateur = self._consomme("operateur")
+        return _Comparaison(champ, operateur, [self._consomme("valeur")],
+                            self.fichiers_autorises)
+
+    def get_racine(self):
+        """
+        Retourne la racine de l'arbre syntaxique de l'expression, par exemple pour la
+        combiner avec d'autres expressions (voir :meth:`conjonction`).
+
+        Returns:
+            any: La racine de l'arbre syntaxique.
+        """
+        return self._racine
+
+    def get_predicat(self) -> Callable:
+        """
+        Retourne la fonction spécialisée qui teste une entrée. L'expression n'est
+        compilée qu'une seule fois.
+
+        Returns:
+            Callable: Une fonction qui prend une :class:`EntreeLogApache` et retourne
+                ``True`` si l'entrée satisfait l'expression.
+        """
+        if self._predicat is None:
+            self._predicat = self._racine.get_predicat()
+        return self._predicat
+
+    def get_contraintes_egalite(self) -> dict:
+        """
+        Retourne les valeurs exactes que l'expression impose à certains champs : toute
+        entrée qui satisfait l'expression a, pour chacun de ces champs, l'une des
+        valeurs retournées. Seules les égalités et ensembles de valeurs exactes reliés
+        par ``et`` au niveau de la racine sont pris en compte.
+
+        Returns:
+            dict: ``{champ: ensemble des valeurs acceptées}``.
+        """
+        return self._racine.get_contraintes_egalite()
+
+    def get_masque(self, donnees: DataFrame) -> np.ndarray:
+        """
+        Calcule l'expression de manière vectorisée sur un tableau d'entrées
+        (voir :meth:`AnalyseurLogApachePandas.construit_donnees`).
+
+        Args:
+            donnees (DataFrame): Le tableau des entrées.
+
+        Returns:
+            np.ndarray: Un tableau de booléens, ``True`` pour chaque ligne qui
+                satisfait l'expression.
+
+        Raises:
+            TypeError: Le paramètre ``donnees`` n'est pas un DataFrame.
+        """
+        if not isinstance(donnees, DataFrame):
+            raise TypeError("Les données à filtrer doivent être de type DataFrame.")
+        return np.asarray(self._racine.get_masque(donnees), dtype=bool)
+
+    def __str__(self) -> str:
+        """
+        Retourne la forme textuelle de l'expression.
+
+        Returns:
+            str: L'expression.
+        """
+        return self.texte
@@ -0,0 +1,293 @@
+"""
+Module pour le filtre de Bloom, persistant et versionné, des clés déjà rencontrées.
+"""
+
+from hashlib import blake2b
+from math import ceil, exp, log
+from os import replace
+from struct import Struct, error as StructError
+
+
+class FiltreBloom:
+    """
+    Représente un filtre de Bloom : un ensemble approximatif de clés à mémoire fixe,
+    qui répond « jamais rencontrée » sans erreur et « déjà rencontrée » avec une
+    probabilité de faux positif de :attr:`taux_faux_positifs` tant que le nombre de
+    clés ajoutées ne dépasse pas :attr:`capacite`.
+
+    La taille du tableau de bits et le nombre de fonctions de hachage sont calculés à
+    partir de la capacité et du taux de faux positifs visé. Les positions d'une clé
+    sont obtenues par double hachage (Kirsch et Mitzenmacher) à partir d'une seule
+    empreinte BLAKE2b, stable d'une exécution à l'autre contrairement à ``hash``, ce
+    qui permet d'enregistrer le filtre puis de le relire lors d'une exécution
+    suivante.
+
+    Attributes:
+        capacite (int): Le nombre de clés prévu.
+        taux_faux_positifs (float): Le taux de faux positifs visé à pleine capacité.
+        taille_bits (int): Le nombre de bits du filtre.
+        nombre_hachages (int): Le nombre de positions de chaque clé.
+        nombre_elements (int): Le nombre de clés ajoutées qui n'étaient pas déjà
+            présentes.
+        _bits (bytearray): Le tableau de bits.
+
+    Class-level variables:
+        :cvar SIGNATURE (bytes): Les premiers octets d'un filtre enregistré.
+        :cvar VERSION (int): La version du format enregistré.
+        :cvar ENTETES (dict): L'en-tête d'un filtre enregistré de chaque version lisible :
+            signature, version, capacité, taux de faux positifs, nombre de bits, nombre
+            de hachages et nombre de clés. La version ``1`` codait le nombre de hachages
+            sur un octet, trop peu pour les taux de faux positifs très faibles.
+        :cvar ENTETE (Struct): L'en-tête de la version :attr:`VERSION`.
+    """
+
+    SIGNATURE: bytes = b"LBBF"
+
+    VERSION: int = 2
+
+    ENTETES: dict = {
+        1: Struct("<4sBQdQBQ"),
+        2: Struct("<4sBQdQIQ")
+    }
+
+    ENTETE: Struct = ENTETES[VERSION]
+
+    def __init__(self, capacite: int = 1000000, taux_faux_positifs: float = 0.01):
+        """
+        Initialise un filtre vide.
+
+        Args:
+            capacite (int): Le nombre de clés prévu. Par défaut, ``1000000``.
+            taux_faux_positifs (float): Le taux de faux positifs visé à pleine capacité.
+                Par défaut, ``0.01``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La capacité est inférieure à ``1`` ou le taux n'est pas
+                strictement compris entre ``0`` et ``1``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(capacite, int) or isinstance(capacite, bool):
+            raise TypeError("La capacité du filtre de Bloom doit être un entier.")
+        if not isinstance(taux_faux_positifs, float):
+            raise TypeError("Le taux de faux positifs doit être un nombre flottant.")
+        # Vérification de la valeur des paramètres
+        if capacite < 1:
+            raise ValueError("La capacité du filtre de Bloom doit être supérieure à 0.")
+        if not 0 < taux_faux_positifs < 1:
+            raise ValueError("Le taux de faux positifs doit être strictement compris "
+                             "entre 0 et 1.")
+
+        self.capacite = capacite
+        self.taux_faux_positifs = taux_faux_positifs
+        self.taille_bits = ceil(-capacite * log(taux_faux_positifs) / log(2) ** 2)
+        self.nombre_hachages = max(1, round(self.taille_bits / capacite * log(2)))
+        self.nombre_elements = 0
+        self._bits = bytearray((self.taille_bits + 7) // 8)
+
+    def _positions(self, cle: str):
+        """
+        Calcule les positions des bits d'une clé.
+
+        Args:
+            cle (str): La clé.
+
+        Returns:
+            range: Les positions, avant réduction modulo :attr:`taille_bits`.
+        """
+        empreinte = blake2b(cle.encode("utf-8", "surrogateescape"), digest_size=16).digest()
+        hachage_1 = int.from_bytes(empreinte[:8], "little")
+        # Un pas impair ne s'annule jamais, même si la taille est une puissance de deux
+        hachage_2 = int.from_bytes(empreinte[8:], "little") | 1
+        return range(hachage_1, hachage_1 + self.nombre_hachages * hachage_2, hachage_2)
+
+    def contient(self, cle: str) -> bool:
+        """
+        Indique si une clé a probablement déjà été ajoutée.
+
+        Args:
+            cle (str): La clé.
+
+        Returns:
+            bool: ``False`` si la clé n'a jamais été ajoutée, ``True`` si elle l'a
+            probablement été.
+
+        Raises:
+            TypeError: Le paramètre ``cle`` n'est pas une chaîne de caractères.
+        """
+        # Vérification du paramètre
+        if not isinstance(cle, str):
+            raise TypeError("La clé doit être une chaîne de caractères.")
+
+        bits = self._bits
+        taille_bits = self.taille_bits
+        for position in self._positions(cle):
+            position %= taille_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def ajoute(self, cle: str) -> bool:
+        """
+        Ajoute une clé et indique, avec un seul calcul de ses positions, si elle avait
+        probablement déjà été ajoutée.
+
+        Args:
+            cle (str): La clé.
+
+        Returns:
+            bool: ``False`` si la clé n'avait jamais été ajoutée, ``True`` si elle
+            l'avait probablement été.
+
+        Raises:
+            TypeError: Le paramètre ``cle`` n'est pas une chaîne de caractères.
+        """
+        # Vérification du paramètre
+        if not isinstance(cle, str):
+            raise TypeError("La clé doit être une chaîne de caractères.")
+
+        bits = self._bits
+        taille_bits = self.taille_bits
+        presente = True
+        for position in self._positions(cle):
+            position %= taille_bits
+            masque = 1 << (position & 7)
+            if not bits[position >> 3] & masque:
+                bits[position >> 3] |= masque
+                presente = False
+        if not presente:
+            self.nombre_elements += 1
+        return presente
+
+    def get_taux_faux_positifs_estime(self) -> float:
+        """
+        Retourne le taux de faux positifs attendu avec le nombre actuel de clés, qui
+        dépasse :attr:`taux_faux_positifs` lorsque la capacité est dépassée.
+
+        Returns:
+            float: Le taux de faux positifs estimé.
+        """
+        return (1 - exp(-self.nombre_hachages * self.nombre_elements
+                        / self.taille_bits)) ** self.nombre_hachages
+
+    def get_dict(self) -> dict:
+        """
+        Retourne les paramètres et l'occupation du filtre.
+
+        Returns:
+            dict: La capacité, le taux de faux positifs visé et estimé, le nombre de
+            clés et la taille du filtre en octets.
+        """
+        return {
+            "capacite": self.capacite,
+            "elements": self.nombre_elements,
+            "taux_faux_positifs": self.taux_faux_positifs,
+            "taux_faux_positifs_estime": self.get_taux_faux_positifs_estime(),
+            "octets": len(self._bits)
+        }
+
+    def get_octets(self) -> bytes:
+        """
+        Retourne le filtre sérialisé : un en-tête versionné suivi du tableau de bits.
+
+        Returns:
+            bytes: Le filtre sérialisé.
+        """
+        return self.ENTETE.pack(self.SIGNATURE, self.VERSION, self.capacite,
+                                self.taux_faux_positifs, self.taille_bits,
+                                self.nombre_hachages, self.nombre_elements) + self._bits
+
+    @classmethod
+    def depuis_octets(cls, donnees: bytes) -> "FiltreBloom":
+        """
+        Reconstruit un filtre à partir des octets retournés par :meth:`get_octets`.
+
+        Args:
+            donnees (bytes): Le filtre sérialisé.
+
+        Returns:
+            FiltreBloom: Le filtre reconstruit.
+
+        Raises:
+            FiltreBloomException: Les octets ne sont pas un filtre, sa version n'est pas
+                supportée ou il est incomplet.
+        """
+        if donnees[:len(cls.SIGNATURE)] != cls.SIGNATURE:
+            raise FiltreBloomException("Les données ne sont pas un filtre de Bloom.")
+        version = donnees[len(cls.SIGNATURE)] if len(donnees) > len(cls.SIGNATURE) else None
+        entete = cls.ENTETES.get(version)
+        if entete is None:
+            raise FiltreBloomException(
+                f"La version du filtre de Bloom ({version}) n'est pas supportée, la "
+                f"version attendue est {cls.VERSION}."
+            )
+        try:
+            (_, _, capacite, taux_faux_positifs, taille_bits,
+             nombre_hachages, nombre_elements) = entete.unpack_from(donnees)
+        except StructError as ex:
+            raise FiltreBloomException("Le filtre de Bloom est incomplet.") from ex
+        try:
+            filtre = cls(capacite, taux_faux_positifs)
+        except ValueError as ex:
+            raise FiltreBloomException(f"Le filtre de Bloom est invalide : {ex}") from ex
+        bits = donnees[entete.size:]
+        if (filtre.taille_bits, filtre.nombre_hachages) != (taille_bits, nombre_hachages) \
+                or len(bits) != len(filtre._bits):
+            raise FiltreBloomException("Le filtre de Bloom est incomplet.")
+        filtre.nombre_elements = nombre_elements
+        filtre._bits = bytearray(bits)
+        return filtre
+
+    def enregistre(self, chemin_fichier: str) -> None:
+        """
+        Enregistre le filtre dans un fichier. Le fichier est d'abord écrit sous un nom
+        temporaire puis renommé, pour qu'une interruption ne laisse jamais un filtre à
+        moitié écrit.
+
+        Args:
+            chemin_fichier (str): Le chemin du fichier.
+
+        Returns:
+            None
+
+        Raises:
+            FiltreBloomException: Le fichier ne peut pas être écrit.
+        """
+        chemin_temporaire = f"{chemin_fichier}.tmp"
+        try:
+            with open(chemin_temporaire, "wb") as fichier:
+                fichier.write(self.get_octets())
+            replace(chemin_temporaire, chemin_fichier)
+        except OSError as ex:
+            raise FiltreBloomException(
+                f"Impossible d'enregistrer le filtre de Bloom {chemin_fichier} : {ex}"
+            ) from ex
+
+    @classmethod
+    def charge(cls, chemin_fichier: str) -> "FiltreBloom":
+        """
+        Lit un filtre enregistré par :meth:`enregistre`.
+
+        Args:
+            chemin_fichier (str): Le chemin du fichier.
+
+        Returns:
+            FiltreBloom: Le filtre lu.
+
+        Raises:
+            FiltreBloomException: Le fichier est introuvable ou son contenu est invalide.
+        """
+        try:
+            with open(chemin_fichier, "rb") as fichier:
+                donnees = fichier.read()
+        except OSError as ex:
+            raise FiltreBloomException(
+                f"Impossible de lire le filtre de Bloom {chemin_fichier} : {ex}"
+            ) from ex
+        return cls.depuis_octets(donnees)
+
+
+class FiltreBloomException(Exception):
+    """
+    Représente une erreur lors de la lecture ou de l'enregistrement d'un filtre de Bloom.
+    """
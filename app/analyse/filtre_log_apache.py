@@ -2,14 +2,22 @@
 Module pour les filtres lors d'une analyse d'un fichier log Apache.
 """
 
-from typing import Optional
+from typing import Callable, Optional
+import numpy as np
+from pandas import DataFrame
 from parse.entree_log_apache import EntreeLogApache
+from analyse.expression_filtre import ExpressionFiltre, ExpressionFiltreInvalideException
 
 
 class FiltreLogApache:
     """
     Représente le filtre à appliquer lors d'une analyse d'un fichier de log Apache.
 
+    Les vérifications du filtre sont compilées une seule fois (voir
+    :class:`ExpressionFiltre`) en une fonction spécialisée, ou en un masque vectorisé
+    pour un tableau d'entrées. Elles sont recompilées lorsqu'une vérification est
+    modifiée.
+
     Attributes:
         adresse_ip (Optional[str]): L'adresse IP que doit avoir une entrée pour
             pouvoir passer le filtre. Si sa valeur est ``None``, ce filtre ne sera
@@ -17,9 +25,17 @@ class FiltreLogApache:
         code_statut_http (Optional[int]): Le code de statut http que doit avoir une entrée
             pour pouvoir passer le filtre. Si sa valeur est ``None``, ce filtre ne sera
             pas appliqué.
+        expression (Optional[str]): L'expression de filtre (voir :class:`ExpressionFiltre`)
+            que doit satisfaire une entrée pour pouvoir passer le filtre. Si sa valeur est
+            ``None``, ce filtre ne sera pas appliqué.
+        _expression_compilee (ExpressionFiltre): La conjonction compilée de toutes
+            les vérifications actives.
     """
 
-    def __init__(self, filtre_adresse_ip: Optional[str], filtre_code_statut_http: Optional[int]):
+    def __init__(self,
+                 filtre_adresse_ip: Optional[str],
+                 filtre_code_statut_http: Optional[int],
+                 expression: Optional[str] = None):
         """
         Initalise le filtre à appliquer lors d'une analyse.
 
@@ -30,21 +46,147 @@ class FiltreLogApache:
             filtre_code_statut_http (Optional[int]): Le code de statut http que doit 
                 avoir une entrée pour pouvoir passer le filtre. Si sa valeur est ``None``,
                 cette vérification ne sera pas appliqué.
+            expression (Optional[str]): L'expression de filtre que doit satisfaire une
+                entrée, par exemple ``code = 5xx et url ^= /api``. Si sa valeur est
+                ``None``, cette vérification ne sera pas appliqué.
 
         Raises:
             TypeError: Les paramètres ne sont pas du type attendu.
+            ExpressionFiltreInvalideException: L'expression est invalide.
+        """
+        self._adresse_ip = None
+        self._code_statut_http = None
+        self._expression = None
+        self._expression_compilee = None
+        # Ajout des filtres (vérifiés puis compilés par les propriétés)
+        self.adresse_ip = filtre_adresse_ip
+        self.code_statut_http = filtre_code_statut_http
+        self.expression = expression
+
+    @property
+    def adresse_ip(self) -> Optional[str]:
+        """
+        Retourne l'adresse IP que doit avoir une entrée pour passer le filtre.
+
+        Returns:
+            Optional[str]: L'adresse IP, ou ``None`` si la vérification est désactivée.
+        """
+        return self._adresse_ip
+
+    @adresse_ip.setter
+    def adresse_ip(self, adresse_ip: Optional[str]) -> None:
         """
-        # Vérification des paramètres
-        if filtre_adresse_ip is not None and not isinstance(filtre_adresse_ip, str):
+        Modifie l'adresse IP du filtre puis recompile le filtre.
+
+        Args:
+            adresse_ip (Optional[str]): La nouvelle adresse IP.
+
+        Raises:
+            TypeError: L'adresse IP n'est pas une chaîne de caractères.
+        """
+        if adresse_ip is not None and not isinstance(adresse_ip, str):
             raise TypeError("L'adresse IP dans un filtre doit être une chaîne de caractère.")
-        if (filtre_code_statut_http is not None
-            and not isinstance(filtre_code_statut_http, int)
-            or isinstance(filtre_code_statut_http, bool)):
+        self._adresse_ip = adresse_ip
+        self._compile()
+
+    @property
+    def code_statut_http(self) -> Optional[int]:
+        """
+        Retourne le code de statut http que doit avoir une entrée pour passer le filtre.
+
+        Returns:
+            Optional[int]: Le code, ou ``None`` si la vérification est désactivée.
+        """
+        return self._code_statut_http
+
+    @code_statut_http.setter
+    def code_statut_http(self, code_statut_http: Optional[int]) -> None:
+        """
+        Modifie le code de statut http du filtre puis recompile le filtre.
+
+        Args:
+            code_statut_http (Optional[int]): Le nouveau code de statut http.
+
+        Raises:
+            TypeError: Le code n'est pas un entier.
+        """
+        if (code_statut_http is not None
+            and not isinstance(code_statut_http, int)
+            or isinstance(code_statut_http, bool)):
             raise TypeError("Un code de statut http dans un filtre doit être un entier.")
+        self._code_statut_http = code_statut_http
+        self._compile()
 
-        # Ajout des filtres
-        self.adresse_ip = filtre_adresse_ip
-        self.code_statut_http = filtre_code_statut_http
+    @property
+    def expression(self) -> Optional[str]:
+        """
+        Retourne l'expression de filtre que doit satisfaire une entrée.
+
+        Returns:
+            Optional[str]: L'expression, ou ``None`` si la vérification est désactivée.
+        """
+        return self._expression
+
+    @expression.setter
+    def expression(self, expression: Optional[str]) -> None:
+        """
+        Modifie l'expression du filtre puis recompile le filtre.
+
+        Args:
+            expression (Optional[str]): La nouvelle expression.
+
+        Raises:
+            TypeError: L'expression n'est pas une chaîne de caractères.
+            ExpressionFiltreInvalideException: L'expression est invalide.
+        """
+        if expression is not None and not isinstance(expression, str):
+            raise TypeError("L'expression d'un filtre doit être une chaîne de caractère.")
+        expression_precedente = self._expression
+        self._expression = expression
+        try:
+            self._compile()
+        except ExpressionFiltreInvalideException:
+            self._expression = expression_precedente
+            raise
+
+    def _compile(self) -> None:
+        """
+        Compile la conjonction des vérifications actives du filtre.
+
+        Returns:
+            None
+        """
+        expressions = []
+        if self._adresse_ip is not None:
+            expressions.append(ExpressionFiltre.egalite("ip", self._adresse_ip))
+        if self._code_statut_http is not None:
+            expressions.append(ExpressionFiltre.egalite("code", self._code_statut_http))
+        if self._expression is not None:
+            expressions.append(ExpressionFiltre(self._expression))
+        self._expression_compilee = ExpressionFiltre.conjonction(expressions)
+
+    def get_predicat(self) -> Callable:
+        """
+        Retourne la fonction compilée qui indique si une entrée passe le filtre. Contrairement
+        à :meth:`entree_passe_filtre`, le type de l'entrée n'est pas vérifié, ce qui
+        la destine aux parcours de nombreuses entrées.
+
+        Returns:
+            Callable: Une fonction qui prend une :class:`EntreeLogApache` et retourne
+                ``True`` si l'entrée passe le filtre.
+        """
+        return self._expression_compilee.get_predicat()
+
+    def get_contraintes_egalite(self) -> dict:
+        """
+        Retourne les valeurs exactes que le filtre impose à certains champs, par exemple
+        ``{"ip": {"::1"}, "code": {404}}`` (voir
+        :meth:`ExpressionFiltre.get_contraintes_egalite`).
+
+        Returns:
+            dict: ``{champ: ensemble des valeurs acceptées}``.
+        """
+        return self._expression_compilee.get_contraintes_egalite()
 
     def entree_passe_filtre(self, entree: EntreeLogApache) -> bool:
         """
@@ -63,17 +205,29 @@ class FiltreLogApache:
         if not isinstance(entree, EntreeLogApache):
             raise TypeError("L'entrée à vérifier pour le filtre doit être de type EntreeLogApache")
 
-        # Vérification que l'entrée passe le filtre
-        # Application du filtre sur l'adresse IP si activé
-        if self.adresse_ip is not None:
-            if self.adresse_ip != entree.client.adresse_ip:
-                return False
-        # Application du filtre sur le code de statut http si activé
-        if self.code_statut_http is not None:
-            if self.code_statut_http != entree.reponse.code_statut_http:
-                return False
+        return self.get_predicat()(entree)
+
+    def get_masque(self, donnees: DataFrame) -> np.ndarray:
+        """
+        Retourne le masque des lignes d'un tableau d'entrées qui passent le filtre.
+        Le masque est calculé de manière vectorisée sur les colonnes du tableau
+        (voir :meth:`AnalyseurLogApachePandas.construit_donnees`).
+
+        Args:
+            donnees (DataFrame): Le tableau des entrées, une ligne par entrée.
+
+        Returns:
+            np.ndarray: Un tableau de booléens, ``True`` pour chaque ligne qui passe
+                le filtre.
+
+        Raises:
+            TypeError: Le paramètre ``donnees`` n'est pas un DataFrame.
+        """
+        # Vérification du paramètre
+        if not isinstance(donnees, DataFrame):
+            raise TypeError("Les données à filtrer doivent être de type DataFrame.")
 
-        return True
+        return self._expression_compilee.get_masque(donnees)
 
     def get_dict_filtre(self) -> dict:
         """
@@ -87,5 +241,37 @@ class FiltreLogApache:
         """
         return {
             "adresse_ip": self.adresse_ip,
-            "code_statut_http": self.code_statut_http
+            "code_statut_http": self.code_statut_http,
+            "expression": self.expression
         }
+
+    @classmethod
+    def depuis_dict(cls, definition: dict) -> "FiltreLogApache":
+        """
+        Crée un filtre à partir de sa définition sous forme d'un dictionnaire, au même
+        format que celui retourné par :meth:`get_dict_filtre`. Les clés absentes
+        désactivent la vérification correspondante.
+
+        Args:
+            definition (dict): La définition du filtre.
+
+        Returns:
+            FiltreLogApache: Le filtre correspondant à la définition.
+
+        Raises:
+            TypeError: La définition n'est pas un dictionnaire ou une valeur n'est pas
+                du type attendu.
+            ValueError: La définition contient une clé inconnue.
+            ExpressionFiltreInvalideException: L'expression de la définition est invalide.
+        """
+        # Vérification du paramètre
+        if not isinstance(definition, dict):
+            raise TypeError("La définition d'un filtre doit être un dictionnaire.")
+        cles_inconnues = set(definition) - {"adresse_ip", "code_statut_http", "expression"}
+        if cles_inconnues:
+            raise ValueError("La définition du filtre contient des clés inconnues : "
+                             f"{', '.join(sorted(cles_inconnues))}.")
+
+        return cls(definition.get("adresse_ip"),
+                   definition.get("code_statut_http"),
+                   definition.get("expression"))
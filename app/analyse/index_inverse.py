@@ -0,0 +1,150 @@
+"""
+Module pour les index inversés des entrées d'un fichier log Apache.
+"""
+
+from typing import Optional
+import numpy as np
+from parse.fichier_log_apache import FichierLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.expression_filtre import ExpressionFiltre
+
+
+class IndexInverseEntrees:
+    """
+    Représente des index inversés sur les entrées d'un fichier log Apache déjà parsé :
+    pour chaque champ indexé, chaque valeur est associée à la liste triée des
+    identifiants (positions) des entrées qui ont cette valeur.
+
+    Les index sont construits en un seul parcours du fichier. Un filtre dont les
+    vérifications imposent des valeurs exactes à des champs indexés (adresse IP,
+    code de statut http, égalités d'une expression) est ensuite résolu par
+    l'intersection des listes d'identifiants correspondantes, puis vérifié sur
+    les seules entrées candidates. Le coût d'une analyse filtrée devient ainsi
+    proportionnel au nombre d'entrées candidates plutôt qu'à la taille du fichier.
+
+    Attributes:
+        fichier (FichierLogApache): Le fichier indexé.
+        champs (tuple): Les champs indexés.
+        _index (dict): Pour chaque champ, le dictionnaire qui associe chaque valeur
+            au tableau trié (``uint32``) des identifiants des entrées.
+
+    Class-level variables:
+        :cvar CHAMPS_INDEXABLES (tuple): Les champs qui peuvent être indexés.
+    """
+
+    CHAMPS_INDEXABLES: tuple = ("ip", "code", "methode", "url", "protocole", "vhost")
+
+    def __init__(self,
+                 fichier_log_apache: FichierLogApache,
+                 champs: tuple = ("ip", "code", "methode")):
+        """
+        Construit les index inversés du fichier en un seul parcours de ses entrées.
+
+        Args:
+            fichier_log_apache (FichierLogApache): Le fichier à indexer.
+            champs (tuple): Les champs à indexer (voir :attr:`CHAMPS_INDEXABLES`). Par
+                défaut, l'adresse IP, le code de statut http et la méthode http.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Un champ ne peut pas être indexé.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(fichier_log_apache, FichierLogApache):
+            raise TypeError("La représentation du fichier doit être de type FichierLogApache.")
+        if not isinstance(champs, tuple) or not all(isinstance(champ, str) for champ in champs):
+            raise TypeError("Les champs à indexer doivent être un tuple de chaînes "
+                            "de caractères.")
+        # Vérification de la valeur des paramètres
+        champs_inconnus = set(champs) - set(self.CHAMPS_INDEXABLES)
+        if champs_inconnus:
+            raise ValueError(f"Les champs {', '.join(sorted(champs_inconnus))} ne peuvent "
+                             "pas être indexés. Les champs indexables sont : "
+                             f"{', '.join(self.CHAMPS_INDEXABLES)}.")
+
+        # Construction des index
+        self.fichier = fichier_log_apache
+        self.champs = champs
+        listes = {champ: {} for champ in champs}
+        extracteurs = [(ExpressionFiltre.CHAMPS[champ][1], listes[champ]) for champ in champs]
+        for identifiant, entree in enumerate(fichier_log_apache.entrees):
+            for extracteur, liste_champ in extracteurs:
+                valeur = extracteur(entree)
+                identifiants = liste_champ.get(valeur)
+                if identifiants is None:
+                    liste_champ[valeur] = [identifiant]
+                else:
+                    identifiants.append(identifiant)
+        self._index = {
+            champ: {
+                valeur: np.array(identifiants, dtype=np.uint32)
+                for valeur, identifiants in liste_champ.items()
+            }
+            for champ, liste_champ in listes.items()
+        }
+
+    def get_identifiants(self, contraintes: dict) -> Optional[np.ndarray]:
+        """
+        Retourne les identifiants des entrées qui respectent toutes les contraintes
+        portant sur des champs indexés.
+
+        Les identifiants des valeurs acceptées d'un même champ sont réunis, puis les
+        listes des différents champs sont intersectées, de la plus courte à la plus
+        longue.
+
+        Args:
+            contraintes (dict): ``{champ: ensemble des valeurs acceptées}`` (voir
+                :meth:`FiltreLogApache.get_contraintes_egalite`). Les contraintes sur
+                des champs non indexés sont ignorées.
+
+        Returns:
+            Optional[np.ndarray]: Les identifiants triés des entrées candidates, ou
+                ``None`` si aucune contrainte ne porte sur un champ indexé.
+        """
+        listes = []
+        for champ, valeurs in contraintes.items():
+            if champ not in self._index:
+                continue
+            index_champ = self._index[champ]
+            postings = [index_champ[valeur] for valeur in valeurs if valeur in index_champ]
+            if not postings:
+                return np.empty(0, dtype=np.uint32)
+            # Les identifiants de valeurs différentes sont disjoints
+            listes.append(postings[0] if len(postings) == 1
+                          else np.sort(np.concatenate(postings)))
+        if not listes:
+            return None
+        listes.sort(key=len)
+        identifiants = listes[0]
+        for liste in listes[1:]:
+            if len(identifiants) == 0:
+                break
+            identifiants = np.intersect1d(identifiants, liste, assume_unique=True)
+        return identifiants
+
+    def get_entrees_filtre(self, filtre: FiltreLogApache) -> list:
+        """
+        Retourne les entrées du fichier qui passent le filtre, dans l'ordre du fichier.
+        Seules les entrées candidates trouvées par les index sont vérifiées ; si le
+        filtre n'impose aucune valeur exacte à un champ indexé, toutes les entrées
+        sont vérifiées.
+
+        Args:
+            filtre (FiltreLogApache): Le filtre à appliquer.
+
+        Returns:
+            list: Les entrées qui passent le filtre.
+
+        Raises:
+            TypeError: Le filtre n'est pas de type :class:`FiltreLogApache`.
+        """
+        # Vérification du type du paramètre
+        if not isinstance(filtre, FiltreLogApache):
+            raise TypeError("Le filtre à appliquer aux entrées doit être de type FiltreLogApache.")
+
+        entree_passe_filtre = filtre.get_predicat()
+        entrees = self.fichier.entrees
+        identifiants = self.get_identifiants(filtre.get_contraintes_egalite())
+        candidates = entrees if identifiants is None \
+            else [entrees[identifiant] for identifiant in identifiants.tolist()]
+        return [entree for entree in candidates if entree_passe_filtre(entree)]
@@ -0,0 +1,231 @@
+"""
+Module pour l'index d'appartenance d'adresses IP à de grandes listes de réseaux.
+"""
+
+from bisect import bisect_right
+from ipaddress import ip_address, ip_network, IPv4Network, IPv6Network
+from typing import Union
+
+
+class IndexIP:
+    """
+    Représente un index d'adresses IP et de réseaux CIDR (IPv4 et IPv6) permettant
+    de tester l'appartenance d'une adresse à une liste de plusieurs dizaines de
+    milliers de réseaux en temps logarithmique.
+
+    Chaque réseau est converti en un intervalle d'entiers ``[début, fin]``. Les
+    intervalles de chaque version d'IP sont triés puis fusionnés lorsqu'ils se
+    chevauchent ou se touchent, de sorte qu'une adresse appartient à la liste si
+    et seulement si elle appartient à l'intervalle dont le début est le plus grand
+    début inférieur ou égal à l'adresse, trouvé par recherche dichotomique.
+
+    Un fichier log contenant peu d'adresses distinctes, le résultat de chaque adresse
+    textuelle est mis en cache : la conversion en entier et la recherche ne sont
+    faites qu'une fois par adresse distincte.
+
+    Attributes:
+        total_reseaux (int): Le nombre de réseaux ajoutés à l'index.
+        _debuts (dict): Pour chaque version d'IP (``4`` ou ``6``), les débuts
+            triés des intervalles fusionnés.
+        _fins (dict): Pour chaque version d'IP, les fins des intervalles fusionnés,
+            dans le même ordre que les débuts.
+        _cache (dict): Le résultat de l'appartenance de chaque adresse textuelle
+            déjà testée.
+
+    Class-level variables:
+        :cvar TAILLE_MAX_CACHE (int): Le nombre maximal d'adresses conservées dans
+            le cache. Au-delà, le cache est vidé.
+    """
+
+    TAILLE_MAX_CACHE: int = 100000
+
+    def __init__(self, reseaux: list):
+        """
+        Initialise l'index à partir d'une liste d'adresses IP et de réseaux CIDR.
+
+        Args:
+            reseaux (list): Les adresses IP et réseaux, sous forme de chaînes de
+                caractères (``"10.0.0.0/8"``, ``"::1"``) ou d'objets :mod:`ipaddress`.
+
+        Raises:
+            TypeError: Le paramètre ``reseaux`` n'est pas une liste.
+            ValueError: Un élément de la liste n'est pas une adresse IP ou un réseau
+                CIDR valide.
+        """
+        # Vérification du type du paramètre
+        if not isinstance(reseaux, list):
+            raise TypeError("Les réseaux d'un index IP doivent être dans une liste.")
+
+        intervalles = {4: [], 6: []}
+        for reseau in reseaux:
+            reseau = self._convertit_reseau(reseau)
+            intervalles[reseau.version].append(
+                (int(reseau.network_address), int(reseau.broadcast_address))
+            )
+
+        self.total_reseaux = len(reseaux)
+        self._debuts = {}
+        self._fins = {}
+        for version, intervalles_version in intervalles.items():
+            self._debuts[version], self._fins[version] = self._fusionne_intervalles(
+                intervalles_version
+            )
+        self._cache = {}
+
+    @staticmethod
+    def _convertit_reseau(reseau: Union[str, IPv4Network, IPv6Network]) \
+            -> Union[IPv4Network, IPv6Network]:
+        """
+        Convertit une adresse IP ou un réseau CIDR en objet réseau.
+
+        Args:
+            reseau (Union[str, IPv4Network, IPv6Network]): L'adresse ou le réseau.
+
+        Returns:
+            Union[IPv4Network, IPv6Network]: Le réseau (une adresse seule devient
+                un réseau ``/32`` ou ``/128``).
+
+        Raises:
+            ValueError: L'adresse ou le réseau est invalide.
+        """
+        if isinstance(reseau, (IPv4Network, IPv6Network)):
+            return reseau
+        if not isinstance(reseau, str):
+            raise ValueError(f"'{reseau}' n'est pas une adresse IP ou un réseau CIDR.")
+        try:
+            return ip_network(reseau.strip(), strict=False)
+        except ValueError as ex:
+            raise ValueError(
+                f"'{reseau}' n'est pas une adresse IP ou un réseau CIDR valide."
+            ) from ex
+
+    @staticmethod
+    def _fusionne_intervalles(intervalles: list) -> tuple:
+        """
+        Trie et fusionne des intervalles d'entiers qui se chevauchent ou se touchent.
+
+        Args:
+            intervalles (list): Les intervalles ``(début, fin)``, bornes incluses.
+
+        Returns:
+            tuple: La liste triée des débuts et la liste des fins correspondantes.
+        """
+        debuts, fins = [], []
+        for debut, fin in sorted(intervalles):
+            if fins and debut <= fins[-1] + 1:
+                fins[-1] = max(fins[-1], fin)
+            else:
+                debuts.append(debut)
+                fins.append(fin)
+        return debuts, fins
+
+    @classmethod
+    def lit_fichier(cls, chemin: str) -> list:
+        """
+        Lit une liste d'adresses IP et de réseaux CIDR depuis un fichier texte contenant
+        un élément par ligne. Les lignes vides et le texte après un ``#`` sont ignorés.
+
+        Args:
+            chemin (str): Le chemin du fichier.
+
+        Returns:
+            list: Les réseaux lus (objets :mod:`ipaddress`).
+
+        Raises:
+            OSError: Le fichier ne peut pas être lu.
+            ValueError: Une ligne du fichier n'est pas une adresse IP ou un réseau
+                CIDR valide.
+        """
+        reseaux = []
+        with open(chemin, "r", encoding="utf-8") as fichier:
+            for numero, ligne in enumerate(fichier, start=1):
+                ligne = ligne.split("#", 1)[0].strip()
+                if not ligne:
+                    continue
+                try:
+                    reseaux.append(cls._convertit_reseau(ligne))
+                except ValueError as ex:
+                    # Le contenu de la ligne n'est pas repris dans l'erreur
+                    raise ValueError(f"Ligne {numero} du fichier '{chemin}' : ce n'est pas "
+                                     "une adresse IP ou un réseau CIDR valide.") from ex
+        return reseaux
+
+    @classmethod
+    def depuis_fichier(cls, chemin: str) -> "IndexIP":
+        """
+        Crée un index à partir d'un fichier texte (voir :meth:`lit_fichier`).
+
+        Args:
+            chemin (str): Le chemin du fichier.
+
+        Returns:
+            IndexIP: L'index.
+
+        Raises:
+            OSError: Le fichier ne peut pas être lu.
+            ValueError: Une ligne du fichier est invalide.
+        """
+        return cls(cls.lit_fichier(chemin))
+
+    def contient(self, adresse: str) -> bool:
+        """
+        Indique si une adresse IP appartient à l'un des réseaux de l'index.
+
+        Args:
+            adresse (str): L'adresse IP textuelle.
+
+        Returns:
+            bool: ``True`` si l'adresse appartient à l'index, ``False`` sinon
+                (y compris si l'adresse est invalide).
+        """
+        resultat = self._cache.get(adresse)
+        if resultat is None:
+            resultat = self._recherche(adresse)
+            if len(self._cache) >= self.TAILLE_MAX_CACHE:
+                self._cache.clear()
+            self._cache[adresse] = resultat
+        return resultat
+
+    def _recherche(self, adresse: str) -> bool:
+        """
+        Recherche une adresse IP dans les intervalles de l'index, sans passer
+        par le cache.
+
+        Args:
+            adresse (str): L'adresse IP textuelle.
+
+        Returns:
+            bool: ``True`` si l'adresse appartient à l'index.
+        """
+        try:
+            adresse_ip = ip_address(adresse)
+        except ValueError:
+            return False
+        # Une adresse IPv4 encapsulée dans une IPv6 (::ffff:a.b.c.d) est testée en IPv4
+        if adresse_ip.version == 6 and adresse_ip.ipv4_mapped is not None:
+            adresse_ip = adresse_ip.ipv4_mapped
+        valeur = int(adresse_ip)
+        debuts = self._debuts[adresse_ip.version]
+        position = bisect_right(debuts, valeur) - 1
+        return position >= 0 and valeur <= self._fins[adresse_ip.version][position]
+
+    def __contains__(self, adresse: str) -> bool:
+        """
+        Indique si une adresse IP appartient à l'index (voir :meth:`contient`).
+
+        Args:
+            adresse (str): L'adresse IP textuelle.
+
+        Returns:
+            bool: ``True`` si l'adresse appartient à l'index.
+        """
+        return self.contient(adresse)
+
+    def __len__(self) -> int:
+        """
+        Retourne le nombre d'intervalles de l'index après fusion.
+
+        Returns:
+            int: Le nombre d'intervalles IPv4 et IPv6.
+        """
+        return len(self._debuts[4]) + len(self._debuts[6])
@@ -0,0 +1,403 @@
+"""
+Module pour les regroupements (group-by) des entrées d'un fichier log Apache
+selon plusieurs dimensions.
+"""
+
+from typing import Optional
+from parse.entree_log_apache import EntreeLogApache
+from analyse.compteur_borne import CompteurBorne
+
+
+class SpecificationGroupement:
+    """
+    Représente la spécification déclarative d'un regroupement, par exemple
+    ``methode,code`` pour croiser la méthode HTTP et le code de statut http.
+
+    Attributes:
+        dimensions (list): Les noms des dimensions du regroupement, dans l'ordre.
+        _extracteurs (tuple): Les fonctions qui extraient la valeur de chaque
+            dimension depuis une entrée.
+
+    Class-level variables:
+        :cvar DIMENSIONS (dict): Les dimensions disponibles et la fonction qui extrait
+            leur valeur depuis une :class:`EntreeLogApache`.
+    """
+
+    DIMENSIONS: dict = {
+        "ip": lambda entree: entree.client.adresse_ip,
+        "agent": lambda entree: entree.client.agent_utilisateur,
+        "methode": lambda entree: entree.requete.methode_http,
+        "url": lambda entree: entree.requete.url,
+        "protocole": lambda entree: entree.requete.protocole_http,
+        "referent": lambda entree: entree.requete.ancienne_url,
+        "vhost": lambda entree: entree.requete.hote_virtuel,
+        "heure": lambda entree: entree.requete.horodatage.hour,
+        "jour": lambda entree: entree.requete.horodatage.date().isoformat(),
+        "code": lambda entree: entree.reponse.code_statut_http,
+        "classe_code": lambda entree: f"{entree.reponse.code_statut_http // 100}xx"
+    }
+
+    def __init__(self, specification: str):
+        """
+        Initialise une spécification de regroupement à partir de sa forme textuelle.
+
+        Args:
+            specification (str): Les noms des dimensions séparés par des virgules
+                (voir :attr:`DIMENSIONS`).
+
+        Raises:
+            TypeError: Le paramètre ``specification`` n'est pas une chaîne de caractères.
+            ValueError: La spécification est vide, contient une dimension inconnue
+                ou une dimension en double.
+        """
+        # Vérification du type du paramètre
+        if not isinstance(specification, str):
+            raise TypeError("La spécification d'un regroupement doit être une chaîne "
+                            "de caractères.")
+
+        # Analyse de la spécification
+        dimensions = [dimension.strip() for dimension in specification.split(",")]
+        for dimension in dimensions:
+            if dimension not in self.DIMENSIONS:
+                raise ValueError(f"La dimension '{dimension}' est inconnue. Les dimensions "
+                                 f"disponibles sont : {', '.join(self.DIMENSIONS)}.")
+        if len(set(dimensions)) != len(dimensions):
+            raise ValueError("Une dimension ne peut apparaître qu'une seule fois dans "
+                             "un regroupement.")
+
+        self.dimensions = dimensions
+        self._extracteurs = tuple(self.DIMENSIONS[dimension] for dimension in dimensions)
+
+    def get_cle(self, entree: EntreeLogApache) -> tuple:
+        """
+        Retourne la clé de regroupement d'une entrée.
+
+        Args:
+            entree (EntreeLogApache): L'entrée à regrouper.
+
+        Returns:
+            tuple: La valeur de chaque dimension, dans l'ordre de :attr:`dimensions`.
+        """
+        return tuple(extracteur(entree) for extracteur in self._extracteurs)
+
+    def __str__(self) -> str:
+        """
+        Retourne la forme textuelle de la spécification.
+
+        Returns:
+            str: Les dimensions séparées par des virgules.
+        """
+        return ",".join(self.dimensions)
+
+
+class MoteurGroupement:
+    """
+    Représente un moteur de regroupement qui calcule plusieurs regroupements en un
+    seul parcours des entrées, par agrégation dans des tables de hachage.
+
+    Pour chaque groupe, le moteur conserve le nombre d'entrées, la somme des tailles
+    des réponses et le nombre de réponses avec une taille. La mémoire est bornée : au
+    plus :attr:`taille_maximale` groupes sont conservés par regroupement, choisis par
+    un :class:`CompteurBorne` (Space-Saving). Lorsqu'une nouvelle clé arrive et que
+    la table est pleine, le groupe le moins fréquent est écarté et ses agrégats
+    rejoignent le groupe « autres » ; un groupe fréquent reste donc conservé même
+    s'il apparaît après les autres. Les agrégats d'un groupe portent sur les entrées
+    reçues depuis qu'il est conservé, les précédentes étant dans « autres ».
+
+    Attributes:
+        specifications (list): Les spécifications des regroupements à calculer.
+        taille_maximale (int): Le nombre maximal de groupes conservés par regroupement.
+        _tables (list): Pour chaque regroupement, la table clé -> agrégats.
+        _compteurs (list): Pour chaque regroupement, le :class:`CompteurBorne` qui
+            choisit les groupes conservés.
+        _autres (list): Pour chaque regroupement, les agrégats des groupes
+            qui n'ont pas pu être conservés.
+        _total (int): Le nombre total d'entrées ajoutées.
+
+    Class-level variables:
+        :cvar TAILLE_MAXIMALE (int): Le nombre maximal de groupes conservés par
+            regroupement par défaut.
+    """
+
+    TAILLE_MAXIMALE: int = 10000
+
+    def __init__(self, specifications: list, taille_maximale: int = TAILLE_MAXIMALE):
+        """
+        Initialise un moteur de regroupement.
+
+        Args:
+            specifications (list): Les spécifications (:class:`SpecificationGroupement`)
+                des regroupements à calculer.
+            taille_maximale (int): Le nombre maximal de groupes conservés par
+                regroupement. Par défaut, sa valeur est égale à :attr:`TAILLE_MAXIMALE`.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Le paramètre ``taille_maximale`` est inférieur à 1.
+        """
+        # Vérification des paramètres
+        if not isinstance(specifications, list):
+            raise TypeError("Les spécifications des regroupements doivent être dans une liste.")
+        if not all(isinstance(specification, SpecificationGroupement)
+                   for specification in specifications):
+            raise TypeError("Les spécifications des regroupements doivent être de type "
+                            "SpecificationGroupement.")
+        if not isinstance(taille_maximale, int) or isinstance(taille_maximale, bool):
+            raise TypeError("La taille maximale d'un regroupement doit être un entier.")
+        if taille_maximale < 1:
+            raise ValueError("La taille maximale d'un regroupement doit être supérieure "
+                             "ou égale à 1.")
+
+        self.specifications = specifications
+        self.taille_maximale = taille_maximale
+        self._tables = [{} for _ in specifications]
+        self._compteurs = [CompteurBorne(taille_maximale) for _ in specifications]
+        self._autres = [[0, 0, 0] for _ in specifications]
+        self._total = 0
+
+    def ajoute_entree(self, entree: EntreeLogApache) -> None:
+        """
+        Ajoute une entrée à tous les regroupements.
+
+        Args:
+            entree (EntreeLogApache): L'entrée à ajouter.
+
+        Returns:
+            None
+        """
+        self._total += 1
+        taille_octets = entree.reponse.taille_octets
+        for indice, (specification, table, compteur) in enumerate(zip(self.specifications,
+                                                                      self._tables,
+                                                                      self._compteurs)):
+            cle = specification.get_cle(entree)
+            agregats = table.get(cle)
+            if agregats is None:
+                agregats = self._conserve_groupe(indice, cle, 1, 0)
+            else:
+                compteur.ajoute(cle)
+            agregats[0] += 1
+            if taille_octets is not None:
+                agregats[1] += taille_octets
+                agregats[2] += 1
+
+    def _conserve_groupe(self, indice: int, cle: tuple, poids: int, erreur: int) -> list:
+        """
+        Ajoute un nouveau groupe à la table d'un regroupement. Si la table est pleine,
+        le groupe le moins fréquent est écarté et ses agrégats sont ajoutés au groupe
+        « autres ».
+
+        Args:
+            indice (int): L'indice du regroupement.
+            cle (tuple): La clé du nouveau groupe.
+            poids (int): Le nombre d'entrées du groupe à compter.
+            erreur (int): L'erreur maximale déjà contenue dans ``poids``.
+
+        Returns:
+            list: Les agrégats (à zéro) du nouveau groupe.
+        """
+        table = self._tables[indice]
+        remplace = self._compteurs[indice].ajoute(cle, poids, erreur)
+        if remplace is not None:
+            autres = self._autres[indice]
+            for position, valeur in enumerate(table.pop(remplace[0])):
+                autres[position] += valeur
+        agregats = table[cle] = [0, 0, 0]
+        return agregats
+
+    def ajoute_entrees(self, entrees: list) -> None:
+        """
+        Ajoute plusieurs entrées à tous les regroupements.
+
+        Args:
+            entrees (list): Les entrées à ajouter.
+
+        Returns:
+            None
+        """
+        for entree in entrees:
+            self.ajoute_entree(entree)
+
+    def fusionne(self, autre: "MoteurGroupement") -> None:
+        """
+        Fusionne les regroupements d'un autre moteur dans ce moteur. Les agrégats
+        des clés communes sont additionnés ; les nouvelles clés sont conservées selon
+        leur fréquence, comme pour :meth:`ajoute_entree`, et les groupes écartés sont
+        agrégés dans « autres ». Le moteur ``autre`` n'est pas modifié.
+
+        Args:
+            autre (MoteurGroupement): Le moteur à fusionner.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: Le paramètre ``autre`` n'est pas un :class:`MoteurGroupement`.
+            ValueError: Les deux moteurs ne calculent pas les mêmes regroupements.
+        """
+        # Vérification du paramètre
+        if not isinstance(autre, MoteurGroupement):
+            raise TypeError("Le moteur à fusionner doit être de type MoteurGroupement.")
+        if [str(specification) for specification in self.specifications] \
+                != [str(specification) for specification in autre.specifications]:
+            raise ValueError("Les deux moteurs doivent calculer les mêmes regroupements.")
+
+        etat_autre = autre.get_dict()
+        self._total += etat_autre["total"]
+        for indice, specification in enumerate(self.specifications):
+            nombre_dimensions = len(specification.dimensions)
+            for groupe in etat_autre["tables"][indice]:
+                cle = tuple(groupe[:nombre_dimensions])
+                *agregats_autre, erreur = groupe[nombre_dimensions:]
+                agregats = self._tables[indice].get(cle)
+                if agregats is None:
+                    agregats = self._conserve_groupe(indice, cle, agregats_autre[0] + erreur,
+                                                     erreur)
+                else:
+                    self._compteurs[indice].ajoute(cle, agregats_autre[0] + erreur, erreur)
+                for position, valeur in enumerate(agregats_autre):
+                    agregats[position] += valeur
+            for position, valeur in enumerate(etat_autre["autres"][indice]):
+                self._autres[indice][position] += valeur
+
+    def get_dict(self) -> dict:
+        """
+        Retourne l'état brut du moteur (agrégats non arrondis et non tronqués) sous
+        forme d'un dictionnaire sérialisable en JSON.
+
+        Returns:
+            dict: Un dictionnaire contenant :
+                - specifications: La forme textuelle de chaque spécification.
+                - taille_maximale: Le nombre maximal de groupes par regroupement.
+                - total: Le nombre total d'entrées ajoutées.
+                - tables: Pour chaque regroupement, la liste des groupes sous la forme
+                  ``[valeurs des dimensions..., total, somme_octets, nombre_tailles,
+                  erreur]``, où ``erreur`` est le nombre maximal d'entrées du groupe
+                  comptées dans « autres » avant qu'il ne soit conservé.
+                - autres: Pour chaque regroupement, les agrégats du groupe « autres ».
+        """
+        tables = []
+        for table, compteur in zip(self._tables, self._compteurs):
+            erreurs = {cle: erreur for cle, _, erreur in compteur.get_top()}
+            tables.append([[*cle, *agregats, erreurs[cle]] for cle, agregats in table.items()])
+        return {
+            "specifications": [str(specification) for specification in self.specifications],
+            "taille_maximale": self.taille_maximale,
+            "total": self._total,
+            "tables": tables,
+            "autres": [list(autres) for autres in self._autres]
+        }
+
+    @classmethod
+    def depuis_dict(cls, etat: dict) -> "MoteurGroupement":
+        """
+        Reconstruit un moteur à partir du dictionnaire retourné par :meth:`get_dict`.
+
+        Args:
+            etat (dict): L'état du moteur.
+
+        Returns:
+            MoteurGroupement: Le moteur reconstruit.
+
+        Raises:
+            TypeError: Le paramètre ``etat`` n'est pas un dictionnaire.
+            ValueError: L'état est incomplet ou incohérent.
+        """
+        # Vérification du paramètre
+        if not isinstance(etat, dict):
+            raise TypeError("L'état d'un moteur de regroupement doit être un dictionnaire.")
+        cles = ("specifications", "taille_maximale", "total", "tables", "autres")
+        if any(cle not in etat for cle in cles):
+            raise ValueError("L'état d'un moteur de regroupement doit contenir les clés : "
+                             f"{', '.join(cles)}.")
+
+        moteur = cls([SpecificationGroupement(specification)
+                      for specification in etat["specifications"]],
+                     etat["taille_maximale"])
+        if len(etat["tables"]) != len(moteur.specifications) \
+                or len(etat["autres"]) != len(moteur.specifications):
+            raise ValueError("L'état d'un moteur de regroupement doit contenir une table "
+                             "par spécification.")
+        moteur._total = etat["total"]
+        for specification, table, compteur, groupes in zip(moteur.specifications,
+                                                           moteur._tables,
+                                                           moteur._compteurs,
+                                                           etat["tables"]):
+            nombre_dimensions = len(specification.dimensions)
+            if len(groupes) > moteur.taille_maximale \
+                    or any(len(groupe) != nombre_dimensions + 4 for groupe in groupes):
+                raise ValueError("Les groupes d'un moteur de regroupement sont incohérents "
+                                 "avec ses spécifications.")
+            for groupe in groupes:
+                cle = tuple(groupe[:nombre_dimensions])
+                *agregats, erreur = groupe[nombre_dimensions:]
+                compteur.ajoute(cle, agregats[0] + erreur, erreur)
+                table[cle] = agregats
+        moteur._autres = [list(autres) for autres in etat["autres"]]
+        return moteur
+
+    def _get_statistiques_groupe(self, agregats: list) -> dict:
+        """
+        Retourne les statistiques d'un groupe à partir de ses agrégats.
+
+        Args:
+            agregats (list): Le nombre d'entrées, la somme des tailles et le nombre
+                de réponses avec une taille.
+
+        Returns:
+            dict: Le total, le taux, la somme et la moyenne des tailles du groupe.
+        """
+        total, somme_octets, nombre_tailles = agregats
+        return {
+            "total": total,
+            "taux": total / self._total * 100 if self._total else 0.0,
+            "somme_octets": somme_octets,
+            "moyenne_octets": somme_octets / nombre_tailles if nombre_tailles else None
+        }
+
+    def get_groupements(self, limite: Optional[int] = None) -> list:
+        """
+        Retourne le résultat de chaque regroupement.
+
+        Args:
+            limite (Optional[int]): Le nombre maximal de groupes retournés par
+                regroupement. Si ``None``, tous les groupes conservés sont retournés.
+
+        Raises:
+            TypeError: Le paramètre ``limite`` n'est ni un entier ni ``None``.
+            ValueError: Le paramètre ``limite`` est négatif.
+
+        Returns:
+            list: Une liste de dictionnaires, un par spécification, contenant :
+                - dimensions: Les noms des dimensions.
+                - total_groupes: Le nombre de groupes conservés.
+                - groupes: Les groupes triés par total décroissant, où chaque groupe
+                  contient la valeur de chaque dimension ainsi que total, taux,
+                  somme_octets et moyenne_octets.
+                - autres: Les statistiques des entrées dont le groupe n'a pas pu être
+                  conservé, ou ``None`` si aucun groupe n'a été écarté.
+        """
+        if limite is not None and (not isinstance(limite, int) or isinstance(limite, bool)):
+            raise TypeError("La limite du nombre de groupes doit être un entier ou None.")
+        if limite is not None and limite < 0:
+            raise ValueError("La limite du nombre de groupes doit être supérieure ou égale "
+                             "à 0.")
+
+        resultats = []
+        for specification, table, autres in zip(self.specifications,
+                                                 self._tables,
+                                                 self._autres):
+            groupes = sorted(table.items(), key=lambda groupe: groupe[1][0], reverse=True)
+            resultats.append({
+                "dimensions": list(specification.dimensions),
+                "total_groupes": len(table),
+                "groupes": [
+                    {
+                        **dict(zip(specification.dimensions, cle)),
+                        **self._get_statistiques_groupe(agregats)
+                    }
+                    for cle, agregats in groupes[:limite]
+                ],
+                "autres": self._get_statistiques_groupe(autres) if autres[0] else None
+            })
+        return resultats
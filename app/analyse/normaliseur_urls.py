@@ -0,0 +1,301 @@
+"""
+Module pour la normalisation des urls en routes (suppression de la chaîne de
+requête, regroupement des identifiants et modèles de routes).
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional
+
+
+class NormaliseurUrls:
+    """
+    Représente la normalisation des urls demandées en routes, afin que les
+    classements comptent les points d'accès et non chaque url brute : par exemple,
+    ``/produit/123?x=1`` et ``/produit/456`` deviennent tous deux ``/produit/{id}``.
+
+    Une url est normalisée en trois étapes :
+        - La chaîne de requête (à partir de ``?``) est supprimée.
+        - Le chemin est cherché dans les modèles de routes fournis (par exemple
+          ``/api/{version}/produit/{id}``) ; s'il correspond à un modèle, il est
+          remplacé par ce modèle.
+        - Sinon, les segments qui sont des identifiants (nombres, UUID, empreintes
+          hexadécimales) sont remplacés par ``{id}``.
+
+    Les modèles sont rangés dans un arbre préfixe (trie) de segments : un segment
+    ``{nom}`` correspond à n'importe quel segment et un dernier segment ``*`` à
+    n'importe quelle suite de segments. Un segment littéral est prioritaire sur un
+    paramètre, lui-même prioritaire sur ``*``. Le résultat de la normalisation d'une
+    url est gardé dans un cache LRU, de sorte qu'une url répétée n'est normalisée
+    qu'une fois tant qu'elle reste dans le cache.
+
+    Attributes:
+        modeles (list): Les modèles de routes.
+        regroupe_identifiants (bool): Indique si les identifiants des urls qui ne
+            correspondent à aucun modèle sont remplacés par ``{id}``.
+        _transitions (list): Pour chaque état de l'arbre, ses transitions par
+            segment littéral.
+        _parametres (list): Pour chaque état, l'état atteint par un segment
+            paramètre (``None`` s'il n'y en a pas).
+        _modeles_etats (list): Pour chaque état, le modèle qui se termine à cet état
+            (``None`` s'il n'y en a pas).
+        _jokers (list): Pour chaque état, le modèle qui se termine par ``*`` à cet
+            état (``None`` s'il n'y en a pas).
+        _normalise_cache (Callable): La normalisation d'une url, enveloppée dans un
+            cache LRU.
+
+    Class-level variables:
+        :cvar IDENTIFIANT (str): Le segment qui remplace les identifiants.
+        :cvar MOTIF_PARAMETRE (re.Pattern): Le format d'un segment paramètre d'un
+            modèle.
+        :cvar MOTIF_IDENTIFIANT (re.Pattern): Le format d'un segment identifiant.
+    """
+
+    IDENTIFIANT: str = "{id}"
+
+    MOTIF_PARAMETRE: re.Pattern = re.compile(r"\{\w+\}")
+
+    MOTIF_IDENTIFIANT: re.Pattern = re.compile(
+        r"\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+        r"|[0-9a-fA-F]{16,}"
+    )
+
+    def __init__(self,
+                 modeles: Optional[list] = None,
+                 regroupe_identifiants: bool = True,
+                 taille_cache: int = 100000):
+        """
+        Construit l'arbre des modèles de routes.
+
+        Args:
+            modeles (Optional[list]): Les modèles de routes (voir
+                :meth:`decoupe_modele`). Par défaut, aucun.
+            regroupe_identifiants (bool): Indique si les identifiants des urls qui ne
+                correspondent à aucun modèle sont remplacés par ``{id}``. Par défaut,
+                ``True``.
+            taille_cache (int): Le nombre maximal d'urls distinctes gardées dans le
+                cache. Par défaut, ``100000``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Un modèle est invalide ou la taille du cache est inférieure
+                à ``1``.
+        """
+        # Vérification du type des paramètres
+        if modeles is not None and (not isinstance(modeles, list)
+                                    or not all(isinstance(modele, str) for modele in modeles)):
+            raise TypeError("Les modèles de routes doivent être une liste de chaînes de "
+                            "caractères.")
+        if not isinstance(regroupe_identifiants, bool):
+            raise TypeError("Le regroupement des identifiants doit être un booléen.")
+        if not isinstance(taille_cache, int) or isinstance(taille_cache, bool):
+            raise TypeError("La taille du cache doit être un entier.")
+        # Vérification de la valeur des paramètres
+        if taille_cache < 1:
+            raise ValueError("La taille du cache doit être supérieure à 0.")
+
+        self.modeles = modeles if modeles is not None else []
+        self.regroupe_identifiants = regroupe_identifiants
+        self._transitions = [{}]
+        self._parametres = [None]
+        self._modeles_etats = [None]
+        self._jokers = [None]
+        for modele in self.modeles:
+            self._ajoute_modele(modele)
+        self._normalise_cache = lru_cache(maxsize=taille_cache)(self._calcule_normalisation)
+
+    @classmethod
+    def decoupe_modele(cls, modele: str) -> list:
+        """
+        Vérifie un modèle de route et le découpe en segments.
+
+        Un modèle commence par ``/``. Ses segments sont littéraux, des paramètres
+        ``{nom}`` qui correspondent à n'importe quel segment, ou ``*`` (uniquement en
+        dernier) qui correspond à n'importe quelle suite de segments.
+
+        Args:
+            modele (str): Le modèle de route.
+
+        Returns:
+            list: Les segments du modèle (le premier est vide).
+
+        Raises:
+            TypeError: Le modèle n'est pas une chaîne de caractères.
+            ValueError: Le modèle ne commence pas par ``/``, contient ``?``, ou
+                contient ``*`` ailleurs qu'en dernier segment.
+        """
+        # Vérification du paramètre
+        if not isinstance(modele, str):
+            raise TypeError("Le modèle de route doit être une chaîne de caractères.")
+        if not modele.startswith("/") or "?" in modele:
+            raise ValueError(f"Le modèle de route {modele} doit commencer par '/' et ne "
+                             "pas contenir de chaîne de requête.")
+        segments = modele.split("/")
+        if "*" in segments[:-1] or any("*" in segment and segment != "*"
+                                       for segment in segments):
+            raise ValueError(f"Le modèle de route {modele} ne peut contenir '*' qu'en "
+                             "dernier segment.")
+        return segments
+
+    def _ajoute_modele(self, modele: str) -> None:
+        """
+        Ajoute un modèle de route à l'arbre. Si plusieurs modèles correspondent au
+        même chemin de l'arbre, le premier est conservé.
+
+        Args:
+            modele (str): Le modèle de route.
+
+        Returns:
+            None
+        """
+        segments = self.decoupe_modele(modele)
+        joker = segments[-1] == "*"
+        if joker:
+            segments = segments[:-1]
+        etat = 0
+        for segment in segments:
+            if self.MOTIF_PARAMETRE.fullmatch(segment):
+                suivant = self._parametres[etat]
+            else:
+                suivant = self._transitions[etat].get(segment)
+            if suivant is None:
+                suivant = len(self._transitions)
+                self._transitions.append({})
+                self._parametres.append(None)
+                self._modeles_etats.append(None)
+                self._jokers.append(None)
+                if self.MOTIF_PARAMETRE.fullmatch(segment):
+                    self._parametres[etat] = suivant
+                else:
+                    self._transitions[etat][segment] = suivant
+            etat = suivant
+        routes = self._jokers if joker else self._modeles_etats
+        if routes[etat] is None:
+            routes[etat] = modele
+
+    def _cherche_modele(self, etat: int, segments: list, position: int) -> Optional[str]:
+        """
+        Cherche le modèle qui correspond aux segments d'un chemin à partir d'un état
+        de l'arbre, en essayant d'abord le segment littéral, puis le paramètre, puis
+        ``*``.
+
+        Args:
+            etat (int): L'état de l'arbre atteint.
+            segments (list): Les segments du chemin.
+            position (int): La position du prochain segment à lire.
+
+        Returns:
+            Optional[str]: Le modèle correspondant, ou ``None`` s'il n'y en a pas.
+        """
+        if position == len(segments):
+            modele = self._modeles_etats[etat]
+            return modele if modele is not None else self._jokers[etat]
+        for suivant in (self._transitions[etat].get(segments[position]),
+                        self._parametres[etat]):
+            if suivant is not None:
+                modele = self._cherche_modele(suivant, segments, position + 1)
+                if modele is not None:
+                    return modele
+        return self._jokers[etat]
+
+    def _calcule_normalisation(self, url: str) -> str:
+        """
+        Normalise une url, sans cache.
+
+        Args:
+            url (str): L'url.
+
+        Returns:
+            str: L'url normalisée.
+        """
+        chemin = url.split("?", 1)[0]
+        segments = chemin.split("/")
+        if self.modeles:
+            modele = self._cherche_modele(0, segments, 0)
+            if modele is not None:
+                return modele
+        if self.regroupe_identifiants:
+            return "/".join(self.IDENTIFIANT if self.MOTIF_IDENTIFIANT.fullmatch(segment)
+                            else segment for segment in segments)
+        return chemin
+
+    def normalise(self, url: Optional[str]) -> Optional[str]:
+        """
+        Retourne la route d'une url, en réutilisant celle d'une url identique déjà
+        rencontrée.
+
+        Args:
+            url (Optional[str]): L'url (``None`` si la requête n'en contient pas).
+
+        Returns:
+            Optional[str]: L'url normalisée, ou ``None`` si l'url est ``None``.
+
+        Raises:
+            TypeError: Le paramètre ``url`` n'est pas une chaîne de caractères ou
+                ``None``.
+        """
+        if url is None:
+            return None
+        # Vérification du paramètre
+        if not isinstance(url, str):
+            raise TypeError("L'url doit être une chaîne de caractères ou None.")
+
+        return self._normalise_cache(url)
+
+    def get_statistiques_cache(self) -> dict:
+        """
+        Retourne l'utilisation du cache des normalisations.
+
+        Returns:
+            dict: Le nombre d'urls trouvées dans le cache (``succes``), le nombre
+            d'urls normalisées (``normalisations``) et le nombre d'urls gardées dans
+            le cache (``taille``).
+        """
+        informations_cache = self._normalise_cache.cache_info()
+        return {
+            "succes": informations_cache.hits,
+            "normalisations": informations_cache.misses,
+            "taille": informations_cache.currsize
+        }
+
+    def get_dict(self) -> dict:
+        """
+        Retourne la définition de la normalisation sous forme d'un dictionnaire
+        sérialisable en JSON, qui identifie les routes produites.
+
+        Returns:
+            dict: Les modèles de routes (``modeles``) et le regroupement des
+            identifiants (``regroupe_identifiants``).
+        """
+        return {
+            "modeles": list(self.modeles),
+            "regroupe_identifiants": self.regroupe_identifiants
+        }
+
+    @classmethod
+    def depuis_dict(cls, definition: dict) -> "NormaliseurUrls":
+        """
+        Reconstruit une normalisation à partir du dictionnaire retourné par
+        :meth:`get_dict`.
+
+        Args:
+            definition (dict): La définition de la normalisation.
+
+        Returns:
+            NormaliseurUrls: La normalisation reconstruite.
+
+        Raises:
+            TypeError: Le paramètre ``definition`` n'est pas un dictionnaire, ou ses
+                valeurs ne sont pas du type attendu.
+            ValueError: La définition est incomplète ou un modèle est invalide.
+        """
+        # Vérification du paramètre
+        if not isinstance(definition, dict):
+            raise TypeError("La définition d'une normalisation des urls doit être un "
+                            "dictionnaire.")
+        cles = ("modeles", "regroupe_identifiants")
+        if any(cle not in definition for cle in cles):
+            raise ValueError("La définition d'une normalisation des urls doit contenir les "
+                             f"clés : {', '.join(cles)}.")
+
+        return cls(definition["modeles"], definition["regroupe_identifiants"])
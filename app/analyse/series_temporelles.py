@@ -0,0 +1,241 @@
+"""
+Module pour le calcul des séries temporelles du trafic d'un fichier log Apache.
+"""
+
+from datetime import datetime, timezone
+import numpy as np
+
+
+class SeriesTemporelles:
+    """
+    Représente le calcul des séries temporelles du trafic (requêtes, octets et erreurs
+    par intervalle de temps).
+
+    Le regroupement par intervalle est vectorisé avec NumPy sur des horodatages
+    en secondes depuis l'epoch : aucun objet ``datetime`` n'est haché par entrée.
+    Les intervalles sont alignés sur l'epoch, donc en temps UTC quel que soit le
+    décalage horaire (``%z``) des entrées : un intervalle ``jour`` commence à minuit
+    UTC, et non à minuit dans le fuseau du log.
+
+    Attributes:
+        granularite (str): Le nom de l'intervalle de regroupement
+            (``minute``, ``heure`` ou ``jour``).
+
+    Class-level variables:
+        :cvar GRANULARITES (dict): Les granularités disponibles et leur durée en secondes.
+    """
+
+    GRANULARITES: dict = {
+        "minute": 60,
+        "heure": 3600,
+        "jour": 86400
+    }
+
+    def __init__(self, granularite: str = "heure"):
+        """
+        Initialise le calcul des séries temporelles.
+
+        Args:
+            granularite (str): L'intervalle de regroupement. Par défaut, sa valeur
+                est égale à ``heure``.
+
+        Raises:
+            TypeError: Le paramètre ``granularite`` n'est pas une chaîne de caractères.
+            ValueError: La granularité n'est pas une des clés de :attr:`GRANULARITES`.
+        """
+        # Vérification du paramètre
+        if not isinstance(granularite, str):
+            raise TypeError("La granularité doit être une chaîne de caractères.")
+        if granularite not in self.GRANULARITES:
+            raise ValueError("La granularité doit être une des valeurs suivantes : "
+                             f"{', '.join(self.GRANULARITES)}.")
+
+        self.granularite = granularite
+
+    @staticmethod
+    def convertit_horodatages(horodatages: list) -> np.ndarray:
+        """
+        Convertit des horodatages en secondes depuis l'epoch, en un seul tableau.
+
+        Le parseur réutilise le même objet ``datetime`` pour les entrées consécutives
+        de la même seconde : la conversion n'est faite qu'une fois par suite d'objets
+        identiques, puis répétée avec NumPy.
+
+        Args:
+            horodatages (list): Les horodatages (``datetime`` avec fuseau horaire),
+                dans l'ordre des entrées.
+
+        Returns:
+            np.ndarray: Les secondes depuis l'epoch (``int64``), une valeur par horodatage.
+        """
+        debuts = []
+        secondes = []
+        precedent = None
+        for position, horodatage in enumerate(horodatages):
+            if horodatage is not precedent:
+                precedent = horodatage
+                debuts.append(position)
+                secondes.append(int(horodatage.timestamp()))
+        debuts.append(len(horodatages))
+        return np.repeat(np.array(secondes, dtype=np.int64), np.diff(debuts))
+
+    def calcule(self,
+                secondes: np.ndarray,
+                octets: np.ndarray,
+                codes_statut_http: np.ndarray) -> dict:
+        """
+        Calcule les séries temporelles à partir de colonnes alignées (une valeur
+        par entrée).
+
+        Args:
+            secondes (np.ndarray): Les horodatages en secondes depuis l'epoch.
+            octets (np.ndarray): Les tailles des réponses en octets (0 si absente).
+            codes_statut_http (np.ndarray): Les codes de statut http.
+
+        Returns:
+            dict: Un dictionnaire contenant :
+                - granularite: La granularité utilisée.
+                - pic_requetes_par_seconde: Le nombre maximal de requêtes reçues
+                  dans une même seconde.
+                - series: Une liste triée chronologiquement de dictionnaires où chaque
+                  clé contient :
+                    - debut: Le début de l'intervalle (ISO 8601, UTC).
+                    - requetes: Le nombre de requêtes dans l'intervalle.
+                    - octets: Le nombre d'octets envoyés dans l'intervalle.
+                    - erreurs: Le nombre de réponses avec un code supérieur ou égal à 400.
+                    - pic_requetes_par_seconde: Le pic de requêtes par seconde
+                      dans l'intervalle.
+
+        Raises:
+            TypeError: Un paramètre n'est pas un tableau NumPy.
+            ValueError: Les tableaux n'ont pas la même taille.
+        """
+        # Vérification des paramètres
+        for colonne in (secondes, octets, codes_statut_http):
+            if not isinstance(colonne, np.ndarray):
+                raise TypeError("Les colonnes des séries temporelles doivent être "
+                                "des tableaux NumPy.")
+        if not len(secondes) == len(octets) == len(codes_statut_http):
+            raise ValueError("Les colonnes des séries temporelles doivent avoir "
+                             "la même taille.")
+
+        # Agrégation par seconde, puis par intervalle
+        secondes_uniques, indices, requetes = np.unique(secondes.astype(np.int64, copy=False),
+                                                        return_inverse=True,
+                                                        return_counts=True)
+        indices = indices.reshape(-1)
+        return self.calcule_par_seconde(
+            secondes_uniques,
+            requetes,
+            np.bincount(indices, weights=octets.astype(np.float64),
+                        minlength=len(secondes_uniques)).astype(np.int64),
+            np.bincount(indices, weights=codes_statut_http >= 400,
+                        minlength=len(secondes_uniques)).astype(np.int64)
+        )
+
+    def calcule_par_seconde(self,
+                            secondes: np.ndarray,
+                            requetes: np.ndarray,
+                            octets: np.ndarray,
+                            erreurs: np.ndarray) -> dict:
+        """
+        Calcule les séries temporelles à partir de colonnes déjà agrégées par seconde
+        (une valeur par seconde distincte, par exemple issues de la fusion de plusieurs
+        états partiels d'analyse).
+
+        Args:
+            secondes (np.ndarray): Les secondes distinctes depuis l'epoch, triées.
+            requetes (np.ndarray): Le nombre de requêtes reçues dans chaque seconde.
+            octets (np.ndarray): Le nombre d'octets envoyés dans chaque seconde.
+            erreurs (np.ndarray): Le nombre de réponses en erreur dans chaque seconde.
+
+        Returns:
+            dict: Les séries temporelles, voir :meth:`calcule`.
+
+        Raises:
+            TypeError: Un paramètre n'est pas un tableau NumPy.
+            ValueError: Les tableaux n'ont pas la même taille.
+        """
+        # Vérification des paramètres
+        for colonne in (secondes, requetes, octets, erreurs):
+            if not isinstance(colonne, np.ndarray):
+                raise TypeError("Les colonnes des séries temporelles doivent être "
+                                "des tableaux NumPy.")
+        if not len(secondes) == len(requetes) == len(octets) == len(erreurs):
+            raise ValueError("Les colonnes des séries temporelles doivent avoir "
+                             "la même taille.")
+
+        return self.calcule_par_intervalle(
+            secondes,
+            np.column_stack((requetes, octets, erreurs, requetes)).astype(np.int64).reshape(-1, 4)
+        )
+
+    def calcule_par_intervalle(self, debuts: np.ndarray, agregats: np.ndarray) -> dict:
+        """
+        Calcule les séries temporelles à partir de lignes déjà agrégées par seconde ou
+        par intervalle de la granularité, chaque ligne portant son propre pic de
+        requêtes par seconde (par exemple issues d'états partiels d'analyse).
+
+        Args:
+            debuts (np.ndarray): Les débuts des lignes en secondes depuis l'epoch.
+            agregats (np.ndarray): Un tableau de quatre colonnes : le nombre de
+                requêtes, d'octets et d'erreurs de chaque ligne, et son pic de
+                requêtes par seconde.
+
+        Returns:
+            dict: Les séries temporelles, voir :meth:`calcule`.
+
+        Raises:
+            TypeError: Un paramètre n'est pas un tableau NumPy.
+            ValueError: Les agrégats n'ont pas quatre colonnes et une ligne par début.
+        """
+        # Vérification des paramètres
+        if not isinstance(debuts, np.ndarray) or not isinstance(agregats, np.ndarray):
+            raise TypeError("Les colonnes des séries temporelles doivent être "
+                            "des tableaux NumPy.")
+        if agregats.ndim != 2 or agregats.shape != (len(debuts), 4):
+            raise ValueError("Les agrégats des séries temporelles doivent avoir quatre "
+                             "colonnes et une ligne par début.")
+        secondes = debuts
+        requetes, octets, erreurs, pics = agregats.T
+
+        if len(secondes) == 0:
+            return {
+                "granularite": self.granularite,
+                "pic_requetes_par_seconde": 0,
+                "series": []
+            }
+
+        duree = self.GRANULARITES[self.granularite]
+        # Regroupement des secondes par intervalle
+        debuts, indices = np.unique(secondes.astype(np.int64, copy=False) // duree,
+                                    return_inverse=True)
+        indices = indices.reshape(-1)
+        requetes_par_intervalle = np.bincount(indices, weights=requetes,
+                                              minlength=len(debuts))
+        octets_par_intervalle = np.bincount(indices, weights=octets,
+                                            minlength=len(debuts))
+        erreurs_par_intervalle = np.bincount(indices, weights=erreurs,
+                                             minlength=len(debuts))
+        # Pic de requêtes par seconde dans chaque intervalle
+        pics_par_intervalle = np.zeros(len(debuts), dtype=np.int64)
+        np.maximum.at(pics_par_intervalle, indices, pics.astype(np.int64, copy=False))
+
+        return {
+            "granularite": self.granularite,
+            "pic_requetes_par_seconde": int(pics_par_intervalle.max()),
+            "series": [
+                {
+                    "debut": datetime.fromtimestamp(int(debut) * duree,
+                                                    timezone.utc).isoformat(),
+                    "requetes": int(total),
+                    "octets": int(total_octets),
+                    "erreurs": int(total_erreurs),
+                    "pic_requetes_par_seconde": int(pic)
+                }
+                for debut, total, total_octets, total_erreurs, pic in zip(
+                    debuts, requetes_par_intervalle, octets_par_intervalle,
+                    erreurs_par_intervalle, pics_par_intervalle
+                )
+            ]
+        }
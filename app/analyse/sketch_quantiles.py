@@ -0,0 +1,371 @@
+"""
+Module pour l'estimation de quantiles en flux (streaming) via un sketch KLL.
+"""
+
+from math import ceil
+from random import Random
+from typing import Optional, Union
+
+
+class SketchQuantiles:
+    """
+    Représente un sketch KLL (Karnin, Lang, Liberty) pour estimer les quantiles
+    d'un flux de valeurs numériques sans conserver toutes les valeurs en mémoire.
+
+    Le sketch est composé d'une hiérarchie de compacteurs. Lorsque un compacteur
+    est plein, ses valeurs sont triées et une valeur sur deux est promue au niveau
+    supérieur, où chaque valeur compte deux fois plus. La mémoire utilisée reste
+    proportionnelle à ``k`` quel que soit le nombre de valeurs ajoutées, et deux
+    sketchs peuvent être fusionnés sans perte de garantie.
+
+    Attributes:
+        k (int): La précision du sketch. Plus sa valeur est grande, plus les
+            quantiles estimés sont précis et plus la mémoire utilisée est importante.
+        total (int): Le nombre total de valeurs ajoutées au sketch.
+        minimum (Optional[Union[int, float]]): La plus petite valeur ajoutée.
+        maximum (Optional[Union[int, float]]): La plus grande valeur ajoutée.
+        graine (int): La graine du générateur pseudo-aléatoire.
+        _compacteurs (list): Les compacteurs du sketch, du niveau 0 (poids 1)
+            au niveau le plus haut (poids 2^niveau).
+        _aleatoire (Random): Le générateur pseudo-aléatoire pour choisir les valeurs
+            promues lors d'une compaction.
+
+    Class-level variables:
+        :cvar QUANTILES_RAPPORT (dict): Les quantiles présents dans les statistiques
+            retournées par :meth:`get_statistiques`.
+    """
+
+    QUANTILES_RAPPORT: dict = {
+        "p50": 0.5,
+        "p90": 0.9,
+        "p99": 0.99,
+        "p999": 0.999
+    }
+
+    def __init__(self, k: int = 200, graine: int = 0):
+        """
+        Initialise un sketch vide.
+
+        Args:
+            k (int): La précision du sketch. Par défaut, sa valeur est égale à ``200``
+                (erreur de rang d'environ 1%).
+            graine (int): La graine du générateur pseudo-aléatoire. Par défaut, sa
+                valeur est égale à ``0`` pour que les résultats soient reproductibles.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Le paramètre ``k`` est inférieur à ``8``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(k, int) or isinstance(k, bool):
+            raise TypeError("La précision du sketch doit être un entier.")
+        if not isinstance(graine, int) or isinstance(graine, bool):
+            raise TypeError("La graine du sketch doit être un entier.")
+        # Vérification de la valeur des paramètres
+        if k < 8:
+            raise ValueError("La précision du sketch doit être supérieure ou égale à 8.")
+
+        # Initialisation du sketch
+        self.k = k
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.graine = graine
+        self._compacteurs = [[]]
+        self._aleatoire = Random(graine)
+        self._taille = 0
+        self._taille_maximale = self._capacite(0)
+
+    def _capacite(self, niveau: int) -> int:
+        """
+        Retourne la capacité du compacteur au niveau ``niveau``. Les niveaux les plus
+        bas ont une capacité plus faible que les niveaux hauts.
+
+        Args:
+            niveau (int): Le niveau du compacteur.
+
+        Returns:
+            int: Le nombre de valeurs que le compacteur peut contenir avant compaction.
+        """
+        profondeur = len(self._compacteurs) - niveau - 1
+        return int(ceil(self.k * (2 / 3) ** profondeur)) + 1
+
+    def _recalcule_taille_maximale(self) -> None:
+        """
+        Met à jour le nombre total de valeurs que peut contenir le sketch avant
+        qu'une compaction soit nécessaire.
+
+        Returns:
+            None
+        """
+        self._taille_maximale = sum(
+            self._capacite(niveau) for niveau in range(len(self._compacteurs))
+        )
+
+    def ajoute(self, valeur: Union[int, float]) -> None:
+        """
+        Ajoute une valeur au sketch.
+
+        Args:
+            valeur (Union[int, float]): La valeur à ajouter.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: La valeur n'est pas un nombre.
+        """
+        # Vérification du type du paramètre
+        if not isinstance(valeur, (int, float)) or isinstance(valeur, bool):
+            raise TypeError("La valeur à ajouter au sketch doit être un nombre.")
+
+        # Ajout de la valeur
+        self._compacteurs[0].append(valeur)
+        self._taille += 1
+        self.total += 1
+        if self.minimum is None or valeur < self.minimum:
+            self.minimum = valeur
+        if self.maximum is None or valeur > self.maximum:
+            self.maximum = valeur
+        # Compaction si le sketch est plein
+        if self._taille >= self._taille_maximale:
+            self._compresse()
+
+    def ajoute_valeurs(self, valeurs: list) -> None:
+        """
+        Ajoute plusieurs valeurs au sketch. Le résultat est identique à des appels
+        successifs à :meth:`ajoute` dans le même ordre, mais les valeurs sont ajoutées
+        par blocs jusqu'à la prochaine compaction.
+
+        Args:
+            valeurs (list): Les valeurs à ajouter.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: Le paramètre ``valeurs`` n'est pas une liste de nombres.
+        """
+        # Vérification du type du paramètre
+        if not isinstance(valeurs, list):
+            raise TypeError("Les valeurs à ajouter au sketch doivent être dans une liste.")
+        if not all(isinstance(valeur, (int, float)) and not isinstance(valeur, bool)
+                   for valeur in valeurs):
+            raise TypeError("Les valeurs à ajouter au sketch doivent être des nombres.")
+        if not valeurs:
+            return
+
+        # Mise à jour des informations globales
+        self.total += len(valeurs)
+        minimum, maximum = min(valeurs), max(valeurs)
+        if self.minimum is None or minimum < self.minimum:
+            self.minimum = minimum
+        if self.maximum is None or maximum > self.maximum:
+            self.maximum = maximum
+        # Ajout par blocs, une compaction a lieu exactement comme avec ajoute()
+        debut = 0
+        while debut < len(valeurs):
+            fin = debut + self._taille_maximale - self._taille
+            bloc = valeurs[debut:fin]
+            self._compacteurs[0].extend(bloc)
+            self._taille += len(bloc)
+            debut += len(bloc)
+            if self._taille >= self._taille_maximale:
+                self._compresse()
+
+    def _compresse(self) -> None:
+        """
+        Compacte les niveaux pleins jusqu'à ce que le sketch repasse sous sa
+        taille maximale.
+
+        Returns:
+            None
+        """
+        while self._taille >= self._taille_maximale:
+            for niveau, compacteur in enumerate(self._compacteurs):
+                if len(compacteur) < self._capacite(niveau):
+                    continue
+                # Ajout d'un niveau supérieur si nécessaire
+                if niveau + 1 == len(self._compacteurs):
+                    self._compacteurs.append([])
+                    self._recalcule_taille_maximale()
+                # Une valeur sur deux est promue, en partant d'un décalage aléatoire
+                compacteur.sort()
+                valeur_isolee = compacteur.pop() if len(compacteur) % 2 else None
+                decalage = self._aleatoire.randint(0, 1)
+                self._compacteurs[niveau + 1].extend(compacteur[decalage::2])
+                compacteur.clear()
+                if valeur_isolee is not None:
+                    compacteur.append(valeur_isolee)
+                self._taille = sum(len(compacteur) for compacteur in self._compacteurs)
+                break
+            else:
+                break
+
+    def fusionne(self, autre: "SketchQuantiles") -> None:
+        """
+        Fusionne un autre sketch dans ce sketch. Le sketch ``autre`` n'est pas modifié.
+
+        Args:
+            autre (SketchQuantiles): Le sketch à fusionner.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: Le paramètre ``autre`` n'est pas un :class:`SketchQuantiles`.
+        """
+        # Vérification du type du paramètre
+        if not isinstance(autre, SketchQuantiles):
+            raise TypeError("Le sketch à fusionner doit être de type SketchQuantiles.")
+
+        # Fusion des compacteurs niveau par niveau (même classe : accès direct, sans copie)
+        compacteurs = autre._compacteurs  # pylint: disable=protected-access
+        while len(self._compacteurs) < len(compacteurs):
+            self._compacteurs.append([])
+        for niveau, compacteur in enumerate(compacteurs):
+            self._compacteurs[niveau].extend(compacteur)
+        # Fusion des informations globales
+        self.total += autre.total
+        if autre.minimum is not None:
+            if self.minimum is None or autre.minimum < self.minimum:
+                self.minimum = autre.minimum
+            if self.maximum is None or autre.maximum > self.maximum:
+                self.maximum = autre.maximum
+        # Compaction si nécessaire
+        self._taille = sum(len(compacteur) for compacteur in self._compacteurs)
+        self._recalcule_taille_maximale()
+        self._compresse()
+
+    def get_dict(self) -> dict:
+        """
+        Retourne l'état complet du sketch sous forme d'un dictionnaire sérialisable
+        en JSON, pour le transmettre puis le fusionner ailleurs.
+
+        Returns:
+            dict: Un dictionnaire contenant k, graine, total, minimum, maximum et
+                compacteurs (les valeurs de chaque niveau).
+        """
+        return {
+            "k": self.k,
+            "graine": self.graine,
+            "total": self.total,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "compacteurs": [list(compacteur) for compacteur in self._compacteurs]
+        }
+
+    @classmethod
+    def depuis_dict(cls, etat: dict) -> "SketchQuantiles":
+        """
+        Reconstruit un sketch à partir du dictionnaire retourné par :meth:`get_dict`.
+
+        Args:
+            etat (dict): L'état du sketch.
+
+        Returns:
+            SketchQuantiles: Le sketch reconstruit.
+
+        Raises:
+            TypeError: Le paramètre ``etat`` n'est pas un dictionnaire.
+            ValueError: L'état est incomplet ou incohérent.
+        """
+        # Vérification du paramètre
+        if not isinstance(etat, dict):
+            raise TypeError("L'état d'un sketch doit être un dictionnaire.")
+        cles = ("k", "graine", "total", "minimum", "maximum", "compacteurs")
+        if any(cle not in etat for cle in cles):
+            raise ValueError(f"L'état d'un sketch doit contenir les clés : {', '.join(cles)}.")
+        compacteurs = etat["compacteurs"]
+        if (not isinstance(compacteurs, list) or not compacteurs
+                or not all(isinstance(compacteur, list) for compacteur in compacteurs)):
+            raise ValueError("Les compacteurs d'un sketch doivent être une liste non vide "
+                             "de listes.")
+
+        sketch = cls(etat["k"], etat["graine"])
+        sketch.total = etat["total"]
+        sketch.minimum = etat["minimum"]
+        sketch.maximum = etat["maximum"]
+        sketch._compacteurs = [list(compacteur) for compacteur in compacteurs]
+        sketch._taille = sum(len(compacteur) for compacteur in sketch._compacteurs)
+        sketch._recalcule_taille_maximale()
+        return sketch
+
+    def quantile(self, rang: float) -> Optional[Union[int, float]]:
+        """
+        Retourne une estimation de la valeur au quantile ``rang``.
+
+        Args:
+            rang (float): Le quantile souhaité, compris entre 0 et 1.
+
+        Returns:
+            Optional[Union[int, float]]: La valeur estimée, ou ``None`` si le sketch
+                est vide.
+
+        Raises:
+            TypeError: Le paramètre ``rang`` n'est pas un nombre.
+            ValueError: Le paramètre ``rang`` n'est pas compris entre 0 et 1.
+        """
+        # Vérification du paramètre
+        if not isinstance(rang, (int, float)) or isinstance(rang, bool):
+            raise TypeError("Le quantile doit être un nombre.")
+        if not 0 <= rang <= 1:
+            raise ValueError("Le quantile doit être compris entre 0 et 1.")
+
+        return self.quantiles([rang])[0]
+
+    def quantiles(self, rangs: list) -> list:
+        """
+        Retourne une estimation des valeurs pour plusieurs quantiles en un seul
+        parcours du sketch.
+
+        Args:
+            rangs (list): Les quantiles souhaités, compris entre 0 et 1.
+
+        Returns:
+            list: Les valeurs estimées dans le même ordre que ``rangs``. Chaque valeur
+                est ``None`` si le sketch est vide.
+        """
+        if self.total == 0:
+            return [None] * len(rangs)
+        # Valeurs pondérées triées
+        valeurs_ponderees = sorted(
+            (valeur, 2 ** niveau)
+            for niveau, compacteur in enumerate(self._compacteurs)
+            for valeur in compacteur
+        )
+        poids_total = sum(poids for _, poids in valeurs_ponderees)
+        # Recherche du rang de chaque quantile (méthode du rang le plus proche)
+        resultats = []
+        for rang in rangs:
+            rang_cible = max(1, ceil(rang * poids_total))
+            poids_cumule = 0
+            resultat = valeurs_ponderees[-1][0]
+            for valeur, poids in valeurs_ponderees:
+                poids_cumule += poids
+                if poids_cumule >= rang_cible:
+                    resultat = valeur
+                    break
+            resultats.append(resultat)
+        return resultats
+
+    def get_statistiques(self) -> dict:
+        """
+        Retourne les statistiques du sketch sous forme d'un dictionnaire.
+
+        Returns:
+            dict: Un dictionnaire contenant :
+                - total: Le nombre de valeurs.
+                - minimum: La plus petite valeur.
+                - maximum: La plus grande valeur.
+                - p50, p90, p99, p999: Les quantiles de :attr:`QUANTILES_RAPPORT`.
+                Les valeurs sont ``None`` si le sketch est vide.
+        """
+        statistiques = {
+            "total": self.total,
+            "minimum": self.minimum,
+            "maximum": self.maximum
+        }
+        valeurs = self.quantiles(list(self.QUANTILES_RAPPORT.values()))
+        statistiques.update(zip(self.QUANTILES_RAPPORT.keys(), valeurs))
+        return statistiques
@@ -0,0 +1,167 @@
+"""
+Module pour les statistiques fusionnables des réponses (codes de statut http et
+quantiles) d'une analyse de log Apache.
+"""
+
+from donnees.reponse_informations import ReponseInformations
+from analyse.sketch_quantiles import SketchQuantiles
+
+
+class StatistiquesReponses:
+    """
+    Représente le nombre de réponses par code de statut http et les sketchs des
+    quantiles de la taille et du temps des réponses, alimentés réponse par réponse.
+
+    Attributes:
+        codes (dict): Le nombre de réponses par code de statut http, dans l'ordre de
+            première apparition.
+        sketchs (dict): Pour chaque champ de :attr:`CHAMPS_QUANTILES`, le sketch global
+            (clé ``None``) et un sketch par code de statut http.
+
+    Class-level variables:
+        :cvar CHAMPS_QUANTILES (tuple): Les champs de la réponse estimés par des sketchs.
+    """
+
+    CHAMPS_QUANTILES: tuple = ("taille_octets", "temps_reponse")
+
+    def __init__(self):
+        """
+        Initialise des statistiques vides.
+        """
+        self.codes = {}
+        self.sketchs = {champ: {None: SketchQuantiles()} for champ in self.CHAMPS_QUANTILES}
+
+    def ajoute(self, reponse: ReponseInformations) -> None:
+        """
+        Ajoute une réponse aux statistiques.
+
+        Args:
+            reponse (ReponseInformations): La réponse à ajouter.
+
+        Returns:
+            None
+        """
+        code = reponse.code_statut_http
+        self.codes[code] = self.codes.get(code, 0) + 1
+        for champ, sketchs in self.sketchs.items():
+            valeur = getattr(reponse, champ)
+            if valeur is None:
+                continue
+            sketchs[None].ajoute(valeur)
+            if code not in sketchs:
+                sketchs[code] = SketchQuantiles()
+            sketchs[code].ajoute(valeur)
+
+    def fusionne(self, autre: "StatistiquesReponses") -> None:
+        """
+        Fusionne d'autres statistiques dans celles-ci. Les statistiques ``autre`` ne
+        sont pas modifiées.
+
+        Args:
+            autre (StatistiquesReponses): Les statistiques à fusionner.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: Le paramètre ``autre`` n'est pas un :class:`StatistiquesReponses`.
+        """
+        # Vérification du paramètre
+        if not isinstance(autre, StatistiquesReponses):
+            raise TypeError("Les statistiques à fusionner doivent être de type "
+                            "StatistiquesReponses.")
+
+        for code, total in autre.codes.items():
+            self.codes[code] = self.codes.get(code, 0) + total
+        for champ, sketchs in self.sketchs.items():
+            for code, sketch_autre in autre.sketchs[champ].items():
+                if code not in sketchs:
+                    sketchs[code] = SketchQuantiles()
+                sketchs[code].fusionne(sketch_autre)
+
+    def get_repartition_codes(self, total_entrees: int) -> list:
+        """
+        Retourne la répartition des réponses par code de statut http. Les codes à
+        égalité restent dans l'ordre de première apparition.
+
+        Args:
+            total_entrees (int): Le nombre d'entrées sur lequel les taux sont calculés.
+
+        Returns:
+            list: Les codes, leur total et leur taux, triés par total décroissant.
+        """
+        codes = sorted(self.codes.items(), key=lambda element: element[1], reverse=True)
+        return [{"code": code, "total": total, "taux": total / total_entrees * 100}
+                for code, total in codes]
+
+    def get_statistiques_quantiles(self, champ: str) -> dict:
+        """
+        Retourne les statistiques de quantiles d'un champ, au format de
+        :meth:`AnalyseurLogApache._get_statistiques_quantiles`.
+
+        Args:
+            champ (str): Un des champs de :attr:`CHAMPS_QUANTILES`.
+
+        Returns:
+            dict: Les statistiques globales et par code de statut http.
+        """
+        sketchs = self.sketchs[champ]
+        return {
+            "global": sketchs[None].get_statistiques(),
+            "par_code_statut_http": [
+                {"code": code, **sketchs[code].get_statistiques()}
+                for code in sorted(code for code in sketchs if code is not None)
+            ]
+        }
+
+    def get_dict(self) -> dict:
+        """
+        Retourne les statistiques sous forme d'un dictionnaire sérialisable en JSON.
+
+        Returns:
+            dict: Un dictionnaire contenant :
+                - codes: Les listes ``[code, total]``, dans l'ordre de première apparition.
+                - sketchs: Pour chaque champ, le sketch global et la liste des
+                  ``[code, sketch]``.
+        """
+        return {
+            "codes": [[code, total] for code, total in self.codes.items()],
+            "sketchs": {
+                champ: {
+                    "global": sketchs[None].get_dict(),
+                    "par_code_statut_http": [
+                        [code, sketch.get_dict()]
+                        for code, sketch in sketchs.items() if code is not None
+                    ]
+                }
+                for champ, sketchs in self.sketchs.items()
+            }
+        }
+
+    @classmethod
+    def depuis_dict(cls, etat: dict) -> "StatistiquesReponses":
+        """
+        Reconstruit des statistiques à partir du dictionnaire retourné par
+        :meth:`get_dict`.
+
+        Args:
+            etat (dict): Les statistiques sérialisées.
+
+        Returns:
+            StatistiquesReponses: Les statistiques reconstruites.
+
+        Raises:
+            KeyError: Une clé est absente.
+            TypeError: Une valeur n'est pas du type attendu.
+            ValueError: Un sketch est invalide.
+        """
+        statistiques = cls()
+        statistiques.codes = dict(etat["codes"])
+        for champ in cls.CHAMPS_QUANTILES:
+            sketchs = etat["sketchs"][champ]
+            statistiques.sketchs[champ] = {
+                None: SketchQuantiles.depuis_dict(sketchs["global"]),
+                **{code: SketchQuantiles.depuis_dict(sketch)
+                   for code, sketch in sketchs["par_code_statut_http"]}
+            }
+        return statistiques
@@ -0,0 +1,23 @@
+"""
+Module pour les vérifications de paramètres communes aux analyses.
+"""
+
+
+def verifie_nombre_par_top(nombre_par_top: int) -> None:
+    """
+    Vérifie le nombre maximal d'éléments des classements d'une analyse.
+
+    Args:
+        nombre_par_top (int): Le nombre maximal d'éléments de chaque classement.
+
+    Returns:
+        None
+
+    Raises:
+        TypeError: Le paramètre ``nombre_par_top`` n'est pas un entier.
+        ValueError: Le paramètre ``nombre_par_top`` est inférieur à ``0``.
+    """
+    if not isinstance(nombre_par_top, int) or isinstance(nombre_par_top, bool):
+        raise TypeError("Le nombre par top doit être un entier.")
+    if nombre_par_top < 0:
+        raise ValueError("Le nombre par top doit être supérieur ou égale à 0.")
@@ -3,16 +3,76 @@ Module pour analyser les arguments passés en ligne de commande.
 """
 
 from argparse import ArgumentParser, Namespace
+from json import load, JSONDecodeError
 from re import match
+from sys import argv
 from typing import Optional
+from analyse.moteur_groupement import SpecificationGroupement
+from analyse.expression_filtre import ExpressionFiltre, ExpressionFiltreInvalideException
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.entrepot_agregats import EntrepotAgregats
+from cli.types_arguments_cli import (definition_filtre, nombre_positif, taux, date_iso, port_tcp,
+                                     modele_route, expression_filtre)
 
 
 class ParseurArgumentsCLI(ArgumentParser):
     """
     Représente un parseur pour analyser les arguments passés en ligne
     de commande pour l'application.
+
+    L'application propose plusieurs commandes. Si le premier argument n'est pas
+    le nom d'une commande, la commande ``analyser`` est utilisée.
+
+    Class-level variables:
+        :cvar COMMANDES (tuple): Les commandes disponibles, la première étant
+            celle par défaut.
+        :cvar REGEX_CHEMIN (str): L'expression régulière des chemins de fichiers et
+            de dossiers acceptés.
+        :cvar OPTIONS_INCOMPATIBLES (tuple): Pour la commande ``analyser``, les
+            ``(options, options_incompatibles, message)`` : si une des options est
+            utilisée avec une des options incompatibles, l'erreur ``message`` est levée.
+            L'option ``moteur`` est utilisée lorsque le moteur n'est pas ``python``.
     """
 
+    COMMANDES: tuple = ("analyser", "fusionner", "servir", "surveiller", "coordonner",
+                         "travailler", "tendance")
+
+    REGEX_CHEMIN: str = r"^[a-zA-Z0-9:_\\\-.\/]+$"
+
+    OPTIONS_INCOMPATIBLES: tuple = (
+        (("abus", "slo", "agents", "attaques", "arborescence", "navigation", "nouveautes"),
+         ("filtres", "fichier_filtres", "sessions"),
+         "Les options --abus, --slo, --agents, --attaques, --arborescence, --navigation et "
+         "--nouveautes ne peuvent pas être combinées avec une analyse multi-filtres ou une "
+         "analyse des sessions."),
+        (("entrepot",), ("pipe", "sessions", "filtres", "fichier_filtres"),
+         "L'option --entrepot ne peut pas être combinée avec l'option --pipe, une analyse "
+         "des sessions ou une analyse multi-filtres."),
+        (("sqlite",), ("pipe", "sessions", "logs_supplementaires"),
+         "L'option --sqlite ne peut pas être combinée avec l'option --pipe, l'option "
+         "--ajout-log ou une analyse des sessions."),
+        (("pipe",), ("chemin_log",),
+         "L'option --pipe lit l'entrée standard, aucun fichier log ne doit être indiqué."),
+        (("pipe",), ("filtres", "fichier_filtres", "logs_supplementaires", "sessions",
+                     "groupements", "index", "etat_partiel", "moteur"),
+         "L'option --pipe ne peut pas être combinée avec une analyse multi-filtres, "
+         "--ajout-log, --sessions, des regroupements, --index, --etat-partiel ou le "
+         "moteur 'pandas'."),
+        (("sessions",), ("filtres", "fichier_filtres", "groupements", "index",
+                         "etat_partiel", "camembert", "moteur"),
+         "L'option --sessions ne peut pas être combinée avec une analyse multi-filtres, "
+         "des regroupements, --index, --etat-partiel, --camembert ou le moteur 'pandas'."),
+        (("filtres", "fichier_filtres"), ("ip", "code_statut_http", "expression"),
+         "Les options -i, -c et -e ne peuvent pas être combinées avec une analyse "
+         "multi-filtres (--filtre ou --fichier-filtres)."),
+        (("logs_supplementaires",), ("filtres", "fichier_filtres", "moteur"),
+         "L'option --ajout-log ne peut pas être combinée avec une analyse multi-filtres "
+         "(--filtre ou --fichier-filtres) ou le moteur 'pandas'."),
+        (("etat_partiel",), ("filtres", "fichier_filtres"),
+         "L'option --etat-partiel ne peut pas être combinée avec une analyse "
+         "multi-filtres (--filtre ou --fichier-filtres).")
+    )
+
     def __init__(self):
         """
         Initialise uparseur pour analyser les arguments passés en ligne de commande.
@@ -24,19 +84,73 @@ class ParseurArgumentsCLI(ArgumentParser):
 
     def __set_arguments(self) -> None:
         """
-        Définit les arguments attendus par l'application.
+        Définit les commandes et les arguments attendus par l'application.
 
         Returns:
             None
         """
-        # -- Argument obligatoire --
-        self.add_argument(
+        commandes = self.add_subparsers(dest="commande", parser_class=ArgumentParser)
+        self.__set_arguments_analyser(commandes.add_parser(
+            "analyser",
+            allow_abbrev=False,
+            help="Analyse un fichier log Apache (commande par défaut)."
+        ))
+        self.__set_arguments_fusionner(commandes.add_parser(
+            "fusionner",
+            allow_abbrev=False,
+            help="Fusionne des états partiels d'analyse en une analyse complète. La clé "
+                "'precisions' indique si le pic de requêtes par seconde est exact ou une "
+                "borne inférieure (états dont les plages de temps se chevauchent), et si "
+                "les totaux des urls les plus demandées sont exacts ou estimés."
+        ))
+        self.__set_arguments_servir(commandes.add_parser(
+            "servir",
+            allow_abbrev=False,
+            help="Charge des fichiers log en mémoire et répond aux requêtes d'analyse "
+                "d'un serveur HTTP local."
+        ))
+        self.__set_arguments_surveiller(commandes.add_parser(
+            "surveiller",
+            allow_abbrev=False,
+            help="Ingère en continu les fichiers log d'un répertoire et expose leurs "
+                "métriques au format Prometheus."
+        ))
+        self.__set_arguments_coordonner(commandes.add_parser(
+            "coordonner",
+            allow_abbrev=False,
+            help="Distribue l'analyse de fichiers log à des travailleurs connectés par TCP."
+        ))
+        self.__set_arguments_travailler(commandes.add_parser(
+            "travailler",
+            allow_abbrev=False,
+            help="Analyse les tâches confiées par un coordinateur (commande 'coordonner')."
+        ))
+        self.__set_arguments_tendance(commandes.add_parser(
+            "tendance",
+            allow_abbrev=False,
+            help="Compare deux périodes consécutives à partir des agrégats d'un entrepôt "
+                "(option --entrepot de la commande 'analyser')."
+        ))
+
+    def __set_arguments_analyser(self, parseur: ArgumentParser) -> None:
+        """
+        Définit les arguments attendus par la commande ``analyser``.
+
+        Args:
+            parseur (ArgumentParser): Le parseur de la commande.
+
+        Returns:
+            None
+        """
+        # -- Argument obligatoire (sauf avec --pipe) --
+        parseur.add_argument(
             "chemin_log",
             type=str,
-            help="Chemin du fichier log Apache à analyser."
+            nargs="?",
+            help="Chemin du fichier log Apache à analyser ('-' pour l'entrée standard)."
         )
         # -- Argument optionnel --
-        self.add_argument(
+        parseur.add_argument(
             "-s",
             "--sortie",
             type=str,
@@ -44,24 +158,723 @@ class ParseurArgumentsCLI(ArgumentParser):
             help="Dossier où sera écrit l'analyse du fichier de log Apache. Par défaut,"
                 "sa valeur est le répertoire d'exécution du script.",
         )
-        self.add_argument(
+        parseur.add_argument(
+            "--pipe",
+            action="store_true",
+            help="Analyse en continu les lignes reçues sur l'entrée standard, par exemple "
+                "depuis Apache avec 'CustomLog \"|python app/main.py --pipe\" combined'. "
+                "L'analyse est exportée à intervalles réguliers, à la réception de SIGHUP "
+                "et à l'arrêt (SIGTERM ou fin du flux)."
+        )
+        parseur.add_argument(
+            "--intervalle-export",
+            type=nombre_positif,
+            default=60.0,
+            help="Avec --pipe, l'intervalle (en secondes) entre deux exportations de "
+                "l'analyse. Par défaut, sa valeur est 60."
+        )
+        parseur.add_argument(
+            "--ajout-log",
+            dest="logs_supplementaires",
+            type=str,
+            action="append",
+            default=[],
+            help="Un autre fichier log à analyser avec 'chemin_log' (par exemple celui d'un "
+                "autre serveur du pool). Peut être répété : les entrées de tous les "
+                "fichiers sont fusionnées en flux dans l'ordre de leur horodatage."
+        )
+        parseur.add_argument(
+            "--tampon-reordonnancement",
+            type=int,
+            default=1000,
+            help="Avec --ajout-log, le nombre d'entrées par fichier mises en attente "
+                "pour réordonner les lignes légèrement désordonnées. Par défaut, sa "
+                "valeur est 1000."
+        )
+        self.__set_arguments_filtre_et_agregats(parseur)
+        parseur.add_argument(
+            "--filtre",
+            dest="filtres",
+            type=definition_filtre,
+            action="append",
+            default=[],
+            help="Un filtre d'une analyse multi-filtres, sous la forme 'ip=IP,code=CODE' "
+                "(au moins une des deux clés). Peut être répété : une analyse est produite "
+                "par filtre en un seul parcours du fichier log."
+        )
+        parseur.add_argument(
+            "--fichier-filtres",
+            type=str,
+            help="Fichier JSON contenant une liste de filtres pour une analyse multi-filtres. "
+                "Chaque filtre est un dictionnaire avec les clés optionnelles 'adresse_ip' "
+                "et 'code_statut_http'."
+        )
+        parseur.add_argument(
+            "--moteur",
+            type=str,
+            choices=["python", "pandas"],
+            default="python",
+            help="Le moteur d'analyse. 'pandas' calcule les statistiques de manière "
+                "vectorisée et produit la même analyse que 'python'. Par défaut, sa "
+                "valeur est 'python'."
+        )
+        parseur.add_argument(
+            "--index",
+            action="store_true",
+            help="Construit des index inversés des entrées (adresse IP, code de statut "
+                "http, méthode http) pour une analyse multi-filtres : chaque filtre ne "
+                "vérifie que les entrées candidates trouvées par les index."
+        )
+        parseur.add_argument(
+            "--abus",
+            action="store_true",
+            help="Ajoute à l'analyse le classement des adresses IP sur la dernière fenêtre "
+                "et les périodes pendant lesquelles le débit d'une adresse dépasse sa "
+                "référence (moyenne mobile exponentielle de son débit)."
+        )
+        parseur.add_argument(
+            "--fenetre-abus",
+            type=int,
+            default=300,
+            help="Avec --abus, la durée (en secondes, multiple de 10) de la fenêtre "
+                "glissante. Par défaut, sa valeur est 300."
+        )
+        parseur.add_argument(
+            "--seuil-abus",
+            type=nombre_positif,
+            default=3.0,
+            help="Avec --abus, le facteur de dépassement de la référence qui signale une "
+                "adresse. Par défaut, sa valeur est 3."
+        )
+        parseur.add_argument(
+            "--slo",
+            action="store_true",
+            help="Ajoute à l'analyse le taux d'erreurs (réponses 5xx) par fenêtre, les "
+                "pires fenêtres et le taux de consommation du budget d'erreurs sur une "
+                "heure et six heures."
+        )
+        parseur.add_argument(
+            "--objectif-slo",
+            type=nombre_positif,
+            default=0.999,
+            help="Avec --slo, la proportion de réponses sans erreur visée (strictement "
+                "inférieure à 1). Par défaut, sa valeur est 0.999."
+        )
+        parseur.add_argument(
+            "--fenetre-slo",
+            type=int,
+            default=300,
+            help="Avec --slo, la durée (en secondes, diviseur de 3600) d'une fenêtre. "
+                "Par défaut, sa valeur est 300."
+        )
+        parseur.add_argument(
+            "--agents",
+            action="store_true",
+            help="Ajoute à l'analyse la répartition des requêtes par robot, navigateur et "
+                "système d'exploitation, selon la classification des agents utilisateurs."
+        )
+        parseur.add_argument(
+            "--regles-agents",
+            type=str,
+            default=None,
+            help="Avec --agents, le fichier JSON des règles de classification des agents "
+                "utilisateurs. Par défaut, celui fourni avec l'application "
+                "(assets/regles_agents.json)."
+        )
+        parseur.add_argument(
+            "--attaques",
+            action="store_true",
+            help="Ajoute à l'analyse les requêtes dont l'url contient une signature "
+                "d'attaque ou de scanner de vulnérabilités, et les clients suspects "
+                "classés par score."
+        )
+        parseur.add_argument(
+            "--signatures-attaques",
+            type=str,
+            default=None,
+            help="Avec --attaques, le fichier JSON des signatures d'attaques. Par défaut, "
+                "celui fourni avec l'application (assets/signatures_attaques.json)."
+        )
+        parseur.add_argument(
+            "--arborescence",
+            action="store_true",
+            help="Ajoute à l'analyse les chemins les plus demandés de chaque niveau de "
+                "l'arborescence des urls (ex: /api, /api/v2, /api/v2/commandes), avec "
+                "leurs octets et leur taux d'erreurs."
+        )
+        parseur.add_argument(
+            "--profondeur-arborescence",
+            type=int,
+            default=3,
+            help="Avec --arborescence, le nombre maximal de segments des chemins "
+                "agrégés. Par défaut, sa valeur est 3."
+        )
+        parseur.add_argument(
+            "--navigation",
+            action="store_true",
+            help="Ajoute à l'analyse les liens (domaine référent, url) les plus suivis et "
+                "les domaines externes qui amènent le plus de requêtes."
+        )
+        parseur.add_argument(
+            "--domaine-interne",
+            dest="domaines_internes",
+            type=str,
+            action="append",
+            default=[],
+            help="Avec --navigation, un domaine considéré comme interne en plus de l'hôte "
+                "virtuel des requêtes (ex: 'exemple.fr'). Peut être répété."
+        )
+        parseur.add_argument(
+            "--nouveautes",
+            action="store_true",
+            help="Ajoute à l'analyse les adresses IP et les urls jamais rencontrées lors "
+                "des exécutions précédentes, mémorisées dans des filtres de Bloom "
+                "enregistrés dans le dossier de sortie."
+        )
+        parseur.add_argument(
+            "--capacite-nouveautes",
+            type=int,
+            default=1000000,
+            help="Avec --nouveautes, le nombre de clés prévu de chaque nouveau filtre de "
+                "Bloom. Par défaut, sa valeur est 1000000."
+        )
+        parseur.add_argument(
+            "--taux-faux-positifs",
+            type=taux,
+            default=0.01,
+            help="Avec --nouveautes, le taux de faux positifs (clé nouvelle considérée "
+                "comme déjà rencontrée) visé de chaque nouveau filtre de Bloom. Par "
+                "défaut, sa valeur est 0.01."
+        )
+        parseur.add_argument(
+            "--sessions",
+            action="store_true",
+            help="Analyse les sessions des clients (adresse IP et agent utilisateur) au "
+                "lieu des statistiques des requêtes : nombre, nombre de requêtes, durée, "
+                "urls d'entrée et de sortie. Les entrées sont parcourues en flux dans "
+                "l'ordre de leur horodatage (voir --ajout-log)."
+        )
+        parseur.add_argument(
+            "--delai-session",
+            type=int,
+            default=1800,
+            help="Avec --sessions, la durée maximale (en secondes) entre deux requêtes "
+                "d'une même session. Par défaut, sa valeur est 1800."
+        )
+        parseur.add_argument(
+            "--etat-partiel",
+            action="store_true",
+            help="Exporte également l'état partiel de l'analyse (compteurs bruts et "
+                "sketchs) dans 'etat-partiel-analyse.json', pour le fusionner ensuite "
+                "avec la commande 'fusionner'."
+        )
+        parseur.add_argument(
+            "--entrepot",
+            type=str,
+            default=None,
+            help="Ajoute les agrégats de l'analyse (séries temporelles, codes de statut "
+                "http et urls les plus demandées) à l'entrepôt SQLite indiqué, créé s'il "
+                "n'existe pas, pour la commande 'tendance'."
+        )
+        parseur.add_argument(
+            "--sqlite",
+            action="store_true",
+            help="Exporte également toutes les entrées parsées dans la base SQLite "
+                "'entrees-log-apache.sqlite', pour les interroger en SQL."
+        )
+        parseur.add_argument(
+            "--camembert",
+            action="store_true",
+            help="Active la génération d'histogrammes pour les statistiques compatibles."
+        )
+
+    def __set_arguments_filtre_et_agregats(self, parseur: ArgumentParser) -> None:
+        """
+        Définit les arguments du filtre et des agrégats communs aux commandes
+        ``analyser`` et ``coordonner``.
+
+        Args:
+            parseur (ArgumentParser): Le parseur de la commande.
+
+        Returns:
+            None
+        """
+        parseur.add_argument(
             "-i",
             "--ip",
             type=str,
-            help="L'adresse IP que doivent avoir les entrées à analyser."
+            help="L'adresse IP exacte que doivent avoir les entrées à analyser. Les "
+                "réseaux CIDR et les listes '@chemin' s'utilisent avec -e, par exemple "
+                "-e 'ip = 10.0.0.0/8'."
         )
-        self.add_argument(
+        parseur.add_argument(
             "-c",
             "--code-statut-http",
             type=int,
             help="Le code de statut http que doivent avoir les entrées à analyser."
         )
-        self.add_argument(
+        parseur.add_argument(
+            "-e",
+            "--expression",
+            type=expression_filtre,
+            help="Une expression de filtre que doivent satisfaire les entrées à analyser, "
+                "par exemple 'code = 5xx et ip = 10.0.0.0/8 et url ^= /api'. Champs : "
+                f"{', '.join(ExpressionFiltre.CHAMPS)}. Opérateurs : =, !=, in (...), "
+                "^= (préfixe), ~ (expression régulière), <, <=, >, >=, combinés avec "
+                "et, ou, non et des parenthèses."
+        )
+        parseur.add_argument(
+            "-g",
+            "--granularite",
+            type=str,
+            choices=["minute", "heure", "jour"],
+            default="heure",
+            help="L'intervalle de regroupement des séries temporelles du trafic, "
+                "aligné sur l'heure UTC (un 'jour' commence à minuit UTC). "
+                "Par défaut, sa valeur est 'heure'."
+        )
+        parseur.add_argument(
+            "--groupement",
+            dest="groupements",
+            type=SpecificationGroupement,
+            action="append",
+            default=[],
+            help="Un regroupement (group-by) à calculer, sous la forme de dimensions "
+                "séparées par des virgules (ex: 'methode,code'). Peut être répété. "
+                "Dimensions disponibles : "
+                f"{', '.join(SpecificationGroupement.DIMENSIONS)}."
+        )
+        parseur.add_argument(
+            "--normalise-urls",
+            action="store_true",
+            help="Regroupe les urls par route dans les classements : la chaîne de "
+                "requête est supprimée et les identifiants (nombres, UUID, empreintes "
+                "hexadécimales) sont remplacés par '{id}'."
+        )
+        parseur.add_argument(
+            "--route",
+            dest="routes",
+            type=modele_route,
+            action="append",
+            default=[],
+            help="Un modèle de route (ex: '/produit/{id}/avis' ou '/static/*') qui "
+                "remplace les urls correspondantes dans les classements. Peut être "
+                "répété et active --normalise-urls."
+        )
+
+    def __set_arguments_fusionner(self, parseur: ArgumentParser) -> None:
+        """
+        Définit les arguments attendus par la commande ``fusionner``.
+
+        Args:
+            parseur (ArgumentParser): Le parseur de la commande.
+
+        Returns:
+            None
+        """
+        # -- Argument obligatoire --
+        parseur.add_argument(
+            "etats",
+            type=str,
+            nargs="+",
+            help="Chemins des fichiers d'états partiels à fusionner (produits avec "
+                "l'option --etat-partiel)."
+        )
+        # -- Argument optionnel --
+        parseur.add_argument(
+            "-s",
+            "--sortie",
+            type=str,
+            default="./",
+            help="Dossier où sera écrit l'analyse fusionnée. Par défaut, sa valeur est "
+                "le répertoire d'exécution du script.",
+        )
+        parseur.add_argument(
             "--camembert",
             action="store_true",
             help="Active la génération d'histogrammes pour les statistiques compatibles."
         )
 
+    def __set_arguments_servir(self, parseur: ArgumentParser) -> None:
+        """
+        Définit les arguments attendus par la commande ``servir``.
+
+        Args:
+            parseur (ArgumentParser): Le parseur de la commande.
+
+        Returns:
+            None
+        """
+        # -- Argument obligatoire --
+        parseur.add_argument(
+            "logs",
+            type=str,
+            nargs="+",
+            help="Chemins des fichiers log à charger en mémoire."
+        )
+        # -- Argument optionnel --
+        parseur.add_argument(
+            "--hote",
+            type=str,
+            default="127.0.0.1",
+            help="L'adresse d'écoute du serveur. Par défaut, sa valeur est '127.0.0.1' "
+                "(uniquement la machine locale)."
+        )
+        parseur.add_argument(
+            "--port",
+            type=port_tcp,
+            default=8080,
+            help="Le port d'écoute du serveur. Par défaut, sa valeur est 8080."
+        )
+
+    def __set_arguments_surveiller(self, parseur: ArgumentParser) -> None:
+        """
+        Définit les arguments attendus par la commande ``surveiller``.
+
+        Args:
+            parseur (ArgumentParser): Le parseur de la commande.
+
+        Returns:
+            None
+        """
+        # -- Argument obligatoire --
+        parseur.add_argument(
+            "repertoire",
+            type=str,
+            help="Le répertoire des fichiers log à surveiller."
+        )
+        # -- Argument optionnel --
+        parseur.add_argument(
+            "--motif",
+            type=str,
+            default="*.log",
+            help="Le motif des noms de fichiers à suivre. Par défaut, sa valeur est "
+                "'*.log' (fichiers log vivants, sans leurs rotations ni leurs archives)."
+        )
+        parseur.add_argument(
+            "--depuis-debut",
+            action="store_true",
+            help="Ingère les fichiers déjà présents depuis leur début plutôt que "
+                "seulement leurs nouvelles lignes."
+        )
+        parseur.add_argument(
+            "--intervalle",
+            type=nombre_positif,
+            default=1.0,
+            help="L'attente en secondes entre deux passes sans nouvelle ligne. Par "
+                "défaut, sa valeur est 1."
+        )
+        parseur.add_argument(
+            "--hote",
+            type=str,
+            default="127.0.0.1",
+            help="L'adresse d'écoute de la route /metrics. Par défaut, sa valeur est "
+                "'127.0.0.1' (uniquement la machine locale)."
+        )
+        parseur.add_argument(
+            "--port",
+            type=port_tcp,
+            default=9464,
+            help="Le port d'écoute de la route /metrics. Par défaut, sa valeur est 9464."
+        )
+
+    def __set_arguments_coordonner(self, parseur: ArgumentParser) -> None:
+        """
+        Définit les arguments attendus par la commande ``coordonner``.
+
+        Args:
+            parseur (ArgumentParser): Le parseur de la commande.
+
+        Returns:
+            None
+        """
+        # -- Argument obligatoire --
+        parseur.add_argument(
+            "logs",
+            type=str,
+            nargs="+",
+            help="Chemins des fichiers log à analyser. Ils doivent être accessibles au "
+                "même chemin par les travailleurs."
+        )
+        # -- Argument optionnel --
+        parseur.add_argument(
+            "-s",
+            "--sortie",
+            type=str,
+            default="./",
+            help="Dossier où sera écrit l'analyse des fichiers log. Par défaut, sa valeur "
+                "est le répertoire d'exécution du script.",
+        )
+        self.__set_arguments_filtre_et_agregats(parseur)
+        parseur.add_argument(
+            "--taille-tache",
+            type=nombre_positif,
+            default=64.0,
+            help="La taille maximale (en Mio) de la plage d'un fichier confiée à un "
+                "travailleur. Par défaut, sa valeur est 64."
+        )
+        parseur.add_argument(
+            "--travailleurs",
+            type=int,
+            default=0,
+            help="Le nombre de travailleurs lancés sur la machine locale. Par défaut, sa "
+                "valeur est 0 (les travailleurs sont lancés séparément avec la commande "
+                "'travailler')."
+        )
+        parseur.add_argument(
+            "--hote",
+            type=str,
+            default="127.0.0.1",
+            help="L'adresse d'écoute du coordinateur. Par défaut, sa valeur est "
+                "'127.0.0.1' (uniquement la machine locale)."
+        )
+        parseur.add_argument(
+            "--port",
+            type=port_tcp,
+            default=9500,
+            help="Le port d'écoute du coordinateur. Par défaut, sa valeur est 9500."
+        )
+        parseur.add_argument(
+            "--camembert",
+            action="store_true",
+            help="Active la génération d'histogrammes pour les statistiques compatibles."
+        )
+
+    def __set_arguments_travailler(self, parseur: ArgumentParser) -> None:
+        """
+        Définit les arguments attendus par la commande ``travailler``.
+
+        Args:
+            parseur (ArgumentParser): Le parseur de la commande.
+
+        Returns:
+            None
+        """
+        # -- Argument optionnel --
+        parseur.add_argument(
+            "--hote",
+            type=str,
+            default="127.0.0.1",
+            help="L'adresse du coordinateur. Par défaut, sa valeur est '127.0.0.1'."
+        )
+        parseur.add_argument(
+            "--port",
+            type=port_tcp,
+            default=9500,
+            help="Le port du coordinateur. Par défaut, sa valeur est 9500."
+        )
+
+    def __set_arguments_tendance(self, parseur: ArgumentParser) -> None:
+        """
+        Définit les arguments attendus par la commande ``tendance``.
+
+        Args:
+            parseur (ArgumentParser): Le parseur de la commande.
+
+        Returns:
+            None
+        """
+        # -- Argument obligatoire --
+        parseur.add_argument(
+            "entrepot",
+            type=str,
+            help="Chemin de l'entrepôt SQLite des agrégats (option --entrepot de la "
+                "commande 'analyser')."
+        )
+        # -- Argument optionnel --
+        parseur.add_argument(
+            "-s",
+            "--sortie",
+            type=str,
+            default="./",
+            help="Dossier où sera écrite la tendance. Par défaut, sa valeur est le "
+                "répertoire d'exécution du script.",
+        )
+        parseur.add_argument(
+            "--periode",
+            type=str,
+            choices=list(EntrepotAgregats.PERIODES),
+            default="semaine",
+            help="La durée des deux périodes comparées. Par défaut, sa valeur est "
+                "'semaine'."
+        )
+        parseur.add_argument(
+            "--date",
+            dest="date_reference",
+            type=date_iso,
+            default=None,
+            help="Le dernier jour (AAAA-MM-JJ, UTC) de la période courante. Par défaut, "
+                "le jour de la dernière analyse de l'entrepôt."
+        )
+        parseur.add_argument(
+            "-i",
+            "--ip",
+            type=str,
+            help="L'adresse IP du filtre des analyses à comparer. Les analyses filtrées "
+                "ne sont comparées qu'aux analyses du même filtre."
+        )
+        parseur.add_argument(
+            "-c",
+            "--code-statut-http",
+            type=int,
+            help="Le code de statut http du filtre des analyses à comparer."
+        )
+        parseur.add_argument(
+            "-e",
+            "--expression",
+            type=expression_filtre,
+            help="L'expression de filtre des analyses à comparer (voir la commande "
+                "'analyser')."
+        )
+        parseur.add_argument(
+            "--ajout-analyse",
+            dest="analyses",
+            type=str,
+            action="append",
+            default=[],
+            help="Une analyse déjà exportée (analyse-log-apache.json) à ajouter à "
+                "l'entrepôt avant la comparaison. Peut être répété."
+        )
+
+    def _charge_fichier_filtres(self, chemin_fichier: str) -> list:
+        """
+        Charge une liste de définitions de filtres depuis un fichier JSON, puis vérifie
+        que chaque définition donne un :class:`FiltreLogApache` valide.
+
+        Args:
+            chemin_fichier (str): Le chemin du fichier JSON.
+
+        Returns:
+            list: La liste des définitions de filtres.
+
+        Raises:
+            ArgumentCLIException: Le fichier est introuvable, son contenu n'est pas
+                une liste de dictionnaires ou un filtre est invalide (son numéro est
+                indiqué dans le message).
+        """
+        try:
+            with open(chemin_fichier, "r", encoding="utf-8") as fichier:
+                definitions = load(fichier)
+        except (OSError, JSONDecodeError) as ex:
+            raise ArgumentCLIException(
+                f"Impossible de lire le fichier de filtres {chemin_fichier} : {ex}"
+            ) from ex
+        if (not isinstance(definitions, list)
+            or not all(isinstance(definition, dict) for definition in definitions)):
+            raise ArgumentCLIException(
+                f"Le fichier de filtres {chemin_fichier} doit contenir une liste "
+                "de dictionnaires."
+            )
+        for numero, definition in enumerate(definitions, start=1):
+            try:
+                FiltreLogApache.depuis_dict(definition)
+            except (TypeError, ValueError, ExpressionFiltreInvalideException) as ex:
+                raise ArgumentCLIException(
+                    f"Le filtre n°{numero} du fichier de filtres {chemin_fichier} "
+                    f"est invalide : {ex}"
+                ) from ex
+        return definitions
+
+    @classmethod
+    def _verifie_options_incompatibles(cls, arguments_parses: Namespace) -> None:
+        """
+        Vérifie qu'aucune option de la commande ``analyser`` n'est combinée avec une
+        option incompatible de :attr:`OPTIONS_INCOMPATIBLES`.
+
+        Args:
+            arguments_parses (Namespace): Les arguments de la commande ``analyser``.
+
+        Returns:
+            None
+
+        Raises:
+            ArgumentCLIException: Une option est combinée avec une option incompatible.
+        """
+        def est_utilisee(option: str) -> bool:
+            valeur = getattr(arguments_parses, option)
+            if option == "moteur":
+                return valeur != "python"
+            return valeur is not None and valeur is not False and valeur != []
+
+        for options, options_incompatibles, message in cls.OPTIONS_INCOMPATIBLES:
+            if (any(est_utilisee(option) for option in options)
+                    and any(est_utilisee(option) for option in options_incompatibles)):
+                raise ArgumentCLIException(message)
+
+    @classmethod
+    def _verifie_valeurs_analyser(cls, arguments_parses: Namespace) -> None:
+        """
+        Vérifie les valeurs des options de la commande ``analyser`` que leur type ne
+        suffit pas à valider.
+
+        Args:
+            arguments_parses (Namespace): Les arguments de la commande ``analyser``.
+
+        Returns:
+            None
+
+        Raises:
+            ArgumentCLIException: La valeur d'une option utilisée est invalide.
+        """
+        verifications = (
+            (arguments_parses.abus and (arguments_parses.fenetre_abus < 10
+                                        or arguments_parses.fenetre_abus % 10 != 0),
+             "La fenêtre de détection des abus doit être un multiple de 10 secondes."),
+            (arguments_parses.abus and arguments_parses.seuil_abus <= 1,
+             "Le seuil de détection des abus doit être supérieur à 1."),
+            (arguments_parses.slo and arguments_parses.objectif_slo >= 1,
+             "L'objectif de disponibilité doit être strictement inférieur à 1."),
+            (arguments_parses.slo and (arguments_parses.fenetre_slo < 1
+                                       or 3600 % arguments_parses.fenetre_slo != 0),
+             "La fenêtre du suivi du taux d'erreurs doit être un diviseur de 3600 secondes."),
+            (arguments_parses.arborescence and arguments_parses.profondeur_arborescence < 1,
+             "La profondeur de l'arborescence doit être supérieure à 0."),
+            (arguments_parses.nouveautes and arguments_parses.capacite_nouveautes < 1,
+             "La capacité des filtres de Bloom doit être supérieure à 0."),
+            (arguments_parses.entrepot is not None
+             and not match(cls.REGEX_CHEMIN, arguments_parses.entrepot),
+             "Le chemin de l'entrepôt doit uniquement contenir les caractères autorisés. "
+             "Les caractères autorisés sont les minuscules, majuscules, chiffres ou les "
+             "caractères spéciaux suivants: _, \\, -, /."),
+            (not arguments_parses.pipe and arguments_parses.tampon_reordonnancement < 0,
+             "La taille du tampon de réordonnancement doit être supérieure ou égale à 0."),
+            (arguments_parses.sessions and arguments_parses.delai_session < 1,
+             "Le délai d'une session doit être supérieur à 0.")
+        )
+        for invalide, message in verifications:
+            if invalide:
+                raise ArgumentCLIException(message)
+
+    @staticmethod
+    def _get_chemins_entree(arguments_parses: Namespace) -> list:
+        """
+        Retourne les chemins des fichiers lus par la commande.
+
+        Args:
+            arguments_parses (Namespace): Les arguments de la commande.
+
+        Returns:
+            list: Les chemins des fichiers lus.
+
+        Raises:
+            ArgumentCLIException: Aucun fichier log n'est indiqué à la commande
+                ``analyser`` sans l'option ``--pipe``.
+        """
+        if arguments_parses.commande == "fusionner":
+            return arguments_parses.etats
+        if arguments_parses.commande in ("servir", "coordonner"):
+            return arguments_parses.logs
+        if arguments_parses.commande == "surveiller":
+            return [arguments_parses.repertoire]
+        if arguments_parses.commande == "tendance":
+            return [arguments_parses.entrepot] + arguments_parses.analyses
+        if arguments_parses.commande == "travailler" or arguments_parses.pipe:
+            return []
+        if arguments_parses.chemin_log is None:
+            raise ArgumentCLIException("Le chemin du fichier log à analyser est obligatoire "
+                                       "(sauf avec l'option --pipe).")
+        return [arguments_parses.chemin_log] + arguments_parses.logs_supplementaires
+
     def parse_args(self,
                    args: Optional[list] = None,
                    namespace: Optional[Namespace] = None) -> Namespace:
@@ -88,6 +901,11 @@ class ParseurArgumentsCLI(ArgumentParser):
         if namespace is not None and not isinstance(args, Namespace):
             raise TypeError("L'espace de noms doit soit être None, soit être un objet Namespace.")
 
+        # Commande par défaut si le premier argument n'est pas une commande
+        args = list(argv[1:] if args is None else args)
+        if not args or args[0] not in self.COMMANDES + ("-h", "--help"):
+            args.insert(0, self.COMMANDES[0])
+
         # Analyse des arguments
         try:
             arguments_parses = super().parse_args(args, namespace)
@@ -95,24 +913,49 @@ class ParseurArgumentsCLI(ArgumentParser):
             raise ArgumentCLIException() from ex
 
         # Vérification syntaxique des arguments
-        regex_chemin = r"^[a-zA-Z0-9:_\\\-.\/]+$"
-
-        if not match(regex_chemin, arguments_parses.chemin_log):
+        if not all(match(self.REGEX_CHEMIN, chemin)
+                   for chemin in self._get_chemins_entree(arguments_parses)):
             raise ArgumentCLIException(
                 "Le chemin du fichier log doit uniquement contenir les caractères autorisés. "
                 "Les caractères autorisés sont les minuscules, majuscules, chiffres ou les "
                 "caractères spéciaux suivants: _, \\, -, /."
             )
 
-        if not match(regex_chemin, arguments_parses.sortie):
+        if arguments_parses.commande in ("servir", "surveiller", "travailler"):
+            return arguments_parses
+
+        if not match(self.REGEX_CHEMIN, arguments_parses.sortie):
             raise ArgumentCLIException(
                 "Le chemin du dossier de sortie doit uniquement contenir les caractères "
                 "autorisés. Les caractères autorisés sont les minuscules, majuscules, "
                 "chiffres ou les caractères spéciaux suivants: _, \\, -, /."
             )
 
-        return arguments_parses
+        if arguments_parses.commande == "coordonner" and arguments_parses.travailleurs < 0:
+            raise ArgumentCLIException("Le nombre de travailleurs locaux doit être "
+                                       "supérieur ou égal à 0.")
+
+        if arguments_parses.commande != "analyser":
+            return arguments_parses
+
+        self._verifie_valeurs_analyser(arguments_parses)
+        self._verifie_options_incompatibles(arguments_parses)
+        if arguments_parses.pipe or arguments_parses.sessions:
+            return arguments_parses
+
+        # Récupération des filtres d'une analyse multi-filtres
+        if arguments_parses.fichier_filtres is not None:
+            arguments_parses.filtres.extend(
+                self._charge_fichier_filtres(arguments_parses.fichier_filtres)
+            )
+        if arguments_parses.index and (not arguments_parses.filtres
+                                       or arguments_parses.moteur != "python"):
+            raise ArgumentCLIException(
+                "L'option --index n'est utilisable qu'avec une analyse multi-filtres "
+                "(--filtre ou --fichier-filtres) et le moteur 'python'."
+            )
 
+        return arguments_parses
 
 class ArgumentCLIException(Exception):
     """
@@ -0,0 +1,162 @@
+"""
+Module pour les types des arguments passés en ligne de commande : chaque fonction
+convertit et vérifie la valeur d'une option pour :class:`ParseurArgumentsCLI`.
+"""
+
+from argparse import ArgumentTypeError
+from datetime import date
+from math import isfinite
+from analyse.expression_filtre import ExpressionFiltre, ExpressionFiltreInvalideException
+from analyse.normaliseur_urls import NormaliseurUrls
+
+
+def definition_filtre(definition: str) -> dict:
+    """
+    Convertit la définition d'un filtre passée en ligne de commande
+    (``ip=IP,code=CODE``) en un dictionnaire au format de
+    :meth:`FiltreLogApache.get_dict_filtre`.
+
+    Args:
+        definition (str): La définition du filtre.
+
+    Returns:
+        dict: La définition du filtre sous forme d'un dictionnaire.
+
+    Raises:
+        ArgumentTypeError: La définition est invalide.
+    """
+    cles = {"ip": "adresse_ip", "code": "code_statut_http"}
+    filtre = {}
+    for critere in definition.split(","):
+        cle, separateur, valeur = critere.strip().partition("=")
+        if not separateur or cle not in cles or not valeur or cles[cle] in filtre:
+            raise ArgumentTypeError(
+                f"Le filtre '{definition}' est invalide, il doit être sous la forme "
+                "'ip=IP,code=CODE' avec au moins une des deux clés."
+            )
+        if cle == "code":
+            if not valeur.isdigit():
+                raise ArgumentTypeError(f"Le code de statut http '{valeur}' "
+                                        "doit être un entier.")
+            valeur = int(valeur)
+        filtre[cles[cle]] = valeur
+    return filtre
+
+def nombre_positif(nombre: str) -> float:
+    """
+    Vérifie qu'un nombre passé en ligne de commande est strictement positif.
+
+    Args:
+        nombre (str): Le nombre.
+
+    Returns:
+        float: Le nombre.
+
+    Raises:
+        ArgumentTypeError: Le nombre est invalide, infini ou n'est pas strictement
+            positif.
+    """
+    try:
+        valeur = float(nombre)
+    except ValueError as ex:
+        raise ArgumentTypeError(f"'{nombre}' n'est pas un nombre.") from ex
+    if not isfinite(valeur) or valeur <= 0:
+        raise ArgumentTypeError("Le nombre doit être fini et strictement positif.")
+    return valeur
+
+def taux(nombre: str) -> float:
+    """
+    Vérifie qu'un taux passé en ligne de commande est strictement compris entre
+    ``0`` et ``1``.
+
+    Args:
+        nombre (str): Le taux.
+
+    Returns:
+        float: Le taux.
+
+    Raises:
+        ArgumentTypeError: Le taux est invalide ou n'est pas strictement compris
+            entre ``0`` et ``1``.
+    """
+    try:
+        valeur = float(nombre)
+    except ValueError as ex:
+        raise ArgumentTypeError(f"'{nombre}' n'est pas un nombre.") from ex
+    if not 0 < valeur < 1:
+        raise ArgumentTypeError("Le taux doit être strictement compris entre 0 et 1.")
+    return valeur
+
+def date_iso(jour: str) -> date:
+    """
+    Vérifie qu'une date passée en ligne de commande est valide.
+
+    Args:
+        jour (str): La date, au format ``AAAA-MM-JJ``.
+
+    Returns:
+        date: La date.
+
+    Raises:
+        ArgumentTypeError: La date est invalide.
+    """
+    try:
+        return date.fromisoformat(jour)
+    except ValueError as ex:
+        raise ArgumentTypeError(f"'{jour}' n'est pas une date au format "
+                                "AAAA-MM-JJ.") from ex
+
+def port_tcp(port: str) -> int:
+    """
+    Vérifie qu'un port passé en ligne de commande est valide.
+
+    Args:
+        port (str): Le port.
+
+    Returns:
+        int: Le port.
+
+    Raises:
+        ArgumentTypeError: Le port n'est pas un entier entre 1 et 65535.
+    """
+    if not port.isdigit() or not 1 <= int(port) <= 65535:
+        raise ArgumentTypeError("Le port doit être un entier entre 1 et 65535.")
+    return int(port)
+
+def modele_route(modele: str) -> str:
+    """
+    Vérifie qu'un modèle de route passé en ligne de commande est valide.
+
+    Args:
+        modele (str): Le modèle de route.
+
+    Returns:
+        str: Le modèle, inchangé.
+
+    Raises:
+        ArgumentTypeError: Le modèle est invalide.
+    """
+    try:
+        NormaliseurUrls.decoupe_modele(modele)
+    except ValueError as ex:
+        raise ArgumentTypeError(str(ex)) from ex
+    return modele
+
+def expression_filtre(expression: str) -> str:
+    """
+    Vérifie qu'une expression de filtre passée en ligne de commande est valide.
+
+    Args:
+        expression (str): L'expression de filtre.
+
+    Returns:
+        str: L'expression, inchangée.
+
+    Raises:
+        ArgumentTypeError: L'expression est invalide.
+    """
+    try:
+        ExpressionFiltre(expression)
+    except ExpressionFiltreInvalideException as ex:
+        raise ArgumentTypeError(str(ex)) from ex
+    return expression
@@ -19,10 +19,13 @@ class ReponseInformations:
         code_statut_http (int): Le code de statut HTTP.
         taille_octets (Optional[int]): La taille de la réponse en octets.
             Peut être None si non fournie.
+        temps_reponse (Optional[int]): Le temps de traitement de la requête en
+            microsecondes (directive ``%D``). Peut être None si non fournie.
     """
 
     code_statut_http: int
     taille_octets: Optional[int]
+    temps_reponse: Optional[int] = None
 
     def __post_init__(self):
         """
@@ -40,3 +43,8 @@ class ReponseInformations:
             and not isinstance(self.taille_octets, int)
             or isinstance(self.taille_octets, bool)):
             raise TypeError("La taille en octets doit être un entier ou None.")
+        # Vérification du temps de réponse (en microsecondes)
+        if (self.temps_reponse is not None
+            and not isinstance(self.temps_reponse, int)
+            or isinstance(self.temps_reponse, bool)):
+            raise TypeError("Le temps de réponse doit être un entier ou None.")
@@ -25,12 +25,15 @@ class RequeteInformations:
             Peut être None si non fournie.
         ancienne_url (Optional[str]): L'URL de provenance (referrer).
             Peut être None si non fournie.
+        hote_virtuel (Optional[str]): L'hôte virtuel ayant servi la requête, avec son
+            port (directives ``%v:%p``). Peut être None si non fournie.
     """
     horodatage: datetime
     methode_http: Optional[str]
     url: Optional[str]
     protocole_http: Optional[str]
     ancienne_url: Optional[str]
+    hote_virtuel: Optional[str] = None
 
     def __post_init__(self):
         """
@@ -54,3 +57,6 @@ class RequeteInformations:
         # Vérification de l'ancienne URL
         if self.ancienne_url is not None and not isinstance(self.ancienne_url, str):
             raise TypeError("L'ancienne URL doit être une chaine de caractère ou None.")
+        # Vérification de l'hôte virtuel
+        if self.hote_virtuel is not None and not isinstance(self.hote_virtuel, str):
+            raise TypeError("L'hôte virtuel doit être une chaine de caractère ou None.")
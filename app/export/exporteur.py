@@ -2,8 +2,10 @@
 Module pour l'exportation des données.
 """
 
-from os.path import abspath, isdir, join
+from os import remove, replace
+from os.path import abspath, isdir, isfile, join
 from json import dump
+from sqlite3 import connect, Error as SqliteError
 from altair import Chart, Theta, Color
 from pandas import DataFrame
 
@@ -16,6 +18,67 @@ class Exporteur:
     Attributes:
         _chemin_sortie (str): Le chemin du dossier vers lequel les données
             vont être exportées.
+
+    Class-level variables:
+        :cvar SCHEMA_SQLITE (str): Les tables de l'exportation SQLite des entrées. Les
+            adresses IP, les urls (demandées et de provenance) et les agents utilisateurs
+            sont rangés dans des tables dictionnaires, référencées par leur identifiant.
+        :cvar INDEX_SQLITE (str): Les index de l'exportation SQLite des entrées, créés
+            après le chargement.
+        :cvar PRAGMAS_SQLITE (str): Les réglages de la connexion de l'exportation SQLite.
+    """
+
+    SCHEMA_SQLITE: str = """
+        CREATE TABLE adresses_ip (
+            id INTEGER PRIMARY KEY,
+            adresse_ip TEXT NOT NULL
+        );
+        CREATE TABLE urls (
+            id INTEGER PRIMARY KEY,
+            url TEXT NOT NULL
+        );
+        CREATE TABLE agents_utilisateurs (
+            id INTEGER PRIMARY KEY,
+            agent_utilisateur TEXT NOT NULL
+        );
+        CREATE TABLE entrees (
+            id INTEGER PRIMARY KEY,
+            horodatage INTEGER,
+            adresse_ip INTEGER NOT NULL REFERENCES adresses_ip (id),
+            identifiant_rfc TEXT,
+            nom_utilisateur TEXT,
+            agent_utilisateur INTEGER REFERENCES agents_utilisateurs (id),
+            methode_http TEXT,
+            url INTEGER REFERENCES urls (id),
+            protocole_http TEXT,
+            ancienne_url INTEGER REFERENCES urls (id),
+            hote_virtuel TEXT,
+            code_statut_http INTEGER NOT NULL,
+            taille_octets INTEGER,
+            temps_reponse INTEGER
+        );
+    """
+
+    INDEX_SQLITE: str = """
+        CREATE UNIQUE INDEX adresses_ip_valeur ON adresses_ip (adresse_ip);
+        CREATE UNIQUE INDEX urls_valeur ON urls (url);
+        CREATE UNIQUE INDEX agents_utilisateurs_valeur ON agents_utilisateurs (agent_utilisateur);
+        CREATE INDEX entrees_horodatage ON entrees (horodatage);
+        CREATE INDEX entrees_adresse_ip ON entrees (adresse_ip);
+        CREATE INDEX entrees_url ON entrees (url);
+        CREATE INDEX entrees_code_statut_http ON entrees (code_statut_http);
+        ANALYZE;
+    """
+
+    # Base écrite d'un seul tenant dans un fichier temporaire : aucun journal n'est
+    # nécessaire, une exportation en échec ou interrompue n'atteint jamais la base
+    PRAGMAS_SQLITE: str = """
+        PRAGMA journal_mode = OFF;
+        PRAGMA synchronous = OFF;
+        PRAGMA locking_mode = EXCLUSIVE;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -262144;
+        PRAGMA page_size = 65536;
     """
 
     def __init__(self, chemin_sortie: str):
@@ -33,7 +96,10 @@ class Exporteur:
 
     def export_vers_json(self, donnees: dict, nom_fichier: str) -> None:
         """
-        Export le dictionnaire fourni vers le ``chemin de sortie``.
+        Export le dictionnaire fourni vers le ``chemin de sortie``. Le fichier est
+        d'abord écrit sous un nom temporaire puis renommé, pour qu'une lecture
+        concurrente (par exemple lors d'exportations périodiques) ne trouve jamais
+        un fichier à moitié écrit.
 
         Args:
             donnees (dict): Le dictionnaire qui contient les données.
@@ -57,12 +123,144 @@ class Exporteur:
             raise ValueError("Le fichier JSON doit terminé par l'extention '.json'.")
         # Exportation
         chemin_fichier = join(self._chemin_sortie, nom_fichier)
+        chemin_temporaire = f"{chemin_fichier}.tmp"
         try:
-            with open(chemin_fichier, 'w', encoding="utf-8") as fichier:
+            with open(chemin_temporaire, 'w', encoding="utf-8") as fichier:
                 dump(donnees, fichier, indent=4)
+            replace(chemin_temporaire, chemin_fichier)
         except Exception as ex:
             raise ExportationJsonException(str(ex)) from ex
 
+    def export_vers_sqlite(self,
+                           entrees,
+                           nom_fichier: str,
+                           taille_lot: int = 50000) -> int:
+        """
+        Export les entrées de log Apache fournies vers une base SQLite dans le
+        ``chemin de sortie``, pour les interroger ensuite en SQL.
+
+        Les entrées sont insérées par lots de ``taille_lot`` lignes dans une seule
+        transaction, et les index ne sont créés qu'après le chargement. Les adresses
+        IP, les urls et les agents utilisateurs reçoivent leur identifiant en mémoire
+        lors du parcours : chaque valeur distincte n'est écrite qu'une fois. L'horodatage
+        est enregistré en secondes depuis l'epoch (``datetime(horodatage, 'unixepoch')``
+        en SQL). Comme pour l'exportation JSON, la base est écrite sous un nom
+        temporaire puis renommée ; le fichier temporaire est supprimé si l'exportation
+        échoue.
+
+        Args:
+            entrees (Iterable): Les entrées de log Apache à exporter.
+            nom_fichier (str): Le nom du fichier SQLite.
+            taille_lot (int): Le nombre d'entrées insérées par lot. Par défaut,
+                ``50000``.
+
+        Returns:
+            int: Le nombre d'entrées exportées.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Le paramètre ``nom_fichier`` ne termine pas par .sqlite ou le
+                paramètre ``taille_lot`` est inférieur à 1.
+            ExportationSqliteException: Une erreur lors de l'écriture de la base SQLite.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(nom_fichier, str):
+            raise TypeError("Le nom du fichier doit être une chaîne de caractère.")
+        if not isinstance(taille_lot, int) or isinstance(taille_lot, bool):
+            raise TypeError("La taille des lots doit être un entier.")
+        # Vérification de la valeur des paramètres
+        if not nom_fichier.endswith(".sqlite"):
+            raise ValueError("Le fichier SQLite doit terminé par l'extention '.sqlite'.")
+        if taille_lot < 1:
+            raise ValueError("La taille des lots doit être supérieure à 0.")
+        # Exportation
+        chemin_fichier = join(self._chemin_sortie, nom_fichier)
+        chemin_temporaire = f"{chemin_fichier}.tmp"
+        try:
+            if isfile(chemin_temporaire):
+                remove(chemin_temporaire)
+            connexion = connect(chemin_temporaire, isolation_level=None)
+            try:
+                connexion.executescript(self.PRAGMAS_SQLITE + self.SCHEMA_SQLITE)
+                connexion.execute("BEGIN")
+                total_entrees = self._insere_entrees_sqlite(connexion, entrees, taille_lot)
+                connexion.execute("COMMIT")
+                connexion.executescript(self.INDEX_SQLITE)
+            finally:
+                connexion.close()
+            replace(chemin_temporaire, chemin_fichier)
+        except (SqliteError, OSError) as ex:
+            raise ExportationSqliteException(str(ex)) from ex
+        finally:
+            # Une exportation en échec ne laisse pas de base temporaire
+            if isfile(chemin_temporaire):
+                remove(chemin_temporaire)
+        return total_entrees
+
+    @staticmethod
+    def _insere_entrees_sqlite(connexion, entrees, taille_lot: int) -> int:
+        """
+        Insère les entrées et les valeurs de leurs tables dictionnaires par lots.
+
+        Args:
+            connexion (sqlite3.Connection): La connexion à la base, dans une transaction.
+            entrees (Iterable): Les entrées de log Apache à exporter.
+            taille_lot (int): Le nombre d'entrées insérées par lot.
+
+        Returns:
+            int: Le nombre d'entrées insérées.
+        """
+        tables = ("adresses_ip", "urls", "agents_utilisateurs")
+        # Identifiant de chaque valeur connue, et valeurs nouvelles du lot, par table
+        identifiants = {table: {} for table in tables}
+        nouvelles_valeurs = {table: [] for table in tables}
+
+        def identifiant(table: str, valeur):
+            if valeur is None:
+                return None
+            identifiants_table = identifiants[table]
+            numero = identifiants_table.get(valeur)
+            if numero is None:
+                numero = identifiants_table[valeur] = len(identifiants_table) + 1
+                nouvelles_valeurs[table].append((numero, valeur))
+            return numero
+
+        def ecrit_lot(lignes: list) -> None:
+            # Les valeurs sont écrites avant les entrées qui les référencent
+            for table, valeurs in nouvelles_valeurs.items():
+                connexion.executemany(f"INSERT INTO {table} VALUES (?, ?)", valeurs)
+                valeurs.clear()
+            connexion.executemany("INSERT INTO entrees VALUES "
+                                  "(NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", lignes)
+            lignes.clear()
+
+        total_entrees = 0
+        lignes = []
+        for entree in entrees:
+            client, requete, reponse = entree.client, entree.requete, entree.reponse
+            horodatage = requete.horodatage
+            lignes.append((
+                int(horodatage.timestamp()) if horodatage is not None else None,
+                identifiant("adresses_ip", client.adresse_ip),
+                client.identifiant_rfc,
+                client.nom_utilisateur,
+                identifiant("agents_utilisateurs", client.agent_utilisateur),
+                requete.methode_http,
+                identifiant("urls", requete.url),
+                requete.protocole_http,
+                identifiant("urls", requete.ancienne_url),
+                requete.hote_virtuel,
+                reponse.code_statut_http,
+                reponse.taille_octets,
+                reponse.temps_reponse
+            ))
+            if len(lignes) >= taille_lot:
+                total_entrees += len(lignes)
+                ecrit_lot(lignes)
+        total_entrees += len(lignes)
+        ecrit_lot(lignes)
+        return total_entrees
+
     def export_vers_html_camembert(self,
                                      donnees: list,
                                      nom_fichier: str) -> None:
@@ -142,6 +340,11 @@ class ExportationCamembertHtmlException(ExportationException):
     au format HTML.
     """
 
+class ExportationSqliteException(ExportationException):
+    """
+    Représente une erreur lors de l'exportation des entrées vers une base SQLite.
+    """
+
 class ExportationDossierIntrouvableException(ExportationException):
     """
     Représente une erreur lorsque une exportation est impossible
@@ -1,12 +1,50 @@
 """
 Point d'entrée de l'application LogBuster !
 """
+import os
+import signal
+import subprocess
+import sys
+from argparse import Namespace
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from json import load, JSONDecodeError
+from threading import Event, Thread
+from time import monotonic
+from typing import Callable, Optional
 from cli.afficheur_cli import AfficheurCLI
 from cli.parseur_arguments_cli import ParseurArgumentsCLI, ArgumentCLIException
-from parse.parseur_log_apache import ParseurLogApache, ParsageLogApacheException
+from parse.parseur_log_apache import (ParseurLogApache, ParsageLogApacheException,
+                                      FormatLogApacheInvalideException)
+from parse.fichier_log_apache import FichierLogApache
+from parse.fusion_chronologique import FusionChronologique
 from analyse.filtre_log_apache import FiltreLogApache
 from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.analyseur_log_apache_pandas import AnalyseurLogApachePandas
+from analyse.analyseur_multi_filtres import AnalyseurMultiFiltres
+from analyse.analyseur_flux import AnalyseurFlux
+from analyse.analyseur_sessions import AnalyseurSessions
+from analyse.detecteur_abus import DetecteurAbus
+from analyse.analyseur_slo import AnalyseurSLO
+from analyse.analyseur_agents import AnalyseurAgents
+from analyse.classificateur_agents import ClassificateurAgents, ReglesAgentsException
+from analyse.detecteur_attaques import DetecteurAttaques, SignaturesAttaquesException
+from analyse.analyseur_arborescence import AnalyseurArborescence
+from analyse.analyseur_navigation import AnalyseurNavigation
+from analyse.detecteur_nouveautes import DetecteurNouveautes
+from analyse.filtre_bloom import FiltreBloomException
+from analyse.index_inverse import IndexInverseEntrees
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.etat_partiel_analyse import EtatPartielAnalyse, EtatPartielException
+from analyse.entrepot_agregats import EntrepotAgregats, EntrepotAgregatsException
 from export.exporteur import Exporteur, ExportationException
+from serveur.serveur_requetes import ServeurRequetes, DemarrageServeurException
+from serveur.suivi_repertoire import SuiviRepertoireLogs
+from serveur.metriques_prometheus import MetriquesPrometheus
+from serveur.demon_metriques import DemonMetriques
+from serveur.lecteur_tube import LecteurTube
+from serveur.coordinateur import Coordinateur, ExecutionDistribueeException
+from serveur.travailleur import Travailleur
 
 def main() -> None:
     """
@@ -23,24 +61,9 @@ def main() -> None:
         arguments_cli = parseur_cli.parse_args()
         # Lance l'animation de chargement
         afficheur_cli.lance_animation_chargement()
-        # Analyse syntaxique du fichier log
-        parseur_log = ParseurLogApache(arguments_cli.chemin_log)
-        fichier_log = parseur_log.parse_fichier()
-        # Filtre à appliquer lors de l'analyse
-        filtre_log = FiltreLogApache(arguments_cli.ip, arguments_cli.code_statut_http)
-        # Analyse statistique du fichier log
-        analyseur_log = AnalyseurLogApache(fichier_log, filtre_log)
-        analyse = analyseur_log.get_analyse_complete()
-        # Exportation JSON
-        exporteur = Exporteur(arguments_cli.sortie)
-        exporteur.export_vers_json(analyse, "analyse-log-apache.json")
-        # Exportation Camembert
-        if arguments_cli.camembert:
-            exporteur.export_vers_html_camembert(
-                analyseur_log.get_total_par_code_statut_http_camembert(),
-                "camembert-code_statut_http.html"
-            )
-        # Termine l'animation de chargement
+        # Exécution de la commande demandée
+        selectionne_commande(arguments_cli, afficheur_cli)()
+        # Termine l'animation de chargement (si la commande ne l'a pas déjà fait)
         afficheur_cli.stop_animation_chargement()
     except ArgumentCLIException as ex:
         gestion_exception(afficheur_cli, "Erreur dans les arguments fournis !", ex)
@@ -48,9 +71,681 @@ def main() -> None:
         gestion_exception(afficheur_cli, "Erreur dans l'analyse du log Apache !", ex)
     except ExportationException as ex:
         gestion_exception(afficheur_cli, "Erreur dans l'exportation de l'analyse !", ex)
+    except EtatPartielException as ex:
+        gestion_exception(afficheur_cli, "Erreur dans la fusion des états partiels !", ex)
+    except ExecutionDistribueeException as ex:
+        gestion_exception(afficheur_cli, "Erreur dans l'analyse distribuée !", ex)
+    except ReglesAgentsException as ex:
+        gestion_exception(afficheur_cli, "Erreur dans les règles des agents utilisateurs !", ex)
+    except SignaturesAttaquesException as ex:
+        gestion_exception(afficheur_cli, "Erreur dans les signatures d'attaques !", ex)
+    except FiltreBloomException as ex:
+        gestion_exception(afficheur_cli, "Erreur dans la mémoire des nouveautés !", ex)
+    except EntrepotAgregatsException as ex:
+        gestion_exception(afficheur_cli, "Erreur dans l'entrepôt des agrégats !", ex)
+    except DemarrageServeurException as ex:
+        gestion_exception(afficheur_cli, "Erreur lors du démarrage du serveur !", ex)
     except (ValueError, TypeError) as ex:
         gestion_exception(afficheur_cli, "Erreur interne !", ex)
 
+def selectionne_commande(arguments_cli: Namespace,
+                         afficheur_cli: AfficheurCLI) -> Callable[[], None]:
+    """
+    Retourne la fonction qui exécute la commande demandée ou, pour la commande
+    ``analyser``, le mode d'analyse demandé.
+
+    Args:
+        arguments_cli (Namespace): Les arguments passés en ligne de commande.
+        afficheur_cli (AfficheurCLI): L'objet permettant d'intéragir avec la ligne
+            de commande.
+
+    Returns:
+        Callable[[], None]: La fonction qui exécute la commande.
+    """
+    commandes = {
+        # Fusion d'états partiels produits sur d'autres fichiers
+        "fusionner": partial(fusionne_etats_partiels, arguments_cli),
+        # Serveur local de requêtes sur les fichiers gardés en mémoire
+        "servir": partial(servir, arguments_cli, afficheur_cli),
+        # Démon d'ingestion continue exposant les métriques Prometheus
+        "surveiller": partial(surveille, arguments_cli, afficheur_cli),
+        # Analyse distribuée à des travailleurs connectés par TCP
+        "coordonner": partial(coordonne, arguments_cli, afficheur_cli),
+        # Traitement des tâches d'un coordinateur
+        "travailler": partial(travaille, arguments_cli, afficheur_cli),
+        # Comparaison de deux périodes à partir de l'entrepôt des agrégats
+        "tendance": partial(calcule_tendance, arguments_cli)
+    }
+    if arguments_cli.commande in commandes:
+        return commandes[arguments_cli.commande]
+    if arguments_cli.pipe:
+        # Analyse en continu des lignes reçues sur l'entrée standard
+        return partial(analyse_tube, arguments_cli, afficheur_cli)
+    if arguments_cli.sessions:
+        # Analyse des sessions en flux, dans l'ordre chronologique
+        return partial(analyse_sessions, arguments_cli)
+    if arguments_cli.logs_supplementaires:
+        # Fusion chronologique en flux des fichiers log de plusieurs serveurs
+        return partial(analyse_fusion_chronologique, arguments_cli)
+    return partial(analyse_fichier, arguments_cli)
+
+def analyse_fichier(arguments_cli: Namespace) -> None:
+    """
+    Parse le fichier log, l'analyse avec le filtre demandé (ou avec chaque filtre
+    d'une analyse multi-filtres) puis exporte l'analyse.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``analyser``.
+
+    Returns:
+        None
+    """
+    # Analyse syntaxique du fichier log
+    parseur_log = ParseurLogApache(arguments_cli.chemin_log)
+    fichier_log = parseur_log.parse_fichier()
+    exporteur = Exporteur(arguments_cli.sortie)
+    if arguments_cli.sqlite:
+        # Exportation SQLite des entrées parsées
+        exporteur.export_vers_sqlite(fichier_log.entrees, "entrees-log-apache.sqlite")
+    if arguments_cli.filtres:
+        # Analyse multi-filtres en une seule passe
+        analyse_multi_filtres(arguments_cli, fichier_log, exporteur)
+        return
+    # Filtre à appliquer lors de l'analyse
+    filtre_log = FiltreLogApache(arguments_cli.ip,
+                                 arguments_cli.code_statut_http,
+                                 arguments_cli.expression)
+    # Analyse statistique du fichier log
+    classe_analyseur = (AnalyseurLogApachePandas
+                        if arguments_cli.moteur == "pandas"
+                        else AnalyseurLogApache)
+    analyseur_log = classe_analyseur(fichier_log,
+                                     filtre_log,
+                                     granularite=arguments_cli.granularite,
+                                     groupements=arguments_cli.groupements,
+                                     normaliseur_urls=cree_normaliseur_urls(arguments_cli))
+    analyse = analyseur_log.get_analyse_complete()
+    # Analyses en flux, dans l'ordre chronologique des entrées
+    analyses_flux = cree_analyses_flux(arguments_cli, filtre_log)
+    if analyses_flux:
+        entrees_ordonnees = sorted(
+            (entree for entree in fichier_log.entrees
+             if entree.requete.horodatage is not None),
+            key=lambda entree: entree.requete.horodatage
+        )
+        for analyse_flux in analyses_flux.values():
+            analyse_flux.ajoute_entrees(entrees_ordonnees)
+        ajoute_analyses_flux(analyse, analyses_flux)
+    # Exportation JSON
+    exporteur.export_vers_json(analyse, "analyse-log-apache.json")
+    # Ajout des agrégats à l'entrepôt
+    if arguments_cli.entrepot is not None:
+        ajoute_a_entrepot(arguments_cli.entrepot, analyse)
+    # Exportation de l'état partiel
+    if arguments_cli.etat_partiel:
+        exporteur.export_vers_json(analyseur_log.get_etat_partiel().get_dict(),
+                                   "etat-partiel-analyse.json")
+    # Exportation Camembert
+    if arguments_cli.camembert:
+        exporteur.export_vers_html_camembert(
+            analyseur_log.get_total_par_code_statut_http_camembert(),
+            "camembert-code_statut_http.html"
+        )
+
+def analyse_multi_filtres(arguments_cli: Namespace,
+                          fichier_log: FichierLogApache,
+                          exporteur: Exporteur) -> None:
+    """
+    Analyse le fichier log avec chaque filtre demandé en un seul parcours des entrées
+    (ou à l'aide d'index inversés), puis exporte les analyses.
+
+    Args:
+        arguments_cli (Namespace): Les arguments passés en ligne de commande.
+        fichier_log (FichierLogApache): Le fichier log parsé.
+        exporteur (Exporteur): L'exporteur vers le dossier de sortie.
+
+    Returns:
+        None
+    """
+    filtres = [FiltreLogApache.depuis_dict(definition) for definition in arguments_cli.filtres]
+    analyseur_multi_filtres = AnalyseurMultiFiltres(fichier_log,
+                                                    filtres,
+                                                    granularite=arguments_cli.granularite,
+                                                    groupements=arguments_cli.groupements,
+                                                    moteur=arguments_cli.moteur,
+                                                    index=IndexInverseEntrees(fichier_log)
+                                                    if arguments_cli.index else None,
+                                                    normaliseur_urls=cree_normaliseur_urls(
+                                                        arguments_cli
+                                                    ))
+    # Exportation JSON
+    exporteur.export_vers_json(analyseur_multi_filtres.get_analyses_completes(),
+                               "analyses-log-apache.json")
+    # Exportation Camembert (un par filtre)
+    if arguments_cli.camembert:
+        for numero, analyseur in enumerate(analyseur_multi_filtres.get_analyseurs(), start=1):
+            exporteur.export_vers_html_camembert(
+                analyseur.get_total_par_code_statut_http_camembert(),
+                f"camembert-code_statut_http-{numero}.html"
+            )
+
+def analyse_fusion_chronologique(arguments_cli: Namespace) -> None:
+    """
+    Analyse plusieurs fichiers log dont les entrées sont fusionnées en flux dans
+    l'ordre de leur horodatage, sans garder les entrées en mémoire, puis exporte
+    l'analyse.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``analyser`` avec
+            l'option ``--ajout-log``.
+
+    Returns:
+        None
+    """
+    chemins = [arguments_cli.chemin_log] + arguments_cli.logs_supplementaires
+    exporteur = Exporteur(arguments_cli.sortie)
+    filtre_log = FiltreLogApache(arguments_cli.ip,
+                                 arguments_cli.code_statut_http,
+                                 arguments_cli.expression)
+    fusion = FusionChronologique([ParseurLogApache(chemin) for chemin in chemins],
+                                 arguments_cli.tampon_reordonnancement)
+    etat_partiel = EtatPartielAnalyse(filtre_log,
+                                      arguments_cli.granularite,
+                                      arguments_cli.groupements,
+                                      cree_normaliseur_urls(arguments_cli))
+    analyses_flux = cree_analyses_flux(arguments_cli, filtre_log)
+    predicat = filtre_log.get_predicat()
+    for entree in fusion:
+        if predicat(entree):
+            etat_partiel.ajoute_entree(entree)
+        for analyse_flux in analyses_flux.values():
+            analyse_flux.ajoute_entree(entree)
+    for chemin, total_entrees in zip(chemins, fusion.totaux):
+        etat_partiel.ajoute_fichier(chemin, total_entrees)
+    analyse = etat_partiel.get_analyse_complete()
+    ajoute_analyses_flux(analyse, analyses_flux)
+    analyse["fusion_chronologique"] = {
+        "tampon_reordonnancement": fusion.taille_tampon,
+        "entrees_desordonnees": fusion.entrees_desordonnees
+    }
+    # Exportation JSON
+    exporteur.export_vers_json(analyse, "analyse-log-apache.json")
+    # Ajout des agrégats à l'entrepôt
+    if arguments_cli.entrepot is not None:
+        ajoute_a_entrepot(arguments_cli.entrepot, analyse)
+    # Exportation de l'état partiel
+    if arguments_cli.etat_partiel:
+        exporteur.export_vers_json(etat_partiel.get_dict(), "etat-partiel-analyse.json")
+    # Exportation Camembert
+    if arguments_cli.camembert:
+        exporteur.export_vers_html_camembert(
+            etat_partiel.get_total_par_code_statut_http_camembert(),
+            "camembert-code_statut_http.html"
+        )
+
+def analyse_sessions(arguments_cli: Namespace) -> None:
+    """
+    Analyse les sessions des clients des fichiers log, parcourus en flux dans l'ordre
+    de leur horodatage, puis exporte l'analyse.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``analyser`` avec
+            l'option ``--sessions``.
+
+    Returns:
+        None
+    """
+    chemins = [arguments_cli.chemin_log] + arguments_cli.logs_supplementaires
+    exporteur = Exporteur(arguments_cli.sortie)
+    filtre_log = FiltreLogApache(arguments_cli.ip,
+                                 arguments_cli.code_statut_http,
+                                 arguments_cli.expression)
+    fusion = FusionChronologique([ParseurLogApache(chemin) for chemin in chemins],
+                                 arguments_cli.tampon_reordonnancement)
+    analyseur_sessions = AnalyseurSessions(filtre_log, arguments_cli.delai_session,
+                                           normaliseur_urls=cree_normaliseur_urls(arguments_cli))
+    analyseur_sessions.ajoute_entrees(fusion)
+    analyseur_sessions.termine()
+    analyse = analyseur_sessions.get_analyse_complete()
+    analyse["chemins"] = [os.path.abspath(chemin) for chemin in chemins]
+    analyse["fusion_chronologique"] = {
+        "tampon_reordonnancement": fusion.taille_tampon,
+        "entrees_desordonnees": fusion.entrees_desordonnees
+    }
+    # Exportation JSON
+    exporteur.export_vers_json(analyse, "analyse-sessions-log-apache.json")
+
+def cree_normaliseur_urls(arguments_cli: Namespace) -> Optional[NormaliseurUrls]:
+    """
+    Crée la normalisation des urls demandée par les options ``--normalise-urls`` et
+    ``--route``.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``analyser``.
+
+    Returns:
+        Optional[NormaliseurUrls]: La normalisation des urls, ou ``None`` si les urls
+        brutes doivent être comptées.
+    """
+    if not arguments_cli.normalise_urls and not arguments_cli.routes:
+        return None
+    return NormaliseurUrls(arguments_cli.routes)
+
+def cree_analyses_flux(arguments_cli: Namespace, filtre_log: FiltreLogApache) -> dict:
+    """
+    Crée les analyses en flux demandées par les options ``--abus``, ``--slo``,
+    ``--agents``, ``--attaques``, ``--arborescence``, ``--navigation`` et
+    ``--nouveautes``, qui s'ajoutent à l'analyse des requêtes.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``analyser``.
+        filtre_log (FiltreLogApache): Le filtre à appliquer aux entrées.
+
+    Returns:
+        dict: Les analyses (:class:`DetecteurAbus`, :class:`AnalyseurSLO`,
+        :class:`AnalyseurAgents`, :class:`DetecteurAttaques`,
+        :class:`AnalyseurArborescence`, :class:`AnalyseurNavigation`,
+        :class:`DetecteurNouveautes`), à alimenter dans l'ordre chronologique, par nom
+        de leur section dans l'analyse.
+    """
+    analyses_flux = {}
+    if arguments_cli.abus:
+        analyses_flux["abus"] = DetecteurAbus(filtre_log, arguments_cli.fenetre_abus,
+                                              seuil=arguments_cli.seuil_abus)
+    if arguments_cli.slo:
+        analyses_flux["slo"] = AnalyseurSLO(filtre_log, arguments_cli.objectif_slo,
+                                            arguments_cli.fenetre_slo)
+    if arguments_cli.agents:
+        analyses_flux["agents"] = AnalyseurAgents(
+            filtre_log, ClassificateurAgents(arguments_cli.regles_agents)
+        )
+    if arguments_cli.attaques:
+        analyses_flux["attaques"] = DetecteurAttaques(filtre_log,
+                                                      arguments_cli.signatures_attaques)
+    if arguments_cli.arborescence:
+        analyses_flux["arborescence"] = AnalyseurArborescence(
+            filtre_log, arguments_cli.profondeur_arborescence,
+            normaliseur_urls=cree_normaliseur_urls(arguments_cli)
+        )
+    if arguments_cli.navigation:
+        analyses_flux["navigation"] = AnalyseurNavigation(
+            filtre_log, arguments_cli.domaines_internes,
+            normaliseur_urls=cree_normaliseur_urls(arguments_cli)
+        )
+    if arguments_cli.nouveautes:
+        analyses_flux["nouveautes"] = DetecteurNouveautes(
+            filtre_log, arguments_cli.sortie, arguments_cli.capacite_nouveautes,
+            arguments_cli.taux_faux_positifs,
+            normaliseur_urls=cree_normaliseur_urls(arguments_cli)
+        )
+    return analyses_flux
+
+def ajoute_analyses_flux(analyse: dict, analyses_flux: dict) -> None:
+    """
+    Ajoute le résultat des analyses en flux à l'analyse des requêtes, puis enregistre
+    la mémoire de la détection des nouveautés pour les exécutions suivantes.
+
+    Args:
+        analyse (dict): L'analyse des requêtes.
+        analyses_flux (dict): Les analyses en flux retournées par
+            :func:`cree_analyses_flux`.
+
+    Returns:
+        None
+    """
+    for section, analyse_flux in analyses_flux.items():
+        analyse[section] = analyse_flux.get_analyse()
+    if "nouveautes" in analyses_flux:
+        analyses_flux["nouveautes"].enregistre()
+
+def fusionne_etats_partiels(arguments_cli: Namespace) -> None:
+    """
+    Fusionne les états partiels d'analyse passés en ligne de commande, puis exporte
+    l'analyse complète correspondante.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``fusionner``.
+
+    Returns:
+        None
+    """
+    etat_partiel = EtatPartielAnalyse.fusionne_fichiers(arguments_cli.etats)
+    exporteur = Exporteur(arguments_cli.sortie)
+    # Exportation JSON
+    exporteur.export_vers_json(etat_partiel.get_analyse_complete(),
+                               "analyse-log-apache.json")
+    # Exportation Camembert
+    if arguments_cli.camembert:
+        exporteur.export_vers_html_camembert(
+            etat_partiel.get_total_par_code_statut_http_camembert(),
+            "camembert-code_statut_http.html"
+        )
+
+def ajoute_a_entrepot(chemin_entrepot: str, analyse: dict) -> None:
+    """
+    Ajoute les agrégats d'une analyse à l'entrepôt, créé s'il n'existe pas.
+
+    Args:
+        chemin_entrepot (str): Le chemin de l'entrepôt SQLite.
+        analyse (dict): L'analyse au format de
+            :meth:`AnalyseurLogApache.get_analyse_complete`.
+
+    Returns:
+        None
+    """
+    entrepot = EntrepotAgregats(chemin_entrepot)
+    try:
+        entrepot.ajoute_analyse(analyse)
+    finally:
+        entrepot.ferme()
+
+def calcule_tendance(arguments_cli: Namespace) -> None:
+    """
+    Ajoute à l'entrepôt les analyses déjà exportées passées en ligne de commande, puis
+    compare la période courante à la précédente et exporte la tendance.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``tendance``.
+
+    Returns:
+        None
+
+    Raises:
+        EntrepotAgregatsException: Une analyse à ajouter est illisible, ou l'entrepôt
+            est invalide ou vide.
+    """
+    exporteur = Exporteur(arguments_cli.sortie)
+    analyses = []
+    for chemin_analyse in arguments_cli.analyses:
+        try:
+            with open(chemin_analyse, "r", encoding="utf-8") as fichier:
+                analyses.append(load(fichier))
+        except (OSError, JSONDecodeError) as ex:
+            raise EntrepotAgregatsException(
+                f"Impossible de lire l'analyse {chemin_analyse} : {ex}"
+            ) from ex
+    entrepot = EntrepotAgregats(arguments_cli.entrepot)
+    try:
+        for analyse in analyses:
+            entrepot.ajoute_analyse(analyse)
+        tendance = entrepot.get_tendance(
+            arguments_cli.periode, arguments_cli.date_reference,
+            filtre=FiltreLogApache(
+                arguments_cli.ip, arguments_cli.code_statut_http, arguments_cli.expression
+            )
+        )
+    finally:
+        entrepot.ferme()
+    # Exportation JSON
+    exporteur.export_vers_json(tendance, "tendance-log-apache.json")
+
+def ouvre_serveur(creation: Callable, hote: str, port: int):
+    """
+    Crée un serveur à l'écoute de l'adresse et du port demandés.
+
+    Args:
+        creation (Callable): La méthode qui crée le serveur, par exemple
+            :meth:`ServeurRequetes.cree_serveur_http`.
+        hote (str): L'adresse d'écoute.
+        port (int): Le port d'écoute.
+
+    Returns:
+        any: Le serveur, à démarrer avec ``serve_forever``.
+
+    Raises:
+        DemarrageServeurException: Le port ne peut pas être ouvert.
+    """
+    try:
+        return creation(hote, port)
+    except OSError as ex:
+        raise DemarrageServeurException(
+            f"Impossible d'écouter sur {hote}:{port} : {ex}"
+        ) from ex
+
+def servir(arguments_cli: Namespace, afficheur_cli: AfficheurCLI) -> None:
+    """
+    Parse les fichiers log passés en ligne de commande une seule fois, puis répond
+    aux requêtes d'analyse du serveur HTTP local jusqu'à son interruption (Ctrl+C).
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``servir``.
+        afficheur_cli (AfficheurCLI): L'objet permettant d'intéragir avec la ligne
+            de commande.
+
+    Returns:
+        None
+    """
+    fichiers = [ParseurLogApache(chemin).parse_fichier() for chemin in arguments_cli.logs]
+    serveur = ouvre_serveur(ServeurRequetes(fichiers).cree_serveur_http,
+                            arguments_cli.hote, arguments_cli.port)
+    afficheur_cli.stop_animation_chargement()
+    hote, port = serveur.server_address[:2]
+    afficheur_cli.affiche_message(f"Serveur à l'écoute sur http://{hote}:{port}/analyse")
+    try:
+        serveur.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        serveur.server_close()
+
+def surveille(arguments_cli: Namespace, afficheur_cli: AfficheurCLI) -> None:
+    """
+    Ingère en continu les fichiers log d'un répertoire et expose leurs métriques
+    sur la route ``/metrics`` jusqu'à l'interruption du démon (Ctrl+C).
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``surveiller``.
+        afficheur_cli (AfficheurCLI): L'objet permettant d'intéragir avec la ligne
+            de commande.
+
+    Returns:
+        None
+    """
+    suivi = SuiviRepertoireLogs(arguments_cli.repertoire,
+                                arguments_cli.motif,
+                                arguments_cli.depuis_debut)
+    demon = DemonMetriques(suivi, MetriquesPrometheus(), arguments_cli.intervalle)
+    serveur = ouvre_serveur(demon.cree_serveur_http, arguments_cli.hote, arguments_cli.port)
+    afficheur_cli.stop_animation_chargement()
+    hote, port = serveur.server_address[:2]
+    afficheur_cli.affiche_message(f"Métriques exposées sur http://{hote}:{port}/metrics")
+    demon.demarre_ingestion()
+    try:
+        serveur.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        demon.arrete_ingestion()
+        serveur.server_close()
+
+def analyse_tube(arguments_cli: Namespace, afficheur_cli: AfficheurCLI) -> None:
+    """
+    Analyse en continu les lignes reçues sur l'entrée standard (par exemple depuis
+    Apache) et exporte l'analyse à intervalles réguliers, à la réception de SIGHUP,
+    puis une dernière fois à la réception de SIGTERM ou à la fin du flux.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``analyser --pipe``.
+        afficheur_cli (AfficheurCLI): L'objet permettant d'intéragir avec la ligne
+            de commande.
+
+    Returns:
+        None
+    """
+    filtre_log = FiltreLogApache(arguments_cli.ip,
+                                 arguments_cli.code_statut_http,
+                                 arguments_cli.expression)
+    analyseur_flux = AnalyseurFlux(filtre_log, granularite=arguments_cli.granularite,
+                                   normaliseur_urls=cree_normaliseur_urls(arguments_cli))
+    analyses_flux = cree_analyses_flux(arguments_cli, filtre_log)
+    exporteur = Exporteur(arguments_cli.sortie)
+    parseur_log = ParseurLogApache(ParseurLogApache.ENTREE_STANDARD)
+    lecteur_tube = LecteurTube(sys.stdin.fileno())
+    arret = Event()
+    export_demande = Event()
+
+    def exporte() -> None:
+        """
+        Exporte l'analyse des lignes reçues jusqu'à présent.
+
+        Returns:
+            None
+        """
+        analyseur_flux.lignes_perdues = lecteur_tube.get_lignes_perdues()
+        analyse = analyseur_flux.get_analyse_complete()
+        ajoute_analyses_flux(analyse, analyses_flux)
+        exporteur.export_vers_json(analyse, "analyse-flux-log-apache.json")
+        if arguments_cli.camembert:
+            exporteur.export_vers_html_camembert(
+                analyseur_flux.get_total_par_code_statut_http_camembert(),
+                "camembert-code_statut_http.html"
+            )
+
+    afficheur_cli.stop_animation_chargement()
+    lecteur_tube.demarre()
+    prochain_export = monotonic() + arguments_cli.intervalle_export
+    with signaux_tube(arret, export_demande):
+        try:
+            while not arret.is_set() and not lecteur_tube.est_termine():
+                ajoute_lignes_tube(lecteur_tube.recupere_lignes(), parseur_log,
+                                   analyseur_flux, analyses_flux)
+                if export_demande.is_set() or monotonic() >= prochain_export:
+                    export_demande.clear()
+                    exporte()
+                    prochain_export = monotonic() + arguments_cli.intervalle_export
+        except KeyboardInterrupt:
+            pass
+    exporte()
+
+@contextmanager
+def signaux_tube(arret: Event, export_demande: Event):
+    """
+    Installe, le temps de l'analyse en continu, les gestionnaires des signaux SIGTERM
+    (arrêt) et SIGHUP (exportation), puis restaure les gestionnaires précédents. Les
+    signaux ne font que lever des indicateurs lus par la boucle d'analyse.
+
+    Args:
+        arret (Event): L'indicateur levé à la réception de SIGTERM.
+        export_demande (Event): L'indicateur levé à la réception de SIGHUP.
+
+    Yields:
+        None
+    """
+    gestionnaires = {signal.SIGTERM: lambda *_: arret.set()}
+    if hasattr(signal, "SIGHUP"):
+        gestionnaires[signal.SIGHUP] = lambda *_: export_demande.set()
+    anciens_gestionnaires = {numero: signal.signal(numero, gestionnaire)
+                             for numero, gestionnaire in gestionnaires.items()}
+    try:
+        yield
+    finally:
+        for numero, gestionnaire in anciens_gestionnaires.items():
+            signal.signal(numero, gestionnaire)
+
+def ajoute_lignes_tube(lignes: list,
+                       parseur_log: ParseurLogApache,
+                       analyseur_flux: AnalyseurFlux,
+                       analyses_flux: dict) -> None:
+    """
+    Parse les lignes reçues sur l'entrée standard et ajoute leurs entrées à l'analyse
+    en continu. Les lignes au format invalide sont comptées puis ignorées.
+
+    Args:
+        lignes (list): Les lignes reçues.
+        parseur_log (ParseurLogApache): Le parseur des entrées.
+        analyseur_flux (AnalyseurFlux): L'analyse en continu des requêtes.
+        analyses_flux (dict): Les analyses en flux supplémentaires.
+
+    Returns:
+        None
+    """
+    for ligne in lignes:
+        try:
+            entree = parseur_log.parse_entree(ligne)
+        except FormatLogApacheInvalideException:
+            analyseur_flux.lignes_invalides += 1
+            continue
+        analyseur_flux.ajoute_entree(entree)
+        for analyse_flux in analyses_flux.values():
+            analyse_flux.ajoute_entree(entree)
+
+def coordonne(arguments_cli: Namespace, afficheur_cli: AfficheurCLI) -> None:
+    """
+    Découpe les fichiers log en tâches, les distribue aux travailleurs connectés
+    (éventuellement lancés sur la machine locale) puis exporte l'analyse fusionnée.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``coordonner``.
+        afficheur_cli (AfficheurCLI): L'objet permettant d'intéragir avec la ligne
+            de commande.
+
+    Returns:
+        None
+    """
+    exporteur = Exporteur(arguments_cli.sortie)
+    filtre_log = FiltreLogApache(arguments_cli.ip,
+                                 arguments_cli.code_statut_http,
+                                 arguments_cli.expression)
+    taches = Coordinateur.decoupe_fichiers(arguments_cli.logs,
+                                           int(arguments_cli.taille_tache * 1024 * 1024) or 1)
+    coordinateur = Coordinateur(taches,
+                                filtre_log,
+                                granularite=arguments_cli.granularite,
+                                groupements=arguments_cli.groupements,
+                                normaliseur_urls=cree_normaliseur_urls(arguments_cli))
+    serveur = ouvre_serveur(coordinateur.cree_serveur, arguments_cli.hote, arguments_cli.port)
+    hote, port = serveur.server_address[:2]
+    afficheur_cli.affiche_message(f"Coordinateur à l'écoute sur {hote}:{port} "
+                                  f"({len(taches)} tâches)")
+    Thread(target=serveur.serve_forever, name="coordinateur", daemon=True).start()
+    # Travailleurs locaux
+    commande_travailleur = [sys.executable, os.path.abspath(__file__), "travailler",
+                            "--hote", hote, "--port", str(port)]
+    with ExitStack() as pile:
+        # Chaque processus est attendu à la sortie de la pile
+        travailleurs = [pile.enter_context(subprocess.Popen(commande_travailleur,
+                                                            stdout=subprocess.DEVNULL))
+                        for _ in range(arguments_cli.travailleurs)]
+        try:
+            etat_partiel = coordinateur.attend_resultat(processus=travailleurs)
+        finally:
+            serveur.shutdown()
+            serveur.server_close()
+            for travailleur in travailleurs:
+                travailleur.terminate()
+    # Exportation JSON
+    exporteur.export_vers_json(etat_partiel.get_analyse_complete(),
+                               "analyse-log-apache.json")
+    # Exportation Camembert
+    if arguments_cli.camembert:
+        exporteur.export_vers_html_camembert(
+            etat_partiel.get_total_par_code_statut_http_camembert(),
+            "camembert-code_statut_http.html"
+        )
+
+def travaille(arguments_cli: Namespace, afficheur_cli: AfficheurCLI) -> None:
+    """
+    Traite les tâches d'un coordinateur jusqu'à la fin de son analyse.
+
+    Args:
+        arguments_cli (Namespace): Les arguments de la commande ``travailler``.
+        afficheur_cli (AfficheurCLI): L'objet permettant d'intéragir avec la ligne
+            de commande.
+
+    Returns:
+        None
+    """
+    travailleur = Travailleur(arguments_cli.hote, arguments_cli.port)
+    afficheur_cli.stop_animation_chargement()
+    try:
+        total_taches = travailleur.execute()
+    except OSError as ex:
+        raise ExecutionDistribueeException(
+            f"La connexion au coordinateur {arguments_cli.hote}:{arguments_cli.port} a "
+            f"échoué ou a été perdue : {ex}"
+        ) from ex
+    afficheur_cli.affiche_message(f"{total_taches} tâches traitées.")
+
 def gestion_exception(afficheur_cli: AfficheurCLI, message: str, exception: Exception) -> None:
     """
     Gère les erreurs qui demandent une fin du programme.
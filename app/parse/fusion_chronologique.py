@@ -0,0 +1,108 @@
+"""
+Module pour la fusion chronologique, en flux, des entrées de plusieurs fichiers
+log Apache (par exemple un fichier par serveur d'un même pool).
+"""
+
+from heapq import heappop, heappush, merge
+from parse.parseur_log_apache import ParseurLogApache
+
+
+class FusionChronologique:
+    """
+    Représente la fusion k-way des entrées de plusieurs fichiers log Apache, dans
+    l'ordre de leur horodatage.
+
+    Chaque fichier est parsé en flux (:meth:`ParseurLogApache.iter_entrees`) et passe
+    par un tampon de réordonnancement borné (un tas de ``taille_tampon`` entrées) qui
+    remet dans l'ordre les entrées légèrement désordonnées du fichier. Un tas
+    (:func:`heapq.merge`) fusionne ensuite les fichiers : la mémoire utilisée est
+    proportionnelle au nombre de fichiers et à la taille du tampon, jamais au nombre
+    d'entrées.
+
+    Une entrée sans horodatage prend celui de l'entrée précédente de son fichier. À
+    horodatage égal, les entrées sont émises dans l'ordre des fichiers puis des
+    lignes. Une entrée plus en retard que ce que le tampon peut réordonner est émise
+    hors ordre et comptée dans :attr:`entrees_desordonnees`.
+
+    Attributes:
+        parseurs (list): Les parseurs (:class:`ParseurLogApache`) des fichiers à fusionner.
+        taille_tampon (int): Le nombre maximal d'entrées en attente de réordonnancement
+            par fichier (``0`` pour aucun réordonnancement).
+        totaux (list): Le nombre d'entrées lues de chaque fichier.
+        entrees_desordonnees (int): Le nombre d'entrées émises avec un horodatage
+            antérieur à celui d'une entrée déjà émise.
+    """
+
+    def __init__(self, parseurs: list, taille_tampon: int = 1000):
+        """
+        Initialise la fusion chronologique de plusieurs fichiers log.
+
+        Args:
+            parseurs (list): Les parseurs des fichiers à fusionner.
+            taille_tampon (int): Le nombre maximal d'entrées en attente de
+                réordonnancement par fichier. Par défaut, ``1000``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Aucun parseur n'est indiqué ou la taille du tampon est négative.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(parseurs, list) or not all(isinstance(parseur, ParseurLogApache)
+                                                     for parseur in parseurs):
+            raise TypeError("Les parseurs doivent être une liste d'objets ParseurLogApache.")
+        if not isinstance(taille_tampon, int) or isinstance(taille_tampon, bool):
+            raise TypeError("La taille du tampon de réordonnancement doit être un entier.")
+        # Vérification de la valeur des paramètres
+        if not parseurs:
+            raise ValueError("Au moins un fichier log doit être fusionné.")
+        if taille_tampon < 0:
+            raise ValueError("La taille du tampon de réordonnancement doit être "
+                             "supérieure ou égale à 0.")
+
+        self.parseurs = parseurs
+        self.taille_tampon = taille_tampon
+        self.totaux = [0] * len(parseurs)
+        self.entrees_desordonnees = 0
+
+    def _iter_fichier(self, rang: int):
+        """
+        Parse un fichier en flux et réordonne ses entrées avec un tampon borné.
+
+        Args:
+            rang (int): Le rang du fichier dans :attr:`parseurs`.
+
+        Returns:
+            Generator: Les tuples ``(cle, rang, numero, entree)`` du fichier, où ``cle``
+            est l'horodatage (en secondes depuis l'epoch) et ``numero`` le numéro
+            de l'entrée dans le fichier.
+        """
+        tampon = []
+        cle = float("-inf")
+        for numero, entree in enumerate(self.parseurs[rang].iter_entrees()):
+            self.totaux[rang] += 1
+            if entree.requete.horodatage is not None:
+                cle = entree.requete.horodatage.timestamp()
+            heappush(tampon, (cle, rang, numero, entree))
+            if len(tampon) > self.taille_tampon:
+                yield heappop(tampon)
+        while tampon:
+            yield heappop(tampon)
+
+    def __iter__(self):
+        """
+        Parcourt les entrées de tous les fichiers dans l'ordre chronologique.
+
+        Returns:
+            Generator: Les entrées (:class:`EntreeLogApache`) fusionnées.
+
+        Raises:
+            FormatLogApacheInvalideException: Le format d'un fichier log est invalide.
+        """
+        derniere_cle = float("-inf")
+        for cle, _, _, entree in merge(*(self._iter_fichier(rang)
+                                         for rang in range(len(self.parseurs)))):
+            if cle < derniere_cle:
+                self.entrees_desordonnees += 1
+            else:
+                derniere_cle = cle
+            yield entree
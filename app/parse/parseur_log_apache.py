@@ -3,6 +3,7 @@ Module pour parser un fichier log Apache.
 """
 
 import os
+import sys
 from re import match
 from datetime import datetime
 from typing import Optional
@@ -20,23 +21,29 @@ class ParseurLogApache():
 
     Class-level variables:
         :cvar PATTERN_ENTREE_LOG_APACHE (str): Le pattern regex d'une entrée dans un log Apache.
+        :cvar ENTREE_STANDARD (str): Le chemin qui désigne l'entrée standard.
     """
 
     PATTERN_ENTREE_LOG_APACHE: str = (
+        r'((?P<hote_virtuel>\S+:\d+) )?'
         r'(?P<ip>\S+) (?P<rfc>\S+) (?P<utilisateur>\S+)'
         r' (\[(?P<horodatage>\d{2}\/\w{3}\/\d{4}:\d{1,2}:\d{1,2}:\d{1,2} \+\d{4})\]|-)'
         r' "((?P<methode>\S+) (?P<url>\S+) (?P<protocole>\S+)|-)"'
         r' (?P<code_status>\d+) (?P<taille_octets>\d+|-)'
         r'( "(?P<ancienne_url>.*?)")?( "(?P<agent_utilisateur>.*?)")?'
+        r'( (?P<temps_reponse>\d+))?'
     )
 
+    ENTREE_STANDARD: str = "-"
+
     def __init__(self, chemin_log):
         """
         Initialise un nouveau parseur de fichier log Apache et vérifie que
         le fichier passé en paramètre existe.
 
         Args:
-            chemin_log (str): Le chemin du fichier à analyser.
+            chemin_log (str): Le chemin du fichier à analyser, ou :attr:`ENTREE_STANDARD`
+                pour lire l'entrée standard.
 
         Raises:
             TypeError: Le chemin ``chemin_log`` n'est pas de type ``str``.
@@ -46,10 +53,13 @@ class ParseurLogApache():
         if not isinstance(chemin_log, str):
             raise TypeError("Le chemin du log doit être une chaîne de caractères.")
         # Vérification du chemin
-        if not os.path.isfile(chemin_log):
+        if chemin_log != self.ENTREE_STANDARD and not os.path.isfile(chemin_log):
             raise FichierLogApacheIntrouvableException(f"Le fichier {chemin_log} est introuvable.")
         # Ajout du chemin
         self.chemin_log = chemin_log
+        # Dernier horodatage converti (texte, datetime), réutilisé par les entrées
+        # consécutives de la même seconde
+        self._dernier_horodatage = (None, None)
 
     def parse_fichier(self) -> FichierLogApache:
         """
@@ -64,21 +74,41 @@ class ParseurLogApache():
         """
         # Initialisation de la représentation du fichier
         log_analyse = FichierLogApache(self.chemin_log)
-        # Ouverture du log
-        with open(self.chemin_log, "r", encoding="utf-8") as log:
+        # Parcours des entrées du log
+        for entree in self.iter_entrees():
+            log_analyse.ajoute_entree(entree)
+
+        return log_analyse
+
+    def iter_entrees(self):
+        """
+        Effectue une analyse syntaxique du fichier de log Apache entrée par entrée,
+        sans conserver les entrées en mémoire.
+
+        Returns:
+            Generator: Les entrées (:class:`EntreeLogApache`) du fichier, dans l'ordre
+            du fichier.
+
+        Raises:
+            FormatLogApacheInvalideException: Format du fichier log invalide.
+        """
+        # Ouverture du log (l'entrée standard n'est pas fermée à la fin de la lecture)
+        if self.chemin_log == self.ENTREE_STANDARD:
+            log = open(sys.stdin.fileno(), "r", encoding="utf-8", closefd=False)
+        else:
+            log = open(self.chemin_log, "r", encoding="utf-8")
+        with log:
             # Parcours des entrées du log
             for numero_ligne, ligne in enumerate(log, start=1):
                 try:
                     # Parsage de l'entrée
                     entree = self.parse_entree(ligne)
-                    log_analyse.ajoute_entree(entree)
                 except FormatLogApacheInvalideException as ex:
                     raise FormatLogApacheInvalideException(
                         f"Le format de l'entrée à la ligne {numero_ligne} "
                         f"('{ligne.strip()}') est invalide."
                     ) from ex
-
-        return log_analyse
+                yield entree
 
     def parse_entree(self, entree: str) -> EntreeLogApache:
         """
@@ -176,7 +206,11 @@ class ParseurLogApache():
         # Horodatage
         horodatage = self.get_information_entree(analyse_regex, "horodatage")
         if horodatage:
-            horodatage = datetime.strptime(horodatage, "%d/%b/%Y:%H:%M:%S %z")
+            texte, converti = self._dernier_horodatage
+            if horodatage != texte:
+                converti = datetime.strptime(horodatage, "%d/%b/%Y:%H:%M:%S %z")
+                self._dernier_horodatage = (horodatage, converti)
+            horodatage = converti
         if horodatage is None:
             raise FormatLogApacheInvalideException("L'horodatage est obligatoire.")
         # Méthode HTTP
@@ -187,9 +221,11 @@ class ParseurLogApache():
         protocole_http = self.get_information_entree(analyse_regex, "protocole")
         # URL de la précédente ressource demandée
         ancienne_url = self.get_information_entree(analyse_regex, "ancienne_url")
+        # Hôte virtuel (format vhost_combined)
+        hote_virtuel = self.get_information_entree(analyse_regex, "hote_virtuel")
 
         return RequeteInformations(
-            horodatage, methode_http, url, protocole_http, ancienne_url
+            horodatage, methode_http, url, protocole_http, ancienne_url, hote_virtuel
         )
 
     def _extraire_informations_reponse(self, analyse_regex: dict) -> ReponseInformations:
@@ -214,9 +250,13 @@ class ParseurLogApache():
         taille_octets = self.get_information_entree(analyse_regex, "taille_octets")
         if taille_octets:
             taille_octets = int(taille_octets)
+        # Temps de réponse en microsecondes (%D)
+        temps_reponse = self.get_information_entree(analyse_regex, "temps_reponse")
+        if temps_reponse:
+            temps_reponse = int(temps_reponse)
 
         return ReponseInformations(
-            code_statut, taille_octets
+            code_statut, taille_octets, temps_reponse
         )
 
     def get_information_entree(self, analyse_regex: dict, nom_information: str) -> Optional[str]:
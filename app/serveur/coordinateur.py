@@ -0,0 +1,449 @@
+"""
+Module pour le coordinateur d'une analyse distribuée : les fichiers log sont
+découpés en tâches confiées à des travailleurs connectés par TCP.
+"""
+
+import json
+import os
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from threading import Condition
+from time import monotonic
+from typing import Optional
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.etat_partiel_analyse import EtatPartielAnalyse, EtatPartielException
+
+
+class Coordinateur:
+    """
+    Représente le coordinateur d'une analyse distribuée.
+
+    Les fichiers log sont découpés en plages d'octets (:meth:`decoupe_fichiers`). Chaque
+    travailleur (:class:`Travailleur`) connecté reçoit une tâche à la fois, l'analyse
+    localement (parsage, filtre et agrégation) et renvoie l'état partiel
+    (:class:`EtatPartielAnalyse`) de sa plage. Les états sont fusionnés dans l'ordre
+    des tâches, ce qui produit la même analyse qu'un parcours séquentiel des fichiers
+    (aux approximations des sketchs de quantiles près).
+
+    Le protocole est composé de messages JSON, un par ligne :
+        - Coordinateur vers travailleur : ``{"type": "tache", "tache": {...},
+          "configuration": {...}}``, puis ``{"type": "fin"}`` lorsque toutes les tâches
+          sont terminées.
+        - Travailleur vers coordinateur : ``{"type": "resultat", "identifiant": ...,
+          "etat": {...}}`` ou ``{"type": "erreur", "identifiant": ..., "message": ...}``.
+
+    Lorsque la connexion d'un travailleur est perdue ou qu'il ne répond pas dans le
+    délai imparti, sa tâche est remise dans la file pour un autre travailleur, au plus
+    :attr:`tentatives_max` fois. Une erreur signalée par un travailleur (par exemple
+    une entrée au format invalide) arrête l'analyse. L'analyse échoue également
+    lorsque tous les processus des travailleurs locaux se sont arrêtés et qu'aucun
+    travailleur n'est plus connecté (voir :meth:`attend_resultat`).
+
+    Class-level variables:
+        :cvar INTERVALLE_VERIFICATION (float): L'intervalle (en secondes) de
+            vérification des processus des travailleurs locaux pendant l'attente.
+
+    Attributes:
+        taches (list): Les tâches, sous la forme ``{"identifiant", "chemin", "debut",
+            "fin"}``.
+        configuration (dict): Le filtre, la granularité, la normalisation des urls et
+            les regroupements transmis aux travailleurs.
+        tentatives_max (int): Le nombre maximal d'attributions d'une même tâche.
+        delai_tache (float): Le délai (en secondes) accordé à un travailleur pour
+            traiter une tâche.
+        _taches_par_identifiant (dict): Les tâches, indexées par leur identifiant.
+        _file (list): Les identifiants des tâches en attente d'attribution.
+        _tentatives (dict): Le nombre d'attributions de chaque tâche.
+        _etats (dict): L'état partiel de chaque tâche terminée.
+        _erreur (Optional[str]): Le message de l'erreur qui a arrêté l'analyse.
+        _travailleurs_connectes (int): Le nombre de travailleurs actuellement connectés.
+        _condition (Condition): La condition qui protège et signale les changements
+            de la file et des résultats.
+    """
+
+    INTERVALLE_VERIFICATION = 0.5
+
+    def __init__(self,
+                 taches: list,
+                 filtre: FiltreLogApache,
+                 granularite: str = "heure",
+                 groupements: Optional[list] = None,
+                 normaliseur_urls: Optional[NormaliseurUrls] = None,
+                 tentatives_max: int = 3,
+                 delai_tache: float = 600.0):
+        """
+        Initialise le coordinateur.
+
+        Args:
+            taches (list): Les tâches à distribuer (voir :meth:`decoupe_fichiers`).
+            filtre (FiltreLogApache): Le filtre à appliquer aux entrées.
+            granularite (str): L'intervalle de regroupement des séries temporelles.
+                Par défaut, sa valeur est égale à ``heure``.
+            groupements (Optional[list]): Les spécifications (:class:`SpecificationGroupement`)
+                des regroupements à calculer. Si ``None``, aucun regroupement n'est calculé.
+            normaliseur_urls (Optional[NormaliseurUrls]): La normalisation des urls en
+                routes. Si ``None``, les urls brutes sont comptées.
+            tentatives_max (int): Le nombre maximal d'attributions d'une même tâche.
+                Par défaut, ``3``.
+            delai_tache (float): Le délai (en secondes) accordé à un travailleur pour
+                traiter une tâche. Par défaut, ``600`` secondes.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La liste des tâches est vide, la granularité est inconnue ou
+                un nombre est inférieur à ``1``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(taches, list) or not all(isinstance(tache, dict) for tache in taches):
+            raise TypeError("Les tâches doivent être une liste de dictionnaires.")
+        if not isinstance(tentatives_max, int) or isinstance(tentatives_max, bool):
+            raise TypeError("Le nombre maximal de tentatives doit être un entier.")
+        if not isinstance(delai_tache, (int, float)) or isinstance(delai_tache, bool):
+            raise TypeError("Le délai d'une tâche doit être un nombre.")
+        # Vérification de la valeur des paramètres
+        if not taches:
+            raise ValueError("Au moins une tâche doit être distribuée.")
+        if tentatives_max < 1 or delai_tache <= 0:
+            raise ValueError("Le nombre maximal de tentatives et le délai d'une tâche "
+                             "doivent être strictement positifs.")
+        # Vérification du filtre, de la granularité, des regroupements et de la
+        # normalisation des urls
+        etat_vide = EtatPartielAnalyse(filtre, granularite, groupements, normaliseur_urls)
+
+        self.taches = taches
+        self.configuration = {
+            "filtre": filtre.get_dict_filtre(),
+            "granularite": granularite,
+            "groupements": [str(groupement) for groupement in groupements or []],
+            "normalisation_urls": etat_vide.get_definition_normalisation()
+        }
+        self.tentatives_max = tentatives_max
+        self.delai_tache = delai_tache
+        self._taches_par_identifiant = {tache["identifiant"]: tache for tache in taches}
+        self._file = [tache["identifiant"] for tache in taches]
+        self._tentatives = {tache["identifiant"]: 0 for tache in taches}
+        self._etats = {}
+        self._erreur = None
+        self._travailleurs_connectes = 0
+        self._condition = Condition()
+
+    @staticmethod
+    def decoupe_fichiers(chemins: list, taille_tache: int = 64 * 1024 * 1024) -> list:
+        """
+        Découpe des fichiers log en tâches d'au plus ``taille_tache`` octets. Les
+        limites des plages ne sont pas alignées sur les lignes : une ligne appartient
+        à la plage qui contient son premier octet (voir :meth:`Travailleur.lit_plage`).
+
+        Args:
+            chemins (list): Les chemins des fichiers log.
+            taille_tache (int): La taille maximale (en octets) d'une plage. Par défaut,
+                64 Mio.
+
+        Returns:
+            list: Les tâches, dans l'ordre des fichiers puis des plages.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La taille d'une tâche est inférieure à ``1``.
+            OSError: Un fichier est introuvable.
+        """
+        # Vérification des paramètres
+        if not isinstance(chemins, list) or not all(isinstance(chemin, str)
+                                                    for chemin in chemins):
+            raise TypeError("Les chemins doivent être une liste de chaînes de caractères.")
+        if not isinstance(taille_tache, int) or isinstance(taille_tache, bool):
+            raise TypeError("La taille d'une tâche doit être un entier.")
+        if taille_tache < 1:
+            raise ValueError("La taille d'une tâche doit être supérieure à 0.")
+
+        taches = []
+        for chemin in chemins:
+            chemin_absolu = os.path.abspath(chemin)
+            taille = os.path.getsize(chemin_absolu)
+            for debut in range(0, max(taille, 1), taille_tache):
+                taches.append({"identifiant": len(taches), "chemin": chemin_absolu,
+                               "debut": debut, "fin": min(debut + taille_tache, taille)})
+        return taches
+
+    def _prend_tache(self) -> Optional[dict]:
+        """
+        Attribue la prochaine tâche en attente, en attendant si toutes les tâches
+        restantes sont en cours de traitement par d'autres travailleurs.
+
+        Returns:
+            Optional[dict]: La tâche, ou ``None`` si l'analyse est terminée.
+        """
+        with self._condition:
+            while not self._file and not self._est_termine():
+                self._condition.wait()
+            if self._est_termine():
+                return None
+            identifiant = self._file.pop(0)
+            self._tentatives[identifiant] += 1
+            return self._taches_par_identifiant[identifiant]
+
+    def _est_termine(self) -> bool:
+        """
+        Indique si l'analyse est terminée (toutes les tâches sont traitées ou une
+        erreur l'a arrêtée). Doit être appelée sous la condition.
+
+        Returns:
+            bool: ``True`` si l'analyse est terminée.
+        """
+        return self._erreur is not None or len(self._etats) == len(self.taches)
+
+    def _termine_tache(self, identifiant: int, etat: EtatPartielAnalyse) -> None:
+        """
+        Enregistre l'état partiel d'une tâche terminée.
+
+        Args:
+            identifiant (int): L'identifiant de la tâche.
+            etat (EtatPartielAnalyse): L'état partiel de la plage de la tâche.
+
+        Returns:
+            None
+        """
+        with self._condition:
+            self._etats[identifiant] = etat
+            self._condition.notify_all()
+
+    def _remet_tache(self, identifiant: int, raison: str) -> None:
+        """
+        Remet dans la file une tâche dont le travailleur a échoué, ou arrête
+        l'analyse si la tâche a atteint le nombre maximal de tentatives.
+
+        Args:
+            identifiant (int): L'identifiant de la tâche.
+            raison (str): La raison de l'échec.
+
+        Returns:
+            None
+        """
+        with self._condition:
+            if identifiant in self._etats or self._erreur is not None:
+                return
+            if self._tentatives[identifiant] >= self.tentatives_max:
+                self._erreur = (f"La tâche {identifiant} a échoué "
+                                f"{self._tentatives[identifiant]} fois : {raison}")
+            else:
+                self._file.insert(0, identifiant)
+            self._condition.notify_all()
+
+    def _arrete(self, message: str) -> None:
+        """
+        Arrête l'analyse à cause d'une erreur signalée par un travailleur.
+
+        Args:
+            message (str): Le message de l'erreur.
+
+        Returns:
+            None
+        """
+        with self._condition:
+            if self._erreur is None:
+                self._erreur = message
+            self._condition.notify_all()
+
+    def gere_travailleur(self, lecture, ecriture) -> None:
+        """
+        Distribue des tâches à un travailleur connecté jusqu'à la fin de l'analyse ou
+        la perte de sa connexion.
+
+        Args:
+            lecture (BinaryIO): Le flux de lecture des messages du travailleur.
+            ecriture (BinaryIO): Le flux d'écriture des messages vers le travailleur.
+
+        Returns:
+            None
+        """
+        with self._condition:
+            self._travailleurs_connectes += 1
+        try:
+            self._distribue_taches(lecture, ecriture)
+        finally:
+            with self._condition:
+                self._travailleurs_connectes -= 1
+                self._condition.notify_all()
+
+    def _distribue_taches(self, lecture, ecriture) -> None:
+        """
+        Envoie des tâches à un travailleur connecté et enregistre ses résultats (voir
+        :meth:`gere_travailleur`).
+
+        Args:
+            lecture (BinaryIO): Le flux de lecture des messages du travailleur.
+            ecriture (BinaryIO): Le flux d'écriture des messages vers le travailleur.
+
+        Returns:
+            None
+        """
+        while True:
+            tache = self._prend_tache()
+            if tache is None:
+                envoie_message(ecriture, {"type": "fin"})
+                return
+            try:
+                envoie_message(ecriture, {"type": "tache", "tache": tache,
+                                          "configuration": self.configuration})
+                reponse = recoit_message(lecture)
+                if reponse.get("identifiant") != tache["identifiant"]:
+                    raise ValueError("La réponse ne correspond pas à la tâche.")
+                if reponse.get("type") == "erreur":
+                    self._arrete(f"La tâche {tache['identifiant']} ({tache['chemin']}) "
+                                 f"a échoué : {reponse.get('message')}")
+                    # L'analyse est terminée : le travailleur reçoit le message de fin
+                    continue
+                self._termine_tache(tache["identifiant"],
+                                    EtatPartielAnalyse.depuis_dict(reponse["etat"]))
+            except (OSError, ValueError, KeyError, EtatPartielException) as ex:
+                # Travailleur perdu, trop lent ou réponse invalide
+                self._remet_tache(tache["identifiant"], str(ex) or type(ex).__name__)
+                return
+
+    def attend_resultat(self,
+                        delai: Optional[float] = None,
+                        processus: Optional[list] = None) -> EtatPartielAnalyse:
+        """
+        Attend la fin de toutes les tâches puis fusionne leurs états partiels, dans
+        l'ordre des tâches.
+
+        Pendant l'attente, les processus des travailleurs locaux sont vérifiés toutes
+        les :attr:`INTERVALLE_VERIFICATION` secondes : l'attente échoue lorsqu'ils se
+        sont tous arrêtés et qu'aucun travailleur (local ou distant) n'est connecté,
+        car plus aucune tâche ne peut alors être traitée.
+
+        Args:
+            delai (Optional[float]): L'attente maximale (en secondes). Si ``None``,
+                l'attente n'est pas limitée.
+            processus (Optional[list]): Les processus (:class:`subprocess.Popen`) des
+                travailleurs locaux. Si ``None`` ou vide, seul le délai limite l'attente.
+
+        Returns:
+            EtatPartielAnalyse: L'état fusionné de tous les fichiers.
+
+        Raises:
+            ExecutionDistribueeException: Une tâche a échoué, le délai est dépassé ou
+                tous les travailleurs se sont arrêtés avant la fin de l'analyse.
+        """
+        echeance = None if delai is None else monotonic() + delai
+        with self._condition:
+            while not self._est_termine():
+                restant = None if echeance is None else echeance - monotonic()
+                if restant is not None and restant <= 0:
+                    raise ExecutionDistribueeException(
+                        f"L'analyse distribuée n'est pas terminée après {delai} secondes "
+                        f"({len(self._etats)}/{len(self.taches)} tâches)."
+                    )
+                if processus:
+                    codes_sortie = [travailleur.poll() for travailleur in processus]
+                    if (self._travailleurs_connectes == 0
+                            and all(code is not None for code in codes_sortie)):
+                        raise ExecutionDistribueeException(
+                            f"Tous les travailleurs locaux se sont arrêtés (codes de "
+                            f"sortie {codes_sortie}) avant la fin de l'analyse "
+                            f"({len(self._etats)}/{len(self.taches)} tâches)."
+                        )
+                    restant = (self.INTERVALLE_VERIFICATION if restant is None
+                               else min(restant, self.INTERVALLE_VERIFICATION))
+                self._condition.wait(restant)
+            if self._erreur is not None:
+                raise ExecutionDistribueeException(self._erreur)
+            etats = [self._etats[tache["identifiant"]] for tache in self.taches]
+        etat_fusionne = etats[0]
+        for etat in etats[1:]:
+            etat_fusionne.fusionne(etat)
+        # Un fichier découpé en plusieurs tâches n'apparaît qu'une fois
+        etat_fusionne.chemins = list(dict.fromkeys(etat_fusionne.chemins))
+        return etat_fusionne
+
+    def cree_serveur(self, hote: str = "127.0.0.1", port: int = 9500) -> ThreadingTCPServer:
+        """
+        Crée le serveur TCP qui accepte les travailleurs. Chaque travailleur est géré
+        dans son propre thread.
+
+        Args:
+            hote (str): L'adresse d'écoute. Par défaut, uniquement la machine locale.
+            port (int): Le port d'écoute (``0`` pour un port libre choisi par le
+                système). Par défaut, sa valeur est égale à ``9500``.
+
+        Returns:
+            ThreadingTCPServer: Le serveur, à démarrer avec ``serve_forever``.
+
+        Raises:
+            OSError: Le port ne peut pas être ouvert.
+        """
+        coordinateur = self
+
+        class GestionnaireTravailleur(StreamRequestHandler):
+            """
+            Représente la connexion d'un travailleur.
+            """
+
+            def handle(self) -> None:
+                """
+                Distribue des tâches au travailleur connecté.
+
+                Returns:
+                    None
+                """
+                self.connection.settimeout(coordinateur.delai_tache)
+                coordinateur.gere_travailleur(self.rfile, self.wfile)
+
+        serveur = ThreadingTCPServer((hote, port), GestionnaireTravailleur,
+                                     bind_and_activate=False)
+        serveur.allow_reuse_address = True
+        serveur.daemon_threads = True
+        try:
+            serveur.server_bind()
+            serveur.server_activate()
+        except OSError:
+            serveur.server_close()
+            raise
+        return serveur
+
+
+def envoie_message(ecriture, message: dict) -> None:
+    """
+    Envoie un message JSON sur une ligne.
+
+    Args:
+        ecriture (BinaryIO): Le flux d'écriture.
+        message (dict): Le message.
+
+    Returns:
+        None
+
+    Raises:
+        OSError: La connexion est perdue.
+    """
+    ecriture.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+    ecriture.flush()
+
+def recoit_message(lecture) -> dict:
+    """
+    Reçoit un message JSON écrit sur une ligne.
+
+    Args:
+        lecture (BinaryIO): Le flux de lecture.
+
+    Returns:
+        dict: Le message.
+
+    Raises:
+        OSError: La connexion est perdue ou le délai de lecture est dépassé.
+        ValueError: Le message n'est pas un dictionnaire JSON.
+    """
+    ligne = lecture.readline()
+    if not ligne:
+        raise ConnectionError("La connexion a été fermée.")
+    message = json.loads(ligne)
+    if not isinstance(message, dict):
+        raise ValueError("Le message doit être un dictionnaire JSON.")
+    return message
+
+
+class ExecutionDistribueeException(Exception):
+    """
+    Représente une erreur lors d'une analyse distribuée (tâche en échec ou délai
+    dépassé).
+    """
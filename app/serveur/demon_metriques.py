@@ -0,0 +1,186 @@
+"""
+Module pour le démon qui ingère en continu les fichiers log d'un répertoire et
+expose leurs métriques au format de Prometheus.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Event, Thread
+from parse.parseur_log_apache import ParseurLogApache, ParsageLogApacheException
+from serveur.suivi_repertoire import SuiviRepertoireLogs
+from serveur.metriques_prometheus import MetriquesPrometheus
+
+
+class DemonMetriques:
+    """
+    Représente un démon qui suit les fichiers log d'un répertoire
+    (:class:`SuiviRepertoireLogs`), ingère leurs nouvelles lignes par lots et expose
+    les métriques (:class:`MetriquesPrometheus`) sur la route ``/metrics`` d'un
+    serveur HTTP local.
+
+    L'ingestion s'exécute dans son propre thread : une passe lit au plus
+    :attr:`SuiviRepertoireLogs.octets_max_par_passe` octets par fichier, puis le
+    thread attend :attr:`intervalle` secondes avant la passe suivante lorsqu'il n'y
+    a plus rien à lire. Le temps processeur et la mémoire utilisés restent ainsi
+    bornés, et les collectes de métriques ne font que lire le dernier instantané.
+
+    Attributes:
+        suivi (SuiviRepertoireLogs): Le suivi des fichiers du répertoire.
+        metriques (MetriquesPrometheus): Les métriques des entrées ingérées.
+        intervalle (float): L'attente (en secondes) entre deux passes sans
+            nouvelle ligne.
+        _parseurs (dict): Le parseur de chaque fichier suivi, retiré lorsque le fichier
+            n'est plus suivi.
+        _arret (Event): L'évènement qui demande l'arrêt de l'ingestion.
+        _thread_ingestion (Optional[Thread]): Le thread d'ingestion.
+    """
+
+    def __init__(self,
+                 suivi: SuiviRepertoireLogs,
+                 metriques: MetriquesPrometheus,
+                 intervalle: float = 1.0):
+        """
+        Initialise le démon.
+
+        Args:
+            suivi (SuiviRepertoireLogs): Le suivi des fichiers du répertoire.
+            metriques (MetriquesPrometheus): Les métriques à mettre à jour.
+            intervalle (float): L'attente (en secondes) entre deux passes sans nouvelle
+                ligne. Par défaut, ``1`` seconde.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: L'intervalle n'est pas strictement positif.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(suivi, SuiviRepertoireLogs):
+            raise TypeError("Le suivi doit être de type SuiviRepertoireLogs.")
+        if not isinstance(metriques, MetriquesPrometheus):
+            raise TypeError("Les métriques doivent être de type MetriquesPrometheus.")
+        if not isinstance(intervalle, (int, float)) or isinstance(intervalle, bool):
+            raise TypeError("L'intervalle doit être un nombre.")
+        # Vérification de la valeur des paramètres
+        if intervalle <= 0:
+            raise ValueError("L'intervalle doit être strictement positif.")
+
+        self.suivi = suivi
+        self.metriques = metriques
+        self.intervalle = intervalle
+        self._parseurs = {}
+        self._arret = Event()
+        self._thread_ingestion = None
+
+    def ingere(self) -> int:
+        """
+        Effectue une passe d'ingestion : lit les nouvelles lignes, les parse et met
+        à jour les métriques puis leur instantané.
+
+        Returns:
+            int: Le nombre de lignes lues lors de la passe.
+        """
+        lignes = self.suivi.lit_nouvelles_lignes()
+        # Les parseurs des fichiers qui ne sont plus suivis sont oubliés
+        chemins_suivis = self.suivi.get_chemins()
+        for chemin in set(self._parseurs) - chemins_suivis:
+            del self._parseurs[chemin]
+        entrees = []
+        lignes_invalides = 0
+        for chemin, ligne in lignes:
+            try:
+                parseur = self._parseurs.get(chemin)
+                if parseur is None:
+                    parseur = self._parseurs[chemin] = ParseurLogApache(chemin)
+                entrees.append(parseur.parse_entree(ligne))
+            except ParsageLogApacheException:
+                # Format invalide ou fichier supprimé avant la création de son parseur
+                lignes_invalides += 1
+        if lignes:
+            self.metriques.ajoute_entrees(entrees, lignes_invalides)
+            self.metriques.actualise_instantane()
+        return len(lignes)
+
+    def _boucle_ingestion(self) -> None:
+        """
+        Enchaîne les passes d'ingestion jusqu'à la demande d'arrêt.
+
+        Returns:
+            None
+        """
+        while not self._arret.is_set():
+            if self.ingere() == 0:
+                self._arret.wait(self.intervalle)
+
+    def demarre_ingestion(self) -> None:
+        """
+        Démarre le thread d'ingestion.
+
+        Returns:
+            None
+        """
+        self._arret.clear()
+        self._thread_ingestion = Thread(target=self._boucle_ingestion,
+                                        name="ingestion", daemon=True)
+        self._thread_ingestion.start()
+
+    def arrete_ingestion(self) -> None:
+        """
+        Demande l'arrêt du thread d'ingestion et attend la fin de la passe en cours.
+
+        Returns:
+            None
+        """
+        self._arret.set()
+        if self._thread_ingestion is not None:
+            self._thread_ingestion.join()
+            self._thread_ingestion = None
+
+    def cree_serveur_http(self, hote: str = "127.0.0.1", port: int = 9464) \
+            -> ThreadingHTTPServer:
+        """
+        Crée le serveur HTTP qui expose les métriques sur la route ``/metrics``.
+
+        Args:
+            hote (str): L'adresse d'écoute. Par défaut, uniquement la machine locale.
+            port (int): Le port d'écoute (``0`` pour un port libre choisi par le
+                système). Par défaut, sa valeur est égale à ``9464``.
+
+        Returns:
+            ThreadingHTTPServer: Le serveur, à démarrer avec ``serve_forever``.
+
+        Raises:
+            OSError: Le port ne peut pas être ouvert.
+        """
+        metriques = self.metriques
+
+        class GestionnaireMetriquesHTTP(BaseHTTPRequestHandler):
+            """
+            Représente le traitement d'une collecte de métriques.
+            """
+
+            def do_GET(self) -> None: # pylint: disable=invalid-name
+                """
+                Répond avec le dernier instantané des métriques.
+
+                Returns:
+                    None
+                """
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                corps = metriques.get_texte().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(corps)))
+                self.end_headers()
+                self.wfile.write(corps)
+
+            def log_message(self, format, *args) -> None: # pylint: disable=redefined-builtin
+                """
+                Désactive l'écriture de chaque collecte sur la sortie d'erreur.
+
+                Returns:
+                    None
+                """
+
+        serveur = ThreadingHTTPServer((hote, port), GestionnaireMetriquesHTTP)
+        serveur.daemon_threads = True
+        return serveur
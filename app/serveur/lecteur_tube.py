@@ -0,0 +1,174 @@
+"""
+Module pour la lecture non bloquante des lignes de log reçues par un tube (par
+exemple l'entrée standard d'un programme désigné par ``CustomLog "|..."`` d'Apache).
+"""
+
+import os
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+
+
+class LecteurTube:
+    """
+    Représente la lecture des lignes de log d'un descripteur de fichier (tube) dans
+    un thread dédié.
+
+    Le thread de lecture vide le tube en continu par blocs (avec :func:`os.read`,
+    sans objet fichier dont le verrou bloquerait l'arrêt de l'interpréteur) et dépose
+    chaque ligne dans un tampon borné. L'écrivain (Apache) n'attend donc jamais
+    l'analyse : lorsque le tampon est plein, les nouvelles lignes sont perdues et
+    comptées plutôt que de bloquer le tube, et la mémoire utilisée reste bornée.
+
+    Une ligne plus longue que :attr:`LONGUEUR_MAX_LIGNE` est également perdue.
+
+    Attributes:
+        descripteur (int): Le descripteur de fichier lu (par exemple ``0`` pour
+            l'entrée standard).
+        taille_tampon (int): Le nombre maximal de lignes en attente d'analyse.
+        _tampon (Queue): Les lignes lues, en attente d'analyse.
+        _lignes_perdues (int): Le nombre de lignes perdues (tampon plein ou ligne
+            trop longue).
+        _fin_flux (Event): L'évènement signalant la fin du flux.
+        _thread_lecture (Optional[Thread]): Le thread de lecture.
+
+    Class-level variables:
+        :cvar TAILLE_BLOC (int): Le nombre maximal d'octets lus à la fois.
+        :cvar LONGUEUR_MAX_LIGNE (int): La longueur maximale (en octets) d'une ligne.
+    """
+
+    TAILLE_BLOC: int = 64 * 1024
+
+    LONGUEUR_MAX_LIGNE: int = 64 * 1024
+
+    def __init__(self, descripteur: int, taille_tampon: int = 100000):
+        """
+        Initialise la lecture d'un descripteur de fichier.
+
+        Args:
+            descripteur (int): Le descripteur de fichier à lire.
+            taille_tampon (int): Le nombre maximal de lignes en attente d'analyse.
+                Par défaut, sa valeur est égale à ``100000``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La taille du tampon est inférieure à ``1``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(descripteur, int) or isinstance(descripteur, bool):
+            raise TypeError("Le descripteur de fichier doit être un entier.")
+        if not isinstance(taille_tampon, int) or isinstance(taille_tampon, bool):
+            raise TypeError("La taille du tampon doit être un entier.")
+        # Vérification de la valeur des paramètres
+        if taille_tampon < 1:
+            raise ValueError("La taille du tampon doit être supérieure à 0.")
+
+        self.descripteur = descripteur
+        self.taille_tampon = taille_tampon
+        self._tampon = Queue(taille_tampon)
+        self._lignes_perdues = 0
+        self._fin_flux = Event()
+        self._thread_lecture = None
+
+    def _depose(self, ligne: bytes) -> None:
+        """
+        Dépose une ligne dans le tampon, ou la compte comme perdue si le tampon est plein.
+
+        Args:
+            ligne (bytes): La ligne lue, sans son retour à la ligne.
+
+        Returns:
+            None
+        """
+        ligne = ligne.decode("utf-8", errors="replace").rstrip("\r")
+        if not ligne:
+            return
+        try:
+            self._tampon.put_nowait(ligne)
+        except Full:
+            self._lignes_perdues += 1
+
+    def _boucle_lecture(self) -> None:
+        """
+        Lit le descripteur par blocs jusqu'à la fin du flux et dépose les lignes
+        complètes dans le tampon.
+
+        Returns:
+            None
+        """
+        reste = b""
+        ligne_ignoree = False
+        try:
+            while True:
+                bloc = os.read(self.descripteur, self.TAILLE_BLOC)
+                if not bloc:
+                    break
+                *lignes, reste = (reste + bloc).split(b"\n")
+                if lignes and ligne_ignoree:
+                    # Fin de la ligne trop longue
+                    del lignes[0]
+                    ligne_ignoree = False
+                for ligne in lignes:
+                    self._depose(ligne)
+                if len(reste) > self.LONGUEUR_MAX_LIGNE:
+                    reste = b""
+                    if not ligne_ignoree:
+                        self._lignes_perdues += 1
+                        ligne_ignoree = True
+            # Dernière ligne sans retour à la ligne final
+            if not ligne_ignoree:
+                self._depose(reste)
+        except OSError:
+            # Descripteur fermé ou invalide
+            pass
+        finally:
+            self._fin_flux.set()
+
+    def demarre(self) -> None:
+        """
+        Démarre le thread de lecture.
+
+        Returns:
+            None
+        """
+        self._thread_lecture = Thread(target=self._boucle_lecture, name="lecture-tube",
+                                      daemon=True)
+        self._thread_lecture.start()
+
+    def recupere_lignes(self, nombre_max: int = 10000, delai: float = 0.5) -> list:
+        """
+        Retire du tampon les lignes en attente d'analyse.
+
+        Args:
+            nombre_max (int): Le nombre maximal de lignes retirées. Par défaut, ``10000``.
+            delai (float): L'attente maximale (en secondes) d'une première ligne si le
+                tampon est vide. Par défaut, ``0.5`` seconde.
+
+        Returns:
+            list: Les lignes retirées, dans l'ordre de réception (éventuellement vide).
+        """
+        lignes = []
+        try:
+            lignes.append(self._tampon.get(timeout=delai))
+            while len(lignes) < nombre_max:
+                lignes.append(self._tampon.get_nowait())
+        except Empty:
+            pass
+        return lignes
+
+    def get_lignes_perdues(self) -> int:
+        """
+        Retourne le nombre de lignes perdues (tampon plein ou ligne trop longue).
+
+        Returns:
+            int: Le nombre de lignes perdues.
+        """
+        return self._lignes_perdues
+
+    def est_termine(self) -> bool:
+        """
+        Indique si le flux est terminé et que toutes ses lignes ont été retirées.
+
+        Returns:
+            bool: ``True`` si plus aucune ligne ne peut être reçue.
+        """
+        return self._fin_flux.is_set() and self._tampon.empty()
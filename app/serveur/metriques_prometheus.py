@@ -0,0 +1,184 @@
+"""
+Module pour les métriques au format texte de Prometheus calculées sur des entrées
+de log Apache ingérées en continu.
+"""
+
+from bisect import bisect_left
+from threading import Lock
+from parse.entree_log_apache import EntreeLogApache
+
+
+class MetriquesPrometheus:
+    """
+    Représente les métriques d'un flux d'entrées de log Apache : compteurs de requêtes
+    par code de statut http, méthode http et hôte virtuel, octets envoyés, lignes
+    invalides et histogramme des temps de réponse.
+
+    L'ingestion met à jour les compteurs sous un verrou puis, après chaque lot
+    d'entrées, produit un instantané du texte exposé (:meth:`actualise_instantane`).
+    La lecture des métriques (:meth:`get_texte`) retourne cet instantané sans
+    attendre l'ingestion, quelle que soit la fréquence des collectes.
+
+    Pour borner la mémoire, le nombre de combinaisons (code, méthode, hôte virtuel)
+    est limité : au-delà, les requêtes des nouvelles combinaisons sont comptées avec
+    les étiquettes ``autre``.
+
+    Attributes:
+        series_max (int): Le nombre maximal de combinaisons d'étiquettes.
+        _requetes (dict): Le nombre de requêtes par combinaison (code, méthode, hôte
+            virtuel).
+        _octets (int): Le nombre total d'octets envoyés.
+        _lignes_invalides (int): Le nombre de lignes dont le format est invalide.
+        _histogramme (list): Le nombre de temps de réponse par intervalle de
+            :attr:`BORNES_TEMPS_REPONSE` (plus un intervalle pour ``+Inf``).
+        _somme_temps (float): La somme des temps de réponse, en secondes.
+        _verrou (Lock): Le verrou qui protège les compteurs.
+        _instantane (str): Le dernier texte produit.
+
+    Class-level variables:
+        :cvar BORNES_TEMPS_REPONSE (tuple): Les bornes supérieures (en secondes) des
+            intervalles de l'histogramme des temps de réponse.
+        :cvar ETIQUETTE_AUTRE (str): L'étiquette des combinaisons au-delà de la limite.
+    """
+
+    BORNES_TEMPS_REPONSE: tuple = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+                                   2.5, 5.0, 10.0)
+
+    ETIQUETTE_AUTRE: str = "autre"
+
+    def __init__(self, series_max: int = 10000):
+        """
+        Initialise des métriques vides.
+
+        Args:
+            series_max (int): Le nombre maximal de combinaisons d'étiquettes.
+                Par défaut, sa valeur est égale à ``10000``.
+
+        Raises:
+            TypeError: Le paramètre ``series_max`` n'est pas un entier.
+            ValueError: Le paramètre ``series_max`` est inférieur à ``1``.
+        """
+        # Vérification du paramètre
+        if not isinstance(series_max, int) or isinstance(series_max, bool):
+            raise TypeError("Le nombre maximal de séries doit être un entier.")
+        if series_max < 1:
+            raise ValueError("Le nombre maximal de séries doit être supérieur à 0.")
+
+        self.series_max = series_max
+        self._requetes = {}
+        self._octets = 0
+        self._lignes_invalides = 0
+        self._histogramme = [0] * (len(self.BORNES_TEMPS_REPONSE) + 1)
+        self._somme_temps = 0.0
+        self._verrou = Lock()
+        self._instantane = ""
+        self.actualise_instantane()
+
+    def ajoute_entrees(self, entrees: list, lignes_invalides: int = 0) -> None:
+        """
+        Ajoute un lot d'entrées aux métriques.
+
+        Args:
+            entrees (list): Les entrées (:class:`EntreeLogApache`) à ajouter.
+            lignes_invalides (int): Le nombre de lignes du lot dont le format est
+                invalide. Par défaut, ``0``.
+
+        Returns:
+            None
+
+        Raises:
+            TypeError: Une entrée n'est pas de type :class:`EntreeLogApache`.
+        """
+        # Vérification du type du paramètre
+        if not all(isinstance(entree, EntreeLogApache) for entree in entrees):
+            raise TypeError("Les entrées doivent être de type EntreeLogApache.")
+
+        bornes = self.BORNES_TEMPS_REPONSE
+        with self._verrou:
+            requetes = self._requetes
+            for entree in entrees:
+                reponse = entree.reponse
+                cle = (reponse.code_statut_http, entree.requete.methode_http,
+                       entree.requete.hote_virtuel)
+                if cle not in requetes and len(requetes) >= self.series_max:
+                    cle = (self.ETIQUETTE_AUTRE,) * 3
+                requetes[cle] = requetes.get(cle, 0) + 1
+                if reponse.taille_octets is not None:
+                    self._octets += reponse.taille_octets
+                if reponse.temps_reponse is not None:
+                    secondes = reponse.temps_reponse / 1_000_000
+                    self._histogramme[bisect_left(bornes, secondes)] += 1
+                    self._somme_temps += secondes
+            self._lignes_invalides += lignes_invalides
+
+    @staticmethod
+    def _echappe(valeur) -> str:
+        """
+        Échappe la valeur d'une étiquette selon le format texte de Prometheus.
+
+        Args:
+            valeur (any): La valeur (``None`` devient une chaîne vide).
+
+        Returns:
+            str: La valeur échappée.
+        """
+        if valeur is None:
+            return ""
+        return str(valeur).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+    def actualise_instantane(self) -> None:
+        """
+        Produit le texte exposé à partir des compteurs actuels.
+
+        Returns:
+            None
+        """
+        with self._verrou:
+            requetes = sorted(self._requetes.items(), key=lambda element: str(element[0]))
+            octets = self._octets
+            lignes_invalides = self._lignes_invalides
+            histogramme = list(self._histogramme)
+            somme_temps = self._somme_temps
+
+        lignes = [
+            "# HELP logbuster_requetes_total Nombre de requêtes par code de statut http, "
+            "méthode http et hôte virtuel.",
+            "# TYPE logbuster_requetes_total counter"
+        ]
+        for (code, methode, hote_virtuel), total in requetes:
+            lignes.append(
+                f'logbuster_requetes_total{{code="{self._echappe(code)}",'
+                f'methode="{self._echappe(methode)}",vhost="{self._echappe(hote_virtuel)}"}} '
+                f"{total}"
+            )
+        lignes += [
+            "# HELP logbuster_octets_total Nombre total d'octets envoyés.",
+            "# TYPE logbuster_octets_total counter",
+            f"logbuster_octets_total {octets}",
+            "# HELP logbuster_lignes_invalides_total Nombre de lignes au format invalide.",
+            "# TYPE logbuster_lignes_invalides_total counter",
+            f"logbuster_lignes_invalides_total {lignes_invalides}",
+            "# HELP logbuster_temps_reponse_secondes Temps de réponse des requêtes.",
+            "# TYPE logbuster_temps_reponse_secondes histogram"
+        ]
+        cumul = 0
+        for borne, total in zip(self.BORNES_TEMPS_REPONSE, histogramme):
+            cumul += total
+            lignes.append(f'logbuster_temps_reponse_secondes_bucket{{le="{borne}"}} {cumul}')
+        cumul += histogramme[-1]
+        lignes += [
+            f'logbuster_temps_reponse_secondes_bucket{{le="+Inf"}} {cumul}',
+            f"logbuster_temps_reponse_secondes_sum {somme_temps}",
+            f"logbuster_temps_reponse_secondes_count {cumul}"
+        ]
+        # Remplacement atomique de la référence : les lecteurs n'attendent jamais
+        self._instantane = "\n".join(lignes) + "\n"
+
+    def get_texte(self) -> str:
+        """
+        Retourne le dernier instantané des métriques au format texte de Prometheus.
+
+        Returns:
+            str: Les métriques.
+        """
+        return self._instantane
@@ -0,0 +1,268 @@
+"""
+Module pour le serveur local de requêtes d'analyse sur des fichiers log Apache
+gardés en mémoire.
+"""
+
+import json
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os.path import abspath
+from threading import Lock
+from typing import Optional
+from urllib.parse import urlsplit, parse_qs
+from parse.fichier_log_apache import FichierLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.expression_filtre import ExpressionFiltre
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.index_inverse import IndexInverseEntrees
+from analyse.moteur_groupement import SpecificationGroupement
+
+
+class ServeurRequetes:
+    """
+    Représente le moteur de requêtes d'un serveur local : les fichiers log sont
+    parsés et indexés une seule fois (:class:`IndexInverseEntrees`), puis chaque
+    requête d'analyse réutilise ces données et un cache des dernières réponses.
+
+    Routes disponibles (méthode ``GET``) :
+        - ``/fichiers`` : les fichiers chargés et leur nombre d'entrées.
+        - ``/analyse`` : l'analyse complète d'un fichier (voir
+          :meth:`AnalyseurLogApache.get_analyse_complete`), avec les paramètres
+          optionnels ``fichier`` (obligatoire si plusieurs fichiers sont chargés),
+          ``ip``, ``code``, ``expression``, ``top``, ``granularite`` et
+          ``groupement`` (répétable). Les paramètres vides et les listes d'adresses
+          IP lues depuis un fichier (``@chemin``) sont refusés : une requête ne peut
+          pas faire lire un fichier du serveur.
+
+    Attributes:
+        fichiers (dict): Les fichiers chargés, indexés par leur chemin absolu.
+        taille_cache (int): Le nombre maximal de réponses conservées en cache.
+        _index (dict): Les index inversés de chaque fichier.
+        _cache (OrderedDict): Les dernières réponses, de la plus ancienne à la plus
+            récemment utilisée.
+        _verrou (Lock): Le verrou qui protège le cache des accès concurrents.
+
+    Class-level variables:
+        :cvar PARAMETRES_ANALYSE (tuple): Les paramètres acceptés par la route
+            ``/analyse``.
+    """
+
+    PARAMETRES_ANALYSE: tuple = ("fichier", "ip", "code", "expression", "top",
+                                 "granularite", "groupement")
+
+    def __init__(self, fichiers: list, taille_cache: int = 128):
+        """
+        Initialise le moteur de requêtes et indexe les fichiers.
+
+        Args:
+            fichiers (list): Les fichiers (:class:`FichierLogApache`) déjà parsés.
+            taille_cache (int): Le nombre maximal de réponses conservées en cache.
+                Par défaut, sa valeur est égale à ``128``.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: La liste des fichiers est vide ou la taille du cache est
+                inférieure à ``0``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(fichiers, list) \
+                or not all(isinstance(fichier, FichierLogApache) for fichier in fichiers):
+            raise TypeError("Les fichiers doivent être une liste de FichierLogApache.")
+        if not isinstance(taille_cache, int) or isinstance(taille_cache, bool):
+            raise TypeError("La taille du cache doit être un entier.")
+        # Vérification de la valeur des paramètres
+        if not fichiers:
+            raise ValueError("Au moins un fichier doit être chargé.")
+        if taille_cache < 0:
+            raise ValueError("La taille du cache doit être supérieure ou égale à 0.")
+
+        self.fichiers = {abspath(fichier.chemin): fichier for fichier in fichiers}
+        self.taille_cache = taille_cache
+        self._index = {chemin: IndexInverseEntrees(fichier)
+                       for chemin, fichier in self.fichiers.items()}
+        self._cache = OrderedDict()
+        self._verrou = Lock()
+
+    def repond(self, url: str) -> tuple:
+        """
+        Répond à une requête ``GET``.
+
+        Args:
+            url (str): Le chemin et les paramètres de la requête, par exemple
+                ``/analyse?code=404&top=5``.
+
+        Returns:
+            tuple: Le code de statut http de la réponse et son contenu (un dictionnaire
+                sérialisable en JSON). En cas d'erreur, le contenu est
+                ``{"erreur": message}``.
+        """
+        decoupage = urlsplit(url)
+        parametres = parse_qs(decoupage.query, keep_blank_values=True)
+        if decoupage.path == "/fichiers":
+            return 200, {
+                "fichiers": [
+                    {"chemin": chemin, "total_entrees": len(fichier.entrees)}
+                    for chemin, fichier in self.fichiers.items()
+                ]
+            }
+        if decoupage.path != "/analyse":
+            return 404, {"erreur": f"La route '{decoupage.path}' est inconnue."}
+
+        cle = (tuple(sorted((nom, tuple(valeurs)) for nom, valeurs in parametres.items())))
+        with self._verrou:
+            if cle in self._cache:
+                self._cache.move_to_end(cle)
+                return self._cache[cle]
+        try:
+            reponse = 200, self._analyse(parametres)
+        except FichierNonChargeException as ex:
+            return 404, {"erreur": str(ex)}
+        except (ValueError, TypeError) as ex:
+            return 400, {"erreur": str(ex)}
+        if self.taille_cache > 0:
+            with self._verrou:
+                self._cache[cle] = reponse
+                if len(self._cache) > self.taille_cache:
+                    self._cache.popitem(last=False)
+        return reponse
+
+    def _get_chemin_fichier(self, fichier: Optional[str]) -> str:
+        """
+        Retourne le chemin absolu du fichier chargé visé par une requête.
+
+        Args:
+            fichier (Optional[str]): Le chemin indiqué dans la requête. Si ``None``,
+                l'unique fichier chargé est visé.
+
+        Returns:
+            str: Le chemin absolu du fichier.
+
+        Raises:
+            ValueError: Aucun fichier n'est indiqué alors que plusieurs sont chargés.
+            FichierNonChargeException: Le fichier n'est pas chargé.
+        """
+        if fichier is None:
+            if len(self.fichiers) > 1:
+                raise ValueError("Le paramètre 'fichier' est obligatoire lorsque plusieurs "
+                                 "fichiers sont chargés.")
+            return next(iter(self.fichiers))
+        chemin = abspath(fichier)
+        if chemin not in self.fichiers:
+            raise FichierNonChargeException(f"Le fichier '{fichier}' n'est pas chargé.")
+        return chemin
+
+    def _analyse(self, parametres: dict) -> dict:
+        """
+        Calcule l'analyse complète demandée par les paramètres d'une requête.
+
+        Args:
+            parametres (dict): Les paramètres de la requête, chacun associé à la liste
+                de ses valeurs.
+
+        Returns:
+            dict: L'analyse complète.
+
+        Raises:
+            ValueError: Un paramètre est inconnu, répété, vide ou invalide, ou fait
+                référence à un fichier du serveur.
+            TypeError: Un paramètre n'est pas du type attendu.
+            FichierNonChargeException: Le fichier n'est pas chargé.
+        """
+        inconnus = set(parametres) - set(self.PARAMETRES_ANALYSE)
+        if inconnus:
+            raise ValueError(f"Paramètres inconnus : {', '.join(sorted(inconnus))}.")
+        valeurs = {}
+        for nom, valeurs_parametre in parametres.items():
+            if nom != "groupement" and len(valeurs_parametre) > 1:
+                raise ValueError(f"Le paramètre '{nom}' ne peut être indiqué qu'une fois.")
+            if any(not valeur.strip() for valeur in valeurs_parametre):
+                raise ValueError(f"Le paramètre '{nom}' ne peut pas être vide.")
+            valeurs[nom] = valeurs_parametre[0]
+        # Le paramètre 'ip' est une égalité exacte : une valeur ``@chemin`` ne serait
+        # jamais lue comme une liste d'adresses IP, elle est refusée explicitement
+        if valeurs.get("ip", "").startswith("@"):
+            raise ValueError("Le paramètre 'ip' ne peut pas faire référence à un fichier.")
+        if "expression" in valeurs:
+            ExpressionFiltre(valeurs["expression"], fichiers_autorises=False)
+        try:
+            code = int(valeurs["code"]) if "code" in valeurs else None
+            top = int(valeurs.get("top", 3))
+        except ValueError as ex:
+            raise ValueError("Les paramètres 'code' et 'top' doivent être des entiers.") from ex
+
+        chemin = self._get_chemin_fichier(valeurs.get("fichier"))
+        filtre = FiltreLogApache(valeurs.get("ip"), code, valeurs.get("expression"))
+        analyseur = AnalyseurLogApache(
+            self.fichiers[chemin],
+            filtre,
+            top,
+            valeurs.get("granularite", "heure"),
+            entrees_filtre=self._index[chemin].get_entrees_filtre(filtre),
+            groupements=[SpecificationGroupement(specification)
+                         for specification in parametres.get("groupement", [])]
+        )
+        return analyseur.get_analyse_complete()
+
+    def cree_serveur_http(self, hote: str = "127.0.0.1", port: int = 8080) \
+            -> ThreadingHTTPServer:
+        """
+        Crée le serveur HTTP qui transmet les requêtes à ce moteur. Chaque requête
+        est traitée dans son propre thread.
+
+        Args:
+            hote (str): L'adresse d'écoute. Par défaut, uniquement la machine locale.
+            port (int): Le port d'écoute (``0`` pour un port libre choisi par le
+                système). Par défaut, sa valeur est égale à ``8080``.
+
+        Returns:
+            ThreadingHTTPServer: Le serveur, à démarrer avec ``serve_forever``.
+
+        Raises:
+            OSError: Le port ne peut pas être ouvert.
+        """
+        serveur_requetes = self
+
+        class GestionnaireRequetesHTTP(BaseHTTPRequestHandler):
+            """
+            Représente le traitement d'une requête HTTP par le serveur.
+            """
+
+            def do_GET(self) -> None: # pylint: disable=invalid-name
+                """
+                Répond à une requête ``GET`` en JSON.
+
+                Returns:
+                    None
+                """
+                code, contenu = serveur_requetes.repond(self.path)
+                corps = json.dumps(contenu, ensure_ascii=False).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(corps)))
+                self.end_headers()
+                self.wfile.write(corps)
+
+            def log_message(self, format, *args) -> None: # pylint: disable=redefined-builtin
+                """
+                Désactive l'écriture de chaque requête sur la sortie d'erreur.
+
+                Returns:
+                    None
+                """
+
+        serveur = ThreadingHTTPServer((hote, port), GestionnaireRequetesHTTP)
+        serveur.daemon_threads = True
+        return serveur
+
+
+class FichierNonChargeException(Exception):
+    """
+    Représente une erreur lorsque une requête vise un fichier log qui n'a pas été
+    chargé par le serveur.
+    """
+
+class DemarrageServeurException(Exception):
+    """
+    Représente une erreur lorsque un serveur ne peut pas être démarré, par exemple
+    lorsque son port est déjà utilisé.
+    """
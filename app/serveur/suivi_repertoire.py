@@ -0,0 +1,286 @@
+"""
+Module pour le suivi incrémental des fichiers log d'un répertoire, y compris
+lors de leur rotation.
+"""
+
+import os
+import re
+from fnmatch import fnmatch
+from typing import Optional
+
+
+class SuiviRepertoireLogs:
+    """
+    Représente le suivi des fichiers log d'un répertoire : à chaque passe, seules les
+    lignes ajoutées depuis la passe précédente sont lues.
+
+    Chaque fichier est identifié par son périphérique et son inode plutôt que par son
+    nom, ce qui permet de suivre les rotations :
+        - Rotation par renommage (``access.log`` devient ``access.log.1`` et un nouveau
+          ``access.log`` est créé) : l'ancien fichier reste suivi sous son nouveau nom,
+          même s'il ne correspond plus au motif, et il est lu jusqu'à sa fin ; le
+          nouveau est lu depuis son début.
+        - Rotation par troncature (``copytruncate``) : un fichier dont la taille devient
+          inférieure à la position déjà lue est relu depuis son début. Sa copie
+          (``access.log.1``, nouvel inode) n'est lue qu'à partir de la position
+          atteinte dans le fichier tronqué, pour ne pas relire ses lignes.
+
+    Un nouvel inode n'est lu depuis son début que s'il apparaît sous un nom vivant.
+    Un nom de rotation, c'est-à-dire le nom d'un autre fichier présent suivi d'un
+    suffixe ``.N`` ou ``-AAAAMMJJ`` (par exemple ``access.log.2.gz``), n'est jamais
+    lu, sauf la copie d'un fichier tronqué lors de la même passe.
+
+    Une ligne incomplète (sans retour à la ligne final) n'est lue qu'une fois
+    complétée. Le nombre d'octets lus par fichier et par passe est borné pour
+    limiter la mémoire et le temps de chaque passe ; le reste est lu aux passes
+    suivantes.
+
+    Attributes:
+        repertoire (str): Le répertoire surveillé.
+        motif (str): Le motif (au format de :mod:`fnmatch`) des noms de fichiers suivis.
+        octets_max_par_passe (int): Le nombre maximal d'octets lus par fichier et
+            par passe.
+        _positions (dict): Pour chaque fichier suivi (clé ``(périphérique, inode)``),
+            son chemin actuel et la position jusqu'à laquelle il a été lu (``None``
+            pour une rotation ou une archive qui n'est pas lue).
+
+    Class-level variables:
+        :cvar MOTIF_SUFFIXE_ROTATION (re.Pattern): Le début du suffixe qui distingue le
+            nom d'une rotation du nom du fichier d'origine.
+        :cvar MOTIF_SUFFIXE_COPIE (re.Pattern): Le suffixe complet du nom d'une copie
+            non compressée d'un fichier.
+    """
+
+    MOTIF_SUFFIXE_ROTATION: re.Pattern = re.compile(r"[.-]\d")
+    MOTIF_SUFFIXE_COPIE: re.Pattern = re.compile(r"[.-]\d+")
+
+    def __init__(self,
+                 repertoire: str,
+                 motif: str = "*.log",
+                 depuis_debut: bool = False,
+                 octets_max_par_passe: int = 8 * 1024 * 1024):
+        """
+        Initialise le suivi d'un répertoire.
+
+        Args:
+            repertoire (str): Le répertoire à surveiller.
+            motif (str): Le motif des noms de fichiers à suivre. Par défaut, ``*.log``
+                (fichiers log vivants, sans leurs rotations ni leurs archives ``.gz``).
+            depuis_debut (bool): Si ``True``, les fichiers déjà présents sont lus depuis
+                leur début ; sinon, seules les lignes ajoutées après la création du suivi sont
+                lues. Les fichiers créés ensuite sont toujours lus depuis leur début.
+                Par défaut, ``False``.
+            octets_max_par_passe (int): Le nombre maximal d'octets lus par fichier et
+                par passe. Par défaut, 8 Mio.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Le répertoire n'existe pas ou ``octets_max_par_passe`` est
+                inférieur à ``1``.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(repertoire, str) or not isinstance(motif, str):
+            raise TypeError("Le répertoire et le motif doivent être des chaînes de caractères.")
+        if not isinstance(depuis_debut, bool):
+            raise TypeError("L'indication de lecture depuis le début doit être un booléen.")
+        if not isinstance(octets_max_par_passe, int) or isinstance(octets_max_par_passe, bool):
+            raise TypeError("Le nombre maximal d'octets par passe doit être un entier.")
+        # Vérification de la valeur des paramètres
+        if not os.path.isdir(repertoire):
+            raise ValueError(f"Le répertoire {repertoire} est introuvable.")
+        if octets_max_par_passe < 1:
+            raise ValueError("Le nombre maximal d'octets par passe doit être supérieur à 0.")
+
+        self.repertoire = repertoire
+        self.motif = motif
+        self.octets_max_par_passe = octets_max_par_passe
+        self._positions = {}
+        # Les fichiers déjà présents sont suivis à partir de leur taille actuelle
+        self._positions = {
+            identifiant: (chemin, 0 if depuis_debut else taille)
+            for identifiant, (chemin, taille) in self._liste_fichiers().items()
+        }
+
+    def get_total_fichiers(self) -> int:
+        """
+        Retourne le nombre de fichiers suivis.
+
+        Returns:
+            int: Le nombre de fichiers suivis.
+        """
+        return len(self._positions)
+
+    def get_chemins(self) -> set:
+        """
+        Retourne les chemins actuels des fichiers suivis.
+
+        Returns:
+            set: Les chemins des fichiers suivis.
+        """
+        return {chemin for chemin, _ in self._positions.values()}
+
+    def _liste_fichiers(self, origines: Optional[set] = None) -> dict:
+        """
+        Liste les fichiers du répertoire qui correspondent au motif, ainsi que les
+        fichiers déjà suivis qui n'y correspondent plus depuis leur renommage.
+
+        Args:
+            origines (Optional[set]): Si indiqués, les noms des fichiers tronqués dont
+                les copies (``nom.N`` ou ``nom-N``) sont listées à la place des
+                fichiers qui correspondent au motif.
+
+        Returns:
+            dict: Pour chaque fichier (clé ``(périphérique, inode)``), son chemin et
+                sa taille actuelle.
+        """
+        inodes_suivis = {inode for _, inode in self._positions}
+        fichiers = {}
+        with os.scandir(self.repertoire) as entrees:
+            for entree in entrees:
+                try:
+                    if origines is None:
+                        retenu = fnmatch(entree.name, self.motif)
+                    else:
+                        retenu = self._get_nom_origine(entree.name, origines, True) is not None
+                    if not retenu and entree.inode() not in inodes_suivis:
+                        continue
+                    if not entree.is_file():
+                        continue
+                    informations = entree.stat()
+                except OSError:
+                    continue
+                identifiant = (informations.st_dev, informations.st_ino)
+                if retenu or identifiant in self._positions:
+                    fichiers[identifiant] = (entree.path, informations.st_size)
+        return fichiers
+
+    @classmethod
+    def _get_nom_origine(cls, nom: str, noms: set, copie: bool = False) -> Optional[str]:
+        """
+        Retourne le nom du fichier dont un nom est la rotation, par exemple
+        ``access.log`` pour ``access.log.1`` ou ``access.log-20250112.gz``.
+
+        Args:
+            nom (str): Le nom du fichier.
+            noms (set): Les noms des fichiers d'origine possibles.
+            copie (bool): Si ``True``, seuls les noms de copie non compressée
+                (``access.log.1``, ``access.log-20250112``) sont reconnus.
+
+        Returns:
+            Optional[str]: Le plus long nom d'origine, ou ``None`` si le nom n'est pas
+                un nom de rotation (nom vivant).
+        """
+        suffixe = cls.MOTIF_SUFFIXE_COPIE.fullmatch if copie else cls.MOTIF_SUFFIXE_ROTATION.match
+        origines = [origine for origine in noms
+                    if len(origine) < len(nom) and nom.startswith(origine)
+                    and suffixe(nom, len(origine))]
+        return max(origines, key=len) if origines else None
+
+    def _get_position_initiale(self,
+                               nom: str,
+                               taille: int,
+                               noms: set,
+                               troncatures: dict) -> Optional[int]:
+        """
+        Retourne la position à partir de laquelle lire un nouvel inode.
+
+        Args:
+            nom (str): Le nom du fichier.
+            taille (int): La taille actuelle du fichier.
+            noms (set): Les noms des fichiers listés lors de la passe.
+            troncatures (dict): La position atteinte dans chaque fichier tronqué depuis
+                la passe précédente, indexée par son nom.
+
+        Returns:
+            Optional[int]: ``0`` pour un nom vivant, la position atteinte dans le
+                fichier tronqué pour sa copie, ou ``None`` pour une rotation ou une
+                archive, qui n'est jamais lue.
+        """
+        if self._get_nom_origine(nom, noms) is None:
+            return 0
+        origine = self._get_nom_origine(nom, set(troncatures), True)
+        if origine is not None:
+            return min(troncatures[origine], taille)
+        return None
+
+    def lit_nouvelles_lignes(self) -> list:
+        """
+        Effectue une passe : lit les lignes complètes ajoutées à chaque fichier suivi
+        depuis la passe précédente.
+
+        Returns:
+            list: Les nouvelles lignes, sous la forme ``(chemin, ligne)``, dans l'ordre
+                de chaque fichier.
+        """
+        fichiers = self._liste_fichiers()
+        # Position atteinte dans chaque fichier tronqué depuis la passe précédente
+        troncatures = {}
+        for identifiant, (chemin, taille) in fichiers.items():
+            position = self._positions.get(identifiant, (None, None))[1]
+            if position is not None and taille < position:
+                troncatures[os.path.basename(chemin)] = position
+        if troncatures:
+            # Copies des fichiers tronqués (rotation copytruncate), même hors du motif
+            fichiers.update(self._liste_fichiers(set(troncatures)))
+        noms = {os.path.basename(chemin) for chemin, _ in fichiers.values()}
+        lignes = []
+        positions = {}
+        for identifiant, (chemin, taille) in fichiers.items():
+            if identifiant in self._positions:
+                position = self._positions[identifiant][1]
+                # Fichier tronqué (rotation copytruncate)
+                if position is not None and taille < position:
+                    position = 0
+            else:
+                position = self._get_position_initiale(os.path.basename(chemin), taille,
+                                                       noms, troncatures)
+            if position is not None and taille > position:
+                position = self._lit_fichier(chemin, position, lignes)
+            positions[identifiant] = (chemin, position)
+        # Les fichiers supprimés ne sont plus suivis
+        self._positions = positions
+        return lignes
+
+    def _lit_fichier(self, chemin: str, position: int, lignes: list) -> int:
+        """
+        Lit les lignes complètes d'un fichier à partir d'une position, dans la limite
+        de :attr:`octets_max_par_passe`.
+
+        Args:
+            chemin (str): Le chemin du fichier.
+            position (int): La position à partir de laquelle lire.
+            lignes (list): La liste à laquelle ajouter les lignes ``(chemin, ligne)``.
+
+        Returns:
+            int: La nouvelle position, juste après la dernière ligne complète lue.
+        """
+        donnees = self._lit_octets(chemin, position)
+        if donnees is None:
+            return position
+        fin = donnees.rfind(b"\n") + 1
+        # Une ligne plus longue que la limite est lue telle quelle pour ne pas bloquer
+        if fin == 0 and len(donnees) == self.octets_max_par_passe:
+            fin = len(donnees)
+        for ligne in donnees[:fin].decode("utf-8", errors="replace").splitlines():
+            if ligne:
+                lignes.append((chemin, ligne))
+        return position + fin
+
+    def _lit_octets(self, chemin: str, position: int) -> Optional[bytes]:
+        """
+        Lit au plus :attr:`octets_max_par_passe` octets d'un fichier.
+
+        Args:
+            chemin (str): Le chemin du fichier.
+            position (int): La position à partir de laquelle lire.
+
+        Returns:
+            Optional[bytes]: Les octets lus, ou ``None`` si le fichier ne peut plus
+                être lu (par exemple s'il a été supprimé entre-temps).
+        """
+        try:
+            with open(chemin, "rb") as fichier:
+                fichier.seek(position)
+                return fichier.read(self.octets_max_par_passe)
+        except OSError:
+            return None
@@ -0,0 +1,174 @@
+"""
+Module pour le travailleur d'une analyse distribuée : il reçoit des tâches d'un
+coordinateur, les analyse localement et renvoie leurs états partiels.
+"""
+
+import socket
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.etat_partiel_analyse import EtatPartielAnalyse
+from analyse.moteur_groupement import SpecificationGroupement
+from parse.parseur_log_apache import (
+    ParseurLogApache,
+    ParsageLogApacheException,
+    FormatLogApacheInvalideException
+)
+from serveur.coordinateur import envoie_message, recoit_message
+
+
+class Travailleur:
+    """
+    Représente un travailleur d'une analyse distribuée, connecté à un
+    :class:`Coordinateur`.
+
+    Le travailleur traite une tâche à la fois : il lit la plage d'octets du fichier
+    log désignée par la tâche, parse et filtre ses entrées puis renvoie l'état
+    partiel (:class:`EtatPartielAnalyse`) de la plage. Les fichiers doivent donc être
+    accessibles au même chemin par le coordinateur et par ses travailleurs.
+
+    Attributes:
+        hote (str): L'adresse du coordinateur.
+        port (int): Le port du coordinateur.
+        delai_connexion (float): L'attente maximale (en secondes) de la connexion
+            au coordinateur.
+    """
+
+    def __init__(self, hote: str = "127.0.0.1", port: int = 9500, delai_connexion: float = 10.0):
+        """
+        Initialise un travailleur.
+
+        Args:
+            hote (str): L'adresse du coordinateur. Par défaut, la machine locale.
+            port (int): Le port du coordinateur. Par défaut, sa valeur est égale à ``9500``.
+            delai_connexion (float): L'attente maximale (en secondes) de la connexion
+                au coordinateur. Par défaut, ``10`` secondes.
+
+        Raises:
+            TypeError: Les paramètres ne sont pas du type attendu.
+            ValueError: Le port n'est pas compris entre ``0`` et ``65535`` ou le délai
+                n'est pas strictement positif.
+        """
+        # Vérification du type des paramètres
+        if not isinstance(hote, str):
+            raise TypeError("L'adresse du coordinateur doit être une chaîne de caractères.")
+        if not isinstance(port, int) or isinstance(port, bool):
+            raise TypeError("Le port du coordinateur doit être un entier.")
+        if not isinstance(delai_connexion, (int, float)) or isinstance(delai_connexion, bool):
+            raise TypeError("Le délai de connexion doit être un nombre.")
+        # Vérification de la valeur des paramètres
+        if not 0 <= port <= 65535:
+            raise ValueError("Le port du coordinateur doit être compris entre 0 et 65535.")
+        if delai_connexion <= 0:
+            raise ValueError("Le délai de connexion doit être strictement positif.")
+
+        self.hote = hote
+        self.port = port
+        self.delai_connexion = delai_connexion
+
+    @staticmethod
+    def lit_plage(chemin: str, debut: int, fin: int):
+        """
+        Lit les lignes d'un fichier dont le premier octet est compris dans la plage
+        ``[debut, fin[``. Une ligne à cheval sur deux plages est donc lue une seule
+        fois, par la plage qui contient son début.
+
+        Args:
+            chemin (str): Le chemin du fichier.
+            debut (int): La position (en octets) du début de la plage.
+            fin (int): La position (en octets) de la fin (exclue) de la plage.
+
+        Returns:
+            Generator: Les couples ``(position, ligne)`` des lignes de la plage.
+
+        Raises:
+            OSError: Le fichier ne peut pas être lu.
+        """
+        with open(chemin, "rb") as fichier:
+            position = debut
+            if debut > 0:
+                # La ligne commencée avant la plage appartient à la plage précédente
+                fichier.seek(debut - 1)
+                position = debut - 1 + len(fichier.readline())
+            while position < fin:
+                ligne = fichier.readline()
+                if not ligne:
+                    return
+                yield position, ligne.decode("utf-8")
+                position += len(ligne)
+
+    @staticmethod
+    def analyse_tache(tache: dict, configuration: dict) -> EtatPartielAnalyse:
+        """
+        Analyse la plage d'une tâche.
+
+        Args:
+            tache (dict): La tâche (voir :meth:`Coordinateur.decoupe_fichiers`).
+            configuration (dict): Le filtre, la granularité, la normalisation des urls
+                et les regroupements (voir :attr:`Coordinateur.configuration`).
+
+        Returns:
+            EtatPartielAnalyse: L'état partiel des entrées de la plage.
+
+        Raises:
+            FichierLogApacheIntrouvableException: Le fichier est introuvable.
+            FormatLogApacheInvalideException: Une entrée de la plage est invalide.
+            OSError: Le fichier ne peut pas être lu.
+        """
+        filtre = FiltreLogApache.depuis_dict(configuration["filtre"])
+        normalisation_urls = configuration["normalisation_urls"]
+        etat = EtatPartielAnalyse(filtre, configuration["granularite"],
+                                  [SpecificationGroupement(specification)
+                                   for specification in configuration["groupements"]],
+                                  NormaliseurUrls.depuis_dict(normalisation_urls)
+                                  if normalisation_urls is not None else None)
+        parseur = ParseurLogApache(tache["chemin"])
+        predicat = filtre.get_predicat()
+        total_entrees = 0
+        for position, ligne in Travailleur.lit_plage(tache["chemin"], tache["debut"],
+                                                     tache["fin"]):
+            try:
+                entree = parseur.parse_entree(ligne)
+            except FormatLogApacheInvalideException as ex:
+                raise FormatLogApacheInvalideException(
+                    f"Le format de l'entrée à l'octet {position} "
+                    f"('{ligne.strip()}') est invalide."
+                ) from ex
+            total_entrees += 1
+            if predicat(entree):
+                etat.ajoute_entree(entree)
+        etat.ajoute_fichier(tache["chemin"], total_entrees)
+        return etat
+
+    def execute(self) -> int:
+        """
+        Se connecte au coordinateur et traite ses tâches jusqu'à la fin de l'analyse.
+
+        Une tâche qui échoue (fichier introuvable, entrée invalide...) est signalée au
+        coordinateur, qui arrête alors l'analyse.
+
+        Returns:
+            int: Le nombre de tâches traitées.
+
+        Raises:
+            OSError: La connexion au coordinateur a échoué ou a été perdue.
+            ValueError: Un message du coordinateur est invalide.
+        """
+        with socket.create_connection((self.hote, self.port),
+                                      timeout=self.delai_connexion) as connexion:
+            connexion.settimeout(None)
+            with connexion.makefile("rb") as lecture, connexion.makefile("wb") as ecriture:
+                total_taches = 0
+                while True:
+                    message = recoit_message(lecture)
+                    if message.get("type") == "fin":
+                        return total_taches
+                    tache = message["tache"]
+                    try:
+                        etat = self.analyse_tache(tache, message["configuration"])
+                        reponse = {"type": "resultat", "identifiant": tache["identifiant"],
+                                   "etat": etat.get_dict()}
+                    except (ParsageLogApacheException, OSError, UnicodeDecodeError) as ex:
+                        reponse = {"type": "erreur", "identifiant": tache["identifiant"],
+                                   "message": str(ex)}
+                    envoie_message(ecriture, reponse)
+                    total_taches += 1
@@ -0,0 +1,118 @@
+"""
+Module des tests unitaires pour la répartition des requêtes par agent utilisateur.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.classificateur_agents import ClassificateurAgents
+from analyse.analyseur_agents import AnalyseurAgents
+from parse.parseur_log_apache import ParseurLogApache
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def cree_entree(parseur, agent, code=200):
+    """
+    Crée une entrée de log Apache avec l'agent utilisateur indiqué.
+
+    Args:
+        parseur (ParseurLogApache): Le parseur des entrées.
+        agent (Optional[str]): L'agent utilisateur (``None`` pour une entrée sans agent).
+        code (int): Le code de statut http de la réponse.
+
+    Returns:
+        EntreeLogApache: L'entrée.
+    """
+    fin = f' "-" "{agent}"' if agent is not None else ""
+    return parseur.parse_entree(
+        f'10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET / HTTP/1.1" {code} 100{fin}'
+    )
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("filtre, classificateur, exception", [
+    (None, ClassificateurAgents(), TypeError),
+    (FiltreLogApache(None, None), None, TypeError)
+])
+def test_agents_exception_parametres_invalides(filtre, classificateur, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre ou classificateur d'un type incorrect.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        filtre (any): Le filtre.
+        classificateur (any): Le classificateur.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        AnalyseurAgents(filtre, classificateur)
+
+def test_agents_repartition(log_apache):
+    """
+    Vérifie la répartition des requêtes par robot, navigateur et système.
+
+    Scénarios testés:
+        - Requêtes de navigateurs, de robots, sans agent, d'agent inconnu et exclues
+          par le filtre.
+
+    Asserts:
+        - Les robots sont comptés à part des navigateurs et des systèmes.
+        - Les navigateurs et systèmes non reconnus sont comptés comme ``Autre``.
+        - Chaque agent distinct n'est classifié qu'une fois.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurAgents(FiltreLogApache(None, None, "code < 400"),
+                                ClassificateurAgents())
+    firefox = "Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0"
+    analyseur.ajoute_entrees([cree_entree(parseur, firefox)] * 3
+                             + [cree_entree(parseur, "curl/8.4.0")] * 2
+                             + [cree_entree(parseur, "Googlebot/2.1"),
+                                cree_entree(parseur, "inconnu"),
+                                cree_entree(parseur, None),
+                                cree_entree(parseur, firefox, 500)])
+    analyse = analyseur.get_analyse()
+    assert analyseur.total_entrees == 9
+    assert (analyse["requetes_sans_agent"], analyse["requetes_robots"]) == (1, 3)
+    assert analyse["taux_robots"] == pytest.approx(300 / 7)
+    assert analyse["top_robots"] == [
+        {"robot": "curl", "total": 2, "taux": pytest.approx(200 / 3)},
+        {"robot": "Googlebot", "total": 1, "taux": pytest.approx(100 / 3)}
+    ]
+    assert analyse["top_navigateurs"] == [
+        {"navigateur": "Firefox", "total": 3, "taux": 75},
+        {"navigateur": "Autre", "total": 1, "taux": 25}
+    ]
+    assert [systeme["systeme"] for systeme in analyse["top_systemes"]] == ["Linux", "Autre"]
+    assert analyse["cache"]["classifications"] == 4
+
+@pytest.mark.parametrize("nombre_par_top, exception", [
+    ("3", TypeError),
+    (-1, ValueError)
+])
+def test_agents_exception_nombre_par_top_invalide(nombre_par_top, exception):
+    """
+    Vérifie que l'analyse renvoie une erreur lorsque le nombre par top est invalide.
+
+    Scénarios testés:
+        - Nombre par top d'un type incorrect ou négatif.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        nombre_par_top (any): Le nombre par top.
+        exception (type): L'exception attendue.
+    """
+    analyseur = AnalyseurAgents(FiltreLogApache(None, None), ClassificateurAgents())
+    with pytest.raises(exception):
+        analyseur.get_analyse(nombre_par_top)
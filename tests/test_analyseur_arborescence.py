@@ -0,0 +1,210 @@
+"""
+Module des tests unitaires pour l'agrégation des requêtes par arborescence des chemins.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.analyseur_arborescence import AnalyseurArborescence
+from parse.parseur_log_apache import ParseurLogApache
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def cree_entree(parseur, url, code=200, taille=100):
+    """
+    Crée une entrée de log Apache avec l'url indiquée.
+
+    Args:
+        parseur (ParseurLogApache): Le parseur des entrées.
+        url (Optional[str]): L'url demandée (``None`` pour une requête invalide).
+        code (int): Le code de statut http de la réponse.
+        taille (int): La taille de la réponse en octets.
+
+    Returns:
+        EntreeLogApache: L'entrée.
+    """
+    requete = f'"GET {url} HTTP/1.1"' if url is not None else '"-"'
+    return parseur.parse_entree(
+        f'10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] {requete} {code} {taille}'
+    )
+
+
+# Tests unitaires
+
+def test_arborescence_agregation_par_niveau(log_apache):
+    """
+    Vérifie que les requêtes sont agrégées à chaque préfixe de leur chemin.
+
+    Scénarios testés:
+        - Requêtes vers plusieurs niveaux d'une api, avec une chaîne de requête, une
+          erreur, un chemin plus profond que la profondeur maximale, la racine, une
+          requête sans url et une requête exclue par le filtre.
+
+    Asserts:
+        - Chaque niveau contient ses chemins classés par nombre de requêtes, avec
+          leurs octets et leur taux d'erreurs.
+        - Les chemins sont tronqués à la profondeur maximale.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurArborescence(FiltreLogApache("10.0.0.1", None),
+                                      profondeur_max=2)
+    analyseur.ajoute_entrees([
+        cree_entree(parseur, "/api/v2/commandes?page=2"),
+        cree_entree(parseur, "/api/v2/commandes/12", 500, 300),
+        cree_entree(parseur, "/api/v1"),
+        cree_entree(parseur, "/index.html"),
+        cree_entree(parseur, "/"),
+        cree_entree(parseur, None)
+    ])
+    analyseur.ajoute_entree(parseur.parse_entree(
+        '10.0.0.2 - - [12/Jan/2025:10:00:00 +0000] "GET /api HTTP/1.1" 200 10'
+    ))
+    analyse = analyseur.get_analyse()
+    assert analyseur.total_entrees == 7
+    assert (analyse["requetes"], analyse["requetes_sans_url"], analyse["noeuds"]) == (5, 1, 4)
+    assert analyse["niveaux"] == [
+        {"profondeur": 1, "chemins": [
+            {"chemin": "/api", "requetes": 3, "taux": 60, "octets": 500,
+             "taux_erreurs": pytest.approx(100 / 3)},
+            {"chemin": "/index.html", "requetes": 1, "taux": 20, "octets": 100,
+             "taux_erreurs": 0}
+        ]},
+        {"profondeur": 2, "chemins": [
+            {"chemin": "/api/v2", "requetes": 2, "taux": 40, "octets": 400,
+             "taux_erreurs": 50},
+            {"chemin": "/api/v1", "requetes": 1, "taux": 20, "octets": 100,
+             "taux_erreurs": 0}
+        ]}
+    ]
+    assert [len(niveau["chemins"]) for niveau in analyseur.get_analyse(1)["niveaux"]] \
+        == [1, 1]
+
+def test_arborescence_capacite_et_normalisation(log_apache):
+    """
+    Vérifie que le nombre de noeuds reste borné et que les urls peuvent être
+    normalisées avant leur agrégation.
+
+    Scénarios testés:
+        - Cent produits distincts avec une capacité de deux noeuds, sans puis avec
+          normalisation des urls.
+
+    Asserts:
+        - Sans normalisation, chaque nouveau produit évince le précédent : seul le
+          dernier reste détaillé et les autres ne sont comptés que par leur préfixe
+          ``/produit``.
+        - Avec normalisation, tous les produits sont comptés par la route
+          ``/produit/{id}``.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    entrees = [cree_entree(parseur, f"/produit/{numero}") for numero in range(100)]
+    analyseur = AnalyseurArborescence(FiltreLogApache(None, None), capacite_noeuds=2)
+    analyseur.ajoute_entrees(entrees)
+    analyse = analyseur.get_analyse()
+    assert (analyse["noeuds"], analyse["requetes_non_detaillees"]) == (2, 0)
+    assert (analyse["noeuds_evinces"], analyse["requetes_evincees"]) == (99, 99)
+    assert analyse["niveaux"][1]["chemins"][0]["chemin"] == "/produit/99"
+    assert [niveau["chemins"][0]["requetes"] for niveau in analyse["niveaux"]] == [100, 1]
+
+    analyseur = AnalyseurArborescence(FiltreLogApache(None, None), capacite_noeuds=2,
+                                      normaliseur_urls=NormaliseurUrls())
+    analyseur.ajoute_entrees(entrees)
+    analyse = analyseur.get_analyse()
+    assert analyse["requetes_non_detaillees"] == 0
+    assert analyse["niveaux"][1]["chemins"][0]["chemin"] == "/produit/{id}"
+    assert analyse["niveaux"][1]["chemins"][0]["requetes"] == 100
+
+def test_arborescence_eviction_feuilles_froides(log_apache):
+    """
+    Vérifie que les chemins fréquents restent détaillés lorsque la capacité est
+    atteinte, même s'ils apparaissent après de nombreux chemins rares.
+
+    Scénarios testés:
+        - Cinquante chemins rares, puis un chemin fréquent demandé entre d'autres
+          chemins rares, avec une capacité de six noeuds.
+        - Un chemin plus profond que la capacité.
+
+    Asserts:
+        - Le chemin fréquent et son préfixe restent détaillés, les feuilles rares
+          sont évincées et le nombre de noeuds reste borné.
+        - Les requêtes du chemin trop profond ne sont comptées que par son premier
+          préfixe.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    entrees = [cree_entree(parseur, f"/rare/{numero}") for numero in range(50)]
+    for numero in range(20):
+        entrees.append(cree_entree(parseur, "/api/commandes"))
+        entrees.append(cree_entree(parseur, f"/autre/{numero}"))
+    analyseur = AnalyseurArborescence(FiltreLogApache(None, None), capacite_noeuds=6)
+    analyseur.ajoute_entrees(entrees)
+    analyse = analyseur.get_analyse()
+    assert (analyse["noeuds"], analyse["requetes"]) == (6, 90)
+    assert (analyse["noeuds_evinces"], analyse["requetes_evincees"]) == (68, 68)
+    chemins = {chemin["chemin"]: chemin["requetes"]
+               for niveau in analyse["niveaux"] for chemin in niveau["chemins"]}
+    assert (chemins["/rare"], chemins["/autre"]) == (50, 20)
+    assert chemins["/api/commandes"] == 20
+    assert chemins["/api"] == 20
+
+    analyseur = AnalyseurArborescence(FiltreLogApache(None, None), capacite_noeuds=1)
+    analyseur.ajoute_entrees([cree_entree(parseur, "/a/b") for _ in range(3)])
+    analyse = analyseur.get_analyse()
+    assert (analyse["noeuds"], analyse["requetes_non_detaillees"]) == (1, 3)
+    assert analyse["niveaux"][0]["chemins"][0]["requetes"] == 3
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"filtre": None}, TypeError),
+    ({"profondeur_max": "3"}, TypeError),
+    ({"normaliseur_urls": "/{id}"}, TypeError),
+    ({"profondeur_max": 0}, ValueError),
+    ({"capacite_noeuds": 0}, ValueError)
+])
+def test_arborescence_exception_parametres_invalides(parametres, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre, profondeur ou normalisation des urls d'un type incorrect.
+        - Profondeur ou capacité nulle.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        parametres (dict): Les paramètres qui remplacent les paramètres valides.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        AnalyseurArborescence(**{"filtre": FiltreLogApache(None, None), **parametres})
+
+@pytest.mark.parametrize("nombre_par_top, exception", [
+    ("3", TypeError),
+    (-1, ValueError)
+])
+def test_arborescence_exception_nombre_par_top_invalide(nombre_par_top, exception):
+    """
+    Vérifie que l'analyse renvoie une erreur lorsque le nombre par top est invalide.
+
+    Scénarios testés:
+        - Nombre par top d'un type incorrect ou négatif.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        nombre_par_top (any): Le nombre par top.
+        exception (type): L'exception attendue.
+    """
+    analyseur = AnalyseurArborescence(FiltreLogApache(None, None))
+    with pytest.raises(exception):
+        analyseur.get_analyse(nombre_par_top)
@@ -0,0 +1,69 @@
+"""
+Module des tests unitaires pour la base commune des analyses en flux d'entrées
+horodatées.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_entrees_horodatees import AnalyseurEntreesHorodatees
+from analyse.analyseur_sessions import AnalyseurSessions
+from analyse.detecteur_abus import DetecteurAbus
+from analyse.analyseur_slo import AnalyseurSLO
+from parse.parseur_log_apache import ParseurLogApache
+
+
+# Tests unitaires
+
+def test_entrees_horodatees_admission(log_apache):
+    """
+    Vérifie que seules les entrées filtrées et horodatées sont admises.
+
+    Scénarios testés:
+        - Entrée qui passe le filtre.
+        - Entrée qui ne passe pas le filtre.
+        - Entrée qui passe le filtre mais sans horodatage.
+
+    Asserts:
+        - Seule la première entrée est admise.
+        - Toutes les entrées sont comptées, et seule la dernière est ignorée.
+        - L'ajout d'entrées doit être défini par la classe fille.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    ligne = '10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET / HTTP/1.1" {} 100 "-" "-"'
+    admise = parseur.parse_entree(ligne.format(200))
+    filtree = parseur.parse_entree(ligne.format(500))
+    sans_horodatage = parseur.parse_entree(ligne.format(200))
+    sans_horodatage.requete.horodatage = None
+    analyseur = AnalyseurEntreesHorodatees(FiltreLogApache(None, None, "code < 400"))
+    assert [analyseur._admet_entree(entree)
+            for entree in (admise, filtree, sans_horodatage)] == [True, False, False]
+    assert analyseur.total_entrees == 3
+    assert analyseur.entrees_ignorees == 1
+    with pytest.raises(NotImplementedError):
+        analyseur.ajoute_entrees([admise])
+
+@pytest.mark.parametrize("classe", [AnalyseurSessions, DetecteurAbus, AnalyseurSLO])
+def test_entrees_horodatees_analyses_en_flux(log_apache, classe):
+    """
+    Vérifie que les analyses en flux partagent la même admission des entrées.
+
+    Scénarios testés:
+        - Ajout d'une entrée sans horodatage à chaque analyse en flux.
+
+    Asserts:
+        - L'analyse hérite de :class:`AnalyseurEntreesHorodatees`.
+        - L'entrée est comptée puis ignorée.
+
+    Args:
+        classe (type): La classe de l'analyse en flux.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    entree = parseur.parse_entree(
+        '10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET / HTTP/1.1" 200 100 "-" "-"'
+    )
+    entree.requete.horodatage = None
+    analyseur = classe(FiltreLogApache(None, None))
+    analyseur.ajoute_entree(entree)
+    assert isinstance(analyseur, AnalyseurEntreesHorodatees)
+    assert analyseur.total_entrees == 1
+    assert analyseur.entrees_ignorees == 1
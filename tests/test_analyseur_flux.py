@@ -0,0 +1,139 @@
+"""
+Module des tests unitaires pour l'analyse en flux d'entrées de log Apache.
+"""
+
+from datetime import timedelta
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.analyseur_flux import AnalyseurFlux
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"filtre": "code=500"}, TypeError),
+    ({"granularite": "semaine"}, ValueError),
+    ({"capacite_urls": 0}, ValueError),
+    ({"fenetre_secondes": 1.5}, TypeError),
+    ({"fenetre_secondes": 0}, ValueError),
+    ({"normaliseur_urls": "/{id}"}, TypeError)
+])
+def test_analyseur_flux_exception_parametres_invalides(filtre_log_apache, parametres,
+                                                       exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre, fenêtre ou normalisation des urls d'un type incorrect.
+        - Granularité inconnue, capacité ou fenêtre nulle.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+        parametres (dict): Les paramètres qui remplacent ceux par défaut.
+        exception (type): L'exception attendue.
+    """
+    arguments = {"filtre": filtre_log_apache}
+    arguments.update(parametres)
+    with pytest.raises(exception):
+        AnalyseurFlux(**arguments)
+
+@pytest.mark.parametrize("filtre", [
+    FiltreLogApache(None, None),
+    FiltreLogApache(None, 500),
+    FiltreLogApache(None, None, "methode = DELETE")
+])
+def test_analyseur_flux_identique_analyse_fichier(fichier_log_apache, filtre):
+    """
+    Vérifie que l'analyse en flux produit les mêmes statistiques que l'analyse du
+    fichier lorsque les bornes de mémoire ne sont pas atteintes et que la fenêtre
+    couvre toutes les entrées.
+
+    Scénarios testés:
+        - Entrées du fichier de test ajoutées une à une, avec plusieurs filtres.
+
+    Asserts:
+        - Les totaux, la répartition des codes, les quantiles et les séries
+          temporelles sont identiques.
+        - Les urls les plus demandées sont identiques, sans erreur.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        filtre (FiltreLogApache): Le filtre des deux analyses.
+    """
+    analyseur_flux = AnalyseurFlux(filtre, fenetre_secondes=365 * 86400)
+    analyseur_flux.ajoute_entrees(fichier_log_apache.entrees)
+    analyse_flux = analyseur_flux.get_analyse_complete()
+    analyse = AnalyseurLogApache(fichier_log_apache, filtre).get_analyse_complete()
+
+    assert analyse_flux["total_entrees"] == analyse["total_entrees"]
+    assert analyse_flux["filtre"] == analyse["filtre"]
+    statistiques_flux = analyse_flux["statistiques"]
+    statistiques = analyse["statistiques"]
+    for cle in ("total_entrees_filtre", "reponses", "series_temporelles"):
+        assert statistiques_flux[cle] == statistiques[cle]
+    assert [{cle: url[cle] for cle in ("url", "total", "taux")}
+            for url in statistiques_flux["requetes"]["top_urls"]] \
+        == statistiques["requetes"]["top_urls"]
+    assert all(url["erreur_max"] == 0 for url in statistiques_flux["requetes"]["top_urls"])
+
+def test_analyseur_flux_fenetre_glissante(filtre_log_apache, entree_log_apache):
+    """
+    Vérifie que les séries temporelles ne couvrent que la fenêtre la plus récente.
+
+    Scénarios testés:
+        - Entrées réparties sur plusieurs heures avec une fenêtre d'une heure.
+        - Entrée en retard, antérieure à la fenêtre.
+
+    Asserts:
+        - Seuls les intervalles de la fenêtre sont présents dans les séries.
+        - Les totaux et quantiles tiennent compte de toutes les entrées.
+        - Le nombre de secondes conservées reste borné.
+
+    Args:
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+        entree_log_apache (EntreeLogApache): Fixture pour l'instance
+            de la classe :class:`EntreeLogApache`.
+    """
+    analyseur_flux = AnalyseurFlux(filtre_log_apache, fenetre_secondes=3600)
+    debut = entree_log_apache.requete.horodatage
+    for seconde in range(0, 3 * 3600, 2):
+        entree_log_apache.requete.horodatage = debut + timedelta(seconds=seconde)
+        analyseur_flux.ajoute_entree(entree_log_apache)
+    entree_log_apache.requete.horodatage = debut
+    analyseur_flux.ajoute_entree(entree_log_apache)
+
+    assert len(analyseur_flux.secondes) <= 2 * 3600
+    analyse = analyseur_flux.get_analyse_complete()
+    series = analyse["statistiques"]["series_temporelles"]["series"]
+    assert sum(serie["requetes"] for serie in series) == 1800
+    assert analyse["total_entrees"] == 5401
+    assert analyse["statistiques"]["reponses"]["taille_octets"]["global"]["total"] == 5401
+
+def test_analyseur_flux_lignes_invalides_et_perdues(filtre_log_apache):
+    """
+    Vérifie que les compteurs de lignes invalides et perdues apparaissent dans
+    l'analyse.
+
+    Scénarios testés:
+        - Analyse sans entrée avec des lignes invalides et perdues.
+
+    Asserts:
+        - La section ``flux`` contient les compteurs.
+        - L'analyse d'un flux vide ne contient ni url ni série.
+    """
+    analyseur_flux = AnalyseurFlux(filtre_log_apache, capacite_urls=10)
+    analyseur_flux.lignes_invalides = 2
+    analyseur_flux.lignes_perdues = 3
+    analyse = analyseur_flux.get_analyse_complete()
+    assert analyse["flux"] == {"lignes_invalides": 2, "lignes_perdues": 3,
+                               "fenetre_secondes": 86400, "urls_suivies": 0}
+    assert analyse["statistiques"]["requetes"]["top_urls"] == []
+    assert analyse["statistiques"]["series_temporelles"]["series"] == []
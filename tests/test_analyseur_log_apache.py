@@ -7,6 +7,7 @@ from os.path import abspath
 from parse.fichier_log_apache import FichierLogApache
 from analyse.filtre_log_apache import FiltreLogApache
 from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.moteur_groupement import SpecificationGroupement
 
 
 # Tests unitaires
@@ -302,7 +303,7 @@ def test_analyseur_get_entrees_passent_filtre_valide(mocker,
     retour_methode += [False] * nombre_entrees_valides
 
     analyseur_log_apache.filtre = mocker.MagicMock()
-    analyseur_log_apache.filtre.entree_passe_filtre.side_effect = retour_methode
+    analyseur_log_apache.filtre.get_predicat.return_value.side_effect = retour_methode
 
     entrees_filtre = analyseur_log_apache._get_entrees_passent_filtre()
 
@@ -335,4 +336,151 @@ def test_analyseur_get_analyse_complete_valide(analyseur_log_apache):
     statistiques_reponses = statistiques["reponses"]
     assert (statistiques_reponses["repartition_code_statut_http"] 
             == analyseur_log_apache.get_total_par_code_statut_http())
-    
\ No newline at end of file
+    
+def test_analyseur_statistiques_taille_octets_valide(analyseur_log_apache):
+    """
+    Vérifie que ``get_statistiques_taille_octets`` retourne les quantiles de la taille
+    des réponses globalement et par code de statut http.
+
+    Scénarios testés:
+        - Calcul des quantiles sur les entrées de ``lignes_valides``.
+
+    Asserts:
+        - Les statistiques globales portent sur toutes les réponses.
+        - Les statistiques par code sont triées par code et correctes.
+
+    Args:
+        analyseur_log_apache (AnalyseurLogApache): Fixture pour l'instance 
+            de la classe :class:`AnalyseurLogApache`.
+    """
+    statistiques = analyseur_log_apache.get_statistiques_taille_octets()
+    assert statistiques["global"]["total"] == 5
+    assert statistiques["global"]["minimum"] == 20
+    assert statistiques["global"]["maximum"] == 532
+    assert statistiques["global"]["p50"] == 20
+    assert statistiques["global"]["p99"] == 532
+    par_code = statistiques["par_code_statut_http"]
+    assert [stat["code"] for stat in par_code] == [200, 500]
+    assert par_code[0]["total"] == 1
+    assert par_code[0]["p50"] == 532
+    assert par_code[1]["total"] == 4
+    assert par_code[1]["p999"] == 20
+
+def test_analyseur_statistiques_temps_reponse_valide(analyseur_log_apache,
+                                                     entree_log_apache):
+    """
+    Vérifie que ``get_statistiques_temps_reponse`` ignore les entrées sans temps
+    de réponse et analyse celles qui en ont un.
+
+    Scénarios testés:
+        - Aucune entrée ne contient de temps de réponse.
+        - Une seule entrée contient un temps de réponse.
+
+    Asserts:
+        - Le total est égal à 0 sans temps de réponse.
+        - Les quantiles sont égaux à l'unique temps de réponse sinon.
+
+    Args:
+        analyseur_log_apache (AnalyseurLogApache): Fixture pour l'instance 
+            de la classe :class:`AnalyseurLogApache`.
+        entree_log_apache (EntreeLogApache): Fixture pour l'instance 
+            de la classe :class:`EntreeLogApache`.
+    """
+    statistiques = analyseur_log_apache.get_statistiques_temps_reponse()
+    assert statistiques["global"]["total"] == 0
+    assert statistiques["par_code_statut_http"] == []
+    entree_log_apache.reponse.temps_reponse = 1500
+    statistiques = analyseur_log_apache.get_statistiques_temps_reponse()
+    assert statistiques["global"]["total"] == 1
+    assert statistiques["global"]["p90"] == 1500
+    assert statistiques["par_code_statut_http"][0]["code"] == 200
+
+def test_analyseur_exception_granularite_invalide():
+    """
+    Vérifie que la classe AnalyseurLogApache lève une exception si la granularité
+    des séries temporelles est inconnue.
+
+    Scénarios testés:
+        - Granularité inconnue pour le paramètre ``granularite``.
+
+    Asserts:
+        - Une exception :class:`ValueError` est levée.
+    """
+    with pytest.raises(ValueError):
+        AnalyseurLogApache(FichierLogApache("test.log"), FiltreLogApache(None, None),
+                           3, "semaine")
+
+def test_analyseur_series_temporelles_valide(analyseur_log_apache):
+    """
+    Vérifie que ``get_series_temporelles`` regroupe les entrées qui passent le filtre
+    par intervalle de temps.
+
+    Scénarios testés:
+        - Regroupement par heure des entrées de ``lignes_valides``.
+
+    Asserts:
+        - Les intervalles sont triés et couvrent toutes les entrées.
+        - Les erreurs et les octets sont correctement comptés.
+
+    Args:
+        analyseur_log_apache (AnalyseurLogApache): Fixture pour l'instance 
+            de la classe :class:`AnalyseurLogApache`.
+    """
+    resultat = analyseur_log_apache.get_series_temporelles()
+    series = resultat["series"]
+    assert resultat["granularite"] == "heure"
+    assert [serie["debut"] for serie in series] == sorted(serie["debut"] for serie in series)
+    assert sum(serie["requetes"] for serie in series) == 5
+    assert sum(serie["erreurs"] for serie in series) == 4
+    assert sum(serie["octets"] for serie in series) == 612
+    assert resultat["pic_requetes_par_seconde"] == 2
+
+def test_analyseur_groupements_valide(fichier_log_apache, filtre_log_apache):
+    """
+    Vérifie que ``get_groupements`` calcule les regroupements demandés sur les
+    entrées qui passent le filtre.
+
+    Scénarios testés:
+        - Aucun regroupement demandé.
+        - Regroupement par classe de code avec un filtre sur l'adresse IP.
+
+    Asserts:
+        - La liste est vide sans regroupement.
+        - Seules les entrées qui passent le filtre sont regroupées.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance 
+            de la classe :class:`FichierLogApache`.
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance 
+            de la classe :class:`FiltreLogApache`.
+    """
+    assert AnalyseurLogApache(fichier_log_apache, filtre_log_apache).get_groupements() == []
+    filtre_log_apache.adresse_ip = "::1"
+    analyseur = AnalyseurLogApache(fichier_log_apache, filtre_log_apache,
+                                   groupements=[SpecificationGroupement("classe_code")])
+    groupements = analyseur.get_groupements()
+    assert groupements[0]["groupes"] == [
+        {"classe_code": "5xx", "total": 3, "taux": 100.0,
+         "somme_octets": 60, "moyenne_octets": 20.0}
+    ]
+    assert analyseur.get_analyse_complete()["statistiques"]["groupements"] == groupements
+
+def test_analyseur_exception_groupements_type_invalide(fichier_log_apache, filtre_log_apache):
+    """
+    Vérifie que la classe AnalyseurLogApache lève une exception si les regroupements
+    ne sont pas des spécifications.
+
+    Scénarios testés:
+        - Regroupement sous forme textuelle.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance 
+            de la classe :class:`FichierLogApache`.
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance 
+            de la classe :class:`FiltreLogApache`.
+    """
+    with pytest.raises(TypeError):
+        AnalyseurLogApache(fichier_log_apache, filtre_log_apache, groupements=["ip"])
@@ -0,0 +1,323 @@
+"""
+Module des tests unitaires pour l'analyseur vectorisé (pandas) d'un fichier de log Apache.
+"""
+
+import json
+import pytest
+from random import Random
+from parse.fichier_log_apache import FichierLogApache
+from parse.parseur_log_apache import ParseurLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.analyseur_log_apache_pandas import AnalyseurLogApachePandas
+from analyse.analyseur_multi_filtres import AnalyseurMultiFiltres
+from analyse.moteur_groupement import MoteurGroupement, SpecificationGroupement
+from analyse.normaliseur_urls import NormaliseurUrls
+
+
+# Données utilisées pour les tests unitaires
+
+groupements = [
+    SpecificationGroupement("ip"),
+    SpecificationGroupement("methode,code"),
+    SpecificationGroupement("url,classe_code,vhost"),
+    SpecificationGroupement("heure,jour"),
+    SpecificationGroupement("referent,agent,protocole"),
+    SpecificationGroupement("ip,agent,url,referent,vhost,heure,jour,methode,protocole,code")
+]
+
+filtres = [
+    FiltreLogApache(None, None),
+    FiltreLogApache("::1", None),
+    FiltreLogApache(None, 500),
+    FiltreLogApache("9.9.9.9", None)
+]
+
+
+# Fixtures utilisées pour les tests unitaires
+
+@pytest.fixture
+def fichier_log_apache_aleatoire(tmp_path):
+    """
+    Fixture pour créer et parser un fichier de log Apache aléatoire (mais reproductible)
+    contenant des requêtes invalides (``"-"``), des tailles absentes, des temps de
+    réponse et des hôtes virtuels.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+
+    Returns:
+        FichierLogApache: Le fichier de log Apache parsé.
+    """
+    aleatoire = Random(1)
+    lignes = []
+    for _ in range(2000):
+        adresse_ip = aleatoire.choice(["1.1.1.1", "::1", f"10.0.0.{aleatoire.randint(0, 50)}"])
+        requete = aleatoire.choice(['"GET /a HTTP/1.1"', '"POST /b HTTP/1.1"', '"-"',
+                                    f'"GET /{aleatoire.randint(0, 30)} HTTP/2"'])
+        code = aleatoire.choice([200, 200, 301, 404, 500])
+        taille = aleatoire.choice(["-", str(aleatoire.randint(0, 5000))])
+        temps = f" {aleatoire.randint(1, 10 ** 6)}" if aleatoire.random() < 0.7 else ""
+        hote_virtuel = aleatoire.choice(["", "site.fr:80 "])
+        lignes.append(f"{hote_virtuel}{adresse_ip} - - [12/Jan/2025:"
+                      f"{aleatoire.randint(0, 23):02d}:{aleatoire.randint(0, 59):02d}:"
+                      f"{aleatoire.randint(0, 59):02d} +0000] {requete} {code} "
+                      f"{taille}{temps}")
+    fichier = tmp_path / "aleatoire.log"
+    fichier.write_text("\n".join(lignes))
+    return ParseurLogApache(str(fichier)).parse_fichier()
+
+
+# Tests unitaires
+
+def test_analyseur_pandas_exception_donnees_invalides(fichier_log_apache, filtre_log_apache):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les données fournies ne sont pas
+    un DataFrame.
+
+    Scénarios testés:
+        - Données sous forme d'une liste.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+    """
+    with pytest.raises(TypeError):
+        AnalyseurLogApachePandas(fichier_log_apache, filtre_log_apache, donnees=[])
+
+def test_analyseur_pandas_exception_construit_donnees_type_invalide():
+    """
+    Vérifie que ``construit_donnees`` renvoie une erreur lorsque le fichier n'est pas
+    un :class:`FichierLogApache`.
+
+    Scénarios testés:
+        - Fichier sous forme d'un chemin.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    with pytest.raises(TypeError):
+        AnalyseurLogApachePandas.construit_donnees("access.log")
+
+def test_analyseur_pandas_construit_donnees(fichier_log_apache):
+    """
+    Vérifie que le tableau des entrées contient une ligne typée par entrée.
+
+    Scénarios testés:
+        - Construction du tableau à partir du fichier de test.
+
+    Asserts:
+        - Le tableau contient une ligne par entrée, dans l'ordre du fichier.
+        - Les colonnes textuelles sont catégorielles.
+        - Les valeurs de la première ligne correspondent à la première entrée.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+    """
+    donnees = AnalyseurLogApachePandas.construit_donnees(fichier_log_apache)
+    assert len(donnees) == len(fichier_log_apache.entrees)
+    assert donnees["ip"].dtype == "category"
+    assert donnees["ip"].iloc[0] == "192.168.1.1"
+    assert donnees["url"].iloc[0] == "/index.html"
+    assert donnees["code"].iloc[0] == 200
+    assert donnees["taille"].iloc[0] == 532
+
+@pytest.mark.parametrize("filtre", filtres)
+def test_analyseur_pandas_analyse_identique_fichier_test(fichier_log_apache, filtre):
+    """
+    Vérifie que l'analyse JSON du moteur pandas est identique à celle du moteur Python
+    sur le fichier de test.
+
+    Scénarios testés:
+        - Analyse sans filtre, avec un filtre sur l'adresse IP, sur le code de statut
+          http, puis avec un filtre qui ne retient aucune entrée.
+
+    Asserts:
+        - Les deux analyses sérialisées en JSON sont identiques.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        filtre (FiltreLogApache): Le filtre appliqué.
+    """
+    analyse_python = AnalyseurLogApache(fichier_log_apache, filtre,
+                                        groupements=groupements).get_analyse_complete()
+    analyse_pandas = AnalyseurLogApachePandas(fichier_log_apache, filtre,
+                                              groupements=groupements).get_analyse_complete()
+    assert json.dumps(analyse_pandas) == json.dumps(analyse_python)
+
+@pytest.mark.parametrize("filtre", filtres)
+def test_analyseur_pandas_analyse_identique_fichier_aleatoire(fichier_log_apache_aleatoire,
+                                                              filtre):
+    """
+    Vérifie que l'analyse JSON du moteur pandas est identique à celle du moteur Python
+    sur un fichier plus volumineux avec des valeurs absentes.
+
+    Scénarios testés:
+        - Analyse avec chaque filtre, un top de 5 et une granularité à la minute.
+
+    Asserts:
+        - Les deux analyses sérialisées en JSON sont identiques.
+
+    Args:
+        fichier_log_apache_aleatoire (FichierLogApache): Le fichier aléatoire parsé.
+        filtre (FiltreLogApache): Le filtre appliqué.
+    """
+    analyse_python = AnalyseurLogApache(fichier_log_apache_aleatoire, filtre, 5, "minute",
+                                        groupements=groupements).get_analyse_complete()
+    analyse_pandas = AnalyseurLogApachePandas(fichier_log_apache_aleatoire, filtre, 5,
+                                              "minute", groupements=groupements
+                                              ).get_analyse_complete()
+    assert json.dumps(analyse_pandas) == json.dumps(analyse_python)
+
+def test_analyseur_pandas_fichier_vide(filtre_log_apache):
+    """
+    Vérifie que le moteur pandas produit la même analyse qu'en Python pour un fichier
+    sans entrée.
+
+    Scénarios testés:
+        - Analyse d'un fichier vide.
+
+    Asserts:
+        - Les deux analyses sérialisées en JSON sont identiques.
+
+    Args:
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+    """
+    fichier = FichierLogApache("vide.log")
+    analyse_python = AnalyseurLogApache(fichier, filtre_log_apache,
+                                        groupements=groupements).get_analyse_complete()
+    analyse_pandas = AnalyseurLogApachePandas(fichier, filtre_log_apache,
+                                              groupements=groupements).get_analyse_complete()
+    assert json.dumps(analyse_pandas) == json.dumps(analyse_python)
+
+def test_analyseur_pandas_groupements_bornes(fichier_log_apache, monkeypatch):
+    """
+    Vérifie que le moteur pandas borne les groupes comme :class:`MoteurGroupement`
+    lorsque le nombre de groupes dépasse sa taille maximale.
+
+    Scénarios testés:
+        - Regroupement par méthode avec au maximum deux groupes conservés.
+
+    Asserts:
+        - Le regroupement est identique à celui d'un :class:`MoteurGroupement` de même
+          taille maximale alimenté avec les entrées dans l'ordre du fichier.
+        - Deux groupes sont conservés et le groupe « autres » n'est pas vide.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        monkeypatch (MonkeyPatch): Fixture pytest pour modifier la taille maximale.
+    """
+    monkeypatch.setattr(MoteurGroupement, "TAILLE_MAXIMALE", 2)
+    specifications = [SpecificationGroupement("methode")]
+    groupement = AnalyseurLogApachePandas(
+        fichier_log_apache, FiltreLogApache(None, None), groupements=specifications
+    ).get_groupements()[0]
+    moteur = MoteurGroupement(specifications, 2)
+    moteur.ajoute_entrees(fichier_log_apache.entrees)
+    assert groupement == moteur.get_groupements()[0]
+    assert groupement["total_groupes"] == 2
+    assert groupement["autres"] is not None
+
+def test_analyseur_pandas_groupements_au_dela_taille_maximale(tmp_path):
+    """
+    Vérifie que les moteurs pandas et Python retournent les mêmes regroupements
+    au-delà de la taille maximale de :class:`MoteurGroupement`.
+
+    Scénarios testés:
+        - Regroupement par adresse IP et par méthode sur un fichier contenant plus
+          d'adresses IP distinctes que la taille maximale.
+
+    Asserts:
+        - Les regroupements des deux moteurs sont identiques.
+        - Le regroupement par adresse IP est borné et a un groupe « autres ».
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    aleatoire = Random(2)
+    # Chaque adresse apparaît au moins une fois, les cent premières bien plus souvent
+    adresses = list(range(MoteurGroupement.TAILLE_MAXIMALE + 2000))
+    adresses += [aleatoire.randint(0, 100) for _ in range(len(adresses))]
+    aleatoire.shuffle(adresses)
+    lignes = [
+        f"10.{adresse // 65536}.{adresse // 256 % 256}.{adresse % 256} - - "
+        f'[12/Jan/2025:10:{aleatoire.randint(0, 59):02d}:00 +0000] "GET / HTTP/1.1" 200 '
+        f"{aleatoire.randint(0, 100)}"
+        for adresse in adresses
+    ]
+    fichier = tmp_path / "adresses.log"
+    fichier.write_text("\n".join(lignes))
+    fichier_log = ParseurLogApache(str(fichier)).parse_fichier()
+    specifications = [SpecificationGroupement("ip"), SpecificationGroupement("methode")]
+    groupements_python = AnalyseurLogApache(fichier_log, FiltreLogApache(None, None),
+                                            groupements=specifications).get_groupements()
+    groupements_pandas = AnalyseurLogApachePandas(fichier_log, FiltreLogApache(None, None),
+                                                  groupements=specifications).get_groupements()
+    assert groupements_pandas == groupements_python
+    assert groupements_python[0]["total_groupes"] == MoteurGroupement.TAILLE_MAXIMALE
+    assert groupements_python[0]["autres"] is not None
+
+def test_analyseur_pandas_multi_filtres(fichier_log_apache_aleatoire):
+    """
+    Vérifie que l'analyse multi-filtres avec le moteur pandas partage un seul tableau
+    et produit les mêmes analyses qu'avec le moteur Python.
+
+    Scénarios testés:
+        - Analyse multi-filtres avec les deux moteurs.
+
+    Asserts:
+        - Tous les analyseurs pandas utilisent le même tableau des entrées.
+        - Les analyses sérialisées en JSON sont identiques.
+
+    Args:
+        fichier_log_apache_aleatoire (FichierLogApache): Le fichier aléatoire parsé.
+    """
+    analyseur_python = AnalyseurMultiFiltres(fichier_log_apache_aleatoire, filtres,
+                                             groupements=groupements)
+    analyseur_pandas = AnalyseurMultiFiltres(fichier_log_apache_aleatoire, filtres,
+                                             groupements=groupements, moteur="pandas")
+    analyseurs = analyseur_pandas.get_analyseurs()
+    assert all(analyseur.donnees is analyseurs[0].donnees for analyseur in analyseurs)
+    assert json.dumps(analyseur_pandas.get_analyses_completes()) \
+        == json.dumps(analyseur_python.get_analyses_completes())
+
+def test_analyseur_pandas_normalisation_urls(fichier_log_apache_aleatoire):
+    """
+    Vérifie que les urls normalisées par le moteur pandas et par le moteur Python
+    produisent les mêmes classements, avec une normalisation partagée par tous
+    les filtres.
+
+    Scénarios testés:
+        - Analyse multi-filtres avec les deux moteurs, des urls numériques et des
+          requêtes sans url.
+
+    Asserts:
+        - Les urls numériques sont regroupées en ``/{id}``, qui entre dans le top.
+        - Les analyses sérialisées en JSON sont identiques.
+        - Chaque url distincte n'est normalisée qu'une fois pour tous les filtres.
+
+    Args:
+        fichier_log_apache_aleatoire (FichierLogApache): Le fichier aléatoire parsé.
+    """
+    normaliseur_python = NormaliseurUrls()
+    normaliseur_pandas = NormaliseurUrls()
+    analyses_python = AnalyseurMultiFiltres(fichier_log_apache_aleatoire, filtres,
+                                            normaliseur_urls=normaliseur_python
+                                            ).get_analyses_completes()
+    analyses_pandas = AnalyseurMultiFiltres(fichier_log_apache_aleatoire, filtres,
+                                            moteur="pandas",
+                                            normaliseur_urls=normaliseur_pandas
+                                            ).get_analyses_completes()
+    top_urls = analyses_python["analyses"][0]["statistiques"]["requetes"]["top_urls"]
+    assert [url["url"] for url in top_urls] == [None, "/a", "/{id}"]
+    assert json.dumps(analyses_pandas) == json.dumps(analyses_python)
+    assert normaliseur_python.get_statistiques_cache()["normalisations"] == 33
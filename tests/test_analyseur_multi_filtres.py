@@ -0,0 +1,148 @@
+"""
+Module des tests unitaires pour l'analyse d'un fichier de log Apache avec plusieurs filtres.
+"""
+
+import pytest
+from parse.fichier_log_apache import FichierLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.analyseur_multi_filtres import AnalyseurMultiFiltres
+from analyse.index_inverse import IndexInverseEntrees
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("fichier, filtres, exception", [
+    (False, [FiltreLogApache(None, None)], TypeError),
+    (FichierLogApache("test.log"), FiltreLogApache(None, None), TypeError),
+    (FichierLogApache("test.log"), [FiltreLogApache(None, None), None], TypeError),
+    (FichierLogApache("test.log"), [], ValueError)
+])
+def test_analyseur_multi_filtres_exception_parametres_invalides(fichier, filtres, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Type incorrect pour le paramètre ``fichier``.
+        - Filtres qui ne sont pas dans une liste.
+        - Liste contenant un élément qui n'est pas un filtre.
+        - Liste de filtres vide.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        fichier (any): Représentation du fichier log.
+        filtres (any): Les filtres à appliquer.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        AnalyseurMultiFiltres(fichier, filtres)
+
+@pytest.mark.parametrize("moteur, exception", [
+    (None, TypeError),
+    ("spark", ValueError)
+])
+def test_analyseur_multi_filtres_exception_moteur_invalide(moteur, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque le moteur d'analyse est invalide.
+
+    Scénarios testés:
+        - Moteur qui n'est pas une chaîne de caractères.
+        - Moteur inconnu.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        moteur (any): Le moteur d'analyse.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        AnalyseurMultiFiltres(FichierLogApache("test.log"),
+                              [FiltreLogApache(None, None)],
+                              moteur=moteur)
+
+def test_analyseur_multi_filtres_une_seule_passe(mocker, fichier_log_apache):
+    """
+    Vérifie que chaque filtre n'est évalué qu'une seule fois par entrée, même
+    lorsque toutes les analyses sont produites.
+
+    Scénarios testés:
+        - Analyse complète avec deux filtres.
+
+    Asserts:
+        - Le prédicat compilé de chaque filtre est appelé autant de fois qu'il y a
+          d'entrées.
+
+    Args:
+        mocker (MockerFixture): Fixture pour espionner les méthodes.
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance 
+            de la classe :class:`FichierLogApache`.
+    """
+    filtres = [FiltreLogApache(None, 500), FiltreLogApache("::1", None)]
+    espions = [mocker.MagicMock(side_effect=filtre.get_predicat()) for filtre in filtres]
+    for filtre, espion in zip(filtres, espions):
+        mocker.patch.object(filtre, "get_predicat", return_value=espion)
+    analyseur = AnalyseurMultiFiltres(fichier_log_apache, filtres)
+    analyseur.get_analyses_completes()
+    analyseur.get_analyses_completes()
+    for espion in espions:
+        assert espion.call_count == len(fichier_log_apache.entrees)
+
+def test_analyseur_multi_filtres_analyses_identiques(fichier_log_apache):
+    """
+    Vérifie que chaque analyse produite est identique à l'analyse d'un
+    :class:`AnalyseurLogApache` avec le même filtre.
+
+    Scénarios testés:
+        - Analyse avec trois filtres différents.
+
+    Asserts:
+        - Les analyses sont dans l'ordre des filtres.
+        - Chaque analyse est égale à celle d'une analyse séparée.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance 
+            de la classe :class:`FichierLogApache`.
+    """
+    definitions = [(None, None), (None, 500), ("::1", 500)]
+    filtres = [FiltreLogApache(*definition) for definition in definitions]
+    resultat = AnalyseurMultiFiltres(fichier_log_apache, filtres).get_analyses_completes()
+    assert resultat["total_entrees"] == 5
+    assert len(resultat["analyses"]) == 3
+    for definition, analyse in zip(definitions, resultat["analyses"]):
+        analyseur_seul = AnalyseurLogApache(fichier_log_apache, FiltreLogApache(*definition))
+        assert analyse == analyseur_seul.get_analyse_complete()
+    assert [analyse["statistiques"]["total_entrees_filtre"]
+            for analyse in resultat["analyses"]] == [5, 4, 3]
+
+def test_analyseur_multi_filtres_index_inverse(fichier_log_apache):
+    """
+    Vérifie que l'analyse multi-filtres avec des index inversés produit les mêmes
+    analyses que la répartition en une seule passe.
+
+    Scénarios testés:
+        - Analyse avec des filtres sur l'adresse IP, le code de statut http et
+          une expression.
+        - Index construits pour un autre fichier ou utilisés avec le moteur ``pandas``.
+
+    Asserts:
+        - Les analyses sont identiques avec et sans index.
+        - Une exception :class:`ValueError` est levée pour les index inutilisables.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+    """
+    filtres = [FiltreLogApache(None, None), FiltreLogApache("::1", 500),
+               FiltreLogApache(None, None, "methode in (GET, DELETE) et url = /index.html")]
+    index = IndexInverseEntrees(fichier_log_apache)
+    assert AnalyseurMultiFiltres(fichier_log_apache, filtres,
+                                 index=index).get_analyses_completes() \
+        == AnalyseurMultiFiltres(fichier_log_apache, filtres).get_analyses_completes()
+    with pytest.raises(ValueError):
+        AnalyseurMultiFiltres(FichierLogApache("autre.log"), filtres, index=index)
+    with pytest.raises(ValueError):
+        AnalyseurMultiFiltres(fichier_log_apache, filtres, moteur="pandas", index=index)
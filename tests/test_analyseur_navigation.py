@@ -0,0 +1,187 @@
+"""
+Module des tests unitaires pour l'analyse des flux de navigation.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.analyseur_navigation import AnalyseurNavigation
+from parse.parseur_log_apache import ParseurLogApache
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def cree_entree(parseur, url, referent, hote_virtuel="", code=200):
+    """
+    Crée une entrée de log Apache avec l'url et le référent indiqués.
+
+    Args:
+        parseur (ParseurLogApache): Le parseur des entrées.
+        url (str): L'url demandée.
+        referent (str): Le référent (``-`` pour une requête sans référent).
+        hote_virtuel (str): L'hôte virtuel suivi d'un espace, ou une chaîne vide.
+        code (int): Le code de statut http de la réponse.
+
+    Returns:
+        EntreeLogApache: L'entrée.
+    """
+    return parseur.parse_entree(
+        f'{hote_virtuel}10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET {url} HTTP/1.1" '
+        f'{code} 100 "{referent}" "Firefox"'
+    )
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("referent, domaine", [
+    ("https://www.Google.com/search?q=apache", "google.com"),
+    ("http://exemple.fr:8080/page", "exemple.fr"),
+    ("android-app://com.google.android.gm/", "com.google.android.gm"),
+    ("recherche", None)
+])
+def test_navigation_domaine_referent(referent, domaine):
+    """
+    Vérifie l'extraction du domaine d'un référent.
+
+    Scénarios testés:
+        - Référent avec majuscules et préfixe ``www.``, avec un port, d'une application
+          ou sans domaine.
+
+    Asserts:
+        - Le domaine est en minuscules, sans port ni préfixe ``www.``, ou ``None``.
+
+    Args:
+        referent (str): Le référent.
+        domaine (Optional[str]): Le domaine attendu.
+    """
+    assert AnalyseurNavigation(FiltreLogApache(None, None)).get_domaine(referent) == domaine
+
+def test_navigation_liens_et_domaines_externes(log_apache):
+    """
+    Vérifie le comptage des liens et des domaines externes.
+
+    Scénarios testés:
+        - Requêtes depuis un moteur de recherche, un réseau social, une page du même
+          hôte virtuel, un domaine interne déclaré, sans référent, avec un référent
+          sans domaine et exclues par le filtre, avec normalisation des urls.
+
+    Asserts:
+        - Les requêtes sont réparties par type de référent.
+        - Les liens sont comptés par domaine et url normalisée.
+        - Seuls les domaines externes sont classés.
+        - Chaque référent distinct n'est analysé qu'une fois.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurNavigation(FiltreLogApache(None, None, "code < 400"),
+                                    ["Blog.exemple.fr"],
+                                    normaliseur_urls=NormaliseurUrls())
+    google = "https://www.google.com/"
+    analyseur.ajoute_entrees([cree_entree(parseur, "/produit/1", google),
+                              cree_entree(parseur, "/produit/2?x=1", google),
+                              cree_entree(parseur, "/", google),
+                              cree_entree(parseur, "/", "https://t.co/abc"),
+                              cree_entree(parseur, "/panier", "http://exemple.fr/produit/1",
+                                          "www.exemple.fr:443 "),
+                              cree_entree(parseur, "/", "https://blog.exemple.fr/"),
+                              cree_entree(parseur, "/", "-"),
+                              cree_entree(parseur, "/", "recherche"),
+                              cree_entree(parseur, "/", google, code=404)])
+    analyse = analyseur.get_analyse()
+    assert analyseur.total_entrees == 9
+    assert (analyse["requetes_analysees"], analyse["requetes_sans_referent"],
+            analyse["requetes_referent_invalide"], analyse["requetes_referent_interne"],
+            analyse["requetes_referent_externe"]) == (8, 1, 1, 2, 4)
+    assert [(lien["domaine_referent"], lien["url"], lien["total"])
+            for lien in analyse["top_liens"]] == [
+        ("google.com", "/produit/{id}", 2), ("google.com", "/", 1), ("t.co", "/", 1),
+        ("exemple.fr", "/panier", 1), ("blog.exemple.fr", "/", 1)
+    ]
+    assert analyse["top_domaines_externes"] == [
+        {"domaine": "google.com", "total": 3, "taux": 75, "erreur_max": 0},
+        {"domaine": "t.co", "total": 1, "taux": 25, "erreur_max": 0}
+    ]
+    assert analyse["cache"]["taille"] == 6
+
+def test_navigation_liens_memoire_bornee(log_apache):
+    """
+    Vérifie que le nombre de liens suivis reste borné.
+
+    Scénarios testés:
+        - Cent urls distinctes depuis le même domaine, avec une capacité de cinq liens.
+
+    Asserts:
+        - Au plus cinq liens sont classés.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurNavigation(FiltreLogApache(None, None), capacite_liens=5)
+    analyseur.ajoute_entrees(cree_entree(parseur, f"/page-{numero}", "https://t.co/")
+                             for numero in range(100))
+    assert len(analyseur.get_analyse(100)["top_liens"]) == 5
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"filtre": None}, TypeError),
+    ({"domaines_internes": "exemple.fr"}, TypeError),
+    ({"capacite_liens": "10"}, TypeError),
+    ({"normaliseur_urls": "/{id}"}, TypeError),
+    ({"taille_cache": 0}, ValueError)
+])
+def test_navigation_exception_parametres_invalides(parametres, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre, domaines internes, capacité ou normalisation des urls d'un type
+          incorrect.
+        - Taille du cache nulle.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        parametres (dict): Les paramètres qui remplacent les paramètres valides.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        AnalyseurNavigation(**{"filtre": FiltreLogApache(None, None), **parametres})
+
+@pytest.mark.parametrize("nombre_par_top, exception", [
+    ("3", TypeError),
+    (-1, ValueError)
+])
+def test_navigation_exception_nombre_par_top_invalide(nombre_par_top, exception):
+    """
+    Vérifie que l'analyse renvoie une erreur lorsque le nombre par top est invalide.
+
+    Scénarios testés:
+        - Nombre par top d'un type incorrect ou négatif.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        nombre_par_top (any): Le nombre par top.
+        exception (type): L'exception attendue.
+    """
+    analyseur = AnalyseurNavigation(FiltreLogApache(None, None))
+    with pytest.raises(exception):
+        analyseur.get_analyse(nombre_par_top)
+
+def test_navigation_exception_referent_invalide():
+    """
+    Vérifie qu'un référent d'un type incorrect lève une ``TypeError``.
+
+    Scénarios testés:
+        - Référent entier.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    with pytest.raises(TypeError):
+        AnalyseurNavigation(FiltreLogApache(None, None)).get_domaine(12)
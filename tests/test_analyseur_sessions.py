@@ -0,0 +1,210 @@
+"""
+Module des tests unitaires pour l'analyse des sessions des clients.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_sessions import AnalyseurSessions
+from analyse.normaliseur_urls import NormaliseurUrls
+from parse.parseur_log_apache import ParseurLogApache
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def cree_entree(parseur, seconde, ip="10.0.0.1", url="/", agent="Firefox", code=200):
+    """
+    Crée une entrée de log Apache à la seconde indiquée (après 10:00:00).
+
+    Args:
+        parseur (ParseurLogApache): Le parseur des entrées.
+        seconde (int): La seconde de l'entrée.
+        ip (str): L'adresse IP du client.
+        url (str): L'url demandée.
+        agent (str): L'agent utilisateur du client.
+        code (int): Le code de statut http de la réponse.
+
+    Returns:
+        EntreeLogApache: L'entrée.
+    """
+    heure, reste = divmod(seconde, 3600)
+    return parseur.parse_entree(
+        f'{ip} - - [12/Jan/2025:{10 + heure:02d}:{reste // 60:02d}:{reste % 60:02d} +0000] '
+        f'"GET {url} HTTP/1.1" {code} 100 "-" "{agent}"'
+    )
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("filtre, delai_inactivite, capacite_urls, exception", [
+    (None, 1800, 10, TypeError),
+    (FiltreLogApache(None, None), "1800", 10, TypeError),
+    (FiltreLogApache(None, None), 0, 10, ValueError),
+    (FiltreLogApache(None, None), 1800, 0, ValueError)
+])
+def test_sessions_exception_parametres_invalides(filtre, delai_inactivite, capacite_urls,
+                                                 exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre ou délai d'inactivité d'un type incorrect.
+        - Délai d'inactivité ou capacité nul.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        filtre (any): Le filtre.
+        delai_inactivite (any): Le délai d'inactivité.
+        capacite_urls (any): La capacité des compteurs d'urls.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        AnalyseurSessions(filtre, delai_inactivite, capacite_urls)
+
+def test_sessions_decoupe_par_client_et_inactivite(log_apache):
+    """
+    Vérifie que les requêtes sont regroupées en sessions par client et par délai
+    d'inactivité.
+
+    Scénarios testés:
+        - Un client avec deux sessions séparées par une longue inactivité.
+        - Un second client (même adresse IP, autre agent utilisateur) actif en même temps.
+
+    Asserts:
+        - Le nombre de sessions, de requêtes par session et les durées sont corrects.
+        - Les urls d'entrée et de sortie sont comptées par session.
+        - Le nombre maximal de sessions simultanées est correct.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurSessions(FiltreLogApache(None, None), delai_inactivite=60)
+    analyseur.ajoute_entrees([
+        cree_entree(parseur, 0, url="/accueil"),
+        cree_entree(parseur, 10, url="/accueil", agent="Chrome"),
+        cree_entree(parseur, 30, url="/produits"),
+        cree_entree(parseur, 90, url="/panier"),
+        cree_entree(parseur, 200, url="/accueil"),
+    ])
+    assert analyseur.total_sessions == 2
+    assert analyseur.get_total_sessions_en_cours() == 1
+    analyseur.termine()
+    analyse = analyseur.get_analyse_complete()
+    sessions = analyse["sessions"]
+    assert analyse["total_entrees"] == 5
+    assert sessions["total_sessions"] == 3
+    assert sessions["sessions_en_cours"] == 0
+    assert sessions["sessions_simultanees_max"] == 2
+    assert (sessions["requetes_par_session"]["minimum"],
+            sessions["requetes_par_session"]["maximum"]) == (1, 3)
+    assert (sessions["duree_secondes"]["minimum"],
+            sessions["duree_secondes"]["maximum"]) == (0, 90)
+    assert sessions["top_urls_entree"][0] == {"url": "/accueil", "total": 3, "taux": 100,
+                                              "erreur_max": 0}
+    assert {url["url"]: url["total"] for url in sessions["top_urls_sortie"]} == {
+        "/panier": 1, "/accueil": 2
+    }
+
+def test_sessions_normalisation_urls(log_apache):
+    """
+    Vérifie que les urls d'entrée et de sortie des sessions sont regroupées par route.
+
+    Scénarios testés:
+        - Deux clients qui entrent par des produits différents.
+
+    Asserts:
+        - Les urls d'entrée sont comptées par route.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurSessions(FiltreLogApache(None, None),
+                                  normaliseur_urls=NormaliseurUrls())
+    analyseur.ajoute_entrees([cree_entree(parseur, 0, url="/produit/1?ref=pub"),
+                              cree_entree(parseur, 5, ip="10.0.0.2", url="/produit/2")])
+    analyseur.termine()
+    sessions = analyseur.get_analyse_complete()["sessions"]
+    assert [(url["url"], url["total"]) for url in sessions["top_urls_entree"]] == [
+        ("/produit/{id}", 2)
+    ]
+
+def test_sessions_memoire_bornee_sessions_simultanees(log_apache):
+    """
+    Vérifie que seules les sessions actives sont gardées en mémoire.
+
+    Scénarios testés:
+        - Mille clients successifs, chacun actif pendant une seule requête.
+
+    Asserts:
+        - Au plus deux sessions sont en cours à tout instant.
+        - Toutes les sessions sont comptées.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurSessions(FiltreLogApache(None, None), delai_inactivite=5)
+    for numero in range(1000):
+        analyseur.ajoute_entree(cree_entree(parseur, numero * 5, ip=f"10.0.{numero // 256}."
+                                                                   f"{numero % 256}"))
+        assert analyseur.get_total_sessions_en_cours() <= 2
+    analyseur.termine()
+    assert analyseur.total_sessions == 1000
+    assert analyseur.sessions_simultanees_max == 2
+
+def test_sessions_filtre_et_entree_desordonnee(log_apache):
+    """
+    Vérifie que le filtre est appliqué et qu'une entrée légèrement désordonnée est
+    rattachée à l'instant le plus récent.
+
+    Scénarios testés:
+        - Une entrée exclue par le filtre.
+        - Une entrée antérieure à la plus récente reçue.
+
+    Asserts:
+        - L'entrée exclue n'ouvre pas de session.
+        - L'entrée désordonnée prolonge la session de son client sans durée négative.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurSessions(FiltreLogApache(None, None, "code < 400"),
+                                  delai_inactivite=60)
+    analyseur.ajoute_entrees([
+        cree_entree(parseur, 0, ip="10.0.0.2", code=500),
+        cree_entree(parseur, 20),
+        cree_entree(parseur, 50, ip="10.0.0.3"),
+        cree_entree(parseur, 40),
+    ])
+    analyseur.termine()
+    sessions = analyseur.get_analyse_complete()["sessions"]
+    assert analyseur.total_entrees == 4
+    assert sessions["total_sessions"] == 2
+    assert sessions["duree_secondes"]["maximum"] == 30
+    assert sessions["requetes_par_session"]["maximum"] == 2
+
+@pytest.mark.parametrize("nombre_par_top, exception", [
+    ("3", TypeError),
+    (-1, ValueError)
+])
+def test_sessions_exception_nombre_par_top_invalide(nombre_par_top, exception):
+    """
+    Vérifie que l'analyse renvoie une erreur lorsque le nombre par top est invalide.
+
+    Scénarios testés:
+        - Nombre par top d'un type incorrect ou négatif.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        nombre_par_top (any): Le nombre par top.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        AnalyseurSessions(FiltreLogApache(None, None)).get_analyse_complete(nombre_par_top)
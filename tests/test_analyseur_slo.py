@@ -0,0 +1,160 @@
+"""
+Module des tests unitaires pour le suivi du taux d'erreurs et du budget d'erreurs.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_slo import AnalyseurSLO
+from parse.parseur_log_apache import ParseurLogApache
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def cree_entrees(parseur, seconde, requetes, erreurs, ip="10.0.0.1"):
+    """
+    Crée des entrées de log Apache à la seconde indiquée (après 10:00:00).
+
+    Args:
+        parseur (ParseurLogApache): Le parseur des entrées.
+        seconde (int): La seconde des entrées.
+        requetes (int): Le nombre d'entrées.
+        erreurs (int): Le nombre d'entrées en erreur (code ``503``) parmi elles.
+        ip (str): L'adresse IP du client.
+
+    Returns:
+        list: Les entrées, les erreurs en premier.
+    """
+    heure, reste = divmod(seconde, 3600)
+    return [
+        parseur.parse_entree(
+            f'{ip} - - [12/Jan/2025:{10 + heure:02d}:{reste // 60:02d}:{reste % 60:02d} '
+            f'+0000] "GET / HTTP/1.1" {503 if numero < erreurs else 200} 100'
+        )
+        for numero in range(requetes)
+    ]
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"filtre": None}, TypeError),
+    ({"objectif": "0.99"}, TypeError),
+    ({"taille_fenetre": 60.0}, TypeError),
+    ({"objectif": 1}, ValueError),
+    ({"objectif": 0}, ValueError),
+    ({"taille_fenetre": 0}, ValueError),
+    ({"taille_fenetre": 7}, ValueError),
+    ({"nombre_pires": -1}, ValueError)
+])
+def test_slo_exception_parametres_invalides(parametres, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre, objectif ou taille des fenêtres d'un type incorrect.
+        - Objectif hors de ]0, 1[, taille des fenêtres nulle ou qui ne divise pas
+          une heure, nombre de pires fenêtres négatif.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        parametres (dict): Les paramètres qui remplacent les paramètres valides.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        AnalyseurSLO(**{"filtre": FiltreLogApache(None, None), **parametres})
+
+def test_slo_fenetres_et_budget(log_apache):
+    """
+    Vérifie le taux d'erreurs par fenêtre, les pires fenêtres et le budget d'erreurs.
+
+    Scénarios testés:
+        - Trois fenêtres d'une minute, dont la dernière est en cours.
+        - Entrées exclues par le filtre.
+
+    Asserts:
+        - Les fenêtres hors objectif sont comptées, fenêtre en cours comprise.
+        - Les pires fenêtres sont classées par taux d'erreurs.
+        - La disponibilité et le budget consommé portent sur toutes les entrées filtrées.
+        - Le taux de consommation maximal garde la première fenêtre qui l'atteint.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurSLO(FiltreLogApache("10.0.0.1", None), objectif=0.9,
+                             taille_fenetre=60, nombre_pires=2)
+    analyseur.ajoute_entrees(cree_entrees(parseur, 0, 10, 0)
+                             + cree_entrees(parseur, 70, 10, 5)
+                             + cree_entrees(parseur, 80, 10, 10, "10.0.0.2")
+                             + cree_entrees(parseur, 130, 4, 1))
+    analyse = analyseur.get_analyse()
+    assert analyseur.total_entrees == 34
+    assert (analyse["total_requetes"], analyse["total_erreurs"]) == (24, 6)
+    assert analyse["disponibilite"] == pytest.approx(0.75)
+    assert analyse["budget_erreurs_consomme"] == pytest.approx(2.5)
+    assert (analyse["fenetres"], analyse["fenetres_hors_objectif"]) == (3, 2)
+    assert analyse["fin_fenetre"] == "2025-01-12T10:03:00+00:00"
+    assert [(fenetre["debut"], fenetre["taux_erreurs"])
+            for fenetre in analyse["pires_fenetres"]] == [
+        ("2025-01-12T10:01:00+00:00", 0.5), ("2025-01-12T10:02:00+00:00", 0.25)
+    ]
+    consommation = analyse["taux_consommation"]["1h"]
+    assert consommation["actuel"] == pytest.approx(2.5)
+    assert consommation["maximum"] == pytest.approx(2.5)
+    assert consommation["fin_maximum"] == "2025-01-12T10:02:00+00:00"
+
+def test_slo_taux_consommation_glissant(log_apache):
+    """
+    Vérifie que les taux de consommation portent sur la dernière heure et les six
+    dernières heures.
+
+    Scénarios testés:
+        - Une heure avec 10 % d'erreurs, puis deux heures sans erreur.
+
+    Asserts:
+        - Le taux sur une heure est nul à la fin, son maximum a été atteint dès la
+          première fenêtre.
+        - Le taux sur six heures couvre les trois heures.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurSLO(FiltreLogApache(None, None), taille_fenetre=600)
+    for fenetre in range(18):
+        analyseur.ajoute_entrees(cree_entrees(parseur, fenetre * 600, 100,
+                                              10 if fenetre < 6 else 0))
+    consommation = analyseur.get_analyse()["taux_consommation"]
+    assert consommation["1h"]["actuel"] == 0
+    assert consommation["1h"]["maximum"] == pytest.approx(100)
+    assert consommation["1h"]["fin_maximum"] == "2025-01-12T10:10:00+00:00"
+    assert consommation["6h"]["actuel"] == pytest.approx(1000 / 30)
+    assert consommation["6h"]["maximum"] == pytest.approx(100)
+
+def test_slo_longue_interruption(log_apache):
+    """
+    Vérifie qu'une interruption plus longue que la plus longue période efface les
+    sommes glissantes sans parcourir les fenêtres vides.
+
+    Scénarios testés:
+        - Fenêtres en erreur, puis une requête sans erreur sept heures plus tard.
+
+    Asserts:
+        - Les taux de consommation actuels sont nuls.
+        - Les totaux conservent les erreurs passées.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    analyseur = AnalyseurSLO(FiltreLogApache(None, None), taille_fenetre=1)
+    analyseur.ajoute_entrees(cree_entrees(parseur, 0, 5, 5) + cree_entrees(parseur, 1, 5, 5)
+                             + cree_entrees(parseur, 7 * 3600, 1, 0))
+    analyse = analyseur.get_analyse()
+    assert analyse["taux_consommation"]["1h"]["actuel"] == 0
+    assert analyse["taux_consommation"]["6h"]["actuel"] == 0
+    assert (analyse["total_requetes"], analyse["total_erreurs"]) == (11, 10)
+    assert len(analyseur._historique) == 0
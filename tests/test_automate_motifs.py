@@ -0,0 +1,75 @@
+"""
+Module des tests unitaires pour l'automate de recherche de plusieurs motifs.
+"""
+
+import pytest
+from analyse.automate_motifs import AutomateMotifs
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("motifs, exception", [
+    ("bot", TypeError),
+    (["bot", 3], TypeError),
+    (["bot", ""], ValueError)
+])
+def test_automate_exception_motifs_invalides(motifs, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les motifs sont invalides.
+
+    Scénarios testés:
+        - Motifs qui ne sont pas une liste de chaînes.
+        - Motif vide.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        motifs (any): Les motifs.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        AutomateMotifs(motifs)
+
+@pytest.mark.parametrize("texte, motifs_attendus", [
+    ("ushers", {0, 1, 3}),
+    ("ahishers", {0, 1, 2, 3}),
+    ("HIS", {2}),
+    ("hx", set()),
+    ("", set())
+])
+def test_automate_recherche_motifs(texte, motifs_attendus):
+    """
+    Vérifie que tous les motifs présents dans un texte sont trouvés, y compris ceux
+    qui se chevauchent ou sont suffixes d'un autre motif.
+
+    Scénarios testés:
+        - Motifs classiques d'Aho-Corasick (``he``, ``she``, ``his``, ``hers``).
+        - Texte en majuscules.
+        - Texte sans motif et texte vide.
+
+    Asserts:
+        - Les numéros des motifs trouvés sont ceux attendus.
+
+    Args:
+        texte (str): Le texte parcouru.
+        motifs_attendus (set): Les numéros des motifs attendus.
+    """
+    assert AutomateMotifs(["he", "she", "his", "hers"]).recherche(texte) == motifs_attendus
+
+def test_automate_motifs_identiques_et_casse():
+    """
+    Vérifie que des motifs identiques sont tous trouvés et que la casse des motifs
+    est ignorée.
+
+    Scénarios testés:
+        - Deux motifs identiques à la casse près.
+
+    Asserts:
+        - Les deux motifs sont trouvés.
+        - Un texte qui n'est pas une chaîne lève une ``TypeError``.
+    """
+    automate = AutomateMotifs(["Bot", "bot", "crawler"])
+    assert automate.recherche("Googlebot/2.1") == {0, 1}
+    with pytest.raises(TypeError):
+        automate.recherche(None)
@@ -0,0 +1,126 @@
+"""
+Module des tests unitaires pour la classification des agents utilisateurs.
+"""
+
+import json
+import pytest
+from analyse.classificateur_agents import ClassificateurAgents, ReglesAgentsException
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("agent, classification", [
+    ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+     "Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0", (None, "Edge", "Windows")),
+    ("Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 "
+     "(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1", (None, "Safari", "iOS")),
+    ("Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) "
+     "Chrome/120.0 Mobile Safari/537.36", (None, "Chrome", "Android")),
+    ("Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0",
+     (None, "Firefox", "Linux")),
+    ("Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
+     ("Googlebot", None, None)),
+    ("curl/8.4.0", ("curl", None, None)),
+    ("-", (None, None, None))
+])
+def test_classificateur_regles_par_defaut(agent, classification):
+    """
+    Vérifie la classification d'agents courants avec les règles fournies.
+
+    Scénarios testés:
+        - Navigateurs dont l'agent contient aussi les motifs d'autres navigateurs.
+        - Système iOS dont l'agent contient aussi le motif de macOS.
+        - Robots d'indexation et outils en ligne de commande.
+        - Agent inconnu.
+
+    Asserts:
+        - La classification est celle de la première règle correspondante de chaque
+          catégorie.
+
+    Args:
+        agent (str): L'agent utilisateur.
+        classification (tuple): Le robot, le navigateur et le système attendus.
+    """
+    assert ClassificateurAgents().classifie(agent) == classification
+
+def test_classificateur_cache(tmp_path):
+    """
+    Vérifie qu'un agent déjà rencontré n'est pas classifié de nouveau et que le cache
+    est borné.
+
+    Scénarios testés:
+        - Fichier de règles personnalisé, cache de deux agents.
+        - Agents répétés, puis un troisième agent qui évince le moins récent.
+
+    Asserts:
+        - Les classifications répétées sont trouvées dans le cache.
+        - La taille du cache ne dépasse pas sa limite.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin = tmp_path / "regles.json"
+    chemin.write_text(json.dumps({"robots": [{"nom": "Sonde", "motifs": ["sonde"]}]}))
+    classificateur = ClassificateurAgents(str(chemin), taille_cache=2)
+    for _ in range(10):
+        assert classificateur.classifie("Sonde/1.0") == ("Sonde", None, None)
+        assert classificateur.classifie("Firefox/121.0") == (None, None, None)
+    classificateur.classifie("Autre")
+    assert classificateur.get_statistiques_cache() == {"succes": 18, "classifications": 3,
+                                                       "taille": 2}
+
+@pytest.mark.parametrize("contenu", [
+    "{invalide",
+    "[]",
+    json.dumps({"robots": {"nom": "Sonde"}}),
+    json.dumps({"navigateurs": [{"nom": "Sonde", "motifs": []}]}),
+    json.dumps({"systemes": [{"nom": "Sonde", "motifs": [""]}]})
+])
+def test_classificateur_exception_regles_invalides(tmp_path, contenu):
+    """
+    Vérifie qu'un fichier de règles invalide lève une ``ReglesAgentsException``.
+
+    Scénarios testés:
+        - Fichier JSON invalide.
+        - Contenu qui n'est pas un dictionnaire.
+        - Règles qui ne sont pas une liste, règle sans motif ou avec un motif vide.
+
+    Asserts:
+        - Une exception :class:`ReglesAgentsException` est levée.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        contenu (str): Le contenu du fichier de règles.
+    """
+    chemin = tmp_path / "regles.json"
+    chemin.write_text(contenu)
+    with pytest.raises(ReglesAgentsException):
+        ClassificateurAgents(str(chemin))
+
+@pytest.mark.parametrize("chemin_regles, taille_cache, exception", [
+    (3, 10, TypeError),
+    (None, "10", TypeError),
+    (None, 0, ValueError),
+    ("inexistant.json", 10, ReglesAgentsException)
+])
+def test_classificateur_exception_parametres_invalides(chemin_regles, taille_cache,
+                                                       exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Chemin ou taille du cache d'un type incorrect.
+        - Taille du cache nulle.
+        - Fichier de règles introuvable.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        chemin_regles (any): Le chemin du fichier de règles.
+        taille_cache (any): La taille du cache.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        ClassificateurAgents(chemin_regles, taille_cache)
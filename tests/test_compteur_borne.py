@@ -0,0 +1,149 @@
+"""
+Module des tests unitaires pour le compteur à mémoire bornée (Space-Saving).
+"""
+
+import json
+import pytest
+from collections import Counter
+from random import Random
+from analyse.compteur_borne import CompteurBorne
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("capacite, exception", [
+    ("10", TypeError),
+    (True, TypeError),
+    (0, ValueError)
+])
+def test_compteur_borne_exception_capacite_invalide(capacite, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque la capacité est invalide.
+
+    Scénarios testés:
+        - Capacité qui n'est pas un entier.
+        - Capacité nulle.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        capacite (any): La capacité du compteur.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        CompteurBorne(capacite)
+
+def test_compteur_borne_exact_sous_capacite():
+    """
+    Vérifie que les totaux sont exacts tant que la capacité n'est pas atteinte.
+
+    Scénarios testés:
+        - Ajout de trois éléments distincts dans un compteur de capacité 3, dont
+          un avec un poids.
+
+    Asserts:
+        - Les totaux sont exacts, sans erreur.
+        - Les éléments à égalité restent dans l'ordre de première apparition.
+    """
+    compteur = CompteurBorne(3)
+    for element in ["/b", "/a", "/a", "/c", "/b", "/a"]:
+        compteur.ajoute(element)
+    compteur.ajoute("/c", poids=2)
+    assert compteur.get_top() == [("/a", 3, 0), ("/c", 3, 0), ("/b", 2, 0)]
+    assert compteur.get_top(1) == [("/a", 3, 0)]
+    assert compteur.total == 8
+    assert len(compteur) == 3
+    assert compteur.get_total("/a") == 3
+
+def test_compteur_borne_remplacement_minimum():
+    """
+    Vérifie qu'un nouvel élément remplace l'élément le moins fréquent lorsque le
+    compteur est plein.
+
+    Scénarios testés:
+        - Compteur de capacité 2 qui reçoit un troisième élément.
+
+    Asserts:
+        - Seul l'ajout du troisième élément retourne l'élément remplacé et son total.
+        - Le nouvel élément hérite du total de l'élément remplacé, comme erreur.
+    """
+    compteur = CompteurBorne(2)
+    assert [compteur.ajoute(element) for element in ["a", "a", "b", "a", "b", "c"]] \
+        == [None] * 5 + [("b", 2)]
+    assert compteur.get_top() == [("a", 3, 0), ("c", 3, 2)]
+    assert compteur.get_total("b") == 0
+
+def test_compteur_borne_elements_frequents():
+    """
+    Vérifie les garanties de l'algorithme sur un flux aléatoire de distribution
+    très déséquilibrée.
+
+    Scénarios testés:
+        - 20000 éléments tirés parmi 5000 valeurs, dont quelques valeurs fréquentes.
+
+    Asserts:
+        - Les valeurs fréquentes sont suivies.
+        - Chaque total estimé encadre le total réel à son erreur près.
+    """
+    aleatoire = Random(0)
+    flux = [f"/page-{int(aleatoire.paretovariate(1.2)) % 5000}" for _ in range(20000)]
+    totaux_reels = Counter(flux)
+    compteur = CompteurBorne(100)
+    for element in flux:
+        compteur.ajoute(element)
+    assert len(compteur) == 100
+    suivis = {element: (total, erreur) for element, total, erreur in compteur.get_top()}
+    for element, total_reel in totaux_reels.items():
+        if total_reel > len(flux) / 100:
+            assert element in suivis
+    for element, (total, erreur) in suivis.items():
+        assert total - erreur <= totaux_reels[element] <= total
+
+def test_compteur_borne_fusion_et_serialisation():
+    """
+    Vérifie la sérialisation et la fusion de compteurs.
+
+    Scénarios testés:
+        - Compteur reconstruit depuis sa forme JSON, avec des éléments de type tuple.
+        - Fusion de deux compteurs qui suivent des éléments communs.
+
+    Asserts:
+        - Le compteur reconstruit a les mêmes éléments, totaux et erreurs.
+        - Les totaux des éléments communs et le total du compteur sont additionnés.
+    """
+    compteur = CompteurBorne(2)
+    for element in [("a", 1), ("a", 1), ("b", 2), ("c", 3)]:
+        compteur.ajoute(element)
+    etat = json.loads(json.dumps(compteur.get_dict()))
+    assert CompteurBorne.depuis_dict(etat).get_dict() == compteur.get_dict()
+    autre = CompteurBorne(2)
+    autre.ajoute(("a", 1), 3)
+    compteur.fusionne(autre)
+    assert compteur.total == 7
+    assert compteur.get_top(1) == [(("a", 1), 5, 0)]
+    with pytest.raises(TypeError):
+        compteur.fusionne({})
+
+@pytest.mark.parametrize("etat", [
+    [],
+    {"capacite": 2, "total": 0},
+    {"capacite": 1, "total": 2, "elements": [["a", 1, 0], ["b", 1, 0]]},
+    {"capacite": 2, "total": 1, "elements": [["a", 1]]}
+])
+def test_compteur_borne_exception_depuis_dict_invalide(etat):
+    """
+    Vérifie que ``depuis_dict`` renvoie une erreur lorsque l'état est invalide.
+
+    Scénarios testés:
+        - État qui n'est pas un dictionnaire, état incomplet, plus d'éléments que la
+          capacité et élément mal formé.
+
+    Asserts:
+        - Une exception :class:`TypeError` ou :class:`ValueError` est levée.
+
+    Args:
+        etat (any): L'état sérialisé.
+    """
+    with pytest.raises((TypeError, ValueError)):
+        CompteurBorne.depuis_dict(etat)
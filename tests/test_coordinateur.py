@@ -0,0 +1,323 @@
+"""
+Module des tests unitaires pour le coordinateur d'une analyse distribuée.
+"""
+
+import socket
+import pytest
+from threading import Thread
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.moteur_groupement import SpecificationGroupement
+from analyse.normaliseur_urls import NormaliseurUrls
+from parse.parseur_log_apache import ParseurLogApache
+from serveur.coordinateur import (
+    Coordinateur,
+    ExecutionDistribueeException,
+    envoie_message,
+    recoit_message
+)
+from serveur.travailleur import Travailleur
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def lance_coordinateur(coordinateur):
+    """
+    Crée et démarre le serveur d'un coordinateur sur un port libre.
+
+    Args:
+        coordinateur (Coordinateur): Le coordinateur.
+
+    Returns:
+        ThreadingTCPServer: Le serveur démarré.
+    """
+    serveur = coordinateur.cree_serveur("127.0.0.1", 0)
+    Thread(target=serveur.serve_forever, daemon=True).start()
+    return serveur
+
+def lance_travailleurs(port, nombre):
+    """
+    Lance des travailleurs dans des threads.
+
+    Args:
+        port (int): Le port du coordinateur.
+        nombre (int): Le nombre de travailleurs.
+
+    Returns:
+        list: Les threads des travailleurs.
+    """
+    threads = [Thread(target=Travailleur("127.0.0.1", port).execute, daemon=True)
+               for _ in range(nombre)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+def get_analyse_sans_precision_pic(etat):
+    """
+    Retourne l'analyse complète d'un état sans la précision de son pic de requêtes
+    par seconde. Les entrées du log de test ne sont pas triées : les plages des tâches
+    se chevauchent, et le pic fusionné est alors signalé comme une borne inférieure.
+
+    Args:
+        etat (EtatPartielAnalyse): L'état partiel.
+
+    Returns:
+        dict: L'analyse complète de l'état.
+    """
+    analyse = etat.get_analyse_complete()
+    del analyse["precisions"]["pic_requetes_par_seconde"]
+    return analyse
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("taches, tentatives_max, delai_tache, exception", [
+    ("taches", 3, 1.0, TypeError),
+    ([1], 3, 1.0, TypeError),
+    ([], 3, 1.0, ValueError),
+    ([{"identifiant": 0}], "3", 1.0, TypeError),
+    ([{"identifiant": 0}], 0, 1.0, ValueError),
+    ([{"identifiant": 0}], 3, None, TypeError),
+    ([{"identifiant": 0}], 3, 0, ValueError)
+])
+def test_coordinateur_exception_parametres_invalides(taches, tentatives_max, delai_tache,
+                                                     exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Tâches, nombre de tentatives ou délai d'un type incorrect.
+        - Aucune tâche, aucune tentative ou délai nul.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        taches (any): Les tâches.
+        tentatives_max (any): Le nombre maximal de tentatives.
+        delai_tache (any): Le délai d'une tâche.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        Coordinateur(taches, FiltreLogApache(None, None), tentatives_max=tentatives_max,
+                     delai_tache=delai_tache)
+
+def test_coordinateur_decoupe_fichiers(log_apache):
+    """
+    Vérifie que les fichiers sont découpés en plages contiguës qui couvrent
+    tout le fichier.
+
+    Scénarios testés:
+        - Découpage d'un fichier en plages de 100 octets.
+        - Découpage avec une taille invalide.
+
+    Asserts:
+        - Les plages sont contiguës, couvrent le fichier et ont des identifiants
+          consécutifs.
+        - Une taille nulle lève une ``ValueError``.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    chemin = log_apache(True)
+    taille = chemin.stat().st_size
+    taches = Coordinateur.decoupe_fichiers([str(chemin)], 100)
+    assert [tache["identifiant"] for tache in taches] == list(range(len(taches)))
+    assert taches[0]["debut"] == 0 and taches[-1]["fin"] == taille
+    assert all(tache["fin"] == suivante["debut"] for tache, suivante in zip(taches, taches[1:]))
+    assert all(tache["chemin"] == str(chemin.resolve()) for tache in taches)
+    with pytest.raises(ValueError):
+        Coordinateur.decoupe_fichiers([str(chemin)], 0)
+
+@pytest.mark.parametrize("groupements", [None, [SpecificationGroupement("methode,code")]])
+def test_coordinateur_analyse_distribuee_identique(log_apache, groupements):
+    """
+    Vérifie que l'analyse distribuée à plusieurs travailleurs est identique à
+    l'analyse séquentielle du fichier.
+
+    Scénarios testés:
+        - Trois travailleurs, plages de 150 octets, avec et sans regroupements.
+
+    Asserts:
+        - L'analyse complète fusionnée est égale à celle de l'analyseur séquentiel.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        groupements (Optional[list]): Les regroupements à calculer.
+    """
+    chemin = str(log_apache(True))
+    filtre = FiltreLogApache(None, None, "code = 5xx")
+    coordinateur = Coordinateur(Coordinateur.decoupe_fichiers([chemin], 150), filtre,
+                                groupements=groupements)
+    serveur = lance_coordinateur(coordinateur)
+    try:
+        lance_travailleurs(serveur.server_address[1], 3)
+        etat = coordinateur.attend_resultat(10)
+    finally:
+        serveur.shutdown()
+        serveur.server_close()
+    attendu = AnalyseurLogApache(ParseurLogApache(chemin).parse_fichier(), filtre,
+                                 groupements=groupements).get_etat_partiel()
+    assert get_analyse_sans_precision_pic(etat) == get_analyse_sans_precision_pic(attendu)
+
+def test_coordinateur_analyse_distribuee_normalisation_urls(log_apache):
+    """
+    Vérifie que la normalisation des urls est transmise aux travailleurs.
+
+    Scénarios testés:
+        - Deux travailleurs avec un modèle de route.
+
+    Asserts:
+        - L'état fusionné porte la normalisation et ses urls sont des routes.
+        - L'analyse fusionnée est égale à celle de l'analyseur séquentiel.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    chemin = str(log_apache(True))
+    filtre = FiltreLogApache(None, None)
+    coordinateur = Coordinateur(Coordinateur.decoupe_fichiers([chemin], 150), filtre,
+                                normaliseur_urls=NormaliseurUrls(["/index.html"]))
+    serveur = lance_coordinateur(coordinateur)
+    try:
+        lance_travailleurs(serveur.server_address[1], 2)
+        etat = coordinateur.attend_resultat(10)
+    finally:
+        serveur.shutdown()
+        serveur.server_close()
+    attendu = AnalyseurLogApache(ParseurLogApache(chemin).parse_fichier(), filtre,
+                                 normaliseur_urls=NormaliseurUrls(["/index.html"])
+                                 ).get_etat_partiel()
+    assert etat.get_definition_normalisation()["modeles"] == ["/index.html"]
+    assert get_analyse_sans_precision_pic(etat) == get_analyse_sans_precision_pic(attendu)
+
+def test_coordinateur_remet_tache_travailleur_perdu(log_apache):
+    """
+    Vérifie que la tâche d'un travailleur dont la connexion est perdue est confiée
+    à un autre travailleur.
+
+    Scénarios testés:
+        - Un travailleur reçoit une tâche puis ferme sa connexion, un second
+          travailleur termine l'analyse.
+
+    Asserts:
+        - L'analyse aboutit et compte toutes les entrées.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    chemin = str(log_apache(True))
+    coordinateur = Coordinateur(Coordinateur.decoupe_fichiers([chemin], 200),
+                                FiltreLogApache(None, None))
+    serveur = lance_coordinateur(coordinateur)
+    try:
+        with socket.create_connection(serveur.server_address) as connexion:
+            with connexion.makefile("rb") as lecture:
+                assert recoit_message(lecture)["type"] == "tache"
+        lance_travailleurs(serveur.server_address[1], 1)
+        etat = coordinateur.attend_resultat(10)
+    finally:
+        serveur.shutdown()
+        serveur.server_close()
+    assert etat.total_entrees == 5
+    assert etat.chemins == [str(log_apache(True).resolve())]
+
+def test_coordinateur_exception_tentatives_epuisees(log_apache):
+    """
+    Vérifie que l'analyse échoue lorsqu'une tâche a atteint le nombre maximal
+    de tentatives.
+
+    Scénarios testés:
+        - Un travailleur répond par un message invalide, avec une seule tentative.
+
+    Asserts:
+        - Une ``ExecutionDistribueeException`` est levée.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    coordinateur = Coordinateur(Coordinateur.decoupe_fichiers([str(log_apache(True))]),
+                                FiltreLogApache(None, None), tentatives_max=1)
+    serveur = lance_coordinateur(coordinateur)
+    try:
+        with socket.create_connection(serveur.server_address) as connexion:
+            with connexion.makefile("rb") as lecture, connexion.makefile("wb") as ecriture:
+                tache = recoit_message(lecture)["tache"]
+                envoie_message(ecriture, {"type": "resultat",
+                                          "identifiant": tache["identifiant"], "etat": {}})
+            with pytest.raises(ExecutionDistribueeException):
+                coordinateur.attend_resultat(10)
+    finally:
+        serveur.shutdown()
+        serveur.server_close()
+
+def test_coordinateur_exception_erreur_travailleur(log_apache):
+    """
+    Vérifie qu'une erreur signalée par un travailleur arrête l'analyse.
+
+    Scénarios testés:
+        - Analyse distribuée d'un fichier au format invalide.
+
+    Asserts:
+        - Une ``ExecutionDistribueeException`` est levée avec le message du travailleur.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    coordinateur = Coordinateur(Coordinateur.decoupe_fichiers([str(log_apache(False))]),
+                                FiltreLogApache(None, None))
+    serveur = lance_coordinateur(coordinateur)
+    try:
+        lance_travailleurs(serveur.server_address[1], 1)
+        with pytest.raises(ExecutionDistribueeException, match="invalide"):
+            coordinateur.attend_resultat(10)
+    finally:
+        serveur.shutdown()
+        serveur.server_close()
+
+def test_coordinateur_exception_delai_depasse(log_apache):
+    """
+    Vérifie que l'attente du résultat échoue lorsque le délai est dépassé.
+
+    Scénarios testés:
+        - Attente sans aucun travailleur connecté.
+
+    Asserts:
+        - Une ``ExecutionDistribueeException`` est levée.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    coordinateur = Coordinateur(Coordinateur.decoupe_fichiers([str(log_apache(True))]),
+                                FiltreLogApache(None, None))
+    with pytest.raises(ExecutionDistribueeException):
+        coordinateur.attend_resultat(0.1)
+
+def test_coordinateur_exception_travailleurs_arretes(log_apache, mocker):
+    """
+    Vérifie que l'attente du résultat échoue lorsque tous les travailleurs locaux
+    se sont arrêtés avant la fin de l'analyse, même sans délai.
+
+    Scénarios testés:
+        - Attente sans délai avec deux processus de travailleurs locaux terminés et
+          aucun travailleur connecté.
+        - Attente avec un processus encore en cours d'exécution.
+
+    Asserts:
+        - Une ``ExecutionDistribueeException`` est levée avec les codes de sortie.
+        - Tant qu'un processus s'exécute, seul le délai arrête l'attente.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        mocker (MockerFixture): Une fixture pour simuler les processus.
+    """
+    mocker.patch.object(Coordinateur, "INTERVALLE_VERIFICATION", 0.01)
+    coordinateur = Coordinateur(Coordinateur.decoupe_fichiers([str(log_apache(True))]),
+                                FiltreLogApache(None, None))
+    arretes = [mocker.MagicMock(**{"poll.return_value": code}) for code in (1, -9)]
+    with pytest.raises(ExecutionDistribueeException, match=r"\[1, -9\]"):
+        coordinateur.attend_resultat(processus=arretes)
+    actif = [arretes[0], mocker.MagicMock(**{"poll.return_value": None})]
+    with pytest.raises(ExecutionDistribueeException, match="0.1 secondes"):
+        coordinateur.attend_resultat(0.1, processus=actif)
@@ -0,0 +1,144 @@
+"""
+Module des tests unitaires pour le démon d'ingestion continue et d'exposition
+des métriques.
+"""
+
+import time
+import pytest
+from threading import Thread
+from urllib.error import HTTPError
+from urllib.request import urlopen
+from serveur.suivi_repertoire import SuiviRepertoireLogs
+from serveur.metriques_prometheus import MetriquesPrometheus
+from serveur.demon_metriques import DemonMetriques
+
+
+# Données utilisées pour les tests unitaires
+
+ligne_valide = '::1 - - [05/Mar/2025:16:59:43 +0100] "GET / HTTP/1.1" 404 20 12000\n'
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("suivi, metriques, intervalle, exception", [
+    ("rep/", None, 1, TypeError),
+    (None, {}, 1, TypeError),
+    (None, None, "1", TypeError),
+    (None, None, 0, ValueError)
+])
+def test_demon_exception_parametres_invalides(tmp_path, suivi, metriques, intervalle,
+                                              exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Suivi, métriques ou intervalle d'un type incorrect.
+        - Intervalle nul.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        suivi (any): Le suivi (``None`` pour un suivi valide).
+        metriques (any): Les métriques (``None`` pour des métriques valides).
+        intervalle (any): L'intervalle entre deux passes.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        DemonMetriques(suivi if suivi is not None else SuiviRepertoireLogs(str(tmp_path)),
+                       metriques if metriques is not None else MetriquesPrometheus(),
+                       intervalle)
+
+def test_demon_ingere(tmp_path):
+    """
+    Vérifie qu'une passe d'ingestion parse les nouvelles lignes et met à jour
+    l'instantané des métriques.
+
+    Scénarios testés:
+        - Passe avec une ligne valide et une ligne invalide.
+        - Passe sans nouvelle ligne.
+
+    Asserts:
+        - Le nombre de lignes lues est retourné.
+        - Les métriques exposées comptent la requête et la ligne invalide.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    (tmp_path / "access.log").write_text(ligne_valide + "ligne invalide\n")
+    demon = DemonMetriques(SuiviRepertoireLogs(str(tmp_path), depuis_debut=True),
+                           MetriquesPrometheus())
+    assert demon.ingere() == 2
+    assert demon.ingere() == 0
+    texte = demon.metriques.get_texte()
+    assert 'logbuster_requetes_total{code="404",methode="GET",vhost=""} 1' in texte
+    assert "logbuster_lignes_invalides_total 1" in texte
+    assert 'logbuster_temps_reponse_secondes_bucket{le="0.025"} 1' in texte
+
+def test_demon_parseurs_fichiers_supprimes(tmp_path):
+    """
+    Vérifie que les parseurs des fichiers qui ne sont plus suivis sont oubliés.
+
+    Scénarios testés:
+        - Vingt fichiers log ingérés puis supprimés, sauf un.
+
+    Asserts:
+        - Seul le parseur du fichier restant est gardé.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    for numero in range(20):
+        (tmp_path / f"access-{numero}.log").write_text(ligne_valide)
+    demon = DemonMetriques(SuiviRepertoireLogs(str(tmp_path), depuis_debut=True),
+                           MetriquesPrometheus())
+    assert demon.ingere() == 20
+    for numero in range(1, 20):
+        (tmp_path / f"access-{numero}.log").unlink()
+    demon.ingere()
+    # pylint: disable=protected-access
+    assert list(demon._parseurs) == [str(tmp_path / "access-0.log")]
+
+def test_demon_ingestion_continue_et_http(tmp_path):
+    """
+    Vérifie que le thread d'ingestion lit les lignes ajoutées pendant son exécution
+    et que les métriques sont exposées sur la route ``/metrics``.
+
+    Scénarios testés:
+        - Ajout d'une ligne après le démarrage du démon.
+        - Collecte des métriques puis requête sur une route inconnue.
+
+    Asserts:
+        - La ligne ajoutée est comptée dans les métriques collectées.
+        - La route inconnue retourne le code de statut http 404.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    fichier = tmp_path / "access.log"
+    fichier.write_text("")
+    demon = DemonMetriques(SuiviRepertoireLogs(str(tmp_path)), MetriquesPrometheus(), 0.01)
+    serveur = demon.cree_serveur_http("127.0.0.1", 0)
+    Thread(target=serveur.serve_forever, daemon=True).start()
+    demon.demarre_ingestion()
+    try:
+        with open(fichier, "a", encoding="utf-8") as log:
+            log.write(ligne_valide)
+        adresse = f"http://127.0.0.1:{serveur.server_address[1]}"
+        texte = ""
+        for _ in range(200):
+            with urlopen(f"{adresse}/metrics", timeout=5) as reponse:
+                texte = reponse.read().decode("utf-8")
+            if 'code="404"' in texte:
+                break
+            time.sleep(0.01)
+        assert 'logbuster_requetes_total{code="404",methode="GET",vhost=""} 1' in texte
+        with pytest.raises(HTTPError) as erreur:
+            urlopen(f"{adresse}/inconnue", timeout=5)
+        assert erreur.value.code == 404
+    finally:
+        demon.arrete_ingestion()
+        serveur.shutdown()
+        serveur.server_close()
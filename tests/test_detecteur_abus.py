@@ -0,0 +1,216 @@
+"""
+Module des tests unitaires pour la détection des clients abusifs.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.detecteur_abus import DetecteurAbus
+from parse.parseur_log_apache import ParseurLogApache
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def cree_entree(parseur, seconde, ip="10.0.0.1", code=200):
+    """
+    Crée une entrée de log Apache à la seconde indiquée (après 10:00:00).
+
+    Args:
+        parseur (ParseurLogApache): Le parseur des entrées.
+        seconde (int): La seconde de l'entrée.
+        ip (str): L'adresse IP du client.
+        code (int): Le code de statut http de la réponse.
+
+    Returns:
+        EntreeLogApache: L'entrée.
+    """
+    heure, reste = divmod(seconde, 3600)
+    return parseur.parse_entree(
+        f'{ip} - - [12/Jan/2025:{10 + heure:02d}:{reste // 60:02d}:{reste % 60:02d} +0000] '
+        f'"GET / HTTP/1.1" {code} 100'
+    )
+
+def trafic(parseur, duree, rafale=None):
+    """
+    Crée le trafic d'un client régulier (une requête par seconde) et d'un client
+    occasionnel (une requête toutes les 10 secondes), avec une éventuelle rafale
+    du client occasionnel.
+
+    Args:
+        parseur (ParseurLogApache): Le parseur des entrées.
+        duree (int): La durée (en secondes) du trafic.
+        rafale (Optional[range]): Les secondes de la rafale (20 requêtes par seconde).
+
+    Returns:
+        list: Les entrées, dans l'ordre chronologique.
+    """
+    entrees = []
+    for seconde in range(duree):
+        entrees.append(cree_entree(parseur, seconde, "10.0.0.1"))
+        if seconde % 10 == 0:
+            entrees.append(cree_entree(parseur, seconde, "10.0.0.2"))
+        if rafale is not None and seconde in rafale:
+            entrees.extend(cree_entree(parseur, seconde, "10.0.0.2") for _ in range(20))
+    return entrees
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"filtre": None}, TypeError),
+    ({"fenetre_secondes": "300"}, TypeError),
+    ({"alpha": None}, TypeError),
+    ({"fenetre_secondes": 0}, ValueError),
+    ({"fenetre_secondes": 305}, ValueError),
+    ({"alpha": 0}, ValueError),
+    ({"seuil": 1}, ValueError),
+    ({"capacite_clients": 0}, ValueError)
+])
+def test_detecteur_exception_parametres_invalides(parametres, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre, fenêtre ou poids d'un type incorrect.
+        - Fenêtre nulle ou non multiple de l'intervalle, poids nul, seuil trop faible
+          ou capacité nulle.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        parametres (dict): Les paramètres qui remplacent les paramètres valides.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        DetecteurAbus(**{"filtre": FiltreLogApache(None, None), **parametres})
+
+def test_detecteur_top_clients_fenetre(log_apache):
+    """
+    Vérifie le classement des adresses IP sur la dernière fenêtre.
+
+    Scénarios testés:
+        - Deux clients réguliers pendant dix minutes, fenêtre de cinq minutes.
+
+    Asserts:
+        - Les adresses sont classées par nombre de requêtes de la dernière fenêtre.
+        - La référence du client régulier est égale à son débit.
+        - Aucune alerte n'est levée.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    detecteur = DetecteurAbus(FiltreLogApache(None, None))
+    detecteur.ajoute_entrees(trafic(ParseurLogApache(str(log_apache(True))), 600))
+    top = detecteur.get_top_clients()
+    assert [(client["adresse_ip"], client["requetes"]) for client in top] == [
+        ("10.0.0.1", 300), ("10.0.0.2", 30)
+    ]
+    assert top[0]["reference_fenetre"] == pytest.approx(300, rel=0.01)
+    assert detecteur.get_alertes() == []
+
+def test_detecteur_alerte_rafale(log_apache):
+    """
+    Vérifie qu'une rafale de requêtes d'un client est signalée sur la période
+    pendant laquelle elle reste dans la fenêtre.
+
+    Scénarios testés:
+        - Rafale d'une minute d'un client occasionnel, après trente minutes de
+          trafic régulier.
+
+    Asserts:
+        - Une seule alerte est levée, pour le client de la rafale.
+        - La période signalée commence à la rafale et se termine lorsqu'elle sort
+          de la fenêtre.
+        - La référence n'apprend pas le débit de la rafale.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    detecteur = DetecteurAbus(FiltreLogApache(None, None))
+    detecteur.ajoute_entrees(trafic(ParseurLogApache(str(log_apache(True))), 3600,
+                                    range(1800, 1860)))
+    alertes = detecteur.get_alertes()
+    assert len(alertes) == 1
+    assert alertes[0]["adresse_ip"] == "10.0.0.2"
+    assert alertes[0]["debut"] == "2025-01-12T10:30:00+00:00"
+    assert alertes[0]["fin"] == "2025-01-12T10:35:50+00:00"
+    assert alertes[0]["requetes_fenetre_max"] == 1230
+    assert alertes[0]["reference_fenetre"] == pytest.approx(30, rel=0.01)
+    assert not alertes[0]["en_cours"]
+
+def test_detecteur_alerte_en_cours_et_filtre(log_apache):
+    """
+    Vérifie qu'une alerte dont la condition est toujours vraie est signalée en cours,
+    et que le filtre est appliqué.
+
+    Scénarios testés:
+        - Rafale à la fin du flux.
+        - Entrées exclues par le filtre.
+
+    Asserts:
+        - L'alerte est en cours.
+        - Les entrées exclues ne sont pas comptées.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    detecteur = DetecteurAbus(FiltreLogApache(None, None, "code < 400"))
+    detecteur.ajoute_entrees([cree_entree(parseur, seconde, "10.0.0.3")
+                              for seconde in range(0, 600, 10)])
+    detecteur.ajoute_entrees([cree_entree(parseur, 599, "10.0.0.4", 500)] * 500)
+    detecteur.ajoute_entrees([cree_entree(parseur, 599, "10.0.0.3")] * 150)
+    alertes = detecteur.get_alertes()
+    assert [(alerte["adresse_ip"], alerte["en_cours"]) for alerte in alertes] == [
+        ("10.0.0.3", True)
+    ]
+    assert detecteur.total_entrees == 710
+    assert detecteur.get_total_clients() == 1
+
+def test_detecteur_eviction_clients_inactifs(log_apache):
+    """
+    Vérifie que les adresses inactives et celles au-delà de la capacité sont oubliées.
+
+    Scénarios testés:
+        - Clients successifs, chacun actif une seule fois, avec une capacité de 10.
+        - Client inactif plus longtemps que le délai d'éviction.
+
+    Asserts:
+        - Le nombre d'adresses suivies reste borné par la capacité.
+        - Le client inactif est oublié.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    detecteur = DetecteurAbus(FiltreLogApache(None, None), delai_eviction=60,
+                              capacite_clients=10)
+    for numero in range(50):
+        detecteur.ajoute_entree(cree_entree(parseur, 0, f"10.0.1.{numero}"))
+        assert detecteur.get_total_clients() <= 10
+    assert detecteur.clients_evinces == 40
+    detecteur.ajoute_entree(cree_entree(parseur, 120, "10.0.0.1"))
+    assert detecteur.get_total_clients() == 1
+    assert detecteur.get_analyse()["clients_evinces"] == 50
+
+@pytest.mark.parametrize("nombre_par_top, exception", [
+    ("3", TypeError),
+    (-1, ValueError)
+])
+def test_detecteur_exception_nombre_par_top_invalide(nombre_par_top, exception):
+    """
+    Vérifie que l'analyse renvoie une erreur lorsque le nombre par top est invalide.
+
+    Scénarios testés:
+        - Nombre par top d'un type incorrect ou négatif.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        nombre_par_top (any): Le nombre par top.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        DetecteurAbus(FiltreLogApache(None, None)).get_analyse(nombre_par_top)
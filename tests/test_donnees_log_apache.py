@@ -216,4 +216,37 @@ def test_reponse_exception_type_invalide(code_statut_http,
         reponse = ReponseInformations(
             code_statut_http,
             taille_octets
-        )
\ No newline at end of file
+        )
+@pytest.mark.parametrize("temps_reponse", [
+    (False), ("120"), (1.5)
+])
+def test_reponse_exception_temps_reponse_type_invalide(temps_reponse):
+    """
+    Vérifie que la classe renvoie une erreur lorsque le temps de réponse
+    n'est pas un entier.
+
+    Scénarios testés:
+        - Type incorrect pour le paramètre ``temps_reponse``.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+
+    Args:
+        temps_reponse (any): Le temps de réponse en microsecondes.
+    """
+    with pytest.raises(TypeError):
+        ReponseInformations(200, 50, temps_reponse)
+
+def test_requete_exception_hote_virtuel_type_invalide():
+    """
+    Vérifie que la classe renvoie une erreur lorsque l'hôte virtuel n'est pas
+    une chaîne de caractères.
+
+    Scénarios testés:
+        - Type incorrect pour le paramètre ``hote_virtuel``.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    with pytest.raises(TypeError):
+        RequeteInformations(datetime(2025, 1, 1), "GET", "/", "HTTP/1.1", None, 443)
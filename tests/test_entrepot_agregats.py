@@ -0,0 +1,338 @@
+"""
+Module des tests unitaires pour l'entrepôt des agrégats et le calcul des tendances.
+"""
+
+import sqlite3
+from datetime import date
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.entrepot_agregats import EntrepotAgregats, EntrepotAgregatsException
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def cree_analyse(chemin, series, codes, urls, filtre=None):
+    """
+    Crée une analyse au format de :meth:`AnalyseurLogApache.get_analyse_complete`,
+    réduite aux informations lues par l'entrepôt.
+
+    Args:
+        chemin (str): Le chemin du fichier analysé.
+        series (list): Les intervalles horaires ``(debut, requetes, erreurs)``.
+        codes (list): Les couples ``(code, total)``.
+        urls (list): Les couples ``(url, total)``.
+        filtre (Optional[FiltreLogApache]): Le filtre de l'analyse. Par défaut, aucun.
+
+    Returns:
+        dict: L'analyse.
+    """
+    return {
+        "chemin": chemin,
+        "total_entrees": sum(requetes for _, requetes, _ in series),
+        "filtre": (filtre or FiltreLogApache(None, None)).get_dict_filtre(),
+        "statistiques": {
+            "total_entrees_filtre": sum(requetes for _, requetes, _ in series),
+            "requetes": {"top_urls": [{"url": url, "total": total, "taux": 0}
+                                      for url, total in urls]},
+            "reponses": {"repartition_code_statut_http": [
+                {"code": code, "total": total, "taux": 0} for code, total in codes
+            ]},
+            "series_temporelles": {
+                "granularite": "heure",
+                "pic_requetes_par_seconde": 1,
+                "series": [{"debut": debut, "requetes": requetes, "octets": requetes * 10,
+                            "erreurs": erreurs, "pic_requetes_par_seconde": 1}
+                           for debut, requetes, erreurs in series]
+            }
+        }
+    }
+
+
+@pytest.fixture
+def entrepot(tmp_path):
+    """
+    Fixture qui crée un entrepôt contenant les analyses de trois jours consécutifs.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+
+    Returns:
+        EntrepotAgregats: L'entrepôt, fermé à la fin du test.
+    """
+    entrepot_agregats = EntrepotAgregats(str(tmp_path / "entrepot.sqlite"))
+    entrepot_agregats.ajoute_analyse(cree_analyse(
+        "/logs/access-10.log", [("2025-01-10T10:00:00+00:00", 50, 5)],
+        [(200, 45), (500, 5)], [("/", 30), ("/panier", 20)]
+    ))
+    entrepot_agregats.ajoute_analyse(cree_analyse(
+        "/logs/access-11.log",
+        [("2025-01-11T10:00:00+00:00", 100, 2), ("2025-01-11T11:00:00+00:00", 60, 0)],
+        [(200, 150), (404, 8), (500, 2)], [("/", 90), ("/produit", 70)]
+    ))
+    entrepot_agregats.ajoute_analyse(cree_analyse(
+        "/logs/access-12.log", [("2025-01-12T09:00:00+00:00", 80, 8)],
+        [(200, 72), (500, 8)], [("/produit", 50), ("/", 30)]
+    ))
+    yield entrepot_agregats
+    entrepot_agregats.ferme()
+
+
+# Tests unitaires
+
+def test_entrepot_tendance_jour(entrepot):
+    """
+    Vérifie la comparaison du dernier jour de l'entrepôt avec le jour précédent.
+
+    Scénarios testés:
+        - Période d'un jour, sans date de référence.
+
+    Asserts:
+        - Les intervalles, les codes et les urls sont sommés par jour.
+        - L'évolution est exprimée en pourcentage, et en points pour le taux
+          d'erreurs.
+
+    Args:
+        entrepot (EntrepotAgregats): La fixture de l'entrepôt de trois jours d'analyses.
+    """
+    tendance = entrepot.get_tendance("jour")
+    assert tendance["courante"]["debut"] == "2025-01-12T00:00:00+00:00"
+    assert (tendance["courante"]["requetes"], tendance["courante"]["erreurs"]) == (80, 8)
+    assert (tendance["precedente"]["requetes"], tendance["precedente"]["octets"]) == (160, 1600)
+    assert tendance["precedente"]["repartition_code_statut_http"] == [
+        {"code": 200, "total": 150}, {"code": 404, "total": 8}, {"code": 500, "total": 2}
+    ]
+    assert tendance["courante"]["top_urls"] == [{"url": "/produit", "total": 50},
+                                                {"url": "/", "total": 30}]
+    assert tendance["evolution"]["requetes"] == -50
+    assert tendance["evolution"]["erreurs"] == 300
+    assert tendance["evolution"]["taux_erreurs"] == pytest.approx(10 - 1.25)
+
+def test_entrepot_tendance_semaine(entrepot):
+    """
+    Vérifie la comparaison d'une semaine avec la semaine précédente.
+
+    Scénarios testés:
+        - Période d'une semaine se terminant à une date de référence, avec un
+          classement d'une seule url.
+
+    Asserts:
+        - Seules les analyses de la semaine courante sont sommées.
+        - L'évolution est ``None`` lorsque la semaine précédente est vide.
+
+    Args:
+        entrepot (EntrepotAgregats): La fixture de l'entrepôt de trois jours d'analyses.
+    """
+    tendance = entrepot.get_tendance("semaine", date(2025, 1, 11), 1)
+    assert tendance["courante"]["fin"] == "2025-01-12T00:00:00+00:00"
+    assert tendance["courante"]["requetes"] == 210
+    assert tendance["courante"]["top_urls"] == [{"url": "/", "total": 120}]
+    assert tendance["precedente"]["requetes"] == 0
+    assert tendance["evolution"]["requetes"] is None
+
+def test_entrepot_analyse_deja_ajoutee(entrepot):
+    """
+    Vérifie qu'une analyse déjà ajoutée n'est pas comptée deux fois, y compris après
+    la réouverture de l'entrepôt.
+
+    Scénarios testés:
+        - Ajout, par une autre connexion à l'entrepôt, d'une analyse identique à une
+          analyse déjà ajoutée.
+
+    Asserts:
+        - L'ajout est ignoré et les totaux sont inchangés.
+
+    Args:
+        entrepot (EntrepotAgregats): La fixture de l'entrepôt de trois jours d'analyses.
+    """
+    entrepot_rouvert = EntrepotAgregats(entrepot.chemin_base)
+    try:
+        assert entrepot_rouvert.ajoute_analyse(cree_analyse(
+            "/logs/access-12.log", [("2025-01-12T09:00:00+00:00", 80, 8)],
+            [(200, 72), (500, 8)], [("/produit", 50), ("/", 30)]
+        )) is False
+        assert entrepot_rouvert.get_tendance("jour")["courante"]["requetes"] == 80
+    finally:
+        entrepot_rouvert.ferme()
+
+def test_entrepot_nouvelle_analyse_meme_fichier(entrepot):
+    """
+    Vérifie qu'une nouvelle analyse d'un fichier qui a grossi remplace l'analyse
+    précédente sur sa plage de temps au lieu de s'y ajouter.
+
+    Scénarios testés:
+        - Nouvelle analyse du fichier du 12 janvier avec davantage de requêtes sur la
+          même heure et une heure supplémentaire.
+
+    Asserts:
+        - Les intervalles et les codes du jour ne comptent que la dernière analyse.
+
+    Args:
+        entrepot (EntrepotAgregats): La fixture de l'entrepôt de trois jours d'analyses.
+    """
+    assert entrepot.ajoute_analyse(cree_analyse(
+        "/logs/access-12.log",
+        [("2025-01-12T09:00:00+00:00", 100, 8), ("2025-01-12T10:00:00+00:00", 20, 0)],
+        [(200, 112), (500, 8)], [("/produit", 70), ("/", 50)]
+    )) is True
+    tendance = entrepot.get_tendance("jour")
+    assert (tendance["courante"]["requetes"], tendance["courante"]["erreurs"]) == (120, 8)
+    assert tendance["courante"]["repartition_code_statut_http"] == [
+        {"code": 200, "total": 112}, {"code": 500, "total": 8}
+    ]
+    assert tendance["courante"]["top_urls"][0] == {"url": "/produit", "total": 70}
+
+def test_entrepot_analyses_filtrees_separees(entrepot):
+    """
+    Vérifie que les analyses filtrées ne sont pas additionnées aux analyses sans
+    filtre.
+
+    Scénarios testés:
+        - Analyse du 12 janvier filtrée sur le code 500, puis tendance sans filtre et
+          tendance du filtre.
+
+    Asserts:
+        - La tendance sans filtre est inchangée.
+        - La tendance du filtre ne compte que l'analyse filtrée.
+
+    Args:
+        entrepot (EntrepotAgregats): La fixture de l'entrepôt de trois jours d'analyses.
+    """
+    filtre = FiltreLogApache(None, 500)
+    entrepot.ajoute_analyse(cree_analyse(
+        "/logs/access-12.log", [("2025-01-12T09:00:00+00:00", 8, 8)], [(500, 8)],
+        [("/produit", 8)], filtre
+    ))
+    assert entrepot.get_tendance("jour")["courante"]["requetes"] == 80
+    tendance = entrepot.get_tendance("jour", filtre=filtre)
+    assert tendance["filtre"]["code_statut_http"] == 500
+    assert (tendance["courante"]["requetes"], tendance["precedente"]["requetes"]) == (8, 0)
+    assert tendance["courante"]["repartition_code_statut_http"] == [{"code": 500, "total": 8}]
+
+def test_entrepot_analyse_plusieurs_periodes(tmp_path):
+    """
+    Vérifie que les codes et les urls d'une analyse à cheval sur deux périodes ne
+    sont comptés dans aucune d'elles.
+
+    Scénarios testés:
+        - Analyse dont les intervalles couvrent deux semaines.
+
+    Asserts:
+        - Les intervalles sont comptés dans leur semaine.
+        - Les codes et les urls sont écartés et l'analyse est signalée comme partielle
+          dans les deux semaines.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    entrepot_agregats = EntrepotAgregats(str(tmp_path / "entrepot.sqlite"))
+    try:
+        entrepot_agregats.ajoute_analyse(cree_analyse(
+            "/logs/access.log",
+            [("2025-01-03T10:00:00+00:00", 40, 0), ("2025-01-10T10:00:00+00:00", 60, 6)],
+            [(200, 94), (500, 6)], [("/", 100)]
+        ))
+        tendance = entrepot_agregats.get_tendance("semaine", date(2025, 1, 12))
+        for periode, requetes in (("courante", 60), ("precedente", 40)):
+            assert tendance[periode]["requetes"] == requetes
+            assert tendance[periode]["repartition_code_statut_http"] == []
+            assert tendance[periode]["top_urls"] == []
+            assert tendance[periode]["executions_partielles"] == 1
+    finally:
+        entrepot_agregats.ferme()
+
+def test_entrepot_index_couvrant(entrepot):
+    """
+    Vérifie que la somme des intervalles d'une période n'utilise que l'index.
+
+    Scénarios testés:
+        - Plan de la requête des intervalles d'une période.
+
+    Asserts:
+        - SQLite utilise l'index couvrant sur la série et le début des intervalles.
+
+    Args:
+        entrepot (EntrepotAgregats): La fixture de l'entrepôt de trois jours d'analyses.
+    """
+    # pylint: disable=protected-access
+    plan = entrepot._connexion.execute(
+        "EXPLAIN QUERY PLAN SELECT COALESCE(SUM(requetes), 0), COALESCE(SUM(octets), 0), "
+        "COALESCE(SUM(erreurs), 0) FROM intervalles WHERE debut >= ? AND debut < ? "
+        "AND serie IN (SELECT id FROM series WHERE filtre = ?)",
+        (0, 1, "{}")
+    ).fetchall()
+    assert "COVERING INDEX intervalles_serie" in " ".join(str(ligne) for ligne in plan)
+
+def test_entrepot_exception_analyse_invalide(entrepot):
+    """
+    Vérifie qu'une analyse invalide lève une exception sans rien ajouter.
+
+    Scénarios testés:
+        - Analyse d'un type incorrect.
+        - Analyse sans séries temporelles.
+
+    Asserts:
+        - L'exception attendue est levée.
+        - L'entrepôt est inchangé.
+
+    Args:
+        entrepot (EntrepotAgregats): La fixture de l'entrepôt de trois jours d'analyses.
+    """
+    with pytest.raises(TypeError):
+        entrepot.ajoute_analyse([])
+    with pytest.raises(EntrepotAgregatsException):
+        entrepot.ajoute_analyse({"chemin": "/logs/access.log", "statistiques": {}})
+    assert entrepot.get_tendance("jour")["courante"]["requetes"] == 80
+
+def test_entrepot_exception_version_ou_vide(tmp_path):
+    """
+    Vérifie les erreurs d'un entrepôt d'une autre version ou vide.
+
+    Scénarios testés:
+        - Base dont la version du schéma est inconnue.
+        - Tendance d'un entrepôt vide sans date de référence.
+
+    Asserts:
+        - Une exception :class:`EntrepotAgregatsException` est levée.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    connexion = sqlite3.connect(str(tmp_path / "autre.sqlite"))
+    connexion.execute("PRAGMA user_version = 99")
+    connexion.close()
+    with pytest.raises(EntrepotAgregatsException):
+        EntrepotAgregats(str(tmp_path / "autre.sqlite"))
+    entrepot_vide = EntrepotAgregats(str(tmp_path / "vide.sqlite"))
+    try:
+        with pytest.raises(EntrepotAgregatsException):
+            entrepot_vide.get_tendance()
+    finally:
+        entrepot_vide.ferme()
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"periode": 7}, TypeError),
+    ({"date_reference": "2025-01-12"}, TypeError),
+    ({"nombre_par_top": "3"}, TypeError),
+    ({"filtre": {"code_statut_http": 404}}, TypeError),
+    ({"periode": "mois"}, ValueError),
+    ({"nombre_par_top": -1}, ValueError)
+])
+def test_entrepot_exception_parametres_tendance_invalides(entrepot, parametres, exception):
+    """
+    Vérifie que le calcul de la tendance renvoie une erreur lorsque ses paramètres sont
+    invalides.
+
+    Scénarios testés:
+        - Période, date, nombre par top ou filtre d'un type incorrect.
+        - Période inconnue ou nombre par top négatif.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        entrepot (EntrepotAgregats): La fixture de l'entrepôt de trois jours d'analyses.
+        parametres (dict): Les paramètres de la tendance.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        entrepot.get_tendance(**parametres)
@@ -0,0 +1,337 @@
+"""
+Module des tests unitaires pour l'état partiel (fusionnable) d'une analyse de log Apache.
+"""
+
+import json
+import pytest
+from parse.fichier_log_apache import FichierLogApache
+from parse.parseur_log_apache import ParseurLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.moteur_groupement import SpecificationGroupement
+from analyse.normaliseur_urls import NormaliseurUrls
+from analyse.etat_partiel_analyse import EtatPartielAnalyse, EtatPartielException
+
+
+# Données utilisées pour les tests unitaires
+
+groupements = [SpecificationGroupement("ip"), SpecificationGroupement("methode,code")]
+
+
+# Fonctions utilitaires
+
+def get_etat_partiel(fichier_log_apache: FichierLogApache,
+                     debut: int,
+                     fin: int,
+                     filtre: FiltreLogApache) -> EtatPartielAnalyse:
+    """
+    Retourne l'état partiel d'une partie des entrées d'un fichier, après un passage
+    par sa forme JSON.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Le fichier complet.
+        debut (int): L'indice de la première entrée de la partie.
+        fin (int): L'indice de fin (exclu) de la partie.
+        filtre (FiltreLogApache): Le filtre de l'analyse.
+
+    Returns:
+        EtatPartielAnalyse: L'état partiel reconstruit depuis sa forme JSON.
+    """
+    partie = FichierLogApache(f"partie-{debut}.log")
+    for entree in fichier_log_apache.entrees[debut:fin]:
+        partie.ajoute_entree(entree)
+    etat_partiel = AnalyseurLogApache(partie, filtre, groupements=groupements).get_etat_partiel()
+    return EtatPartielAnalyse.depuis_dict(json.loads(json.dumps(etat_partiel.get_dict())))
+
+
+# Tests unitaires
+
+def test_etat_partiel_exception_parametres_invalides(filtre_log_apache):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Filtre qui n'est pas un :class:`FiltreLogApache`.
+        - Granularité inconnue.
+
+    Asserts:
+        - Les exceptions :class:`TypeError` puis :class:`ValueError` sont levées.
+
+    Args:
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+    """
+    with pytest.raises(TypeError):
+        EtatPartielAnalyse({"adresse_ip": None})
+    with pytest.raises(ValueError):
+        EtatPartielAnalyse(filtre_log_apache, "semaine")
+
+@pytest.mark.parametrize("filtre", [
+    FiltreLogApache(None, None),
+    FiltreLogApache("::1", None),
+    FiltreLogApache(None, 404)
+])
+def test_etat_partiel_analyse_identique(fichier_log_apache, filtre):
+    """
+    Vérifie que l'analyse produite depuis l'état partiel d'un fichier est identique
+    à l'analyse complète de ce fichier.
+
+    Scénarios testés:
+        - État partiel sérialisé en JSON puis reconstruit, avec différents filtres.
+
+    Asserts:
+        - Les statistiques, le filtre et le total d'entrées sont identiques.
+        - Le chemin du fichier est présent dans ``chemins``.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        filtre (FiltreLogApache): Le filtre de l'analyse.
+    """
+    analyseur = AnalyseurLogApache(fichier_log_apache, filtre, groupements=groupements)
+    analyse = analyseur.get_analyse_complete()
+    etat_partiel = EtatPartielAnalyse.depuis_dict(
+        json.loads(json.dumps(analyseur.get_etat_partiel().get_dict()))
+    )
+    analyse_etat = etat_partiel.get_analyse_complete()
+    assert analyse_etat["chemins"] == [analyse["chemin"]]
+    assert analyse_etat["total_entrees"] == analyse["total_entrees"]
+    assert analyse_etat["filtre"] == analyse["filtre"]
+    assert analyse_etat["statistiques"] == analyse["statistiques"]
+    assert etat_partiel.get_total_par_code_statut_http_camembert() \
+        == analyseur.get_total_par_code_statut_http_camembert()
+
+def test_etat_partiel_fusion_identique(fichier_log_apache, filtre_log_apache):
+    """
+    Vérifie que la fusion des états partiels de plusieurs parties d'un fichier donne
+    la même analyse que l'analyse du fichier complet.
+
+    Scénarios testés:
+        - Fichier découpé en trois parties fusionnées dans l'ordre.
+
+    Asserts:
+        - Les statistiques fusionnées sont identiques à celles du fichier complet
+          (les sketchs sont exacts en dessous de leur capacité).
+        - Le total d'entrées est la somme des totaux des parties.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+    """
+    analyse = AnalyseurLogApache(fichier_log_apache, filtre_log_apache,
+                                 groupements=groupements).get_analyse_complete()
+    etat_fusionne = get_etat_partiel(fichier_log_apache, 0, 1, filtre_log_apache)
+    etat_fusionne.fusionne(get_etat_partiel(fichier_log_apache, 1, 3, filtre_log_apache))
+    etat_fusionne.fusionne(get_etat_partiel(fichier_log_apache, 3, None, filtre_log_apache))
+    analyse_fusionnee = etat_fusionne.get_analyse_complete()
+    assert len(analyse_fusionnee["chemins"]) == 3
+    assert analyse_fusionnee["total_entrees"] == analyse["total_entrees"]
+    assert analyse_fusionnee["statistiques"] == analyse["statistiques"]
+
+def test_etat_partiel_fusion_seconde_partagee(fichier_log_apache, filtre_log_apache):
+    """
+    Vérifie que le pic de requêtes par seconde reste exact lorsque les requêtes
+    d'une même seconde sont réparties entre deux états.
+
+    Scénarios testés:
+        - Fichier découpé entre deux requêtes de la même seconde.
+
+    Asserts:
+        - Les séries temporelles fusionnées sont identiques à celles du fichier
+          complet.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+    """
+    analyse = AnalyseurLogApache(fichier_log_apache, filtre_log_apache).get_analyse_complete()
+    etat_fusionne = get_etat_partiel(fichier_log_apache, 2, None, filtre_log_apache)
+    etat_fusionne.fusionne(get_etat_partiel(fichier_log_apache, 0, 2, filtre_log_apache))
+    series_temporelles = etat_fusionne.get_analyse_complete()["statistiques"]["series_temporelles"]
+    assert series_temporelles == analyse["statistiques"]["series_temporelles"]
+    assert series_temporelles["pic_requetes_par_seconde"] == 2
+
+def test_etat_partiel_fusion_plages_chevauchantes(tmp_path, filtre_log_apache):
+    """
+    Vérifie que le pic de requêtes par seconde d'états dont les plages se chevauchent
+    est signalé comme une borne inférieure.
+
+    Scénarios testés:
+        - Deux fichiers avec chacun six requêtes dans la même seconde, entourée par
+          des requêtes plus anciennes et plus récentes.
+        - Un fichier de l'heure suivante, dont la plage ne chevauche pas la première.
+
+    Asserts:
+        - Les totaux des intervalles fusionnés sont exacts.
+        - Le pic fusionné (6) est inférieur au pic réel (12) et sa précision est
+          ``borne_inferieure``, dans l'état et après sérialisation.
+        - Les urls, jamais écartées, restent exactes.
+        - Le pic de la fusion avec le fichier de l'heure suivante reste exact.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+    """
+    etats = []
+    for nom, heure in (("a", 10), ("b", 10), ("c", 11)):
+        fichier = tmp_path / f"{nom}.log"
+        fichier.write_text("\n".join(
+            f'1.1.1.1 - - [12/Jan/2025:{heure}:00:{seconde:02d} +0000] "GET /{nom} HTTP/1.1" '
+            "200 10"
+            for seconde in [0] + [30] * 6 + [59]
+        ))
+        etats.append(AnalyseurLogApache(ParseurLogApache(str(fichier)).parse_fichier(),
+                                        filtre_log_apache).get_etat_partiel())
+    etat_fusionne = EtatPartielAnalyse.depuis_dict(json.loads(json.dumps(etats[0].get_dict())))
+    etat_fusionne.fusionne(etats[1])
+    analyse = EtatPartielAnalyse.depuis_dict(
+        json.loads(json.dumps(etat_fusionne.get_dict()))
+    ).get_analyse_complete()
+    series_temporelles = analyse["statistiques"]["series_temporelles"]
+    assert series_temporelles["series"][0]["requetes"] == 16
+    assert series_temporelles["pic_requetes_par_seconde"] == 6
+    assert analyse["precisions"] == {"pic_requetes_par_seconde": "borne_inferieure",
+                                     "top_urls": "exact"}
+    etats[0].fusionne(etats[2])
+    assert etats[0].get_precisions() == {"pic_requetes_par_seconde": "exact",
+                                         "top_urls": "exact"}
+
+def test_etat_partiel_taille_bornee(tmp_path, filtre_log_apache, monkeypatch):
+    """
+    Vérifie que la taille de l'état sérialisé ne dépend ni du nombre d'urls
+    distinctes ni du nombre de secondes distinctes.
+
+    Scénarios testés:
+        - 2000 requêtes dans la même heure, chacune dans sa propre seconde et
+          presque toutes vers une url distincte, avec au maximum 50 urls suivies.
+
+    Asserts:
+        - L'état sérialisé contient 50 urls et un seul intervalle.
+        - L'url fréquente reste en tête du classement.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+        monkeypatch (MonkeyPatch): Fixture pytest pour modifier le nombre d'urls suivies.
+    """
+    monkeypatch.setattr(EtatPartielAnalyse, "CAPACITE_URLS", 50)
+    fichier = tmp_path / "access.log"
+    fichier.write_text("\n".join(
+        f'1.1.1.1 - - [12/Jan/2025:10:{indice // 60 % 60:02d}:{indice % 60:02d} +0000] '
+        f'"GET {"/populaire" if indice % 4 == 0 else f"/page-{indice}"} HTTP/1.1" 200 10'
+        for indice in range(2000)
+    ))
+    etat_partiel = EtatPartielAnalyse(filtre_log_apache)
+    etat_partiel.ajoute_entrees(ParseurLogApache(str(fichier)).parse_fichier().entrees)
+    etat = json.loads(json.dumps(etat_partiel.get_dict()))
+    assert len(etat["urls"]["elements"]) == 50
+    assert len(etat["intervalles"]["debuts"]) == 1
+    top_urls = EtatPartielAnalyse.depuis_dict(etat).get_analyse_complete(1)["statistiques"][
+        "requetes"]["top_urls"]
+    assert [(url["url"], url["total"]) for url in top_urls] == [("/populaire", 500)]
+    assert etat_partiel.get_precisions()["top_urls"] == "estimation"
+
+def test_etat_partiel_exception_fusion_incompatible(fichier_log_apache, filtre_log_apache):
+    """
+    Vérifie que la fusion renvoie une erreur lorsque les états ne sont pas compatibles.
+
+    Scénarios testés:
+        - Fusion avec un objet qui n'est pas un état partiel.
+        - Fusion d'états avec des filtres différents.
+        - Fusion d'états avec des granularités différentes.
+        - Fusion d'états avec des regroupements différents.
+        - Fusion d'états avec et sans normalisation des urls, ou avec des modèles de
+          routes différents, y compris après sérialisation.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+    """
+    etat_partiel = get_etat_partiel(fichier_log_apache, 0, None, filtre_log_apache)
+    with pytest.raises(TypeError):
+        etat_partiel.fusionne({})
+    with pytest.raises(ValueError):
+        etat_partiel.fusionne(EtatPartielAnalyse(FiltreLogApache("::1", None),
+                                                 groupements=groupements))
+    with pytest.raises(ValueError):
+        etat_partiel.fusionne(EtatPartielAnalyse(filtre_log_apache, "jour",
+                                                 groupements=groupements))
+    with pytest.raises(ValueError):
+        etat_partiel.fusionne(EtatPartielAnalyse(filtre_log_apache))
+    with pytest.raises(ValueError):
+        etat_partiel.fusionne(EtatPartielAnalyse(filtre_log_apache, groupements=groupements,
+                                                 normaliseur_urls=NormaliseurUrls()))
+    etat_routes = EtatPartielAnalyse.depuis_dict(EtatPartielAnalyse(
+        filtre_log_apache, normaliseur_urls=NormaliseurUrls(["/produit/{id}"])
+    ).get_dict())
+    with pytest.raises(ValueError):
+        etat_routes.fusionne(EtatPartielAnalyse(filtre_log_apache,
+                                                normaliseur_urls=NormaliseurUrls()))
+
+@pytest.mark.parametrize("etat", [
+    [],
+    {"version": 0},
+    {"version": EtatPartielAnalyse.VERSION, "filtre": {}}
+])
+def test_etat_partiel_exception_depuis_dict_invalide(etat):
+    """
+    Vérifie que ``depuis_dict`` renvoie une erreur lorsque l'état sérialisé est invalide.
+
+    Scénarios testés:
+        - État qui n'est pas un dictionnaire.
+        - Version non supportée.
+        - État incomplet.
+
+    Asserts:
+        - Une exception :class:`EtatPartielException` est levée.
+
+    Args:
+        etat (any): L'état sérialisé.
+    """
+    with pytest.raises(EtatPartielException):
+        EtatPartielAnalyse.depuis_dict(etat)
+
+def test_etat_partiel_fusionne_fichiers(tmp_path, fichier_log_apache, filtre_log_apache):
+    """
+    Vérifie la lecture et la fusion d'états partiels depuis des fichiers JSON.
+
+    Scénarios testés:
+        - Fusion de deux fichiers valides.
+        - Fichier introuvable, fichier JSON invalide et liste de fichiers vide.
+
+    Asserts:
+        - L'état fusionné contient toutes les entrées des deux fichiers.
+        - Une exception :class:`EtatPartielException` est levée pour les fichiers
+          invalides.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        filtre_log_apache (FiltreLogApache): Fixture pour l'instance
+            de la classe :class:`FiltreLogApache`.
+    """
+    etat_partiel = get_etat_partiel(fichier_log_apache, 0, None, filtre_log_apache)
+    chemins = [tmp_path / "etat-1.json", tmp_path / "etat-2.json"]
+    for chemin in chemins:
+        chemin.write_text(json.dumps(etat_partiel.get_dict()))
+    etat_fusionne = EtatPartielAnalyse.fusionne_fichiers([str(chemin) for chemin in chemins])
+    assert etat_fusionne.total_entrees_filtre == 2 * len(fichier_log_apache.entrees)
+
+    fichier_invalide = tmp_path / "invalide.json"
+    fichier_invalide.write_text("{")
+    for chemins_invalides in ([str(tmp_path / "absent.json")], [str(fichier_invalide)], []):
+        with pytest.raises(EtatPartielException):
+            EtatPartielAnalyse.fusionne_fichiers(chemins_invalides)
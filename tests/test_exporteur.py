@@ -2,10 +2,13 @@
 Module des tests unitaires pour l'exporteur de données.
 """
 
+import sqlite3
 import pytest
 from json import load
+from parse.parseur_log_apache import ParseurLogApache
 from export.exporteur import (Exporteur,
                               ExportationJsonException,
+                              ExportationSqliteException,
                               ExportationCamembertHtmlException,
                               ExportationDossierIntrouvableException)
 
@@ -268,3 +271,131 @@ def test_exporteur_export_vers_html_camembert_exception_exportation(exporteur, m
     mocker.patch("altair.Chart.save", side_effect=exception)
     with pytest.raises(ExportationCamembertHtmlException):
         exporteur.export_vers_html_camembert([[200, 1], [404, 3]], "fichier.html")
+
+def test_exporteur_export_vers_sqlite_valide(exporteur, log_apache, tmp_path):
+    """
+    Vérifie que la méthode ``export_vers_sqlite`` exporte toutes les entrées dans une
+    base normalisée, interrogeable en SQL.
+
+    Scénarios testés:
+        - Exportation de cinq entrées par lots de deux, avec des adresses IP, des urls
+          et des agents utilisateurs répétés, et des champs absents.
+
+    Asserts:
+        - Toutes les entrées sont exportées, y compris celles du dernier lot incomplet.
+        - Chaque adresse IP, url et agent utilisateur n'est écrit qu'une fois.
+        - Les champs sont retrouvés par jointure avec les tables dictionnaires.
+        - Les index sont créés et aucun fichier temporaire ne reste dans le dossier.
+
+    Args:
+        exporteur (Exporteur) : Fixture pour l'instance de la classe :class:`Exporteur`.
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    parseur = ParseurLogApache(str(log_apache(True)))
+    lignes = [
+        '10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET / HTTP/1.1" 200 100 '
+        '"https://exemple.fr/panier" "Mozilla/5.0"',
+        '10.0.0.1 - - [12/Jan/2025:10:00:01 +0000] "GET /panier HTTP/1.1" 200 50 '
+        '"https://exemple.fr/" "Mozilla/5.0"',
+        '10.0.0.2 - alice [12/Jan/2025:10:00:02 +0000] "POST /panier HTTP/1.1" 500 - '
+        '"-" "curl/8.0"',
+        '10.0.0.2 - - [12/Jan/2025:10:00:03 +0000] "GET / HTTP/1.1" 404 10',
+        '10.0.0.3 - - [12/Jan/2025:10:00:04 +0000] "GET /panier HTTP/1.1" 200 50'
+    ]
+    total_entrees = exporteur.export_vers_sqlite(
+        (parseur.parse_entree(ligne) for ligne in lignes), "entrees.sqlite", taille_lot=2
+    )
+    assert total_entrees == 5
+    assert [fichier.name for fichier in tmp_path.iterdir()
+            if fichier.suffix == ".tmp"] == []
+    connexion = sqlite3.connect(str(tmp_path / "entrees.sqlite"))
+    try:
+        assert connexion.execute("SELECT COUNT(*) FROM entrees").fetchone() == (5,)
+        assert connexion.execute("SELECT COUNT(*) FROM adresses_ip").fetchone() == (3,)
+        assert connexion.execute("SELECT COUNT(*) FROM agents_utilisateurs").fetchone() \
+            == (2,)
+        assert connexion.execute(
+            "SELECT a.adresse_ip, u.url, COUNT(*) FROM entrees e "
+            "JOIN adresses_ip a ON a.id = e.adresse_ip JOIN urls u ON u.id = e.url "
+            "GROUP BY a.adresse_ip, u.url ORDER BY a.adresse_ip, u.url"
+        ).fetchall() == [("10.0.0.1", "/", 1), ("10.0.0.1", "/panier", 1),
+                         ("10.0.0.2", "/", 1), ("10.0.0.2", "/panier", 1),
+                         ("10.0.0.3", "/panier", 1)]
+        assert connexion.execute(
+            "SELECT datetime(horodatage, 'unixepoch'), nom_utilisateur, taille_octets, "
+            "agent_utilisateur FROM entrees WHERE code_statut_http = 500"
+        ).fetchone() == ("2025-01-12 10:00:02", "alice", None, 2)
+        index = {ligne[0] for ligne in connexion.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"urls_valeur", "entrees_horodatage", "entrees_code_statut_http"} <= index
+    finally:
+        connexion.close()
+
+@pytest.mark.parametrize("nom_fichier, taille_lot, exception", [
+    (None, 10, TypeError),
+    ("entrees.sqlite", "10", TypeError),
+    ("entrees.json", 10, ValueError),
+    ("entrees.sqlite", 0, ValueError)
+])
+def test_exporteur_exception_export_vers_sqlite_parametres_invalides(exporteur,
+                                                                     nom_fichier,
+                                                                     taille_lot,
+                                                                     exception):
+    """
+    Vérifie que la méthode ``export_vers_sqlite`` renvoie une erreur lorsque ses
+    paramètres sont invalides.
+
+    Scénarios testés:
+        - Nom du fichier ou taille des lots d'un type incorrect.
+        - Extension autre que ``.sqlite`` ou taille des lots nulle.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        exporteur (Exporteur) : Fixture pour l'instance de la classe :class:`Exporteur`.
+        nom_fichier (any): Le nom du fichier SQLite.
+        taille_lot (any): Le nombre d'entrées insérées par lot.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        exporteur.export_vers_sqlite([], nom_fichier, taille_lot)
+
+def test_exporteur_export_vers_sqlite_exception_exportation(exporteur, log_apache,
+                                                             tmp_path, monkeypatch):
+    """
+    Vérifie que la méthode ``export_vers_sqlite`` renvoie l'exception
+    :class:`ExportationSqliteException` lorsque une erreur SQLite apparait durant
+    l'exportation, sans remplacer une base existante ni laisser de base temporaire.
+
+    Scénarios testés:
+        - Une erreur SQLite lors de la création des index, après l'insertion des
+          entrées.
+        - Une entrée invalide au milieu des entrées exportées.
+
+    Asserts:
+        - Une exception :class:`ExportationSqliteException` est levée pour l'erreur
+          SQLite.
+        - L'erreur due à l'entrée invalide n'est pas présentée comme une erreur
+          d'exportation.
+        - La base existante est inchangée et la base temporaire est supprimée.
+
+    Args:
+        exporteur (Exporteur) : Fixture pour l'instance de la classe :class:`Exporteur`.
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        monkeypatch (MonkeyPatch): Une fixture pour modifier les index créés.
+    """
+    (tmp_path / "entrees.sqlite").write_bytes(b"ancienne base")
+    entrees = ParseurLogApache(str(log_apache(True))).parse_fichier().entrees
+    with monkeypatch.context() as contexte:
+        contexte.setattr(Exporteur, "INDEX_SQLITE", "CREATE INDEX i ON absente (a);")
+        with pytest.raises(ExportationSqliteException):
+            exporteur.export_vers_sqlite(entrees, "entrees.sqlite")
+    assert (tmp_path / "entrees.sqlite").read_bytes() == b"ancienne base"
+    assert not (tmp_path / "entrees.sqlite.tmp").exists()
+    with pytest.raises(AttributeError):
+        exporteur.export_vers_sqlite([None], "entrees.sqlite")
+    assert (tmp_path / "entrees.sqlite").read_bytes() == b"ancienne base"
+    assert not (tmp_path / "entrees.sqlite.tmp").exists()
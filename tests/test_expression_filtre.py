@@ -0,0 +1,229 @@
+"""
+Module des tests unitaires pour le langage d'expressions de filtre.
+"""
+
+import pytest
+from analyse.expression_filtre import ExpressionFiltre, ExpressionFiltreInvalideException
+from analyse.analyseur_log_apache_pandas import AnalyseurLogApachePandas
+
+
+# Données utilisées pour les tests unitaires
+# (voir les lignes valides du fichier conftest.py)
+
+expressions_resultats = [
+    ("code = 500", [False, True, True, True, True]),
+    ("code == 5xx", [False, True, True, True, True]),
+    ("code != 2xx", [False, True, True, True, True]),
+    ("code in (200, 4xx)", [True, False, False, False, False]),
+    ("taille > 100", [True, False, False, False, False]),
+    ("taille <= 20", [False, True, True, True, True]),
+    ("ip = ::1", [False, True, True, True, False]),
+    ("ip = 192.168.0.0/16", [True, False, False, False, False]),
+    ("ip in (111.89.0.0/16, ::/0)", [False, True, True, True, True]),
+    ("ip ^= 111.", [False, False, False, False, True]),
+    ("url = /", [False, True, False, False, True]),
+    ("url ^= /index", [True, False, True, True, False]),
+    ("methode in (GET, POST)", [True, True, False, False, True]),
+    ('agent ~ "Mozilla|curl"', [False, False, False, False, False]),
+    ("referent != http://localhost/connexion.php", [False, False, False, False, False]),
+    ("protocole = HTTP/2.1", [False, False, True, True, True]),
+    ("date < 2025-03-05T16:59:59+01:00", [True, True, True, False, True]),
+    ("date >= 2025-03-05T15:59:50Z", [False, False, False, True, False]),
+    ("date = 2025-01-12T10:15:32", [True, False, False, False, False]),
+    ("ip = ::1 et methode = DELETE", [False, False, True, True, False]),
+    ("url = / ou code = 200", [True, True, False, False, True]),
+    ("non (ip = ::1 and code = 500)", [True, False, False, False, True]),
+    ("NOT url = / OR ip = ::1 AND methode = POST", [True, True, True, True, False]),
+    ('methode dans ("GET")', [True, False, False, False, True])
+]
+
+
+# Tests unitaires
+
+def test_expression_filtre_exception_type_invalide():
+    """
+    Vérifie que la classe renvoie une erreur lorsque l'expression n'est pas une chaîne
+    de caractères.
+
+    Scénarios testés:
+        - Expression sous forme d'un entier.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    with pytest.raises(TypeError):
+        ExpressionFiltre(500)
+
+@pytest.mark.parametrize("texte", [
+    "",
+    "code",
+    "code =",
+    "code = abc",
+    "code ^= 5",
+    "url < 5",
+    "inconnu = 1",
+    "ip = ::1 et",
+    "(ip = ::1",
+    "ip = ::1)",
+    "ip in ()",
+    "ip in (::1 ::2)",
+    "ip = 10.0.0.0/33",
+    "agent ~ \"(\"",
+    "date > hier",
+    "code = 500 code = 200",
+    "url = a\"b"
+])
+def test_expression_filtre_exception_invalide(texte):
+    """
+    Vérifie que l'analyse d'une expression invalide renvoie une erreur.
+
+    Scénarios testés:
+        - Expression vide ou incomplète.
+        - Valeur invalide pour le type du champ.
+        - Opérateur incompatible avec le champ, champ inconnu.
+        - Parenthèses ou ensembles mal formés.
+        - Réseau IP, expression régulière ou date invalide.
+        - Jetons en trop ou guillemet non fermé.
+
+    Asserts:
+        - Une exception :class:`ExpressionFiltreInvalideException` est levée.
+
+    Args:
+        texte (str): L'expression invalide.
+    """
+    with pytest.raises(ExpressionFiltreInvalideException):
+        ExpressionFiltre(texte)
+
+@pytest.mark.parametrize("texte, resultats_attendus", expressions_resultats)
+def test_expression_filtre_get_predicat(fichier_log_apache, texte, resultats_attendus):
+    """
+    Vérifie que la fonction compilée d'une expression retourne le résultat attendu
+    pour chaque entrée du fichier de test.
+
+    Scénarios testés:
+        - Chaque opérateur sur des champs textuels, entiers et sur la date.
+        - Classes de codes, réseaux IP, préfixes et expressions régulières.
+        - Valeurs absentes (agent et référent), qui ne satisfont aucune comparaison.
+        - Combinaisons avec ``et``, ``ou``, ``non`` et des parenthèses.
+
+    Asserts:
+        - Les résultats de la fonction sont égaux à ceux attendus.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        texte (str): L'expression.
+        resultats_attendus (list): Le résultat attendu pour chaque entrée.
+    """
+    predicat = ExpressionFiltre(texte).get_predicat()
+    assert [predicat(entree) for entree in fichier_log_apache.entrees] == resultats_attendus
+
+@pytest.mark.parametrize("texte, resultats_attendus", expressions_resultats)
+def test_expression_filtre_get_masque(fichier_log_apache, texte, resultats_attendus):
+    """
+    Vérifie que le masque vectorisé d'une expression est identique au résultat
+    de sa fonction compilée.
+
+    Scénarios testés:
+        - Les mêmes expressions que pour ``get_predicat`` sur le tableau des entrées
+          du fichier de test.
+
+    Asserts:
+        - Le masque est égal aux résultats attendus.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        texte (str): L'expression.
+        resultats_attendus (list): Le résultat attendu pour chaque entrée.
+    """
+    donnees = AnalyseurLogApachePandas.construit_donnees(fichier_log_apache)
+    assert ExpressionFiltre(texte).get_masque(donnees).tolist() == resultats_attendus
+
+def test_expression_filtre_conjonction(fichier_log_apache):
+    """
+    Vérifie la construction d'expressions sans analyse syntaxique.
+
+    Scénarios testés:
+        - Conjonction d'une égalité et d'une expression analysée.
+        - Conjonction vide.
+
+    Asserts:
+        - La conjonction retient les entrées satisfaisant les deux expressions.
+        - La conjonction vide retient toutes les entrées.
+        - La forme textuelle de la conjonction est une expression valide équivalente.
+    """
+    expression = ExpressionFiltre.conjonction([ExpressionFiltre.egalite("ip", "::1"),
+                                               ExpressionFiltre("url = /")])
+    predicat = expression.get_predicat()
+    assert [predicat(entree) for entree in fichier_log_apache.entrees] \
+        == [False, True, False, False, False]
+    predicat_texte = ExpressionFiltre(str(expression)).get_predicat()
+    assert [predicat_texte(entree) for entree in fichier_log_apache.entrees] \
+        == [False, True, False, False, False]
+    predicat_vide = ExpressionFiltre.conjonction([]).get_predicat()
+    assert all(predicat_vide(entree) for entree in fichier_log_apache.entrees)
+
+def test_expression_filtre_liste_ip_fichier(tmp_path, fichier_log_apache):
+    """
+    Vérifie le test d'appartenance des adresses IP à une liste lue depuis un fichier.
+
+    Scénarios testés:
+        - ``ip in @fichier`` avec et sans parenthèses, et sa négation.
+        - Fichier introuvable.
+        - Fichier existant alors que les fichiers ne sont pas autorisés.
+
+    Asserts:
+        - Les entrées retenues sont celles dont l'adresse appartient à la liste,
+          avec la fonction compilée comme avec le masque vectorisé.
+        - Une exception :class:`ExpressionFiltreInvalideException` est levée pour
+          le fichier introuvable et pour le fichier non autorisé.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+    """
+    fichier = tmp_path / "liste ip.txt"
+    fichier.write_text("192.168.0.0/16\n111.89.7.3\n")
+    donnees = AnalyseurLogApachePandas.construit_donnees(fichier_log_apache)
+    for texte, resultats_attendus in (
+        (f'ip in "@{fichier}"', [True, False, False, False, True]),
+        (f'ip in ("@{fichier}", ::1)', [True, True, True, True, True]),
+        (f'non ip = "@{fichier}"', [False, True, True, True, False])
+    ):
+        expression = ExpressionFiltre(texte)
+        predicat = expression.get_predicat()
+        assert [predicat(entree) for entree in fichier_log_apache.entrees] == resultats_attendus
+        assert expression.get_masque(donnees).tolist() == resultats_attendus
+    with pytest.raises(ExpressionFiltreInvalideException):
+        ExpressionFiltre(f"ip in @{tmp_path / 'absent.txt'}")
+    with pytest.raises(ExpressionFiltreInvalideException):
+        ExpressionFiltre(f'ip in "@{fichier}"', fichiers_autorises=False)
+
+@pytest.mark.parametrize("texte, contraintes_attendues", [
+    ("ip = ::1", {"ip": {"::1"}}),
+    ("ip = ::1 et code in (404, 500) et url ^= /api", {"ip": {"::1"}, "code": {404, 500}}),
+    ("methode in (GET, POST) et methode = GET", {"methode": {"GET"}}),
+    ("code = 5xx et ip = 10.0.0.0/8", {}),
+    ("ip = ::1 ou code = 500", {}),
+    ("non ip = ::1", {}),
+    ("ip != ::1", {})
+])
+def test_expression_filtre_get_contraintes_egalite(texte, contraintes_attendues):
+    """
+    Vérifie les valeurs exactes qu'une expression impose à ses champs.
+
+    Scénarios testés:
+        - Égalités et ensembles de valeurs reliés par ``et``.
+        - Même champ contraint deux fois.
+        - Classes de codes, réseaux, disjonctions et négations (aucune contrainte).
+
+    Asserts:
+        - Les contraintes sont égales à celles attendues.
+
+    Args:
+        texte (str): L'expression.
+        contraintes_attendues (dict): Les contraintes attendues.
+    """
+    assert ExpressionFiltre(texte).get_contraintes_egalite() == contraintes_attendues
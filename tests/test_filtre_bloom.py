@@ -0,0 +1,199 @@
+"""
+Module des tests unitaires pour le filtre de Bloom des clés déjà rencontrées.
+"""
+
+import pytest
+from analyse.filtre_bloom import FiltreBloom, FiltreBloomException
+
+
+# Tests unitaires
+
+def test_filtre_bloom_sans_faux_negatif():
+    """
+    Vérifie qu'une clé ajoutée est toujours retrouvée et qu'une clé est signalée comme
+    nouvelle une seule fois.
+
+    Scénarios testés:
+        - Ajout de mille clés, puis ajout répété de la première.
+
+    Asserts:
+        - Chaque clé ajoutée est contenue dans le filtre.
+        - Le second ajout d'une clé indique qu'elle était présente.
+        - Le nombre de clés ne compte pas les ajouts répétés.
+    """
+    filtre = FiltreBloom(1000, 0.01)
+    cles = [f"10.0.{numero // 256}.{numero % 256}" for numero in range(1000)]
+    for cle in cles:
+        filtre.ajoute(cle)
+    assert all(filtre.contient(cle) for cle in cles)
+    elements = filtre.nombre_elements
+    assert filtre.ajoute(cles[0]) is True
+    assert filtre.nombre_elements == elements
+
+def test_filtre_bloom_taux_faux_positifs():
+    """
+    Vérifie que le taux de faux positifs observé à pleine capacité reste proche de
+    celui visé, et que la mémoire est fixe.
+
+    Scénarios testés:
+        - Filtre de mille clés à 1 %, rempli puis interrogé avec dix mille clés
+          jamais ajoutées.
+
+    Asserts:
+        - La taille du filtre correspond à la formule optimale (environ 9,6 bits par
+          clé et 7 hachages).
+        - Moins de 2 % des clés jamais ajoutées sont signalées comme présentes.
+        - Le taux estimé est proche du taux visé.
+    """
+    filtre = FiltreBloom(1000, 0.01)
+    for numero in range(1000):
+        filtre.ajoute(f"/page/{numero}")
+    faux_positifs = sum(filtre.contient(f"/autre/{numero}") for numero in range(10000))
+    assert (filtre.taille_bits, filtre.nombre_hachages) == (9586, 7)
+    assert filtre.get_dict()["octets"] == 1199
+    assert faux_positifs < 200
+    assert filtre.get_taux_faux_positifs_estime() == pytest.approx(0.01, rel=0.1)
+
+def test_filtre_bloom_enregistrement(tmp_path):
+    """
+    Vérifie qu'un filtre enregistré puis relu est identique.
+
+    Scénarios testés:
+        - Filtre avec quelques clés enregistré dans un fichier.
+
+    Asserts:
+        - Les paramètres, le nombre de clés et les clés du filtre relu sont identiques.
+        - Aucun fichier temporaire ne reste dans le dossier.
+    """
+    filtre = FiltreBloom(100, 0.001)
+    for cle in ("::1", "10.0.0.1", "/index.html"):
+        filtre.ajoute(cle)
+    chemin = tmp_path / "filtre.bloom"
+    filtre.enregistre(str(chemin))
+    filtre_lu = FiltreBloom.charge(str(chemin))
+    assert filtre_lu.get_dict() == filtre.get_dict()
+    assert all(filtre_lu.contient(cle) for cle in ("::1", "10.0.0.1", "/index.html"))
+    assert filtre_lu.get_octets() == filtre.get_octets()
+    assert [fichier.name for fichier in tmp_path.iterdir()] == ["filtre.bloom"]
+
+def test_filtre_bloom_taux_tres_faible():
+    """
+    Vérifie qu'un filtre dont le taux de faux positifs demande plus de 255 fonctions
+    de hachage peut être enregistré puis relu.
+
+    Scénarios testés:
+        - Taux de faux positifs de ``1e-100``.
+
+    Asserts:
+        - Le nombre de hachages dépasse 255 et le filtre relu est identique.
+    """
+    filtre = FiltreBloom(10, 1e-100)
+    filtre.ajoute("/produit/1")
+    relu = FiltreBloom.depuis_octets(filtre.get_octets())
+    assert filtre.nombre_hachages > 255
+    assert relu.nombre_hachages == filtre.nombre_hachages
+    assert relu.contient("/produit/1")
+
+def test_filtre_bloom_lecture_version_1():
+    """
+    Vérifie qu'un filtre enregistré au format de la version 1 reste lisible.
+
+    Scénarios testés:
+        - En-tête de la version 1, dont le nombre de hachages est codé sur un octet.
+
+    Asserts:
+        - Le filtre relu contient les clés ajoutées.
+    """
+    filtre = FiltreBloom(100)
+    filtre.ajoute("10.0.0.1")
+    octets = FiltreBloom.ENTETES[1].pack(
+        FiltreBloom.SIGNATURE, 1, filtre.capacite, filtre.taux_faux_positifs,
+        filtre.taille_bits, filtre.nombre_hachages, filtre.nombre_elements
+    ) + filtre.get_octets()[FiltreBloom.ENTETE.size:]
+    relu = FiltreBloom.depuis_octets(octets)
+    assert relu.contient("10.0.0.1")
+    assert relu.nombre_elements == 1
+
+@pytest.mark.parametrize("alteration", [
+    lambda octets: octets[:10],
+    lambda octets: b"ABCD" + octets[4:],
+    lambda octets: octets[:4] + b"\x03" + octets[5:],
+    lambda octets: octets[:-1]
+])
+def test_filtre_bloom_exception_octets_invalides(alteration):
+    """
+    Vérifie qu'un filtre sérialisé invalide lève une ``FiltreBloomException``.
+
+    Scénarios testés:
+        - En-tête tronqué, signature inconnue, version non supportée ou tableau de
+          bits incomplet.
+
+    Asserts:
+        - Une exception :class:`FiltreBloomException` est levée.
+
+    Args:
+        alteration (Callable): La modification des octets d'un filtre valide.
+    """
+    with pytest.raises(FiltreBloomException):
+        FiltreBloom.depuis_octets(alteration(FiltreBloom(100).get_octets()))
+
+def test_filtre_bloom_exception_fichier_introuvable(tmp_path):
+    """
+    Vérifie qu'un fichier introuvable lève une ``FiltreBloomException``.
+
+    Scénarios testés:
+        - Lecture d'un fichier inexistant et écriture dans un dossier inexistant.
+
+    Asserts:
+        - Une exception :class:`FiltreBloomException` est levée.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    with pytest.raises(FiltreBloomException):
+        FiltreBloom.charge(str(tmp_path / "absent.bloom"))
+    with pytest.raises(FiltreBloomException):
+        FiltreBloom(100).enregistre(str(tmp_path / "absent" / "filtre.bloom"))
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"capacite": "10"}, TypeError),
+    ({"taux_faux_positifs": 1}, TypeError),
+    ({"capacite": 0}, ValueError),
+    ({"taux_faux_positifs": 0.0}, ValueError),
+    ({"taux_faux_positifs": 1.0}, ValueError),
+    ({"taux_faux_positifs": float("nan")}, ValueError)
+])
+def test_filtre_bloom_exception_parametres_invalides(parametres, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Capacité ou taux d'un type incorrect.
+        - Capacité nulle, taux nul, égal à 1 ou non numérique.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        parametres (dict): Les paramètres du constructeur.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        FiltreBloom(**parametres)
+
+def test_filtre_bloom_exception_cle_invalide():
+    """
+    Vérifie qu'une clé d'un type incorrect lève une ``TypeError``.
+
+    Scénarios testés:
+        - Clé entière ajoutée puis recherchée.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    filtre = FiltreBloom(100)
+    with pytest.raises(TypeError):
+        filtre.ajoute(12)
+    with pytest.raises(TypeError):
+        filtre.contient(12)
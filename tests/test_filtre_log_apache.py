@@ -3,6 +3,7 @@ Module des tests unitaires pour le filtre de log Apache.
 """
 
 import pytest
+from pandas import DataFrame
 from analyse.filtre_log_apache import FiltreLogApache
 
 
@@ -52,7 +53,10 @@ def test_filtre_log_entree_passe_filtre_type_invalide(filtre_log_apache):
 @pytest.mark.parametrize("filtre_adresse_ip, adresse_ip_entree, retour_attendu", [
     ("127.0.0.1", "127.0.0.1", True),
     ("127.0.0.2", "127.0.0.1", False),
-    ("127.0.0.1", "127.0.0.2", False)
+    ("127.0.0.1", "127.0.0.2", False),
+    ("127.0.0.0/8", "127.0.0.1", False),
+    ("127.0.0.0/8", "127.0.0.0/8", True),
+    ("@adresses.txt", "127.0.0.1", False)
 ])
 def test_filtre_log_entree_passe_filtre_adresse_ip_valide(filtre_log_apache,
                                                       entree_log_apache,
@@ -66,6 +70,7 @@ def test_filtre_log_entree_passe_filtre_adresse_ip_valide(filtre_log_apache,
     Scénarios testés:
         - L'adresse IP de l'entrée égale à celle du filtre.
         - L'adresse IP de l'entrée différente de celle du filtre.
+        - Un réseau CIDR ou une liste ``@chemin`` (inexistante), comparés tels quels.
 
     Asserts:
         - La méthode ``entree_passe_filtre`` est égale à ``retour_attendu``.
@@ -115,4 +120,127 @@ def test_filtre_log_entree_passe_filtre_code_statut_http_valide(filtre_log_apach
     """
     filtre_log_apache.code_statut_http = filtre_code_statut_http
     entree_log_apache.reponse.code_statut_http = code_statut_http_entree
-    assert filtre_log_apache.entree_passe_filtre(entree_log_apache) == retour_attendu
\ No newline at end of file
+    assert filtre_log_apache.entree_passe_filtre(entree_log_apache) == retour_attendu
+@pytest.mark.parametrize("definition, adresse_ip, code_statut_http", [
+    ({}, None, None),
+    ({"adresse_ip": "::1"}, "::1", None),
+    ({"code_statut_http": 404}, None, 404),
+    ({"adresse_ip": "::1", "code_statut_http": 500}, "::1", 500)
+])
+def test_filtre_log_depuis_dict_valide(definition, adresse_ip, code_statut_http):
+    """
+    Vérifie que ``depuis_dict`` crée un filtre conforme à sa définition.
+
+    Scénarios testés:
+        - Définitions avec aucune, une ou deux vérifications.
+
+    Asserts:
+        - Les vérifications du filtre sont égales à celles de la définition.
+        - ``get_dict_filtre`` retourne une définition équivalente.
+
+    Args:
+        definition (dict): La définition du filtre.
+        adresse_ip (Optional[str]): L'adresse IP attendue.
+        code_statut_http (Optional[int]): Le code de statut http attendu.
+    """
+    filtre = FiltreLogApache.depuis_dict(definition)
+    assert filtre.adresse_ip == adresse_ip
+    assert filtre.code_statut_http == code_statut_http
+    assert FiltreLogApache.depuis_dict(filtre.get_dict_filtre()).get_dict_filtre() \
+        == filtre.get_dict_filtre()
+
+@pytest.mark.parametrize("definition, exception", [
+    ([], TypeError),
+    ({"code_statut_http": "404"}, TypeError),
+    ({"url": "/"}, ValueError)
+])
+def test_filtre_log_depuis_dict_invalide(definition, exception):
+    """
+    Vérifie que ``depuis_dict`` renvoie une erreur lorsque la définition est invalide.
+
+    Scénarios testés:
+        - Définition qui n'est pas un dictionnaire.
+        - Valeur d'un type incorrect.
+        - Clé inconnue.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        definition (any): La définition du filtre.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        FiltreLogApache.depuis_dict(definition)
+
+@pytest.mark.parametrize("adresse_ip, code_statut_http, masque_attendu", [
+    (None, None, [True, True, True]),
+    ("::1", None, [True, False, True]),
+    (None, 500, [False, True, True]),
+    ("::1", 500, [False, False, True])
+])
+def test_filtre_log_get_masque(adresse_ip, code_statut_http, masque_attendu):
+    """
+    Vérifie que le masque vectorisé est identique au résultat de ``entree_passe_filtre``.
+
+    Scénarios testés:
+        - Aucune vérification, une seule vérification puis les deux vérifications.
+
+    Asserts:
+        - Le masque retourné est égal à celui attendu.
+
+    Args:
+        adresse_ip (Optional[str]): L'adresse IP du filtre.
+        code_statut_http (Optional[int]): Le code de statut http du filtre.
+        masque_attendu (list): Le masque attendu.
+    """
+    donnees = DataFrame({"ip": ["::1", "10.0.0.1", "::1"], "code": [200, 500, 500]})
+    filtre = FiltreLogApache(adresse_ip, code_statut_http)
+    assert filtre.get_masque(donnees).tolist() == masque_attendu
+
+def test_filtre_log_exception_get_masque_type_invalide():
+    """
+    Vérifie que ``get_masque`` renvoie une erreur lorsque les données ne sont pas
+    un DataFrame.
+
+    Scénarios testés:
+        - Données sous forme d'une liste.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    with pytest.raises(TypeError):
+        FiltreLogApache(None, None).get_masque([{"ip": "::1", "code": 200}])
+
+def test_filtre_log_expression(fichier_log_apache):
+    """
+    Vérifie que l'expression d'un filtre est combinée avec ses autres vérifications
+    et recompilée lorsqu'elle est modifiée.
+
+    Scénarios testés:
+        - Filtre avec une expression et un code de statut http.
+        - Modification de l'expression par son setter.
+        - Modification avec une expression invalide.
+
+    Asserts:
+        - Seules les entrées satisfaisant toutes les vérifications passent le filtre.
+        - Une exception :class:`ValueError` est levée pour l'expression invalide et
+          l'expression précédente est conservée.
+        - L'expression est présente dans ``get_dict_filtre``.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+    """
+    filtre = FiltreLogApache(None, 500, "url = /index.html")
+    entrees = fichier_log_apache.entrees
+    assert [filtre.entree_passe_filtre(entree) for entree in entrees] \
+        == [False, False, True, True, False]
+    filtre.expression = "methode = POST"
+    assert [filtre.entree_passe_filtre(entree) for entree in entrees] \
+        == [False, True, False, False, False]
+    with pytest.raises(ValueError):
+        filtre.expression = "methode = "
+    assert filtre.expression == "methode = POST"
+    assert filtre.get_dict_filtre()["expression"] == "methode = POST"
+    assert FiltreLogApache.depuis_dict({"expression": "code = 2xx"}).expression == "code = 2xx"
@@ -0,0 +1,169 @@
+"""
+Module des tests unitaires pour la fusion chronologique de plusieurs fichiers log.
+"""
+
+import pytest
+from parse.parseur_log_apache import ParseurLogApache, FormatLogApacheInvalideException
+from parse.fusion_chronologique import FusionChronologique
+
+
+# Fonctions utilitaires pour les tests unitaires
+
+def ecrit_log(chemin, secondes, hote="192.168.0.1"):
+    """
+    Écrit un fichier log dont les entrées ont les secondes indiquées.
+
+    Args:
+        chemin (Path): Le chemin du fichier.
+        secondes (list): Les secondes (après 10:00:00) des entrées, dans l'ordre du fichier.
+        hote (str): L'adresse IP des entrées.
+
+    Returns:
+        ParseurLogApache: Le parseur du fichier.
+    """
+    chemin.write_text("".join(
+        f'{hote} - - [12/Jan/2025:10:{seconde // 60:02d}:{seconde % 60:02d} +0000] '
+        f'"GET /{seconde} HTTP/1.1" 200 {seconde}\n'
+        for seconde in secondes
+    ))
+    return ParseurLogApache(str(chemin))
+
+def secondes_entrees(entrees):
+    """
+    Retourne les secondes (après 10:00:00) des entrées.
+
+    Args:
+        entrees (Iterable): Les entrées.
+
+    Returns:
+        list: Les secondes des entrées.
+    """
+    return [entree.requete.horodatage.minute * 60 + entree.requete.horodatage.second
+            for entree in entrees]
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("parseurs, taille_tampon, exception", [
+    ("access.log", 10, TypeError),
+    (["access.log"], 10, TypeError),
+    ([], 10, ValueError),
+    (None, "10", TypeError),
+    (None, -1, ValueError)
+])
+def test_fusion_exception_parametres_invalides(tmp_path, parseurs, taille_tampon, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Parseurs ou taille du tampon d'un type incorrect.
+        - Aucun parseur ou taille du tampon négative.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        parseurs (any): Les parseurs (``None`` pour un parseur valide).
+        taille_tampon (any): La taille du tampon de réordonnancement.
+        exception (type): L'exception attendue.
+    """
+    if parseurs is None:
+        parseurs = [ecrit_log(tmp_path / "access.log", [0])]
+    with pytest.raises(exception):
+        FusionChronologique(parseurs, taille_tampon)
+
+def test_fusion_entrees_ordonnees(tmp_path):
+    """
+    Vérifie que les entrées de plusieurs fichiers sont fusionnées dans l'ordre
+    chronologique.
+
+    Scénarios testés:
+        - Trois fichiers ordonnés qui s'entrecroisent, dont un vide.
+
+    Asserts:
+        - Les entrées sont émises dans l'ordre chronologique.
+        - Le nombre d'entrées de chaque fichier est compté, sans entrée désordonnée.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    fusion = FusionChronologique([ecrit_log(tmp_path / "a.log", [0, 3, 4, 9]),
+                                  ecrit_log(tmp_path / "b.log", [1, 2, 8]),
+                                  ecrit_log(tmp_path / "c.log", [])])
+    assert secondes_entrees(fusion) == [0, 1, 2, 3, 4, 8, 9]
+    assert fusion.totaux == [4, 3, 0]
+    assert fusion.entrees_desordonnees == 0
+
+def test_fusion_egalite_ordre_fichiers(tmp_path):
+    """
+    Vérifie que les entrées de même horodatage sont émises dans l'ordre des fichiers.
+
+    Scénarios testés:
+        - Deux fichiers avec des entrées à la même seconde.
+
+    Asserts:
+        - Les entrées du premier fichier précèdent celles du second.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    fusion = FusionChronologique([ecrit_log(tmp_path / "a.log", [5, 5], "10.0.0.1"),
+                                  ecrit_log(tmp_path / "b.log", [5], "10.0.0.2")])
+    assert [entree.client.adresse_ip for entree in fusion] == ["10.0.0.1", "10.0.0.1",
+                                                               "10.0.0.2"]
+
+@pytest.mark.parametrize("taille_tampon, secondes_attendues, desordonnees", [
+    (0, [0, 1, 5, 3, 4, 6, 9, 7, 10], 3),
+    (2, [0, 1, 3, 4, 5, 6, 7, 9, 10], 0)
+])
+def test_fusion_tampon_reordonnancement(tmp_path, taille_tampon, secondes_attendues,
+                                        desordonnees):
+    """
+    Vérifie que le tampon de réordonnancement remet dans l'ordre les entrées
+    légèrement désordonnées d'un fichier.
+
+    Scénarios testés:
+        - Fichier désordonné, sans tampon puis avec un tampon suffisant.
+
+    Asserts:
+        - Les entrées sont émises dans l'ordre attendu.
+        - Les entrées émises hors ordre sont comptées.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        taille_tampon (int): La taille du tampon de réordonnancement.
+        secondes_attendues (list): Les secondes des entrées dans l'ordre attendu.
+        desordonnees (int): Le nombre d'entrées désordonnées attendu.
+    """
+    fusion = FusionChronologique([ecrit_log(tmp_path / "a.log", [0, 5, 3, 4, 9, 7]),
+                                  ecrit_log(tmp_path / "b.log", [1, 6, 10])],
+                                 taille_tampon)
+    assert secondes_entrees(fusion) == secondes_attendues
+    assert fusion.entrees_desordonnees == desordonnees
+
+def test_fusion_lecture_en_flux(tmp_path):
+    """
+    Vérifie que les fichiers sont lus en flux : une entrée est émise avant la
+    lecture de la fin des fichiers.
+
+    Scénarios testés:
+        - Fichier dont la dernière ligne est invalide.
+
+    Asserts:
+        - Les premières entrées sont émises.
+        - L'entrée invalide lève une ``FormatLogApacheInvalideException`` une fois
+          atteinte.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin = tmp_path / "a.log"
+    ecrit_log(chemin, [0, 1, 2])
+    with open(chemin, "a", encoding="utf-8") as fichier:
+        fichier.write("ligne invalide\n")
+    entrees = iter(FusionChronologique([ParseurLogApache(str(chemin))], 0))
+    assert secondes_entrees([next(entrees), next(entrees)]) == [0, 1]
+    with pytest.raises(FormatLogApacheInvalideException, match="ligne 4"):
+        list(entrees)
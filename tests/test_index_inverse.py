@@ -0,0 +1,124 @@
+"""
+Module des tests unitaires pour les index inversés des entrées d'un fichier log Apache.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.index_inverse import IndexInverseEntrees
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("fichier, champs, exception", [
+    ("access.log", ("ip",), TypeError),
+    (None, ["ip"], TypeError),
+    (None, ("ip", "agent"), ValueError)
+])
+def test_index_inverse_exception_parametres_invalides(fichier_log_apache,
+                                                      fichier,
+                                                      champs,
+                                                      exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Fichier qui n'est pas un :class:`FichierLogApache`.
+        - Champs qui ne sont pas dans un tuple.
+        - Champ qui ne peut pas être indexé.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        fichier (any): Le fichier à indexer (``None`` pour le fichier de test).
+        champs (any): Les champs à indexer.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        IndexInverseEntrees(fichier if fichier is not None else fichier_log_apache, champs)
+
+@pytest.mark.parametrize("contraintes, identifiants_attendus", [
+    ({}, None),
+    ({"url": {"/"}}, None),
+    ({"ip": {"::1"}}, [1, 2, 3]),
+    ({"code": {500}}, [1, 2, 3, 4]),
+    ({"ip": {"::1"}, "code": {500}, "methode": {"DELETE"}}, [2, 3]),
+    ({"ip": {"::1", "192.168.1.1"}}, [0, 1, 2, 3]),
+    ({"ip": {"::1"}, "code": {200}}, []),
+    ({"ip": {"10.0.0.1"}, "code": {500}}, [])
+])
+def test_index_inverse_get_identifiants(fichier_log_apache, contraintes, identifiants_attendus):
+    """
+    Vérifie les identifiants des entrées trouvés par les index pour des contraintes
+    d'égalité.
+
+    Scénarios testés:
+        - Aucune contrainte, ou contrainte sur un champ non indexé.
+        - Contrainte sur un seul champ, avec une ou plusieurs valeurs.
+        - Intersection de contraintes sur plusieurs champs.
+        - Intersection vide et valeur absente du fichier.
+
+    Asserts:
+        - Les identifiants sont égaux à ceux attendus.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        contraintes (dict): Les contraintes d'égalité.
+        identifiants_attendus (Optional[list]): Les identifiants attendus.
+    """
+    identifiants = IndexInverseEntrees(fichier_log_apache).get_identifiants(contraintes)
+    if identifiants_attendus is None:
+        assert identifiants is None
+    else:
+        assert identifiants.tolist() == identifiants_attendus
+
+@pytest.mark.parametrize("filtre", [
+    FiltreLogApache(None, None),
+    FiltreLogApache("::1", None),
+    FiltreLogApache("::1", 500, "url = /index.html"),
+    FiltreLogApache(None, None, "code in (200, 500) et taille < 100"),
+    FiltreLogApache(None, None, "ip = ::1 ou methode = GET"),
+    FiltreLogApache(None, 404)
+])
+def test_index_inverse_get_entrees_filtre(fichier_log_apache, filtre):
+    """
+    Vérifie que les entrées obtenues depuis les index sont celles qui passent le filtre,
+    dans l'ordre du fichier.
+
+    Scénarios testés:
+        - Filtres résolus par les index, complétés par une vérification des candidates,
+          ou non indexables (disjonction).
+
+    Asserts:
+        - Les entrées sont identiques à celles obtenues en vérifiant tout le fichier.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        filtre (FiltreLogApache): Le filtre appliqué.
+    """
+    attendues = [entree for entree in fichier_log_apache.entrees
+                 if filtre.entree_passe_filtre(entree)]
+    assert IndexInverseEntrees(fichier_log_apache).get_entrees_filtre(filtre) == attendues
+
+def test_index_inverse_exception_get_entrees_filtre_type_invalide(fichier_log_apache):
+    """
+    Vérifie que ``get_entrees_filtre`` renvoie une erreur lorsque le filtre n'est pas
+    un :class:`FiltreLogApache`.
+
+    Scénarios testés:
+        - Filtre sous forme d'un dictionnaire.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+    """
+    with pytest.raises(TypeError):
+        IndexInverseEntrees(fichier_log_apache).get_entrees_filtre({"adresse_ip": "::1"})
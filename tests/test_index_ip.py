@@ -0,0 +1,142 @@
+"""
+Module des tests unitaires pour l'index d'appartenance d'adresses IP.
+"""
+
+import pytest
+from random import Random
+from ipaddress import ip_address, ip_network
+from analyse.index_ip import IndexIP
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("reseaux, exception", [
+    ("10.0.0.0/8", TypeError),
+    (["10.0.0.0/33"], ValueError),
+    (["pas une adresse"], ValueError),
+    ([8], ValueError)
+])
+def test_index_ip_exception_parametres_invalides(reseaux, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les réseaux sont invalides.
+
+    Scénarios testés:
+        - Réseaux qui ne sont pas dans une liste.
+        - Réseau CIDR, adresse ou type invalide dans la liste.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        reseaux (any): Les réseaux de l'index.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        IndexIP(reseaux)
+
+@pytest.mark.parametrize("adresse, retour_attendu", [
+    ("10.1.2.3", True),
+    ("11.0.0.0", True),
+    ("11.0.0.255", True),
+    ("11.0.1.0", False),
+    ("9.255.255.255", False),
+    ("192.168.1.1", True),
+    ("192.168.1.2", False),
+    ("::1", True),
+    ("2001:db8::42", True),
+    ("2001:db9::", False),
+    ("::ffff:10.0.0.1", True),
+    ("adresse invalide", False)
+])
+def test_index_ip_contient(adresse, retour_attendu):
+    """
+    Vérifie l'appartenance d'adresses IPv4 et IPv6 à l'index.
+
+    Scénarios testés:
+        - Adresses aux bornes de réseaux qui se touchent (fusionnés).
+        - Adresses seules et réseaux IPv6.
+        - Adresse IPv4 encapsulée dans une IPv6.
+        - Adresse invalide.
+
+    Asserts:
+        - ``contient`` et l'opérateur ``in`` retournent le résultat attendu, deux
+          fois de suite (avec le cache).
+
+    Args:
+        adresse (str): L'adresse testée.
+        retour_attendu (bool): Le résultat attendu.
+    """
+    index = IndexIP(["10.0.0.0/8", "11.0.0.0/24", "192.168.1.1", "::1",
+                     ip_network("2001:db8::/32")])
+    assert index.contient(adresse) == retour_attendu
+    assert (adresse in index) == retour_attendu
+
+def test_index_ip_fusion_intervalles():
+    """
+    Vérifie que les réseaux qui se chevauchent ou se touchent sont fusionnés.
+
+    Scénarios testés:
+        - Réseaux inclus les uns dans les autres et réseaux contigus.
+
+    Asserts:
+        - L'index ne contient qu'un intervalle IPv4 et un intervalle IPv6.
+        - Le nombre de réseaux ajoutés est conservé.
+    """
+    index = IndexIP(["10.0.0.0/24", "10.0.0.128/25", "10.0.1.0/24", "10.0.0.7",
+                     "fe80::/64", "fe80::1"])
+    assert len(index) == 2
+    assert index.total_reseaux == 6
+
+def test_index_ip_identique_recherche_lineaire():
+    """
+    Vérifie que l'index donne le même résultat qu'un test linéaire de chaque réseau
+    sur une grande liste aléatoire.
+
+    Scénarios testés:
+        - 2000 réseaux IPv4 aléatoires de tailles variées et 2000 adresses testées.
+
+    Asserts:
+        - Les résultats de l'index et du test linéaire sont identiques.
+    """
+    aleatoire = Random(3)
+    reseaux = [ip_network(f"{aleatoire.randint(1, 223)}.{aleatoire.randint(0, 255)}."
+                          f"{aleatoire.randint(0, 255)}.0/{aleatoire.randint(16, 30)}",
+                          strict=False)
+               for _ in range(2000)]
+    intervalles = [(int(reseau.network_address), int(reseau.broadcast_address))
+                   for reseau in reseaux]
+    index = IndexIP(reseaux)
+    for _ in range(2000):
+        valeur = aleatoire.randint(0, 2 ** 32 - 1)
+        attendu = any(debut <= valeur <= fin for debut, fin in intervalles)
+        assert index.contient(str(ip_address(valeur))) == attendu
+
+def test_index_ip_depuis_fichier(tmp_path):
+    """
+    Vérifie la lecture d'un index depuis un fichier texte.
+
+    Scénarios testés:
+        - Fichier avec des commentaires et des lignes vides.
+        - Fichier avec une ligne invalide.
+        - Fichier introuvable.
+
+    Asserts:
+        - L'index contient les réseaux du fichier.
+        - Une exception :class:`ValueError` indiquant la ligne invalide est levée.
+        - Une exception :class:`OSError` est levée pour le fichier introuvable.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    fichier = tmp_path / "liste.txt"
+    fichier.write_text("# Robots connus\n\n66.249.64.0/19  # Googlebot\n::1\n")
+    index = IndexIP.depuis_fichier(str(fichier))
+    assert index.total_reseaux == 2
+    assert "66.249.70.1" in index
+    assert "66.249.96.1" not in index
+
+    fichier.write_text("10.0.0.0/8\n10.0.0.300\n")
+    with pytest.raises(ValueError, match="Ligne 2"):
+        IndexIP.depuis_fichier(str(fichier))
+    with pytest.raises(OSError):
+        IndexIP.depuis_fichier(str(tmp_path / "absent.txt"))
@@ -0,0 +1,101 @@
+"""
+Module des tests unitaires pour la lecture non bloquante d'un tube.
+"""
+
+import os
+import pytest
+from serveur.lecteur_tube import LecteurTube
+
+
+# Fonctions utilitaires
+
+def lit_tube(donnees: bytes, taille_tampon: int = 100) -> LecteurTube:
+    """
+    Écrit des données dans un tube, le ferme puis attend que le lecteur ait lu
+    tout le flux.
+
+    Args:
+        donnees (bytes): Les données écrites dans le tube.
+        taille_tampon (int): La taille du tampon du lecteur.
+
+    Returns:
+        LecteurTube: Le lecteur, dont le flux est entièrement lu.
+    """
+    lecture, ecriture = os.pipe()
+    lecteur = LecteurTube(lecture, taille_tampon)
+    lecteur.demarre()
+    os.write(ecriture, donnees)
+    os.close(ecriture)
+    lecteur._thread_lecture.join(timeout=5)
+    os.close(lecture)
+    return lecteur
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("descripteur, taille_tampon, exception", [
+    ("0", 10, TypeError),
+    (0, 1.5, TypeError),
+    (0, 0, ValueError)
+])
+def test_lecteur_tube_exception_parametres_invalides(descripteur, taille_tampon, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Descripteur ou taille de tampon d'un type incorrect.
+        - Taille de tampon nulle.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        descripteur (any): Le descripteur de fichier.
+        taille_tampon (any): La taille du tampon.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        LecteurTube(descripteur, taille_tampon)
+
+def test_lecteur_tube_lignes():
+    """
+    Vérifie que les lignes du flux sont retirées dans l'ordre, y compris la dernière
+    ligne sans retour à la ligne.
+
+    Scénarios testés:
+        - Flux avec des lignes vides, une fin de ligne Windows et un caractère
+          invalide en UTF-8.
+
+    Asserts:
+        - Les lignes non vides sont retirées dans l'ordre.
+        - Le flux est terminé une fois toutes les lignes retirées.
+    """
+    lecteur = lit_tube(b"ligne 1\n\nligne 2\r\nligne \xff\nderniere")
+    assert not lecteur.est_termine()
+    assert lecteur.recupere_lignes(nombre_max=2) == ["ligne 1", "ligne 2"]
+    assert lecteur.recupere_lignes() == ["ligne �", "derniere"]
+    assert lecteur.recupere_lignes(delai=0.01) == []
+    assert lecteur.est_termine()
+    assert lecteur.get_lignes_perdues() == 0
+
+def test_lecteur_tube_lignes_perdues():
+    """
+    Vérifie que les lignes sont perdues et comptées plutôt que de bloquer la lecture
+    lorsque le tampon est plein ou qu'une ligne est trop longue.
+
+    Scénarios testés:
+        - Cinq lignes reçues avec un tampon de deux lignes.
+        - Ligne plus longue que la longueur maximale.
+
+    Asserts:
+        - Seules les premières lignes sont conservées et les autres sont comptées.
+    """
+    lecteur = lit_tube(b"1\n2\n3\n4\n5\n")
+    assert lecteur.recupere_lignes() == ["1", "2", "3", "4", "5"]
+    lecteur = lit_tube(b"1\n2\n3\n4\n5\n", taille_tampon=2)
+    assert lecteur.recupere_lignes() == ["1", "2"]
+    assert lecteur.get_lignes_perdues() == 3
+    lecteur = lit_tube(b"a" * (LecteurTube.LONGUEUR_MAX_LIGNE * 3) + b"\nfin\n")
+    assert lecteur.recupere_lignes() == ["fin"]
+    assert lecteur.get_lignes_perdues() == 1
@@ -2,11 +2,23 @@
 Module des tests unitaires pour le point d'entrée de l'application.
 """
 
+import json
+import signal
+import sqlite3
 import pytest
+from threading import Thread
 from main import main
 from cli.parseur_arguments_cli import ArgumentCLIException
 from parse.parseur_log_apache import FormatLogApacheInvalideException
 from export.exporteur import ExportationException
+from analyse.etat_partiel_analyse import EtatPartielException
+from serveur.coordinateur import ExecutionDistribueeException
+from serveur.travailleur import Travailleur
+from analyse.classificateur_agents import ReglesAgentsException
+from analyse.detecteur_attaques import SignaturesAttaquesException
+from analyse.filtre_bloom import FiltreBloomException
+from analyse.entrepot_agregats import EntrepotAgregatsException
+from serveur.serveur_requetes import DemarrageServeurException
 
 
 @pytest.mark.parametrize(
@@ -15,6 +27,13 @@ from export.exporteur import ExportationException
         (ArgumentCLIException),
         (FormatLogApacheInvalideException),
         (ExportationException),
+        (EtatPartielException),
+        (ExecutionDistribueeException),
+        (ReglesAgentsException),
+        (SignaturesAttaquesException),
+        (FiltreBloomException),
+        (EntrepotAgregatsException),
+        (DemarrageServeurException),
         (TypeError),
         (ValueError),
     ],
@@ -49,7 +68,9 @@ def test_main_succes(mocker):
     # Mock des classes pour simuler un fonctionnement correct
     mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
     mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
-        chemin_log="test.log"
+        chemin_log="test.log", filtres=[], pipe=False, sessions=False, abus=False, slo=False,
+        agents=False, attaques=False, arborescence=False, navigation=False, nouveautes=False,
+        entrepot=None, sqlite=False, normalise_urls=False, routes=[], logs_supplementaires=[]
     )
 
     mocker.patch("main.FiltreLogApache")
@@ -69,3 +90,905 @@ def test_main_succes(mocker):
         main()
     except Exception:
         pytest.fail("Aucune exception ne doit être levée ici")
+
+
+@pytest.mark.parametrize("index", [False, True])
+def test_main_multi_filtres_succes(mocker, index):
+    """
+    Vérifie le fonctionnement du fichier principal lors d'une analyse multi-filtres.
+
+    Scénarios testés:
+        - Analyse avec deux filtres passés en ligne de commande, avec et sans
+          index inversés.
+
+    Asserts:
+        - Un seul parsage du fichier log est effectué.
+        - L'analyseur multi-filtres reçoit un filtre par définition.
+        - Les index inversés ne sont transmis que s'ils sont demandés.
+        - Les analyses sont exportées dans un seul fichier JSON.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        index (bool): Indique si l'option ``--index`` est activée.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log="test.log",
+        pipe=False, sessions=False, abus=False, slo=False, agents=False, attaques=False,
+        arborescence=False, navigation=False, nouveautes=False, normalise_urls=False, routes=[],
+        entrepot=None, sqlite=False, logs_supplementaires=[],
+        filtres=[{"code_statut_http": 404}, {"adresse_ip": "::1"}],
+        camembert=False,
+        index=index
+    )
+    mock_parseur_log = mocker.patch("main.ParseurLogApache")
+    mock_index = mocker.patch("main.IndexInverseEntrees")
+    mock_multi_filtres = mocker.patch("main.AnalyseurMultiFiltres")
+    mock_multi_filtres.return_value.get_analyses_completes.return_value = {"analyses": []}
+    mock_exporteur = mocker.patch("main.Exporteur")
+
+    main()
+
+    mock_parseur_log.return_value.parse_fichier.assert_called_once()
+    filtres = mock_multi_filtres.call_args.args[1]
+    assert [filtre.get_dict_filtre() for filtre in filtres] == [
+        {"adresse_ip": None, "code_statut_http": 404, "expression": None},
+        {"adresse_ip": "::1", "code_statut_http": None, "expression": None}
+    ]
+    assert mock_multi_filtres.call_args.kwargs["index"] \
+        == (mock_index.return_value if index else None)
+    mock_exporteur.return_value.export_vers_json.assert_called_once_with(
+        {"analyses": []}, "analyses-log-apache.json"
+    )
+
+
+def test_main_moteur_pandas(mocker):
+    """
+    Vérifie que le fichier principal utilise l'analyseur vectorisé lorsque le moteur
+    ``pandas`` est demandé.
+
+    Scénarios testés:
+        - Analyse simple avec l'option ``--moteur pandas``.
+
+    Asserts:
+        - L'analyseur pandas est utilisé à la place de l'analyseur Python.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log="test.log", filtres=[], pipe=False, sessions=False, abus=False, slo=False,
+        agents=False, attaques=False, arborescence=False, navigation=False, nouveautes=False,
+        entrepot=None, sqlite=False, normalise_urls=False, routes=[], logs_supplementaires=[],
+        moteur="pandas", camembert=False
+    )
+    mocker.patch("main.FiltreLogApache")
+    mocker.patch("main.ParseurLogApache")
+    mock_analyseur_log = mocker.patch("main.AnalyseurLogApache")
+    mock_analyseur_pandas = mocker.patch("main.AnalyseurLogApachePandas")
+    mock_analyseur_pandas.return_value.get_analyse_complete.return_value = {}
+    mocker.patch("main.Exporteur")
+
+    main()
+
+    mock_analyseur_pandas.assert_called_once()
+    mock_analyseur_log.assert_not_called()
+
+
+def test_main_fusionner(mocker):
+    """
+    Vérifie que le fichier principal fusionne les états partiels avec la commande
+    ``fusionner`` sans parser de fichier log.
+
+    Scénarios testés:
+        - Commande ``fusionner`` avec deux états partiels.
+
+    Asserts:
+        - Les états partiels sont fusionnés dans l'ordre.
+        - Aucun fichier log n'est parsé.
+        - L'analyse fusionnée est exportée.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        commande="fusionner", etats=["etat-1.json", "etat-2.json"], camembert=False
+    )
+    mock_parseur_log = mocker.patch("main.ParseurLogApache")
+    mock_etat_partiel = mocker.patch("main.EtatPartielAnalyse")
+    mock_etat_partiel.fusionne_fichiers.return_value.get_analyse_complete.return_value = {}
+    mock_exporteur = mocker.patch("main.Exporteur")
+
+    main()
+
+    mock_etat_partiel.fusionne_fichiers.assert_called_once_with(["etat-1.json", "etat-2.json"])
+    mock_parseur_log.assert_not_called()
+    mock_exporteur.return_value.export_vers_json.assert_called_once_with(
+        {}, "analyse-log-apache.json"
+    )
+
+
+def test_main_servir(mocker):
+    """
+    Vérifie que le fichier principal charge les fichiers log une seule fois puis
+    démarre le serveur avec la commande ``servir``.
+
+    Scénarios testés:
+        - Commande ``servir`` avec deux fichiers log, interrompue par Ctrl+C.
+
+    Asserts:
+        - Chaque fichier log est parsé une seule fois.
+        - Le serveur est créé avec l'adresse et le port demandés, démarré puis fermé.
+        - Aucune analyse n'est exportée.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        commande="servir", logs=["access-1.log", "access-2.log"], hote="127.0.0.1", port=9000
+    )
+    mock_parseur_log = mocker.patch("main.ParseurLogApache")
+    mock_serveur_requetes = mocker.patch("main.ServeurRequetes")
+    mock_serveur = mock_serveur_requetes.return_value.cree_serveur_http.return_value
+    mock_serveur.server_address = ("127.0.0.1", 9000)
+    mock_serveur.serve_forever.side_effect = KeyboardInterrupt
+    mock_exporteur = mocker.patch("main.Exporteur")
+
+    main()
+
+    assert [appel.args for appel in mock_parseur_log.call_args_list] \
+        == [("access-1.log",), ("access-2.log",)]
+    mock_serveur_requetes.return_value.cree_serveur_http.assert_called_once_with(
+        "127.0.0.1", 9000
+    )
+    mock_serveur.serve_forever.assert_called_once()
+    mock_serveur.server_close.assert_called_once()
+    mock_exporteur.assert_not_called()
+
+
+def test_main_surveille(mocker):
+    """
+    Vérifie que le fichier principal démarre l'ingestion continue et le serveur de
+    métriques avec la commande ``surveiller``, puis les arrête proprement.
+
+    Scénarios testés:
+        - Commande ``surveiller`` sur un répertoire, interrompue par Ctrl+C.
+
+    Asserts:
+        - Le suivi du répertoire et le démon sont créés avec les options demandées.
+        - L'ingestion est démarrée puis arrêtée, et le serveur est fermé.
+        - Aucune analyse n'est exportée.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        commande="surveiller", repertoire="logs/", motif="*.log", depuis_debut=False,
+        intervalle=0.5, hote="127.0.0.1", port=9100
+    )
+    mock_suivi = mocker.patch("main.SuiviRepertoireLogs")
+    mock_metriques = mocker.patch("main.MetriquesPrometheus")
+    mock_demon = mocker.patch("main.DemonMetriques")
+    mock_serveur = mock_demon.return_value.cree_serveur_http.return_value
+    mock_serveur.server_address = ("127.0.0.1", 9100)
+    mock_serveur.serve_forever.side_effect = KeyboardInterrupt
+    mock_exporteur = mocker.patch("main.Exporteur")
+
+    main()
+
+    mock_suivi.assert_called_once_with("logs/", "*.log", False)
+    mock_demon.assert_called_once_with(mock_suivi.return_value,
+                                       mock_metriques.return_value, 0.5)
+    mock_demon.return_value.cree_serveur_http.assert_called_once_with("127.0.0.1", 9100)
+    mock_demon.return_value.demarre_ingestion.assert_called_once()
+    mock_demon.return_value.arrete_ingestion.assert_called_once()
+    mock_serveur.server_close.assert_called_once()
+    mock_exporteur.assert_not_called()
+
+
+def test_main_analyse_tube(mocker, tmp_path):
+    """
+    Vérifie que le fichier principal analyse en continu les lignes reçues avec
+    l'option ``--pipe`` et exporte l'analyse à la fin du flux.
+
+    Scénarios testés:
+        - Flux contenant une ligne valide et une ligne invalide, puis terminé.
+
+    Asserts:
+        - L'analyse exportée compte l'entrée, la ligne invalide et les lignes perdues.
+        - Les gestionnaires de signaux sont restaurés après l'analyse.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        commande="analyser", pipe=True, ip=None, code_statut_http=None, expression=None,
+        granularite="heure", sortie=str(tmp_path), intervalle_export=60.0, camembert=False,
+        abus=False, slo=False, agents=False, attaques=False,
+        arborescence=False, navigation=False, nouveautes=False, entrepot=None, sqlite=False,
+        normalise_urls=False, routes=[]
+    )
+    mocker.patch("main.sys")
+    mock_lecteur = mocker.patch("main.LecteurTube")
+    mock_lecteur.return_value.est_termine.side_effect = [False, True]
+    mock_lecteur.return_value.recupere_lignes.return_value = [
+        '::1 - - [05/Mar/2025:16:59:43 +0100] "GET / HTTP/1.1" 404 20',
+        "ligne invalide"
+    ]
+    mock_lecteur.return_value.get_lignes_perdues.return_value = 2
+    mock_exporteur = mocker.patch("main.Exporteur")
+    gestionnaire_sigterm = signal.getsignal(signal.SIGTERM)
+
+    main()
+
+    mock_lecteur.return_value.demarre.assert_called_once()
+    analyse, nom_fichier = mock_exporteur.return_value.export_vers_json.call_args.args
+    assert nom_fichier == "analyse-flux-log-apache.json"
+    assert analyse["total_entrees"] == 1
+    assert analyse["flux"]["lignes_invalides"] == 1
+    assert analyse["flux"]["lignes_perdues"] == 2
+    assert signal.getsignal(signal.SIGTERM) == gestionnaire_sigterm
+
+
+def test_main_coordonne(mocker, log_apache, tmp_path):
+    """
+    Vérifie que le fichier principal distribue l'analyse aux travailleurs locaux
+    avec la commande ``coordonner``, puis exporte l'analyse fusionnée.
+
+    Scénarios testés:
+        - Commande ``coordonner`` sur un fichier découpé en plusieurs tâches, avec
+          deux travailleurs locaux (simulés par des threads).
+
+    Asserts:
+        - Les travailleurs sont lancés avec l'adresse et le port du coordinateur,
+          puis arrêtés et attendus.
+        - L'analyse exportée compte toutes les entrées du fichier.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        commande="coordonner", logs=[str(log_apache(True))], sortie=str(tmp_path),
+        ip=None, code_statut_http=None, expression=None, granularite="heure",
+        groupements=[], normalise_urls=True, routes=[], taille_tache=0.0002, travailleurs=2,
+        hote="127.0.0.1", port=0, camembert=False
+    )
+
+    travailleurs = []
+
+    def lance_travailleur(commande, **_):
+        """
+        Simule le lancement d'un travailleur local par un thread.
+        """
+        Thread(target=Travailleur(commande[-3], int(commande[-1])).execute,
+               daemon=True).start()
+        processus = mocker.MagicMock()
+        processus.__enter__.return_value = processus
+        processus.poll.return_value = None
+        travailleurs.append(processus)
+        return processus
+
+    mock_popen = mocker.patch("main.subprocess.Popen", side_effect=lance_travailleur)
+
+    main()
+
+    assert mock_popen.call_count == 2
+    assert mock_popen.call_args[0][0][2:5] == ["travailler", "--hote", "127.0.0.1"]
+    assert all(processus.terminate.called for processus in travailleurs)
+    assert all(processus.__exit__.called for processus in travailleurs)
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())
+    assert analyse["total_entrees"] == 5
+    assert analyse["chemins"] == [str(log_apache(True).resolve())]
+
+
+def test_main_erreurs_systeme(mocker):
+    """
+    Vérifie que seules les erreurs d'ouverture du port d'un serveur sont présentées
+    comme des erreurs de démarrage du serveur.
+
+    Scénarios testés:
+        - Commande ``servir`` dont le port est déjà utilisé.
+        - Commande ``travailler`` dont le coordinateur est injoignable.
+        - Erreur système en dehors d'un serveur.
+
+    Asserts:
+        - Les deux premières erreurs sont interceptées et affichées avec leur message.
+        - L'erreur système en dehors d'un serveur n'est pas interceptée.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_gestion_exception = mocker.patch("main.gestion_exception")
+    mocker.patch("main.ParseurLogApache")
+    mock_serveur_requetes = mocker.patch("main.ServeurRequetes")
+    mock_serveur_requetes.return_value.cree_serveur_http.side_effect = OSError("utilisé")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        commande="servir", logs=["access.log"], hote="127.0.0.1", port=9000
+    )
+    main()
+    assert mock_gestion_exception.call_args[0][1] == "Erreur lors du démarrage du serveur !"
+    assert isinstance(mock_gestion_exception.call_args[0][2], DemarrageServeurException)
+
+    mocker.patch("main.Travailleur").return_value.execute.side_effect = \
+        ConnectionRefusedError("refusée")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        commande="travailler", hote="10.0.0.1", port=9600
+    )
+    main()
+    assert mock_gestion_exception.call_args[0][1] == "Erreur dans l'analyse distribuée !"
+
+    mock_parseur_cli.return_value.parse_args.side_effect = PermissionError("refusé")
+    with pytest.raises(PermissionError):
+        main()
+
+def test_main_travaille(mocker):
+    """
+    Vérifie que le fichier principal traite les tâches d'un coordinateur avec la
+    commande ``travailler``.
+
+    Scénarios testés:
+        - Commande ``travailler`` avec l'adresse et le port du coordinateur.
+
+    Asserts:
+        - Le travailleur est créé avec l'adresse et le port demandés puis exécuté.
+        - Aucune analyse n'est exportée.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        commande="travailler", hote="10.0.0.1", port=9600
+    )
+    mock_travailleur = mocker.patch("main.Travailleur")
+    mock_travailleur.return_value.execute.return_value = 3
+    mock_exporteur = mocker.patch("main.Exporteur")
+
+    main()
+
+    mock_travailleur.assert_called_once_with("10.0.0.1", 9600)
+    mock_travailleur.return_value.execute.assert_called_once()
+    mock_exporteur.assert_not_called()
+
+
+def test_main_analyse_fusion_chronologique(mocker, log_apache, tmp_path):
+    """
+    Vérifie que le fichier principal fusionne en flux plusieurs fichiers log avec
+    l'option ``--ajout-log`` et exporte leur analyse.
+
+    Scénarios testés:
+        - Analyse de deux fichiers log avec un filtre sur le code de statut http.
+
+    Asserts:
+        - L'analyse exportée compte les entrées des deux fichiers et indique les
+          statistiques de la fusion.
+        - Aucun fichier n'est parsé en entier en mémoire.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    autre_log = tmp_path / "autre.log"
+    autre_log.write_text('::1 - - [05/Mar/2025:16:59:43 +0100] "GET / HTTP/1.1" 500 20\n')
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(log_apache(True)), logs_supplementaires=[str(autre_log)],
+        tampon_reordonnancement=10, pipe=False, sessions=False, abus=False, slo=False,
+        agents=False, attaques=False, arborescence=False, navigation=False, nouveautes=False,
+        entrepot=None, sqlite=False, normalise_urls=False, routes=[],
+        sortie=str(tmp_path), ip=None,
+        code_statut_http=500, expression=None, granularite="heure", groupements=[],
+        etat_partiel=False, camembert=False
+    )
+    mock_parse_fichier = mocker.patch("main.ParseurLogApache.parse_fichier")
+
+    main()
+
+    mock_parse_fichier.assert_not_called()
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())
+    assert analyse["total_entrees"] == 6
+    assert analyse["statistiques"]["total_entrees_filtre"] == 5
+    assert len(analyse["chemins"]) == 2
+    assert analyse["fusion_chronologique"] == {"tampon_reordonnancement": 10,
+                                               "entrees_desordonnees": 0}
+
+
+def test_main_analyse_sessions(mocker, log_apache, tmp_path):
+    """
+    Vérifie que le fichier principal analyse les sessions des clients avec l'option
+    ``--sessions`` et exporte l'analyse.
+
+    Scénarios testés:
+        - Analyse des sessions d'un fichier log avec un délai d'une heure.
+
+    Asserts:
+        - L'analyse exportée compte les entrées et les sessions du fichier (les trois
+          requêtes de ``::1`` forment une seule session).
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(log_apache(True)), logs_supplementaires=[], tampon_reordonnancement=10,
+        pipe=False, sessions=True, delai_session=3600, sortie=str(tmp_path), ip=None,
+        code_statut_http=None, expression=None, normalise_urls=False, routes=[]
+    )
+
+    main()
+
+    analyse = json.loads((tmp_path / "analyse-sessions-log-apache.json").read_text())
+    assert analyse["total_entrees"] == 5
+    assert analyse["sessions"]["total_sessions"] == 3
+    assert analyse["sessions"]["requetes_par_session"]["maximum"] == 3
+    assert analyse["sessions"]["sessions_en_cours"] == 0
+    assert analyse["chemins"] == [str(log_apache(True).resolve())]
+
+
+def test_main_analyse_abus(mocker, log_apache, tmp_path):
+    """
+    Vérifie que le fichier principal ajoute la détection des clients abusifs à
+    l'analyse avec l'option ``--abus``.
+
+    Scénarios testés:
+        - Analyse d'un fichier log avec une fenêtre d'une minute.
+
+    Asserts:
+        - L'analyse exportée contient le classement des adresses IP de la dernière
+          fenêtre, sans alerte (trafic trop faible).
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(log_apache(True)), filtres=[], pipe=False, sessions=False,
+        logs_supplementaires=[], abus=True, fenetre_abus=60, seuil_abus=3.0, slo=False,
+        agents=False, attaques=False, arborescence=False, navigation=False, nouveautes=False,
+        entrepot=None, sqlite=False, normalise_urls=False, routes=[],
+        sortie=str(tmp_path), ip=None, code_statut_http=None, expression=None,
+        granularite="heure", groupements=[], moteur="python", etat_partiel=False,
+        camembert=False
+    )
+
+    main()
+
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())
+    assert analyse["abus"]["fenetre_secondes"] == 60
+    assert analyse["abus"]["top_clients_fenetre"] == [
+        {"adresse_ip": "::1", "requetes": 3, "reference_fenetre": 1.2}
+    ]
+    assert analyse["abus"]["alertes"] == []
+
+
+def test_main_analyse_slo(mocker, log_apache, tmp_path):
+    """
+    Vérifie que le fichier principal ajoute le suivi du taux d'erreurs à l'analyse
+    avec l'option ``--slo``.
+
+    Scénarios testés:
+        - Analyse d'un fichier log avec un objectif de 90 % et des fenêtres d'une heure.
+
+    Asserts:
+        - L'analyse exportée contient la disponibilité, les pires fenêtres et les
+          taux de consommation du budget d'erreurs.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(log_apache(True)), filtres=[], pipe=False, sessions=False,
+        logs_supplementaires=[], abus=False, slo=True, objectif_slo=0.9, fenetre_slo=3600,
+        agents=False, attaques=False, arborescence=False, navigation=False, nouveautes=False,
+        entrepot=None, sqlite=False, normalise_urls=False, routes=[],
+        sortie=str(tmp_path), ip=None, code_statut_http=None, expression=None,
+        granularite="heure", groupements=[], moteur="python", etat_partiel=False,
+        camembert=False
+    )
+
+    main()
+
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())
+    assert (analyse["slo"]["total_requetes"], analyse["slo"]["total_erreurs"]) == (5, 4)
+    assert analyse["slo"]["disponibilite"] == pytest.approx(0.2)
+    assert (analyse["slo"]["fenetres"], analyse["slo"]["fenetres_hors_objectif"]) == (3, 2)
+    assert [(fenetre["debut"], fenetre["requetes"], fenetre["erreurs"])
+            for fenetre in analyse["slo"]["pires_fenetres"]] == [
+        ("2025-03-05T15:00:00+00:00", 3, 3), ("2025-02-27T08:00:00+00:00", 1, 1),
+        ("2025-01-12T10:00:00+00:00", 1, 0)
+    ]
+    assert analyse["slo"]["taux_consommation"]["1h"]["actuel"] == pytest.approx(10)
+
+
+def test_main_analyse_agents(mocker, tmp_path):
+    """
+    Vérifie que le fichier principal ajoute la répartition des requêtes par agent
+    utilisateur à l'analyse avec l'option ``--agents``.
+
+    Scénarios testés:
+        - Analyse d'un fichier log avec un navigateur et un robot.
+
+    Asserts:
+        - L'analyse exportée contient la répartition des robots et des navigateurs.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin_log = tmp_path / "access.log"
+    chemin_log.write_text(
+        '10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET / HTTP/1.1" 200 10 "-" '
+        '"Mozilla/5.0 (Windows NT 10.0) Firefox/121.0"\n'
+        '10.0.0.2 - - [12/Jan/2025:10:00:01 +0000] "GET / HTTP/1.1" 200 10 "-" '
+        '"curl/8.4.0"\n'
+    )
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(chemin_log), filtres=[], pipe=False, sessions=False,
+        logs_supplementaires=[], abus=False, slo=False, agents=True, regles_agents=None,
+        attaques=False, arborescence=False, navigation=False, nouveautes=False, entrepot=None,
+        sqlite=False, normalise_urls=False, routes=[],
+        sortie=str(tmp_path), ip=None, code_statut_http=None, expression=None,
+        granularite="heure", groupements=[], moteur="python", etat_partiel=False,
+        camembert=False
+    )
+
+    main()
+
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())
+    assert analyse["agents"]["requetes_robots"] == 1
+    assert [(robot["robot"], robot["total"]) for robot in analyse["agents"]["top_robots"]] \
+        == [("curl", 1)]
+    assert [(navigateur["navigateur"], navigateur["total"])
+            for navigateur in analyse["agents"]["top_navigateurs"]] == [("Firefox", 1)]
+
+
+def test_main_analyse_attaques(mocker, tmp_path):
+    """
+    Vérifie que le fichier principal ajoute les clients suspects à l'analyse avec
+    l'option ``--attaques``.
+
+    Scénarios testés:
+        - Analyse d'un fichier log avec une requête légitime et deux sondes d'un scanner.
+
+    Asserts:
+        - L'analyse exportée contient le scanner parmi les clients suspects.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin_log = tmp_path / "access.log"
+    chemin_log.write_text(
+        '10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET / HTTP/1.1" 200 10\n'
+        '10.0.0.9 - - [12/Jan/2025:10:00:01 +0000] "GET /.env HTTP/1.1" 404 10\n'
+        '10.0.0.9 - - [12/Jan/2025:10:00:02 +0000] "GET /phpmyadmin/ HTTP/1.1" 404 10\n'
+    )
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(chemin_log), filtres=[], pipe=False, sessions=False,
+        logs_supplementaires=[], abus=False, slo=False, agents=False, attaques=True,
+        arborescence=False, navigation=False, nouveautes=False, entrepot=None, sqlite=False,
+        signatures_attaques=None, sortie=str(tmp_path), ip=None, code_statut_http=None,
+        expression=None, granularite="heure", groupements=[], moteur="python",
+        etat_partiel=False, camembert=False, normalise_urls=False, routes=[]
+    )
+
+    main()
+
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())
+    assert analyse["attaques"]["requetes_suspectes"] == 2
+    assert analyse["attaques"]["clients_suspects"] == [
+        {"adresse_ip": "10.0.0.9", "score": 7, "erreur_max": 0,
+         "signatures": ["Fichiers sensibles", "Interfaces d'administration"]}
+    ]
+
+def test_main_normalisation_urls(mocker, tmp_path):
+    """
+    Vérifie que le fichier principal regroupe les urls par route avec les options
+    ``--normalise-urls`` et ``--route``.
+
+    Scénarios testés:
+        - Analyse d'un fichier log avec des urls de produits, d'avis et une chaîne de
+          requête, et exportation de l'état partiel.
+
+    Asserts:
+        - Le classement des urls et l'état partiel exporté comptent les routes.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin_log = tmp_path / "access.log"
+    chemin_log.write_text(
+        '10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET /produit/12?x=1 HTTP/1.1" 200 10\n'
+        '10.0.0.1 - - [12/Jan/2025:10:00:01 +0000] "GET /produit/13 HTTP/1.1" 200 10\n'
+        '10.0.0.2 - - [12/Jan/2025:10:00:02 +0000] "GET /avis/chaise HTTP/1.1" 200 10\n'
+    )
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(chemin_log), filtres=[], pipe=False, sessions=False,
+        logs_supplementaires=[], abus=False, slo=False, agents=False, attaques=False,
+        arborescence=False, navigation=False, nouveautes=False, entrepot=None, sqlite=False,
+        normalise_urls=True, routes=["/avis/{produit}"], sortie=str(tmp_path), ip=None,
+        code_statut_http=None, expression=None, granularite="heure", groupements=[],
+        moteur="python", etat_partiel=True, camembert=False
+    )
+
+    main()
+
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())
+    assert [(url["url"], url["total"])
+            for url in analyse["statistiques"]["requetes"]["top_urls"]] == [
+        ("/produit/{id}", 2), ("/avis/{produit}", 1)
+    ]
+    etat_partiel = json.loads((tmp_path / "etat-partiel-analyse.json").read_text())
+    assert etat_partiel["urls"]["elements"] == [["/produit/{id}", 2, 0],
+                                                ["/avis/{produit}", 1, 0]]
+
+def test_main_analyse_arborescence(mocker, tmp_path):
+    """
+    Vérifie que le fichier principal ajoute l'arborescence des chemins à l'analyse avec
+    l'option ``--arborescence``.
+
+    Scénarios testés:
+        - Analyse d'un fichier log avec des requêtes vers deux versions d'une api.
+
+    Asserts:
+        - L'analyse exportée contient les chemins de chaque niveau.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin_log = tmp_path / "access.log"
+    chemin_log.write_text(
+        '10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET /api/v1/produits HTTP/1.1" 200 10\n'
+        '10.0.0.1 - - [12/Jan/2025:10:00:01 +0000] "GET /api/v2/produits HTTP/1.1" 500 10\n'
+        '10.0.0.2 - - [12/Jan/2025:10:00:02 +0000] "GET /api/v2/commandes HTTP/1.1" 200 10\n'
+    )
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(chemin_log), filtres=[], pipe=False, sessions=False,
+        logs_supplementaires=[], abus=False, slo=False, agents=False, attaques=False,
+        arborescence=True, profondeur_arborescence=2, navigation=False, nouveautes=False,
+        entrepot=None, sqlite=False, normalise_urls=False, routes=[], sortie=str(tmp_path), ip=None,
+        code_statut_http=None, expression=None, granularite="heure", groupements=[],
+        moteur="python", etat_partiel=False, camembert=False
+    )
+
+    main()
+
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())
+    assert [[(chemin["chemin"], chemin["requetes"]) for chemin in niveau["chemins"]]
+            for niveau in analyse["arborescence"]["niveaux"]] == [
+        [("/api", 3)], [("/api/v2", 2), ("/api/v1", 1)]
+    ]
+
+def test_main_analyse_navigation(mocker, tmp_path):
+    """
+    Vérifie que le fichier principal ajoute les flux de navigation à l'analyse avec
+    l'option ``--navigation``.
+
+    Scénarios testés:
+        - Analyse d'un fichier log avec des requêtes depuis un moteur de recherche, un
+          domaine interne déclaré et sans référent.
+
+    Asserts:
+        - L'analyse exportée contient les requêtes par type de référent, les liens et
+          les domaines externes.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin_log = tmp_path / "access.log"
+    chemin_log.write_text(
+        '10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET / HTTP/1.1" 200 10 '
+        '"https://www.google.com/" "Firefox"\n'
+        '10.0.0.1 - - [12/Jan/2025:10:00:01 +0000] "GET /panier HTTP/1.1" 200 10 '
+        '"https://exemple.fr/" "Firefox"\n'
+        '10.0.0.2 - - [12/Jan/2025:10:00:02 +0000] "GET / HTTP/1.1" 200 10 "-" "Firefox"\n'
+    )
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(chemin_log), filtres=[], pipe=False, sessions=False,
+        logs_supplementaires=[], abus=False, slo=False, agents=False, attaques=False,
+        arborescence=False, navigation=True, nouveautes=False, domaines_internes=["exemple.fr"],
+        entrepot=None, sqlite=False, normalise_urls=False, routes=[], sortie=str(tmp_path), ip=None,
+        code_statut_http=None, expression=None, granularite="heure", groupements=[],
+        moteur="python", etat_partiel=False, camembert=False
+    )
+
+    main()
+
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())["navigation"]
+    assert (analyse["requetes_sans_referent"], analyse["requetes_referent_interne"],
+            analyse["requetes_referent_externe"]) == (1, 1, 1)
+    assert [(lien["domaine_referent"], lien["url"]) for lien in analyse["top_liens"]] \
+        == [("google.com", "/"), ("exemple.fr", "/panier")]
+    assert [domaine["domaine"] for domaine in analyse["top_domaines_externes"]] \
+        == ["google.com"]
+
+def test_main_analyse_nouveautes(mocker, tmp_path):
+    """
+    Vérifie que le fichier principal ajoute les nouvelles adresses IP et urls à
+    l'analyse avec l'option ``--nouveautes``, et que leur mémoire est conservée d'une
+    exécution à l'autre.
+
+    Scénarios testés:
+        - Analyse d'un premier fichier log, puis d'un second fichier log avec un ancien
+          et un nouveau client.
+
+    Asserts:
+        - Les filtres de Bloom sont enregistrés dans le dossier de sortie.
+        - Lors de la seconde analyse, seules les nouvelles clés sont signalées.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemins_log = [tmp_path / "access-1.log", tmp_path / "access-2.log"]
+    chemins_log[0].write_text(
+        '10.0.0.1 - - [12/Jan/2025:10:00:00 +0000] "GET / HTTP/1.1" 200 10\n'
+        '10.0.0.2 - - [12/Jan/2025:10:00:01 +0000] "GET /panier HTTP/1.1" 200 10\n'
+    )
+    chemins_log[1].write_text(
+        '10.0.0.2 - - [13/Jan/2025:10:00:00 +0000] "GET / HTTP/1.1" 200 10\n'
+        '10.0.0.3 - - [13/Jan/2025:10:00:01 +0000] "GET /commande HTTP/1.1" 200 10\n'
+    )
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    for chemin_log in chemins_log:
+        mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+            chemin_log=str(chemin_log), filtres=[], pipe=False, sessions=False,
+            logs_supplementaires=[], abus=False, slo=False, agents=False, attaques=False,
+            arborescence=False, navigation=False, nouveautes=True, entrepot=None, sqlite=False,
+            capacite_nouveautes=1000, taux_faux_positifs=0.01, normalise_urls=False,
+            routes=[], sortie=str(tmp_path), ip=None, code_statut_http=None,
+            expression=None, granularite="heure", groupements=[], moteur="python",
+            etat_partiel=False, camembert=False
+        )
+
+        main()
+
+    assert (tmp_path / "memoire-nouveautes-ip.bloom").is_file()
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())["nouveautes"]
+    assert analyse["premiere_execution"] is False
+    assert analyse["ip"]["exemples"] == ["10.0.0.3"]
+    assert analyse["urls"]["exemples"] == ["/commande"]
+
+def test_main_entrepot_et_tendance(mocker, tmp_path):
+    """
+    Vérifie que le fichier principal ajoute les agrégats de chaque analyse à
+    l'entrepôt avec l'option ``--entrepot``, puis calcule la tendance avec la commande
+    ``tendance`` sans relire les fichiers log.
+
+    Scénarios testés:
+        - Analyse des fichiers log de deux jours consécutifs avec un entrepôt.
+        - Commande ``tendance`` sur un jour, avec l'analyse d'un troisième jour déjà
+          exportée à ajouter.
+
+    Asserts:
+        - La tendance compare le dernier jour au jour précédent.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin_entrepot = str(tmp_path / "agregats.sqlite")
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    for jour, requetes in ((10, 1), (11, 4)):
+        chemin_log = tmp_path / f"access-{jour}.log"
+        chemin_log.write_text("".join(
+            f'10.0.0.1 - - [{jour}/Jan/2025:10:00:0{numero} +0000] "GET / HTTP/1.1" 200 10\n'
+            for numero in range(requetes)
+        ))
+        mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+            chemin_log=str(chemin_log), filtres=[], pipe=False, sessions=False,
+            logs_supplementaires=[], abus=False, slo=False, agents=False, attaques=False,
+            arborescence=False, navigation=False, nouveautes=False,
+            entrepot=chemin_entrepot, sqlite=False, normalise_urls=False, routes=[],
+            sortie=str(tmp_path), ip=None, code_statut_http=None, expression=None,
+            granularite="heure", groupements=[], moteur="python", etat_partiel=False,
+            camembert=False
+        )
+        main()
+    analyse = json.loads((tmp_path / "analyse-log-apache.json").read_text())
+    analyse["chemin"] = "/logs/access-12.log"
+    analyse["statistiques"]["series_temporelles"]["series"][0]["debut"] = \
+        "2025-01-12T10:00:00+00:00"
+    (tmp_path / "analyse-12.json").write_text(json.dumps(analyse))
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        commande="tendance", entrepot=chemin_entrepot, periode="jour",
+        date_reference=None, analyses=[str(tmp_path / "analyse-12.json")],
+        sortie=str(tmp_path), ip=None, code_statut_http=None, expression=None
+    )
+    mock_parseur_log = mocker.patch("main.ParseurLogApache")
+
+    main()
+
+    mock_parseur_log.assert_not_called()
+    tendance = json.loads((tmp_path / "tendance-log-apache.json").read_text())
+    assert tendance["courante"]["debut"] == "2025-01-12T00:00:00+00:00"
+    assert (tendance["precedente"]["requetes"], tendance["courante"]["requetes"]) == (4, 4)
+    assert tendance["evolution"]["requetes"] == 0
+
+def test_main_export_sqlite(mocker, tmp_path):
+    """
+    Vérifie que l'option ``--sqlite`` exporte les entrées parsées en plus de l'analyse.
+
+    Scénarios testés:
+        - Analyse d'un fichier log de trois entrées avec l'option ``--sqlite``.
+
+    Asserts:
+        - L'analyse JSON est exportée.
+        - La base SQLite contient toutes les entrées, y compris celles exclues par le
+          filtre de l'analyse.
+
+    Args:
+        mocker (MockerFixture): Une fixture pour simuler des retours pour les classes
+            et méthodes dans main.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin_log = tmp_path / "access.log"
+    chemin_log.write_text("".join(
+        f'10.0.0.{numero} - - [12/Jan/2025:10:00:0{numero} +0000] "GET / HTTP/1.1" {code} 10\n'
+        for numero, code in ((1, 200), (2, 404), (3, 200))
+    ))
+    mock_parseur_cli = mocker.patch("main.ParseurArgumentsCLI")
+    mock_parseur_cli.return_value.parse_args.return_value = mocker.MagicMock(
+        chemin_log=str(chemin_log), filtres=[], pipe=False, sessions=False,
+        logs_supplementaires=[], abus=False, slo=False, agents=False, attaques=False,
+        arborescence=False, navigation=False, nouveautes=False, entrepot=None,
+        sqlite=True, normalise_urls=False, routes=[],
+        sortie=str(tmp_path), ip=None, code_statut_http=200, expression=None,
+        granularite="heure", groupements=[], moteur="python", etat_partiel=False,
+        camembert=False
+    )
+
+    main()
+
+    assert (tmp_path / "analyse-log-apache.json").exists()
+    connexion = sqlite3.connect(str(tmp_path / "entrees-log-apache.sqlite"))
+    try:
+        assert connexion.execute("SELECT COUNT(*) FROM entrees").fetchone() == (3,)
+    finally:
+        connexion.close()
@@ -0,0 +1,112 @@
+"""
+Module des tests unitaires pour les métriques au format texte de Prometheus.
+"""
+
+import pytest
+from serveur.metriques_prometheus import MetriquesPrometheus
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("series_max, exception", [
+    ("10", TypeError),
+    (0, ValueError)
+])
+def test_metriques_exception_parametres_invalides(series_max, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque le nombre maximal de séries
+    est invalide.
+
+    Scénarios testés:
+        - Nombre qui n'est pas un entier.
+        - Nombre nul.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        series_max (any): Le nombre maximal de séries.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        MetriquesPrometheus(series_max)
+
+def test_metriques_texte(fichier_log_apache):
+    """
+    Vérifie le texte exposé après l'ajout des entrées du fichier de test.
+
+    Scénarios testés:
+        - Ajout des entrées et d'une ligne invalide.
+        - Lecture avant puis après l'actualisation de l'instantané.
+
+    Asserts:
+        - L'instantané n'évolue qu'après son actualisation.
+        - Les compteurs par code et méthode, les octets et les lignes invalides sont
+          exposés.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+    """
+    metriques = MetriquesPrometheus()
+    texte_initial = metriques.get_texte()
+    metriques.ajoute_entrees(fichier_log_apache.entrees, lignes_invalides=1)
+    assert metriques.get_texte() == texte_initial
+    metriques.actualise_instantane()
+    texte = metriques.get_texte()
+    assert 'logbuster_requetes_total{code="500",methode="DELETE",vhost=""} 2' in texte
+    assert 'logbuster_requetes_total{code="200",methode="GET",vhost=""} 1' in texte
+    assert "logbuster_octets_total 612" in texte
+    assert "logbuster_lignes_invalides_total 1" in texte
+    assert 'logbuster_temps_reponse_secondes_bucket{le="+Inf"} 0' in texte
+    assert texte.endswith("\n")
+
+def test_metriques_histogramme_et_limite_series(entree_log_apache):
+    """
+    Vérifie l'histogramme des temps de réponse et la limite du nombre de séries.
+
+    Scénarios testés:
+        - Entrées avec des temps de réponse de 3 ms et 2 s.
+        - Combinaisons d'étiquettes au-delà de la limite, avec une valeur à échapper.
+
+    Asserts:
+        - Les intervalles de l'histogramme sont cumulatifs.
+        - Les combinaisons au-delà de la limite sont comptées avec l'étiquette ``autre``.
+        - Les guillemets des étiquettes sont échappés.
+
+    Args:
+        entree_log_apache (EntreeLogApache): Fixture pour l'instance
+            de la classe :class:`EntreeLogApache`.
+    """
+    metriques = MetriquesPrometheus(series_max=1)
+    entree_log_apache.reponse.temps_reponse = 3000
+    metriques.ajoute_entrees([entree_log_apache])
+    entree_log_apache.reponse.temps_reponse = 2_000_000
+    entree_log_apache.requete.methode_http = 'GE"T'
+    metriques.ajoute_entrees([entree_log_apache])
+    metriques.actualise_instantane()
+    texte = metriques.get_texte()
+    assert 'logbuster_temps_reponse_secondes_bucket{le="0.005"} 1' in texte
+    assert 'logbuster_temps_reponse_secondes_bucket{le="1.0"} 1' in texte
+    assert 'logbuster_temps_reponse_secondes_bucket{le="2.5"} 2' in texte
+    assert "logbuster_temps_reponse_secondes_count 2" in texte
+    assert 'logbuster_requetes_total{code="autre",methode="autre",vhost="autre"} 1' in texte
+
+    metriques_sans_limite = MetriquesPrometheus()
+    metriques_sans_limite.ajoute_entrees([entree_log_apache])
+    metriques_sans_limite.actualise_instantane()
+    assert 'methode="GE\\"T"' in metriques_sans_limite.get_texte()
+
+def test_metriques_exception_entrees_invalides():
+    """
+    Vérifie que ``ajoute_entrees`` renvoie une erreur lorsque une entrée n'est pas
+    une :class:`EntreeLogApache`.
+
+    Scénarios testés:
+        - Entrée sous forme d'une chaîne de caractères.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    with pytest.raises(TypeError):
+        MetriquesPrometheus().ajoute_entrees(["ligne"])
@@ -0,0 +1,247 @@
+"""
+Module des tests unitaires pour le moteur de regroupement des entrées.
+"""
+
+import pytest
+from analyse.moteur_groupement import SpecificationGroupement, MoteurGroupement
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("specification, exception", [
+    (None, TypeError),
+    ("", ValueError),
+    ("methode,inconnue", ValueError),
+    ("methode,methode", ValueError)
+])
+def test_specification_groupement_invalide(specification, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque la spécification est invalide.
+
+    Scénarios testés:
+        - Type incorrect pour le paramètre ``specification``.
+        - Spécification vide.
+        - Dimension inconnue.
+        - Dimension en double.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        specification (any): La spécification du regroupement.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        SpecificationGroupement(specification)
+
+@pytest.mark.parametrize("specification, cle_attendue", [
+    ("methode,code", ("GET", 200)),
+    (" ip , url ", ("192.168.1.1", "/index.html")),
+    ("heure,classe_code,vhost", (10, "2xx", None)),
+    ("jour", ("2025-01-12",))
+])
+def test_specification_groupement_cle_valide(entree_log_apache, specification, cle_attendue):
+    """
+    Vérifie que la clé de regroupement d'une entrée contient la valeur de chaque
+    dimension, dans l'ordre de la spécification.
+
+    Scénarios testés:
+        - Regroupements sur une ou plusieurs dimensions.
+
+    Asserts:
+        - La clé est égale à celle attendue.
+        - La forme textuelle de la spécification est normalisée.
+
+    Args:
+        entree_log_apache (EntreeLogApache): Fixture pour l'instance 
+            de la classe :class:`EntreeLogApache`.
+        specification (str): La spécification du regroupement.
+        cle_attendue (tuple): La clé attendue.
+    """
+    specification = SpecificationGroupement(specification)
+    assert specification.get_cle(entree_log_apache) == cle_attendue
+    assert " " not in str(specification)
+
+@pytest.mark.parametrize("specifications, taille_maximale, exception", [
+    (SpecificationGroupement("ip"), 10, TypeError),
+    (["ip"], 10, TypeError),
+    ([SpecificationGroupement("ip")], "10", TypeError),
+    ([SpecificationGroupement("ip")], 0, ValueError)
+])
+def test_moteur_groupement_exception_parametres_invalides(specifications,
+                                                          taille_maximale,
+                                                          exception):
+    """
+    Vérifie que le moteur renvoie une erreur lorsque les paramètres sont invalides.
+
+    Scénarios testés:
+        - Spécifications qui ne sont pas dans une liste.
+        - Liste contenant une spécification sous forme textuelle.
+        - Type incorrect pour le paramètre ``taille_maximale``.
+        - Taille maximale inférieure à 1.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        specifications (any): Les spécifications des regroupements.
+        taille_maximale (any): Le nombre maximal de groupes.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        MoteurGroupement(specifications, taille_maximale)
+
+def test_moteur_groupement_plusieurs_regroupements(fichier_log_apache):
+    """
+    Vérifie que plusieurs regroupements sont calculés en un seul parcours avec les
+    bons agrégats.
+
+    Scénarios testés:
+        - Regroupement par méthode et code puis par adresse IP.
+
+    Asserts:
+        - Les groupes sont triés par total décroissant.
+        - Les totaux, taux, sommes et moyennes des tailles sont corrects.
+        - Aucun groupe n'est écarté.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance 
+            de la classe :class:`FichierLogApache`.
+    """
+    moteur = MoteurGroupement([SpecificationGroupement("methode,code"),
+                               SpecificationGroupement("ip")])
+    moteur.ajoute_entrees(fichier_log_apache.entrees)
+    par_methode_code, par_ip = moteur.get_groupements()
+    assert par_methode_code["dimensions"] == ["methode", "code"]
+    assert par_methode_code["total_groupes"] == 4
+    assert par_methode_code["groupes"][0] == {
+        "methode": "DELETE", "code": 500, "total": 2, "taux": 40.0,
+        "somme_octets": 40, "moyenne_octets": 20.0
+    }
+    assert par_methode_code["autres"] is None
+    assert par_ip["groupes"][0]["ip"] == "::1"
+    assert par_ip["groupes"][0]["total"] == 3
+    assert [groupe["ip"] for groupe in par_ip["groupes"]] == ["::1", "192.168.1.1", "111.89.7.3"]
+
+def test_moteur_groupement_memoire_bornee(fichier_log_apache):
+    """
+    Vérifie que le nombre de groupes conservés est borné et que les entrées des
+    groupes écartés sont agrégées dans le groupe « autres ».
+
+    Scénarios testés:
+        - Regroupement par adresse IP avec au maximum deux groupes conservés.
+
+    Asserts:
+        - Deux groupes sont conservés, le moins fréquent ayant été écarté.
+        - Le groupe « autres » contient les entrées du groupe écarté.
+        - La limite restreint le nombre de groupes retournés.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance 
+            de la classe :class:`FichierLogApache`.
+    """
+    moteur = MoteurGroupement([SpecificationGroupement("ip")], taille_maximale=2)
+    moteur.ajoute_entrees(fichier_log_apache.entrees)
+    groupement = moteur.get_groupements()[0]
+    assert groupement["total_groupes"] == 2
+    assert [(groupe["ip"], groupe["total"]) for groupe in groupement["groupes"]] == [
+        ("::1", 3), ("111.89.7.3", 1)
+    ]
+    assert groupement["autres"]["total"] == 1
+    assert groupement["autres"]["somme_octets"] == 532
+    assert MoteurGroupement([SpecificationGroupement("ip")]).get_groupements(0)[0]["groupes"] == []
+
+def test_moteur_groupement_groupe_frequent_tardif(fichier_log_apache):
+    """
+    Vérifie qu'un groupe fréquent apparu après que la table soit pleine est conservé
+    à la place d'un groupe peu fréquent, y compris après fusion.
+
+    Scénarios testés:
+        - Deux adresses IP vues une fois, puis une troisième vue cinq fois, avec au
+          maximum deux groupes conservés.
+        - Fusion de ce moteur, sérialisé, dans un moteur vide.
+
+    Asserts:
+        - L'adresse fréquente est le premier groupe conservé.
+        - Le total des groupes et du groupe « autres » est égal au nombre d'entrées.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance 
+            de la classe :class:`FichierLogApache`.
+    """
+    entrees = fichier_log_apache.entrees
+    moteur = MoteurGroupement([SpecificationGroupement("ip")], taille_maximale=2)
+    moteur.ajoute_entrees([entrees[0], entrees[4]] + [entrees[1]] * 5)
+    moteur_fusionne = MoteurGroupement([SpecificationGroupement("ip")], taille_maximale=2)
+    moteur_fusionne.fusionne(MoteurGroupement.depuis_dict(moteur.get_dict()))
+    for groupement in (moteur.get_groupements()[0], moteur_fusionne.get_groupements()[0]):
+        assert (groupement["groupes"][0]["ip"], groupement["groupes"][0]["total"]) == ("::1", 5)
+        assert sum(groupe["total"] for groupe in groupement["groupes"]) \
+            + groupement["autres"]["total"] == 7
+
+@pytest.mark.parametrize("limite, exception", [
+    ("3", TypeError),
+    (True, TypeError),
+    (-1, ValueError)
+])
+def test_moteur_groupement_exception_limite_invalide(limite, exception):
+    """
+    Vérifie que la limite du nombre de groupes retournés est validée.
+
+    Scénarios testés:
+        - Limite d'un type incorrect.
+        - Limite négative.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        limite (any): La limite du nombre de groupes.
+        exception (Exception): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        MoteurGroupement([SpecificationGroupement("ip")]).get_groupements(limite)
+
+def test_moteur_groupement_fusion_identique(fichier_log_apache):
+    """
+    Vérifie que la fusion de moteurs alimentés par des parties du fichier donne
+    les mêmes regroupements qu'un seul moteur, y compris après sérialisation.
+
+    Scénarios testés:
+        - Fichier découpé en deux parties, chaque moteur passant par ``get_dict``
+          et ``depuis_dict`` avant la fusion.
+
+    Asserts:
+        - Les regroupements fusionnés sont identiques à ceux d'un seul moteur.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance 
+            de la classe :class:`FichierLogApache`.
+    """
+    specifications = [SpecificationGroupement("ip"), SpecificationGroupement("methode,code")]
+    moteur_complet = MoteurGroupement(specifications)
+    moteur_complet.ajoute_entrees(fichier_log_apache.entrees)
+    moteur_debut = MoteurGroupement(specifications)
+    moteur_debut.ajoute_entrees(fichier_log_apache.entrees[:2])
+    moteur_fin = MoteurGroupement(specifications)
+    moteur_fin.ajoute_entrees(fichier_log_apache.entrees[2:])
+    moteur_fusionne = MoteurGroupement.depuis_dict(moteur_debut.get_dict())
+    moteur_fusionne.fusionne(MoteurGroupement.depuis_dict(moteur_fin.get_dict()))
+    assert moteur_fusionne.get_groupements() == moteur_complet.get_groupements()
+
+def test_moteur_groupement_exception_fusion_invalide():
+    """
+    Vérifie que la fusion renvoie une erreur lorsque les moteurs ne sont pas compatibles.
+
+    Scénarios testés:
+        - Fusion avec un objet qui n'est pas un moteur.
+        - Fusion de moteurs qui ne calculent pas les mêmes regroupements.
+
+    Asserts:
+        - Les exceptions :class:`TypeError` puis :class:`ValueError` sont levées.
+    """
+    moteur = MoteurGroupement([SpecificationGroupement("ip")])
+    with pytest.raises(TypeError):
+        moteur.fusionne({})
+    with pytest.raises(ValueError):
+        moteur.fusionne(MoteurGroupement([SpecificationGroupement("url")]))
@@ -0,0 +1,187 @@
+"""
+Module des tests unitaires pour la normalisation des urls en routes.
+"""
+
+import pytest
+from analyse.normaliseur_urls import NormaliseurUrls
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("url, url_normalisee", [
+    ("/index.html", "/index.html"),
+    ("/produit/123?x=1", "/produit/{id}"),
+    ("/produit/456", "/produit/{id}"),
+    ("/commande/550e8400-e29b-41d4-a716-446655440000/facture",
+     "/commande/{id}/facture"),
+    ("/fichier/d41d8cd98f00b204e9800998ecf8427e", "/fichier/{id}"),
+    ("/article/v2", "/article/v2"),
+    (None, None)
+])
+def test_normaliseur_identifiants(url, url_normalisee):
+    """
+    Vérifie la normalisation des urls sans modèle de route.
+
+    Scénarios testés:
+        - Url sans identifiant, avec une chaîne de requête, un nombre, un UUID, une
+          empreinte hexadécimale ou un segment court mêlant lettres et chiffres.
+        - Requête sans url.
+
+    Asserts:
+        - La chaîne de requête est supprimée et seuls les identifiants sont
+          remplacés par ``{id}``.
+
+    Args:
+        url (Optional[str]): L'url.
+        url_normalisee (Optional[str]): L'url normalisée attendue.
+    """
+    assert NormaliseurUrls().normalise(url) == url_normalisee
+
+@pytest.mark.parametrize("url, url_normalisee", [
+    ("/produit/nouveautes", "/produit/nouveautes"),
+    ("/produit/chaise-bleue/avis?page=2", "/produit/{nom}/avis"),
+    ("/produit/chaise-bleue", "/produit/{nom}"),
+    ("/api/v1/produit/12", "/api/{version}/produit/{id}"),
+    ("/static/css/site.css", "/static/*"),
+    ("/static", "/static/*"),
+    ("/utilisateur/42/profil", "/utilisateur/{id}/profil")
+])
+def test_normaliseur_modeles(url, url_normalisee):
+    """
+    Vérifie la normalisation des urls avec des modèles de routes.
+
+    Scénarios testés:
+        - Segment littéral et paramètre au même niveau de l'arbre.
+        - Paramètre suivi d'un segment littéral, plusieurs paramètres.
+        - Modèle terminé par ``*``.
+        - Url qui ne correspond à aucun modèle.
+
+    Asserts:
+        - Un segment littéral est prioritaire sur un paramètre, avec retour en
+          arrière si la suite du chemin ne correspond pas.
+        - Une url sans modèle est normalisée par le regroupement des identifiants.
+
+    Args:
+        url (str): L'url.
+        url_normalisee (str): L'url normalisée attendue.
+    """
+    normaliseur = NormaliseurUrls(["/produit/nouveautes", "/produit/{nom}/avis",
+                                   "/produit/{nom}", "/api/{version}/produit/{id}",
+                                   "/static/*"])
+    assert normaliseur.normalise(url) == url_normalisee
+
+def test_normaliseur_sans_regroupement_identifiants():
+    """
+    Vérifie que le regroupement des identifiants peut être désactivé.
+
+    Scénarios testés:
+        - Url avec un identifiant et une chaîne de requête.
+
+    Asserts:
+        - Seule la chaîne de requête est supprimée.
+    """
+    normaliseur = NormaliseurUrls(regroupe_identifiants=False)
+    assert normaliseur.normalise("/produit/123?x=1") == "/produit/123"
+
+def test_normaliseur_cache():
+    """
+    Vérifie qu'une url déjà rencontrée n'est pas normalisée de nouveau et que le
+    cache est borné.
+
+    Scénarios testés:
+        - Cache de deux urls, urls répétées puis une troisième url.
+
+    Asserts:
+        - Les normalisations répétées sont trouvées dans le cache.
+        - La taille du cache ne dépasse pas sa limite.
+    """
+    normaliseur = NormaliseurUrls(taille_cache=2)
+    for _ in range(10):
+        normaliseur.normalise("/produit/1")
+        normaliseur.normalise("/produit/2")
+    normaliseur.normalise("/produit/3")
+    assert normaliseur.get_statistiques_cache() == {"succes": 18, "normalisations": 3,
+                                                    "taille": 2}
+
+@pytest.mark.parametrize("modele", ["produit/{id}", "/produit?x={id}", "/static/*/css",
+                                    "/static/*.css"])
+def test_normaliseur_exception_modele_invalide(modele):
+    """
+    Vérifie qu'un modèle de route invalide lève une ``ValueError``.
+
+    Scénarios testés:
+        - Modèle sans ``/`` initial, avec une chaîne de requête, avec ``*`` ailleurs
+          qu'en dernier segment ou dans un segment.
+
+    Asserts:
+        - Une exception :class:`ValueError` est levée.
+
+    Args:
+        modele (str): Le modèle de route.
+    """
+    with pytest.raises(ValueError):
+        NormaliseurUrls([modele])
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"modeles": "/produit/{id}"}, TypeError),
+    ({"modeles": [3]}, TypeError),
+    ({"regroupe_identifiants": 1}, TypeError),
+    ({"taille_cache": "10"}, TypeError),
+    ({"taille_cache": 0}, ValueError)
+])
+def test_normaliseur_exception_parametres_invalides(parametres, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Modèles, regroupement des identifiants ou taille du cache d'un type
+          incorrect.
+        - Taille du cache nulle.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        parametres (dict): Les paramètres du constructeur.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        NormaliseurUrls(**parametres)
+
+def test_normaliseur_exception_url_invalide():
+    """
+    Vérifie qu'une url d'un type incorrect lève une ``TypeError``.
+
+    Scénarios testés:
+        - Url entière.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    with pytest.raises(TypeError):
+        NormaliseurUrls().normalise(12)
+
+def test_normaliseur_serialisation():
+    """
+    Vérifie que la définition d'une normalisation peut être reconstruite.
+
+    Scénarios testés:
+        - Normalisation avec un modèle et sans regroupement des identifiants.
+        - Définition qui n'est pas un dictionnaire ou incomplète.
+
+    Asserts:
+        - La normalisation reconstruite a la même définition et normalise de la
+          même manière.
+        - Les exceptions :class:`TypeError` puis :class:`ValueError` sont levées.
+    """
+    normaliseur = NormaliseurUrls(["/produit/{id}"], False)
+    reconstruit = NormaliseurUrls.depuis_dict(normaliseur.get_dict())
+    assert reconstruit.get_dict() == {"modeles": ["/produit/{id}"],
+                                      "regroupe_identifiants": False}
+    assert reconstruit.normalise("/produit/12?x=1") == "/produit/{id}"
+    assert reconstruit.normalise("/panier/12") == "/panier/12"
+    with pytest.raises(TypeError):
+        NormaliseurUrls.depuis_dict(["/produit/{id}"])
+    with pytest.raises(ValueError):
+        NormaliseurUrls.depuis_dict({"modeles": []})
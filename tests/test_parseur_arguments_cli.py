@@ -2,6 +2,7 @@
 Module des tests unitaires pour le parseur des arguments passés depuis la CLI.
 """
 
+from datetime import date
 import pytest
 from cli.parseur_arguments_cli import ArgumentCLIException
 
@@ -248,4 +249,619 @@ def test_parseur_cli_exception_recuperation_filtre_code_statut_http_invalide(
     """
     with pytest.raises(ArgumentCLIException):
         arguments = parseur_arguments_cli.parse_args(
-            args=["fichier.txt", "-c", code_statut_http_invalide])
\ No newline at end of file
+            args=["fichier.txt", "-c", code_statut_http_invalide])
+@pytest.mark.parametrize("arguments, granularite_attendue", [
+    (["fichier.txt"], "heure"),
+    (["fichier.txt", "-g", "minute"], "minute"),
+    (["fichier.txt", "--granularite", "jour"], "jour")
+])
+def test_parseur_cli_recuperation_granularite_valide(parseur_arguments_cli,
+                                                     arguments,
+                                                     granularite_attendue):
+    """
+    Vérifie que la granularité des séries temporelles est bien récupérée par le parseur.
+
+    Scénarios testés:
+        - Aucune granularité indiquée.
+        - Granularité indiquée avec l'option courte puis longue.
+
+    Asserts:
+        - La granularité récupérée est égale à celle attendue.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+        granularite_attendue (str): La granularité attendue.
+    """
+    assert parseur_arguments_cli.parse_args(args=arguments).granularite == granularite_attendue
+
+def test_parseur_cli_exception_granularite_invalide(parseur_arguments_cli):
+    """
+    Vérifie qu'une erreur se produit lorsque la granularité est inconnue.
+
+    Scénarios testés:
+        - Granularité inconnue dans les arguments de la CLI.
+
+    Asserts:
+        - Une exception :class:`ArgumentCLIException` est levée.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+    """
+    with pytest.raises(ArgumentCLIException):
+        parseur_arguments_cli.parse_args(args=["fichier.txt", "-g", "semaine"])
+
+@pytest.mark.parametrize("arguments, moteur_attendu", [
+    (["fichier.txt"], "python"),
+    (["fichier.txt", "--moteur", "pandas"], "pandas")
+])
+def test_parseur_cli_recuperation_moteur_valide(parseur_arguments_cli,
+                                                arguments,
+                                                moteur_attendu):
+    """
+    Vérifie que le moteur d'analyse est bien récupéré par le parseur.
+
+    Scénarios testés:
+        - Aucun moteur indiqué.
+        - Moteur ``pandas`` indiqué.
+
+    Asserts:
+        - Le moteur récupéré est égal à celui attendu.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+        moteur_attendu (str): Le moteur attendu.
+    """
+    assert parseur_arguments_cli.parse_args(args=arguments).moteur == moteur_attendu
+
+def test_parseur_cli_exception_moteur_invalide(parseur_arguments_cli):
+    """
+    Vérifie qu'une erreur se produit lorsque le moteur d'analyse est inconnu.
+
+    Scénarios testés:
+        - Moteur inconnu dans les arguments de la CLI.
+
+    Asserts:
+        - Une exception :class:`ArgumentCLIException` est levée.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+    """
+    with pytest.raises(ArgumentCLIException):
+        parseur_arguments_cli.parse_args(args=["fichier.txt", "--moteur", "spark"])
+
+@pytest.mark.parametrize("arguments, expression_attendue", [
+    (["fichier.txt"], None),
+    (["fichier.txt", "-e", "code = 5xx et url ^= /api"], "code = 5xx et url ^= /api"),
+    (["fichier.txt", "--expression", "non ip in (::1, 10.0.0.0/8)"],
+     "non ip in (::1, 10.0.0.0/8)")
+])
+def test_parseur_cli_recuperation_expression_valide(parseur_arguments_cli,
+                                                    arguments,
+                                                    expression_attendue):
+    """
+    Vérifie que l'expression de filtre est bien récupérée par le parseur.
+
+    Scénarios testés:
+        - Aucune expression indiquée.
+        - Expression indiquée avec l'option courte puis longue.
+
+    Asserts:
+        - L'expression récupérée est égale à celle attendue.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+        expression_attendue (Optional[str]): L'expression attendue.
+    """
+    assert parseur_arguments_cli.parse_args(args=arguments).expression == expression_attendue
+
+@pytest.mark.parametrize("expression", ["code = abc", "url ~ \"(\"", "ip = ::1 et"])
+def test_parseur_cli_exception_expression_invalide(parseur_arguments_cli, expression):
+    """
+    Vérifie qu'une erreur se produit lorsque l'expression de filtre est invalide.
+
+    Scénarios testés:
+        - Valeur invalide, expression régulière invalide et expression incomplète.
+
+    Asserts:
+        - Une exception :class:`ArgumentCLIException` est levée.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        expression (str): L'expression invalide.
+    """
+    with pytest.raises(ArgumentCLIException):
+        parseur_arguments_cli.parse_args(args=["fichier.txt", "-e", expression])
+
+@pytest.mark.parametrize("arguments, filtres_attendus", [
+    (["fichier.txt"], []),
+    (["fichier.txt", "--filtre", "code=404"], [{"code_statut_http": 404}]),
+    (["fichier.txt", "--filtre", "ip=::1,code=500", "--filtre", "ip=10.0.0.1"], [
+        {"adresse_ip": "::1", "code_statut_http": 500},
+        {"adresse_ip": "10.0.0.1"}
+    ])
+])
+def test_parseur_cli_recuperation_filtres_valide(parseur_arguments_cli,
+                                                 arguments,
+                                                 filtres_attendus):
+    """
+    Vérifie que les filtres d'une analyse multi-filtres sont bien récupérés par le parseur.
+
+    Scénarios testés:
+        - Aucun filtre indiqué.
+        - Un filtre indiqué.
+        - Plusieurs filtres indiqués en répétant l'option.
+
+    Asserts:
+        - Les définitions des filtres sont égales à celles attendues.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+        filtres_attendus (list): Les définitions des filtres attendues.
+    """
+    assert parseur_arguments_cli.parse_args(args=arguments).filtres == filtres_attendus
+
+@pytest.mark.parametrize("arguments", [
+    ["fichier.txt", "--filtre", "code=abc"],
+    ["fichier.txt", "--filtre", "url=/"],
+    ["fichier.txt", "--filtre", "ip="],
+    ["fichier.txt", "--filtre", "ip=::1,ip=::2"],
+    ["fichier.txt", "--filtre", "code=404", "-c", "500"],
+    ["fichier.txt", "--filtre", "code=404", "-e", "url ^= /api"],
+    ["fichier.txt", "--index"],
+    ["fichier.txt", "--filtre", "code=404", "--index", "--moteur", "pandas"],
+    ["fichier.txt", "--fichier-filtres", "inexistant.json"]
+])
+def test_parseur_cli_exception_filtres_invalides(parseur_arguments_cli, arguments):
+    """
+    Vérifie qu'une erreur se produit lorsque les filtres d'une analyse multi-filtres
+    sont invalides.
+
+    Scénarios testés:
+        - Code de statut http qui n'est pas un entier.
+        - Clé inconnue, valeur vide ou clé répétée.
+        - Combinaison avec les options -c ou -e.
+        - Option --index sans filtre ou avec le moteur pandas.
+        - Fichier de filtres introuvable.
+
+    Asserts:
+        - Une exception :class:`ArgumentCLIException` est levée.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+    """
+    with pytest.raises(ArgumentCLIException):
+        parseur_arguments_cli.parse_args(args=arguments)
+
+@pytest.mark.parametrize("contenu, valide", [
+    ('[{"code_statut_http": 404}, {"adresse_ip": "::1"}]', True),
+    ('{"code_statut_http": 404}', False),
+    ('[404]', False),
+    ('pas du json', False)
+])
+def test_parseur_cli_fichier_filtres(parseur_arguments_cli, tmp_path, contenu, valide):
+    """
+    Vérifie que les filtres d'un fichier JSON sont bien chargés par le parseur.
+
+    Scénarios testés:
+        - Fichier contenant une liste de filtres.
+        - Fichier contenant un dictionnaire, une liste de nombres ou un JSON invalide.
+
+    Asserts:
+        - Les filtres sont ajoutés à la liste des filtres si le fichier est valide.
+        - Une exception :class:`ArgumentCLIException` est levée sinon.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        contenu (str): Le contenu du fichier de filtres.
+        valide (bool): Indique si le fichier est valide.
+    """
+    chemin = tmp_path / "filtres.json"
+    chemin.write_text(contenu)
+    arguments = ["fichier.txt", "--filtre", "code=500", "--fichier-filtres", str(chemin)]
+    if valide:
+        assert parseur_arguments_cli.parse_args(args=arguments).filtres == [
+            {"code_statut_http": 500}, {"code_statut_http": 404}, {"adresse_ip": "::1"}
+        ]
+    else:
+        with pytest.raises(ArgumentCLIException):
+            parseur_arguments_cli.parse_args(args=arguments)
+
+@pytest.mark.parametrize("definition", [
+    '{"code_statut_http": "404"}',
+    '{"adresse_ip": 1}',
+    '{"url": "/"}',
+    '{"expression": "code = "}'
+])
+def test_parseur_cli_fichier_filtres_filtre_invalide(parseur_arguments_cli, tmp_path, definition):
+    """
+    Vérifie qu'un filtre mal formé dans un fichier de filtres est refusé par le parseur,
+    avec le numéro du filtre dans le message.
+
+    Scénarios testés:
+        - Code de statut http ou adresse IP du mauvais type.
+        - Clé inconnue.
+        - Expression de filtre invalide.
+
+    Asserts:
+        - Une exception :class:`ArgumentCLIException` est levée.
+        - Le message indique le numéro du filtre invalide.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        definition (str): La définition JSON du filtre invalide.
+    """
+    chemin = tmp_path / "filtres.json"
+    chemin.write_text(f'[{{"code_statut_http": 404}}, {definition}]')
+    arguments = ["fichier.txt", "--fichier-filtres", str(chemin)]
+    with pytest.raises(ArgumentCLIException, match="filtre n°2"):
+        parseur_arguments_cli.parse_args(args=arguments)
+
+@pytest.mark.parametrize("arguments, groupements_attendus", [
+    (["fichier.txt"], []),
+    (["fichier.txt", "--groupement", "methode,code", "--groupement", "heure,vhost"],
+     ["methode,code", "heure,vhost"])
+])
+def test_parseur_cli_recuperation_groupements_valide(parseur_arguments_cli,
+                                                     arguments,
+                                                     groupements_attendus):
+    """
+    Vérifie que les regroupements demandés sont bien récupérés par le parseur.
+
+    Scénarios testés:
+        - Aucun regroupement indiqué.
+        - Plusieurs regroupements indiqués en répétant l'option.
+
+    Asserts:
+        - Les spécifications récupérées sont égales à celles attendues.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+        groupements_attendus (list): Les spécifications attendues.
+    """
+    groupements = parseur_arguments_cli.parse_args(args=arguments).groupements
+    assert [str(groupement) for groupement in groupements] == groupements_attendus
+
+def test_parseur_cli_exception_groupement_invalide(parseur_arguments_cli):
+    """
+    Vérifie qu'une erreur se produit lorsque un regroupement contient une dimension
+    inconnue.
+
+    Scénarios testés:
+        - Regroupement avec une dimension inconnue.
+
+    Asserts:
+        - Une exception :class:`ArgumentCLIException` est levée.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+    """
+    with pytest.raises(ArgumentCLIException):
+        parseur_arguments_cli.parse_args(args=["fichier.txt", "--groupement", "methode,pays"])
+
+@pytest.mark.parametrize("arguments, normalise_urls, routes", [
+    (["fichier.txt"], False, []),
+    (["fichier.txt", "--normalise-urls"], True, []),
+    (["fichier.txt", "--route", "/produit/{id}", "--route", "/static/*"], False,
+     ["/produit/{id}", "/static/*"])
+])
+def test_parseur_cli_recuperation_routes_valide(parseur_arguments_cli,
+                                                arguments,
+                                                normalise_urls,
+                                                routes):
+    """
+    Vérifie que la normalisation des urls et les modèles de routes demandés sont bien
+    récupérés par le parseur.
+
+    Scénarios testés:
+        - Aucune normalisation demandée.
+        - Normalisation sans modèle de route.
+        - Plusieurs modèles de routes indiqués en répétant l'option.
+
+    Asserts:
+        - Les valeurs récupérées sont égales à celles attendues.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+        normalise_urls (bool): L'option ``--normalise-urls`` attendue.
+        routes (list): Les modèles de routes attendus.
+    """
+    arguments_parses = parseur_arguments_cli.parse_args(args=arguments)
+    assert arguments_parses.normalise_urls == normalise_urls
+    assert arguments_parses.routes == routes
+
+@pytest.mark.parametrize("route", ["produit/{id}", "/static/*/css"])
+def test_parseur_cli_exception_route_invalide(parseur_arguments_cli, route):
+    """
+    Vérifie qu'une erreur se produit lorsque un modèle de route est invalide.
+
+    Scénarios testés:
+        - Modèle sans ``/`` initial ou avec ``*`` ailleurs qu'en dernier segment.
+
+    Asserts:
+        - Une exception :class:`ArgumentCLIException` est levée.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        route (str): Le modèle de route.
+    """
+    with pytest.raises(ArgumentCLIException):
+        parseur_arguments_cli.parse_args(args=["fichier.txt", "--route", route])
+
+@pytest.mark.parametrize("arguments, commande_attendue", [
+    (["fichier.txt"], "analyser"),
+    (["analyser", "fichier.txt"], "analyser"),
+    (["fusionner", "etat-1.json", "etat-2.json"], "fusionner"),
+    (["servir", "access-1.log", "access-2.log", "--port", "9000"], "servir"),
+    (["surveiller", "logs/", "--port", "9100", "--intervalle", "0.5"], "surveiller"),
+    (["coordonner", "access-1.log", "access-2.log", "--travailleurs", "2",
+      "--taille-tache", "0.5", "-c", "500", "--route", "/produit/{id}"], "coordonner"),
+    (["travailler", "--hote", "10.0.0.1", "--port", "9600"], "travailler"),
+    (["a.log", "--ajout-log", "b.log", "--ajout-log", "c.log",
+      "--tampon-reordonnancement", "50"], "analyser"),
+    (["a.log", "--sessions", "--delai-session", "600", "-c", "200"], "analyser"),
+    (["a.log", "--abus", "--fenetre-abus", "60", "--seuil-abus", "4"], "analyser"),
+    (["a.log", "--slo", "--objectif-slo", "0.99", "--fenetre-slo", "60"], "analyser"),
+    (["a.log", "--agents", "--regles-agents", "regles.json"], "analyser"),
+    (["a.log", "--attaques", "--signatures-attaques", "signatures.json"], "analyser"),
+    (["a.log", "--arborescence", "--profondeur-arborescence", "4"], "analyser"),
+    (["a.log", "--navigation", "--domaine-interne", "exemple.fr"], "analyser"),
+    (["a.log", "--nouveautes", "--capacite-nouveautes", "5000",
+      "--taux-faux-positifs", "0.001"], "analyser"),
+    (["a.log", "--entrepot", "agregats.sqlite"], "analyser"),
+    (["a.log", "--sqlite", "--filtre", "code=404"], "analyser"),
+    (["tendance", "agregats.sqlite", "--periode", "jour", "--date", "2025-01-12",
+      "--ajout-analyse", "analyse.json", "-c", "404"], "tendance")
+])
+def test_parseur_cli_recuperation_commande_valide(parseur_arguments_cli,
+                                                  arguments,
+                                                  commande_attendue):
+    """
+    Vérifie que la commande est bien récupérée par le parseur.
+
+    Scénarios testés:
+        - Aucune commande indiquée (commande ``analyser`` par défaut).
+        - Commande ``analyser`` indiquée.
+        - Commande ``fusionner`` avec plusieurs états partiels.
+        - Commande ``servir`` avec plusieurs fichiers log et un port.
+        - Commande ``surveiller`` avec un répertoire, un port et un intervalle.
+        - Commande ``coordonner`` avec plusieurs fichiers log, des travailleurs locaux,
+          une taille de tâche, un filtre et un modèle de route.
+        - Commande ``travailler`` avec l'adresse et le port du coordinateur.
+        - Commande ``analyser`` avec plusieurs fichiers log à fusionner.
+        - Commande ``analyser`` avec une analyse des sessions.
+        - Commande ``analyser`` avec une détection des clients abusifs.
+        - Commande ``analyser`` avec un suivi du taux d'erreurs.
+        - Commande ``analyser`` avec une classification des agents utilisateurs.
+        - Commande ``analyser`` avec une détection des requêtes d'attaque.
+        - Commande ``analyser`` avec une agrégation par arborescence des chemins.
+        - Commande ``analyser`` avec une analyse des flux de navigation.
+        - Commande ``analyser`` avec une détection des nouvelles adresses IP et urls.
+        - Commande ``analyser`` avec un entrepôt des agrégats.
+        - Commande ``tendance`` avec une période, une date, une analyse à ajouter et un
+          filtre.
+
+    Asserts:
+        - La commande récupérée est égale à celle attendue.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+        commande_attendue (str): La commande attendue.
+    """
+    arguments_parses = parseur_arguments_cli.parse_args(args=arguments)
+    assert arguments_parses.commande == commande_attendue
+    if commande_attendue == "fusionner":
+        assert arguments_parses.etats == ["etat-1.json", "etat-2.json"]
+    if commande_attendue == "servir":
+        assert arguments_parses.logs == ["access-1.log", "access-2.log"]
+        assert (arguments_parses.hote, arguments_parses.port) == ("127.0.0.1", 9000)
+    if commande_attendue == "surveiller":
+        assert arguments_parses.repertoire == "logs/"
+        assert (arguments_parses.motif, arguments_parses.depuis_debut) == ("*.log", False)
+        assert (arguments_parses.port, arguments_parses.intervalle) == (9100, 0.5)
+    if commande_attendue == "coordonner":
+        assert arguments_parses.logs == ["access-1.log", "access-2.log"]
+        assert (arguments_parses.travailleurs, arguments_parses.taille_tache) == (2, 0.5)
+        assert (arguments_parses.code_statut_http, arguments_parses.port) == (500, 9500)
+        assert (arguments_parses.normalise_urls, arguments_parses.routes) == (False,
+                                                                              ["/produit/{id}"])
+    if commande_attendue == "travailler":
+        assert (arguments_parses.hote, arguments_parses.port) == ("10.0.0.1", 9600)
+    if commande_attendue == "tendance":
+        assert (arguments_parses.entrepot, arguments_parses.periode) == ("agregats.sqlite",
+                                                                        "jour")
+        assert arguments_parses.date_reference == date(2025, 1, 12)
+        assert arguments_parses.analyses == ["analyse.json"]
+        assert (arguments_parses.code_statut_http, arguments_parses.ip) == (404, None)
+    if arguments_parses.commande == "analyser" and arguments_parses.logs_supplementaires:
+        assert arguments_parses.logs_supplementaires == ["b.log", "c.log"]
+        assert arguments_parses.tampon_reordonnancement == 50
+    if arguments_parses.commande == "analyser" and arguments_parses.sessions:
+        assert (arguments_parses.delai_session, arguments_parses.code_statut_http) == (600, 200)
+    if arguments_parses.commande == "analyser" and arguments_parses.abus:
+        assert (arguments_parses.fenetre_abus, arguments_parses.seuil_abus) == (60, 4)
+    if arguments_parses.commande == "analyser" and arguments_parses.slo:
+        assert (arguments_parses.objectif_slo, arguments_parses.fenetre_slo) == (0.99, 60)
+    if arguments_parses.commande == "analyser" and arguments_parses.agents:
+        assert arguments_parses.regles_agents == "regles.json"
+    if arguments_parses.commande == "analyser" and arguments_parses.attaques:
+        assert arguments_parses.signatures_attaques == "signatures.json"
+    if arguments_parses.commande == "analyser" and arguments_parses.arborescence:
+        assert arguments_parses.profondeur_arborescence == 4
+    if arguments_parses.commande == "analyser" and arguments_parses.navigation:
+        assert arguments_parses.domaines_internes == ["exemple.fr"]
+    if arguments_parses.commande == "analyser" and arguments_parses.nouveautes:
+        assert (arguments_parses.capacite_nouveautes,
+                arguments_parses.taux_faux_positifs) == (5000, 0.001)
+
+@pytest.mark.parametrize("arguments", [
+    ["fusionner"],
+    ["fusionner", "etat$.json"],
+    ["fusionner", "etat.json", "-i", "::1"],
+    ["fichier.txt", "--filtre", "code=404", "--etat-partiel"],
+    ["servir"],
+    ["servir", "access.log", "--port", "70000"],
+    ["servir", "access.log", "-s", "sortie/"],
+    ["surveiller"],
+    ["surveiller", "logs/", "--intervalle", "0"],
+    ["coordonner"],
+    ["coordonner", "access.log", "--travailleurs", "-1"],
+    ["coordonner", "access.log", "-s", "sortie$/"],
+    ["travailler", "access.log"],
+    ["a.log", "--ajout-log", "b$.log"],
+    ["a.log", "--ajout-log", "b.log", "--filtre", "code=404"],
+    ["a.log", "--ajout-log", "b.log", "--moteur", "pandas"],
+    ["a.log", "--ajout-log", "b.log", "--tampon-reordonnancement", "-1"],
+    ["--pipe", "--ajout-log", "b.log"],
+    ["a.log", "--sessions", "--delai-session", "0"],
+    ["a.log", "--sessions", "--groupement", "methode"],
+    ["a.log", "--sessions", "--etat-partiel"],
+    ["--pipe", "--sessions"],
+    ["a.log", "--abus", "--fenetre-abus", "15"],
+    ["a.log", "--abus", "--seuil-abus", "1"],
+    ["a.log", "--abus", "--sessions"],
+    ["a.log", "--abus", "--filtre", "code=404"],
+    ["a.log", "--slo", "--objectif-slo", "1"],
+    ["a.log", "--slo", "--fenetre-slo", "7"],
+    ["a.log", "--slo", "--sessions"],
+    ["a.log", "--agents", "--filtre", "code=404"],
+    ["a.log", "--attaques", "--sessions"],
+    ["a.log", "--arborescence", "--profondeur-arborescence", "0"],
+    ["a.log", "--arborescence", "--filtre", "code=404"],
+    ["a.log", "--navigation", "--sessions"],
+    ["a.log", "--nouveautes", "--capacite-nouveautes", "0"],
+    ["a.log", "--nouveautes", "--taux-faux-positifs", "1"],
+    ["a.log", "--nouveautes", "--taux-faux-positifs", "nan"],
+    ["a.log", "--nouveautes", "--taux-faux-positifs", "1e-400"],
+    ["a.log", "--nouveautes", "--filtre", "code=404"],
+    ["a.log", "--entrepot", "agregats$.sqlite"],
+    ["a.log", "--entrepot", "agregats.sqlite", "--sessions"],
+    ["a.log", "--sqlite", "--pipe"],
+    ["a.log", "--sqlite", "--ajout-log", "b.log"],
+    ["tendance"],
+    ["tendance", "agregats.sqlite", "--date", "12/01/2025"],
+    ["tendance", "agregats.sqlite", "--periode", "mois"]
+])
+def test_parseur_cli_exception_commande_invalide(parseur_arguments_cli, arguments):
+    """
+    Vérifie qu'une erreur se produit lorsque les arguments d'une commande sont invalides.
+
+    Scénarios testés:
+        - Commande ``fusionner`` sans état partiel.
+        - État partiel avec un chemin invalide.
+        - Option de la commande ``analyser`` passée à la commande ``fusionner``.
+        - État partiel demandé avec une analyse multi-filtres.
+        - Commande ``servir`` sans fichier log, avec un port invalide ou une option
+          de la commande ``analyser``.
+        - Commande ``surveiller`` sans répertoire ou avec un intervalle nul.
+        - Commande ``coordonner`` sans fichier log, avec un nombre de travailleurs
+          négatif ou un dossier de sortie invalide.
+        - Commande ``travailler`` avec un fichier log.
+        - Fichier log ajouté avec un chemin invalide, une analyse multi-filtres, le
+          moteur ``pandas``, un tampon négatif ou l'option ``--pipe``.
+        - Analyse des sessions avec un délai nul, des regroupements, un état partiel
+          ou l'option ``--pipe``.
+        - Détection des clients abusifs avec une fenêtre non multiple de 10 secondes,
+          un seuil trop faible, une analyse des sessions ou une analyse multi-filtres.
+        - Suivi du taux d'erreurs avec un objectif de 100 %, une fenêtre qui ne divise
+          pas une heure ou une analyse des sessions.
+        - Classification des agents utilisateurs avec une analyse multi-filtres.
+        - Détection des requêtes d'attaque avec une analyse des sessions.
+        - Agrégation par arborescence avec une profondeur nulle ou une analyse
+          multi-filtres.
+        - Analyse des flux de navigation avec une analyse des sessions.
+        - Détection des nouveautés avec une capacité nulle, un taux de faux positifs
+          de 100 %, non numérique ou arrondi à 0, ou une analyse multi-filtres.
+        - Entrepôt des agrégats avec un chemin invalide ou une analyse des sessions.
+        - Commande ``tendance`` sans entrepôt, avec une date ou une période invalide.
+
+    Asserts:
+        - Une exception :class:`ArgumentCLIException` est levée.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+    """
+    with pytest.raises(ArgumentCLIException):
+        parseur_arguments_cli.parse_args(args=arguments)
+
+def test_parseur_cli_recuperation_pipe_valide(parseur_arguments_cli):
+    """
+    Vérifie que l'analyse en continu de l'entrée standard est bien récupérée par
+    le parseur.
+
+    Scénarios testés:
+        - Option ``--pipe`` sans commande ni fichier log, avec un filtre et un
+          intervalle d'exportation.
+
+    Asserts:
+        - La commande ``analyser`` est utilisée avec l'option ``--pipe``.
+        - L'intervalle d'exportation est récupéré.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+    """
+    arguments_parses = parseur_arguments_cli.parse_args(
+        args=["--pipe", "-c", "500", "--intervalle-export", "30"]
+    )
+    assert arguments_parses.commande == "analyser"
+    assert arguments_parses.pipe
+    assert arguments_parses.chemin_log is None
+    assert arguments_parses.intervalle_export == 30.0
+
+@pytest.mark.parametrize("arguments", [
+    [],
+    ["--pipe", "access.log"],
+    ["--pipe", "--filtre", "code=404"],
+    ["--pipe", "--groupement", "methode"],
+    ["--pipe", "--moteur", "pandas"],
+    ["--pipe", "--intervalle-export", "0"]
+])
+def test_parseur_cli_exception_pipe_invalide(parseur_arguments_cli, arguments):
+    """
+    Vérifie qu'une erreur se produit lorsque le fichier log est absent sans l'option
+    ``--pipe``, ou que l'option ``--pipe`` est combinée avec des options incompatibles.
+
+    Scénarios testés:
+        - Aucun fichier log ni option ``--pipe``.
+        - Option ``--pipe`` avec un fichier log.
+        - Option ``--pipe`` avec une analyse multi-filtres, des regroupements ou le
+          moteur ``pandas``.
+        - Intervalle d'exportation nul.
+
+    Asserts:
+        - Une exception :class:`ArgumentCLIException` est levée.
+
+    Args:
+        parseur_arguments_cli (ParseurArgumentsCLI): Fixture pour l'instance 
+            de la classe :class:`ParseurArgumentsCLI`.
+        arguments (list): Les arguments de la CLI.
+    """
+    with pytest.raises(ArgumentCLIException):
+        parseur_arguments_cli.parse_args(args=arguments)
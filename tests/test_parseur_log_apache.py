@@ -41,6 +41,26 @@ def test_parseur_log_exception_fichier_introuvable():
     with pytest.raises(FichierLogApacheIntrouvableException):
         parseur = ParseurLogApache("fichier/existe/pas.txt")
 
+def test_parseur_log_entree_standard(log_apache, monkeypatch):
+    """
+    Vérifie que le chemin ``-`` désigne l'entrée standard.
+
+    Scénarios testés:
+        - Parsage de l'entrée standard redirigée vers un fichier de log valide.
+
+    Asserts:
+        - Aucune exception n'est levée à la création du parseur.
+        - Toutes les entrées de l'entrée standard sont parsées.
+
+    Args:
+        log_apache (Callable): Fixture pour créer un fichier de log Apache.
+        monkeypatch (MonkeyPatch): Fixture pour remplacer l'entrée standard.
+    """
+    with open(log_apache(True), "r", encoding="utf-8") as entree_standard:
+        monkeypatch.setattr("sys.stdin", entree_standard)
+        fichier = ParseurLogApache(ParseurLogApache.ENTREE_STANDARD).parse_fichier()
+    assert len(fichier.entrees) == len(lignes_valides)
+
 @pytest.mark.parametrize("parseur_log_apache", [False], indirect=["parseur_log_apache"])
 def test_parseur_log_exception_fichier_invalide(parseur_log_apache):
     """
@@ -115,6 +135,23 @@ def test_parseur_log_nombre_entrees_valide(parseur_log_apache):
     fichier_log = parseur_log_apache.parse_fichier()
     assert len(fichier_log.entrees) == len(lignes_valides)
 
+def test_parseur_log_iter_entrees(parseur_log_apache):
+    """
+    Vérifie que le parcours en flux des entrées produit les mêmes entrées que le
+    parsage complet du fichier.
+
+    Scénarios testés:
+        - Parcours des entrées d'un fichier valide.
+
+    Asserts:
+        - Les entrées parcourues sont égales à celles du fichier parsé, dans le même ordre.
+
+    Args:
+        parseur_log_apache (ParseurLogApache): Fixture pour l'instance
+            de la classe :class:`ParseurLogApache`.
+    """
+    assert list(parseur_log_apache.iter_entrees()) == parseur_log_apache.parse_fichier().entrees
+
 @pytest.mark.parametrize("analyse_regex, nom_information", [
     (False, "Information"),
     ({}, False)
@@ -203,6 +240,36 @@ def test_parsage_entree_valide(parseur_log_apache):
     assert entree.requete.ancienne_url == "/home"
     assert entree.reponse.code_statut_http == 200
     assert entree.reponse.taille_octets == 532
+    assert entree.reponse.temps_reponse is None
+
+@pytest.mark.parametrize("ligne, temps_reponse_attendu", [
+    ('192.168.1.1 - - [12/Jan/2025:10:15:32 +0000] "GET / HTTP/1.1" 200 532 1234', 1234),
+    ('192.168.1.1 - - [12/Jan/2025:10:15:32 +0000] "GET / HTTP/1.1" 200 532 '
+     '"/home" "Chrome/133.0.0.0" 98765', 98765),
+    ('192.168.1.1 - - [12/Jan/2025:10:15:32 +0000] "GET / HTTP/1.1" 200 532 '
+     '"/home" "Chrome/133.0.0.0"', None)
+])
+def test_parsage_entree_temps_reponse(parseur_log_apache, ligne, temps_reponse_attendu):
+    """
+    Vérifie que le temps de réponse (``%D``) est récupéré lorsque il termine l'entrée.
+
+    Scénarios testés:
+        - Format commun suivi du temps de réponse.
+        - Format combiné suivi du temps de réponse.
+        - Format combiné sans temps de réponse.
+
+    Asserts:
+        - Le temps de réponse est égal à celui attendu.
+
+    Args:
+        parseur_log_apache (ParseurLogApache): Fixture pour l'instance 
+            de la classe :class:`ParseurLogApache`.
+        ligne (str): L'entrée à analyser.
+        temps_reponse_attendu (Optional[int]): Le temps de réponse attendu.
+    """
+    entree = parseur_log_apache.parse_entree(ligne)
+    assert entree.reponse.temps_reponse == temps_reponse_attendu
+    assert entree.reponse.taille_octets == 532
 
 def test_parseur_log_exception_extraction_informations_client_type_invalide(parseur_log_apache):
     """
@@ -256,4 +323,59 @@ def test_parseur_log_exception_extraction_informations_reponse_type_invalide(par
             de la classe :class:`ParseurLogApache`.
     """
     with pytest.raises(TypeError):
-        parseur_log_apache._extraire_informations_reponse(False)
\ No newline at end of file
+        parseur_log_apache._extraire_informations_reponse(False)
+@pytest.mark.parametrize("ligne, hote_virtuel_attendu, adresse_ip_attendue", [
+    ('www.exemple.fr:443 192.168.1.1 - - [12/Jan/2025:10:15:32 +0000] "GET / HTTP/1.1" 200 532',
+     "www.exemple.fr:443", "192.168.1.1"),
+    ('::1 - - [12/Jan/2025:10:15:32 +0000] "GET / HTTP/1.1" 200 532', None, "::1"),
+    ('2001:db8::1 - - [12/Jan/2025:10:15:32 +0000] "GET / HTTP/1.1" 200 532', None, "2001:db8::1")
+])
+def test_parsage_entree_hote_virtuel(parseur_log_apache,
+                                     ligne,
+                                     hote_virtuel_attendu,
+                                     adresse_ip_attendue):
+    """
+    Vérifie que l'hôte virtuel (format ``vhost_combined``) est récupéré lorsque
+    il précède l'adresse IP, sans être confondu avec une adresse IPv6.
+
+    Scénarios testés:
+        - Entrée préfixée par un hôte virtuel et son port.
+        - Entrées sans hôte virtuel avec une adresse IPv6.
+
+    Asserts:
+        - L'hôte virtuel et l'adresse IP sont égaux à ceux attendus.
+
+    Args:
+        parseur_log_apache (ParseurLogApache): Fixture pour l'instance 
+            de la classe :class:`ParseurLogApache`.
+        ligne (str): L'entrée à analyser.
+        hote_virtuel_attendu (Optional[str]): L'hôte virtuel attendu.
+        adresse_ip_attendue (str): L'adresse IP attendue.
+    """
+    entree = parseur_log_apache.parse_entree(ligne)
+    assert entree.requete.hote_virtuel == hote_virtuel_attendu
+    assert entree.client.adresse_ip == adresse_ip_attendue
+
+def test_parsage_entree_horodatage_reutilise(parseur_log_apache):
+    """
+    Vérifie que l'horodatage d'entrées consécutives de la même seconde n'est converti
+    qu'une fois.
+
+    Scénarios testés:
+        - Deux entrées de la même seconde, puis une entrée d'une autre seconde.
+
+    Asserts:
+        - Les deux premières entrées partagent le même objet ``datetime``.
+        - La troisième entrée a son propre horodatage.
+
+    Args:
+        parseur_log_apache (ParseurLogApache): Fixture pour l'instance 
+            de la classe :class:`ParseurLogApache`.
+    """
+    ligne = '192.168.1.1 - - [12/Jan/2025:10:15:{} +0200] "GET / HTTP/1.1" 200 532'
+    premiere, deuxieme, troisieme = (
+        parseur_log_apache.parse_entree(ligne.format(seconde)) for seconde in ("32", "32", "33")
+    )
+    assert premiere.requete.horodatage is deuxieme.requete.horodatage
+    assert troisieme.requete.horodatage.second == 33
+    assert troisieme.requete.horodatage.utcoffset() == timedelta(hours=2)
@@ -0,0 +1,201 @@
+"""
+Module des tests unitaires pour le calcul des séries temporelles du trafic.
+"""
+
+from datetime import datetime, timedelta, timezone
+import pytest
+import numpy as np
+from analyse.series_temporelles import SeriesTemporelles
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("granularite, exception", [
+    (False, TypeError),
+    (3600, TypeError),
+    ("seconde", ValueError)
+])
+def test_series_temporelles_exception_granularite_invalide(granularite, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque la granularité est invalide.
+
+    Scénarios testés:
+        - Type incorrect pour le paramètre ``granularite``.
+        - Granularité inconnue.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        granularite (any): La granularité des séries.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        SeriesTemporelles(granularite)
+
+@pytest.mark.parametrize("secondes, octets, codes, exception", [
+    ([0], np.array([0]), np.array([200]), TypeError),
+    (np.array([0]), np.array([0, 1]), np.array([200]), ValueError)
+])
+def test_series_temporelles_exception_colonnes_invalides(secondes, octets, codes, exception):
+    """
+    Vérifie que la méthode ``calcule`` renvoie une erreur lorsque les colonnes
+    sont invalides.
+
+    Scénarios testés:
+        - Une colonne n'est pas un tableau NumPy.
+        - Les colonnes n'ont pas la même taille.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        secondes (any): Les horodatages.
+        octets (any): Les tailles des réponses.
+        codes (any): Les codes de statut http.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        SeriesTemporelles().calcule(secondes, octets, codes)
+
+def test_series_temporelles_vide():
+    """
+    Vérifie le calcul des séries temporelles sans aucune entrée.
+
+    Scénarios testés:
+        - Colonnes vides.
+
+    Asserts:
+        - Aucune série n'est retournée et le pic est égal à 0.
+    """
+    vide = np.array([], dtype=np.int64)
+    series = SeriesTemporelles("minute").calcule(vide, vide, vide)
+    assert series == {"granularite": "minute", "pic_requetes_par_seconde": 0, "series": []}
+
+@pytest.mark.parametrize("granularite, nombre_series", [
+    ("minute", 3), ("heure", 2), ("jour", 1)
+])
+def test_series_temporelles_regroupement_valide(granularite, nombre_series):
+    """
+    Vérifie le regroupement des requêtes, octets et erreurs par intervalle.
+
+    Scénarios testés:
+        - Regroupement de requêtes sur deux heures d'une même journée.
+
+    Asserts:
+        - Le nombre d'intervalles dépend de la granularité.
+        - Les totaux de toutes les séries correspondent aux colonnes.
+        - Le pic de requêtes par seconde est correct.
+
+    Args:
+        granularite (str): La granularité des séries.
+        nombre_series (int): Le nombre d'intervalles attendu.
+    """
+    secondes = np.array([0, 0, 0, 90, 3600, 3650], dtype=np.int64)
+    octets = np.array([10, 20, 0, 5, 100, 1], dtype=np.int64)
+    codes = np.array([200, 404, 500, 200, 200, 301], dtype=np.int64)
+    resultat = SeriesTemporelles(granularite).calcule(secondes, octets, codes)
+    series = resultat["series"]
+    assert len(series) == nombre_series
+    assert resultat["pic_requetes_par_seconde"] == 3
+    assert sum(serie["requetes"] for serie in series) == 6
+    assert sum(serie["octets"] for serie in series) == 136
+    assert sum(serie["erreurs"] for serie in series) == 2
+    assert series[0]["debut"] == "1970-01-01T00:00:00+00:00"
+    assert series[0]["pic_requetes_par_seconde"] == 3
+    assert series[-1]["pic_requetes_par_seconde"] == (1 if nombre_series > 1 else 3)
+
+def test_series_temporelles_par_seconde_identique():
+    """
+    Vérifie que le calcul à partir d'agrégats par seconde donne le même résultat
+    que le calcul à partir des colonnes par entrée.
+
+    Scénarios testés:
+        - Colonnes agrégées manuellement par seconde.
+
+    Asserts:
+        - Les deux calculs sont identiques.
+    """
+    series_temporelles = SeriesTemporelles("minute")
+    resultat = series_temporelles.calcule(
+        np.array([0, 0, 0, 90, 3600, 3650], dtype=np.int64),
+        np.array([10, 20, 0, 5, 100, 1], dtype=np.int64),
+        np.array([200, 404, 500, 200, 200, 301], dtype=np.int64)
+    )
+    resultat_par_seconde = series_temporelles.calcule_par_seconde(
+        np.array([0, 90, 3600, 3650], dtype=np.int64),
+        np.array([3, 1, 1, 1], dtype=np.int64),
+        np.array([30, 5, 100, 1], dtype=np.int64),
+        np.array([2, 0, 0, 0], dtype=np.int64)
+    )
+    assert resultat_par_seconde == resultat
+
+def test_series_temporelles_par_intervalle():
+    """
+    Vérifie le calcul à partir d'agrégats par intervalle qui portent leur pic de
+    requêtes par seconde.
+
+    Scénarios testés:
+        - Deux intervalles d'une minute, et des agrégats mal formés.
+
+    Asserts:
+        - Le résultat est identique au calcul à partir des colonnes par entrée.
+        - Des agrégats qui n'ont pas quatre colonnes lèvent une :class:`ValueError`.
+    """
+    series_temporelles = SeriesTemporelles("minute")
+    resultat = series_temporelles.calcule(
+        np.array([0, 0, 0, 30, 3600, 3650], dtype=np.int64),
+        np.array([10, 20, 0, 5, 100, 1], dtype=np.int64),
+        np.array([200, 404, 500, 200, 200, 301], dtype=np.int64)
+    )
+    resultat_par_intervalle = series_temporelles.calcule_par_intervalle(
+        np.array([0, 3600], dtype=np.int64),
+        np.array([[4, 35, 2, 3], [2, 101, 0, 1]], dtype=np.int64)
+    )
+    assert resultat_par_intervalle == resultat
+    with pytest.raises(ValueError):
+        series_temporelles.calcule_par_intervalle(np.array([0]), np.array([[1, 2, 3]]))
+
+def test_series_temporelles_conversion_horodatages():
+    """
+    Vérifie la conversion des horodatages en secondes depuis l'epoch.
+
+    Scénarios testés:
+        - Des horodatages avec fuseau horaire, dont des objets répétés et des objets
+          distincts de même valeur.
+
+    Asserts:
+        - Les secondes sont celles de ``timestamp``, une valeur par horodatage.
+        - Une liste vide donne un tableau vide.
+    """
+    premier = datetime(2025, 1, 12, 10, 0, 0, tzinfo=timezone(timedelta(hours=2)))
+    second = datetime(2025, 1, 12, 8, 0, 1, tzinfo=timezone.utc)
+    horodatages = [premier, premier, second, premier.replace(), premier]
+    secondes = SeriesTemporelles.convertit_horodatages(horodatages)
+    assert secondes.dtype == np.int64
+    assert secondes.tolist() == [int(horodatage.timestamp()) for horodatage in horodatages]
+    assert SeriesTemporelles.convertit_horodatages([]).tolist() == []
+
+def test_series_temporelles_jour_utc():
+    """
+    Vérifie que les intervalles ``jour`` sont alignés sur minuit UTC, et non sur
+    le décalage horaire des entrées.
+
+    Scénarios testés:
+        - Deux entrées du même jour dans le fuseau ``+0200``, de part et d'autre
+          de minuit UTC.
+
+    Asserts:
+        - Les entrées sont comptées dans deux jours UTC différents.
+    """
+    fuseau = timezone(timedelta(hours=2))
+    secondes = SeriesTemporelles.convertit_horodatages([
+        datetime(2025, 1, 12, 1, 0, 0, tzinfo=fuseau),
+        datetime(2025, 1, 12, 3, 0, 0, tzinfo=fuseau)
+    ])
+    resultat = SeriesTemporelles("jour").calcule(
+        secondes, np.zeros(2, dtype=np.int64), np.full(2, 200, dtype=np.int64)
+    )
+    assert [serie["debut"] for serie in resultat["series"]] == [
+        "2025-01-11T00:00:00+00:00", "2025-01-12T00:00:00+00:00"
+    ]
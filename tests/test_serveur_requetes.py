@@ -0,0 +1,198 @@
+"""
+Module des tests unitaires pour le serveur local de requêtes d'analyse.
+"""
+
+import json
+import pytest
+from threading import Thread
+from urllib.error import HTTPError
+from urllib.request import urlopen
+from parse.fichier_log_apache import FichierLogApache
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from analyse.moteur_groupement import SpecificationGroupement
+from serveur.serveur_requetes import ServeurRequetes
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("fichiers, taille_cache, exception", [
+    ("access.log", 128, TypeError),
+    ([], 128, ValueError),
+    (None, "128", TypeError),
+    (None, -1, ValueError)
+])
+def test_serveur_requetes_exception_parametres_invalides(fichier_log_apache,
+                                                         fichiers,
+                                                         taille_cache,
+                                                         exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Fichiers qui ne sont pas une liste de :class:`FichierLogApache`.
+        - Liste de fichiers vide.
+        - Taille du cache qui n'est pas un entier ou qui est négative.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        fichiers (any): Les fichiers (``None`` pour le fichier de test).
+        taille_cache (any): La taille du cache.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        ServeurRequetes(fichiers if fichiers is not None else [fichier_log_apache],
+                        taille_cache)
+
+def test_serveur_requetes_analyse(fichier_log_apache):
+    """
+    Vérifie que la route ``/analyse`` retourne la même analyse qu'un
+    :class:`AnalyseurLogApache` et que les réponses sont mises en cache.
+
+    Scénarios testés:
+        - Analyse avec un filtre, un top, une granularité et des regroupements.
+        - Même requête avec les paramètres dans un autre ordre.
+
+    Asserts:
+        - L'analyse est identique à celle d'un analyseur avec les mêmes paramètres.
+        - La seconde requête retourne la réponse en cache.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+    """
+    serveur_requetes = ServeurRequetes([fichier_log_apache])
+    code, analyse = serveur_requetes.repond(
+        "/analyse?code=500&expression=url%20%5E%3D%20%2Findex&top=2&granularite=jour"
+        "&groupement=ip&groupement=methode,code"
+    )
+    attendue = AnalyseurLogApache(
+        fichier_log_apache, FiltreLogApache(None, 500, "url ^= /index"), 2, "jour",
+        groupements=[SpecificationGroupement("ip"), SpecificationGroupement("methode,code")]
+    ).get_analyse_complete()
+    assert code == 200
+    assert analyse == attendue
+    assert serveur_requetes.repond(
+        "/analyse?groupement=ip&groupement=methode,code&granularite=jour&top=2"
+        "&expression=url%20%5E%3D%20%2Findex&code=500"
+    )[1] is analyse
+
+@pytest.mark.parametrize("url, code_attendu", [
+    ("/inconnue", 404),
+    ("/analyse?fichier=absent.log", 404),
+    ("/analyse?code=abc", 400),
+    ("/analyse?code=500&code=404", 400),
+    ("/analyse?pays=fr", 400),
+    ("/analyse?expression=code%20%3D", 400),
+    ("/analyse?granularite=semaine", 400),
+    ("/analyse?groupement=pays", 400),
+    ("/analyse?ip=", 400),
+    ("/analyse?expression=%20", 400),
+    ("/analyse?ip=@liste.txt", 400)
+])
+def test_serveur_requetes_erreurs(fichier_log_apache, url, code_attendu):
+    """
+    Vérifie que les requêtes invalides reçoivent une réponse d'erreur.
+
+    Scénarios testés:
+        - Route inconnue et fichier non chargé.
+        - Paramètre invalide, répété ou inconnu.
+        - Expression, granularité ou regroupement invalide.
+        - Paramètre vide ou adresse IP qui fait référence à un fichier.
+
+    Asserts:
+        - Le code de statut http est celui attendu et la réponse contient l'erreur.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        url (str): La requête.
+        code_attendu (int): Le code de statut http attendu.
+    """
+    code, contenu = ServeurRequetes([fichier_log_apache]).repond(url)
+    assert code == code_attendu
+    assert "erreur" in contenu
+
+def test_serveur_requetes_plusieurs_fichiers(fichier_log_apache):
+    """
+    Vérifie le choix du fichier analysé lorsque plusieurs fichiers sont chargés.
+
+    Scénarios testés:
+        - Liste des fichiers chargés.
+        - Analyse sans préciser le fichier, puis en le précisant.
+
+    Asserts:
+        - Les deux fichiers sont listés avec leur nombre d'entrées.
+        - Une erreur est retournée sans fichier précisé, l'analyse sinon.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+    """
+    serveur_requetes = ServeurRequetes([fichier_log_apache, FichierLogApache("vide.log")])
+    code, contenu = serveur_requetes.repond("/fichiers")
+    assert code == 200
+    assert [fichier["total_entrees"] for fichier in contenu["fichiers"]] == [5, 0]
+    assert serveur_requetes.repond("/analyse")[0] == 400
+    code, analyse = serveur_requetes.repond("/analyse?fichier=vide.log")
+    assert code == 200
+    assert analyse["total_entrees"] == 0
+
+def test_serveur_requetes_http(fichier_log_apache):
+    """
+    Vérifie que le serveur HTTP répond en JSON sur la machine locale.
+
+    Scénarios testés:
+        - Requête valide puis requête sur une route inconnue.
+
+    Asserts:
+        - La réponse valide est l'analyse en JSON.
+        - La route inconnue retourne le code de statut http 404.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+    """
+    serveur = ServeurRequetes([fichier_log_apache]).cree_serveur_http("127.0.0.1", 0)
+    Thread(target=serveur.serve_forever, daemon=True).start()
+    try:
+        adresse = f"http://127.0.0.1:{serveur.server_address[1]}"
+        with urlopen(f"{adresse}/analyse?ip=::1", timeout=5) as reponse:
+            analyse = json.loads(reponse.read().decode("utf-8"))
+        assert analyse["statistiques"]["total_entrees_filtre"] == 3
+        with pytest.raises(HTTPError) as erreur:
+            urlopen(f"{adresse}/inconnue", timeout=5)
+        assert erreur.value.code == 404
+    finally:
+        serveur.shutdown()
+        serveur.server_close()
+
+def test_serveur_requetes_fichier_refuse(fichier_log_apache, tmp_path):
+    """
+    Vérifie qu'une requête ne peut pas faire lire un fichier du serveur.
+
+    Scénarios testés:
+        - Expression qui compare l'adresse IP à une liste lue depuis un fichier
+          existant dont les lignes ne sont pas des adresses IP.
+
+    Asserts:
+        - La requête reçoit une réponse d'erreur ``400``.
+        - Le contenu du fichier n'apparaît pas dans l'erreur.
+
+    Args:
+        fichier_log_apache (FichierLogApache): Fixture pour l'instance
+            de la classe :class:`FichierLogApache`.
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    chemin_secret = tmp_path / "secret.txt"
+    chemin_secret.write_text("root:x:0:0:root:/root:/bin/bash\n")
+    code, contenu = ServeurRequetes([fichier_log_apache]).repond(
+        f"/analyse?expression=ip%20in%20@{chemin_secret}"
+    )
+    assert code == 400
+    assert "root:x" not in contenu["erreur"]
@@ -0,0 +1,282 @@
+"""
+Module des tests unitaires pour le sketch d'estimation de quantiles.
+"""
+
+import json
+import pytest
+from random import Random
+from analyse.sketch_quantiles import SketchQuantiles
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("k, graine", [
+    (False, 0),
+    ("200", 0),
+    (200, None)
+])
+def test_sketch_exception_type_invalide(k, graine):
+    """
+    Vérifie que la classe renvoie une erreur lorsque un argument de type invalide
+    est passé dans le constructeur.
+
+    Scénarios testés:
+        - Type incorrect pour le paramètre ``k``.
+        - Type incorrect pour le paramètre ``graine``.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+
+    Args:
+        k (any): La précision du sketch.
+        graine (any): La graine du générateur pseudo-aléatoire.
+    """
+    with pytest.raises(TypeError):
+        SketchQuantiles(k, graine)
+
+def test_sketch_exception_valeur_k_invalide():
+    """
+    Vérifie que la classe renvoie une erreur lorsque la précision est trop faible.
+
+    Scénarios testés:
+        - Précision ``k`` inférieure à 8.
+
+    Asserts:
+        - Une exception :class:`ValueError` est levée.
+    """
+    with pytest.raises(ValueError):
+        SketchQuantiles(4)
+
+@pytest.mark.parametrize("valeur", [
+    (None), ("12"), (True)
+])
+def test_sketch_exception_ajoute_type_invalide(valeur):
+    """
+    Vérifie que la méthode ``ajoute`` renvoie une erreur lorsque la valeur n'est
+    pas un nombre.
+
+    Scénarios testés:
+        - Ajout d'une valeur qui n'est pas un nombre.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+
+    Args:
+        valeur (any): La valeur à ajouter.
+    """
+    with pytest.raises(TypeError):
+        SketchQuantiles().ajoute(valeur)
+
+@pytest.mark.parametrize("rang, exception", [
+    ("0.5", TypeError),
+    (-0.1, ValueError),
+    (1.5, ValueError)
+])
+def test_sketch_exception_quantile_invalide(rang, exception):
+    """
+    Vérifie que la méthode ``quantile`` renvoie une erreur lorsque le quantile
+    demandé est invalide.
+
+    Scénarios testés:
+        - Type incorrect pour le paramètre ``rang``.
+        - Valeur hors de l'intervalle [0, 1].
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        rang (any): Le quantile demandé.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        SketchQuantiles().quantile(rang)
+
+def test_sketch_vide():
+    """
+    Vérifie que les statistiques d'un sketch vide ne contiennent aucune valeur.
+
+    Scénarios testés:
+        - Statistiques d'un sketch sans valeur.
+
+    Asserts:
+        - Le total est égal à 0 et toutes les autres statistiques sont ``None``.
+    """
+    statistiques = SketchQuantiles().get_statistiques()
+    assert statistiques["total"] == 0
+    for cle in ("minimum", "maximum", "p50", "p90", "p99", "p999"):
+        assert statistiques[cle] is None
+
+def test_sketch_quantiles_exacts_petit_volume():
+    """
+    Vérifie que les quantiles sont exacts lorsque le nombre de valeurs est inférieur
+    à la capacité du sketch.
+
+    Scénarios testés:
+        - Ajout des valeurs de 1 à 100 dans le désordre.
+
+    Asserts:
+        - Les quantiles correspondent au rang le plus proche.
+        - Le minimum, le maximum et le total sont corrects.
+    """
+    sketch = SketchQuantiles()
+    valeurs = list(range(1, 101))
+    Random(1).shuffle(valeurs)
+    for valeur in valeurs:
+        sketch.ajoute(valeur)
+    statistiques = sketch.get_statistiques()
+    assert statistiques["total"] == 100
+    assert statistiques["minimum"] == 1
+    assert statistiques["maximum"] == 100
+    assert statistiques["p50"] == 50
+    assert statistiques["p90"] == 90
+    assert statistiques["p99"] == 99
+    assert statistiques["p999"] == 100
+
+def test_sketch_quantiles_approches_grand_volume():
+    """
+    Vérifie que le sketch borne sa mémoire et estime correctement les quantiles
+    sur un grand nombre de valeurs.
+
+    Scénarios testés:
+        - Ajout de 100 000 valeurs distinctes.
+
+    Asserts:
+        - Le nombre de valeurs conservées est très inférieur au nombre de valeurs ajoutées.
+        - L'erreur de rang des quantiles reste inférieure à 2%.
+    """
+    sketch = SketchQuantiles()
+    valeurs = list(range(100000))
+    Random(2).shuffle(valeurs)
+    for valeur in valeurs:
+        sketch.ajoute(valeur)
+    assert sum(len(compacteur) for compacteur in sketch._compacteurs) < 2000
+    for rang in (0.5, 0.9, 0.99):
+        assert abs(sketch.quantile(rang) - rang * 100000) < 2000
+
+def test_sketch_fusion():
+    """
+    Vérifie que la fusion de deux sketchs donne les mêmes garanties qu'un sketch
+    alimenté par toutes les valeurs.
+
+    Scénarios testés:
+        - Fusion de deux sketchs alimentés par deux moitiés d'un même flux.
+
+    Asserts:
+        - Le total, le minimum et le maximum sont ceux de l'ensemble des valeurs.
+        - La médiane reste proche de la médiane réelle.
+    """
+    sketch_a = SketchQuantiles()
+    sketch_b = SketchQuantiles()
+    for valeur in range(0, 50000):
+        sketch_a.ajoute(valeur)
+    for valeur in range(50000, 100000):
+        sketch_b.ajoute(valeur)
+    sketch_a.fusionne(sketch_b)
+    assert sketch_a.total == 100000
+    assert sketch_a.minimum == 0
+    assert sketch_a.maximum == 99999
+    assert abs(sketch_a.quantile(0.5) - 50000) < 2000
+
+def test_sketch_exception_fusion_type_invalide():
+    """
+    Vérifie que la méthode ``fusionne`` renvoie une erreur lorsque le paramètre
+    n'est pas un sketch.
+
+    Scénarios testés:
+        - Fusion avec un objet qui n'est pas un :class:`SketchQuantiles`.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    with pytest.raises(TypeError):
+        SketchQuantiles().fusionne([1, 2, 3])
+
+def test_sketch_ajoute_valeurs_identique_ajoute():
+    """
+    Vérifie que l'ajout par blocs donne exactement le même sketch que des ajouts
+    successifs.
+
+    Scénarios testés:
+        - Ajout de 20 000 valeurs aléatoires, en une liste puis une par une.
+
+    Asserts:
+        - Les statistiques et les compacteurs des deux sketchs sont identiques.
+    """
+    aleatoire = Random(7)
+    valeurs = [aleatoire.randint(0, 10000) for _ in range(20000)]
+    sketch_blocs = SketchQuantiles()
+    sketch_blocs.ajoute_valeurs(valeurs[:5000])
+    sketch_blocs.ajoute_valeurs(valeurs[5000:])
+    sketch_unitaire = SketchQuantiles()
+    for valeur in valeurs:
+        sketch_unitaire.ajoute(valeur)
+    assert sketch_blocs.get_statistiques() == sketch_unitaire.get_statistiques()
+    assert sketch_blocs._compacteurs == sketch_unitaire._compacteurs
+
+@pytest.mark.parametrize("valeurs", [
+    (1, 2, 3),
+    [1, "2", 3],
+    [True]
+])
+def test_sketch_exception_ajoute_valeurs_type_invalide(valeurs):
+    """
+    Vérifie que la méthode ``ajoute_valeurs`` renvoie une erreur lorsque les valeurs
+    sont invalides.
+
+    Scénarios testés:
+        - Valeurs qui ne sont pas dans une liste.
+        - Liste contenant une valeur qui n'est pas un nombre.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+
+    Args:
+        valeurs (any): Les valeurs à ajouter.
+    """
+    with pytest.raises(TypeError):
+        SketchQuantiles().ajoute_valeurs(valeurs)
+
+def test_sketch_serialisation():
+    """
+    Vérifie qu'un sketch reconstruit depuis son dictionnaire est identique au sketch
+    d'origine et peut continuer à recevoir des valeurs.
+
+    Scénarios testés:
+        - Sérialisation JSON d'un sketch compacté puis ajout de nouvelles valeurs.
+
+    Asserts:
+        - Les statistiques du sketch reconstruit sont identiques.
+        - Le total et le minimum sont mis à jour après de nouveaux ajouts.
+    """
+    sketch = SketchQuantiles()
+    sketch.ajoute_valeurs(list(range(5000)))
+    sketch_reconstruit = SketchQuantiles.depuis_dict(json.loads(json.dumps(sketch.get_dict())))
+    assert sketch_reconstruit.get_statistiques() == sketch.get_statistiques()
+    sketch_reconstruit.ajoute_valeurs(list(range(-100, 0)))
+    assert sketch_reconstruit.total == 5100
+    assert sketch_reconstruit.minimum == -100
+
+@pytest.mark.parametrize("etat, exception", [
+    ([], TypeError),
+    ({"k": 200}, ValueError),
+    ({"k": 200, "graine": 0, "total": 0, "minimum": None, "maximum": None,
+      "compacteurs": []}, ValueError)
+])
+def test_sketch_exception_depuis_dict_invalide(etat, exception):
+    """
+    Vérifie que ``depuis_dict`` renvoie une erreur lorsque l'état est invalide.
+
+    Scénarios testés:
+        - État qui n'est pas un dictionnaire.
+        - État incomplet.
+        - État sans compacteur.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        etat (any): L'état du sketch.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        SketchQuantiles.depuis_dict(etat)
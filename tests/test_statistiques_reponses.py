@@ -0,0 +1,121 @@
+"""
+Module des tests unitaires pour les statistiques fusionnables des réponses.
+"""
+
+import json
+import pytest
+from donnees.reponse_informations import ReponseInformations
+from analyse.statistiques_reponses import StatistiquesReponses
+
+
+# Tests unitaires
+
+def test_statistiques_reponses_repartition_codes():
+    """
+    Vérifie que la répartition des codes est triée par total décroissant.
+
+    Scénarios testés:
+        - Ajout de réponses de trois codes, dont deux à égalité.
+
+    Asserts:
+        - Les totaux et les taux sont exacts.
+        - Les codes à égalité restent dans l'ordre de première apparition.
+        - Les réponses sans taille ne sont pas ajoutées au sketch de la taille.
+    """
+    statistiques = StatistiquesReponses()
+    for code, taille in [(404, 10), (200, 20), (500, None), (200, 30)]:
+        statistiques.ajoute(ReponseInformations(code, taille))
+    assert statistiques.get_repartition_codes(4) == [
+        {"code": 200, "total": 2, "taux": 50.0},
+        {"code": 404, "total": 1, "taux": 25.0},
+        {"code": 500, "total": 1, "taux": 25.0}
+    ]
+    quantiles = statistiques.get_statistiques_quantiles("taille_octets")
+    assert quantiles["global"]["total"] == 3
+    assert [statistique["code"] for statistique in quantiles["par_code_statut_http"]] \
+        == [200, 404]
+
+def test_statistiques_reponses_fusion():
+    """
+    Vérifie que la fusion de statistiques équivaut à l'ajout de toutes les réponses.
+
+    Scénarios testés:
+        - Fusion de deux statistiques alimentées par des réponses distinctes.
+
+    Asserts:
+        - Le résultat est identique aux statistiques alimentées par toutes les réponses.
+        - Les statistiques fusionnées ne sont pas modifiées.
+    """
+    reponses = [ReponseInformations(200 + 100 * (i % 3), i, i * 10) for i in range(30)]
+    completes = StatistiquesReponses()
+    premieres = StatistiquesReponses()
+    dernieres = StatistiquesReponses()
+    for i, reponse in enumerate(reponses):
+        completes.ajoute(reponse)
+        (premieres if i < 12 else dernieres).ajoute(reponse)
+    dict_dernieres = dernieres.get_dict()
+    premieres.fusionne(dernieres)
+    assert premieres.get_repartition_codes(30) == completes.get_repartition_codes(30)
+    for champ in StatistiquesReponses.CHAMPS_QUANTILES:
+        assert premieres.get_statistiques_quantiles(champ) \
+            == completes.get_statistiques_quantiles(champ)
+    assert dernieres.get_dict() == dict_dernieres
+
+def test_statistiques_reponses_fusion_exception_type():
+    """
+    Vérifie que la fusion renvoie une erreur lorsque le paramètre n'est pas du bon type.
+
+    Scénarios testés:
+        - Fusion d'un dictionnaire.
+
+    Asserts:
+        - Une exception :class:`TypeError` est levée.
+    """
+    with pytest.raises(TypeError):
+        StatistiquesReponses().fusionne({})
+
+def test_statistiques_reponses_serialisation():
+    """
+    Vérifie que les statistiques sont reconstruites à l'identique depuis leur
+    dictionnaire JSON.
+
+    Scénarios testés:
+        - Sérialisation JSON puis reconstruction de statistiques non vides.
+
+    Asserts:
+        - Les statistiques reconstruites ont le même dictionnaire et les mêmes quantiles.
+    """
+    statistiques = StatistiquesReponses()
+    for i in range(20):
+        statistiques.ajoute(ReponseInformations(404 if i % 4 else 200, i * 3, i))
+    reconstruites = StatistiquesReponses.depuis_dict(
+        json.loads(json.dumps(statistiques.get_dict()))
+    )
+    assert reconstruites.get_dict() == statistiques.get_dict()
+    assert reconstruites.get_statistiques_quantiles("temps_reponse") \
+        == statistiques.get_statistiques_quantiles("temps_reponse")
+
+@pytest.mark.parametrize("etat, exception", [
+    ({"sketchs": {}}, KeyError),
+    ({"codes": [[200, 1]], "sketchs": {}}, KeyError),
+    ({"codes": 3, "sketchs": {}}, TypeError)
+])
+def test_statistiques_reponses_depuis_dict_invalide(etat, exception):
+    """
+    Vérifie que la reconstruction renvoie une erreur lorsque le dictionnaire est
+    invalide.
+
+    Scénarios testés:
+        - Codes absents.
+        - Sketchs absents.
+        - Codes qui ne sont pas une liste.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        etat (dict): Les statistiques sérialisées.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        StatistiquesReponses.depuis_dict(etat)
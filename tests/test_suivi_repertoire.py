@@ -0,0 +1,164 @@
+"""
+Module des tests unitaires pour le suivi incrémental des fichiers log d'un répertoire.
+"""
+
+import os
+import pytest
+from serveur.suivi_repertoire import SuiviRepertoireLogs
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("parametres, exception", [
+    ({"repertoire": 8}, TypeError),
+    ({"depuis_debut": "oui"}, TypeError),
+    ({"octets_max_par_passe": 1.5}, TypeError),
+    ({"repertoire": "absent/"}, ValueError),
+    ({"octets_max_par_passe": 0}, ValueError)
+])
+def test_suivi_repertoire_exception_parametres_invalides(tmp_path, parametres, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Paramètres d'un type incorrect.
+        - Répertoire introuvable et nombre d'octets par passe nul.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        parametres (dict): Les paramètres qui remplacent ceux par défaut.
+        exception (type): L'exception attendue.
+    """
+    arguments = {"repertoire": str(tmp_path)}
+    arguments.update(parametres)
+    with pytest.raises(exception):
+        SuiviRepertoireLogs(**arguments)
+
+def test_suivi_repertoire_nouvelles_lignes(tmp_path):
+    """
+    Vérifie que seules les lignes complètes ajoutées depuis la passe précédente
+    sont lues.
+
+    Scénarios testés:
+        - Fichier présent à la création du suivi (lu à partir de sa fin).
+        - Ajout d'une ligne complète puis d'une ligne incomplète.
+        - Fichier qui ne correspond pas au motif.
+        - Nouveau fichier créé après le démarrage.
+
+    Asserts:
+        - Chaque passe retourne uniquement les nouvelles lignes complètes.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    fichier = tmp_path / "access.log"
+    fichier.write_text("ancienne\n")
+    (tmp_path / "notes.txt").write_text("ignoree\n")
+    suivi = SuiviRepertoireLogs(str(tmp_path))
+    assert suivi.get_total_fichiers() == 1
+    assert suivi.lit_nouvelles_lignes() == []
+
+    with open(fichier, "a", encoding="utf-8") as log:
+        log.write("ligne 1\nligne 2 incompl")
+    assert suivi.lit_nouvelles_lignes() == [(str(fichier), "ligne 1")]
+    with open(fichier, "a", encoding="utf-8") as log:
+        log.write("ete\n")
+    assert suivi.lit_nouvelles_lignes() == [(str(fichier), "ligne 2 incomplete")]
+    assert suivi.lit_nouvelles_lignes() == []
+
+    nouveau = tmp_path / "erreurs.log"
+    nouveau.write_text("nouvelle\n")
+    assert suivi.lit_nouvelles_lignes() == [(str(nouveau), "nouvelle")]
+
+def test_suivi_repertoire_rotations(tmp_path):
+    """
+    Vérifie le suivi des fichiers lors d'une rotation par renommage puis par
+    troncature.
+
+    Scénarios testés:
+        - Ancien fichier renommé après l'ajout de lignes, puis nouveau fichier créé.
+        - Fichier tronqué puis complété.
+
+    Asserts:
+        - Aucune ligne n'est perdue ni lue deux fois.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    fichier = tmp_path / "access.log"
+    fichier.write_text("a\n")
+    suivi = SuiviRepertoireLogs(str(tmp_path), depuis_debut=True)
+    assert suivi.lit_nouvelles_lignes() == [(str(fichier), "a")]
+
+    with open(fichier, "a", encoding="utf-8") as log:
+        log.write("b\n")
+    os.rename(fichier, tmp_path / "access.log.1")
+    fichier.write_text("c\n")
+    assert sorted(ligne for _, ligne in suivi.lit_nouvelles_lignes()) == ["b", "c"]
+
+    fichier.write_text("")
+    assert suivi.lit_nouvelles_lignes() == []
+    with open(fichier, "a", encoding="utf-8") as log:
+        log.write("d\n")
+    assert suivi.lit_nouvelles_lignes() == [(str(fichier), "d")]
+
+@pytest.mark.parametrize("motif", ["*.log", "*.log*"])
+def test_suivi_repertoire_rotation_copytruncate(tmp_path, motif):
+    """
+    Vérifie qu'une rotation par copie puis troncature (``copytruncate``) ne relit
+    pas les lignes déjà lues, et qu'une archive compressée n'est pas lue.
+
+    Scénarios testés:
+        - Cinquante lignes lues, puis une ligne ajoutée avant la copie du fichier dans
+          ``access.log.1`` et sa troncature, puis dix nouvelles lignes.
+        - Compression de la copie en ``access.log.1.gz``.
+        - Motif par défaut et motif qui correspond aussi aux rotations.
+
+    Asserts:
+        - Seules la ligne non lue avant la copie et les dix nouvelles lignes sont lues.
+        - L'archive n'est pas lue et la copie supprimée n'est plus suivie.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+        motif (str): Le motif des noms de fichiers suivis.
+    """
+    fichier = tmp_path / "access.log"
+    fichier.write_text("".join(f"ligne {numero}\n" for numero in range(50)))
+    suivi = SuiviRepertoireLogs(str(tmp_path), motif, depuis_debut=True)
+    assert len(suivi.lit_nouvelles_lignes()) == 50
+
+    with open(fichier, "a", encoding="utf-8") as log:
+        log.write("ligne 50\n")
+    (tmp_path / "access.log.1").write_bytes(fichier.read_bytes())
+    fichier.write_text("".join(f"nouvelle {numero}\n" for numero in range(10)))
+    lignes = [ligne for _, ligne in suivi.lit_nouvelles_lignes()]
+    assert sorted(lignes) == ["ligne 50"] + [f"nouvelle {numero}" for numero in range(10)]
+
+    (tmp_path / "access.log.1.gz").write_bytes(b"\x1f\x8b\x08\x00binaire\n")
+    os.remove(tmp_path / "access.log.1")
+    assert suivi.lit_nouvelles_lignes() == []
+    assert str(tmp_path / "access.log.1") not in suivi.get_chemins()
+
+def test_suivi_repertoire_octets_max_par_passe(tmp_path):
+    """
+    Vérifie que le nombre d'octets lus par passe est borné.
+
+    Scénarios testés:
+        - Fichier de trois lignes lu avec une limite d'une dizaine d'octets.
+
+    Asserts:
+        - Les lignes sont réparties sur plusieurs passes, sans perte.
+
+    Args:
+        tmp_path (Path): Chemin temporaire fourni par pytest.
+    """
+    (tmp_path / "access.log").write_text("ligne 1\nligne 2\nligne 3\n")
+    suivi = SuiviRepertoireLogs(str(tmp_path), depuis_debut=True, octets_max_par_passe=10)
+    lignes = []
+    for _ in range(3):
+        lignes.append([ligne for _, ligne in suivi.lit_nouvelles_lignes()])
+    assert lignes == [["ligne 1"], ["ligne 2"], ["ligne 3"]]
@@ -0,0 +1,120 @@
+"""
+Module des tests unitaires pour le travailleur d'une analyse distribuée.
+"""
+
+import pytest
+from analyse.filtre_log_apache import FiltreLogApache
+from analyse.analyseur_log_apache import AnalyseurLogApache
+from parse.parseur_log_apache import ParseurLogApache, FormatLogApacheInvalideException
+from serveur.coordinateur import Coordinateur
+from serveur.travailleur import Travailleur
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("hote, port, delai_connexion, exception", [
+    (None, 9500, 1.0, TypeError),
+    ("127.0.0.1", "9500", 1.0, TypeError),
+    ("127.0.0.1", 70000, 1.0, ValueError),
+    ("127.0.0.1", 9500, "1", TypeError),
+    ("127.0.0.1", 9500, 0, ValueError)
+])
+def test_travailleur_exception_parametres_invalides(hote, port, delai_connexion, exception):
+    """
+    Vérifie que la classe renvoie une erreur lorsque les paramètres du constructeur
+    sont invalides.
+
+    Scénarios testés:
+        - Adresse, port ou délai d'un type incorrect.
+        - Port hors limites ou délai nul.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        hote (any): L'adresse du coordinateur.
+        port (any): Le port du coordinateur.
+        delai_connexion (any): Le délai de connexion.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        Travailleur(hote, port, delai_connexion)
+
+@pytest.mark.parametrize("taille_tache", [1, 7, 64, 10000])
+def test_travailleur_lit_plage_chaque_ligne_une_fois(log_apache, taille_tache):
+    """
+    Vérifie que les plages d'un fichier lisent chaque ligne exactement une fois,
+    quelle que soit la position de leurs limites.
+
+    Scénarios testés:
+        - Plages de tailles variées (d'un octet au fichier entier).
+
+    Asserts:
+        - La concaténation des lignes des plages est égale au fichier.
+        - La position de chaque ligne est celle de son premier octet.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+        taille_tache (int): La taille des plages.
+    """
+    chemin = log_apache(True)
+    contenu = chemin.read_bytes().decode("utf-8")
+    lignes = []
+    for tache in Coordinateur.decoupe_fichiers([str(chemin)], taille_tache):
+        lignes.extend(Travailleur.lit_plage(tache["chemin"], tache["debut"], tache["fin"]))
+    assert "".join(ligne for _, ligne in lignes) == contenu
+    assert all(contenu.encode("utf-8")[position:].decode("utf-8").startswith(ligne)
+               for position, ligne in lignes)
+
+def test_travailleur_analyse_tache(log_apache):
+    """
+    Vérifie que l'analyse d'une tâche couvrant tout le fichier produit le même état
+    partiel que l'analyseur séquentiel.
+
+    Scénarios testés:
+        - Analyse d'une tâche avec un filtre.
+
+    Asserts:
+        - L'analyse complète de l'état est égale à celle de l'analyseur.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    chemin = str(log_apache(True))
+    filtre = FiltreLogApache(None, 500)
+    coordinateur = Coordinateur(Coordinateur.decoupe_fichiers([chemin]), filtre)
+    etat = Travailleur.analyse_tache(coordinateur.taches[0], coordinateur.configuration)
+    attendu = AnalyseurLogApache(ParseurLogApache(chemin).parse_fichier(),
+                                 filtre).get_etat_partiel()
+    assert etat.get_analyse_complete() == attendu.get_analyse_complete()
+
+def test_travailleur_analyse_tache_exception_format_invalide(log_apache):
+    """
+    Vérifie que l'analyse d'une tâche échoue lorsqu'une entrée est invalide.
+
+    Scénarios testés:
+        - Analyse d'une tâche d'un fichier au format invalide.
+
+    Asserts:
+        - Une ``FormatLogApacheInvalideException`` indiquant la position est levée.
+
+    Args:
+        log_apache (Callable): La fixture pour créer un fichier log temporaire.
+    """
+    coordinateur = Coordinateur(Coordinateur.decoupe_fichiers([str(log_apache(False))]),
+                                FiltreLogApache(None, None))
+    with pytest.raises(FormatLogApacheInvalideException, match="octet 0"):
+        Travailleur.analyse_tache(coordinateur.taches[0], coordinateur.configuration)
+
+def test_travailleur_exception_coordinateur_absent():
+    """
+    Vérifie que le travailleur échoue lorsque aucun coordinateur n'écoute.
+
+    Scénarios testés:
+        - Connexion à un port fermé.
+
+    Asserts:
+        - Une ``OSError`` est levée.
+    """
+    with pytest.raises(OSError):
+        Travailleur("127.0.0.1", 1, 1.0).execute()
@@ -0,0 +1,67 @@
+"""
+Module des tests unitaires pour les types des arguments passés depuis la CLI.
+"""
+
+from argparse import ArgumentTypeError
+from datetime import date
+import pytest
+from cli.types_arguments_cli import (definition_filtre, nombre_positif, taux, date_iso,
+                                     port_tcp, modele_route, expression_filtre)
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("conversion, valeur, attendu", [
+    (definition_filtre, "ip=1.2.3.4,code=404", {"adresse_ip": "1.2.3.4",
+                                                "code_statut_http": 404}),
+    (nombre_positif, "2.5", 2.5),
+    (taux, "0.01", 0.01),
+    (date_iso, "2025-01-12", date(2025, 1, 12)),
+    (port_tcp, "8080", 8080),
+    (modele_route, "/produit/{id}", "/produit/{id}"),
+    (expression_filtre, "code = 5xx", "code = 5xx")
+])
+def test_types_arguments_cli_valides(conversion, valeur, attendu):
+    """
+    Vérifie que les types convertissent les valeurs valides.
+
+    Scénarios testés:
+        - Une valeur valide pour chaque type.
+
+    Asserts:
+        - La valeur convertie est celle attendue.
+
+    Args:
+        conversion (Callable): Le type de l'argument.
+        valeur (str): La valeur passée en ligne de commande.
+        attendu (any): La valeur convertie attendue.
+    """
+    assert conversion(valeur) == attendu
+
+@pytest.mark.parametrize("conversion, valeur", [
+    (definition_filtre, "ip=1.2.3.4,ip=5.6.7.8"),
+    (definition_filtre, "code=abc"),
+    (nombre_positif, "inf"),
+    (nombre_positif, "-1"),
+    (taux, "1"),
+    (date_iso, "12/01/2025"),
+    (port_tcp, "70000"),
+    (modele_route, "produit"),
+    (expression_filtre, "code =")
+])
+def test_types_arguments_cli_invalides(conversion, valeur):
+    """
+    Vérifie que les types renvoient une erreur lorsque la valeur est invalide.
+
+    Scénarios testés:
+        - Une ou plusieurs valeurs invalides pour chaque type.
+
+    Asserts:
+        - Une exception :class:`ArgumentTypeError` est levée.
+
+    Args:
+        conversion (Callable): Le type de l'argument.
+        valeur (str): La valeur passée en ligne de commande.
+    """
+    with pytest.raises(ArgumentTypeError):
+        conversion(valeur)
@@ -0,0 +1,48 @@
+"""
+Module des tests unitaires pour les vérifications de paramètres communes aux analyses.
+"""
+
+import pytest
+from analyse.verifications import verifie_nombre_par_top
+
+
+# Tests unitaires
+
+@pytest.mark.parametrize("nombre_par_top", [0, 3])
+def test_verifications_nombre_par_top_valide(nombre_par_top):
+    """
+    Vérifie qu'un nombre par top valide est accepté.
+
+    Scénarios testés:
+        - Nombre par top nul ou positif.
+
+    Asserts:
+        - Aucune exception n'est levée.
+
+    Args:
+        nombre_par_top (int): Le nombre par top.
+    """
+    assert verifie_nombre_par_top(nombre_par_top) is None
+
+@pytest.mark.parametrize("nombre_par_top, exception", [
+    ("3", TypeError),
+    (2.0, TypeError),
+    (True, TypeError),
+    (-1, ValueError)
+])
+def test_verifications_exception_nombre_par_top_invalide(nombre_par_top, exception):
+    """
+    Vérifie qu'un nombre par top invalide lève une exception.
+
+    Scénarios testés:
+        - Nombre par top d'un type incorrect (chaîne, flottant, booléen) ou négatif.
+
+    Asserts:
+        - L'exception attendue est levée.
+
+    Args:
+        nombre_par_top (any): Le nombre par top.
+        exception (type): L'exception attendue.
+    """
+    with pytest.raises(exception):
+        verifie_nombre_par_top(nombre_par_top)